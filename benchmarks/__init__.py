@@ -0,0 +1,42 @@
+"""
+Offline benchmarks for the hfortix_fortios SDK.
+
+These benchmarks never talk to a FortiGate. They measure the cost of the SDK
+itself (imports, client construction, response wrapping, payload building)
+so regressions show up before they reach serverless functions and CLI tools
+where cold start dominates latency.
+
+The benchmarks are development tooling and not part of the installed
+package. Run each module from the repository root:
+
+    python -m benchmarks.startup
+    python -m benchmarks.startup --update-budgets
+    python -m benchmarks.fleet
+    python -m benchmarks.objects
+    python -m benchmarks.response_modes
+    python -m benchmarks.streaming
+    python -m benchmarks.payloads
+    python -m benchmarks.pagination
+
+Benchmarks that gate against stored budgets exit with status 1 when a
+metric exceeds its budget, so they can be wired into CI as-is. Budgets live
+in ``budgets.json`` next to this file.
+"""
+
+from ._common import (
+    BenchmarkReport,
+    BudgetViolation,
+    check_budgets,
+    load_budgets,
+    rss_bytes,
+    save_budgets,
+)
+
+__all__ = [
+    "BenchmarkReport",
+    "BudgetViolation",
+    "check_budgets",
+    "load_budgets",
+    "rss_bytes",
+    "save_budgets",
+]
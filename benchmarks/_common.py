@@ -0,0 +1,224 @@
+"""
+Shared measurement and budget helpers for the offline benchmarks.
+
+Budgets are stored in ``budgets.json`` as::
+
+    {
+        "<suite>": {
+            "<phase>": {"<metric>": <max value>, ...},
+            ...
+        }
+    }
+
+A metric without a budget entry is reported but never gated.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+
+BUDGETS_FILE = Path(__file__).with_name("budgets.json")
+
+# Phase -> metric -> value
+Metrics = dict[str, dict[str, float]]
+
+
+@dataclass
+class BudgetViolation:
+    """
+    A metric that exceeded its stored budget.
+
+    Attributes:
+        phase: Benchmark phase (e.g. "import")
+        metric: Metric name (e.g. "wall_ms")
+        value: Measured value
+        budget: Stored maximum
+    """
+
+    phase: str
+    metric: str
+    value: float
+    budget: float
+
+    def __str__(self) -> str:
+        return (
+            f"{self.phase}.{self.metric} = {self.value:.2f} "
+            f"exceeds budget {self.budget:.2f}"
+        )
+
+
+@dataclass
+class BenchmarkReport:
+    """
+    Result of a benchmark run.
+
+    Attributes:
+        suite: Suite name, also the top-level key in budgets.json
+        metrics: Median value of every metric, grouped by phase
+        runs: Number of samples each median was taken from
+        violations: Metrics that exceeded their budget
+    """
+
+    suite: str
+    metrics: Metrics = field(default_factory=dict)
+    runs: int = 0
+    violations: list[BudgetViolation] = field(default_factory=list)
+
+    @property
+    def passed(self) -> bool:
+        """True when no metric exceeded its budget."""
+        return not self.violations
+
+    def __str__(self) -> str:
+        status = "PASSED" if self.passed else "FAILED"
+        return (
+            f"{self.suite}: {status} "
+            f"({len(self.metrics)} phases, {len(self.violations)} violations)"
+        )
+
+    def print_summary(self, budgets: Optional[Metrics] = None) -> None:
+        """Print a table of metrics with their budgets."""
+        budgets = budgets or {}
+        print("\n" + "=" * 70)
+        print(f"Benchmark: {self.suite} (median of {self.runs} runs)")
+        print("=" * 70)
+        for phase, values in self.metrics.items():
+            print(f"\n[{phase}]")
+            for metric, value in values.items():
+                limit = budgets.get(phase, {}).get(metric)
+                suffix = "" if limit is None else f"  (budget {limit:g})"
+                print(f"  {metric:<24} {value:>12.2f}{suffix}")
+        print()
+        if self.violations:
+            print("✗ Budget violations:")
+            for violation in self.violations:
+                print(f"  - {violation}")
+        else:
+            print("✓ All metrics within budget")
+        print("=" * 70)
+
+
+def rss_bytes() -> int:
+    """
+    Return the current resident set size of this process in bytes.
+
+    Uses /proc on Linux and falls back to the peak RSS reported by
+    ``resource`` elsewhere (which only ever grows, so deltas are upper
+    bounds).
+    """
+    try:
+        with open("/proc/self/statm") as fh:
+            resident_pages = int(fh.read().split()[1])
+        return resident_pages * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is bytes on macOS, kilobytes elsewhere
+        return peak if sys.platform == "darwin" else peak * 1024
+    except ImportError:  # pragma: no cover - Windows
+        return 0
+
+
+def run_child(script: str, *args: str) -> Any:
+    """
+    Run ``script`` in a fresh interpreter and return its JSON output.
+
+    The script must print a single JSON document as its last line of
+    stdout. The interpreter sees the same ``hfortix_fortios`` as the caller
+    (the checkout's when the benchmarks run from a source tree).
+    """
+    package_root = str(Path(__file__).resolve().parents[1])
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (package_root, env.get("PYTHONPATH")) if p
+    )
+    proc = subprocess.run(
+        [sys.executable, "-c", script, *args],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=False,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"Benchmark child process failed:\n{proc.stderr.strip()}"
+        )
+    return json.loads(proc.stdout.strip().splitlines()[-1])
+
+
+def median_metrics(samples: list[Metrics]) -> Metrics:
+    """Reduce several runs to the per-metric median."""
+    result: Metrics = {}
+    for phase in samples[0]:
+        result[phase] = {}
+        for metric in samples[0][phase]:
+            values = [sample[phase][metric] for sample in samples]
+            result[phase][metric] = statistics.median(values)
+    return result
+
+
+def load_budgets(suite: str, path: Optional[Path] = None) -> Metrics:
+    """Load the stored budgets for ``suite`` (empty if none are stored)."""
+    path = path or BUDGETS_FILE
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data: dict[str, Any] = json.load(fh)
+    except FileNotFoundError:
+        return {}
+    return data.get(suite, {})
+
+
+def save_budgets(
+    suite: str,
+    metrics: Metrics,
+    headroom: float = 1.5,
+    path: Optional[Path] = None,
+) -> Metrics:
+    """
+    Store new budgets for ``suite`` derived from measured ``metrics``.
+
+    Each budget is the measured value multiplied by ``headroom``, rounded up
+    to two decimals. Other suites in the file are left untouched.
+
+    Returns:
+        The budgets written for ``suite``
+    """
+    path = path or BUDGETS_FILE
+    try:
+        with open(path, encoding="utf-8") as fh:
+            data: dict[str, Any] = json.load(fh)
+    except FileNotFoundError:
+        data = {}
+    budgets = {
+        phase: {
+            metric: round(value * headroom + 0.005, 2)
+            for metric, value in values.items()
+        }
+        for phase, values in metrics.items()
+    }
+    data[suite] = budgets
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(data, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+    return budgets
+
+
+def check_budgets(metrics: Metrics, budgets: Metrics) -> list[BudgetViolation]:
+    """Compare measured metrics against budgets."""
+    violations = []
+    for phase, values in metrics.items():
+        for metric, value in values.items():
+            limit = budgets.get(phase, {}).get(metric)
+            if limit is not None and value > limit:
+                violations.append(BudgetViolation(phase, metric, value, limit))
+    return violations
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Fleet memory benchmark: many FortiOS clients in one process.
+
+Builds 10, 100 and 1,000 clients (each size in a fresh interpreter) with
+default settings and touches a CMDB and a Monitor endpoint on every client,
+the way a script managing a fleet of FortiGates would. For each size it
+records:
+
+- ``wall_ms_per_client``: construction + endpoint access time per client
+- ``rss_kb_per_client``: resident memory added per client
+- ``rss_mb_total``: resident memory added by the whole fleet
+
+The per-client figures should stay flat as the fleet grows. They are
+gated against ``budgets.json`` (suite ``fleet``).
+
+Usage:
+    python -m benchmarks.fleet
+    python -m benchmarks.fleet --sizes 10 100 1000 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from typing import Optional, Sequence
+
+from ._common import (
+    BenchmarkReport,
+    Metrics,
+    check_budgets,
+    load_budgets,
+    median_metrics,
+    run_child,
+    save_budgets,
+)
+
+logger = logging.getLogger(__name__)
+
+SUITE = "fleet"
+DEFAULT_SIZES = (10, 100, 1000)
+
+_CHILD_SCRIPT = r"""
+import gc, json, logging, os, sys, time
+
+def rss():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+logging.disable(logging.CRITICAL)
+size = int(sys.argv[1])
+from hfortix_fortios import FortiOS
+
+def build(i):
+    fgt = FortiOS(host=f"10.{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}", token="x" * 31)
+    fgt.api.cmdb.firewall.address
+    fgt.api.monitor.system.status
+    return fgt
+
+build(0)  # warm imports and shared state
+gc.collect()
+mem = rss()
+start = time.perf_counter()
+fleet = [build(i + 1) for i in range(size)]
+wall = time.perf_counter() - start
+gc.collect()
+added = rss() - mem
+print(json.dumps({
+    "wall_ms_per_client": wall * 1000 / size,
+    "rss_kb_per_client": added / 1024 / size,
+    "rss_mb_total": added / 1048576,
+}))
+"""
+
+
+def run_fleet_benchmark(
+    sizes: Sequence[int] = DEFAULT_SIZES,
+    runs: int = 3,
+    budgets: Optional[Metrics] = None,
+) -> BenchmarkReport:
+    """
+    Measure per-client cost for fleets of the given sizes.
+
+    Args:
+        sizes: Fleet sizes to measure (one phase per size)
+        runs: Samples per size (median is reported)
+        budgets: Budgets to check against (default: stored budgets)
+
+    Returns:
+        BenchmarkReport with one ``clients_<n>`` phase per size
+    """
+    samples: list[Metrics] = []
+    for run in range(runs):
+        sample: Metrics = {}
+        for size in sizes:
+            logger.debug("fleet benchmark run %d size %d", run + 1, size)
+            sample[f"clients_{size}"] = run_child(_CHILD_SCRIPT, str(size))
+        samples.append(sample)
+    metrics = median_metrics(samples)
+    if budgets is None:
+        budgets = load_budgets(SUITE)
+    return BenchmarkReport(
+        suite=SUITE,
+        metrics=metrics,
+        runs=runs,
+        violations=check_budgets(metrics, budgets),
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point. Returns the process exit status."""
+    parser = argparse.ArgumentParser(
+        description="Measure memory and time per client for large fleets."
+    )
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES)
+    )
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--update-budgets",
+        action="store_true",
+        help="store the measured values (with headroom) as new budgets",
+    )
+    parser.add_argument("--headroom", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    report = run_fleet_benchmark(sizes=args.sizes, runs=args.runs)
+    if args.update_budgets:
+        budgets = save_budgets(SUITE, report.metrics, args.headroom)
+        report.violations = []
+    else:
+        budgets = load_budgets(SUITE)
+    report.print_summary(budgets)
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
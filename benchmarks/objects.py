@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+"""
+FortiObject / FortiObjectList micro-benchmarks.
+
+Runs in-process against synthetic firewall-policy shaped results (no
+network). Phases:
+
+- ``process_response``: turn a large response envelope into a result list
+- ``attr_access``: read 10 fields from every object of a large result set
+- ``nested_traversal``: walk the member tables of every object three
+  times; ``ns_per_member`` is taken from the repeated passes
+- ``to_columns``: build typed columns for every field of a large result
+  set, next to the per-object loop it replaces for one aggregate
+
+Each phase reports wall time and a per-operation figure that is gated
+against ``budgets.json`` (suite ``objects``).
+
+Usage:
+    python -m benchmarks.objects
+    python -m benchmarks.objects --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from typing import Any, Callable, Optional
+
+from ._common import (
+    BenchmarkReport,
+    Metrics,
+    check_budgets,
+    load_budgets,
+    median_metrics,
+    save_budgets,
+)
+
+logger = logging.getLogger(__name__)
+
+SUITE = "objects"
+DEFAULT_ROWS = 20000
+
+# Mix of plain, snake_case -> hyphen and keyword-mapped ('type_') fields
+ACCESSED_FIELDS = (
+    "policyid",
+    "name",
+    "action",
+    "status",
+    "schedule",
+    "nat",
+    "logtraffic",
+    "type_",
+    "comments",
+    "internet_service",
+)
+
+
+def make_policy_rows(rows: int) -> list[dict[str, Any]]:
+    """Build ``rows`` synthetic firewall policy dicts."""
+    return [
+        {
+            "policyid": i,
+            "q_origin_key": i,
+            "name": f"policy-{i}",
+            "uuid": f"00000000-0000-0000-0000-{i:012d}",
+            "action": "accept" if i % 3 else "deny",
+            "status": "enable",
+            "schedule": "always",
+            "nat": "disable",
+            "logtraffic": "utm",
+            "type": "standard",
+            "comments": "",
+            "internet-service": "disable",
+            "srcintf": [{"name": "port1", "q_origin_key": "port1"}],
+            "dstintf": [{"name": "port2", "q_origin_key": "port2"}],
+            "srcaddr": [
+                {"name": f"addr-{i}-{j}", "q_origin_key": f"addr-{i}-{j}"}
+                for j in range(4)
+            ],
+            "dstaddr": [{"name": "all", "q_origin_key": "all"}],
+            "service": [{"name": "HTTPS", "q_origin_key": "HTTPS"}],
+        }
+        for i in range(rows)
+    ]
+
+
+def make_envelope(results: list[dict[str, Any]]) -> dict[str, Any]:
+    """Wrap ``results`` in a FortiOS-style response envelope."""
+    return {
+        "http_method": "GET",
+        "results": results,
+        "vdom": "root",
+        "path": "firewall",
+        "name": "policy",
+        "status": "success",
+        "http_status": 200,
+        "serial": "FGVM00000000000",
+        "version": "v7.6.5",
+        "build": 3651,
+    }
+
+
+def _bench_process_response(rows: int) -> dict[str, float]:
+    from hfortix_fortios.models import process_response
+
+    envelope = make_envelope(make_policy_rows(rows))
+    start = time.perf_counter()
+    objects = process_response(envelope, raw_envelope=envelope)
+    wall = time.perf_counter() - start
+    objects[0].name  # first access pays for one wrapper only
+    return {
+        "wall_ms": wall * 1000,
+        "ns_per_row": wall * 1e9 / rows,
+    }
+
+
+def _bench_attr_access(rows: int) -> dict[str, float]:
+    from hfortix_fortios.models import process_response
+
+    envelope = make_envelope(make_policy_rows(rows))
+    objects = process_response(envelope, raw_envelope=envelope)
+    start = time.perf_counter()
+    for obj in objects:
+        for field_name in ACCESSED_FIELDS:
+            getattr(obj, field_name)
+    wall = time.perf_counter() - start
+    return {
+        "wall_ms": wall * 1000,
+        "ns_per_access": wall * 1e9 / (rows * len(ACCESSED_FIELDS)),
+    }
+
+
+def _bench_nested_traversal(rows: int) -> dict[str, float]:
+    from hfortix_fortios.models import process_response
+
+    envelope = make_envelope(make_policy_rows(rows))
+    objects = process_response(envelope, raw_envelope=envelope)
+    passes = []
+    members = 0
+    for _ in range(3):
+        members = 0
+        start = time.perf_counter()
+        for obj in objects:
+            for member in obj.srcaddr:
+                member.name
+                members += 1
+            for member in obj.dstaddr:
+                member.name
+                members += 1
+        passes.append(time.perf_counter() - start)
+    repeat = (passes[1] + passes[2]) / 2
+    return {
+        "first_pass_ms": passes[0] * 1000,
+        "repeat_pass_ms": repeat * 1000,
+        "ns_per_member": repeat * 1e9 / members,
+    }
+
+
+def _bench_to_columns(rows: int) -> dict[str, float]:
+    from hfortix_fortios.models import process_response
+
+    envelope = make_envelope(make_policy_rows(rows))
+    objects = process_response(envelope, raw_envelope=envelope)
+    start = time.perf_counter()
+    columns = objects.to_columns()
+    wall = time.perf_counter() - start
+    start = time.perf_counter()
+    column_total = sum(columns["policyid"])
+    column_sum = time.perf_counter() - start
+    start = time.perf_counter()
+    loop_total = sum(obj.policyid for obj in objects)
+    loop_sum = time.perf_counter() - start
+    assert column_total == loop_total
+    return {
+        "wall_ms": wall * 1000,
+        "ns_per_row": wall * 1e9 / rows,
+        "column_sum_ms": column_sum * 1000,
+        "object_loop_sum_ms": loop_sum * 1000,
+    }
+
+
+PHASES: dict[str, Callable[[int], dict[str, float]]] = {
+    "process_response": _bench_process_response,
+    "attr_access": _bench_attr_access,
+    "nested_traversal": _bench_nested_traversal,
+    "to_columns": _bench_to_columns,
+}
+
+
+def run_objects_benchmark(
+    rows: int = DEFAULT_ROWS,
+    runs: int = 3,
+    phases: Optional[list[str]] = None,
+    budgets: Optional[Metrics] = None,
+) -> BenchmarkReport:
+    """
+    Run the FortiObject micro-benchmarks.
+
+    Args:
+        rows: Size of the synthetic result set
+        runs: Samples per phase (median is reported)
+        phases: Subset of PHASES to run (default: all)
+        budgets: Budgets to check against (default: stored budgets)
+
+    Returns:
+        BenchmarkReport with one entry per phase
+    """
+    selected = phases or list(PHASES)
+    samples: list[Metrics] = []
+    for run in range(runs):
+        logger.debug("objects benchmark run %d/%d", run + 1, runs)
+        samples.append({name: PHASES[name](rows) for name in selected})
+    metrics = median_metrics(samples)
+    if budgets is None:
+        budgets = load_budgets(SUITE)
+    return BenchmarkReport(
+        suite=SUITE,
+        metrics=metrics,
+        runs=runs,
+        violations=check_budgets(metrics, budgets),
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point. Returns the process exit status."""
+    parser = argparse.ArgumentParser(
+        description="Measure FortiObject wrapping and access overhead."
+    )
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--phase", action="append", choices=list(PHASES))
+    parser.add_argument(
+        "--update-budgets",
+        action="store_true",
+        help="store the measured values (with headroom) as new budgets",
+    )
+    parser.add_argument("--headroom", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    report = run_objects_benchmark(
+        rows=args.rows, runs=args.runs, phases=args.phase
+    )
+    if args.update_budgets:
+        budgets = save_budgets(SUITE, report.metrics, args.headroom)
+        report.violations = []
+    else:
+        budgets = load_budgets(SUITE)
+    report.print_summary(budgets)
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
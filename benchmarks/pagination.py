@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""
+Pagination benchmark: sequential, read-ahead and parallel page fetching.
+
+Walks a synthetic firewall-session table with ``iter_all()`` against an
+in-process mock FortiGate (``httpx.MockTransport``). The mock answers each
+``start``/``count`` window after a fixed per-request latency plus a
+per-row serialization cost, both spent sleeping so concurrent requests
+overlap as they would on a real device. Page bodies are encoded before
+the clock starts. Phases, for ``--rows`` of 50k and 500k by default:
+
+- ``sequential_<n>``: one page at a time (``prefetch=False``)
+- ``prefetch_<n>``: next page requested while the current one is consumed
+- ``parallel_<n>``: ``--fanout`` windows in flight once the total is known
+
+Each phase reports:
+
+- ``wall_ms``: time to read every row
+- ``rows_per_s``: throughput
+- ``wall_ratio``: wall time relative to ``sequential_<n>``; gated against
+  ``budgets.json`` (suite ``pagination``) for the parallel phases
+
+Usage:
+    python -m benchmarks.pagination
+    python -m benchmarks.pagination --rows 50000 --fanout 16
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Any, Optional
+
+from ._common import (
+    BenchmarkReport,
+    Metrics,
+    check_budgets,
+    load_budgets,
+    median_metrics,
+    save_budgets,
+)
+
+logger = logging.getLogger(__name__)
+
+SUITE = "pagination"
+DEFAULT_ROWS = (50000, 500000)
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_FANOUT = 8
+DEFAULT_LATENCY_MS = 10.0
+DEFAULT_ROW_US = 2.0
+MODES = ("sequential", "prefetch", "parallel")
+
+
+def _row(i: int) -> dict[str, Any]:
+    return {
+        "session_id": i,
+        "proto": 6,
+        "srcaddr": f"10.0.{i >> 8 & 255}.{i & 255}",
+        "srcport": 1024 + i % 60000,
+        "dstaddr": "192.0.2.10",
+        "dstport": 443,
+        "policyid": i % 500,
+        "sentbyte": i * 37 % 100000,
+        "rcvdbyte": i * 91 % 1000000,
+        "duration": i % 3600,
+    }
+
+
+def _encode_pages(rows: int, page_size: int) -> dict[int, bytes]:
+    """Response body per ``start``, like a FortiGate list response."""
+    pages = {}
+    for start in range(0, rows, page_size):
+        results = [_row(i) for i in range(start, min(rows, start + page_size))]
+        pages[start] = json.dumps(
+            {
+                "http_method": "GET",
+                "results": results,
+                "vdom": "root",
+                "path": "firewall",
+                "name": "sessions",
+                "status": "success",
+                "http_status": 200,
+                "matched_count": rows,
+            }
+        ).encode()
+    return pages
+
+
+def _make_endpoint(
+    pages: dict[int, bytes],
+    rows: int,
+    page_size: int,
+    latency: float,
+    row_cost: float,
+) -> Any:
+    import httpx
+
+    from hfortix_fortios import FortiOS
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start = int(request.url.params.get("start", 0))
+        if int(request.url.params.get("count", page_size)) != page_size:
+            return httpx.Response(400, json={"status": "error"})
+        body = pages[start]
+        time.sleep(latency + min(page_size, rows - start) * row_cost)
+        return httpx.Response(
+            200, content=body, headers={"content-type": "application/json"}
+        )
+
+    fgt = FortiOS(
+        host="192.0.2.1", token="x" * 31, verify=False, max_connections=32
+    )
+    fgt._client._client.close()
+    fgt._client._client = httpx.Client(transport=httpx.MockTransport(handler))
+    return fgt.with_response_mode("dict").monitor.firewall.sessions
+
+
+def _walk(
+    endpoint: Any, rows: int, page_size: int, mode: str, fanout: int
+) -> dict[str, float]:
+    start = time.perf_counter()
+    count = 0
+    for _ in endpoint.iter_all(
+        page_size=page_size,
+        prefetch=mode != "sequential",
+        fanout=fanout if mode == "parallel" else 1,
+    ):
+        count += 1
+    wall = time.perf_counter() - start
+    if count != rows:
+        raise RuntimeError(f"{mode}: read {count} of {rows} rows")
+    return {"wall_ms": wall * 1000, "rows_per_s": rows / wall}
+
+
+def _run_once(
+    rows_list: tuple[int, ...],
+    page_size: int,
+    fanout: int,
+    latency: float,
+    row_cost: float,
+) -> Metrics:
+    metrics: Metrics = {}
+    for rows in rows_list:
+        pages = _encode_pages(rows, page_size)
+        endpoint = _make_endpoint(pages, rows, page_size, latency, row_cost)
+        suffix = f"{rows // 1000}k" if rows % 1000 == 0 else str(rows)
+        sequential = None
+        for mode in MODES:
+            values = _walk(endpoint, rows, page_size, mode, fanout)
+            if sequential is None:
+                sequential = values["wall_ms"]
+            values["wall_ratio"] = values["wall_ms"] / sequential
+            metrics[f"{mode}_{suffix}"] = values
+            logger.debug("%s_%s: %.0f ms", mode, suffix, values["wall_ms"])
+    return metrics
+
+
+def run_pagination_benchmark(
+    rows: tuple[int, ...] = DEFAULT_ROWS,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    fanout: int = DEFAULT_FANOUT,
+    latency_ms: float = DEFAULT_LATENCY_MS,
+    row_us: float = DEFAULT_ROW_US,
+    runs: int = 1,
+    budgets: Optional[Metrics] = None,
+) -> BenchmarkReport:
+    """
+    Compare sequential, read-ahead and parallel pagination.
+
+    Args:
+        rows: Table sizes to walk
+        page_size: Rows per request
+        fanout: Windows in flight in the parallel phases
+        latency_ms: Simulated per-request latency of the FortiGate
+        row_us: Simulated per-row serialization cost of the FortiGate
+        runs: Samples per phase (median is reported)
+        budgets: Budgets to check against (default: stored budgets)
+
+    Returns:
+        BenchmarkReport with one entry per mode and table size
+    """
+    samples = []
+    for run in range(runs):
+        logger.debug("pagination benchmark run %d/%d", run + 1, runs)
+        samples.append(
+            _run_once(
+                rows, page_size, fanout, latency_ms / 1000, row_us / 1e6
+            )
+        )
+    metrics = median_metrics(samples)
+    if budgets is None:
+        budgets = load_budgets(SUITE)
+    return BenchmarkReport(
+        suite=SUITE,
+        metrics=metrics,
+        runs=runs,
+        violations=check_budgets(metrics, budgets),
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point. Returns the process exit status."""
+    parser = argparse.ArgumentParser(
+        description="Compare sequential, read-ahead and parallel paging."
+    )
+    parser.add_argument(
+        "--rows", type=int, action="append", help="table size (repeatable)"
+    )
+    parser.add_argument("--page-size", type=int, default=DEFAULT_PAGE_SIZE)
+    parser.add_argument("--fanout", type=int, default=DEFAULT_FANOUT)
+    parser.add_argument(
+        "--latency-ms", type=float, default=DEFAULT_LATENCY_MS
+    )
+    parser.add_argument("--row-us", type=float, default=DEFAULT_ROW_US)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument(
+        "--update-budgets",
+        action="store_true",
+        help="store the measured values (with headroom) as new budgets",
+    )
+    parser.add_argument("--headroom", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    report = run_pagination_benchmark(
+        rows=tuple(args.rows) if args.rows else DEFAULT_ROWS,
+        page_size=args.page_size,
+        fanout=args.fanout,
+        latency_ms=args.latency_ms,
+        row_us=args.row_us,
+        runs=args.runs,
+    )
+    if args.update_budgets:
+        budgets = save_budgets(SUITE, report.metrics, args.headroom)
+        report.violations = []
+    else:
+        budgets = load_budgets(SUITE)
+    report.print_summary(budgets)
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,224 @@
+#!/usr/bin/env python3
+"""
+Payload building throughput of the generated CMDB endpoints.
+
+Calls ``post()`` of ``cmdb.firewall.address`` and ``cmdb.firewall.policy``
+``--payloads`` times each with varied arguments (table fields, keyword
+fields, ``payload_dict`` overrides). The client is an in-process recorder
+behind the regular response processing client, so the figures cover
+argument normalization, payload translation and the hand-off to the HTTP
+layer, and nothing else. Phases:
+
+- ``address``: flat firewall addresses with an occasional tagging table
+- ``policy``: firewall policies with interface/address/service tables
+
+Each phase reports:
+
+- ``wall_ms``: time to build every payload
+- ``payloads_per_s``: throughput
+- ``ns_per_payload``: gated against ``budgets.json`` (suite ``payloads``)
+- ``second_pass_ns_per_payload``: what a recursive field-name conversion
+  of the finished payload would add (the pass builder payloads skip)
+
+Usage:
+    python -m benchmarks.payloads
+    python -m benchmarks.payloads --payloads 20000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+import time
+from typing import Any, Callable, Optional
+
+from ._common import (
+    BenchmarkReport,
+    Metrics,
+    check_budgets,
+    load_budgets,
+    median_metrics,
+    save_budgets,
+)
+
+logger = logging.getLogger(__name__)
+
+SUITE = "payloads"
+DEFAULT_PAYLOADS = 100000
+
+
+class _RecordingClient:
+    """Sync client that keeps the last request body and sends nothing."""
+
+    def __init__(self) -> None:
+        self.bodies: list[Any] = []
+
+    def post(
+        self,
+        api_type: str,
+        path: str,
+        data: Any = None,
+        params: Any = None,
+        vdom: Any = None,
+        raw_json: bool = False,
+    ) -> dict[str, Any]:
+        self.bodies.append(data)
+        return {"status": "success", "http_status": 200}
+
+    put = post
+
+
+def _make_api() -> tuple[Any, _RecordingClient]:
+    from hfortix_fortios.api import API
+    from hfortix_fortios.client import _processing_client
+
+    recorder = _RecordingClient()
+    return API(_processing_client(recorder, "dict")), recorder  # type: ignore[arg-type]
+
+
+def _post_addresses(endpoint: Any, count: int) -> None:
+    for i in range(count):
+        octets = f"{i >> 16 & 255}.{i >> 8 & 255}.{i & 255}"
+        if i % 4 == 0:
+            endpoint.post(
+                name=f"fqdn-{i}",
+                type="fqdn",
+                fqdn=f"host{i}.example.com",
+                cache_ttl=300,
+                comment="generated",
+            )
+        else:
+            endpoint.post(
+                name=f"net-{i}",
+                subnet=f"10.{octets}/32",
+                comment="generated",
+                color=i % 32,
+                allow_routing="enable" if i % 2 else None,
+                tagging=(
+                    [{"name": "env", "category": "env", "tags": ["prod"]}]
+                    if i % 10 == 1
+                    else None
+                ),
+            )
+
+
+def _post_policies(endpoint: Any, count: int) -> None:
+    for i in range(count):
+        endpoint.post(
+            name=f"policy-{i}",
+            srcintf=["port1"],
+            dstintf=["port2"],
+            srcaddr=[f"net-{i}", f"net-{i + 1}"],
+            dstaddr="all",
+            service=["HTTPS", "HTTP"],
+            action="accept" if i % 3 else "deny",
+            schedule="always",
+            nat="enable" if i % 2 else "disable",
+            logtraffic="all",
+            comments="generated",
+            payload_dict=(
+                {"internet_service": "disable", "ssl_ssh_profile": "no-inspection"}
+                if i % 5 == 0
+                else None
+            ),
+        )
+
+
+def _bench(
+    build: Callable[[Any, int], None], endpoint_name: str, count: int
+) -> dict[str, float]:
+    from hfortix_fortios.client import convert_field_names
+
+    api, recorder = _make_api()
+    endpoint = getattr(api.cmdb.firewall, endpoint_name)
+    build(endpoint, 100)  # warm up lazy imports and translation plans
+    recorder.bodies.clear()
+
+    start = time.perf_counter()
+    build(endpoint, count)
+    wall = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for body in recorder.bodies:
+        convert_field_names(body)
+    second_pass = time.perf_counter() - start
+    return {
+        "wall_ms": wall * 1000,
+        "payloads_per_s": count / wall,
+        "ns_per_payload": wall * 1e9 / count,
+        "second_pass_ns_per_payload": second_pass * 1e9 / count,
+    }
+
+
+PHASES: dict[str, Callable[[int], dict[str, float]]] = {
+    "address": lambda count: _bench(_post_addresses, "address", count),
+    "policy": lambda count: _bench(_post_policies, "policy", count),
+}
+
+
+def run_payloads_benchmark(
+    payloads: int = DEFAULT_PAYLOADS,
+    runs: int = 3,
+    phases: Optional[list[str]] = None,
+    budgets: Optional[Metrics] = None,
+) -> BenchmarkReport:
+    """
+    Measure payload building throughput.
+
+    Args:
+        payloads: Payloads built per phase and run
+        runs: Samples per phase (median is reported)
+        phases: Subset of PHASES to run (default: all)
+        budgets: Budgets to check against (default: stored budgets)
+
+    Returns:
+        BenchmarkReport with one entry per phase
+    """
+    selected = phases or list(PHASES)
+    samples: list[Metrics] = []
+    for run in range(runs):
+        logger.debug("payloads benchmark run %d/%d", run + 1, runs)
+        samples.append({name: PHASES[name](payloads) for name in selected})
+    metrics = median_metrics(samples)
+    if budgets is None:
+        budgets = load_budgets(SUITE)
+    return BenchmarkReport(
+        suite=SUITE,
+        metrics=metrics,
+        runs=runs,
+        violations=check_budgets(metrics, budgets),
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point. Returns the process exit status."""
+    parser = argparse.ArgumentParser(
+        description="Measure payload building throughput."
+    )
+    parser.add_argument("--payloads", type=int, default=DEFAULT_PAYLOADS)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--phase", action="append", choices=list(PHASES))
+    parser.add_argument(
+        "--update-budgets",
+        action="store_true",
+        help="store the measured values (with headroom) as new budgets",
+    )
+    parser.add_argument("--headroom", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    report = run_payloads_benchmark(
+        payloads=args.payloads, runs=args.runs, phases=args.phase
+    )
+    if args.update_budgets:
+        budgets = save_budgets(SUITE, report.metrics, args.headroom)
+        report.violations = []
+    else:
+        budgets = load_budgets(SUITE)
+    report.print_summary(budgets)
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Per-request client-side overhead of each ``response_mode``.
+
+Issues the same CMDB GET through a real ``FortiOS`` client in every
+response mode. The HTTP transport is replaced by an in-process
+``httpx.MockTransport`` that returns a prepared firewall-policy response,
+so the figures cover everything the client does on its side of the wire
+(request building, retries bookkeeping, JSON decoding, key normalization
+and result wrapping) and nothing else. Phases:
+
+- ``object``: FortiObject/FortiObjectList results (default mode)
+- ``dict``: decoded envelope as a plain dict
+- ``raw_bytes``: undecoded response body
+
+Each phase reports ``ms_per_request`` and ``ns_per_row``; the latter is
+gated against ``budgets.json`` (suite ``response_modes``).
+
+Usage:
+    python -m benchmarks.response_modes
+    python -m benchmarks.response_modes --rows 5000
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import logging
+import sys
+import time
+from typing import Any, Optional
+
+from ._common import (
+    BenchmarkReport,
+    Metrics,
+    check_budgets,
+    load_budgets,
+    median_metrics,
+    save_budgets,
+)
+from .objects import make_envelope, make_policy_rows
+
+logger = logging.getLogger(__name__)
+
+SUITE = "response_modes"
+DEFAULT_ROWS = 1000
+DEFAULT_REQUESTS = 20
+MODES = ("object", "dict", "raw_bytes")
+
+
+def make_mock_client(body: bytes) -> Any:
+    """
+    Build a FortiOS client whose transport always answers with ``body``.
+
+    The client is constructed normally and its httpx client is swapped for
+    one backed by ``httpx.MockTransport``; no connection is ever opened.
+    """
+    import httpx
+
+    from hfortix_fortios import FortiOS
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200,
+            content=body,
+            headers={"content-type": "application/json"},
+        )
+
+    fgt = FortiOS(host="192.0.2.1", token="x" * 31, verify=False)
+    fgt._client._client.close()  # type: ignore[union-attr]
+    fgt._client._client = httpx.Client(  # type: ignore[union-attr]
+        transport=httpx.MockTransport(handler)
+    )
+    return fgt
+
+
+def _bench_mode(
+    fgt: Any, mode: str, rows: int, requests: int
+) -> dict[str, float]:
+    endpoint = fgt.with_response_mode(mode).cmdb.firewall.policy
+    endpoint.get()  # warm up connection pool and lazy imports
+    start = time.perf_counter()
+    for _ in range(requests):
+        endpoint.get()
+    wall = time.perf_counter() - start
+    return {
+        "ms_per_request": wall * 1000 / requests,
+        "ns_per_row": wall * 1e9 / (requests * rows),
+    }
+
+
+def run_response_modes_benchmark(
+    rows: int = DEFAULT_ROWS,
+    requests: int = DEFAULT_REQUESTS,
+    runs: int = 3,
+    budgets: Optional[Metrics] = None,
+) -> BenchmarkReport:
+    """
+    Measure per-request overhead in every response mode.
+
+    Args:
+        rows: Number of policies in the mocked response
+        requests: Requests timed per mode and run
+        runs: Samples per mode (median is reported)
+        budgets: Budgets to check against (default: stored budgets)
+
+    Returns:
+        BenchmarkReport with one phase per response mode
+    """
+    body = json.dumps(make_envelope(make_policy_rows(rows))).encode()
+    fgt = make_mock_client(body)
+    samples: list[Metrics] = []
+    try:
+        for run in range(runs):
+            logger.debug("response mode benchmark run %d/%d", run + 1, runs)
+            samples.append(
+                {mode: _bench_mode(fgt, mode, rows, requests) for mode in MODES}
+            )
+    finally:
+        fgt.close()
+    metrics = median_metrics(samples)
+    if budgets is None:
+        budgets = load_budgets(SUITE)
+    return BenchmarkReport(
+        suite=SUITE,
+        metrics=metrics,
+        runs=runs,
+        violations=check_budgets(metrics, budgets),
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point. Returns the process exit status."""
+    parser = argparse.ArgumentParser(
+        description="Measure client-side overhead per response mode."
+    )
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--requests", type=int, default=DEFAULT_REQUESTS)
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument(
+        "--update-budgets",
+        action="store_true",
+        help="store the measured values (with headroom) as new budgets",
+    )
+    parser.add_argument("--headroom", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    logging.disable(logging.WARNING)
+    report = run_response_modes_benchmark(
+        rows=args.rows, requests=args.requests, runs=args.runs
+    )
+    if args.update_budgets:
+        budgets = save_budgets(SUITE, report.metrics, args.headroom)
+        report.violations = []
+    else:
+        budgets = load_budgets(SUITE)
+    report.print_summary(budgets)
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+"""
+Import-time and client-construction benchmark.
+
+Measures, in a fresh interpreter per run so nothing is cached:
+
+- ``import``: ``import hfortix_fortios``
+- ``first_client``: the first ``FortiOS(host, token)`` construction
+- ``nth_client``: each further construction (averaged over ``--clients``)
+- ``deep_endpoint``: first access of ``api.cmdb.router.bgp``
+
+For every phase it records wall time (``wall_ms``), the number of modules
+imported by that phase (``modules``) and the change in resident memory
+(``rss_mb``). The median over ``--runs`` runs is compared against the
+budgets stored in ``budgets.json``; the process exits with status 1 when a
+budget is exceeded.
+
+No network traffic is generated - constructing a client does not connect.
+
+Usage:
+    python -m benchmarks.startup
+    python -m benchmarks.startup --runs 10 --clients 50
+    python -m benchmarks.startup --update-budgets
+
+    from benchmarks.startup import run_startup_benchmark
+    report = run_startup_benchmark(runs=3)
+    report.print_summary()
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from typing import Optional
+
+from ._common import (
+    BenchmarkReport,
+    Metrics,
+    check_budgets,
+    load_budgets,
+    median_metrics,
+    run_child,
+    save_budgets,
+)
+
+logger = logging.getLogger(__name__)
+
+SUITE = "startup"
+
+# Runs in a clean interpreter via ``python -c``. It must not import
+# hfortix_fortios (directly or through ``-m``) before the first measurement.
+_CHILD_SCRIPT = r"""
+import json, logging, os, sys, time
+
+def rss():
+    try:
+        with open("/proc/self/statm") as fh:
+            return int(fh.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except Exception:
+        import resource
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak if sys.platform == "darwin" else peak * 1024
+
+def phase(fn, repeat=1):
+    mods, mem = len(sys.modules), rss()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        value = fn()
+    wall = time.perf_counter() - start
+    return value, {
+        "wall_ms": wall * 1000 / repeat,
+        "modules": (len(sys.modules) - mods) / repeat,
+        "rss_mb": (rss() - mem) / 1048576 / repeat,
+    }
+
+logging.disable(logging.CRITICAL)
+clients = int(sys.argv[1])
+keep = []
+
+def make_client():
+    client = FortiOS(host="192.0.2.1", token="x" * 31, verify=False)
+    keep.append(client)
+    return client
+
+out = {}
+_, out["import"] = phase(lambda: __import__("hfortix_fortios"))
+from hfortix_fortios import FortiOS
+fgt, out["first_client"] = phase(make_client)
+_, out["nth_client"] = phase(make_client, repeat=clients)
+_, out["deep_endpoint"] = phase(lambda: fgt.api.cmdb.router.bgp)
+print(json.dumps(out))
+"""
+
+
+def run_startup_benchmark(
+    runs: int = 5,
+    clients: int = 20,
+    budgets: Optional[Metrics] = None,
+) -> BenchmarkReport:
+    """
+    Run the startup benchmark and compare it against budgets.
+
+    Args:
+        runs: Number of fresh interpreters to sample (median is reported)
+        clients: Number of constructions averaged for ``nth_client``
+        budgets: Budgets to check against (default: stored budgets)
+
+    Returns:
+        BenchmarkReport with median metrics and any budget violations
+    """
+    samples = []
+    for run in range(runs):
+        logger.debug("startup benchmark run %d/%d", run + 1, runs)
+        samples.append(run_child(_CHILD_SCRIPT, str(clients)))
+    metrics = median_metrics(samples)
+    if budgets is None:
+        budgets = load_budgets(SUITE)
+    return BenchmarkReport(
+        suite=SUITE,
+        metrics=metrics,
+        runs=runs,
+        violations=check_budgets(metrics, budgets),
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point. Returns the process exit status."""
+    parser = argparse.ArgumentParser(
+        description="Measure import and client-construction cost."
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--clients", type=int, default=20)
+    parser.add_argument(
+        "--update-budgets",
+        action="store_true",
+        help="store the measured values (with headroom) as new budgets",
+    )
+    parser.add_argument("--headroom", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    report = run_startup_benchmark(runs=args.runs, clients=args.clients)
+    if args.update_budgets:
+        budgets = save_budgets(SUITE, report.metrics, args.headroom)
+        report.violations = []
+    else:
+        budgets = load_budgets(SUITE)
+    report.print_summary(budgets)
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
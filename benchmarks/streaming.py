@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+"""
+Streaming decode benchmark: peak memory of a large list response.
+
+Serves a synthetic firewall-session style response of ``--rows`` rows
+through ``httpx.MockTransport`` (the body is generated chunk by chunk, so
+the mock itself holds no copy of the payload) and consumes it in a fresh
+interpreter per phase:
+
+- ``get``: regular GET in ``"dict"`` mode, then iterate ``results``
+- ``stream``: ``"stream"`` response mode, iterating the ResultStream
+
+For each phase it records:
+
+- ``peak_rss_mb``: growth of the peak resident set size while consuming
+- ``wall_ms``: time to consume every row
+- ``payload_mb``: size of the response body
+
+``stream.peak_rss_mb`` should stay flat as ``--rows`` grows; it is gated
+against ``budgets.json`` (suite ``streaming``).
+
+Usage:
+    python -m benchmarks.streaming
+    python -m benchmarks.streaming --rows 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from typing import Optional
+
+from ._common import (
+    BenchmarkReport,
+    Metrics,
+    check_budgets,
+    load_budgets,
+    median_metrics,
+    run_child,
+    save_budgets,
+)
+
+logger = logging.getLogger(__name__)
+
+SUITE = "streaming"
+DEFAULT_ROWS = 200000
+PHASES = ("get", "stream")
+
+_CHILD_SCRIPT = r"""
+import json, logging, resource, sys, time
+import httpx
+
+logging.disable(logging.CRITICAL)
+phase, rows = sys.argv[1], int(sys.argv[2])
+
+def peak_rss():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+def row(i):
+    return {
+        "session_id": i, "proto": 6, "srcaddr": f"10.0.{i >> 8 & 255}.{i & 255}",
+        "srcport": 1024 + i % 60000, "dstaddr": "192.0.2.10", "dstport": 443,
+        "policyid": i % 500, "sentbyte": i * 37 % 100000,
+        "rcvdbyte": i * 91 % 1000000, "duration": i % 3600,
+        "application": "HTTPS.BROWSER", "country": "Reserved",
+        "srcintf": "port1", "dstintf": "port2", "username": "",
+    }
+
+size = 0
+
+def body():
+    global size
+    head = '{"http_method":"GET","results":['
+    size += len(head)
+    yield head.encode()
+    batch = []
+    for i in range(rows):
+        batch.append(json.dumps(row(i)))
+        if len(batch) == 1000 or i == rows - 1:
+            chunk = ("," if i >= 1000 else "") + ",".join(batch)
+            size += len(chunk)
+            yield chunk.encode()
+            batch = []
+    tail = '],"vdom":"root","path":"firewall","name":"sessions",' \
+        f'"status":"success","http_status":200,"matched_count":{rows}}}'
+    size += len(tail)
+    yield tail.encode()
+
+def handler(request):
+    return httpx.Response(
+        200, content=body(), headers={"content-type": "application/json"}
+    )
+
+from hfortix_fortios import FortiOS
+fgt = FortiOS(host="192.0.2.1", token="x" * 31, verify=False)
+fgt._client._client.close()
+fgt._client._client = httpx.Client(transport=httpx.MockTransport(handler))
+api = fgt.with_response_mode("dict" if phase == "get" else "stream")
+endpoint = api.monitor.firewall.sessions
+
+baseline = peak_rss()
+start = time.perf_counter()
+count = 0
+total = 0
+if phase == "get":
+    for item in endpoint.get()["results"]:
+        count += 1
+        total += item["sentbyte"]
+else:
+    stream = endpoint.get()
+    for item in stream:
+        count += 1
+        total += item["sentbyte"]
+    assert stream.matched_count == rows
+wall = time.perf_counter() - start
+assert count == rows
+print(json.dumps({
+    "peak_rss_mb": (peak_rss() - baseline) / 1048576,
+    "wall_ms": wall * 1000,
+    "payload_mb": size / 1048576,
+}))
+"""
+
+
+def run_streaming_benchmark(
+    rows: int = DEFAULT_ROWS,
+    runs: int = 1,
+    budgets: Optional[Metrics] = None,
+) -> BenchmarkReport:
+    """
+    Compare peak memory of a regular GET and a streamed GET.
+
+    Args:
+        rows: Rows in the synthetic response
+        runs: Samples per phase (median is reported)
+        budgets: Budgets to check against (default: stored budgets)
+
+    Returns:
+        BenchmarkReport with a ``get`` and a ``stream`` phase
+    """
+    samples: list[Metrics] = []
+    for run in range(runs):
+        logger.debug("streaming benchmark run %d/%d", run + 1, runs)
+        samples.append(
+            {
+                phase: run_child(_CHILD_SCRIPT, phase, str(rows))
+                for phase in PHASES
+            }
+        )
+    metrics = median_metrics(samples)
+    if budgets is None:
+        budgets = load_budgets(SUITE)
+    return BenchmarkReport(
+        suite=SUITE,
+        metrics=metrics,
+        runs=runs,
+        violations=check_budgets(metrics, budgets),
+    )
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """Command-line entry point. Returns the process exit status."""
+    parser = argparse.ArgumentParser(
+        description="Measure peak memory of streamed vs regular GETs."
+    )
+    parser.add_argument("--rows", type=int, default=DEFAULT_ROWS)
+    parser.add_argument("--runs", type=int, default=1)
+    parser.add_argument(
+        "--update-budgets",
+        action="store_true",
+        help="store the measured values (with headroom) as new budgets",
+    )
+    parser.add_argument("--headroom", type=float, default=1.5)
+    args = parser.parse_args(argv)
+
+    report = run_streaming_benchmark(rows=args.rows, runs=args.runs)
+    if args.update_budgets:
+        budgets = save_budgets(SUITE, report.metrics, args.headroom)
+        report.violations = []
+    else:
+        budgets = load_budgets(SUITE)
+    report.print_summary(budgets)
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -51,6 +51,22 @@ from .formatting import to_csv, to_dict, to_json, to_multiline, to_quoted
 from .transaction import Transaction, TransactionError
 from .help import help
 from .models import FortiObject, FortiObjectList, ContentResponse, CONTENT_ENDPOINTS, is_content_endpoint, parse_fortios_config
+from .streaming import ResultStream
+from ._helpers.filters import F, Filter, compile_filter
+from ._helpers.schema_validator import PayloadValidationError, validate_payloads
+from ._helpers.bulk import BulkItemResult, BulkResult
+from ._helpers.sync import SyncPlan
+from ._helpers.lookup import LookupResult
+from ._helpers.dependencies import (
+    DependencyGraph,
+    apply_in_order,
+    delete_in_order,
+)
+from ._helpers.references import (
+    ReferenceReport,
+    avalidate_references,
+    validate_references,
+)
 
 # FortiManager proxy support
 from .fmg_proxy import (
@@ -85,6 +101,29 @@ __all__ = [
     "CONTENT_ENDPOINTS",
     "is_content_endpoint",
     "parse_fortios_config",
+    "ResultStream",
+    # Query filters
+    "F",
+    "Filter",
+    "compile_filter",
+    # Client-side payload validation
+    "PayloadValidationError",
+    "validate_payloads",
+    # Bulk CRUD results
+    "BulkItemResult",
+    "BulkResult",
+    # Desired-state sync plans
+    "SyncPlan",
+    # exists_many()/get_many() results
+    "LookupResult",
+    # Dependency-ordered bulk apply/teardown
+    "DependencyGraph",
+    "apply_in_order",
+    "delete_in_order",
+    # Batched datasource reference validation
+    "ReferenceReport",
+    "validate_references",
+    "avalidate_references",
     "configure_logging",
     # Transaction support
     "Transaction",
@@ -10,6 +10,28 @@ from .models import ContentResponse as ContentResponse
 from .models import CONTENT_ENDPOINTS as CONTENT_ENDPOINTS
 from .models import is_content_endpoint as is_content_endpoint
 from .models import parse_fortios_config as parse_fortios_config
+from .streaming import ResultStream as ResultStream
+from ._helpers.filters import F as F, Filter as Filter, compile_filter as compile_filter
+from ._helpers.schema_validator import (
+    PayloadValidationError as PayloadValidationError,
+    validate_payloads as validate_payloads,
+)
+from ._helpers.bulk import (
+    BulkItemResult as BulkItemResult,
+    BulkResult as BulkResult,
+)
+from ._helpers.sync import SyncPlan as SyncPlan
+from ._helpers.lookup import LookupResult as LookupResult
+from ._helpers.dependencies import (
+    DependencyGraph as DependencyGraph,
+    apply_in_order as apply_in_order,
+    delete_in_order as delete_in_order,
+)
+from ._helpers.references import (
+    ReferenceReport as ReferenceReport,
+    avalidate_references as avalidate_references,
+    validate_references as validate_references,
+)
 
 # Transaction support
 from .transaction import Transaction as Transaction
@@ -84,6 +106,26 @@ __all__ = [
     "FortiOS",
     "FortiObject",
     "FortiObjectList",
+    "ResultStream",
+    # Query filters
+    "F",
+    "Filter",
+    "compile_filter",
+    # Client-side payload validation
+    "PayloadValidationError",
+    "validate_payloads",
+    # Bulk CRUD results
+    "BulkItemResult",
+    "BulkResult",
+    "SyncPlan",
+    "LookupResult",
+    "DependencyGraph",
+    "apply_in_order",
+    "delete_in_order",
+    # Batched datasource reference validation
+    "ReferenceReport",
+    "validate_references",
+    "avalidate_references",
     "ContentResponse",
     "CONTENT_ENDPOINTS",
     "is_content_endpoint",
@@ -14,6 +14,17 @@ Organized into logical submodules:
 - validators: All validation functions (generic + domain-specific)
 - converters: Type conversion and data cleaning
 - response: Response parsing helpers
+- filters: Cached filter/query compilation and the F expression DSL
+- schema_validator: Opt-in payload validation compiled from schema metadata
+- references: Batched datasource reference validation for the models
+- upsert: Create-or-update strategies of the generated set() methods
+- bulk: Bulk CRUD execution with bounded concurrency
+- pagination: start/count page iteration behind iter_all()/aiter_all()
+- ordering: move() neighbour lookups and minimal-move reorder()
+- child_tables: Sub-path entry access and batch() of the child-table helpers
+- sync: Desired-state sync plans behind sync()
+- dependencies: Reference-ordered bulk creates and deletes
+- lookup: exists_many()/get_many() from one projected GET
 
 
 Import from this module for consistency across the codebase:
@@ -27,6 +38,51 @@ from hfortix_fortios._helpers.builders import (
     build_cmdb_payload_normalized,
 )
 
+# Filter/query compilation
+from hfortix_fortios._helpers.filters import F, Filter, compile_filter
+
+# Client-side payload validation
+from hfortix_fortios._helpers.schema_validator import (
+    PayloadValidationError,
+    validate_payload,
+    validate_payloads,
+)
+
+# set() create-or-update strategies
+from hfortix_fortios._helpers.upsert import upsert
+
+# Bulk CRUD execution
+from hfortix_fortios._helpers.bulk import BulkItemResult, BulkResult
+
+# Auto-pagination
+from hfortix_fortios._helpers.pagination import aiter_pages, iter_pages
+
+# Dependency-ordered bulk apply/teardown
+from hfortix_fortios._helpers.dependencies import (
+    DependencyGraph,
+    apply_in_order,
+    delete_in_order,
+)
+
+# Many-key lookups
+from hfortix_fortios._helpers.lookup import LookupResult
+
+# Desired-state sync
+from hfortix_fortios._helpers.sync import SyncPlan
+
+# Batched child-table edits
+from hfortix_fortios._helpers.child_tables import ChildTableBatch
+
+# Positional moves and reordering
+from hfortix_fortios._helpers.ordering import Move, move_object, plan_moves
+
+# Batched datasource reference validation
+from hfortix_fortios._helpers.references import (
+    ReferenceReport,
+    avalidate_references,
+    validate_references,
+)
+
 # Data converters and cleaners
 from hfortix_fortios._helpers.converters import (
     convert_boolean_to_str,
@@ -113,6 +169,40 @@ __all__ = [
     "build_api_payload",
     "build_cmdb_payload",
     "build_cmdb_payload_normalized",
+    # Filter/query compilation
+    "compile_filter",
+    "F",
+    "Filter",
+    # Payload validation
+    "PayloadValidationError",
+    "validate_payload",
+    "validate_payloads",
+    # Upsert strategies
+    "upsert",
+    # Bulk operations
+    "BulkItemResult",
+    "BulkResult",
+    # Pagination
+    "iter_pages",
+    "aiter_pages",
+    # Dependency ordering
+    "DependencyGraph",
+    "apply_in_order",
+    "delete_in_order",
+    # Many-key lookups
+    "LookupResult",
+    # Desired-state sync
+    "SyncPlan",
+    # Child-table batches
+    "ChildTableBatch",
+    # Positional moves
+    "Move",
+    "move_object",
+    "plan_moves",
+    # Reference validation
+    "ReferenceReport",
+    "validate_references",
+    "avalidate_references",
     # List normalization
     "normalize_to_name_list",
     "normalize_member_list",
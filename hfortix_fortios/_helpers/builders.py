@@ -13,8 +13,15 @@ Architecture (v0.5.128):
   - Monitor/Service endpoints: Use MONITOR_BODY_FIELD_NO_HYPHEN for body fields
   - Query/path parameters: Handled separately (not in these builders)
   - Body fields: Default to kebab-case conversion unless in *_BODY_FIELD_NO_HYPHEN
+
+Payloads are translated in a single pass: the key mapping and normalizer of
+every parameter is compiled once per call signature (the generated endpoint
+methods always pass the same keywords) and nested values are converted with
+the same rules the client used to apply in a second recursive pass. The
+result is an ``ApiPayload`` so the client knows it is already in API format.
 """
 
+import functools
 from typing import Any, Literal
 
 from hfortix_fortios._helpers.normalizers import (
@@ -25,9 +32,241 @@ from hfortix_fortios._helpers.field_overrides import (
     CMDB_BODY_FIELD_NO_HYPHEN,
     MONITOR_BODY_FIELD_NO_HYPHEN,
     LOG_BODY_FIELD_NO_HYPHEN,
+    NO_HYPHEN_PARAMETERS,
     PYTHON_KEYWORD_TO_API_FIELD,
 )
 
+# Common list fields across all API types that use [{'name': '...'}] format
+COMMON_LIST_FIELDS: frozenset[str] = frozenset(
+    {
+        # Firewall policy fields
+        "srcintf",
+        "dstintf",
+        "srcaddr",
+        "dstaddr",
+        "srcaddr6",
+        "dstaddr6",
+        "service",
+        "poolname",
+        "poolname6",
+        "groups",
+        "users",
+        "fsso_groups",
+        "ztna_ems_tag",
+        "ztna_ems_tag_secondary",
+        "ztna_geo_tag",
+        "internet_service_name",
+        "internet_service_group",
+        "internet_service_custom",
+        "internet_service_custom_group",
+        "network_service_dynamic",
+        "internet_service_src_name",
+        "internet_service_src_group",
+        "internet_service_src_custom",
+        "internet_service_src_custom_group",
+        "network_service_src_dynamic",
+        "internet_service6_name",
+        "internet_service6_group",
+        "internet_service6_custom",
+        "internet_service6_custom_group",
+        "internet_service6_src_name",
+        "internet_service6_src_group",
+        "internet_service6_src_custom",
+        "internet_service6_src_custom_group",
+        "src_vendor_mac",
+        "rtp_addr",
+        "ntlm_enabled_browsers",
+        "custom_log_fields",
+        "pcp_poolname",
+        "sgt",
+        "internet_service_fortiguard",
+        "internet_service_src_fortiguard",
+        "internet_service6_fortiguard",
+        "internet_service6_src_fortiguard",
+        # Group membership
+        "member",
+        # System/interface fields
+        "interface",
+        "allowaccess",
+        "device",
+        # Router fields
+        "gateway",
+        "nexthop",
+        # VPN fields
+        "destination",
+        "source",
+        # Application fields
+        "application",
+        "category",
+        # User fields
+        "group",
+        "user",
+        # Certificate fields
+        "ca",
+        "certificate",
+        # DNS fields
+        "dns_server",
+    }
+)
+
+# Common simple array fields that use plain list format (not [{'name': '...'}])
+COMMON_ARRAY_FIELDS: frozenset[str] = frozenset(
+    {
+        "id_list",  # monitor.system.config-script.delete
+        # Add more as discovered
+    }
+)
+
+
+# Default fields that commonly need normalization across CMDB endpoints
+DEFAULT_NORMALIZE_FIELDS: frozenset[str] = frozenset(
+    {
+        "member",  # address groups, service groups, user groups
+        "interface",  # various config objects
+        "allowaccess",  # system interfaces
+        "srcintf",  # firewall policies, routes
+        "dstintf",  # firewall policies, routes
+        "srcaddr",  # firewall policies
+        "dstaddr",  # firewall policies
+        "service",  # firewall policies
+        "users",  # various auth/policy objects
+        "groups",  # various auth/policy objects
+    }
+)
+
+_NO_FIELDS: frozenset[str] = frozenset()
+
+# Normalizer kinds of a compiled payload plan
+_PLAIN = 0
+_NAME_LIST = 1
+_STRING_LIST = 2
+
+# Body key translation cache (snake_case -> API key), see api_field_name()
+_API_KEYS: dict[str, str] = {}
+
+
+class ApiPayload(dict):
+    """
+    Payload dict whose keys (including nested ones) are in FortiOS API format.
+
+    Returned by ``build_api_payload``. The response processing client sends
+    it as-is instead of running the recursive field-name conversion again;
+    plain dicts are still converted.
+    """
+
+    __slots__ = ()
+
+
+def api_field_name(key: str) -> str:
+    """
+    Translate a body field name to its FortiOS API form.
+
+    Keeps names listed in NO_HYPHEN_PARAMETERS and converts everything else
+    from snake_case to kebab-case. Results are cached.
+    """
+    api_key = _API_KEYS.get(key)
+    if api_key is None:
+        api_key = key if key in NO_HYPHEN_PARAMETERS else key.replace("_", "-")
+        _API_KEYS[key] = api_key
+    return api_key
+
+
+def python_field_api_name(name: str) -> str:
+    """
+    API name of a field given by its Python or FortiOS name.
+
+    Renamed Python keywords get their API name back (``asn`` -> ``as``,
+    ``type_`` -> ``type``), then the body-key rules of ``api_field_name``
+    apply. FortiOS names are returned unchanged.
+    """
+    name = PYTHON_KEYWORD_TO_API_FIELD.get(name, name)
+    if name.endswith("_") and name[:-1]:
+        name = name[:-1]
+    return api_field_name(name)
+
+
+def to_api_fields(value: Any) -> Any:
+    """
+    Recursively translate the keys of nested dicts/lists to API format.
+
+    Same result as ``convert_field_names`` in the client, with cached key
+    translation.
+    """
+    if isinstance(value, dict):
+        keys = _API_KEYS
+        converted = {}
+        for key, item in value.items():
+            if isinstance(item, (dict, list)):
+                item = to_api_fields(item)
+            converted[keys.get(key) or api_field_name(key)] = item
+        return converted
+    if isinstance(value, list):
+        return [
+            to_api_fields(item) if isinstance(item, (dict, list)) else item
+            for item in value
+        ]
+    return value
+
+
+def _param_api_key(param_name: str, api_type: str | None) -> str:
+    """Builder key for a keyword parameter (before the body-key rules)."""
+    # First, check if this is a Python keyword that needs reverse mapping
+    if param_name in PYTHON_KEYWORD_TO_API_FIELD:
+        return PYTHON_KEYWORD_TO_API_FIELD[param_name]
+    # Context-aware underscore preservation based on API type
+    if api_type == "cmdb" and param_name in CMDB_BODY_FIELD_NO_HYPHEN:
+        return param_name
+    if api_type == "monitor" and param_name in MONITOR_BODY_FIELD_NO_HYPHEN:
+        return param_name
+    if api_type == "log" and param_name in LOG_BODY_FIELD_NO_HYPHEN:
+        return param_name
+    # Legacy behavior: Check all NO_HYPHEN sets if api_type not specified
+    if api_type is None and (
+        param_name in CMDB_BODY_FIELD_NO_HYPHEN
+        or param_name in MONITOR_BODY_FIELD_NO_HYPHEN
+        or param_name in LOG_BODY_FIELD_NO_HYPHEN
+    ):
+        return param_name
+    # Convert snake_case to kebab-case for FortiOS API
+    return param_name.replace("_", "-")
+
+
+@functools.lru_cache(maxsize=64)
+def _payload_plan(
+    api_type: str | None,
+    name_list_fields: frozenset[str],
+    string_list_fields: frozenset[str],
+) -> dict[str, tuple[str, int]]:
+    """
+    Translation plan of one builder configuration.
+
+    Maps each parameter name to its (API key, normalizer) step. Steps are
+    compiled on first use by ``_compile_step`` and shared by every endpoint
+    built with the same configuration.
+    """
+    return {}
+
+
+def _compile_step(
+    plan: dict[str, tuple[str, int]],
+    param_name: str,
+    api_type: str | None,
+    name_list_fields: frozenset[str],
+    string_list_fields: frozenset[str],
+) -> tuple[str, int]:
+    """Compile and store the plan step of one parameter."""
+    if param_name in string_list_fields:
+        kind = _STRING_LIST
+    elif param_name in name_list_fields:
+        kind = _NAME_LIST
+    else:
+        kind = _PLAIN
+    # The API key already includes the body-key rules, so the payload
+    # needs no further conversion
+    step = (api_field_name(_param_api_key(param_name, api_type)), kind)
+    plan[param_name] = step
+    return step
+
 
 def build_cmdb_payload(**params: Any) -> dict[str, Any]:
     """
@@ -70,20 +309,6 @@ def build_cmdb_payload_normalized(
     Returns:
         Dictionary with FortiOS API-compatible keys and normalized values
     """
-    # Default fields that commonly need normalization across CMDB endpoints
-    DEFAULT_NORMALIZE_FIELDS = {
-        "member",  # address groups, service groups, user groups
-        "interface",  # various config objects
-        "allowaccess",  # system interfaces
-        "srcintf",  # firewall policies, routes
-        "dstintf",  # firewall policies, routes
-        "srcaddr",  # firewall policies
-        "dstaddr",  # firewall policies
-        "service",  # firewall policies
-        "users",  # various auth/policy objects
-        "groups",  # various auth/policy objects
-    }
-
     # Use provided fields or defaults
     fields_to_normalize = (
         normalize_fields
@@ -158,156 +383,69 @@ def build_api_payload(
     Returns:
         Dictionary with FortiOS API-compatible keys and normalized values
     """
-    # Common list fields across all API types that use [{'name': '...'}] format
-    COMMON_LIST_FIELDS = {
-        # Firewall policy fields
-        "srcintf",
-        "dstintf",
-        "srcaddr",
-        "dstaddr",
-        "srcaddr6",
-        "dstaddr6",
-        "service",
-        "poolname",
-        "poolname6",
-        "groups",
-        "users",
-        "fsso_groups",
-        "ztna_ems_tag",
-        "ztna_ems_tag_secondary",
-        "ztna_geo_tag",
-        "internet_service_name",
-        "internet_service_group",
-        "internet_service_custom",
-        "internet_service_custom_group",
-        "network_service_dynamic",
-        "internet_service_src_name",
-        "internet_service_src_group",
-        "internet_service_src_custom",
-        "internet_service_src_custom_group",
-        "network_service_src_dynamic",
-        "internet_service6_name",
-        "internet_service6_group",
-        "internet_service6_custom",
-        "internet_service6_custom_group",
-        "internet_service6_src_name",
-        "internet_service6_src_group",
-        "internet_service6_src_custom",
-        "internet_service6_src_custom_group",
-        "src_vendor_mac",
-        "rtp_addr",
-        "ntlm_enabled_browsers",
-        "custom_log_fields",
-        "pcp_poolname",
-        "sgt",
-        "internet_service_fortiguard",
-        "internet_service_src_fortiguard",
-        "internet_service6_fortiguard",
-        "internet_service6_src_fortiguard",
-        # Group membership
-        "member",
-        # System/interface fields
-        "interface",
-        "allowaccess",
-        "device",
-        # Router fields
-        "gateway",
-        "nexthop",
-        # VPN fields
-        "destination",
-        "source",
-        # Application fields
-        "application",
-        "category",
-        # User fields
-        "group",
-        "user",
-        # Certificate fields
-        "ca",
-        "certificate",
-        # DNS fields
-        "dns_server",
-    }
-
-    # Common simple array fields that use plain list format (not [{'name': '...'}])
-    COMMON_ARRAY_FIELDS = {
-        "id_list",  # monitor.system.config-script.delete
-        # Add more as discovered
-    }
-
     # Determine which fields to normalize
     if normalize_fields is not None:
         # Explicit field list provided
-        fields_to_normalize = normalize_fields
+        fields_to_normalize = frozenset(normalize_fields)
     elif auto_normalize:
         # Auto-detect common fields
         fields_to_normalize = COMMON_LIST_FIELDS
     else:
         # No normalization
-        fields_to_normalize = set()
+        fields_to_normalize = _NO_FIELDS
 
     # Determine which array fields to normalize
     if normalize_array_fields is not None:
         # Explicit array field list provided
-        array_fields_to_normalize = normalize_array_fields
+        array_fields_to_normalize = frozenset(normalize_array_fields)
     elif auto_normalize:
         # Auto-detect common array fields
         array_fields_to_normalize = COMMON_ARRAY_FIELDS
     else:
         # No array normalization
-        array_fields_to_normalize = set()
-
-    payload: dict[str, Any] = {}
+        array_fields_to_normalize = _NO_FIELDS
 
     # Extract 'data' parameter if present
     data_dict = params.pop("data", None)
 
+    plan = _payload_plan(
+        api_type, fields_to_normalize, array_fields_to_normalize
+    )
+
+    payload = ApiPayload()
     for param_name, value in params.items():
         if value is None:
             continue
 
-        # First, check if this is a Python keyword that needs reverse mapping
-        if param_name in PYTHON_KEYWORD_TO_API_FIELD:
-            api_key = PYTHON_KEYWORD_TO_API_FIELD[param_name]
-        # Context-aware underscore preservation based on API type
-        elif api_type == "cmdb" and param_name in CMDB_BODY_FIELD_NO_HYPHEN:
-            api_key = param_name
-        elif api_type == "monitor" and param_name in MONITOR_BODY_FIELD_NO_HYPHEN:
-            api_key = param_name
-        elif api_type == "log" and param_name in LOG_BODY_FIELD_NO_HYPHEN:
-            api_key = param_name
-        # Legacy behavior: Check all NO_HYPHEN sets if api_type not specified
-        elif api_type is None:
-            if param_name in CMDB_BODY_FIELD_NO_HYPHEN:
-                api_key = param_name
-            elif param_name in MONITOR_BODY_FIELD_NO_HYPHEN:
-                api_key = param_name
-            elif param_name in LOG_BODY_FIELD_NO_HYPHEN:
-                api_key = param_name
-            else:
-                # Convert snake_case to kebab-case for FortiOS API
-                api_key = param_name.replace("_", "-")
-        else:
-            # Convert snake_case to kebab-case for FortiOS API
-            api_key = param_name.replace("_", "-")
+        step = plan.get(param_name)
+        if step is None:
+            step = _compile_step(
+                plan,
+                param_name,
+                api_type,
+                fields_to_normalize,
+                array_fields_to_normalize,
+            )
+        api_key, kind = step
 
         # Normalize simple array parameters (e.g., id_list)
-        if param_name in array_fields_to_normalize:
-            normalized = normalize_to_string_list(value)
+        if kind == _STRING_LIST:
+            value = normalize_to_string_list(value)
             # Only add if normalization resulted in non-empty/non-None list
-            if normalized:
-                payload[api_key] = normalized
+            if not value:
+                continue
         # Normalize list parameters to [{'name': '...'}] format
-        elif param_name in fields_to_normalize:
-            normalized = normalize_to_name_list(value)
+        elif kind == _NAME_LIST:
+            value = normalize_to_name_list(value)
             # Only add if normalization resulted in non-empty list
-            if normalized:
-                payload[api_key] = normalized
-        else:
-            payload[api_key] = value
+            if not value:
+                continue
+        if isinstance(value, (dict, list)):
+            value = to_api_fields(value)
+        payload[api_key] = value
 
     # Merge 'data' dictionary into payload (override existing keys)
     if data_dict and isinstance(data_dict, dict):
-        payload.update(data_dict)
+        payload.update(to_api_fields(data_dict))
 
     return payload
@@ -0,0 +1,403 @@
+"""
+Bulk CRUD execution with bounded concurrency.
+
+Runs one endpoint call per item with up to ``concurrency`` requests in
+flight: worker threads for sync clients, worker tasks for async clients.
+Items are consumed lazily, so a generator of 20k payloads never has more
+than ``concurrency`` requests (and payloads) alive at once. Each item's
+outcome and timing is collected into a ``BulkResult``::
+
+    >>> result = fgt.api.cmdb.firewall.address.bulk_post(payloads)
+    >>> result.ok, len(result.succeeded), result.elapsed
+    (True, 20000, 41.7)
+    >>> for item in result.failed:
+    ...     print(item.key, item.error)
+
+Used by the ``bulk_*`` methods of ``CRUDEndpoint``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    wait,
+)
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, Literal, Optional
+
+__all__ = [
+    "BulkItemResult",
+    "BulkResult",
+    "OnError",
+    "default_concurrency",
+    "is_async_endpoint",
+    "key_calls",
+    "payload_calls",
+    "run_bulk",
+]
+
+OnError = Literal["continue", "stop"]
+
+# Used when the HTTP client does not expose its connection limit
+DEFAULT_CONCURRENCY = 10
+
+ItemStatus = Literal["ok", "error", "skipped"]
+
+# (key, zero-argument call)
+BulkCall = tuple[Any, Callable[[], Any]]
+
+
+@dataclass
+class BulkItemResult:
+    """
+    Outcome of one item of a bulk operation.
+
+    Attributes:
+        index: Position of the item in the input
+        key: The item's mkey (None if it could not be determined)
+        status: "ok", "error" or "skipped" (not sent after a stop)
+        result: Endpoint method return value (status "ok")
+        error: Raised exception (status "error")
+        elapsed: Seconds spent on this item's request
+    """
+
+    index: int
+    key: Any
+    status: ItemStatus
+    result: Any = None
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.status == "ok"
+
+
+@dataclass
+class BulkResult:
+    """
+    Aggregated outcome of a bulk operation, items in input order.
+
+    Attributes:
+        operation: "post", "put", "set" or "delete"
+        items: One BulkItemResult per input item
+        elapsed: Wall time of the whole operation in seconds
+        concurrency: Requests that were allowed in flight
+    """
+
+    operation: str
+    items: list[BulkItemResult] = field(default_factory=list)
+    elapsed: float = 0.0
+    concurrency: int = 1
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __iter__(self) -> Iterator[BulkItemResult]:
+        return iter(self.items)
+
+    @property
+    def ok(self) -> bool:
+        """True when every item succeeded."""
+        return all(item.status == "ok" for item in self.items)
+
+    @property
+    def succeeded(self) -> list[BulkItemResult]:
+        return [item for item in self.items if item.status == "ok"]
+
+    @property
+    def failed(self) -> list[BulkItemResult]:
+        return [item for item in self.items if item.status == "error"]
+
+    @property
+    def skipped(self) -> list[BulkItemResult]:
+        return [item for item in self.items if item.status == "skipped"]
+
+    def summary(self) -> dict[str, Any]:
+        """Counts and timing as a JSON-serializable dict."""
+        timings = sorted(
+            item.elapsed for item in self.items if item.status != "skipped"
+        )
+        return {
+            "operation": self.operation,
+            "total": len(self.items),
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "skipped": len(self.skipped),
+            "elapsed": self.elapsed,
+            "concurrency": self.concurrency,
+            "max_item_elapsed": timings[-1] if timings else 0.0,
+            "median_item_elapsed": (
+                timings[len(timings) // 2] if timings else 0.0
+            ),
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"BulkResult({self.operation}: {len(self.succeeded)} ok, "
+            f"{len(self.failed)} failed, {len(self.skipped)} skipped, "
+            f"{self.elapsed:.3f}s)"
+        )
+
+
+def is_async_endpoint(endpoint: Any) -> bool:
+    """True if the endpoint's methods return coroutines."""
+    client = endpoint._client
+    # Same test _processing_client() uses to pick the async wrapper
+    http = getattr(client, "_wrapped_client", client)
+    return inspect.iscoroutinefunction(getattr(http, "get", None))
+
+
+def default_concurrency(endpoint: Any) -> int:
+    """The HTTP client's ``max_connections`` (requests it can overlap)."""
+    client = endpoint._client
+    http = getattr(client, "_wrapped_client", client)
+    limit = getattr(http, "_max_connections", None)
+    if isinstance(limit, int) and limit > 0:
+        return limit
+    return DEFAULT_CONCURRENCY
+
+
+def _response_failed(response: Any) -> bool:
+    # Raised errors are the norm; envelopes only reach us in "return" modes
+    if isinstance(response, dict):
+        return response.get("status", "success") != "success"
+    return getattr(response, "http_status", "success") == "error"
+
+
+def _finish(
+    index: int, key: Any, response: Any, error: Any, elapsed: float
+) -> BulkItemResult:
+    if error is None and _response_failed(response):
+        return BulkItemResult(index, key, "error", response, None, elapsed)
+    if error is not None:
+        return BulkItemResult(index, key, "error", None, error, elapsed)
+    return BulkItemResult(index, key, "ok", response, None, elapsed)
+
+
+def _timed(call: Callable[[], Any]) -> tuple[Any, Any, float]:
+    start = time.perf_counter()
+    try:
+        return call(), None, time.perf_counter() - start
+    except Exception as e:
+        return None, e, time.perf_counter() - start
+
+
+def _run_sync(
+    result: BulkResult, calls: Iterable[BulkCall], on_error: OnError
+) -> BulkResult:
+    stop = False
+    pending: dict[Future, tuple[int, Any]] = {}
+
+    def collect(done: Iterable[Future]) -> None:
+        nonlocal stop
+        for future in done:
+            index, key = pending.pop(future)
+            item = _finish(index, key, *future.result())
+            result.items.append(item)
+            if item.status == "error" and on_error == "stop":
+                stop = True
+
+    with ThreadPoolExecutor(max_workers=result.concurrency) as pool:
+        for index, (key, call) in enumerate(calls):
+            if stop:
+                result.items.append(BulkItemResult(index, key, "skipped"))
+                continue
+            pending[pool.submit(_timed, call)] = (index, key)
+            if len(pending) >= result.concurrency:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                collect(done)
+        collect(wait(pending).done)
+    result.items.sort(key=lambda item: item.index)
+    return result
+
+
+async def _run_async(
+    result: BulkResult, calls: Iterable[BulkCall], on_error: OnError
+) -> BulkResult:
+    # Workers share one iterator, so at most `concurrency` items are live
+    items = enumerate(calls)
+    stop = False
+
+    async def worker() -> None:
+        nonlocal stop
+        for index, (key, call) in items:
+            if stop:
+                result.items.append(BulkItemResult(index, key, "skipped"))
+                continue
+            start = time.perf_counter()
+            response, error = None, None
+            try:
+                response = call()
+                if inspect.isawaitable(response):
+                    response = await response
+            except Exception as e:
+                error = e
+            item = _finish(
+                index, key, response, error, time.perf_counter() - start
+            )
+            result.items.append(item)
+            if item.status == "error" and on_error == "stop":
+                stop = True
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(result.concurrency)))
+    result.elapsed = time.perf_counter() - started
+    result.items.sort(key=lambda item: item.index)
+    return result
+
+
+def _mkey(endpoint: Any) -> Optional[str]:
+    try:
+        return endpoint._get_helper_module().SCHEMA_INFO.get("mkey")
+    except (AttributeError, ImportError, NotImplementedError):
+        return None
+
+
+def _api_path(endpoint: Any) -> Optional[str]:
+    """Table path of the endpoint (``firewall/address``), if it has one."""
+    try:
+        return endpoint._get_helper_module().SCHEMA_INFO.get("api_path")
+    except (AttributeError, ImportError, NotImplementedError):
+        return None
+
+
+def _scope(
+    endpoint: Any, method: str, vdom: Any
+) -> tuple[dict[str, Any], Any]:
+    """
+    vdom keyword arguments for ``method`` calls and the vdom of a raw GET.
+
+    Methods of global tables take no vdom, and a GET of such a table must
+    not send one either (``vdom=False``).
+    """
+    if "vdom" not in inspect.signature(getattr(endpoint, method)).parameters:
+        return {}, False
+    return ({"vdom": vdom} if vdom is not None else {}), vdom
+
+
+def _as_payload(item: Any) -> dict[str, Any]:
+    # Pydantic models of hfortix_fortios.api.models
+    to_dict = getattr(item, "to_fortios_dict", None)
+    return to_dict() if to_dict is not None else item
+
+
+def _check_implemented(method: Callable[..., Any]) -> None:
+    """
+    Reject the base signatures of ``_protocols``.
+
+    Every endpoint inherits the bulk_* methods from CRUDEndpoint, but
+    read-only endpoints (monitor, log) do not implement post()/put()/
+    delete(): the inherited protocol stub returns None without sending
+    anything, which would be reported as success.
+    """
+    function = getattr(method, "__func__", method)
+    if getattr(function, "__module__", None) == "hfortix_fortios._protocols":
+        owner = type(getattr(method, "__self__", None)).__name__
+        raise TypeError(
+            f"{owner} does not support {function.__name__}() requests"
+        )
+
+
+def payload_calls(
+    endpoint: Any,
+    method: Callable[..., Any],
+    payloads: Iterable[Any],
+    **kwargs: Any,
+) -> Iterator[BulkCall]:
+    """
+    ``(key, call)`` pairs sending each payload through ``method``.
+
+    Raises:
+        TypeError: If the endpoint does not implement ``method``
+    """
+    _check_implemented(method)
+    mkey = _mkey(endpoint)
+    alias = mkey.replace("-", "_") if mkey else None
+
+    def calls() -> Iterator[BulkCall]:
+        for item in payloads:
+            payload = _as_payload(item)
+            key = None
+            if mkey and isinstance(payload, dict):
+                key = payload.get(mkey, payload.get(alias))  # type: ignore[arg-type]
+
+            def call(payload: Any = payload) -> Any:
+                return method(payload_dict=payload, **kwargs)
+
+            yield key, call
+
+    return calls()
+
+
+def key_calls(
+    method: Callable[..., Any], keys: Iterable[Any], **kwargs: Any
+) -> Iterator[BulkCall]:
+    """
+    ``(key, call)`` pairs calling ``method`` with each key.
+
+    Raises:
+        TypeError: If the endpoint does not implement ``method``
+    """
+    _check_implemented(method)
+
+    def calls() -> Iterator[BulkCall]:
+        for key in keys:
+            if isinstance(key, dict):
+                # e.g. {"policyid": 7} or {"name": "x", "vdom": "root"}
+                def call(key: Any = key) -> Any:
+                    return method(**key, **kwargs)
+            else:
+                def call(key: Any = key) -> Any:
+                    return method(key, **kwargs)
+
+            yield key, call
+
+    return calls()
+
+
+def run_bulk(
+    endpoint: Any,
+    operation: str,
+    calls: Iterable[BulkCall],
+    concurrency: Optional[int] = None,
+    on_error: OnError = "continue",
+) -> Any:
+    """
+    Run endpoint calls with bounded concurrency.
+
+    Args:
+        endpoint: Endpoint instance the calls belong to
+        operation: Operation name recorded in the result
+        calls: ``(key, call)`` pairs; ``call()`` performs one request
+        concurrency: Requests in flight (default: the client's
+            ``max_connections``)
+        on_error: "continue" runs every item; "stop" sends no further
+            items after the first failure (in-flight requests finish)
+
+    Returns:
+        BulkResult, or a coroutine resolving to it with an async client
+
+    Raises:
+        ValueError: If on_error or concurrency is invalid
+    """
+    if on_error not in ("continue", "stop"):
+        raise ValueError(
+            f"Invalid on_error '{on_error}'. Must be one of: continue, stop"
+        )
+    if concurrency is None:
+        concurrency = default_concurrency(endpoint)
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    result = BulkResult(operation=operation, concurrency=concurrency)
+    if is_async_endpoint(endpoint):
+        return _run_async(result, calls, on_error)
+    started = time.perf_counter()
+    _run_sync(result, calls, on_error)
+    result.elapsed = time.perf_counter() - started
+    return result
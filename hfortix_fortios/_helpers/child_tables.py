@@ -0,0 +1,392 @@
+"""
+Entry-level access to the child tables of singleton endpoints.
+
+FortiOS exposes every child table of a CMDB object as a sub-path of its
+parent (``/cmdb/router/bgp/neighbor``), and each entry under its mkey
+(``/cmdb/router/bgp/neighbor/10.0.0.1``). The generated child-table
+helpers (``fgt.api.cmdb.router.bgp.neighbor`` and friends) build on
+``ChildTableHelper``, which sends single-entry reads and writes to those
+sub-paths. Adding, updating or deleting one BGP neighbour therefore
+transfers that neighbour only, not the whole ``router bgp`` configuration
+with every other neighbour::
+
+    >>> fgt.api.cmdb.router.bgp.neighbor.set(ip="10.0.0.1", remote_as="65001")
+    # GET  /cmdb/router/bgp/neighbor/10.0.0.1     (upsert_strategy="check")
+    # PUT  /cmdb/router/bgp/neighbor/10.0.0.1     (or POST .../neighbor)
+    >>> fgt.api.cmdb.router.bgp.neighbor.delete(ip="10.0.0.1")
+    # DELETE /cmdb/router/bgp/neighbor/10.0.0.1
+
+``set()`` follows the client's ``upsert_strategy`` like the ``set()`` of
+table endpoints. With an async client every method returns a coroutine.
+
+Many edits are cheaper as one batch (``ChildTableBatch``): the parent is
+fetched once, edits are applied to an in-memory model keyed by mkey, and
+a single PUT carrying only the modified child tables is sent on exit::
+
+    >>> with fgt.api.cmdb.router.bgp.batch() as b:
+    ...     for ip, asn in peers:
+    ...         b.neighbor.set(ip=ip, remote_as=asn)
+    ...     b.network.delete(id=12)
+    ...     print(b.diff())   # what the PUT will change
+    # GET /cmdb/router/bgp, then PUT /cmdb/router/bgp {neighbor, network}
+
+``batch(dry_run=True)`` sends nothing; inspect ``diff()`` and
+``payload()`` instead. Use ``async with`` for async clients.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any, Callable, Iterator, Optional
+
+from hfortix_core.exceptions import ResourceNotFoundError
+
+from hfortix_fortios._helpers.converters import quote_path_param
+from hfortix_fortios._helpers.upsert import upsert
+
+__all__ = [
+    "BatchTable",
+    "ChildTableBatch",
+    "ChildTableHelper",
+]
+
+
+def _or_none(call: Callable[[], Any]) -> Any:
+    """
+    Run a silent GET; a missing entry yields None instead of raising.
+
+    Only ResourceNotFoundError (the 404) means "missing"; any other error
+    is raised, with sync and async clients alike.
+    """
+    try:
+        result = call()
+    except ResourceNotFoundError:
+        return None
+    if not hasattr(result, "__await__"):
+        return result
+
+    async def _run() -> Any:
+        try:
+            response = await result
+        except ResourceNotFoundError:
+            return None
+        return response
+
+    return _run()
+
+
+class _EntryEndpoint:
+    """
+    The exists/post/put surface ``upsert()`` expects, for one entry.
+
+    The write methods take the ``error_mode``/``error_format`` options of
+    the generated endpoint methods and, like those, do not apply them.
+    """
+
+    def __init__(self, helper: ChildTableHelper, key: Any):
+        self._helper = helper
+        self._key = key
+        self._client = helper._parent._client
+
+    def exists(self, **mkey: Any) -> Any:
+        return self._helper._entry_exists(self._key)
+
+    def post(self, payload_dict: dict[str, Any], **kwargs: Any) -> Any:
+        return self._client.post("cmdb", self._helper._path, data=payload_dict)
+
+    def put(self, payload_dict: dict[str, Any], **kwargs: Any) -> Any:
+        return self._client.put(
+            "cmdb", self._helper._entry_path(self._key), data=payload_dict
+        )
+
+    def delete(self, **kwargs: Any) -> Any:
+        return self._client.delete(
+            "cmdb", self._helper._entry_path(self._key)
+        )
+
+
+class ChildTableHelper:
+    """
+    Base of the generated child-table helpers.
+
+    Subclasses set ``_parent`` (the singleton endpoint), ``_table_name``
+    (attribute name, e.g. ``"neighbor_group"``) and ``_mkey``, and expose
+    the mkey under its own parameter name in get/set/delete/exists.
+    """
+
+    _parent: Any
+    _table_name: str
+    _mkey: str
+
+    @property
+    def _field(self) -> str:
+        """The child table's FortiOS field name (e.g. ``neighbor-group``)."""
+        return self._table_name.replace("_", "-")
+
+    @property
+    def _path(self) -> str:
+        api_path = self._parent._get_helper_module().SCHEMA_INFO["api_path"]
+        return f"/{api_path}/{self._field}"
+
+    def _entry_path(self, key: Any) -> str:
+        return f"{self._path}/{quote_path_param(key)}"
+
+    def _get_entries(self, key: Optional[Any] = None) -> Any:
+        """All entries (key None), the entry with ``key``, or None."""
+        client = self._parent._client
+        if key is None:
+            return client.get("cmdb", self._path)
+        # silent=True: a 404 is the expected "not found" answer
+        return _or_none(
+            lambda: client.get(
+                "cmdb", self._entry_path(key), unwrap_single=True, silent=True
+            )
+        )
+
+    def _set_entry(self, fields: dict[str, Any], **options: Any) -> Any:
+        """
+        Create or update the entry named by ``fields[self._mkey]``.
+
+        ``options`` (error_mode, error_format) are passed to the entry's
+        post()/put() like ``_put_entries()`` passes them to the parent's
+        put().
+        """
+        if self._mkey not in fields:
+            raise ValueError(f"{self._mkey} is required")
+        key = fields[self._mkey]
+        # Convert Python snake_case keys to FortiOS kebab-case
+        payload = {k.replace("_", "-"): v for k, v in fields.items()}
+        return upsert(
+            _EntryEndpoint(self, key), payload, {self._mkey: key}, **options
+        )
+
+    def _delete_entry(self, key: Any, **options: Any) -> Any:
+        return _EntryEndpoint(self, key).delete(**options)
+
+    def _put_entries(
+        self, entries: list[dict[str, Any]], **options: Any
+    ) -> Any:
+        """Replace the whole table; other parent fields are left alone."""
+        return self._parent.put(payload_dict={self._field: entries}, **options)
+
+    def _entry_exists(self, key: Any) -> Any:
+        try:
+            # silent=True: a 404 is the expected "no" answer
+            result = self._parent._client.get(
+                "cmdb", self._entry_path(key), silent=True
+            )
+        except Exception:
+            return False
+        if not hasattr(result, "__await__"):
+            return result.http_status == "success"
+
+        async def _check() -> bool:
+            try:
+                return (await result).http_status == "success"
+            except Exception:
+                return False
+
+        return _check()
+
+
+class BatchTable:
+    """
+    In-memory child table of a ``ChildTableBatch``, keyed by mkey.
+
+    Mirrors the helper's get/set/delete/exists/put, with the mkey passed
+    positionally or under its own name (``b.neighbor.delete(ip="...")``).
+    Edits are recorded only; the batch sends them.
+    """
+
+    def __init__(self, field: str, mkey: str, entries: list[dict[str, Any]]):
+        self.field = field
+        self._mkey = mkey
+        self._key_field = mkey.replace("_", "-")
+        self._original = self._index(entries)
+        self._entries = copy.deepcopy(self._original)
+
+    def _index(self, entries: list[dict[str, Any]]) -> dict[str, dict]:
+        # str() keys: FortiOS may report an integer mkey as a string
+        return {str(entry.get(self._key_field)): entry for entry in entries}
+
+    def _key(self, key: Any, named: dict[str, Any]) -> str:
+        if key is None:
+            key = named.get(self._mkey, named.get(self._key_field))
+        if key is None:
+            raise ValueError(f"{self._mkey} is required")
+        return str(key)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self._entries.values())
+
+    def get(self, key: Any = None, **named: Any) -> Any:
+        """All entries, or the entry with the given mkey (None if absent)."""
+        if key is None and not named:
+            return list(self._entries.values())
+        return self._entries.get(self._key(key, named))
+
+    def exists(self, key: Any = None, **named: Any) -> bool:
+        return self._key(key, named) in self._entries
+
+    def set(self, **fields: Any) -> None:
+        """Add an entry, or merge the fields into the existing one."""
+        key = self._key(None, fields)
+        payload = {k.replace("_", "-"): v for k, v in fields.items()}
+        current = self._entries.get(key)
+        self._entries[key] = {**current, **payload} if current else payload
+
+    def delete(self, key: Any = None, **named: Any) -> None:
+        self._entries.pop(self._key(key, named), None)
+
+    def put(self, entries: list[dict[str, Any]]) -> None:
+        """Replace the whole table."""
+        self._entries = self._index(
+            [{k.replace("_", "-"): v for k, v in e.items()} for e in entries]
+        )
+
+    @property
+    def modified(self) -> bool:
+        return list(self._entries.items()) != list(self._original.items())
+
+    def diff(self) -> dict[str, list[str]]:
+        """mkeys of the added, removed and changed entries."""
+        return {
+            "added": [k for k in self._entries if k not in self._original],
+            "removed": [k for k in self._original if k not in self._entries],
+            "changed": [
+                k
+                for k, entry in self._entries.items()
+                if k in self._original and entry != self._original[k]
+            ],
+        }
+
+
+class ChildTableBatch:
+    """
+    Batched edits of a singleton's child tables: one GET, one PUT.
+
+    Created by the ``batch()`` method of endpoints with child-table
+    helpers. Entering the context fetches the parent; each helper is
+    available under its usual name as a BatchTable. On a clean exit the
+    modified tables are sent in a single PUT (nothing is sent if no table
+    changed, on an exception, or with ``dry_run``).
+
+    Attributes:
+        dry_run: Never send the PUT
+        result: Response of the PUT, once sent
+    """
+
+    def __init__(self, parent: Any, dry_run: bool = False, vdom: Any = None):
+        self._parent = parent
+        self._helpers = {
+            name: helper
+            for name, helper in vars(parent).items()
+            if isinstance(helper, ChildTableHelper)
+        }
+        self._scope = {"vdom": vdom} if vdom is not None else {}
+        self._tables: Optional[dict[str, BatchTable]] = None
+        self.dry_run = dry_run
+        self.result: Any = None
+        self._sent = False
+
+    def __getattr__(self, name: str) -> BatchTable:
+        tables = self.__dict__.get("_tables")
+        if tables is None:
+            raise AttributeError(
+                f"{name}: use the batch inside a with/async with block"
+            )
+        try:
+            return tables[name]
+        except KeyError:
+            raise AttributeError(
+                f"{type(self._parent).__name__} has no child table '{name}'"
+            ) from None
+
+    def _fetch(self) -> Any:
+        api_path = self._parent._get_helper_module().SCHEMA_INFO["api_path"]
+        return self._parent._client.get(
+            "cmdb", f"/{api_path}", response_mode="dict", **self._scope
+        )
+
+    def _load(self, envelope: Any) -> None:
+        config = envelope.get("results") if isinstance(envelope, dict) else {}
+        if isinstance(config, list):
+            config = config[0] if config else {}
+        self._tables = {}
+        for name, helper in self._helpers.items():
+            entries = (config or {}).get(helper._field) or []
+            self._tables[name] = BatchTable(
+                helper._field, helper._mkey, entries
+            )
+
+    @property
+    def tables(self) -> dict[str, BatchTable]:
+        """BatchTable per helper name (after entering the context)."""
+        return dict(self._tables or {})
+
+    def payload(self) -> dict[str, Any]:
+        """PUT body: the complete entries of every modified table."""
+        return {
+            table.field: list(table)
+            for table in (self._tables or {}).values()
+            if table.modified
+        }
+
+    def diff(self) -> dict[str, dict[str, list[str]]]:
+        """Added/removed/changed mkeys per modified table."""
+        return {
+            table.field: table.diff()
+            for table in (self._tables or {}).values()
+            if table.modified
+        }
+
+    def push(self) -> Any:
+        """
+        Send the modified tables now (once; the exit then sends nothing).
+
+        Returns:
+            The parent's ``put()`` result (a coroutine with an async
+            client), or None if no table changed or ``dry_run`` is set
+        """
+        payload = self.payload()
+        self._sent = True
+        if self.dry_run or not payload:
+            return None
+        result = self._parent.put(payload_dict=payload, **self._scope)
+        if not hasattr(result, "__await__"):
+            self.result = result
+            return result
+
+        async def _send() -> Any:
+            self.result = await result
+            return self.result
+
+        return _send()
+
+    def __enter__(self) -> ChildTableBatch:
+        envelope = self._fetch()
+        if hasattr(envelope, "__await__"):
+            envelope.close()
+            raise TypeError("Use 'async with' for batches of async clients")
+        self._load(envelope)
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None and not self._sent:
+            self.push()
+
+    async def __aenter__(self) -> ChildTableBatch:
+        envelope = self._fetch()
+        if hasattr(envelope, "__await__"):
+            envelope = await envelope
+        self._load(envelope)
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        if exc_type is None and not self._sent:
+            result = self.push()
+            if result is not None:
+                await result
@@ -0,0 +1,371 @@
+"""
+Dependency-ordered bulk creates and deletes.
+
+FortiOS rejects an object that references one not created yet (an
+``addrgrp`` before its member addresses) and refuses to delete one that is
+still referenced (``EntryInUseError``). The generated models know every
+reference in the ``DATASOURCES`` map of each model class (see
+``datasource_map()``). ``DependencyGraph`` links the objects of a batch
+through that metadata, and the scheduler runs them level by level: every
+object of a level only depends on objects of earlier levels, so each level
+is sent with full concurrency::
+
+    >>> items = [
+    ...     (fgt.api.cmdb.firewall.addrgrp, {"name": "web", "member": [
+    ...         {"name": "web01"}, {"name": "web02"}]}),
+    ...     (fgt.api.cmdb.firewall.address, {"name": "web01", ...}),
+    ...     (fgt.api.cmdb.firewall.address, {"name": "web02", ...}),
+    ...     (fgt.api.cmdb.firewall.policy, {"policyid": 10,
+    ...         "dstaddr": [{"name": "web"}], ...}),
+    ... ]
+    >>> DependencyGraph(items).levels()
+    [[1, 2], [0], [3]]
+    >>> result = apply_in_order(items)            # addresses, group, policy
+    >>> result = delete_in_order(items)           # policy, group, addresses
+
+Only references between objects of the same batch create edges; objects
+that already exist on the FortiGate need no ordering. Objects whose
+dependencies failed are not sent and are reported as skipped.
+"""
+
+from __future__ import annotations
+
+import functools
+import importlib
+import time
+from typing import Any, Iterable, Literal, Optional, Sequence
+
+from hfortix_fortios._helpers.bulk import (
+    BulkItemResult,
+    BulkResult,
+    OnError,
+    _api_path,
+    _as_payload,
+    _mkey,
+    is_async_endpoint,
+    run_bulk,
+)
+from hfortix_fortios._helpers.references import _collect, _item_get
+
+__all__ = [
+    "DependencyGraph",
+    "apply_in_order",
+    "delete_in_order",
+    "model_class",
+]
+
+ApplyMethod = Literal["post", "put", "set"]
+
+# (endpoint, payload dict / model / bare mkey for deletes)
+Item = tuple[Any, Any]
+
+
+@functools.lru_cache(maxsize=None)
+def _model_class(module_name: str) -> Optional[type]:
+    # api.v2.cmdb.firewall.addrgrp -> api.models.cmdb.firewall.addrgrp
+    try:
+        module = importlib.import_module(
+            module_name.replace(".api.v2.", ".api.models.", 1)
+        )
+    except ImportError:
+        return None
+    for name, value in vars(module).items():
+        if (
+            name.endswith("Model")
+            and isinstance(value, type)
+            and value.__module__ == module.__name__
+        ):
+            return value
+    return None
+
+
+def model_class(endpoint: Any) -> Optional[type]:
+    """The generated pydantic model of an endpoint (None if there is none)."""
+    return _model_class(type(endpoint).__module__)
+
+
+def _table(endpoint: Any) -> Optional[str]:
+    """Datasource spelling of the endpoint's table (``firewall.address``)."""
+    api_path = _api_path(endpoint)
+    return api_path.replace("/", ".") if api_path else None
+
+
+def _python_keys(value: Any) -> Any:
+    # The model metadata is keyed by Python field names
+    if isinstance(value, dict):
+        return {
+            key.replace("-", "_"): _python_keys(item)
+            for key, item in value.items()
+        }
+    if isinstance(value, list):
+        return [_python_keys(item) for item in value]
+    return value
+
+
+class DependencyGraph:
+    """
+    References between the objects of a batch.
+
+    Args:
+        items: ``(endpoint, object)`` pairs; an object is a payload dict,
+            a generated model, or (for deletes) just its mkey
+
+    Attributes:
+        items: The input pairs
+        depends_on: Per item, the indices of the items it references
+    """
+
+    def __init__(self, items: Iterable[Item]):
+        self.items: list[Item] = list(items)
+        self._keys: list[Any] = []
+        owners: dict[tuple[str, str], list[int]] = {}
+        for index, (endpoint, obj) in enumerate(self.items):
+            key = self._key(endpoint, obj)
+            self._keys.append(key)
+            table = _table(endpoint)
+            if table is not None and key is not None:
+                owners.setdefault((table, str(key)), []).append(index)
+
+        self.depends_on: list[set[int]] = []
+        for index, (endpoint, obj) in enumerate(self.items):
+            deps: set[int] = set()
+            for reference, value in self._references(endpoint, obj):
+                table = reference.rsplit(".", 1)[0]
+                deps.update(owners.get((table, value), ()))
+            deps.discard(index)
+            self.depends_on.append(deps)
+
+    @staticmethod
+    def _key(endpoint: Any, obj: Any) -> Any:
+        mkey = _mkey(endpoint)
+        payload = _as_payload(obj)
+        if not isinstance(payload, dict) and not hasattr(
+            payload, "model_fields"
+        ):
+            return payload  # a bare mkey
+        if mkey is None:
+            return None
+        return _item_get(payload, mkey.replace("-", "_"))
+
+    @staticmethod
+    def _references(endpoint: Any, obj: Any) -> list[tuple[str, str]]:
+        if isinstance(obj, dict):
+            model, cls = _python_keys(obj), model_class(endpoint)
+        elif hasattr(obj, "model_fields"):
+            model, cls = obj, type(obj)
+        else:
+            return []
+        if cls is None:
+            return []
+        checks: list[tuple[int, str, str, tuple[str, ...]]] = []
+        _collect(0, model, cls, None, checks)
+        return [
+            (reference, value)
+            for _, _, value, references in checks
+            for reference in references
+        ]
+
+    def key(self, index: int) -> Any:
+        """mkey of the item at ``index``."""
+        return self._keys[index]
+
+    def levels(self) -> list[list[int]]:
+        """
+        Item indices grouped so that each level only depends on earlier ones.
+
+        Raises:
+            ValueError: If the references form a cycle
+        """
+        remaining = {i: set(deps) for i, deps in enumerate(self.depends_on)}
+        levels: list[list[int]] = []
+        while remaining:
+            level = sorted(i for i, deps in remaining.items() if not deps)
+            if not level:
+                cycle = sorted(remaining)[:10]
+                raise ValueError(
+                    "Circular references between items "
+                    f"{[self.describe(i) for i in cycle]}"
+                )
+            levels.append(level)
+            for i in level:
+                del remaining[i]
+            done = set(level)
+            for deps in remaining.values():
+                deps -= done
+        return levels
+
+    def describe(self, index: int) -> str:
+        """``table:mkey`` of the item at ``index``, for messages."""
+        endpoint = self.items[index][0]
+        table = _table(endpoint) or type(endpoint).__name__
+        return f"{table}:{self.key(index)}"
+
+
+def _run_levels(
+    graph: DependencyGraph,
+    levels: Sequence[list[int]],
+    operation: str,
+    call_for: Any,
+    blockers: list[set[int]],
+    concurrency: Optional[int],
+    on_error: OnError,
+) -> Any:
+    """Run the levels in order; items whose blockers failed are skipped."""
+    result = BulkResult(operation=operation)
+    if not graph.items:
+        return result
+    endpoint = graph.items[0][0]
+    failed: set[int] = set()
+    stopped = False
+
+    def prepare(level: list[int]) -> tuple[list[int], list]:
+        send = []
+        for i in level:
+            if stopped or blockers[i] & failed:
+                failed.add(i)
+                result.items.append(
+                    BulkItemResult(i, graph.key(i), "skipped")
+                )
+            else:
+                send.append(i)
+        calls = [(graph.key(i), call_for(i)) for i in send]
+        return send, calls
+
+    def record(send: list[int], level_result: BulkResult) -> None:
+        nonlocal stopped
+        result.concurrency = max(result.concurrency, level_result.concurrency)
+        for i, item in zip(send, level_result.items):
+            item.index = i
+            result.items.append(item)
+            if item.status != "ok":
+                failed.add(i)
+                stopped = stopped or on_error == "stop"
+
+    def finish(started: float) -> BulkResult:
+        result.elapsed = time.perf_counter() - started
+        result.items.sort(key=lambda item: item.index)
+        return result
+
+    if not is_async_endpoint(endpoint):
+        started = time.perf_counter()
+        for level in levels:
+            send, calls = prepare(level)
+            if calls:
+                record(
+                    send,
+                    run_bulk(endpoint, operation, calls, concurrency, on_error),
+                )
+        return finish(started)
+
+    async def _run() -> BulkResult:
+        started = time.perf_counter()
+        for level in levels:
+            send, calls = prepare(level)
+            if calls:
+                record(
+                    send,
+                    await run_bulk(
+                        endpoint, operation, calls, concurrency, on_error
+                    ),
+                )
+        return finish(started)
+
+    return _run()
+
+
+def apply_in_order(
+    items: Iterable[Item],
+    method: ApplyMethod = "post",
+    concurrency: Optional[int] = None,
+    on_error: OnError = "stop",
+    **kwargs: Any,
+) -> Any:
+    """
+    Create (or update) objects of several tables, referenced ones first.
+
+    Args:
+        items: ``(endpoint, payload)`` pairs (dicts or generated models)
+        method: Endpoint method to call: "post", "put" or "set"
+        concurrency: Requests in flight per level (default:
+            max_connections)
+        on_error: "stop" (default) sends nothing further after a failure;
+            "continue" still sends everything that does not depend on a
+            failed object
+        **kwargs: Passed to every call (e.g. ``vdom``)
+
+    Returns:
+        BulkResult in input order (a coroutine resolving to it with an
+        async client)
+
+    Raises:
+        ValueError: If the references form a cycle
+    """
+    graph = DependencyGraph(items)
+
+    def call_for(i: int) -> Any:
+        endpoint, obj = graph.items[i]
+        payload = _as_payload(obj)
+        send = getattr(endpoint, method)
+        return lambda: send(payload_dict=payload, **kwargs)
+
+    return _run_levels(
+        graph,
+        graph.levels(),
+        method,
+        call_for,
+        graph.depends_on,
+        concurrency,
+        on_error,
+    )
+
+
+def delete_in_order(
+    items: Iterable[Item],
+    concurrency: Optional[int] = None,
+    on_error: OnError = "stop",
+    **kwargs: Any,
+) -> Any:
+    """
+    Delete objects of several tables, referencing ones first.
+
+    Objects given as payloads or models contribute their references
+    (e.g. a policy's addresses); objects given as a bare mkey are only
+    ordered after whatever references them.
+
+    Args:
+        items: ``(endpoint, object)`` pairs; object is a payload dict, a
+            generated model or the mkey
+        concurrency: Requests in flight per level (default:
+            max_connections)
+        on_error: "stop" (default) or "continue"; objects still referenced
+            by a failed delete are skipped either way
+        **kwargs: Passed to every delete() call (e.g. ``vdom``)
+
+    Returns:
+        BulkResult in input order (a coroutine resolving to it with an
+        async client)
+
+    Raises:
+        ValueError: If the references form a cycle
+    """
+    graph = DependencyGraph(items)
+    # A delete waits for everything that references the object
+    referenced_by: list[set[int]] = [set() for _ in graph.items]
+    for i, deps in enumerate(graph.depends_on):
+        for j in deps:
+            referenced_by[j].add(i)
+
+    def call_for(i: int) -> Any:
+        endpoint = graph.items[i][0]
+        key = graph.key(i)
+        return lambda: endpoint.delete(key, **kwargs)
+
+    return _run_levels(
+        graph,
+        list(reversed(graph.levels())),
+        "delete",
+        call_for,
+        referenced_by,
+        concurrency,
+        on_error,
+    )
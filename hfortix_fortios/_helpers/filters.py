@@ -0,0 +1,250 @@
+"""
+Filter compilation for FortiOS GET queries.
+
+FortiOS combines filters with AND by repeating the ``filter`` query
+parameter and with OR by separating conditions with a comma inside one
+parameter. The generated ``get()`` methods accept filters as:
+
+- a string: ``"name=@web"``, ``"name=@web&type==fqdn"``,
+  ``"filter=name=@web&filter=type==fqdn"`` (``&`` means AND)
+- a list of such strings (AND)
+- a ``Filter`` built with the ``F`` expression DSL
+
+``compile_filter`` turns any of these into the ``filter`` query value once
+and keeps the result in an LRU cache, so polling loops that repeat the same
+query do no parsing at all.
+
+Expression DSL::
+
+    >>> from hfortix_fortios import F
+    >>> F.name.contains("web") & (F.type == "fqdn")
+    Filter(['name=@web', 'type==fqdn'])
+    >>> (F.status == "enable") | (F.comment.contains("temp"))
+    Filter(['status==enable,comment=@temp'])
+    >>> fgt.api.cmdb.firewall.address.get(filter=F.name.contains("web"))
+
+Comparisons bind looser than ``&`` and ``|`` in Python, so parenthesize
+them when combining: ``F.a.contains("x") & (F.b == "y")``.
+"""
+
+from __future__ import annotations
+
+import functools
+from typing import Any, Iterable, Sequence, Union
+
+from hfortix_fortios._helpers.builders import python_field_api_name
+
+__all__ = ["F", "Field", "Filter", "compile_filter"]
+
+# Size of the compiled-query cache
+FILTER_CACHE_SIZE = 1024
+
+_PREFIX = "filter="
+
+
+class Filter(list):
+    """
+    Compiled filter: a list of AND-ed conditions.
+
+    Each item is one ``filter`` query value; conditions inside an item are
+    OR-ed with commas. Being a list, a Filter can be passed anywhere a
+    ``list[str]`` filter is accepted. Combine filters with ``&`` (AND) and
+    ``|`` (OR).
+    """
+
+    __slots__ = ()
+
+    def __and__(self, other: Any) -> "Filter":
+        return Filter([*self, *_as_filter(other)])
+
+    def __rand__(self, other: Any) -> "Filter":
+        return Filter([*_as_filter(other), *self])
+
+    def __or__(self, other: Any) -> "Filter":
+        # (a AND b) OR (c AND d) == (a OR c) AND (a OR d) AND (b OR c) ...
+        right = _as_filter(other)
+        return Filter([f"{a},{b}" for a in self for b in right])
+
+    def __ror__(self, other: Any) -> "Filter":
+        return _as_filter(other) | self
+
+    def __repr__(self) -> str:
+        return f"Filter({list.__repr__(self)})"
+
+
+def _as_filter(value: Any) -> Filter:
+    if isinstance(value, Filter):
+        return value
+    if isinstance(value, Field):
+        raise TypeError(
+            f"Cannot combine field {value.api_name!r} without a comparison; "
+            "parenthesize comparisons, e.g. F.a.contains('x') & (F.b == 'y')"
+        )
+    if isinstance(value, (str, list, tuple)):
+        compiled = compile_filter(value)
+        return Filter([compiled] if isinstance(compiled, str) else compiled)
+    raise TypeError(f"Cannot combine a Filter with {type(value).__name__}")
+
+
+def _format_value(value: Any) -> str:
+    """Render a filter value; commas and backslashes are escaped."""
+    if isinstance(value, bool):
+        text = "enable" if value else "disable"
+    else:
+        text = str(value)
+    if "\\" in text or "," in text:
+        text = text.replace("\\", "\\\\").replace(",", "\\,")
+    return text
+
+
+class Field:
+    """
+    A field reference in a filter expression (see ``F``).
+
+    Comparison operators and the methods below return a ``Filter``.
+    """
+
+    __slots__ = ("api_name",)
+
+    def __init__(self, api_name: str):
+        self.api_name = api_name
+
+    def __repr__(self) -> str:
+        return f"F[{self.api_name!r}]"
+
+    def _condition(self, operator: str, value: Any) -> Filter:
+        return Filter([f"{self.api_name}{operator}{_format_value(value)}"])
+
+    def __eq__(self, value: Any) -> Filter:  # type: ignore[override]
+        return self._condition("==", value)
+
+    def __ne__(self, value: Any) -> Filter:  # type: ignore[override]
+        return self._condition("!=", value)
+
+    def __lt__(self, value: Any) -> Filter:
+        return self._condition("<", value)
+
+    def __le__(self, value: Any) -> Filter:
+        return self._condition("<=", value)
+
+    def __gt__(self, value: Any) -> Filter:
+        return self._condition(">", value)
+
+    def __ge__(self, value: Any) -> Filter:
+        return self._condition(">=", value)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def contains(self, value: Any) -> Filter:
+        """Field contains ``value`` (``=@``)."""
+        return self._condition("=@", value)
+
+    def not_contains(self, value: Any) -> Filter:
+        """Field does not contain ``value`` (``!@``)."""
+        return self._condition("!@", value)
+
+    def is_in(self, *values: Any) -> Filter:
+        """Field equals any of ``values`` (OR of ``==``)."""
+        if not values:
+            raise ValueError(
+                f"is_in() on {self.api_name!r} needs at least one value"
+            )
+        return Filter(
+            [",".join(f"{self.api_name}=={_format_value(v)}" for v in values)]
+        )
+
+
+class _FieldFactory:
+    """
+    Entry point of the filter DSL.
+
+    ``F.field_name`` uses the same name translation as request bodies
+    (``internet_service`` -> ``internet-service``, ``type_`` -> ``type``);
+    ``F["exact-name"]`` uses the name verbatim.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Field:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return _field(name)
+
+    def __getitem__(self, api_name: str) -> Field:
+        return Field(api_name)
+
+    def __repr__(self) -> str:
+        return "F"
+
+
+@functools.lru_cache(maxsize=None)
+def _field(python_name: str) -> Field:
+    return Field(python_field_api_name(python_name))
+
+
+F = _FieldFactory()
+
+
+@functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _compile_text(text: str) -> tuple[str, ...]:
+    """Split one filter string into its AND-ed conditions."""
+    # Accept an explicit leading "filter=" (copied from a URL)
+    if text.startswith(_PREFIX):
+        text = text[len(_PREFIX) :]
+    if "&" not in text:
+        return (text,)
+    # "a&b", "a&filter=b" and mixes of both are all AND
+    first, *rest = text.split("&")
+    return (first, *(part.removeprefix(_PREFIX) for part in rest))
+
+
+@functools.lru_cache(maxsize=FILTER_CACHE_SIZE)
+def _compile_items(items: tuple[str, ...]) -> tuple[str, ...]:
+    compiled: list[str] = []
+    for item in items:
+        compiled.extend(_compile_text(item))
+    return tuple(compiled)
+
+
+def _compile_mixed(items: tuple[Union[str, Filter], ...]) -> tuple[str, ...]:
+    """Conditions of a list mixing strings and (unhashable) Filters."""
+    compiled: list[str] = []
+    for item in items:
+        if isinstance(item, Filter):
+            compiled.extend(item)  # already compiled conditions
+        else:
+            compiled.extend(_compile_text(item))
+    return tuple(compiled)
+
+
+def compile_filter(
+    filter: Union[str, Sequence[str], Iterable[str]],
+) -> Union[str, list[str]]:
+    """
+    Compile a filter into the value of the ``filter`` query parameter.
+
+    Args:
+        filter: Filter string, ``Filter``, or a list of filter strings
+            and ``Filter`` objects
+
+    Returns:
+        A single condition string, or a list of conditions (AND) that is
+        sent as repeated ``filter`` parameters
+
+    Example:
+        >>> compile_filter("name=@web&filter=type==fqdn")
+        ['name=@web', 'type==fqdn']
+        >>> compile_filter(["status==enable"])
+        'status==enable'
+    """
+    if isinstance(filter, Filter):
+        return filter[0] if len(filter) == 1 else list(filter)
+    if isinstance(filter, str):
+        parts = _compile_text(filter)
+    else:
+        items = tuple(filter)
+        if any(isinstance(item, Filter) for item in items):
+            parts = _compile_mixed(items)
+        else:
+            parts = _compile_items(items)
+    return parts[0] if len(parts) == 1 else list(parts)
@@ -8,7 +8,7 @@ _helpers.<endpoint_name> module for endpoint-specific data.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Union
+from typing import TYPE_CHECKING, Any, Iterable, Literal, Union
 
 if TYPE_CHECKING:
     from types import ModuleType
@@ -200,6 +200,54 @@ class MetadataMixin:
 
         return validate_field_value(field_name, value)
 
+    @classmethod
+    def validate_payloads(
+        cls,
+        payloads: Iterable[dict[str, Any]],
+        method: str = "POST",
+        mode: Literal["fast", "strict"] = "fast",
+        raise_on_error: bool = True,
+        required: bool = False,
+    ) -> dict[int, list[Any]]:
+        """
+        Validate many payloads against this endpoint's schema in one call.
+
+        Uses the same compiled rules as the ``validate`` client option and
+        reports the errors of every payload together.
+
+        Args:
+            payloads: Request bodies (Python or API field names)
+            method: "POST" or "PUT" (required fields only apply to POST)
+            mode: "fast" (default) or "strict"
+            raise_on_error: Raise PayloadValidationError instead of
+                returning the errors
+            required: Also report missing required fields (POST only);
+                the schema lists some fields that are only required for
+                certain object types
+
+        Returns:
+            Field errors (ValidationError) per payload index
+
+        Examples:
+            >>> errors = fgt.api.cmdb.firewall.address.validate_payloads(
+            ...     rows, raise_on_error=False
+            ... )
+            >>> for index, field_errors in errors.items():
+            ...     print(index, [e.field for e in field_errors])
+        """
+        from hfortix_fortios._helpers.schema_validator import (
+            validate_payloads,
+        )
+
+        return validate_payloads(
+            cls,
+            payloads,
+            method=method,
+            mode=mode,
+            raise_on_error=raise_on_error,
+            required=required,
+        )
+
     @classmethod
     def required_fields(cls) -> list[str]:
         """
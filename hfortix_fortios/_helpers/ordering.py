@@ -0,0 +1,372 @@
+"""
+Positional moves for sequenced table endpoints.
+
+FortiOS reorders table entries with ``PUT <path>/<mkey>?action=move`` and a
+``before=<mkey>`` or ``after=<mkey>`` neighbour. Moves to ``"top"``,
+``"bottom"`` or a numeric position first need that neighbour's key, which
+``move_object()`` looks up without downloading the table: only the mkey
+column is requested (``format=<mkey>``) and only the one-row window around
+the target position (``start``/``count``)::
+
+    >>> fgt.api.cmdb.firewall.policy.move(policyid=100, position="top")
+    # GET  /cmdb/firewall/policy?format=policyid&start=0&count=1
+    # PUT  /cmdb/firewall/policy/100?action=move&before=<first policyid>
+
+Positions past the first row use ``matched_count`` of that window to find
+the last row, so a move costs at most two single-key GETs however large the
+table is. The lookups are made in ``"dict"`` mode regardless of the
+client's response mode; the PUT returns whatever the client returns.
+
+``reorder()`` brings a whole table into a desired order with the fewest
+moves: it reads the mkey column once, keeps the longest increasing
+subsequence of the current order in place and moves only the remaining
+entries, each next to a neighbour that is already in its final place::
+
+    >>> result = fgt.api.cmdb.firewall.policy.reorder([3, 1, 2, 4])
+    >>> [item.key for item in result]   # policy 3 moved before policy 1
+    [3]
+
+Run it inside ``fgt.transaction()`` to apply all moves atomically.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import (
+    Any,
+    Generator,
+    Hashable,
+    Iterable,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+
+from hfortix_fortios._helpers.bulk import (
+    BulkItemResult,
+    BulkResult,
+    OnError,
+    _api_path,
+    _mkey,
+    _scope,
+    is_async_endpoint,
+    run_bulk,
+)
+from hfortix_fortios._helpers.converters import quote_path_param
+from hfortix_fortios._helpers.pagination import Page, read_page
+
+__all__ = [
+    "Move",
+    "move_object",
+    "plan_moves",
+    "reorder",
+]
+
+# (start, count) of the window to fetch; count None means every row
+Window = tuple[int, Optional[int]]
+
+# Yields windows, receives their pages, returns (before/after, reference)
+Plan = Generator[Window, Page, tuple[str, Any]]
+
+
+def _key(row: Any, mkey: Optional[str]) -> Any:
+    if mkey and isinstance(row, dict):
+        return row.get(mkey)
+    return row
+
+
+def _last(page: Page, mkey: Optional[str]) -> Plan:
+    """Key of the last row, given any page that reported the total."""
+    if page.total is None:
+        # No matched_count: read the whole (mkey-only) column instead
+        page = yield 0, None
+        return "after", _key(page.items[-1], mkey)
+    if not page.items or page.next_start != page.total:
+        page = yield page.total - 1, 1
+    return "after", _key(page.items[-1], mkey)
+
+
+def _plan(
+    position: Union[str, int],
+    reference: Any,
+    reference_arg: str,
+    mkey: Optional[str],
+) -> Plan:
+    if isinstance(position, int):
+        if position < 1:
+            raise ValueError(f"Position must be >= 1, got {position}")
+        page = yield position - 1, 1
+        if page.items:
+            # Move before the object currently at that position
+            return "before", _key(page.items[0], mkey)
+        total = page.total
+        if total is None:
+            page = yield 0, None
+            total = len(page.items)
+            page = page._replace(total=total)
+        if not total:
+            raise ValueError(
+                f"Cannot move to position {position} - no objects found"
+            )
+        # Valid range is 1..len+1 (len+1 appends at the end)
+        if position > total + 1:
+            raise ValueError(
+                f"Position {position} is out of range. Valid range: "
+                f"1-{total + 1} ({total} objects exist)"
+            )
+        return (yield from _last(page, mkey))
+
+    if position in ("top", "bottom"):
+        page = yield 0, 1
+        if not page.items:
+            raise ValueError(f"Cannot move to {position} - no objects found")
+        if position == "top":
+            return "before", _key(page.items[0], mkey)
+        return (yield from _last(page, mkey))
+
+    if reference is None:
+        raise ValueError(
+            f"{reference_arg} is required when position='{position}'"
+        )
+    return position, reference  # type: ignore[return-value]
+
+
+def move_object(
+    endpoint: Any,
+    path: str,
+    key: Any,
+    position: Union[str, int],
+    reference: Any = None,
+    reference_arg: str = "reference",
+    params: Optional[dict[str, Any]] = None,
+    vdom: Any = None,
+    mkey: Optional[str] = None,
+) -> Any:
+    """
+    Move one object of a sequenced table endpoint.
+
+    Args:
+        endpoint: Generated endpoint instance
+        path: Table path, e.g. ``"/firewall/policy"``
+        key: mkey of the object to move
+        position: "before", "after", "top", "bottom" or a 1-based position
+        reference: mkey of the neighbour (required for before/after)
+        reference_arg: Name of the endpoint's reference argument, used in
+            error messages
+        params: Additional query parameters for the move request
+        vdom: Virtual domain (False for global endpoints)
+        mkey: Key field of the table (default: the endpoint schema's mkey)
+
+    Returns:
+        The ``put()`` result, or a coroutine resolving to it with an async
+        client
+
+    Raises:
+        ValueError: If the position is invalid or out of range, or a
+            required reference is missing
+    """
+    client = endpoint._client
+    mkey = mkey or _mkey(endpoint)
+
+    def fetch(window: Window) -> Any:
+        start, count = window
+        query: dict[str, Any] = {"start": start}
+        if count is not None:
+            query["count"] = count
+        if mkey:
+            query["format"] = mkey
+        return client.get(
+            "cmdb", path, params=query, vdom=vdom, response_mode="dict"
+        )
+
+    def put(actual_position: str, reference: Any) -> Any:
+        query = {
+            "action": "move",
+            actual_position: reference,
+            **(params or {}),
+        }
+        return client.put(
+            "cmdb",
+            f"{path}/{quote_path_param(key)}",
+            data={},
+            params=query,
+            vdom=vdom,
+        )
+
+    plan = _plan(position, reference, reference_arg, mkey)
+    try:
+        window = next(plan)
+    except StopIteration as done:
+        # before/after: nothing to look up
+        return put(*done.value)
+
+    if not is_async_endpoint(endpoint):
+        try:
+            while True:
+                window = plan.send(read_page(window[0], fetch(window)))
+        except StopIteration as done:
+            return put(*done.value)
+
+    async def _move() -> Any:
+        nonlocal window
+        try:
+            while True:
+                response = await fetch(window)
+                window = plan.send(read_page(window[0], response))
+        except StopIteration as done:
+            return await put(*done.value)
+
+    return _move()
+
+
+class Move(NamedTuple):
+    """One ``action=move`` request: put ``key`` before/after ``reference``."""
+
+    key: Any
+    position: str
+    reference: Any
+
+
+def _stable(indices: Sequence[int]) -> set[int]:
+    """Positions in ``indices`` forming a longest increasing subsequence."""
+    # Patience sorting: tails[k] is the position ending the best run of k+1
+    tails: list[int] = []
+    tail_values: list[int] = []
+    previous = [-1] * len(indices)
+    for i, value in enumerate(indices):
+        k = bisect_left(tail_values, value)
+        if k:
+            previous[i] = tails[k - 1]
+        if k == len(tails):
+            tails.append(i)
+            tail_values.append(value)
+        else:
+            tails[k] = i
+            tail_values[k] = value
+    stable = set()
+    i = tails[-1] if tails else -1
+    while i >= 0:
+        stable.add(i)
+        i = previous[i]
+    return stable
+
+
+def plan_moves(
+    current: Sequence[Hashable], desired: Iterable[Hashable]
+) -> list[Move]:
+    """
+    Fewest moves that bring ``current`` into the ``desired`` order.
+
+    ``desired`` may list a subset of the keys: the listed entries are
+    reordered among the positions they occupy now and unlisted entries
+    keep their place. Moves are to be applied in the returned order.
+
+    Args:
+        current: Keys in their current order
+        desired: Keys in the desired order
+
+    Returns:
+        Move tuples; empty if the order is already as desired
+
+    Raises:
+        ValueError: If ``desired`` repeats a key or names an unknown one
+    """
+    desired = list(desired)
+    position = {key: i for i, key in enumerate(current)}
+    unknown = [key for key in desired if key not in position]
+    if unknown:
+        raise ValueError(f"Unknown keys in desired order: {unknown[:10]}")
+    if len(set(desired)) != len(desired):
+        raise ValueError("Desired order lists a key more than once")
+
+    listed = set(desired)
+    slots = iter(desired)
+    target = [next(slots) if key in listed else key for key in current]
+    stable = _stable([position[key] for key in target])
+    if len(stable) == len(target):
+        return []
+
+    moves = []
+    first = min(stable)
+    # Entries ahead of the first fixed one: each goes before its successor
+    for i in range(first - 1, -1, -1):
+        moves.append(Move(target[i], "before", target[i + 1]))
+    # The rest: each goes after its predecessor, which is already placed
+    for i in range(first + 1, len(target)):
+        if i not in stable:
+            moves.append(Move(target[i], "after", target[i - 1]))
+    return moves
+
+
+def _column(response: Any, mkey: str) -> list[Any]:
+    return [row.get(mkey) for row in read_page(0, response).items]
+
+
+def reorder(
+    endpoint: Any,
+    desired: Iterable[Any],
+    dry_run: bool = False,
+    on_error: OnError = "stop",
+    vdom: Any = None,
+) -> Any:
+    """
+    Bring a sequenced table into the desired order with the fewest moves.
+
+    Args:
+        endpoint: Generated endpoint instance with a ``move()`` method
+        desired: mkeys in the desired order (all keys, or a subset to
+            reorder among their current positions)
+        dry_run: Only plan; every move is reported as skipped
+        on_error: "stop" (default) sends no further moves after a failure;
+            "continue" sends them anyway
+        vdom: Virtual domain name (None: the client's default)
+
+    Returns:
+        BulkResult with one item per move (``result`` of skipped items is
+        the planned Move), or a coroutine resolving to it with an async
+        client
+
+    Raises:
+        TypeError: If the endpoint has no positional ``move()``
+        ValueError: If ``desired`` repeats a key or names an unknown one
+    """
+    mkey = _mkey(endpoint)
+    if mkey is None or not hasattr(endpoint, "move"):
+        raise TypeError(
+            f"{type(endpoint).__name__} is not a sequenced table endpoint"
+        )
+    path = f"/{_api_path(endpoint)}"
+    scope, vdom = _scope(endpoint, "move", vdom)
+    response = endpoint._client.get(
+        "cmdb", path, params={"format": mkey}, vdom=vdom, response_mode="dict"
+    )
+
+    def run(moves: list[Move]) -> Any:
+        if dry_run:
+            return BulkResult(
+                operation="reorder",
+                items=[
+                    BulkItemResult(i, move.key, "skipped", move)
+                    for i, move in enumerate(moves)
+                ],
+            )
+        calls = (
+            (
+                move.key,
+                lambda move=move: endpoint.move(*move, **scope),
+            )
+            for move in moves
+        )
+        # Each move is relative to an earlier one: strictly one at a time
+        return run_bulk(endpoint, "reorder", calls, 1, on_error)
+
+    if not is_async_endpoint(endpoint):
+        return run(plan_moves(_column(response, mkey), desired))
+
+    async def _reorder() -> Any:
+        current = _column(await response, mkey)
+        result = run(plan_moves(current, desired))
+        return result if dry_run else await result
+
+    return _reorder()
@@ -0,0 +1,301 @@
+"""
+Auto-pagination for list endpoints.
+
+FortiOS pages list responses with the ``start``/``count`` query parameters
+and reports the total in the envelope (``matched_count``). ``iter_pages``
+and ``aiter_pages`` walk those windows for the caller, one page in memory
+at a time, optionally fetching the next page while the current one is
+being consumed (``prefetch``).
+
+Once the first page has reported the total, the remaining windows can
+also be fetched concurrently (``fanout`` > 1): up to ``fanout`` requests
+are in flight and pages are still yielded in order, so the FortiGate is
+never idle between requests. Rows added or deleted while a parallel walk
+is running can shift the windows, as with any offset pagination.
+
+Used by ``iter_all()``/``aiter_all()`` of the generated endpoints::
+
+    >>> for address in fgt.api.cmdb.firewall.address.iter_all(page_size=500):
+    ...     process(address)
+    >>> async for session in fgt.api.monitor.firewall.sessions.aiter_all():
+    ...     process(session)
+
+Items are whatever the endpoint's response mode yields per row:
+FortiObject in ``"object"`` mode, dicts in ``"dict"`` and ``"stream"``
+mode. ``"raw_bytes"`` responses cannot be paged.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+)
+
+__all__ = [
+    "DEFAULT_PAGE_SIZE",
+    "Page",
+    "aiter_pages",
+    "iter_pages",
+    "read_page",
+]
+
+DEFAULT_PAGE_SIZE = 1000
+
+# fetch(start, count) -> response (or awaitable response)
+PageFetch = Callable[[int, int], Any]
+
+
+class Page(NamedTuple):
+    """One window of a list response."""
+
+    start: int
+    items: list[Any]
+    total: Optional[int]
+
+    @property
+    def next_start(self) -> int:
+        return self.start + len(self.items)
+
+    def is_last(self, page_size: int) -> bool:
+        """True if no further page needs to be requested."""
+        if not self.items:
+            return True
+        if self.total is not None:
+            return self.next_start >= self.total
+        # No total reported: a short page is the last one
+        return len(self.items) < page_size
+
+
+def _total(envelope: Any) -> Optional[int]:
+    if not isinstance(envelope, dict):
+        return None
+    # Monitor endpoints without matched_count report the row count as size
+    total = envelope.get("matched_count", envelope.get("size"))
+    return total if isinstance(total, int) else None
+
+
+def _windows(first: Page, page_size: int) -> tuple[int, range]:
+    """Page size actually served and the starts of the remaining pages."""
+    if not first.is_last(page_size) and len(first.items) < page_size:
+        # The server capped count (e.g. monitor endpoints serve at most
+        # 1000 rows); use its page size so the windows leave no gaps
+        page_size = len(first.items)
+    if first.total is None or first.is_last(page_size):
+        return page_size, range(0)
+    return page_size, range(first.next_start, first.total, page_size)
+
+
+def read_page(start: int, response: Any) -> Page:
+    """
+    Split a list response into its rows and the reported total.
+
+    Args:
+        start: ``start`` the page was requested with
+        response: GET result in object, dict or stream response mode
+
+    Returns:
+        Page with the rows and ``matched_count`` (None if not reported)
+
+    Raises:
+        TypeError: For ``"raw_bytes"`` responses
+    """
+    if isinstance(response, (bytes, bytearray, memoryview)):
+        raise TypeError(
+            "Pagination needs decoded responses; use the object, dict or "
+            "stream response mode instead of raw_bytes"
+        )
+    if isinstance(response, dict):
+        # "dict" mode: the API envelope
+        results = response.get("results", [])
+        items = results if isinstance(results, list) else [results]
+        return Page(start, items, _total(response))
+    if isinstance(response, list):
+        # FortiObjectList (or a plain list of rows)
+        envelope = getattr(response, "raw", None)
+        return Page(start, response, _total(envelope))
+    if hasattr(response, "envelope") and hasattr(response, "__iter__"):
+        # ResultStream: rows first, the envelope is complete afterwards
+        items = list(response)
+        return Page(start, items, _total(response.envelope))
+    # A single object (endpoints that unwrap one-row results)
+    return Page(start, [response], None)
+
+
+def _check_sizes(page_size: int, fanout: int) -> None:
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if fanout < 1:
+        raise ValueError("fanout must be at least 1")
+
+
+def _iter_parallel(
+    fetch: PageFetch, first: Page, page_size: int, fanout: int
+) -> Iterator[Page]:
+    page_size, starts = _windows(first, page_size)
+    yield first
+    if not starts:
+        return
+    pool = ThreadPoolExecutor(max_workers=min(fanout, len(starts)))
+    window: deque[tuple[int, Future]] = deque()
+    remaining = iter(starts)
+    try:
+        for offset in remaining:
+            window.append((offset, pool.submit(fetch, offset, page_size)))
+            if len(window) >= fanout:
+                break
+        while window:
+            offset, future = window.popleft()
+            for following in remaining:
+                window.append(
+                    (following, pool.submit(fetch, following, page_size))
+                )
+                break
+            yield read_page(offset, future.result())
+    finally:
+        for _, future in window:
+            future.cancel()
+        pool.shutdown(wait=False)
+
+
+def iter_pages(
+    fetch: PageFetch,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    start: int = 0,
+    prefetch: bool = True,
+    fanout: int = 1,
+) -> Iterator[Page]:
+    """
+    Yield successive pages of a list endpoint (sync clients).
+
+    Args:
+        fetch: ``fetch(start, count)`` performing one GET
+        page_size: Rows requested per page
+        start: Index of the first row
+        prefetch: Request the next page in a background thread while the
+            current page is being consumed
+        fanout: Pages fetched concurrently once the first page reported
+            the total (1 = sequential)
+
+    Yields:
+        Page objects in order
+    """
+    _check_sizes(page_size, fanout)
+    if fanout > 1:
+        first = read_page(start, fetch(start, page_size))
+        if first.total is not None:
+            yield from _iter_parallel(fetch, first, page_size, fanout)
+            return
+        # No total to plan the windows with: continue sequentially
+        yield first
+        if first.is_last(page_size):
+            return
+        start = first.next_start
+    if not prefetch:
+        while True:
+            page = read_page(start, fetch(start, page_size))
+            yield page
+            if page.is_last(page_size):
+                return
+            start = page.next_start
+
+    pool = ThreadPoolExecutor(max_workers=1)
+    pending: Optional[Future] = None
+    try:
+        page = read_page(start, fetch(start, page_size))
+        while True:
+            if not page.is_last(page_size):
+                pending = pool.submit(fetch, page.next_start, page_size)
+            yield page
+            if pending is None:
+                return
+            page = read_page(page.next_start, pending.result())
+            pending = None
+    finally:
+        if pending is not None:
+            pending.cancel()
+        pool.shutdown(wait=False)
+
+
+async def aiter_pages(
+    fetch: Callable[[int, int], Awaitable[Any]],
+    page_size: int = DEFAULT_PAGE_SIZE,
+    start: int = 0,
+    prefetch: bool = True,
+    fanout: int = 1,
+) -> AsyncIterator[Page]:
+    """
+    Yield successive pages of a list endpoint (async).
+
+    Args:
+        fetch: ``fetch(start, count)`` returning an awaitable GET result
+            (or an awaitable Page)
+        page_size: Rows requested per page
+        start: Index of the first row
+        prefetch: Request the next page in a task while the current page
+            is being consumed
+        fanout: Pages fetched concurrently once the first page reported
+            the total (1 = sequential)
+
+    Yields:
+        Page objects in order
+    """
+    _check_sizes(page_size, fanout)
+
+    async def get(offset: int, count: int = page_size) -> Page:
+        response = fetch(offset, count)
+        if inspect.isawaitable(response):
+            response = await response
+        if isinstance(response, Page):
+            return response
+        if hasattr(response, "__aiter__") and hasattr(response, "envelope"):
+            # Async ResultStream
+            items = [item async for item in response]
+            return Page(offset, items, _total(response.envelope))
+        return read_page(offset, response)
+
+    pending: Optional[asyncio.Task] = None
+    window: deque[asyncio.Task] = deque()
+    try:
+        page = await get(start)
+        if fanout > 1 and page.total is not None:
+            size, starts = _windows(page, page_size)
+            yield page
+            remaining = iter(starts)
+            for offset in remaining:
+                window.append(asyncio.ensure_future(get(offset, size)))
+                if len(window) >= fanout:
+                    break
+            while window:
+                task = window.popleft()
+                for following in remaining:
+                    window.append(asyncio.ensure_future(get(following, size)))
+                    break
+                yield await task
+            return
+        while True:
+            last = page.is_last(page_size)
+            if prefetch and not last:
+                pending = asyncio.ensure_future(get(page.next_start))
+            yield page
+            if last:
+                return
+            if pending is not None:
+                page = await pending
+                pending = None
+            else:
+                page = await get(page.next_start)
+    finally:
+        if pending is not None:
+            pending.cancel()
+        for task in window:
+            task.cancel()
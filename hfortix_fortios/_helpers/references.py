@@ -0,0 +1,454 @@
+"""
+Batched datasource reference validation for the pydantic models.
+
+The generated models list the datasource tables of their fields in a
+``DATASOURCES`` class attribute
+(``{"interface": ("system.interface.name", "system.zone.name")}``).
+The per-field ``validate_*_references()`` methods turn every referenced
+value into its own ``exists()`` request, which makes a pre-flight check of
+a few thousand policies cost tens of thousands of round trips.
+
+This module collects every reference across a batch of models first,
+fetches each referenced table once with ``format=<key>`` (only the key
+column, concurrently), and resolves all checks against in-memory name
+sets::
+
+    >>> from hfortix_fortios import validate_references
+    >>> report = validate_references(policies, fgt)
+    >>> report.requests          # one GET per referenced table
+    12
+    >>> for index, errors in report.errors.items():
+    ...     print(policies[index].name, errors)
+
+``avalidate_references()`` is the async variant; it works with both async
+and sync clients (sync fetches run in worker threads).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import inspect
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional, Union
+
+from hfortix_fortios._helpers.response import get_results
+
+__all__ = [
+    "ReferenceReport",
+    "avalidate_references",
+    "datasource_map",
+    "validate_references",
+]
+
+# Concurrent table fetches per validation run
+DEFAULT_CONCURRENCY = 8
+
+
+@dataclass
+class ReferenceReport:
+    """
+    Result of a batched reference validation.
+
+    Attributes:
+        errors: Error messages by model index (only models with errors)
+        tables: Key sets fetched per table, e.g. ``"system.interface.name"``
+        failed: Tables that could not be fetched, with the error; references
+            that only point at failed tables are reported as unverified
+        unresolved: Datasources with no matching endpoint in this SDK
+        requests: Number of GET requests issued
+    """
+
+    errors: dict[int, list[str]] = field(default_factory=dict)
+    tables: dict[str, frozenset[str]] = field(default_factory=dict)
+    failed: dict[str, str] = field(default_factory=dict)
+    unresolved: set[str] = field(default_factory=set)
+    requests: int = 0
+
+    @property
+    def ok(self) -> bool:
+        """True when every reference was found."""
+        return not self.errors
+
+    def errors_for(self, index: int) -> list[str]:
+        """Error messages of the model at ``index`` (empty if valid)."""
+        return self.errors.get(index, [])
+
+
+def datasource_map(model_class: type) -> dict[str, tuple[str, ...]]:
+    """
+    Datasources of a model class's fields.
+
+    Reads the ``DATASOURCES`` class attribute of the generated models;
+    classes without one have no datasource fields.
+
+    Args:
+        model_class: Generated pydantic model (or child table model) class
+
+    Returns:
+        Python field name -> datasource references, e.g.
+        ``{"interface": ("system.interface.name",)}``
+
+    Example:
+        >>> from hfortix_fortios.api.models.cmdb.firewall.address import (
+        ...     AddressModel,
+        ... )
+        >>> datasource_map(AddressModel)["associated_interface"]
+        ('system.interface.name', 'system.zone.name')
+    """
+    return model_class.__dict__.get("DATASOURCES", {})
+
+
+@functools.lru_cache(maxsize=None)
+def _child_model(model_class: type, field_name: str) -> Optional[type]:
+    """Model class of the items of a child table field, if any."""
+    fields = getattr(model_class, "model_fields", {})
+    info = fields.get(field_name)
+    if info is None:
+        return None
+    pending = [info.annotation]
+    while pending:
+        annotation = pending.pop()
+        if isinstance(annotation, type) and hasattr(
+            annotation, "model_fields"
+        ):
+            return annotation
+        pending.extend(typing.get_args(annotation))
+    return None
+
+
+def _label(field_name: str) -> str:
+    # Same wording as the generated validate_*_references() methods
+    return field_name.rstrip("_").replace("_", "-").title()
+
+
+def _values(value: Any) -> Iterable[Any]:
+    if isinstance(value, (list, tuple, set)):
+        return value
+    return (value,)
+
+
+def _item_get(item: Any, name: str) -> Any:
+    if isinstance(item, dict):
+        if name in item:
+            return item[name]
+        return item.get(name.rstrip("_").replace("_", "-"))
+    return getattr(item, name, None)
+
+
+# (model index, label, value, datasources)
+_Check = tuple[int, str, str, tuple[str, ...]]
+
+
+def _collect(
+    index: int,
+    model: Any,
+    model_class: type,
+    label: Optional[str],
+    checks: list[_Check],
+) -> None:
+    datasources = datasource_map(model_class)
+    if isinstance(model, dict):
+        names: Iterable[str] = model.keys()
+    else:
+        names = getattr(model_class, "model_fields", {}).keys()
+    for name in names:
+        value = _item_get(model, name)
+        if value is None or value == [] or value == "":
+            continue
+        field_label = label or _label(name)
+        tables = datasources.get(name)
+        if tables:
+            for item in _values(value):
+                # Empty and zero values are unset, as in validate_*_references()
+                if item and not isinstance(item, (dict, list)) and not hasattr(
+                    item, "model_fields"
+                ):
+                    checks.append((index, field_label, str(item), tables))
+        child_class = _child_model(model_class, name)
+        if child_class is None:
+            continue
+        for item in _values(value):
+            if isinstance(item, dict) or hasattr(item, "model_fields"):
+                item_class = (
+                    child_class if isinstance(item, dict) else type(item)
+                )
+                _collect(index, item, item_class, field_label, checks)
+
+
+class _Table:
+    """A datasource table: endpoint, optional child table, key column."""
+
+    __slots__ = ("endpoint", "path", "child", "key")
+
+    def __init__(
+        self, endpoint: Any, path: str, child: Optional[str], key: str
+    ):
+        self.endpoint = endpoint
+        self.path = path
+        self.child = child
+        self.key = key
+
+    @property
+    def display(self) -> str:
+        return f"{self.path}/{self.child}" if self.child else self.path
+
+    def keys(self, response: Any) -> frozenset[str]:
+        names: set[str] = set()
+        results = get_results(response)
+        for entry in results if isinstance(results, list) else [results]:
+            rows = _field(entry, self.child) if self.child else [entry]
+            for row in rows if isinstance(rows, list) else [rows]:
+                value = _field(row, self.key)
+                if value is not None and value != "":
+                    names.add(str(value))
+        return frozenset(names)
+
+
+def _field(row: Any, name: str) -> Any:
+    if not isinstance(row, dict):
+        return None
+    if name in row:
+        return row[name]
+    return row.get(name.replace("-", "_"))
+
+
+def _resolve(api: Any, reference: str) -> Optional[_Table]:
+    """Map ``"system.object-tagging.tags.name"`` to its endpoint."""
+    *parts, key = reference.split(".")
+    node = getattr(api, "cmdb", None)
+    for position, part in enumerate(parts):
+        if node is not None and hasattr(node, "_helper_module_name"):
+            # Remaining parts name a child table of this endpoint
+            child = "/".join(parts[position:])
+            return _Table(node, _endpoint_path(node, parts), child, key)
+        attr = part.replace("-", "_").replace(".", "_")
+        node = getattr(node, attr, None) or getattr(node, f"{attr}_", None)
+        if node is None:
+            return None
+    if not hasattr(node, "_helper_module_name"):
+        return None
+    return _Table(node, _endpoint_path(node, parts), None, key)
+
+
+def _endpoint_path(endpoint: Any, parts: list[str]) -> str:
+    try:
+        return endpoint._get_helper_module().SCHEMA_INFO["api_path"]
+    except (AttributeError, ImportError, KeyError):
+        return "/".join(parts)
+
+
+def _dict_api(client: Any) -> Any:
+    """API namespace returning plain dicts for a FortiOS or HTTP client."""
+    if hasattr(client, "with_response_mode"):
+        return client.with_response_mode("dict")
+    if hasattr(client, "api"):
+        return client.api
+    # fgt._client, as the generated validate_*_references() docs suggest
+    from hfortix_fortios.api import API
+    from hfortix_fortios.client import _processing_client
+
+    http = getattr(client, "_wrapped_client", client)
+    return API(_processing_client(http, "dict"))
+
+
+def _plan(
+    models: Iterable[Any], client: Any
+) -> tuple[Any, list[_Check], dict[str, _Table], ReferenceReport]:
+    api = _dict_api(client)
+    checks: list[_Check] = []
+    for index, model in enumerate(models):
+        _collect(index, model, type(model), None, checks)
+    report = ReferenceReport()
+    tables: dict[str, _Table] = {}
+    for _, _, _, references in checks:
+        for reference in references:
+            if reference in tables or reference in report.unresolved:
+                continue
+            table = _resolve(api, reference)
+            if table is None:
+                report.unresolved.add(reference)
+            else:
+                tables[reference] = table
+    return api, checks, tables, report
+
+
+def _fetch_groups(tables: dict[str, _Table]) -> dict[tuple, list[str]]:
+    # References on the same endpoint and column share one request
+    groups: dict[tuple, list[str]] = {}
+    for reference, table in tables.items():
+        column = table.child or table.key
+        groups.setdefault((id(table.endpoint), column), []).append(reference)
+    return groups
+
+
+def _table_get(table: _Table, vdom: Optional[Union[str, bool]]) -> Any:
+    params: dict[str, Any] = {"format": table.child or table.key}
+    if vdom is not None:
+        # Global endpoints have no vdom parameter
+        params["vdom"] = vdom
+    return table.endpoint.get(**params)
+
+
+def _store(
+    report: ReferenceReport,
+    tables: dict[str, _Table],
+    references: list[str],
+    response: Any,
+    error: Optional[BaseException],
+) -> None:
+    for reference in references:
+        if error is not None:
+            detail = str(error).strip().split("\n", 1)[0]
+            report.failed[reference] = f"{type(error).__name__}: {detail}"
+        else:
+            report.tables[reference] = tables[reference].keys(response)
+
+
+def _resolve_checks(
+    report: ReferenceReport, checks: list[_Check], tables: dict[str, _Table]
+) -> ReferenceReport:
+    for index, label, value, references in checks:
+        known = [r for r in references if r in report.tables]
+        if any(value in report.tables[r] for r in known):
+            continue
+        if len(known) < len(references) and any(
+            r in report.failed for r in references
+        ):
+            message = (
+                f"{label} '{value}' could not be verified "
+                "(datasource fetch failed)"
+            )
+        elif not known:
+            # Only datasources this SDK has no endpoint for
+            continue
+        else:
+            where = ", ".join(
+                dict.fromkeys(tables[r].display for r in known)
+            )
+            message = f"{label} '{value}' not found in {where}"
+        errors = report.errors.setdefault(index, [])
+        if message not in errors:
+            errors.append(message)
+    return report
+
+
+def validate_references(
+    models: Iterable[Any],
+    client: Any,
+    vdom: Optional[Union[str, bool]] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> ReferenceReport:
+    """
+    Validate the datasource references of a batch of models.
+
+    Every referenced table is fetched once (key column only), with up to
+    ``concurrency`` requests in flight, and all references are checked
+    against the fetched names locally.
+
+    Args:
+        models: Pydantic model instances (any mix of model types)
+        client: Sync ``FortiOS`` client
+        vdom: Virtual domain to read the tables from
+        concurrency: Maximum number of concurrent table fetches
+
+    Returns:
+        ReferenceReport with errors by model index
+
+    Raises:
+        TypeError: If ``client`` is async (use avalidate_references)
+    """
+    api, checks, tables, report = _plan(models, client)
+    groups = list(_fetch_groups(tables).values())
+
+    def fetch(references: list[str]) -> tuple[Any, Optional[BaseException]]:
+        table = tables[references[0]]
+        try:
+            response = _table_get(table, vdom)
+        except Exception as e:
+            return None, e
+        if inspect.isawaitable(response):
+            getattr(response, "close", lambda: None)()
+            raise TypeError(
+                "validate_references() needs a sync client; use "
+                "avalidate_references() with an async client"
+            )
+        return response, None
+
+    if len(groups) <= 1 or concurrency <= 1:
+        results = [fetch(references) for references in groups]
+    else:
+        with ThreadPoolExecutor(
+            max_workers=min(concurrency, len(groups))
+        ) as pool:
+            results = list(pool.map(fetch, groups))
+    for references, (response, error) in zip(groups, results):
+        _store(report, tables, references, response, error)
+    report.requests = len(groups)
+    return _resolve_checks(report, checks, tables)
+
+
+async def avalidate_references(
+    models: Iterable[Any],
+    client: Any,
+    vdom: Optional[Union[str, bool]] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> ReferenceReport:
+    """
+    Async variant of validate_references().
+
+    Works with async clients (requests run as concurrent tasks) and sync
+    clients (requests run in worker threads).
+
+    Args:
+        models: Pydantic model instances (any mix of model types)
+        client: ``FortiOS`` client (sync or async mode)
+        vdom: Virtual domain to read the tables from
+        concurrency: Maximum number of concurrent table fetches
+
+    Returns:
+        ReferenceReport with errors by model index
+    """
+    api, checks, tables, report = _plan(models, client)
+    groups = list(_fetch_groups(tables).values())
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def fetch(
+        references: list[str],
+    ) -> tuple[Any, Optional[BaseException]]:
+        table = tables[references[0]]
+        async with semaphore:
+            try:
+                response = _table_get(table, vdom)
+                if inspect.isawaitable(response):
+                    return await response, None
+                return response, None
+            except Exception as e:
+                return None, e
+
+    async def fetch_sync(
+        references: list[str],
+    ) -> tuple[Any, Optional[BaseException]]:
+        table = tables[references[0]]
+        async with semaphore:
+            try:
+                response = await asyncio.to_thread(_table_get, table, vdom)
+                return response, None
+            except Exception as e:
+                return None, e
+
+    is_async = False
+    if groups:
+        # Same test _processing_client() uses to pick the async wrapper
+        http = tables[groups[0][0]].endpoint._client
+        http = getattr(http, "_wrapped_client", http)
+        is_async = inspect.iscoroutinefunction(getattr(http, "get", None))
+    results = await asyncio.gather(
+        *((fetch if is_async else fetch_sync)(refs) for refs in groups)
+    )
+    for references, (response, error) in zip(groups, results):
+        _store(report, tables, references, response, error)
+    report.requests = len(groups)
+    return _resolve_checks(report, checks, tables)
@@ -0,0 +1,471 @@
+"""
+Table-driven client-side payload validation.
+
+The generated ``_helpers/<endpoint>.py`` modules describe every field
+(``FIELD_TYPES``, ``FIELD_CONSTRAINTS``, ``VALID_BODY_*``,
+``REQUIRED_FIELDS``, ``NESTED_SCHEMAS``). ``SchemaValidator`` compiles that
+metadata once per endpoint into one rule per field (frozenset of options,
+length and numeric bounds), so checking a payload is a dict lookup per key.
+
+Validation is opt-in through the client option ``validate``:
+
+- ``"off"`` (default): nothing is checked, payloads go straight out
+- ``"fast"``: option values, string lengths and numeric ranges of
+  top-level fields
+- ``"strict"``: additionally integer types and the child fields of table
+  fields
+
+Required fields are a separate opt-in (``validate_payloads(...,
+required=True)``). ``REQUIRED_FIELDS`` lists conditionally required
+fields without their condition (``interface`` and ``filter`` of
+``firewall/address`` only apply to some address types), so the check
+rejects payloads FortiOS accepts and no validation mode applies it.
+
+Errors are collected rather than raised one by one: a payload with three
+bad fields raises one ``PayloadValidationError`` listing all three, and
+``validate_payloads`` checks thousands of payloads in one call.
+"""
+
+from __future__ import annotations
+
+from types import ModuleType
+from typing import Any, Iterable, Literal, Optional
+
+from hfortix_core.exceptions import ValidationError
+
+from hfortix_fortios._helpers.builders import to_api_fields
+
+__all__ = [
+    "ValidationMode",
+    "VALIDATION_MODES",
+    "PayloadValidationError",
+    "SchemaValidator",
+    "schema_validator",
+    "validate_payload",
+    "validate_payloads",
+]
+
+ValidationMode = Literal["off", "fast", "strict"]
+
+VALIDATION_MODES: frozenset[str] = frozenset({"off", "fast", "strict"})
+
+# Longest error listing rendered by PayloadValidationError.__str__
+_MAX_LISTED_ERRORS = 50
+
+
+def check_validation_mode(mode: str) -> None:
+    """Raise ValueError if ``mode`` is not a known validation mode."""
+    if mode not in VALIDATION_MODES:
+        raise ValueError(
+            f"Invalid validate mode '{mode}'. "
+            f"Must be one of: {', '.join(sorted(VALIDATION_MODES))}"
+        )
+
+
+class PayloadValidationError(ValidationError):
+    """
+    One or more payloads failed client-side validation.
+
+    Attributes:
+        endpoint: Endpoint the payloads were validated for
+        errors: Every field error, in payload order
+        by_index: Field errors per payload index (bulk validation)
+    """
+
+    def __init__(
+        self,
+        endpoint: str,
+        errors: list[ValidationError],
+        by_index: Optional[dict[int, list[ValidationError]]] = None,
+    ):
+        first = errors[0]
+        payloads = f" in {len(by_index)} payload(s)" if by_index else ""
+        super().__init__(
+            f"{len(errors)} validation error(s){payloads} for {endpoint}",
+            field=first.field,
+            value=first.value,
+            constraint=first.constraint,
+        )
+        self.endpoint = endpoint
+        self.errors = errors
+        self.by_index = by_index or {}
+
+    def __str__(self) -> str:
+        lines = [self._original_message]
+        if self.by_index:
+            listed = [
+                (f"[{index}] ", error)
+                for index, errors in self.by_index.items()
+                for error in errors
+            ]
+        else:
+            listed = [("", error) for error in self.errors]
+        for prefix, error in listed[:_MAX_LISTED_ERRORS]:
+            line = f"  - {prefix}{error._original_message}"
+            if error.value is not None and error.constraint != "option":
+                line += f" (got {str(error.value)[:40]!r})"
+            lines.append(line)
+        if len(listed) > _MAX_LISTED_ERRORS:
+            lines.append(f"  ... (+{len(listed) - _MAX_LISTED_ERRORS} more)")
+        return "\n".join(lines)
+
+
+class _FieldRule:
+    """Compiled constraints of one field."""
+
+    __slots__ = (
+        "options",
+        "max_length",
+        "minimum",
+        "maximum",
+        "integer",
+        "children",
+    )
+
+    def __init__(
+        self,
+        options: Optional[frozenset[str]] = None,
+        max_length: Optional[int] = None,
+        minimum: Optional[int] = None,
+        maximum: Optional[int] = None,
+        integer: bool = False,
+        children: Optional[dict[str, "_FieldRule"]] = None,
+    ):
+        self.options = options
+        self.max_length = max_length
+        self.minimum = minimum
+        self.maximum = maximum
+        self.integer = integer
+        self.children = children
+
+
+def _child_rules(
+    schema: dict[str, dict[str, Any]],
+) -> tuple[dict[str, _FieldRule], tuple[str, ...]]:
+    """Compile the child fields of a table field."""
+    rules = {}
+    required = []
+    for name, spec in schema.items():
+        options = spec.get("options")
+        rules[name] = _FieldRule(
+            options=frozenset(options) if options else None,
+            max_length=spec.get("max_length"),
+            minimum=spec.get("min_value"),
+            maximum=spec.get("max_value"),
+            integer=spec.get("type") == "integer",
+        )
+        if spec.get("required"):
+            required.append(name)
+    return rules, tuple(required)
+
+
+class SchemaValidator:
+    """
+    Validator compiled from one endpoint's helper module.
+
+    Use ``schema_validator(EndpointClass)`` to get the cached instance.
+    """
+
+    __slots__ = (
+        "endpoint",
+        "rules",
+        "required",
+        "descriptions",
+        "_child_required",
+    )
+
+    def __init__(self, endpoint: str, module: ModuleType):
+        """
+        Compile the rules of an endpoint.
+
+        Args:
+            endpoint: Endpoint label used in error messages
+            module: The endpoint's ``_helpers`` metadata module
+        """
+        self.endpoint = endpoint
+        field_types: dict[str, str] = getattr(module, "FIELD_TYPES", {})
+        constraints: dict[str, dict[str, Any]] = getattr(
+            module, "FIELD_CONSTRAINTS", {}
+        )
+        nested: dict[str, dict[str, Any]] = getattr(
+            module, "NESTED_SCHEMAS", {}
+        )
+        self.descriptions: dict[str, str] = getattr(
+            module, "FIELD_DESCRIPTIONS", {}
+        )
+        self.required: tuple[str, ...] = tuple(
+            getattr(module, "REQUIRED_FIELDS", ())
+        )
+        self.rules: dict[str, _FieldRule] = {}
+        self._child_required: dict[str, tuple[str, ...]] = {}
+
+        for name in {*field_types, *constraints, *nested}:
+            options = getattr(
+                module, "VALID_BODY_" + name.replace("-", "_").upper(), None
+            )
+            limits = constraints.get(name, {})
+            children = None
+            if name in nested:
+                children, child_required = _child_rules(nested[name])
+                if child_required:
+                    self._child_required[name] = child_required
+            self.rules[name] = _FieldRule(
+                options=frozenset(options) if options else None,
+                max_length=limits.get("max_length"),
+                minimum=limits.get("min"),
+                maximum=limits.get("max"),
+                integer=field_types.get(name) == "integer",
+                children=children,
+            )
+
+    def errors(
+        self,
+        payload: dict[str, Any],
+        method: str = "POST",
+        strict: bool = False,
+        required: bool = False,
+    ) -> list[ValidationError]:
+        """
+        Check a payload (API field names) and return every error found.
+
+        Args:
+            payload: Request body with FortiOS (hyphenated) keys
+            method: "POST" or "PUT"; required fields only apply to POST
+            strict: Also check integer types and table children
+            required: Also check ``REQUIRED_FIELDS`` (POST only), which
+                may list conditionally required fields
+
+        Returns:
+            List of ValidationError, empty if the payload is valid
+        """
+        found: list[ValidationError] = []
+        rules = self.rules
+        for name, value in payload.items():
+            rule = rules.get(name)
+            if rule is not None and value is not None:
+                _check(name, value, rule, strict, self.descriptions, found)
+                if strict and rule.children is not None:
+                    self._check_table(
+                        name, value, rule.children, required, found
+                    )
+        if required and method == "POST":
+            for name in self.required:
+                if name not in payload:
+                    found.append(
+                        ValidationError(
+                            f"Missing required field '{name}'",
+                            field=name,
+                            constraint="required",
+                            description=self.descriptions.get(name),
+                        )
+                    )
+        return found
+
+    def _check_table(
+        self,
+        name: str,
+        value: Any,
+        children: dict[str, _FieldRule],
+        check_required: bool,
+        found: list[ValidationError],
+    ) -> None:
+        if not isinstance(value, list):
+            return
+        required = (
+            self._child_required.get(name, ()) if check_required else ()
+        )
+        for position, entry in enumerate(value):
+            if not isinstance(entry, dict):
+                continue
+            label = f"{name}[{position}]"
+            for child, child_value in entry.items():
+                rule = children.get(child)
+                if rule is not None and child_value is not None:
+                    _check(
+                        f"{label}.{child}", child_value, rule, True, {}, found
+                    )
+            for child in required:
+                if child not in entry:
+                    found.append(
+                        ValidationError(
+                            f"Missing required field '{label}.{child}'",
+                            field=f"{label}.{child}",
+                            constraint="required",
+                        )
+                    )
+
+
+def _check(
+    name: str,
+    value: Any,
+    rule: _FieldRule,
+    strict: bool,
+    descriptions: dict[str, str],
+    found: list[ValidationError],
+) -> None:
+    """Append the errors of one field value to ``found``."""
+    options = rule.options
+    if options is not None and isinstance(value, (str, list)):
+        # Multi-value options are space separated ("ping https ssh")
+        tokens = value.split() if isinstance(value, str) else value
+        for token in tokens:
+            if isinstance(token, str) and token not in options:
+                found.append(
+                    ValidationError(
+                        f"Invalid value for '{name}': {token!r}",
+                        field=name,
+                        value=token,
+                        constraint="option",
+                        valid_options=sorted(options),
+                        description=descriptions.get(name),
+                    )
+                )
+                break
+        return
+
+    if rule.integer or rule.minimum is not None or rule.maximum is not None:
+        number = value
+        if isinstance(value, str):
+            try:
+                number = int(value)
+            except ValueError:
+                number = None
+        if isinstance(number, bool) or not isinstance(number, int):
+            if strict and rule.integer:
+                found.append(
+                    ValidationError(
+                        f"'{name}' must be an integer",
+                        field=name,
+                        value=value,
+                        constraint="integer",
+                        description=descriptions.get(name),
+                    )
+                )
+            return
+        if (rule.minimum is not None and number < rule.minimum) or (
+            rule.maximum is not None and number > rule.maximum
+        ):
+            found.append(
+                ValidationError(
+                    f"'{name}' is out of range",
+                    field=name,
+                    value=value,
+                    constraint=f"{rule.minimum}-{rule.maximum}",
+                    description=descriptions.get(name),
+                )
+            )
+        return
+
+    if (
+        rule.max_length is not None
+        and isinstance(value, str)
+        and len(value) > rule.max_length
+    ):
+        found.append(
+            ValidationError(
+                f"'{name}' is longer than {rule.max_length} characters",
+                field=name,
+                value=value,
+                constraint=f"max_length={rule.max_length}",
+                description=descriptions.get(name),
+            )
+        )
+
+
+_VALIDATORS: dict[type, SchemaValidator] = {}
+
+
+def schema_validator(endpoint_class: type) -> SchemaValidator:
+    """
+    Compiled validator of an endpoint class (cached per class).
+
+    Args:
+        endpoint_class: Generated endpoint class (uses MetadataMixin)
+    """
+    validator = _VALIDATORS.get(endpoint_class)
+    if validator is None:
+        module = endpoint_class._get_helper_module()  # type: ignore
+        info = getattr(module, "SCHEMA_INFO", {})
+        label = (
+            f"{info['category']}/{info['api_path']}"
+            if "category" in info and "api_path" in info
+            else endpoint_class.__name__
+        )
+        validator = SchemaValidator(label, module)
+        _VALIDATORS[endpoint_class] = validator
+    return validator
+
+
+def validate_payload(
+    endpoint: Any, payload: dict[str, Any], method: str
+) -> None:
+    """
+    Validate a request body according to the client's ``validate`` mode.
+
+    Called by the generated ``post()``/``put()`` methods right before the
+    request is sent. Does nothing when validation is off.
+
+    Raises:
+        PayloadValidationError: If the payload has invalid fields
+    """
+    mode = getattr(endpoint._client, "validation", "off")
+    if mode == "off" or not payload:
+        return
+    validator = schema_validator(type(endpoint))
+    found = validator.errors(payload, method, strict=mode == "strict")
+    if found:
+        raise PayloadValidationError(validator.endpoint, found)
+
+
+def validate_payloads(
+    endpoint: Any,
+    payloads: Iterable[dict[str, Any]],
+    method: str = "POST",
+    mode: ValidationMode = "fast",
+    raise_on_error: bool = True,
+    required: bool = False,
+) -> dict[int, list[ValidationError]]:
+    """
+    Validate many payloads for one endpoint in a single call.
+
+    Payload keys may use Python (snake_case) or API (hyphenated) names.
+    Every payload is checked; errors are reported together.
+
+    Args:
+        endpoint: Endpoint instance or class
+            (e.g. ``fgt.api.cmdb.firewall.address``)
+        payloads: Request bodies to check
+        method: "POST" or "PUT"
+        mode: "fast" (default) or "strict"
+        raise_on_error: Raise PayloadValidationError instead of returning
+        required: Also report missing ``REQUIRED_FIELDS`` (POST only);
+            some of them are only required for certain object types
+
+    Returns:
+        Field errors per payload index (empty if every payload is valid)
+
+    Raises:
+        PayloadValidationError: If any payload is invalid and
+            raise_on_error is True
+    """
+    check_validation_mode(mode)
+    if mode == "off":
+        return {}
+    endpoint_class = endpoint if isinstance(endpoint, type) else type(endpoint)
+    validator = schema_validator(endpoint_class)
+    strict = mode == "strict"
+    method = method.upper()
+    by_index: dict[int, list[ValidationError]] = {}
+    for index, payload in enumerate(payloads):
+        found = validator.errors(
+            to_api_fields(payload), method, strict, required
+        )
+        if found:
+            by_index[index] = found
+    if by_index and raise_on_error:
+        raise PayloadValidationError(
+            validator.endpoint,
+            [error for errors in by_index.values() for error in errors],
+            by_index,
+        )
+    return by_index
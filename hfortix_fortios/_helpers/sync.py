@@ -0,0 +1,327 @@
+"""
+Declarative desired-state sync for CMDB tables.
+
+``sync()`` compares the objects a table should contain with what the
+FortiGate has and sends only the difference:
+
+1. One GET of the table, projected to the mkey and the fields the desired
+   objects set (``format=name|subnet|comment``)
+2. A keyed diff: each object is reduced to a content digest of those
+   fields, so unchanged objects are skipped without further requests
+3. The minimal set of writes, with bounded concurrency, in dependency
+   order: creates, then updates (which may now reference the new
+   objects), then deletes (``prune=True`` only; nothing references them
+   any more)
+
+Fields a desired object leaves out are not compared and not sent, so a
+sync never resets settings it was not told about. Updates send only the
+fields that differ. Values are compared as FortiOS returns them (e.g.
+``"10.0.0.0 255.255.255.0"``, not ``"10.0.0.0/24"``); a differently
+spelled but equivalent value costs one redundant PUT, nothing more::
+
+    >>> plan = fgt.api.cmdb.firewall.address.sync(desired, dry_run=True)
+    >>> plan
+    SyncPlan(firewall/address: 3 create, 47 update, 0 delete, 39950 unchanged)
+    >>> with fgt.transaction():
+    ...     plan.execute()
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Iterable, Optional
+
+from hfortix_fortios._helpers.builders import python_field_api_name
+from hfortix_fortios._helpers.bulk import (
+    BulkResult,
+    OnError,
+    _api_path,
+    _as_payload,
+    _mkey,
+    _scope,
+    is_async_endpoint,
+    key_calls,
+    payload_calls,
+    run_bulk,
+)
+from hfortix_fortios._helpers.pagination import read_page
+
+__all__ = [
+    "SyncPlan",
+    "digest",
+    "plan_sync",
+    "sync",
+]
+
+# Bookkeeping FortiOS adds to every table row and child-table entry
+_IGNORED = frozenset({"q_origin_key"})
+
+PHASES = ("post", "put", "delete")
+
+
+def _normalize(value: Any) -> Any:
+    """
+    FortiOS spelling of keys, as the payload builders send them.
+
+    ``snake_case`` becomes ``kebab-case`` except for the fields FortiOS
+    spells with underscores (``block_ack_flood``), and renamed Python
+    keywords get their API name back (``type_`` -> ``type``).
+    """
+    if isinstance(value, dict):
+        return {
+            python_field_api_name(key): _normalize(item)
+            for key, item in value.items()
+            if key not in _IGNORED
+        }
+    if isinstance(value, (list, tuple)):
+        return [_normalize(item) for item in value]
+    return value
+
+
+def digest(obj: dict[str, Any], fields: Iterable[str]) -> str:
+    """Content digest of ``obj`` restricted to ``fields``."""
+    content = {name: obj.get(name) for name in sorted(fields)}
+    encoded = json.dumps(content, sort_keys=True, default=str)
+    return hashlib.blake2b(encoded.encode(), digest_size=16).hexdigest()
+
+
+@dataclass
+class SyncPlan:
+    """
+    Writes that bring a table to the desired state.
+
+    Attributes:
+        endpoint: Endpoint the plan belongs to
+        create: Payloads to POST (new objects)
+        update: Payloads to PUT (mkey plus the differing fields)
+        delete: mkeys to DELETE (``prune=True`` only)
+        unchanged: mkeys that already match
+        results: BulkResult per executed phase ("post", "put", "delete")
+    """
+
+    endpoint: Any
+    create: list[dict[str, Any]] = field(default_factory=list)
+    update: list[dict[str, Any]] = field(default_factory=list)
+    delete: list[Any] = field(default_factory=list)
+    unchanged: list[Any] = field(default_factory=list)
+    results: dict[str, BulkResult] = field(default_factory=dict)
+    scope: dict[str, Any] = field(default_factory=dict, repr=False)
+
+    @property
+    def changes(self) -> int:
+        """Number of writes the plan sends."""
+        return len(self.create) + len(self.update) + len(self.delete)
+
+    @property
+    def executed(self) -> bool:
+        return bool(self.results)
+
+    @property
+    def ok(self) -> bool:
+        """True when every executed write succeeded."""
+        return all(result.ok for result in self.results.values())
+
+    def summary(self) -> dict[str, Any]:
+        """Counts per action, and per-phase outcome once executed."""
+        summary: dict[str, Any] = {
+            "create": len(self.create),
+            "update": len(self.update),
+            "delete": len(self.delete),
+            "unchanged": len(self.unchanged),
+        }
+        for phase, result in self.results.items():
+            summary[phase] = result.summary()
+        return summary
+
+    def _calls(self, phase: str) -> Any:
+        endpoint = self.endpoint
+        if phase == "delete":
+            return key_calls(endpoint.delete, self.delete, **self.scope)
+        method = endpoint.post if phase == "post" else endpoint.put
+        payloads = self.create if phase == "post" else self.update
+        return payload_calls(endpoint, method, payloads, **self.scope)
+
+    def _phases(self) -> list[str]:
+        sizes = {
+            "post": self.create,
+            "put": self.update,
+            "delete": self.delete,
+        }
+        return [phase for phase in PHASES if sizes[phase]]
+
+    def execute(
+        self,
+        concurrency: Optional[int] = None,
+        on_error: OnError = "stop",
+    ) -> Any:
+        """
+        Send the planned writes: creates, then updates, then deletes.
+
+        Each phase runs with up to ``concurrency`` requests in flight and
+        starts once the previous one has finished. Calling it inside
+        ``fgt.transaction()`` applies the whole plan atomically.
+
+        Args:
+            concurrency: Requests in flight (default: max_connections)
+            on_error: "stop" (default) sends nothing further after a
+                failure, including later phases; "continue" sends
+                everything
+
+        Returns:
+            The plan with ``results`` filled in (a coroutine resolving to
+            it with an async client)
+        """
+        phases = self._phases()
+        if is_async_endpoint(self.endpoint):
+
+            async def _execute() -> SyncPlan:
+                for phase in phases:
+                    result = await run_bulk(
+                        self.endpoint,
+                        phase,
+                        self._calls(phase),
+                        concurrency,
+                        on_error,
+                    )
+                    self.results[phase] = result
+                    if on_error == "stop" and not result.ok:
+                        break
+                return self
+
+            return _execute()
+
+        for phase in phases:
+            result = run_bulk(
+                self.endpoint, phase, self._calls(phase), concurrency, on_error
+            )
+            self.results[phase] = result
+            if on_error == "stop" and not result.ok:
+                break
+        return self
+
+    def __repr__(self) -> str:
+        path = _api_path(self.endpoint) or type(self.endpoint).__name__
+        state = ", executed" if self.executed else ""
+        return (
+            f"SyncPlan({path}: {len(self.create)} create, "
+            f"{len(self.update)} update, {len(self.delete)} delete, "
+            f"{len(self.unchanged)} unchanged{state})"
+        )
+
+
+def plan_sync(
+    endpoint: Any,
+    desired: list[dict[str, Any]],
+    current: list[dict[str, Any]],
+    mkey: str,
+    prune: bool = False,
+) -> SyncPlan:
+    """
+    Diff desired objects against the current rows of a table.
+
+    Args:
+        endpoint: Endpoint the plan is executed against
+        desired: Normalized desired objects (FortiOS field names)
+        current: Current rows, at least with the compared fields
+        mkey: The table's key field
+        prune: Delete current objects missing from ``desired``
+
+    Returns:
+        SyncPlan (not executed)
+
+    Raises:
+        ValueError: If a desired object lacks the mkey or repeats one
+    """
+    rows = {str(row.get(mkey)): _normalize(row) for row in current}
+    plan = SyncPlan(endpoint)
+    seen: set[str] = set()
+    for obj in desired:
+        if obj.get(mkey) in (None, ""):
+            raise ValueError(f"Desired object without {mkey}: {obj}")
+        key = str(obj[mkey])
+        if key in seen:
+            raise ValueError(f"Desired state lists {mkey} '{key}' twice")
+        seen.add(key)
+        row = rows.get(key)
+        if row is None:
+            plan.create.append(obj)
+            continue
+        fields = [name for name in obj if name != mkey]
+        if digest(obj, fields) == digest(row, fields):
+            plan.unchanged.append(obj[mkey])
+            continue
+        changed = {
+            name: obj[name] for name in fields if obj[name] != row.get(name)
+        }
+        plan.update.append({mkey: obj[mkey], **changed})
+    if prune:
+        plan.delete = [
+            row.get(mkey) for key, row in rows.items() if key not in seen
+        ]
+    return plan
+
+
+def sync(
+    endpoint: Any,
+    desired: Iterable[Any],
+    prune: bool = False,
+    dry_run: bool = False,
+    concurrency: Optional[int] = None,
+    on_error: OnError = "stop",
+    vdom: Any = None,
+) -> Any:
+    """
+    Bring a CMDB table to the desired state with the fewest writes.
+
+    Args:
+        endpoint: Generated table endpoint
+        desired: Objects the table should contain (dicts or models),
+            each including the mkey
+        prune: Also delete objects that are not in ``desired``
+        dry_run: Only plan; call ``plan.execute()`` later
+        concurrency: Requests in flight (default: max_connections)
+        on_error: "stop" (default) or "continue" after a failed write
+        vdom: Virtual domain name
+
+    Returns:
+        SyncPlan, executed unless ``dry_run`` (a coroutine resolving to
+        it with an async client)
+
+    Raises:
+        TypeError: If the endpoint is not a table with an mkey
+        ValueError: If a desired object lacks the mkey or repeats one
+    """
+    mkey = _mkey(endpoint)
+    api_path = _api_path(endpoint)
+    if not mkey or not api_path:
+        raise TypeError(f"{type(endpoint).__name__} is not a CMDB table")
+    objects = [_normalize(_as_payload(item)) for item in desired]
+    fields = sorted({mkey, *(name for obj in objects for name in obj)})
+    scope, vdom = _scope(endpoint, "post", vdom)
+    response = endpoint._client.get(
+        "cmdb",
+        f"/{api_path}",
+        params={"format": "|".join(fields)},
+        vdom=vdom,
+        response_mode="dict",
+    )
+
+    def plan(response: Any) -> SyncPlan:
+        current = read_page(0, response).items
+        result = plan_sync(endpoint, objects, current, mkey, prune)
+        result.scope = scope
+        return result
+
+    if not is_async_endpoint(endpoint):
+        result = plan(response)
+        return result if dry_run else result.execute(concurrency, on_error)
+
+    async def _sync() -> SyncPlan:
+        result = plan(await response)
+        if dry_run:
+            return result
+        return await result.execute(concurrency, on_error)
+
+    return _sync()
@@ -0,0 +1,187 @@
+"""
+Create-or-update (upsert) strategies behind the generated ``set()`` methods.
+
+- ``"check"``: ``exists()`` (GET), then ``put()`` or ``post()``; two round
+  trips per object, nothing fails on the way (default)
+- ``"post_first"``: ``post()``, and ``put()`` when FortiOS reports a
+  duplicate entry; one round trip for objects that are mostly new
+- ``"put_first"``: ``put()``, and ``post()`` when FortiOS answers 404; one
+  round trip for objects that mostly exist already (re-applying config)
+
+The strategy is chosen per client (``FortiOS(upsert_strategy=...)``) and can
+be overridden per call (``set(..., upsert_strategy="put_first")``). With an
+async client ``upsert()`` returns a coroutine that awaits each step, so the
+existence check is never mistaken for a truthy coroutine.
+
+The error the first attempt of ``"post_first"``/``"put_first"`` expects is
+part of the normal flow, so it is not logged as a failed request: sync
+clients send the attempt with ``silent=True`` (see ``silent_attempt()``);
+the async HTTP client has no silent option, so a logging filter drops the
+log of the expected FortiOS answer instead.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import logging
+from typing import Any, Callable, Literal, Optional
+
+from hfortix_core.exceptions import DuplicateEntryError, ResourceNotFoundError
+
+__all__ = [
+    "UPSERT_STRATEGIES",
+    "UpsertStrategy",
+    "check_upsert_strategy",
+    "upsert",
+]
+
+UpsertStrategy = Literal["check", "post_first", "put_first"]
+
+UPSERT_STRATEGIES: frozenset[str] = frozenset(
+    {"check", "post_first", "put_first"}
+)
+
+# (HTTP status, FortiOS error code) -> whether it is the expected error
+Expected = Callable[[Any, Any], bool]
+
+# Message of the async HTTP client's error log for FortiOS error responses
+_REQUEST_FAILED = (
+    "Request failed: HTTP %d, status=%s, error=%s, description='%s'"
+)
+
+# Expected error of the first attempt running in this context
+_expected: contextvars.ContextVar[Optional[Expected]] = (
+    contextvars.ContextVar("hfortix_upsert_expected", default=None)
+)
+
+
+def _duplicate(http_status: Any, error_code: Any) -> bool:
+    return error_code in (-5, -15, -100)
+
+
+def _not_found(http_status: Any, error_code: Any) -> bool:
+    return error_code == -3 or http_status == 404
+
+
+def silent_attempt() -> bool:
+    """True while the first attempt of an upsert runs in this context."""
+    return _expected.get() is not None
+
+
+class _ExpectedErrorFilter(logging.Filter):
+    """Drop the async client's error log of the expected upsert failure."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        expected = _expected.get()
+        if expected is None or record.msg != _REQUEST_FAILED:
+            return True
+        args = record.args
+        if not isinstance(args, tuple) or len(args) < 3:
+            return True
+        return not expected(args[0], args[2])
+
+
+logging.getLogger("hfortix.http.async").addFilter(_ExpectedErrorFilter())
+
+
+def check_upsert_strategy(strategy: str) -> None:
+    """Raise ValueError if ``strategy`` is not a known upsert strategy."""
+    if strategy not in UPSERT_STRATEGIES:
+        raise ValueError(
+            f"Invalid upsert strategy '{strategy}'. "
+            f"Must be one of: {', '.join(sorted(UPSERT_STRATEGIES))}"
+        )
+
+
+def _fallback(
+    first: Callable[[], Any],
+    second: Callable[[], Any],
+    error: type[Exception],
+    expected: Expected,
+) -> Any:
+    """
+    Run ``first``; run ``second`` instead if it raises ``error``.
+
+    ``first`` runs silently (see ``silent_attempt()``); ``expected``
+    matches the FortiOS answer behind ``error`` for the async log filter.
+    ``second`` always runs with normal error logging.
+    """
+    token = _expected.set(expected)
+    try:
+        result = first()
+    except error:
+        failed = True
+    else:
+        failed = False
+    finally:
+        _expected.reset(token)
+    if failed:
+        return second()
+    if not hasattr(result, "__await__"):
+        return result
+
+    async def _run() -> Any:
+        # The request only runs when awaited, in this task's context
+        token = _expected.set(expected)
+        try:
+            return await result
+        except error:
+            pass
+        finally:
+            _expected.reset(token)
+        return await second()
+
+    return _run()
+
+
+def upsert(
+    endpoint: Any,
+    payload_data: dict[str, Any],
+    mkey: dict[str, Any],
+    strategy: Optional[UpsertStrategy] = None,
+    **kwargs: Any,
+) -> Any:
+    """
+    Create or update one object of a table endpoint.
+
+    Args:
+        endpoint: Generated endpoint instance (provides exists/post/put)
+        payload_data: Complete API payload, including the mkey
+        mkey: The ``exists()`` argument naming the object, e.g.
+            ``{"name": "web01"}``
+        strategy: "check", "post_first" or "put_first" (default: the
+            client's ``upsert_strategy``)
+        **kwargs: Passed to ``post()``/``put()``; ``vdom`` is also passed
+            to ``exists()``
+
+    Returns:
+        The ``post()`` or ``put()`` result, or a coroutine resolving to it
+        with an async client
+
+    Raises:
+        ValueError: If ``strategy`` is not a known upsert strategy
+    """
+    if strategy is None:
+        strategy = getattr(endpoint._client, "upsert_strategy", "check")
+    check_upsert_strategy(strategy)  # type: ignore[arg-type]
+
+    def post() -> Any:
+        return endpoint.post(payload_dict=payload_data, **kwargs)
+
+    def put() -> Any:
+        return endpoint.put(payload_dict=payload_data, **kwargs)
+
+    if strategy == "post_first":
+        return _fallback(post, put, DuplicateEntryError, _duplicate)
+    if strategy == "put_first":
+        return _fallback(put, post, ResourceNotFoundError, _not_found)
+
+    scope = {"vdom": kwargs["vdom"]} if "vdom" in kwargs else {}
+    found = endpoint.exists(**mkey, **scope)
+    if not hasattr(found, "__await__"):
+        return put() if found else post()
+
+    async def _check_first() -> Any:
+        return await (put() if await found else post())
+
+    return _check_first()
@@ -16,12 +16,30 @@ full API envelope.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal, Protocol, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Iterable,
+    Iterator,
+    Literal,
+    Protocol,
+    Union,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Coroutine
+    from hfortix_fortios._helpers.bulk import BulkResult
+    from hfortix_fortios._helpers.lookup import LookupResult
+    from hfortix_fortios._helpers.sync import SyncPlan
     from hfortix_fortios.models import FortiObject, FortiObjectList
 
+BulkReturn = Union["BulkResult", "Coroutine[Any, Any, BulkResult]"]
+SyncReturn = Union["SyncPlan", "Coroutine[Any, Any, SyncPlan]"]
+LookupReturn = Union[
+    "LookupResult", "Coroutine[Any, Any, LookupResult]"
+]
+
 
 class GetProtocol(Protocol):
     """
@@ -47,6 +65,106 @@ class GetProtocol(Protocol):
         **kwargs: Any,
     ) -> Union[FortiObject, FortiObjectList, Coroutine[Any, Any, Union[FortiObject, FortiObjectList]]]: ...
 
+    def iter_all(
+        self,
+        page_size: int = 1000,
+        prefetch: bool = True,
+        start: int = 0,
+        fanout: int = 1,
+        **filters: Any,
+    ) -> Iterator[Any]:
+        """
+        Iterate over every row of a list endpoint, page by page.
+
+        Requests ``page_size`` rows at a time with ``start``/``count`` until
+        ``matched_count`` rows were read, so only one page (two with
+        ``prefetch``) is held in memory. Sync clients only; use
+        aiter_all() in async mode.
+
+        Args:
+            page_size: Rows per request
+            prefetch: Fetch the next page in a background thread while
+                the current one is being consumed
+            start: Index of the first row
+            fanout: Once the first page reported the total, fetch up to
+                this many pages concurrently (rows still arrive in order)
+            **filters: Passed to every get() call (filter, format, vdom...)
+
+        Yields:
+            One row per result (FortiObject in object mode, dict in dict
+            and stream mode)
+
+        Example:
+            >>> for policy in fgt.api.cmdb.firewall.policy.iter_all(
+            ...     page_size=500, filter="action==accept"
+            ... ):
+            ...     print(policy.policyid)
+
+            >>> # Large session tables: 8 windows in flight
+            >>> sessions = list(
+            ...     fgt.api.monitor.firewall.sessions.iter_all(fanout=8)
+            ... )
+        """
+        from hfortix_fortios._helpers.bulk import is_async_endpoint
+        from hfortix_fortios._helpers.pagination import iter_pages
+
+        if is_async_endpoint(self):
+            raise TypeError("iter_all() needs a sync client; use aiter_all()")
+
+        def fetch(offset: int, count: int) -> Any:
+            return self.get(start=offset, count=count, **filters)
+
+        for page in iter_pages(fetch, page_size, start, prefetch, fanout):
+            yield from page.items
+
+    async def aiter_all(
+        self,
+        page_size: int = 1000,
+        prefetch: bool = True,
+        start: int = 0,
+        fanout: int = 1,
+        **filters: Any,
+    ) -> AsyncIterator[Any]:
+        """
+        Async variant of iter_all().
+
+        The next page is requested in a task while the current one is
+        being consumed, or up to ``fanout`` pages at once. With a sync
+        client the requests run in worker threads.
+
+        Example:
+            >>> async for session in fgt.api.monitor.firewall.sessions.aiter_all(
+            ...     page_size=1000
+            ... ):
+            ...     print(session["srcaddr"])
+        """
+        import asyncio
+
+        from hfortix_fortios._helpers.bulk import is_async_endpoint
+        from hfortix_fortios._helpers.pagination import aiter_pages, read_page
+
+        if is_async_endpoint(self):
+
+            def fetch(offset: int, count: int) -> Any:
+                return self.get(start=offset, count=count, **filters)
+
+        else:
+
+            def read(offset: int, count: int) -> Any:
+                # Read the page in the thread too (a sync ResultStream
+                # receives its body while being iterated)
+                response = self.get(start=offset, count=count, **filters)
+                return read_page(offset, response)
+
+            def fetch(offset: int, count: int) -> Any:
+                return asyncio.to_thread(read, offset, count)
+
+        async for page in aiter_pages(
+            fetch, page_size, start, prefetch, fanout
+        ):
+            for item in page.items:
+                yield item
+
 
 class PostProtocol(Protocol):
     """
@@ -111,6 +229,292 @@ class CRUDEndpoint(
     Endpoint classes inherit from this to get base CRUD signatures.
     The generated .pyi stub files provide endpoint-specific type hints
     that override these base signatures with field-aware autocomplete.
+
+    The bulk_* methods are shared implementations: they run one
+    post()/put()/set()/delete() per item with up to ``concurrency``
+    requests in flight (threads in sync mode, tasks in async mode) and
+    return a BulkResult with per-item status and timing. ``concurrency``
+    defaults to the client's ``max_connections``; ``on_error="stop"``
+    sends no further items after the first failure. sync() applies a
+    desired state with the minimal set of writes; exists_many() and
+    get_many() answer many keys from one projected GET; reorder() is
+    available on endpoints with a positional move().
     """
 
-    pass
+    def bulk_post(
+        self,
+        payloads: Iterable[Any],
+        concurrency: int | None = None,
+        on_error: Literal["continue", "stop"] = "continue",
+        vdom: str | bool | None = None,
+        **kwargs: Any,
+    ) -> BulkReturn:
+        """
+        Create many objects.
+
+        Args:
+            payloads: Payload dicts (or pydantic models), one per object
+            concurrency: Requests in flight (default: max_connections)
+            on_error: "continue" or "stop" after the first failure
+            vdom: Virtual domain name
+            **kwargs: Passed to every post() call
+
+        Returns:
+            BulkResult (a coroutine resolving to it in async mode)
+
+        Example:
+            >>> result = fgt.api.cmdb.firewall.address.bulk_post(
+            ...     {"name": f"host-{i}", "subnet": f"10.0.{i}.1/32"}
+            ...     for i in range(200)
+            ... )
+            >>> result.ok
+            True
+        """
+        from hfortix_fortios._helpers.bulk import payload_calls, run_bulk
+
+        calls = payload_calls(
+            self, self.post, payloads, **_scoped(vdom, kwargs)
+        )
+        return run_bulk(self, "post", calls, concurrency, on_error)
+
+    def bulk_put(
+        self,
+        payloads: Iterable[Any],
+        concurrency: int | None = None,
+        on_error: Literal["continue", "stop"] = "continue",
+        vdom: str | bool | None = None,
+        **kwargs: Any,
+    ) -> BulkReturn:
+        """
+        Update many objects; each payload must carry its mkey.
+
+        Args:
+            payloads: Payload dicts (or pydantic models), one per object
+            concurrency: Requests in flight (default: max_connections)
+            on_error: "continue" or "stop" after the first failure
+            vdom: Virtual domain name
+            **kwargs: Passed to every put() call
+
+        Returns:
+            BulkResult (a coroutine resolving to it in async mode)
+        """
+        from hfortix_fortios._helpers.bulk import payload_calls, run_bulk
+
+        calls = payload_calls(
+            self, self.put, payloads, **_scoped(vdom, kwargs)
+        )
+        return run_bulk(self, "put", calls, concurrency, on_error)
+
+    def bulk_set(
+        self,
+        payloads: Iterable[Any],
+        concurrency: int | None = None,
+        on_error: Literal["continue", "stop"] = "continue",
+        upsert_strategy: Literal["check", "post_first", "put_first"]
+        | None = None,
+        vdom: str | bool | None = None,
+        **kwargs: Any,
+    ) -> BulkReturn:
+        """
+        Create or update many objects (see set() for upsert_strategy).
+
+        Args:
+            payloads: Payload dicts (or pydantic models), one per object
+            concurrency: Requests in flight (default: max_connections)
+            on_error: "continue" or "stop" after the first failure
+            upsert_strategy: "check", "post_first" or "put_first"
+                (default: FortiOS(upsert_strategy=...))
+            vdom: Virtual domain name
+            **kwargs: Passed to every set() call
+
+        Returns:
+            BulkResult (a coroutine resolving to it in async mode)
+        """
+        from hfortix_fortios._helpers.bulk import payload_calls, run_bulk
+
+        if not hasattr(self, "set"):
+            raise TypeError(
+                f"{type(self).__name__} does not support set() requests"
+            )
+        calls = payload_calls(
+            self,
+            self.set,  # type: ignore[attr-defined]
+            payloads,
+            upsert_strategy=upsert_strategy,
+            **_scoped(vdom, kwargs),
+        )
+        return run_bulk(self, "set", calls, concurrency, on_error)
+
+    def bulk_delete(
+        self,
+        keys: Iterable[Any],
+        concurrency: int | None = None,
+        on_error: Literal["continue", "stop"] = "continue",
+        vdom: str | bool | None = None,
+        **kwargs: Any,
+    ) -> BulkReturn:
+        """
+        Delete many objects.
+
+        Args:
+            keys: mkey values (e.g. names or policy IDs), or dicts of
+                delete() arguments such as ``{"policyid": 7}``
+            concurrency: Requests in flight (default: max_connections)
+            on_error: "continue" or "stop" after the first failure
+            vdom: Virtual domain name
+            **kwargs: Passed to every delete() call
+
+        Returns:
+            BulkResult (a coroutine resolving to it in async mode)
+        """
+        from hfortix_fortios._helpers.bulk import key_calls, run_bulk
+
+        calls = key_calls(self.delete, keys, **_scoped(vdom, kwargs))
+        return run_bulk(self, "delete", calls, concurrency, on_error)
+
+    def sync(
+        self,
+        desired: Iterable[Any],
+        prune: bool = False,
+        dry_run: bool = False,
+        concurrency: int | None = None,
+        on_error: Literal["continue", "stop"] = "stop",
+        vdom: str | bool | None = None,
+    ) -> SyncReturn:
+        """
+        Bring the table to a desired state with the fewest writes.
+
+        Fetches the table once, projected to the mkey and the fields the
+        desired objects set, skips objects whose content already matches
+        and sends the remaining creates, updates (differing fields only)
+        and, with ``prune``, deletes, in that order with bounded
+        concurrency. Wrap ``plan.execute()`` in ``fgt.transaction()`` to
+        apply a plan atomically.
+
+        Args:
+            desired: Objects (dicts or models) the table should contain,
+                each including the mkey
+            prune: Also delete objects that are not in ``desired``
+            dry_run: Plan only; run ``plan.execute()`` later
+            concurrency: Requests in flight (default: max_connections)
+            on_error: "stop" (default) or "continue" after a failed write
+            vdom: Virtual domain name
+
+        Returns:
+            SyncPlan, executed unless ``dry_run`` (a coroutine resolving
+            to it in async mode)
+        """
+        from hfortix_fortios._helpers.sync import sync
+
+        return sync(
+            self, desired, prune, dry_run, concurrency, on_error, vdom
+        )
+
+    def exists_many(
+        self,
+        keys: Iterable[Any],
+        strategy: Literal["auto", "column", "filter"] = "auto",
+        batch_size: int = 50,
+        concurrency: int | None = None,
+        vdom: str | bool | None = None,
+    ) -> LookupReturn:
+        """
+        Check which of many objects exist, without one GET per key.
+
+        Reads the mkey column once (``format=<mkey>``), or, with
+        strategy "filter", sends one OR-filtered GET per ``batch_size``
+        keys; "auto" filters when the keys fit into one batch. Failed
+        requests do not count as "not found": their keys are reported in
+        ``errors``.
+
+        Args:
+            keys: mkey values to check
+            strategy: "auto" (default), "column" or "filter"
+            batch_size: Keys per filtered GET
+            concurrency: Filtered GETs in flight (default:
+                max_connections)
+            vdom: Virtual domain name
+
+        Returns:
+            LookupResult with ``missing`` and ``errors`` (a coroutine
+            resolving to it in async mode); ``key in result`` is True for
+            existing keys
+        """
+        from hfortix_fortios._helpers.lookup import lookup_many
+
+        return lookup_many(
+            self, keys, (), strategy, batch_size, concurrency, vdom
+        )
+
+    def get_many(
+        self,
+        keys: Iterable[Any],
+        fields: Iterable[str] | None = None,
+        strategy: Literal["auto", "column", "filter"] = "auto",
+        batch_size: int = 50,
+        concurrency: int | None = None,
+        vdom: str | bool | None = None,
+    ) -> LookupReturn:
+        """
+        Read many objects by mkey, without one GET per key.
+
+        Same requests as exists_many(), projected to ``fields``.
+
+        Args:
+            keys: mkey values to read
+            fields: Fields to return (default: whole objects); the mkey
+                is always included
+            strategy: "auto" (default), "column" or "filter"
+            batch_size: Keys per filtered GET
+            concurrency: Filtered GETs in flight (default:
+                max_connections)
+            vdom: Virtual domain name
+
+        Returns:
+            LookupResult; ``result[key]`` is the object as a dict, None if
+            it does not exist (a coroutine resolving to it in async mode)
+        """
+        from hfortix_fortios._helpers.lookup import lookup_many
+
+        return lookup_many(
+            self, keys, fields, strategy, batch_size, concurrency, vdom
+        )
+
+    def reorder(
+        self,
+        desired_keys: Iterable[Any],
+        dry_run: bool = False,
+        on_error: Literal["continue", "stop"] = "stop",
+        vdom: str | bool | None = None,
+    ) -> BulkReturn:
+        """
+        Reorder a sequenced table (e.g. firewall/policy) with few moves.
+
+        Reads the current order once (mkey column only), keeps the
+        longest increasing subsequence in place and issues one move()
+        per remaining entry, sequentially. Wrap the call in
+        ``fgt.transaction()`` to apply the moves atomically.
+
+        Args:
+            desired_keys: mkeys in the desired order; a subset is
+                reordered among the positions it occupies, other entries
+                stay where they are
+            dry_run: Plan only; each move is a skipped item whose
+                ``result`` is the planned Move
+            on_error: "stop" (default) or "continue" after a failed move
+            vdom: Virtual domain name
+
+        Returns:
+            BulkResult with one item per move (a coroutine resolving to it
+            in async mode)
+        """
+        from hfortix_fortios._helpers.ordering import reorder
+
+        return reorder(self, desired_keys, dry_run, on_error, vdom)
+
+
+def _scoped(
+    vdom: str | bool | None, kwargs: dict[str, Any]
+) -> dict[str, Any]:
+    # Global endpoints have no vdom parameter, so only pass it when given
+    return {**kwargs, "vdom": vdom} if vdom is not None else kwargs
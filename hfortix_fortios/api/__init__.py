@@ -34,8 +34,11 @@ See Also:
 
 from __future__ import annotations
 
+import functools
 from typing import TYPE_CHECKING
 
+from ._lazy import LazyEndpoint
+
 if TYPE_CHECKING:
     from typing import Optional
 
@@ -120,11 +123,20 @@ class API:
         "Optional[Utils]"  # None when using custom IHTTPClient implementations
     )
 
+    # Categories are built on first access (see api/_lazy.py)
+    cmdb = LazyEndpoint(".v2.cmdb", "CMDB")  # type: ignore[assignment]
+    log = LazyEndpoint(".v2.log", "Log")  # type: ignore[assignment]
+    monitor = LazyEndpoint(".v2.monitor", "Monitor")  # type: ignore[assignment]
+    service = LazyEndpoint(".v2.service", "Service")  # type: ignore[assignment]
+
     def __init__(self, client: "IHTTPClient") -> None:
         """
         Initialize API namespace with HTTP client implementing IHTTPClient
         protocol.
 
+        Endpoint categories are not imported or instantiated here; each one
+        is created on first attribute access and cached on the instance.
+
         Note:
             Utils requires concrete HTTPClient for internal access. When a
             protocol-only
@@ -134,29 +146,22 @@ class API:
         # for the repository's script-style harnesses under X/tests.
         self._client = client
 
+    @functools.cached_property
+    def utils(self) -> "Optional[Utils]":  # type: ignore[override]
+        """Utility helpers (None for custom IHTTPClient implementations)."""
         from .utils import Utils
-        from .v2.cmdb import CMDB
-        from .v2.log import Log
-        from .v2.monitor import Monitor
-        from .v2.service import Service
-
-        self.cmdb = CMDB(client)
-        self.log = Log(client)
-        self.monitor = Monitor(client)
-        self.service = Service(client)
 
         # Utils requires concrete HTTPClient for access to internal attributes
         # Check if client is the concrete HTTPClient type, or if it wraps one
         from hfortix_core.http.client import HTTPClient
 
         # Get the underlying client (might be wrapped in ResponseProcessingClient)
-        underlying_client = getattr(client, "_wrapped_client", client)
+        underlying_client = getattr(self._client, "_wrapped_client", self._client)
 
         if isinstance(underlying_client, HTTPClient):
-            self.utils = Utils(underlying_client)
-        else:
-            # Custom protocol implementations won't have utils
-            self.utils = None
+            return Utils(underlying_client)
+        # Custom protocol implementations won't have utils
+        return None
 
     def __dir__(self) -> list[str]:
         """Control autocomplete to show only public attributes"""
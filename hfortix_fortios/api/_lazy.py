@@ -0,0 +1,123 @@
+"""
+Lazy endpoint namespace support.
+
+The FortiOS API tree contains well over a thousand endpoint classes spread
+across several hundred modules. Building that tree eagerly means every
+``FortiOS()`` construction imports every module and instantiates every
+endpoint, even though a typical script touches a handful of them.
+
+This module provides the two building blocks used by the generated category
+``__init__.py`` files to defer that work until first use:
+
+- ``LazyEndpoint``: a non-data descriptor declared on a namespace class. On
+  first attribute access it imports the endpoint module, instantiates the
+  endpoint with the namespace's client and stores the instance in the
+  namespace ``__dict__``. Subsequent lookups hit the instance dict directly
+  and never reach the descriptor again.
+- ``lazy_module_getattr``: builds a PEP 562 module ``__getattr__`` so that
+  ``from hfortix_fortios.api.v2.cmdb.firewall import Address`` keeps working
+  without importing every sibling module up front.
+
+Type stubs (``.pyi``) are unaffected: they still declare the attributes as
+plain annotations, so IDE autocomplete and type checking behave exactly as
+before.
+
+Example:
+    >>> class Firewall:
+    ...     address = LazyEndpoint(".address", "Address")
+    ...
+    ...     def __init__(self, client):
+    ...         self._client = client
+    >>>
+    >>> fw = Firewall(client)      # nothing imported yet
+    >>> fw.address.get()           # imports .address and builds Address once
+"""
+
+from __future__ import annotations
+
+import importlib
+import sys
+from typing import Any, Callable, Optional
+
+__all__ = ["LazyEndpoint", "lazy_module_getattr"]
+
+
+class LazyEndpoint:
+    """
+    Descriptor that creates an endpoint (or sub-namespace) on first access.
+
+    Args:
+        module: Module path, relative to the package that defines the owner
+            class (e.g. ``".address"``), or absolute. ``None`` resolves the
+            class from the owner's own module.
+        class_name: Name of the class to instantiate from ``module``.
+
+    The owner instance must expose the HTTP client as ``_client``.
+    """
+
+    __slots__ = ("module", "class_name", "name", "_package", "_cls")
+
+    def __init__(self, module: Optional[str], class_name: str) -> None:
+        self.module = module
+        self.class_name = class_name
+        self.name = class_name
+        self._package: Optional[str] = None
+        self._cls: Optional[type] = None
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self._package = owner.__module__
+
+    def resolve(self) -> type:
+        """Import (once) and return the endpoint class."""
+        cls = self._cls
+        if cls is None:
+            if self.module is None:
+                module = importlib.import_module(self._package or "")
+            else:
+                module = importlib.import_module(self.module, self._package)
+            cls = self._cls = getattr(module, self.class_name)
+        return cls
+
+    def __get__(self, instance: Any, owner: Optional[type] = None) -> Any:
+        if instance is None:
+            return self
+        value = self.resolve()(instance._client)
+        # setdefault keeps the first instance if two threads race here
+        return instance.__dict__.setdefault(self.name, value)
+
+    def __repr__(self) -> str:
+        return f"LazyEndpoint({self.module!r}, {self.class_name!r})"
+
+
+def lazy_module_getattr(
+    package: str, lazy_imports: dict[str, tuple[str, Optional[str]]]
+) -> Callable[[str], Any]:
+    """
+    Build a module-level ``__getattr__`` that imports names on demand.
+
+    Args:
+        package: ``__name__`` of the calling package
+        lazy_imports: Mapping of exported name to ``(module, attribute)``.
+            When ``attribute`` is ``None`` the module itself is returned
+            (used for sub-packages such as ``firewall.ipmacbinding``).
+
+    Returns:
+        Function suitable for assignment to the module's ``__getattr__``.
+        Resolved names are written back into the module globals so each
+        import happens once.
+    """
+
+    def __getattr__(name: str) -> Any:
+        try:
+            module_name, attr = lazy_imports[name]
+        except KeyError:
+            raise AttributeError(
+                f"module {package!r} has no attribute {name!r}"
+            ) from None
+        module = importlib.import_module(module_name, package)
+        value = module if attr is None else getattr(module, attr)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
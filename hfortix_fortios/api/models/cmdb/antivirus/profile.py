@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -438,6 +438,11 @@ class ProfileExternalBlocklist(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.external-resource.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="External blocklist.")  # datasource: ['system.external-resource.name']
 class ProfileContentDisarm(BaseModel):
     """
@@ -523,6 +528,13 @@ class ProfileModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "replacemsg_group": ("system.replacemsg-group.name",),
+        "analytics_ignore_filetype": ("dlp.filepattern.id",),
+        "analytics_accept_filetype": ("dlp.filepattern.id",),
+    }
+    
     name: str = Field(max_length=47, description="Profile name.")    
     comment: str | None = Field(max_length=255, default=None, description="Comment.")    
     replacemsg_group: str | None = Field(max_length=35, default=None, description="Replacement message group customized for this profile.")  # datasource: ['system.replacemsg-group.name']    
@@ -843,8 +855,9 @@ class ProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -858,17 +871,10 @@ class ProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_replacemsg_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_analytics_ignore_filetype_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_analytics_accept_filetype_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_external_blocklist_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -149,6 +149,13 @@ class ListEntries(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "shaper": ("firewall.shaper.traffic-shaper.name",),
+        "shaper_reverse": ("firewall.shaper.traffic-shaper.name",),
+        "per_ip_shaper": ("firewall.shaper.per-ip-shaper.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Entry ID.")    
     risk: list[ListEntriesRisk] = Field(default_factory=list, description="Risk, or impact, of allowing traffic from this application to occur (1 - 5; Low, Elevated, Medium, High, and Critical).")    
     category: list[ListEntriesCategory] = Field(default_factory=list, description="Category ID list.")    
@@ -226,6 +233,11 @@ class ListModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "replacemsg_group": ("system.replacemsg-group.name",),
+    }
+    
     name: str = Field(max_length=47, description="List name.")    
     comment: str | None = Field(max_length=255, default=None, description="Comments.")    
     replacemsg_group: str | None = Field(max_length=35, default=None, description="Replacement message group.")  # datasource: ['system.replacemsg-group.name']    
@@ -402,8 +414,9 @@ class ListModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -417,13 +430,10 @@ class ListModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_replacemsg_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_entries_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class RuleSrcintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class RuleSrcaddr6(BaseModel):
     """
@@ -46,6 +51,11 @@ class RuleSrcaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class RuleSrcaddr(BaseModel):
     """
@@ -60,6 +70,11 @@ class RuleSrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "firewall.proxy-address.name", "firewall.proxy-addrgrp.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'firewall.proxy-address.name', 'firewall.proxy-addrgrp.name', 'system.external-resource.name']
 class RuleDstaddr6(BaseModel):
     """
@@ -74,6 +89,11 @@ class RuleDstaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class RuleDstaddr(BaseModel):
     """
@@ -88,6 +108,11 @@ class RuleDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "firewall.proxy-address.name", "firewall.proxy-addrgrp.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'firewall.proxy-address.name', 'firewall.proxy-addrgrp.name', 'system.external-resource.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -125,6 +150,12 @@ class RuleModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "active_auth_method": ("authentication.scheme.name",),
+        "sso_auth_method": ("authentication.scheme.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Authentication rule name.")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable this authentication rule.")    
     protocol: RuleProtocolEnum | None = Field(default=RuleProtocolEnum.HTTP, description="Authentication is required for the selected protocol (default = HTTP).")    
@@ -623,8 +654,9 @@ class RuleModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -638,23 +670,10 @@ class RuleModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_srcintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_active_auth_method_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sso_auth_method_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class SchemeUserDatabase(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.datasource.name", "user.radius.name", "user.tacacs+.name", "user.ldap.name", "user.group.name", "user.scim.name"),
+    }
+    
     name: str = Field(max_length=79, description="Authentication server name.")  # datasource: ['system.datasource.name', 'user.radius.name', 'user.tacacs+.name', 'user.ldap.name', 'user.group.name', 'user.scim.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -75,6 +80,16 @@ class SchemeModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "kerberos_keytab": ("user.krb-keytab.name",),
+        "domain_controller": ("user.domain-controller.name",),
+        "saml_server": ("user.saml.name",),
+        "fsso_agent_for_ntlm": ("user.fsso.name",),
+        "ssh_ca": ("firewall.ssh.local-ca.name",),
+        "external_idp": ("user.external-identity-provider.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Authentication scheme name.")    
     method: list[SchemeMethodEnum] = Field(description="Authentication methods (default = basic).")    
     negotiate_ntlm: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable negotiate authentication for NTLM (default = disable).")    
@@ -582,8 +597,9 @@ class SchemeModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -597,23 +613,10 @@ class SchemeModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_kerberos_keytab_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_domain_controller_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_saml_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fsso_agent_for_ntlm_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_user_database_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssh_ca_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_external_idp_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class SettingUserCertCa(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("vpn.certificate.ca.name", "vpn.certificate.local.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="CA certificate list.")  # datasource: ['vpn.certificate.ca.name', 'vpn.certificate.local.name']
 class SettingDevRange(BaseModel):
     """
@@ -45,6 +50,11 @@ class SettingDevRange(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -74,6 +84,15 @@ class SettingModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "active_auth_scheme": ("authentication.scheme.name",),
+        "sso_auth_scheme": ("authentication.scheme.name",),
+        "captive_portal": ("firewall.address.name",),
+        "captive_portal6": ("firewall.address6.name",),
+        "cert_captive_portal": ("firewall.address.name",),
+    }
+    
     active_auth_scheme: str | None = Field(max_length=35, default=None, description="Active authentication method (scheme name).")  # datasource: ['authentication.scheme.name']    
     sso_auth_scheme: str | None = Field(max_length=35, default=None, description="Single-Sign-On authentication method (scheme name).")  # datasource: ['authentication.scheme.name']    
     update_time: str | None = Field(default=None, description="Time of the last update.")    
@@ -572,8 +591,9 @@ class SettingModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -587,23 +607,10 @@ class SettingModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_active_auth_scheme_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sso_auth_scheme_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_captive_portal_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_captive_portal6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_cert_captive_portal_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_user_cert_ca_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dev_range_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
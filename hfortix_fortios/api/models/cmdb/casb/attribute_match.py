@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -81,6 +81,11 @@ class AttributeMatchModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "application": ("casb.saas-application.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="CASB attribute match name.")    
     application: str = Field(max_length=79, description="CASB attribute application name.")  # datasource: ['casb.saas-application.name']    
     match_strategy: Literal["or", "and", "subset"] | None = Field(default="or", description="CASB attribute match strategy.")    
@@ -186,8 +191,9 @@ class AttributeMatchModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -201,11 +207,10 @@ class AttributeMatchModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_application_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -111,6 +111,11 @@ class ProfileSaasApplicationCustomControlAttributeFilter(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "attribute_match": ("casb.attribute-match.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="CASB tenant control ID.")    
     attribute_match: str = Field(max_length=79, description="CASB access rule tenant match.")  # datasource: ['casb.attribute-match.name']    
     action: Literal["monitor", "bypass", "block"] | None = Field(default="monitor", description="CASB access rule tenant control action.")
@@ -127,6 +132,11 @@ class ProfileSaasApplicationCustomControl(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("casb.user-activity.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="CASB custom control user activity name.")  # datasource: ['casb.user-activity.name']    
     option: list[ProfileSaasApplicationCustomControlOption] = Field(default_factory=list, description="CASB custom control option.")    
     attribute_filter: list[ProfileSaasApplicationCustomControlAttributeFilter] = Field(default_factory=list, description="CASB attribute filter.")
@@ -172,6 +182,11 @@ class ProfileSaasApplicationAdvancedTenantControl(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("casb.user-activity.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="CASB advanced tenant control name.")  # datasource: ['casb.user-activity.name']    
     attribute: list[ProfileSaasApplicationAdvancedTenantControlAttribute] = Field(default_factory=list, description="CASB advanced tenant control attribute.")
 class ProfileSaasApplicationAccessRuleAttributeFilter(BaseModel):
@@ -187,6 +202,11 @@ class ProfileSaasApplicationAccessRuleAttributeFilter(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "attribute_match": ("casb.attribute-match.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="CASB tenant control ID.")    
     attribute_match: str = Field(max_length=79, description="CASB access rule tenant match.")  # datasource: ['casb.attribute-match.name']    
     action: Literal["monitor", "bypass", "block"] | None = Field(default="monitor", description="CASB access rule tenant control action.")
@@ -203,6 +223,11 @@ class ProfileSaasApplicationAccessRule(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("casb.user-activity.name",),
+    }
+    
     name: str = Field(max_length=79, description="CASB access rule activity name.")  # datasource: ['casb.user-activity.name']    
     action: Literal["monitor", "bypass", "block"] | None = Field(default="monitor", description="CASB access rule action.")    
     bypass: list[ProfileSaasApplicationAccessRuleBypassEnum] = Field(default_factory=list, description="CASB bypass options.")    
@@ -220,6 +245,11 @@ class ProfileSaasApplication(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("casb.saas-application.name",),
+    }
+    
     name: str = Field(max_length=79, description="CASB profile SaaS application name.")  # datasource: ['casb.saas-application.name']    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable setting.")    
     safe_search: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable safe search.")    
@@ -358,8 +388,9 @@ class ProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -373,11 +404,10 @@ class ProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_saas_application_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,12 @@ class CrlModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "update_vdom": ("system.vdom.name",),
+        "scep_cert": ("certificate.local.name",),
+    }
+    
     name: str = Field(max_length=35, description="Name.")    
     crl: str | None = Field(default=None, description="Certificate Revocation List as a PEM file.")    
     range_: Literal["global", "vdom"] | None = Field(default="global", serialization_alias="range", description="Either global or VDOM IP address range for the certificate.")    
@@ -216,8 +222,9 @@ class CrlModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -231,13 +238,10 @@ class CrlModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_update_vdom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_scep_cert_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
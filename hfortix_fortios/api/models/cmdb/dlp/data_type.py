@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,11 @@ class DataTypeModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "match_around": ("dlp.dictionary.name",),
+    }
+    
     name: str = Field(max_length=35, description="Name of table containing the data type.")    
     pattern: str | None = Field(max_length=255, default=None, description="Regular expression pattern string without look around.")    
     verify: str | None = Field(max_length=255, default=None, description="Regular expression pattern string used to verify the data type.")    
@@ -151,8 +156,9 @@ class DataTypeModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -166,11 +172,10 @@ class DataTypeModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_match_around_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
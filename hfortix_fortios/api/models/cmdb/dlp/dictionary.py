@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from uuid import UUID
 
 # ============================================================================
@@ -32,6 +32,11 @@ class DictionaryEntries(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "type_": ("dlp.data-type.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     type_: str = Field(max_length=35, serialization_alias="type", description="Pattern type to match.")  # datasource: ['dlp.data-type.name']    
     pattern: str = Field(max_length=255, description="Pattern to match.")    
@@ -168,8 +173,9 @@ class DictionaryModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -183,11 +189,10 @@ class DictionaryModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_entries_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
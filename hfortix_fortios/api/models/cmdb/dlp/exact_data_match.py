@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class ExactDataMatchColumns(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "type_": ("dlp.data-type.name",),
+    }
+    
     index: int | None = Field(ge=1, le=32, default=0, description="Column index.")    
     type_: str = Field(max_length=35, serialization_alias="type", description="Data-type for this column.")  # datasource: ['dlp.data-type.name']    
     optional: Literal["enable", "disable"] = Field(default="disable", description="Enable/disable optional match.")
@@ -62,6 +67,11 @@ class ExactDataMatchModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "data": ("system.external-resource.name",),
+    }
+    
     name: str = Field(max_length=35, description="Name of table containing the exact-data-match template.")    
     optional: int = Field(ge=0, le=32, default=0, description="Number of optional columns need to match.")    
     data: str = Field(max_length=35, description="External resource for exact data match.")  # datasource: ['system.external-resource.name']    
@@ -225,8 +235,9 @@ class ExactDataMatchModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -240,13 +251,10 @@ class ExactDataMatchModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_data_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_columns_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,12 @@ class LabelEntries(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "fortidata_label_name": ("dlp.fdata-label.name",),
+        "mpip_label_name": ("dlp.mpip-label.name",),
+    }
+    
     id_: int | None = Field(ge=1, le=32, default=0, serialization_alias="id", description="ID.")    
     fortidata_label_name: str = Field(max_length=127, description="Name of FortiData label")  # datasource: ['dlp.fdata-label.name']    
     mpip_label_name: str = Field(max_length=127, description="Name of MPIP label.")  # datasource: ['dlp.mpip-label.name']    
@@ -63,6 +69,11 @@ class LabelModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "connector": ("system.sdn-connector.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Name of table containing the label.")    
     type_: Literal["mpip", "fortidata"] | None = Field(default="mpip", serialization_alias="type", description="Label type.")    
     mpip_type: Literal["remote", "local"] | None = Field(default="remote", description="MPIP label type.")    
@@ -228,8 +239,9 @@ class LabelModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -243,13 +255,10 @@ class LabelModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_connector_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_entries_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
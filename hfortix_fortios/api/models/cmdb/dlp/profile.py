@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -68,6 +68,11 @@ class ProfileRuleSensor(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("dlp.sensor.name",),
+    }
+    
     name: str = Field(max_length=35, description="Address name.")  # datasource: ['dlp.sensor.name']
 class ProfileRuleSensitivity(BaseModel):
     """
@@ -82,6 +87,11 @@ class ProfileRuleSensitivity(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("dlp.sensitivity.name",),
+    }
+    
     name: str = Field(max_length=35, description="Select a DLP sensitivity.")  # datasource: ['dlp.sensitivity.name']
 class ProfileRule(BaseModel):
     """
@@ -96,6 +106,12 @@ class ProfileRule(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "file_type": ("dlp.filepattern.id",),
+        "label": ("dlp.label.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     name: str | None = Field(max_length=35, default=None, description="Filter name.")    
     severity: ProfileRuleSeverityEnum | None = Field(default=ProfileRuleSeverityEnum.MEDIUM, description="Select the severity or threat level that matches this filter.")    
@@ -165,6 +181,11 @@ class ProfileModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "replacemsg_group": ("system.replacemsg-group.name",),
+    }
+    
     name: str = Field(max_length=47, description="Name of the DLP profile.")    
     comment: str | None = Field(max_length=255, default=None, description="Comment.")    
     feature_set: Literal["flow", "proxy"] | None = Field(default="flow", description="Flow/proxy feature set.")    
@@ -335,8 +356,9 @@ class ProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -350,13 +372,10 @@ class ProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_replacemsg_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_rule_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class SensorEntries(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "dictionary": ("dlp.dictionary.name", "dlp.exact-data-match.name"),
+    }
+    
     id_: int | None = Field(ge=1, le=32, default=0, serialization_alias="id", description="ID.")    
     dictionary: str = Field(max_length=35, description="Select a DLP dictionary or exact-data-match.")  # datasource: ['dlp.dictionary.name', 'dlp.exact-data-match.name']    
     count: int = Field(ge=1, le=255, default=1, description="Count of dictionary matches to trigger sensor entry match (Dictionary might not be able to trigger more than once based on its 'repeat' option, 1 - 255, default = 1).")    
@@ -165,8 +170,9 @@ class SensorModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -180,11 +186,10 @@ class SensorModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_entries_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,11 @@ class SettingsModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "storage_device": ("system.storage.name",),
+    }
+    
     storage_device: str | None = Field(max_length=35, default=None, description="Storage device name.")  # datasource: ['system.storage.name']    
     size: int | None = Field(ge=16, le=4294967295, default=16, description="Maximum total size of files within the DLP fingerprint database (MB).")    
     db_mode: Literal["stop-adding", "remove-modified-then-oldest", "remove-oldest"] | None = Field(default="stop-adding", description="Behavior when the maximum size is reached in the DLP fingerprint database.")    
@@ -145,8 +150,9 @@ class SettingsModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -160,11 +166,10 @@ class SettingsModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_storage_device_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class ProfileTransparentDnsDatabase(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.dns-database.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="DNS database zone name.")  # datasource: ['system.dns-database.name']
 class ProfileFtgdDnsFilters(BaseModel):
     """
@@ -77,6 +82,11 @@ class ProfileExternalIpBlocklist(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.external-resource.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="External domain block list name.")  # datasource: ['system.external-resource.name']
 class ProfileDomainFilter(BaseModel):
     """
@@ -91,6 +101,11 @@ class ProfileDomainFilter(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "domain_filter_table": ("dnsfilter.domain-filter.id",),
+    }
+    
     domain_filter_table: int | None = Field(ge=0, le=4294967295, default=0, description="DNS domain filter table ID.")  # datasource: ['dnsfilter.domain-filter.id']
 class ProfileDnsTranslation(BaseModel):
     """
@@ -370,8 +385,9 @@ class ProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -385,15 +401,10 @@ class ProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_domain_filter_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_external_ip_blocklist_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_transparent_dns_database_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
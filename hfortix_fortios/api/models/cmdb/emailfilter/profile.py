@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -185,6 +185,16 @@ class ProfileModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "replacemsg_group": ("system.replacemsg-group.name",),
+        "spam_bword_table": ("emailfilter.bword.id",),
+        "spam_bal_table": ("emailfilter.block-allow-list.id",),
+        "spam_mheader_table": ("emailfilter.mheader.id",),
+        "spam_rbl_table": ("emailfilter.dnsbl.id",),
+        "spam_iptrust_table": ("emailfilter.iptrust.id",),
+    }
+    
     name: str = Field(max_length=47, description="Profile name.")    
     comment: str | None = Field(max_length=255, default=None, description="Comment.")    
     feature_set: Literal["flow", "proxy"] | None = Field(default="flow", description="Flow/proxy feature set.")    
@@ -629,8 +639,9 @@ class ProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -644,21 +655,10 @@ class ProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_replacemsg_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_spam_bword_table_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_spam_bal_table_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_spam_mheader_table_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_spam_rbl_table_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_spam_iptrust_table_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
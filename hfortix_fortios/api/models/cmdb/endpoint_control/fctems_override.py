@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -54,6 +54,12 @@ class FctemsOverrideModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+        "verifying_ca": ("certificate.ca.name", "vpn.certificate.ca.name"),
+    }
+    
     ems_id: int | None = Field(ge=1, le=7, default=0, description="EMS ID in order (1 - 7).")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Enable or disable this EMS configuration.")    
     name: str | None = Field(max_length=35, default=None, description="FortiClient Enterprise Management Server (EMS) name.")    
@@ -245,8 +251,9 @@ class FctemsOverrideModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -260,13 +267,10 @@ class FctemsOverrideModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_verifying_ca_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,20 @@ class ExtenderWanExtension(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "modem1_extension": ("system.interface.name",),
+        "modem2_extension": ("system.interface.name",),
+        "modem1_pdn1_interface": ("system.interface.name",),
+        "modem1_pdn2_interface": ("system.interface.name",),
+        "modem1_pdn3_interface": ("system.interface.name",),
+        "modem1_pdn4_interface": ("system.interface.name",),
+        "modem2_pdn1_interface": ("system.interface.name",),
+        "modem2_pdn2_interface": ("system.interface.name",),
+        "modem2_pdn3_interface": ("system.interface.name",),
+        "modem2_pdn4_interface": ("system.interface.name",),
+    }
+    
     modem1_extension: str | None = Field(max_length=31, default=None, description="FortiExtender interface name.")  # datasource: ['system.interface.name']    
     modem2_extension: str | None = Field(max_length=31, default=None, description="FortiExtender interface name.")  # datasource: ['system.interface.name']    
     modem1_pdn1_interface: str | None = Field(max_length=31, default=None, description="FortiExtender interface name.")  # datasource: ['system.interface.name']    
@@ -79,6 +93,11 @@ class ExtenderModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "profile": ("extension-controller.extender-profile.name",),
+    }
+    
     name: str = Field(max_length=19, description="FortiExtender entry name.")    
     id_: str = Field(max_length=19, serialization_alias="id", description="FortiExtender serial number.")    
     authorized: Literal["discovered", "disable", "enable"] = Field(default="discovered", description="FortiExtender Administration (enable or disable).")    
@@ -257,8 +276,9 @@ class ExtenderModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -272,13 +292,10 @@ class ExtenderModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_wan_extension_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -379,6 +379,11 @@ class ExtenderProfileWifiRadio2LocalVaps(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("extension-controller.extender-vap.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Wi-Fi local VAP name.")  # datasource: ['extension-controller.extender-vap.name']
 class ExtenderProfileWifiRadio2(BaseModel):
     """
@@ -393,6 +398,11 @@ class ExtenderProfileWifiRadio2(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "lan_ext_vap": ("extension-controller.extender-vap.name",),
+    }
+    
     mode: Literal["AP", "Client"] | None = Field(default="AP", description="Wi-Fi radio mode AP(LAN mode) / Client(WAN mode).")    
     band: Literal["5GHz"] | None = Field(default="5GHz", description="Wi-Fi band selection 2.4GHz / 5GHz.")    
     status: Literal["disable", "enable"] | None = Field(default="disable", description="Enable/disable Wi-Fi radio.")    
@@ -422,6 +432,11 @@ class ExtenderProfileWifiRadio1LocalVaps(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("extension-controller.extender-vap.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Wi-Fi local VAP name.")  # datasource: ['extension-controller.extender-vap.name']
 class ExtenderProfileWifiRadio1(BaseModel):
     """
@@ -436,6 +451,11 @@ class ExtenderProfileWifiRadio1(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "lan_ext_vap": ("extension-controller.extender-vap.name",),
+    }
+    
     mode: Literal["AP", "Client"] | None = Field(default="AP", description="Wi-Fi radio mode AP(LAN mode) / Client(WAN mode).")    
     band: Literal["2.4GHz"] | None = Field(default="2.4GHz", description="Wi-Fi band selection 2.4GHz / 5GHz.")    
     status: Literal["disable", "enable"] | None = Field(default="disable", description="Enable/disable Wi-Fi radio.")    
@@ -481,6 +501,12 @@ class ExtenderProfileLanExtensionTrafficSplitServices(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "address": ("firewall.address.name",),
+        "service": ("firewall.service.custom.name",),
+    }
+    
     name: str | None = Field(max_length=31, default=None, description="FortiExtender LAN extension tunnel split entry name.")    
     vsdb: Literal["disable", "enable"] | None = Field(default="disable", description="Set video streaming traffic goes through local WAN [enable/disable].")    
     address: str = Field(max_length=79, description="Address selection.")  # datasource: ['firewall.address.name']    
@@ -512,6 +538,11 @@ class ExtenderProfileLanExtensionDownlinks(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vap": ("extension-controller.extender-vap.name",),
+    }
+    
     name: str | None = Field(max_length=31, default=None, description="FortiExtender LAN extension downlink config entry name.")    
     type_: Literal["port", "vap"] = Field(default="port", serialization_alias="type", description="FortiExtender LAN extension downlink type [port/vap].")    
     port: ExtenderProfileLanExtensionDownlinksPortEnum = Field(description="FortiExtender LAN extension downlink port.")    
@@ -553,6 +584,11 @@ class ExtenderProfileLanExtension(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "backhaul_interface": ("system.interface.name",),
+    }
+    
     link_loadbalance: Literal["activebackup", "loadbalance"] = Field(default="activebackup", description="LAN extension link load balance strategy.")    
     ipsec_tunnel: str | None = Field(max_length=15, default=None, description="IPsec tunnel name.")    
     backhaul_interface: str | None = Field(max_length=15, default=None, description="IPsec phase1 interface.")  # datasource: ['system.interface.name']    
@@ -647,6 +683,14 @@ class ExtenderProfileCellularModem2(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "pdn1_dataplan": ("extension-controller.dataplan.name",),
+        "pdn2_dataplan": ("extension-controller.dataplan.name",),
+        "pdn3_dataplan": ("extension-controller.dataplan.name",),
+        "pdn4_dataplan": ("extension-controller.dataplan.name",),
+    }
+    
     redundant_mode: Literal["disable", "enable"] = Field(default="disable", description="FortiExtender mode.")    
     redundant_intf: str = Field(max_length=15, description="Redundant interface.")    
     conn_status: int | None = Field(ge=0, le=4294967295, default=0, description="Connection status.")    
@@ -697,6 +741,14 @@ class ExtenderProfileCellularModem1(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "pdn1_dataplan": ("extension-controller.dataplan.name",),
+        "pdn2_dataplan": ("extension-controller.dataplan.name",),
+        "pdn3_dataplan": ("extension-controller.dataplan.name",),
+        "pdn4_dataplan": ("extension-controller.dataplan.name",),
+    }
+    
     redundant_mode: Literal["disable", "enable"] = Field(default="disable", description="FortiExtender mode.")    
     redundant_intf: str = Field(max_length=15, description="Redundant interface.")    
     conn_status: int | None = Field(ge=0, le=4294967295, default=0, description="Connection status.")    
@@ -726,6 +778,11 @@ class ExtenderProfileCellularDataplan(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("extension-controller.dataplan.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Dataplan name.")  # datasource: ['extension-controller.dataplan.name']
 class ExtenderProfileCellularControllerReport(BaseModel):
     """
@@ -936,8 +993,9 @@ class ExtenderProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -951,11 +1009,10 @@ class ExtenderProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_lan_extension_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
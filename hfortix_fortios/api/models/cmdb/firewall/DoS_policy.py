@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class DosPolicySrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class DosPolicyService(BaseModel):
     """
@@ -45,6 +50,11 @@ class DosPolicyService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str = Field(max_length=79, description="Service name.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class DosPolicyDstaddr(BaseModel):
     """
@@ -59,6 +69,11 @@ class DosPolicyDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class DosPolicyAnomaly(BaseModel):
     """
@@ -110,6 +125,11 @@ class DosPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.zone.name", "system.sdwan.zone.name", "system.interface.name"),
+    }
+    
     policyid: int | None = Field(ge=0, le=9999, default=0, description="Policy ID.")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable this policy.")    
     name: str | None = Field(max_length=35, default=None, description="Policy name.")    
@@ -404,8 +424,9 @@ class DosPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -419,17 +440,10 @@ class DosPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_service_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -290,6 +290,11 @@ class AccessProxyApiGateway6RealserversSshHostKey(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ssh.host-key.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Server host key name.")  # datasource: ['firewall.ssh.host-key.name']
 class AccessProxyApiGateway6Realservers(BaseModel):
     """
@@ -304,6 +309,12 @@ class AccessProxyApiGateway6Realservers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "address": ("firewall.address6.name", "firewall.addrgrp6.name"),
+        "ssh_client_cert": ("firewall.access-proxy-ssh-client-cert.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Real server ID.")    
     addr_type: Literal["ip", "fqdn"] = Field(default="ip", description="Type of address.")    
     address: str | None = Field(max_length=79, default=None, description="Address or address group of the real server.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']    
@@ -373,6 +384,13 @@ class AccessProxyApiGateway6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "virtual_host": ("firewall.access-proxy-virtual-host.name",),
+        "saml_server": ("user.saml.name",),
+        "ssl_vpn_web_portal": ("vpn.ssl.web.portal.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="API Gateway ID.")    
     url_map: str = Field(max_length=511, default="/", description="URL pattern to match.")    
     service: AccessProxyApiGateway6ServiceEnum = Field(default=AccessProxyApiGateway6ServiceEnum.HTTPS, description="Service.")    
@@ -430,6 +448,11 @@ class AccessProxyApiGatewayRealserversSshHostKey(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ssh.host-key.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Server host key name.")  # datasource: ['firewall.ssh.host-key.name']
 class AccessProxyApiGatewayRealservers(BaseModel):
     """
@@ -444,6 +467,12 @@ class AccessProxyApiGatewayRealservers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "address": ("firewall.address.name", "firewall.addrgrp.name"),
+        "ssh_client_cert": ("firewall.access-proxy-ssh-client-cert.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Real server ID.")    
     addr_type: Literal["ip", "fqdn"] = Field(default="ip", description="Type of address.")    
     address: str | None = Field(max_length=79, default=None, description="Address or address group of the real server.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']    
@@ -513,6 +542,13 @@ class AccessProxyApiGateway(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "virtual_host": ("firewall.access-proxy-virtual-host.name",),
+        "saml_server": ("user.saml.name",),
+        "ssl_vpn_web_portal": ("vpn.ssl.web.portal.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="API Gateway ID.")    
     url_map: str = Field(max_length=511, default="/", description="URL pattern to match.")    
     service: AccessProxyApiGatewayServiceEnum = Field(default=AccessProxyApiGatewayServiceEnum.HTTPS, description="Service.")    
@@ -569,6 +605,13 @@ class AccessProxyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vip": ("firewall.vip.name",),
+        "auth_virtual_host": ("firewall.access-proxy-virtual-host.name",),
+        "decrypted_traffic_mirror": ("firewall.decrypted-traffic-mirror.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Access Proxy name.")    
     vip: str = Field(max_length=79, description="Virtual IP name.")  # datasource: ['firewall.vip.name']    
     auth_portal: Literal["disable", "enable"] | None = Field(default="disable", description="Enable/disable authentication portal.")    
@@ -927,8 +970,9 @@ class AccessProxyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -942,19 +986,10 @@ class AccessProxyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_vip_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_auth_virtual_host_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_decrypted_traffic_mirror_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_api_gateway_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_api_gateway6_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class AccessProxyVirtualHostSslCertificate(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("vpn.certificate.local.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Certificate list.")  # datasource: ['vpn.certificate.local.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -60,6 +65,11 @@ class AccessProxyVirtualHostModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "replacemsg_group": ("system.replacemsg-group.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Virtual host name.")    
     ssl_certificate: list[AccessProxyVirtualHostSslCertificate] = Field(description="SSL certificates for this host.")    
     host: str = Field(max_length=79, description="The host name.")    
@@ -227,8 +237,9 @@ class AccessProxyVirtualHostModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -242,13 +253,10 @@ class AccessProxyVirtualHostModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_ssl_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_replacemsg_group_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
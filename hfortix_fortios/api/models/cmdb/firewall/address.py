@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 from uuid import UUID
 
@@ -33,6 +33,11 @@ class AddressTaggingTags(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.object-tagging.tags.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Tag name.")  # datasource: ['system.object-tagging.tags.name']
 class AddressTagging(BaseModel):
     """
@@ -47,6 +52,11 @@ class AddressTagging(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "category": ("system.object-tagging.category",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Tagging entry name.")    
     category: str | None = Field(max_length=63, default=None, description="Tag category.")  # datasource: ['system.object-tagging.category']    
     tags: list[AddressTaggingTags] = Field(default_factory=list, description="Tags.")
@@ -105,6 +115,11 @@ class AddressFssoGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.adgrp.name",),
+    }
+    
     name: str | None = Field(max_length=511, default=None, description="FSSO group name.")  # datasource: ['user.adgrp.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -169,6 +184,13 @@ class AddressModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "sdn": ("system.sdn-connector.name",),
+        "interface": ("system.interface.name",),
+        "associated_interface": ("system.interface.name", "system.zone.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Address name.")    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
     subnet: Any = Field(default="0.0.0.0 0.0.0.0", description="IP address and subnet mask of address.")    
@@ -561,8 +583,9 @@ class AddressModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -576,19 +599,10 @@ class AddressModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_sdn_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fsso_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_associated_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_tagging_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
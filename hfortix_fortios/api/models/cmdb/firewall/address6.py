@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 from uuid import UUID
 
@@ -33,6 +33,11 @@ class Address6TaggingTags(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.object-tagging.tags.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Tag name.")  # datasource: ['system.object-tagging.tags.name']
 class Address6Tagging(BaseModel):
     """
@@ -47,6 +52,11 @@ class Address6Tagging(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "category": ("system.object-tagging.category",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Tagging entry name.")    
     category: str | None = Field(max_length=63, default=None, description="Tag category.")  # datasource: ['system.object-tagging.category']    
     tags: list[Address6TaggingTags] = Field(default_factory=list, description="Tags.")
@@ -134,6 +144,12 @@ class Address6Model(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "sdn": ("system.sdn-connector.name",),
+        "template": ("firewall.address6-template.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Address name.")    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
     type_: Address6TypeEnum | None = Field(default=Address6TypeEnum.IPPREFIX, serialization_alias="type", description="Type of IPv6 address object (default = ipprefix).")    
@@ -386,8 +402,9 @@ class Address6Model(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -401,15 +418,10 @@ class Address6Model(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_sdn_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_tagging_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_template_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
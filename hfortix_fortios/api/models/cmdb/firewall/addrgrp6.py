@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from uuid import UUID
 
 # ============================================================================
@@ -32,6 +32,11 @@ class Addrgrp6TaggingTags(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.object-tagging.tags.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Tag name.")  # datasource: ['system.object-tagging.tags.name']
 class Addrgrp6Tagging(BaseModel):
     """
@@ -46,6 +51,11 @@ class Addrgrp6Tagging(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "category": ("system.object-tagging.category",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Tagging entry name.")    
     category: str | None = Field(max_length=63, default=None, description="Tag category.")  # datasource: ['system.object-tagging.category']    
     tags: list[Addrgrp6TaggingTags] = Field(default_factory=list, description="Tags.")
@@ -62,6 +72,11 @@ class Addrgrp6Member(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address6/addrgrp6 name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class Addrgrp6ExcludeMember(BaseModel):
     """
@@ -76,6 +91,11 @@ class Addrgrp6ExcludeMember(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address6 name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -329,8 +349,9 @@ class Addrgrp6Model(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -344,15 +365,10 @@ class Addrgrp6Model(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_member_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_exclude_member_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_tagging_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class AuthPortalGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Group name.")  # datasource: ['user.group.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -60,6 +65,11 @@ class AuthPortalModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "identity_based_route": ("firewall.identity-based-route.name",),
+    }
+    
     groups: list[AuthPortalGroups] = Field(default_factory=list, description="Firewall user groups permitted to authenticate through this portal. Separate group names with spaces.")    
     portal_addr: str | None = Field(max_length=63, default=None, description="Address (or FQDN) of the authentication portal.")    
     portal_addr6: str | None = Field(max_length=63, default=None, description="IPv6 address (or FQDN) of authentication portal.")    
@@ -224,8 +234,9 @@ class AuthPortalModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -239,13 +250,10 @@ class AuthPortalModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_groups_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_identity_based_route_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
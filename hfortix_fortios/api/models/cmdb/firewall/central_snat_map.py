@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from uuid import UUID
 
 # ============================================================================
@@ -32,6 +32,11 @@ class CentralSnatMapSrcintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class CentralSnatMapOrigAddr6(BaseModel):
     """
@@ -46,6 +51,11 @@ class CentralSnatMapOrigAddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name", "system.external-resource.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name', 'system.external-resource.name']
 class CentralSnatMapOrigAddr(BaseModel):
     """
@@ -60,6 +70,11 @@ class CentralSnatMapOrigAddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'system.external-resource.name']
 class CentralSnatMapNatIppool6(BaseModel):
     """
@@ -74,6 +89,11 @@ class CentralSnatMapNatIppool6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ippool6.name",),
+    }
+    
     name: str = Field(max_length=79, description="IPv6 pool name.")  # datasource: ['firewall.ippool6.name']
 class CentralSnatMapNatIppool(BaseModel):
     """
@@ -88,6 +108,11 @@ class CentralSnatMapNatIppool(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ippool.name",),
+    }
+    
     name: str = Field(max_length=79, description="IP pool name.")  # datasource: ['firewall.ippool.name']
 class CentralSnatMapDstintf(BaseModel):
     """
@@ -102,6 +127,11 @@ class CentralSnatMapDstintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str = Field(max_length=79, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class CentralSnatMapDstAddr6(BaseModel):
     """
@@ -116,6 +146,11 @@ class CentralSnatMapDstAddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class CentralSnatMapDstAddr(BaseModel):
     """
@@ -130,6 +165,11 @@ class CentralSnatMapDstAddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -702,8 +742,9 @@ class CentralSnatMapModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -717,25 +758,10 @@ class CentralSnatMapModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_srcintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_orig_addr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_orig_addr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dst_addr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dst_addr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_nat_ippool_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_nat_ippool6_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
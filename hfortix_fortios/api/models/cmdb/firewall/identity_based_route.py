@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class IdentityBasedRouteRuleGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Group name.")  # datasource: ['user.group.name']
 class IdentityBasedRouteRule(BaseModel):
     """
@@ -45,6 +50,11 @@ class IdentityBasedRouteRule(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "device": ("system.interface.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Rule ID.")    
     gateway: str | None = Field(default="0.0.0.0", description="IPv4 address of the gateway (Format: xxx.xxx.xxx.xxx , Default: 0.0.0.0).")    
     device: str = Field(max_length=35, description="Outgoing interface for the rule.")  # datasource: ['system.interface.name']    
@@ -175,8 +185,9 @@ class IdentityBasedRouteModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -190,11 +201,10 @@ class IdentityBasedRouteModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_rule_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
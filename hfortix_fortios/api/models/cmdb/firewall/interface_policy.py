@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from uuid import UUID
 
 # ============================================================================
@@ -32,6 +32,11 @@ class InterfacePolicySrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class InterfacePolicyService(BaseModel):
     """
@@ -46,6 +51,11 @@ class InterfacePolicyService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str = Field(max_length=79, description="Service name.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class InterfacePolicyDstaddr(BaseModel):
     """
@@ -60,6 +70,11 @@ class InterfacePolicyDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -89,6 +104,18 @@ class InterfacePolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.zone.name", "system.sdwan.zone.name", "system.interface.name"),
+        "application_list": ("application.list.name",),
+        "ips_sensor": ("ips.sensor.name",),
+        "av_profile": ("antivirus.profile.name",),
+        "webfilter_profile": ("webfilter.profile.name",),
+        "casb_profile": ("casb.profile.name",),
+        "emailfilter_profile": ("emailfilter.profile.name",),
+        "dlp_profile": ("dlp.profile.name",),
+    }
+    
     policyid: int | None = Field(ge=0, le=4294967295, default=0, description="Policy ID (0 - 4294967295).")    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable this policy.")    
@@ -846,8 +873,9 @@ class InterfacePolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -861,31 +889,10 @@ class InterfacePolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_service_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_application_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_sensor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_av_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_casb_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_emailfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dlp_profile_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,14 @@ class InternetServiceNameModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "internet_service_id": ("firewall.internet-service.id",),
+        "country_id": ("firewall.country.id",),
+        "region_id": ("firewall.region.id",),
+        "city_id": ("firewall.city.id",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Internet Service name.")    
     type_: Literal["default", "location"] | None = Field(default="default", serialization_alias="type", description="Internet Service name type.")    
     internet_service_id: int = Field(ge=0, le=4294967295, default=0, description="Internet Service ID.")  # datasource: ['firewall.internet-service.id']    
@@ -337,8 +345,9 @@ class InternetServiceNameModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -352,17 +361,10 @@ class InternetServiceNameModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_internet_service_id_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_country_id_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_region_id_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_city_id_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from uuid import UUID
 
 # ============================================================================
@@ -32,6 +32,11 @@ class LocalInPolicySrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'system.external-resource.name']
 class LocalInPolicyService(BaseModel):
     """
@@ -46,6 +51,11 @@ class LocalInPolicyService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str = Field(max_length=79, description="Service name.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class LocalInPolicyIntf(BaseModel):
     """
@@ -60,6 +70,11 @@ class LocalInPolicyIntf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.zone.name", "system.sdwan.zone.name", "system.interface.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['system.zone.name', 'system.sdwan.zone.name', 'system.interface.name']
 class LocalInPolicyInternetServiceSrcName(BaseModel):
     """
@@ -74,6 +89,11 @@ class LocalInPolicyInternetServiceSrcName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class LocalInPolicyInternetServiceSrcGroup(BaseModel):
     """
@@ -88,6 +108,11 @@ class LocalInPolicyInternetServiceSrcGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class LocalInPolicyInternetServiceSrcFortiguard(BaseModel):
     """
@@ -102,6 +127,11 @@ class LocalInPolicyInternetServiceSrcFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class LocalInPolicyInternetServiceSrcCustomGroup(BaseModel):
     """
@@ -116,6 +146,11 @@ class LocalInPolicyInternetServiceSrcCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class LocalInPolicyInternetServiceSrcCustom(BaseModel):
     """
@@ -130,6 +165,11 @@ class LocalInPolicyInternetServiceSrcCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class LocalInPolicyDstaddr(BaseModel):
     """
@@ -144,6 +184,11 @@ class LocalInPolicyDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'system.external-resource.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -173,6 +218,11 @@ class LocalInPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "schedule": ("firewall.schedule.onetime.name", "firewall.schedule.recurring.name", "firewall.schedule.group.name"),
+    }
+    
     policyid: int | None = Field(ge=0, le=4294967295, default=0, description="User defined local in policy ID.")    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
     ha_mgmt_intf_only: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable dedicating the HA management interface only for local-in policy.")    
@@ -837,8 +887,9 @@ class LocalInPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -852,29 +903,10 @@ class LocalInPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_intf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_service_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_schedule_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
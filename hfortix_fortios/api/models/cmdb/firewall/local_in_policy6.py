@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from uuid import UUID
 
 # ============================================================================
@@ -32,6 +32,11 @@ class LocalInPolicy6Srcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name', 'system.external-resource.name']
 class LocalInPolicy6Service(BaseModel):
     """
@@ -46,6 +51,11 @@ class LocalInPolicy6Service(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str = Field(max_length=79, description="Service name.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class LocalInPolicy6Intf(BaseModel):
     """
@@ -60,6 +70,11 @@ class LocalInPolicy6Intf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.zone.name", "system.sdwan.zone.name", "system.interface.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['system.zone.name', 'system.sdwan.zone.name', 'system.interface.name']
 class LocalInPolicy6InternetService6SrcName(BaseModel):
     """
@@ -74,6 +89,11 @@ class LocalInPolicy6InternetService6SrcName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class LocalInPolicy6InternetService6SrcGroup(BaseModel):
     """
@@ -88,6 +108,11 @@ class LocalInPolicy6InternetService6SrcGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class LocalInPolicy6InternetService6SrcFortiguard(BaseModel):
     """
@@ -102,6 +127,11 @@ class LocalInPolicy6InternetService6SrcFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class LocalInPolicy6InternetService6SrcCustomGroup(BaseModel):
     """
@@ -116,6 +146,11 @@ class LocalInPolicy6InternetService6SrcCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service6 group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class LocalInPolicy6InternetService6SrcCustom(BaseModel):
     """
@@ -130,6 +165,11 @@ class LocalInPolicy6InternetService6SrcCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class LocalInPolicy6Dstaddr(BaseModel):
     """
@@ -144,6 +184,11 @@ class LocalInPolicy6Dstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name', 'system.external-resource.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -173,6 +218,11 @@ class LocalInPolicy6Model(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "schedule": ("firewall.schedule.onetime.name", "firewall.schedule.recurring.name", "firewall.schedule.group.name"),
+    }
+    
     policyid: int | None = Field(ge=0, le=4294967295, default=0, description="User defined local in policy ID.")    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
     intf: list[LocalInPolicy6Intf] = Field(description="Incoming interface name from available options.")    
@@ -836,8 +886,9 @@ class LocalInPolicy6Model(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -851,29 +902,10 @@ class LocalInPolicy6Model(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_intf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_service_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_schedule_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class MulticastAddressTaggingTags(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.object-tagging.tags.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Tag name.")  # datasource: ['system.object-tagging.tags.name']
 class MulticastAddressTagging(BaseModel):
     """
@@ -45,6 +50,11 @@ class MulticastAddressTagging(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "category": ("system.object-tagging.category",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Tagging entry name.")    
     category: str | None = Field(max_length=63, default=None, description="Tag category.")  # datasource: ['system.object-tagging.category']    
     tags: list[MulticastAddressTaggingTags] = Field(default_factory=list, description="Tags.")
@@ -76,6 +86,11 @@ class MulticastAddressModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "associated_interface": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Multicast address name.")    
     type_: Literal["multicastrange", "broadcastmask"] | None = Field(default="multicastrange", serialization_alias="type", description="Type of address object: multicast IP address range or broadcast IP/mask to be treated as a multicast address.")    
     subnet: Any = Field(default="0.0.0.0 0.0.0.0", description="Broadcast address and subnet.")    
@@ -244,8 +259,9 @@ class MulticastAddressModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -259,13 +275,10 @@ class MulticastAddressModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_associated_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_tagging_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from uuid import UUID
 
 # ============================================================================
@@ -32,6 +32,11 @@ class MulticastPolicySrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Source address objects.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class MulticastPolicyDstaddr(BaseModel):
     """
@@ -46,6 +51,11 @@ class MulticastPolicyDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.multicast-address.name",),
+    }
+    
     name: str = Field(max_length=79, description="Destination address objects.")  # datasource: ['firewall.multicast-address.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -75,6 +85,14 @@ class MulticastPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "srcintf": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+        "dstintf": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+        "ips_sensor": ("ips.sensor.name",),
+        "traffic_shaper": ("firewall.shaper.traffic-shaper.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967294, default=0, serialization_alias="id", description="Policy ID ((0 - 4294967294).")    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
     name: str | None = Field(max_length=35, default=None, description="Policy name.")    
@@ -515,8 +533,9 @@ class MulticastPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -530,21 +549,10 @@ class MulticastPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_srcintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_sensor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_traffic_shaper_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from uuid import UUID
 
 # ============================================================================
@@ -32,6 +32,11 @@ class PolicyZtnaGeoTag(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class PolicyZtnaEmsTagSecondary(BaseModel):
     """
@@ -46,6 +51,11 @@ class PolicyZtnaEmsTagSecondary(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class PolicyZtnaEmsTag(BaseModel):
     """
@@ -60,6 +70,11 @@ class PolicyZtnaEmsTag(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class PolicyUsers(BaseModel):
     """
@@ -74,6 +89,11 @@ class PolicyUsers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.local.name", "user.certificate.name"),
+    }
+    
     name: str = Field(max_length=79, description="Names of individual users that can authenticate with this policy.")  # datasource: ['user.local.name', 'user.certificate.name']
 class PolicySrcintf(BaseModel):
     """
@@ -88,6 +108,11 @@ class PolicySrcintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class PolicySrcaddr6(BaseModel):
     """
@@ -102,6 +127,11 @@ class PolicySrcaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "system.external-resource.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'system.external-resource.name', 'firewall.addrgrp6.name']
 class PolicySrcaddr(BaseModel):
     """
@@ -116,6 +146,11 @@ class PolicySrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'system.external-resource.name']
 class PolicySrcVendorMac(BaseModel):
     """
@@ -130,6 +165,11 @@ class PolicySrcVendorMac(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "id_": ("firewall.vendor-mac.id",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Vendor MAC ID.")  # datasource: ['firewall.vendor-mac.id']
 class PolicySgt(BaseModel):
     """
@@ -158,6 +198,11 @@ class PolicyService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str = Field(max_length=79, description="Service and service group names.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class PolicyRtpAddr(BaseModel):
     """
@@ -172,6 +217,11 @@ class PolicyRtpAddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.internet-service-custom-group.name', 'firewall.addrgrp.name']
 class PolicyPoolname6(BaseModel):
     """
@@ -186,6 +236,11 @@ class PolicyPoolname6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ippool6.name",),
+    }
+    
     name: str = Field(max_length=79, description="IPv6 pool name.")  # datasource: ['firewall.ippool6.name']
 class PolicyPoolname(BaseModel):
     """
@@ -200,6 +255,11 @@ class PolicyPoolname(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ippool.name",),
+    }
+    
     name: str = Field(max_length=79, description="IP pool name.")  # datasource: ['firewall.ippool.name']
 class PolicyPcpPoolname(BaseModel):
     """
@@ -214,6 +274,11 @@ class PolicyPcpPoolname(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.pcp-server.pools.name",),
+    }
+    
     name: str = Field(max_length=79, description="PCP pool name.")  # datasource: ['system.pcp-server.pools.name']
 class PolicyNtlmEnabledBrowsers(BaseModel):
     """
@@ -242,6 +307,11 @@ class PolicyNetworkServiceSrcDynamic(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.network-service-dynamic.name",),
+    }
+    
     name: str = Field(max_length=79, description="Dynamic Network Service name.")  # datasource: ['firewall.network-service-dynamic.name']
 class PolicyNetworkServiceDynamic(BaseModel):
     """
@@ -256,6 +326,11 @@ class PolicyNetworkServiceDynamic(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.network-service-dynamic.name",),
+    }
+    
     name: str = Field(max_length=79, description="Dynamic Network Service name.")  # datasource: ['firewall.network-service-dynamic.name']
 class PolicyInternetService6SrcName(BaseModel):
     """
@@ -270,6 +345,11 @@ class PolicyInternetService6SrcName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class PolicyInternetService6SrcGroup(BaseModel):
     """
@@ -284,6 +364,11 @@ class PolicyInternetService6SrcGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class PolicyInternetService6SrcFortiguard(BaseModel):
     """
@@ -298,6 +383,11 @@ class PolicyInternetService6SrcFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class PolicyInternetService6SrcCustomGroup(BaseModel):
     """
@@ -312,6 +402,11 @@ class PolicyInternetService6SrcCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service6 group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class PolicyInternetService6SrcCustom(BaseModel):
     """
@@ -326,6 +421,11 @@ class PolicyInternetService6SrcCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class PolicyInternetService6Name(BaseModel):
     """
@@ -340,6 +440,11 @@ class PolicyInternetService6Name(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="IPv6 Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class PolicyInternetService6Group(BaseModel):
     """
@@ -354,6 +459,11 @@ class PolicyInternetService6Group(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class PolicyInternetService6Fortiguard(BaseModel):
     """
@@ -368,6 +478,11 @@ class PolicyInternetService6Fortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class PolicyInternetService6CustomGroup(BaseModel):
     """
@@ -382,6 +497,11 @@ class PolicyInternetService6CustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service6 group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class PolicyInternetService6Custom(BaseModel):
     """
@@ -396,6 +516,11 @@ class PolicyInternetService6Custom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class PolicyInternetServiceSrcName(BaseModel):
     """
@@ -410,6 +535,11 @@ class PolicyInternetServiceSrcName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class PolicyInternetServiceSrcGroup(BaseModel):
     """
@@ -424,6 +554,11 @@ class PolicyInternetServiceSrcGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class PolicyInternetServiceSrcFortiguard(BaseModel):
     """
@@ -438,6 +573,11 @@ class PolicyInternetServiceSrcFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class PolicyInternetServiceSrcCustomGroup(BaseModel):
     """
@@ -452,6 +592,11 @@ class PolicyInternetServiceSrcCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class PolicyInternetServiceSrcCustom(BaseModel):
     """
@@ -466,6 +611,11 @@ class PolicyInternetServiceSrcCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class PolicyInternetServiceName(BaseModel):
     """
@@ -480,6 +630,11 @@ class PolicyInternetServiceName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class PolicyInternetServiceGroup(BaseModel):
     """
@@ -494,6 +649,11 @@ class PolicyInternetServiceGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class PolicyInternetServiceFortiguard(BaseModel):
     """
@@ -508,6 +668,11 @@ class PolicyInternetServiceFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class PolicyInternetServiceCustomGroup(BaseModel):
     """
@@ -522,6 +687,11 @@ class PolicyInternetServiceCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class PolicyInternetServiceCustom(BaseModel):
     """
@@ -536,6 +706,11 @@ class PolicyInternetServiceCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class PolicyGroups(BaseModel):
     """
@@ -550,6 +725,11 @@ class PolicyGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Group name.")  # datasource: ['user.group.name']
 class PolicyFssoGroups(BaseModel):
     """
@@ -564,6 +744,11 @@ class PolicyFssoGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.adgrp.name",),
+    }
+    
     name: str = Field(max_length=511, description="Names of FSSO groups.")  # datasource: ['user.adgrp.name']
 class PolicyDstintf(BaseModel):
     """
@@ -578,6 +763,11 @@ class PolicyDstintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class PolicyDstaddr6(BaseModel):
     """
@@ -592,6 +782,11 @@ class PolicyDstaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name", "firewall.vip6.name", "firewall.vipgrp6.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name', 'firewall.vip6.name', 'firewall.vipgrp6.name', 'system.external-resource.name']
 class PolicyDstaddr(BaseModel):
     """
@@ -606,6 +801,11 @@ class PolicyDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "firewall.vip.name", "firewall.vipgrp.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'firewall.vip.name', 'firewall.vipgrp.name', 'system.external-resource.name']
 class PolicyCustomLogFields(BaseModel):
     """
@@ -620,6 +820,11 @@ class PolicyCustomLogFields(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "field_id": ("log.custom-field.id",),
+    }
+    
     field_id: str | None = Field(max_length=35, default=None, description="Custom log field.")  # datasource: ['log.custom-field.id']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -649,6 +854,47 @@ class PolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "reputation_minimum": ("firewall.internet-service-reputation.id",),
+        "reputation_minimum6": ("firewall.internet-service-reputation.id",),
+        "schedule": ("firewall.schedule.onetime.name", "firewall.schedule.recurring.name", "firewall.schedule.group.name"),
+        "webproxy_profile": ("web-proxy.profile.name",),
+        "profile_group": ("firewall.profile-group.name",),
+        "profile_protocol_options": ("firewall.profile-protocol-options.name",),
+        "ssl_ssh_profile": ("firewall.ssl-ssh-profile.name",),
+        "av_profile": ("antivirus.profile.name",),
+        "webfilter_profile": ("webfilter.profile.name",),
+        "dnsfilter_profile": ("dnsfilter.profile.name",),
+        "emailfilter_profile": ("emailfilter.profile.name",),
+        "dlp_profile": ("dlp.profile.name",),
+        "file_filter_profile": ("file-filter.profile.name",),
+        "ips_sensor": ("ips.sensor.name",),
+        "application_list": ("application.list.name",),
+        "voip_profile": ("voip.profile.name",),
+        "ips_voip_filter": ("voip.profile.name",),
+        "sctp_filter_profile": ("sctp-filter.profile.name",),
+        "diameter_filter_profile": ("diameter-filter.profile.name",),
+        "virtual_patch_profile": ("virtual-patch.profile.name",),
+        "icap_profile": ("icap.profile.name",),
+        "videofilter_profile": ("videofilter.profile.name",),
+        "waf_profile": ("waf.profile.name",),
+        "ssh_filter_profile": ("ssh-filter.profile.name",),
+        "casb_profile": ("casb.profile.name",),
+        "wanopt_profile": ("wanopt.profile.name",),
+        "wanopt_peer": ("wanopt.peer.peer-host-id",),
+        "webproxy_forward_server": ("web-proxy.forward-server.name", "web-proxy.forward-server-group.name"),
+        "traffic_shaper": ("firewall.shaper.traffic-shaper.name",),
+        "traffic_shaper_reverse": ("firewall.shaper.traffic-shaper.name",),
+        "per_ip_shaper": ("firewall.shaper.per-ip-shaper.name",),
+        "fsso_agent_for_ntlm": ("user.fsso.name",),
+        "vpntunnel": ("vpn.ipsec.phase1.name", "vpn.ipsec.manualkey.name"),
+        "auth_cert": ("vpn.certificate.local.name",),
+        "identity_based_route": ("firewall.identity-based-route.name",),
+        "replacemsg_override_group": ("system.replacemsg-group.name",),
+        "decrypted_traffic_mirror": ("firewall.decrypted-traffic-mirror.name",),
+    }
+    
     policyid: int | None = Field(ge=0, le=4294967294, default=0, description="Policy ID (0 - 4294967294).")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable or disable this policy.")    
     name: str | None = Field(max_length=35, default=None, description="Policy name.")    
@@ -5668,8 +5914,9 @@ class PolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -5683,165 +5930,10 @@ class PolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_srcintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ztna_ems_tag_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ztna_ems_tag_secondary_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ztna_geo_tag_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_network_service_dynamic_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_network_service_src_dynamic_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_reputation_minimum_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_src_vendor_mac_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_reputation_minimum6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_rtp_addr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_schedule_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_service_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webproxy_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_profile_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_profile_protocol_options_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_ssh_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_av_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dnsfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_emailfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dlp_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_file_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_sensor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_application_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_voip_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_voip_filter_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sctp_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_diameter_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_virtual_patch_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_icap_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_videofilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_waf_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssh_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_casb_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_wanopt_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_wanopt_peer_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webproxy_forward_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_traffic_shaper_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_traffic_shaper_reverse_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_per_ip_shaper_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_pcp_poolname_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_poolname_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_poolname6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fsso_agent_for_ntlm_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_groups_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_users_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fsso_groups_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vpntunnel_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_auth_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_identity_based_route_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_custom_log_fields_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_replacemsg_override_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_decrypted_traffic_mirror_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_fortiguard_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
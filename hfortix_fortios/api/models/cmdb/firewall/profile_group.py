@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,30 @@ class ProfileGroupModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "profile_protocol_options": ("firewall.profile-protocol-options.name",),
+        "ssl_ssh_profile": ("firewall.ssl-ssh-profile.name",),
+        "av_profile": ("antivirus.profile.name",),
+        "webfilter_profile": ("webfilter.profile.name",),
+        "dnsfilter_profile": ("dnsfilter.profile.name",),
+        "emailfilter_profile": ("emailfilter.profile.name",),
+        "dlp_profile": ("dlp.profile.name",),
+        "file_filter_profile": ("file-filter.profile.name",),
+        "ips_sensor": ("ips.sensor.name",),
+        "application_list": ("application.list.name",),
+        "voip_profile": ("voip.profile.name",),
+        "ips_voip_filter": ("voip.profile.name",),
+        "sctp_filter_profile": ("sctp-filter.profile.name",),
+        "diameter_filter_profile": ("diameter-filter.profile.name",),
+        "virtual_patch_profile": ("virtual-patch.profile.name",),
+        "icap_profile": ("icap.profile.name",),
+        "videofilter_profile": ("videofilter.profile.name",),
+        "waf_profile": ("waf.profile.name",),
+        "ssh_filter_profile": ("ssh-filter.profile.name",),
+        "casb_profile": ("casb.profile.name",),
+    }
+    
     name: str = Field(max_length=47, description="Profile group name.")    
     profile_protocol_options: str | None = Field(max_length=47, default="default", description="Name of an existing Protocol options profile.")  # datasource: ['firewall.profile-protocol-options.name']    
     ssl_ssh_profile: str | None = Field(max_length=47, default="certificate-inspection", description="Name of an existing SSL SSH profile.")  # datasource: ['firewall.ssl-ssh-profile.name']    
@@ -1376,8 +1400,9 @@ class ProfileGroupModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -1391,49 +1416,10 @@ class ProfileGroupModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_profile_protocol_options_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_ssh_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_av_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dnsfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_emailfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dlp_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_file_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_sensor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_application_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_voip_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_voip_filter_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sctp_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_diameter_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_virtual_patch_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_icap_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_videofilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_waf_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssh_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_casb_profile_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
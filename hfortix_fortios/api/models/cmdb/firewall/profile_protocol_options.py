@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -364,6 +364,11 @@ class ProfileProtocolOptionsCifs(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "domain_controller": ("user.domain-controller.name", "credential-store.domain-controller.server-name"),
+    }
+    
     ports: list[int] = Field(ge=1, le=65535, description="Ports to scan for content (1 - 65535, default = 445).")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable the active status of scanning for this protocol.")    
     options: list[Literal["oversize"]] = Field(default_factory=list, description="One or more options that can be applied to the session.")    
@@ -406,6 +411,11 @@ class ProfileProtocolOptionsModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "replacemsg_group": ("system.replacemsg-group.name",),
+    }
+    
     name: str = Field(max_length=47, description="Name.")    
     comment: str | None = Field(max_length=255, default=None, description="Optional comments.")    
     replacemsg_group: str | None = Field(max_length=35, default=None, description="Name of the replacement message group to be used.")  # datasource: ['system.replacemsg-group.name']    
@@ -584,8 +594,9 @@ class ProfileProtocolOptionsModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -599,13 +610,10 @@ class ProfileProtocolOptionsModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_replacemsg_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_cifs_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 from uuid import UUID
 
@@ -33,6 +33,11 @@ class ProxyPolicyZtnaProxy(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("ztna.traffic-forward-proxy.name", "ztna.web-proxy.name", "ztna.web-portal.name"),
+    }
+    
     name: str = Field(max_length=79, description="ZTNA proxy name.")  # datasource: ['ztna.traffic-forward-proxy.name', 'ztna.web-proxy.name', 'ztna.web-portal.name']
 class ProxyPolicyZtnaEmsTag(BaseModel):
     """
@@ -47,6 +52,11 @@ class ProxyPolicyZtnaEmsTag(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="EMS Tag name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class ProxyPolicyUsers(BaseModel):
     """
@@ -61,6 +71,11 @@ class ProxyPolicyUsers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.local.name", "user.certificate.name"),
+    }
+    
     name: str = Field(max_length=79, description="Group name.")  # datasource: ['user.local.name', 'user.certificate.name']
 class ProxyPolicyUrlRisk(BaseModel):
     """
@@ -75,6 +90,11 @@ class ProxyPolicyUrlRisk(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("webfilter.ftgd-risk-level.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Risk level name.")  # datasource: ['webfilter.ftgd-risk-level.name']
 class ProxyPolicySrcintf(BaseModel):
     """
@@ -89,6 +109,11 @@ class ProxyPolicySrcintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class ProxyPolicySrcaddr6(BaseModel):
     """
@@ -103,6 +128,11 @@ class ProxyPolicySrcaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name', 'system.external-resource.name']
 class ProxyPolicySrcaddr(BaseModel):
     """
@@ -117,6 +147,11 @@ class ProxyPolicySrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "firewall.proxy-address.name", "firewall.proxy-addrgrp.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'firewall.proxy-address.name', 'firewall.proxy-addrgrp.name', 'system.external-resource.name']
 class ProxyPolicyService(BaseModel):
     """
@@ -131,6 +166,11 @@ class ProxyPolicyService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str = Field(max_length=79, description="Service name.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class ProxyPolicyPoolname6(BaseModel):
     """
@@ -145,6 +185,11 @@ class ProxyPolicyPoolname6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ippool6.name",),
+    }
+    
     name: str = Field(max_length=79, description="IPv6 pool name.")  # datasource: ['firewall.ippool6.name']
 class ProxyPolicyPoolname(BaseModel):
     """
@@ -159,6 +204,11 @@ class ProxyPolicyPoolname(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ippool.name",),
+    }
+    
     name: str = Field(max_length=79, description="IP pool name.")  # datasource: ['firewall.ippool.name']
 class ProxyPolicyInternetService6Name(BaseModel):
     """
@@ -173,6 +223,11 @@ class ProxyPolicyInternetService6Name(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Internet Service IPv6 name.")  # datasource: ['firewall.internet-service-name.name']
 class ProxyPolicyInternetService6Group(BaseModel):
     """
@@ -187,6 +242,11 @@ class ProxyPolicyInternetService6Group(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service IPv6 group name.")  # datasource: ['firewall.internet-service-group.name']
 class ProxyPolicyInternetService6Fortiguard(BaseModel):
     """
@@ -201,6 +261,11 @@ class ProxyPolicyInternetService6Fortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service IPv6 name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class ProxyPolicyInternetService6CustomGroup(BaseModel):
     """
@@ -215,6 +280,11 @@ class ProxyPolicyInternetService6CustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service IPv6 group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class ProxyPolicyInternetService6Custom(BaseModel):
     """
@@ -229,6 +299,11 @@ class ProxyPolicyInternetService6Custom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service IPv6 name.")  # datasource: ['firewall.internet-service-custom.name']
 class ProxyPolicyInternetServiceName(BaseModel):
     """
@@ -243,6 +318,11 @@ class ProxyPolicyInternetServiceName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class ProxyPolicyInternetServiceGroup(BaseModel):
     """
@@ -257,6 +337,11 @@ class ProxyPolicyInternetServiceGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class ProxyPolicyInternetServiceFortiguard(BaseModel):
     """
@@ -271,6 +356,11 @@ class ProxyPolicyInternetServiceFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class ProxyPolicyInternetServiceCustomGroup(BaseModel):
     """
@@ -285,6 +375,11 @@ class ProxyPolicyInternetServiceCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class ProxyPolicyInternetServiceCustom(BaseModel):
     """
@@ -299,6 +394,11 @@ class ProxyPolicyInternetServiceCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class ProxyPolicyGroups(BaseModel):
     """
@@ -313,6 +413,11 @@ class ProxyPolicyGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Group name.")  # datasource: ['user.group.name']
 class ProxyPolicyDstintf(BaseModel):
     """
@@ -327,6 +432,11 @@ class ProxyPolicyDstintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class ProxyPolicyDstaddr6(BaseModel):
     """
@@ -341,6 +451,11 @@ class ProxyPolicyDstaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name", "firewall.vip6.name", "firewall.vipgrp6.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name', 'firewall.vip6.name', 'firewall.vipgrp6.name', 'system.external-resource.name']
 class ProxyPolicyDstaddr(BaseModel):
     """
@@ -355,6 +470,11 @@ class ProxyPolicyDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "firewall.proxy-address.name", "firewall.proxy-addrgrp.name", "firewall.vip.name", "firewall.vipgrp.name", "system.external-resource.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'firewall.proxy-address.name', 'firewall.proxy-addrgrp.name', 'firewall.vip.name', 'firewall.vipgrp.name', 'system.external-resource.name']
 class ProxyPolicyAccessProxy6(BaseModel):
     """
@@ -369,6 +489,11 @@ class ProxyPolicyAccessProxy6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.access-proxy6.name",),
+    }
+    
     name: str = Field(max_length=79, description="Access proxy name.")  # datasource: ['firewall.access-proxy6.name']
 class ProxyPolicyAccessProxy(BaseModel):
     """
@@ -383,6 +508,11 @@ class ProxyPolicyAccessProxy(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.access-proxy.name",),
+    }
+    
     name: str = Field(max_length=79, description="Access Proxy name.")  # datasource: ['firewall.access-proxy.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -437,6 +567,34 @@ class ProxyPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "schedule": ("firewall.schedule.onetime.name", "firewall.schedule.recurring.name", "firewall.schedule.group.name"),
+        "webproxy_forward_server": ("web-proxy.forward-server.name", "web-proxy.forward-server-group.name"),
+        "isolator_server": ("web-proxy.isolator-server.name",),
+        "webproxy_profile": ("web-proxy.profile.name",),
+        "profile_group": ("firewall.profile-group.name",),
+        "profile_protocol_options": ("firewall.profile-protocol-options.name",),
+        "ssl_ssh_profile": ("firewall.ssl-ssh-profile.name",),
+        "av_profile": ("antivirus.profile.name",),
+        "webfilter_profile": ("webfilter.profile.name",),
+        "dnsfilter_profile": ("dnsfilter.profile.name",),
+        "emailfilter_profile": ("emailfilter.profile.name",),
+        "dlp_profile": ("dlp.profile.name",),
+        "file_filter_profile": ("file-filter.profile.name",),
+        "ips_sensor": ("ips.sensor.name",),
+        "application_list": ("application.list.name",),
+        "ips_voip_filter": ("voip.profile.name",),
+        "sctp_filter_profile": ("sctp-filter.profile.name",),
+        "icap_profile": ("icap.profile.name",),
+        "videofilter_profile": ("videofilter.profile.name",),
+        "waf_profile": ("waf.profile.name",),
+        "ssh_filter_profile": ("ssh-filter.profile.name",),
+        "casb_profile": ("casb.profile.name",),
+        "replacemsg_override_group": ("system.replacemsg-group.name",),
+        "decrypted_traffic_mirror": ("firewall.decrypted-traffic-mirror.name",),
+    }
+    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
     policyid: int | None = Field(ge=0, le=4294967295, default=0, description="Policy ID.")    
     name: str | None = Field(max_length=35, default=None, description="Policy name.")    
@@ -3657,8 +3815,9 @@ class ProxyPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -3672,109 +3831,10 @@ class ProxyPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_access_proxy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_access_proxy6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ztna_proxy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_poolname_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_poolname6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ztna_ems_tag_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_url_risk_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_service_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_schedule_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_groups_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_users_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webproxy_forward_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_isolator_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webproxy_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_profile_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_profile_protocol_options_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_ssh_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_av_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dnsfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_emailfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dlp_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_file_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_sensor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_application_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_voip_filter_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sctp_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_icap_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_videofilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_waf_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssh_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_casb_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_replacemsg_override_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_decrypted_traffic_mirror_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
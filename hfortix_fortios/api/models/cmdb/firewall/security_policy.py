@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from uuid import UUID
 
 # ============================================================================
@@ -32,6 +32,11 @@ class SecurityPolicyUsers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.local.name",),
+    }
+    
     name: str = Field(max_length=79, description="User name.")  # datasource: ['user.local.name']
 class SecurityPolicySrcintf(BaseModel):
     """
@@ -46,6 +51,11 @@ class SecurityPolicySrcintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class SecurityPolicySrcaddr6(BaseModel):
     """
@@ -60,6 +70,11 @@ class SecurityPolicySrcaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name', 'system.external-resource.name']
 class SecurityPolicySrcaddr(BaseModel):
     """
@@ -74,6 +89,11 @@ class SecurityPolicySrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'system.external-resource.name']
 class SecurityPolicyService(BaseModel):
     """
@@ -88,6 +108,11 @@ class SecurityPolicyService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str = Field(max_length=79, description="Service name.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class SecurityPolicyInternetService6SrcName(BaseModel):
     """
@@ -102,6 +127,11 @@ class SecurityPolicyInternetService6SrcName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class SecurityPolicyInternetService6SrcGroup(BaseModel):
     """
@@ -116,6 +146,11 @@ class SecurityPolicyInternetService6SrcGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class SecurityPolicyInternetService6SrcFortiguard(BaseModel):
     """
@@ -130,6 +165,11 @@ class SecurityPolicyInternetService6SrcFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class SecurityPolicyInternetService6SrcCustomGroup(BaseModel):
     """
@@ -144,6 +184,11 @@ class SecurityPolicyInternetService6SrcCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service6 group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class SecurityPolicyInternetService6SrcCustom(BaseModel):
     """
@@ -158,6 +203,11 @@ class SecurityPolicyInternetService6SrcCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class SecurityPolicyInternetService6Name(BaseModel):
     """
@@ -172,6 +222,11 @@ class SecurityPolicyInternetService6Name(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="IPv6 Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class SecurityPolicyInternetService6Group(BaseModel):
     """
@@ -186,6 +241,11 @@ class SecurityPolicyInternetService6Group(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class SecurityPolicyInternetService6Fortiguard(BaseModel):
     """
@@ -200,6 +260,11 @@ class SecurityPolicyInternetService6Fortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class SecurityPolicyInternetService6CustomGroup(BaseModel):
     """
@@ -214,6 +279,11 @@ class SecurityPolicyInternetService6CustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom IPv6 Internet Service group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class SecurityPolicyInternetService6Custom(BaseModel):
     """
@@ -228,6 +298,11 @@ class SecurityPolicyInternetService6Custom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom IPv6 Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class SecurityPolicyInternetServiceSrcName(BaseModel):
     """
@@ -242,6 +317,11 @@ class SecurityPolicyInternetServiceSrcName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class SecurityPolicyInternetServiceSrcGroup(BaseModel):
     """
@@ -256,6 +336,11 @@ class SecurityPolicyInternetServiceSrcGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class SecurityPolicyInternetServiceSrcFortiguard(BaseModel):
     """
@@ -270,6 +355,11 @@ class SecurityPolicyInternetServiceSrcFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class SecurityPolicyInternetServiceSrcCustomGroup(BaseModel):
     """
@@ -284,6 +374,11 @@ class SecurityPolicyInternetServiceSrcCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class SecurityPolicyInternetServiceSrcCustom(BaseModel):
     """
@@ -298,6 +393,11 @@ class SecurityPolicyInternetServiceSrcCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class SecurityPolicyInternetServiceName(BaseModel):
     """
@@ -312,6 +412,11 @@ class SecurityPolicyInternetServiceName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class SecurityPolicyInternetServiceGroup(BaseModel):
     """
@@ -326,6 +431,11 @@ class SecurityPolicyInternetServiceGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class SecurityPolicyInternetServiceFortiguard(BaseModel):
     """
@@ -340,6 +450,11 @@ class SecurityPolicyInternetServiceFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class SecurityPolicyInternetServiceCustomGroup(BaseModel):
     """
@@ -354,6 +469,11 @@ class SecurityPolicyInternetServiceCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class SecurityPolicyInternetServiceCustom(BaseModel):
     """
@@ -368,6 +488,11 @@ class SecurityPolicyInternetServiceCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class SecurityPolicyGroups(BaseModel):
     """
@@ -382,6 +507,11 @@ class SecurityPolicyGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="User group name.")  # datasource: ['user.group.name']
 class SecurityPolicyFssoGroups(BaseModel):
     """
@@ -396,6 +526,11 @@ class SecurityPolicyFssoGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.adgrp.name",),
+    }
+    
     name: str = Field(max_length=511, description="Names of FSSO groups.")  # datasource: ['user.adgrp.name']
 class SecurityPolicyDstintf(BaseModel):
     """
@@ -410,6 +545,11 @@ class SecurityPolicyDstintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class SecurityPolicyDstaddr6(BaseModel):
     """
@@ -424,6 +564,11 @@ class SecurityPolicyDstaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name", "firewall.vip6.name", "firewall.vipgrp6.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name', 'firewall.vip6.name', 'firewall.vipgrp6.name', 'system.external-resource.name']
 class SecurityPolicyDstaddr(BaseModel):
     """
@@ -438,6 +583,11 @@ class SecurityPolicyDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name", "firewall.vip.name", "firewall.vipgrp.name", "system.external-resource.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'firewall.vip.name', 'firewall.vipgrp.name', 'system.external-resource.name']
 class SecurityPolicyApplication(BaseModel):
     """
@@ -466,6 +616,11 @@ class SecurityPolicyAppGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("application.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Application group names.")  # datasource: ['application.group.name']
 class SecurityPolicyAppCategory(BaseModel):
     """
@@ -509,6 +664,31 @@ class SecurityPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "schedule": ("firewall.schedule.onetime.name", "firewall.schedule.recurring.name", "firewall.schedule.group.name"),
+        "profile_group": ("firewall.profile-group.name",),
+        "profile_protocol_options": ("firewall.profile-protocol-options.name",),
+        "ssl_ssh_profile": ("firewall.ssl-ssh-profile.name",),
+        "av_profile": ("antivirus.profile.name",),
+        "webfilter_profile": ("webfilter.profile.name",),
+        "dnsfilter_profile": ("dnsfilter.profile.name",),
+        "emailfilter_profile": ("emailfilter.profile.name",),
+        "dlp_profile": ("dlp.profile.name",),
+        "file_filter_profile": ("file-filter.profile.name",),
+        "ips_sensor": ("ips.sensor.name",),
+        "application_list": ("application.list.name",),
+        "voip_profile": ("voip.profile.name",),
+        "ips_voip_filter": ("voip.profile.name",),
+        "sctp_filter_profile": ("sctp-filter.profile.name",),
+        "diameter_filter_profile": ("diameter-filter.profile.name",),
+        "virtual_patch_profile": ("virtual-patch.profile.name",),
+        "icap_profile": ("icap.profile.name",),
+        "videofilter_profile": ("videofilter.profile.name",),
+        "ssh_filter_profile": ("ssh-filter.profile.name",),
+        "casb_profile": ("casb.profile.name",),
+    }
+    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
     policyid: int | None = Field(ge=0, le=4294967294, default=0, description="Policy ID.")    
     name: str | None = Field(max_length=35, default=None, description="Policy name.")    
@@ -3807,8 +3987,9 @@ class SecurityPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -3822,113 +4003,10 @@ class SecurityPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_srcintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service6_src_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_service_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_schedule_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_profile_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_profile_protocol_options_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_ssh_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_av_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dnsfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_emailfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dlp_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_file_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_sensor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_application_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_voip_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_voip_filter_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sctp_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_diameter_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_virtual_patch_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_icap_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_videofilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssh_filter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_casb_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_app_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_groups_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_users_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fsso_groups_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
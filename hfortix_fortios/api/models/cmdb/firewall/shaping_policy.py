@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from uuid import UUID
 
 # ============================================================================
@@ -32,6 +32,11 @@ class ShapingPolicyUsers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.local.name",),
+    }
+    
     name: str = Field(max_length=79, description="User name.")  # datasource: ['user.local.name']
 class ShapingPolicyUrlCategory(BaseModel):
     """
@@ -60,6 +65,11 @@ class ShapingPolicySrcintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str = Field(max_length=79, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class ShapingPolicySrcaddr6(BaseModel):
     """
@@ -74,6 +84,11 @@ class ShapingPolicySrcaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class ShapingPolicySrcaddr(BaseModel):
     """
@@ -88,6 +103,11 @@ class ShapingPolicySrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class ShapingPolicyService(BaseModel):
     """
@@ -102,6 +122,11 @@ class ShapingPolicyService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str = Field(max_length=79, description="Service name.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class ShapingPolicyInternetServiceSrcName(BaseModel):
     """
@@ -116,6 +141,11 @@ class ShapingPolicyInternetServiceSrcName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class ShapingPolicyInternetServiceSrcGroup(BaseModel):
     """
@@ -130,6 +160,11 @@ class ShapingPolicyInternetServiceSrcGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class ShapingPolicyInternetServiceSrcFortiguard(BaseModel):
     """
@@ -144,6 +179,11 @@ class ShapingPolicyInternetServiceSrcFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class ShapingPolicyInternetServiceSrcCustomGroup(BaseModel):
     """
@@ -158,6 +198,11 @@ class ShapingPolicyInternetServiceSrcCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class ShapingPolicyInternetServiceSrcCustom(BaseModel):
     """
@@ -172,6 +217,11 @@ class ShapingPolicyInternetServiceSrcCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class ShapingPolicyInternetServiceName(BaseModel):
     """
@@ -186,6 +236,11 @@ class ShapingPolicyInternetServiceName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service name.")  # datasource: ['firewall.internet-service-name.name']
 class ShapingPolicyInternetServiceGroup(BaseModel):
     """
@@ -200,6 +255,11 @@ class ShapingPolicyInternetServiceGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class ShapingPolicyInternetServiceFortiguard(BaseModel):
     """
@@ -214,6 +274,11 @@ class ShapingPolicyInternetServiceFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class ShapingPolicyInternetServiceCustomGroup(BaseModel):
     """
@@ -228,6 +293,11 @@ class ShapingPolicyInternetServiceCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class ShapingPolicyInternetServiceCustom(BaseModel):
     """
@@ -242,6 +312,11 @@ class ShapingPolicyInternetServiceCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class ShapingPolicyGroups(BaseModel):
     """
@@ -256,6 +331,11 @@ class ShapingPolicyGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Group name.")  # datasource: ['user.group.name']
 class ShapingPolicyDstintf(BaseModel):
     """
@@ -270,6 +350,11 @@ class ShapingPolicyDstintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str = Field(max_length=79, description="Interface name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class ShapingPolicyDstaddr6(BaseModel):
     """
@@ -284,6 +369,11 @@ class ShapingPolicyDstaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class ShapingPolicyDstaddr(BaseModel):
     """
@@ -298,6 +388,11 @@ class ShapingPolicyDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class ShapingPolicyApplication(BaseModel):
     """
@@ -326,6 +421,11 @@ class ShapingPolicyAppGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("application.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Application group name.")  # datasource: ['application.group.name']
 class ShapingPolicyAppCategory(BaseModel):
     """
@@ -369,6 +469,15 @@ class ShapingPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "schedule": ("firewall.schedule.onetime.name", "firewall.schedule.recurring.name", "firewall.schedule.group.name"),
+        "traffic_shaper": ("firewall.shaper.traffic-shaper.name",),
+        "traffic_shaper_reverse": ("firewall.shaper.traffic-shaper.name",),
+        "per_ip_shaper": ("firewall.shaper.per-ip-shaper.name",),
+        "class_id": ("firewall.traffic-class.class-id",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Shaping policy ID (0 - 4294967295).")    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
     name: str | None = Field(max_length=35, default=None, description="Shaping policy name.")    
@@ -1954,8 +2063,9 @@ class ShapingPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -1969,59 +2079,10 @@ class ShapingPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_custom_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_src_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_service_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_schedule_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_users_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_groups_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_app_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_traffic_shaper_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_traffic_shaper_reverse_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_per_ip_shaper_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_class_id_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -40,6 +40,11 @@ class ShapingProfileShapingEntries(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "class_id": ("firewall.traffic-class.class-id",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID number.")    
     class_id: int = Field(ge=0, le=4294967295, default=0, description="Class ID.")  # datasource: ['firewall.traffic-class.class-id']    
     priority: ShapingProfileShapingEntriesPriorityEnum | None = Field(default=ShapingProfileShapingEntriesPriorityEnum.HIGH, description="Priority.")    
@@ -79,6 +84,11 @@ class ShapingProfileModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "default_class_id": ("firewall.traffic-class.class-id",),
+    }
+    
     profile_name: str = Field(max_length=35, description="Shaping profile name.")    
     comment: str | None = Field(max_length=1023, default=None, description="Comment.")    
     type_: Literal["policing", "queuing"] | None = Field(default="policing", serialization_alias="type", description="Select shaping profile type: policing / queuing.")    
@@ -244,8 +254,9 @@ class ShapingProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -259,13 +270,10 @@ class ShapingProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_default_class_id_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_shaping_entries_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,18 @@ class SettingModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "caname": ("firewall.ssh.local-ca.name",),
+        "untrusted_caname": ("firewall.ssh.local-ca.name",),
+        "hostkey_rsa2048": ("firewall.ssh.local-key.name",),
+        "hostkey_dsa1024": ("firewall.ssh.local-key.name",),
+        "hostkey_ecdsa256": ("firewall.ssh.local-key.name",),
+        "hostkey_ecdsa384": ("firewall.ssh.local-key.name",),
+        "hostkey_ecdsa521": ("firewall.ssh.local-key.name",),
+        "hostkey_ed25519": ("firewall.ssh.local-key.name",),
+    }
+    
     caname: str | None = Field(max_length=35, default=None, description="CA certificate used by SSH Inspection.")  # datasource: ['firewall.ssh.local-ca.name']    
     untrusted_caname: str | None = Field(max_length=35, default=None, description="Untrusted CA certificate used by SSH Inspection.")  # datasource: ['firewall.ssh.local-ca.name']    
     hostkey_rsa2048: str | None = Field(max_length=35, default=None, description="RSA certificate used by SSH proxy.")  # datasource: ['firewall.ssh.local-key.name']    
@@ -596,8 +608,9 @@ class SettingModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -611,25 +624,10 @@ class SettingModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_caname_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_untrusted_caname_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_hostkey_rsa2048_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_hostkey_dsa1024_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_hostkey_ecdsa256_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_hostkey_ecdsa384_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_hostkey_ecdsa521_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_hostkey_ed25519_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -85,6 +85,13 @@ class SslSshProfileSslExempt(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "address": ("firewall.address.name", "firewall.addrgrp.name"),
+        "address6": ("firewall.address6.name", "firewall.addrgrp6.name"),
+        "wildcard_fqdn": ("firewall.wildcard-fqdn.custom.name", "firewall.wildcard-fqdn.group.name"),
+    }
+    
     id_: int | None = Field(ge=0, le=512, default=0, serialization_alias="id", description="ID number.")    
     type_: SslSshProfileSslExemptTypeEnum = Field(default=SslSshProfileSslExemptTypeEnum.FORTIGUARD_CATEGORY, serialization_alias="type", description="Type of address object (IPv4 or IPv6) or FortiGuard category.")    
     fortiguard_category: int | None = Field(ge=0, le=255, default=0, description="FortiGuard category ID.")    
@@ -178,6 +185,11 @@ class SslSshProfileServerCert(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("vpn.certificate.local.name",),
+    }
+    
     name: str | None = Field(max_length=79, default="Fortinet_SSL", description="Certificate list.")  # datasource: ['vpn.certificate.local.name']
 class SslSshProfilePop3S(BaseModel):
     """
@@ -365,6 +377,12 @@ class SslSshProfileModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "caname": ("vpn.certificate.local.name", "vpn.certificate.hsm-local.name"),
+        "untrusted_caname": ("vpn.certificate.local.name", "vpn.certificate.hsm-local.name"),
+    }
+    
     name: str = Field(max_length=47, description="Name.")    
     comment: str | None = Field(max_length=255, default=None, description="Optional comments.")    
     ssl: SslSshProfileSsl | None = Field(default=None, description="Configure SSL options.")    
@@ -681,8 +699,9 @@ class SslSshProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -696,17 +715,10 @@ class SslSshProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_ssl_exempt_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_caname_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_untrusted_caname_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_server_cert_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
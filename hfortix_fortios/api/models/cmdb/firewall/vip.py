@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 from uuid import UUID
 
@@ -229,6 +229,11 @@ class VipSslCertificate(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("vpn.certificate.local.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Certificate list.")  # datasource: ['vpn.certificate.local.name']
 class VipSrcintfFilter(BaseModel):
     """
@@ -243,6 +248,11 @@ class VipSrcintfFilter(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface_name": ("system.interface.name",),
+    }
+    
     interface_name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name']
 class VipSrcFilter(BaseModel):
     """
@@ -271,6 +281,11 @@ class VipService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str = Field(max_length=79, description="Service name.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class VipRealserversMonitor(BaseModel):
     """
@@ -285,6 +300,11 @@ class VipRealserversMonitor(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ldb-monitor.name",),
+    }
+    
     name: str = Field(max_length=79, description="Health monitor name.")  # datasource: ['firewall.ldb-monitor.name']
 class VipRealservers(BaseModel):
     """
@@ -299,6 +319,11 @@ class VipRealservers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "address": ("firewall.address.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Real server ID.")    
     type_: Literal["ip", "address"] = Field(default="ip", serialization_alias="type", description="Type of address.")    
     address: str = Field(max_length=79, description="Dynamic address of the real server.")  # datasource: ['firewall.address.name']    
@@ -348,6 +373,11 @@ class VipMonitor(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ldb-monitor.name",),
+    }
+    
     name: str = Field(max_length=79, description="Health monitor name.")  # datasource: ['firewall.ldb-monitor.name']
 class VipMappedip(BaseModel):
     """
@@ -391,6 +421,11 @@ class VipExtaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -530,6 +565,14 @@ class VipModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "mapped_addr": ("firewall.address.name",),
+        "extintf": ("system.interface.name",),
+        "ssl_hpkp_primary": ("vpn.certificate.local.name", "vpn.certificate.ca.name"),
+        "ssl_hpkp_backup": ("vpn.certificate.local.name", "vpn.certificate.ca.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Virtual IP name.")    
     id_: int | None = Field(ge=0, le=65535, default=0, serialization_alias="id", description="Custom defined ID.")    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
@@ -1277,8 +1320,9 @@ class VipModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -1292,29 +1336,10 @@ class VipModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_service_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_extaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_mapped_addr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_extintf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcintf_filter_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_realservers_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_hpkp_primary_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_hpkp_backup_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_monitor_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 from uuid import UUID
 
@@ -229,6 +229,11 @@ class Vip6SslCertificate(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("vpn.certificate.local.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Certificate list.")  # datasource: ['vpn.certificate.local.name']
 class Vip6SrcFilter(BaseModel):
     """
@@ -257,6 +262,11 @@ class Vip6RealserversMonitor(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ldb-monitor.name",),
+    }
+    
     name: str = Field(max_length=79, description="Health monitor name.")  # datasource: ['firewall.ldb-monitor.name']
 class Vip6Realservers(BaseModel):
     """
@@ -318,6 +328,11 @@ class Vip6Monitor(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.ldb-monitor.name",),
+    }
+    
     name: str = Field(max_length=79, description="Health monitor name.")  # datasource: ['firewall.ldb-monitor.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -441,6 +456,12 @@ class Vip6Model(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ssl_hpkp_primary": ("vpn.certificate.local.name", "vpn.certificate.ca.name"),
+        "ssl_hpkp_backup": ("vpn.certificate.local.name", "vpn.certificate.ca.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Virtual ip6 name.")    
     id_: int | None = Field(ge=0, le=65535, default=0, serialization_alias="id", description="Custom defined ID.")    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
@@ -809,8 +830,9 @@ class Vip6Model(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -824,17 +846,10 @@ class Vip6Model(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_ssl_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_hpkp_primary_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_hpkp_backup_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_monitor_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -63,6 +63,11 @@ class ProfileRespmodForwardRules(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "host": ("firewall.address.name", "firewall.addrgrp.name", "firewall.proxy-address.name"),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Address name.")    
     host: str = Field(max_length=79, description="Address object for the host.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name', 'firewall.proxy-address.name']    
     header_group: list[ProfileRespmodForwardRulesHeaderGroup] = Field(default_factory=list, description="HTTP header group.")    
@@ -125,6 +130,14 @@ class ProfileModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "replacemsg_group": ("system.replacemsg-group.name",),
+        "request_server": ("icap.server.name", "icap.server-group.name"),
+        "response_server": ("icap.server.name", "icap.server-group.name"),
+        "file_transfer_server": ("icap.server.name", "icap.server-group.name"),
+    }
+    
     replacemsg_group: str | None = Field(max_length=35, default=None, description="Replacement message group.")  # datasource: ['system.replacemsg-group.name']    
     name: str | None = Field(max_length=47, default=None, description="ICAP profile name.")    
     comment: str | None = Field(max_length=255, default=None, description="Comment.")    
@@ -517,8 +530,9 @@ class ProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -532,19 +546,10 @@ class ProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_replacemsg_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_request_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_response_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_file_transfer_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_respmod_forward_rules_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
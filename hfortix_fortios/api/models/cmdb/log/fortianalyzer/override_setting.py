@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -77,6 +77,13 @@ class OverrideSettingModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "server_cert_ca": ("certificate.ca.name", "vpn.certificate.ca.name"),
+        "certificate": ("certificate.local.name",),
+        "interface": ("system.interface.name",),
+    }
+    
     use_management_vdom: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable use of management VDOM IP address as source IP for logs sent to FortiAnalyzer.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable logging to FortiAnalyzer.")    
     ips_archive: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable IPS packet archive logging.")    
@@ -337,8 +344,9 @@ class OverrideSettingModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -352,15 +360,10 @@ class OverrideSettingModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_server_cert_ca_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
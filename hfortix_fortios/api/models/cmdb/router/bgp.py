@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -186,6 +186,12 @@ class BgpVrf6LeakTarget(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "route_map": ("router.route-map.name",),
+        "interface": ("system.interface.name",),
+    }
+    
     vrf: str | None = Field(max_length=7, default=None, description="Target VRF ID <0-511>.")    
     route_map: str = Field(max_length=35, description="Route map of VRF leaking.")  # datasource: ['router.route-map.name']    
     interface: str = Field(max_length=15, description="Interface which is used to leak routes to target VRF.")  # datasource: ['system.interface.name']
@@ -230,6 +236,11 @@ class BgpVrf6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "import_route_map": ("router.route-map.name",),
+    }
+    
     vrf: str | None = Field(max_length=7, default=None, description="Origin VRF ID <0-511>.")    
     role: Literal["standalone", "ce", "pe"] | None = Field(default="standalone", description="VRF role.")    
     rd: str | None = Field(max_length=79, default=None, description="Route Distinguisher: AA:NN|A.B.C.D:NN.")    
@@ -250,6 +261,12 @@ class BgpVrfLeakTarget(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "route_map": ("router.route-map.name",),
+        "interface": ("system.interface.name",),
+    }
+    
     vrf: str | None = Field(max_length=7, default=None, description="Target VRF ID <0-511>.")    
     route_map: str = Field(max_length=35, description="Route map of VRF leaking.")  # datasource: ['router.route-map.name']    
     interface: str = Field(max_length=15, description="Interface which is used to leak routes to target VRF.")  # datasource: ['system.interface.name']
@@ -294,6 +311,11 @@ class BgpVrf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "import_route_map": ("router.route-map.name",),
+    }
+    
     vrf: str | None = Field(max_length=7, default=None, description="Origin VRF ID <0-511>.")    
     role: Literal["standalone", "ce", "pe"] | None = Field(default="standalone", description="VRF role.")    
     rd: str | None = Field(max_length=79, default=None, description="Route Distinguisher: AA:NN|A.B.C.D:NN.")    
@@ -314,6 +336,11 @@ class BgpRedistribute6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "route_map": ("router.route-map.name",),
+    }
+    
     name: str = Field(max_length=35, description="Distribute list entry name.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     route_map: str | None = Field(max_length=35, default=None, description="Route map name.")  # datasource: ['router.route-map.name']
@@ -330,6 +357,11 @@ class BgpRedistribute(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "route_map": ("router.route-map.name",),
+    }
+    
     name: str = Field(max_length=35, description="Distribute list entry name.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     route_map: str | None = Field(max_length=35, default=None, description="Route map name.")  # datasource: ['router.route-map.name']
@@ -346,6 +378,11 @@ class BgpNetwork6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "route_map": ("router.route-map.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     prefix6: str = Field(default="::/0", description="Network IPv6 prefix.")    
     network_import_check: Literal["global", "enable", "disable"] | None = Field(default="global", description="Configure insurance of BGP network route existence in IGP.")    
@@ -364,6 +401,12 @@ class BgpNetwork(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "route_map": ("router.route-map.name",),
+        "prefix_name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     prefix: str = Field(default="0.0.0.0 0.0.0.0", description="Network prefix.")    
     network_import_check: Literal["global", "enable", "disable"] | None = Field(default="global", description="Configure insurance of BGP network route existence in IGP.")    
@@ -383,6 +426,11 @@ class BgpNeighborConditionalAdvertise6ConditionRoutemap(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("router.route-map.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Route map.")  # datasource: ['router.route-map.name']
 class BgpNeighborConditionalAdvertise6(BaseModel):
     """
@@ -397,6 +445,11 @@ class BgpNeighborConditionalAdvertise6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "advertise_routemap": ("router.route-map.name",),
+    }
+    
     advertise_routemap: str = Field(max_length=35, description="Name of advertising route map.")  # datasource: ['router.route-map.name']    
     condition_routemap: list[BgpNeighborConditionalAdvertise6ConditionRoutemap] = Field(description="List of conditional route maps.")    
     condition_type: Literal["exist", "non-exist"] | None = Field(default="exist", description="Type of condition.")
@@ -413,6 +466,11 @@ class BgpNeighborConditionalAdvertiseConditionRoutemap(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("router.route-map.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Route map.")  # datasource: ['router.route-map.name']
 class BgpNeighborConditionalAdvertise(BaseModel):
     """
@@ -427,6 +485,11 @@ class BgpNeighborConditionalAdvertise(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "advertise_routemap": ("router.route-map.name",),
+    }
+    
     advertise_routemap: str = Field(max_length=35, description="Name of advertising route map.")  # datasource: ['router.route-map.name']    
     condition_routemap: list[BgpNeighborConditionalAdvertiseConditionRoutemap] = Field(description="List of conditional route maps.")    
     condition_type: Literal["exist", "non-exist"] | None = Field(default="exist", description="Type of condition.")
@@ -443,6 +506,11 @@ class BgpNeighborRange6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "neighbor_group": ("router.bgp.neighbor-group.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="IPv6 neighbor range ID.")    
     prefix6: str = Field(default="::/0", description="IPv6 prefix.")    
     max_neighbor_num: int | None = Field(ge=1, le=1000, default=0, description="Maximum number of neighbors.")    
@@ -460,6 +528,11 @@ class BgpNeighborRange(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "neighbor_group": ("router.bgp.neighbor-group.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Neighbor range ID.")    
     prefix: str = Field(default="0.0.0.0 0.0.0.0", description="Neighbor range prefix.")    
     max_neighbor_num: int | None = Field(ge=1, le=1000, default=0, description="Maximum number of neighbors.")    
@@ -477,6 +550,56 @@ class BgpNeighborGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "default_originate_routemap": ("router.route-map.name",),
+        "default_originate_routemap6": ("router.route-map.name",),
+        "distribute_list_in": ("router.access-list.name",),
+        "distribute_list_in6": ("router.access-list6.name",),
+        "distribute_list_in_vpnv4": ("router.access-list.name",),
+        "distribute_list_in_vpnv6": ("router.access-list6.name",),
+        "distribute_list_out": ("router.access-list.name",),
+        "distribute_list_out6": ("router.access-list6.name",),
+        "distribute_list_out_vpnv4": ("router.access-list.name",),
+        "distribute_list_out_vpnv6": ("router.access-list6.name",),
+        "filter_list_in": ("router.aspath-list.name",),
+        "filter_list_in6": ("router.aspath-list.name",),
+        "filter_list_in_vpnv4": ("router.aspath-list.name",),
+        "filter_list_in_vpnv6": ("router.aspath-list.name",),
+        "filter_list_out": ("router.aspath-list.name",),
+        "filter_list_out6": ("router.aspath-list.name",),
+        "filter_list_out_vpnv4": ("router.aspath-list.name",),
+        "filter_list_out_vpnv6": ("router.aspath-list.name",),
+        "interface": ("system.interface.name",),
+        "prefix_list_in": ("router.prefix-list.name",),
+        "prefix_list_in6": ("router.prefix-list6.name",),
+        "prefix_list_in_vpnv4": ("router.prefix-list.name",),
+        "prefix_list_in_vpnv6": ("router.prefix-list6.name",),
+        "prefix_list_out": ("router.prefix-list.name",),
+        "prefix_list_out6": ("router.prefix-list6.name",),
+        "prefix_list_out_vpnv4": ("router.prefix-list.name",),
+        "prefix_list_out_vpnv6": ("router.prefix-list6.name",),
+        "remote_as_filter": ("router.aspath-list.name",),
+        "route_map_in": ("router.route-map.name",),
+        "route_map_in6": ("router.route-map.name",),
+        "route_map_in_vpnv4": ("router.route-map.name",),
+        "route_map_in_vpnv6": ("router.route-map.name",),
+        "route_map_in_evpn": ("router.route-map.name",),
+        "route_map_out": ("router.route-map.name",),
+        "route_map_out_preferable": ("router.route-map.name",),
+        "route_map_out6": ("router.route-map.name",),
+        "route_map_out6_preferable": ("router.route-map.name",),
+        "route_map_out_vpnv4": ("router.route-map.name",),
+        "route_map_out_vpnv6": ("router.route-map.name",),
+        "route_map_out_vpnv4_preferable": ("router.route-map.name",),
+        "route_map_out_vpnv6_preferable": ("router.route-map.name",),
+        "route_map_out_evpn": ("router.route-map.name",),
+        "unsuppress_map": ("router.route-map.name",),
+        "unsuppress_map6": ("router.route-map.name",),
+        "update_source": ("system.interface.name",),
+        "auth_options": ("router.key-chain.name",),
+    }
+    
     name: str = Field(max_length=45, description="Neighbor group name.")    
     advertisement_interval: int | None = Field(ge=0, le=600, default=30, description="Minimum interval (sec) between sending updates.")    
     allowas_in_enable: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable IPv4 Enable to allow my AS in AS path.")    
@@ -651,6 +774,55 @@ class BgpNeighbor(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "default_originate_routemap": ("router.route-map.name",),
+        "default_originate_routemap6": ("router.route-map.name",),
+        "distribute_list_in": ("router.access-list.name",),
+        "distribute_list_in6": ("router.access-list6.name",),
+        "distribute_list_in_vpnv4": ("router.access-list.name",),
+        "distribute_list_in_vpnv6": ("router.access-list6.name",),
+        "distribute_list_out": ("router.access-list.name",),
+        "distribute_list_out6": ("router.access-list6.name",),
+        "distribute_list_out_vpnv4": ("router.access-list.name",),
+        "distribute_list_out_vpnv6": ("router.access-list6.name",),
+        "filter_list_in": ("router.aspath-list.name",),
+        "filter_list_in6": ("router.aspath-list.name",),
+        "filter_list_in_vpnv4": ("router.aspath-list.name",),
+        "filter_list_in_vpnv6": ("router.aspath-list.name",),
+        "filter_list_out": ("router.aspath-list.name",),
+        "filter_list_out6": ("router.aspath-list.name",),
+        "filter_list_out_vpnv4": ("router.aspath-list.name",),
+        "filter_list_out_vpnv6": ("router.aspath-list.name",),
+        "interface": ("system.interface.name",),
+        "prefix_list_in": ("router.prefix-list.name",),
+        "prefix_list_in6": ("router.prefix-list6.name",),
+        "prefix_list_in_vpnv4": ("router.prefix-list.name",),
+        "prefix_list_in_vpnv6": ("router.prefix-list6.name",),
+        "prefix_list_out": ("router.prefix-list.name",),
+        "prefix_list_out6": ("router.prefix-list6.name",),
+        "prefix_list_out_vpnv4": ("router.prefix-list.name",),
+        "prefix_list_out_vpnv6": ("router.prefix-list6.name",),
+        "route_map_in": ("router.route-map.name",),
+        "route_map_in6": ("router.route-map.name",),
+        "route_map_in_vpnv4": ("router.route-map.name",),
+        "route_map_in_vpnv6": ("router.route-map.name",),
+        "route_map_in_evpn": ("router.route-map.name",),
+        "route_map_out": ("router.route-map.name",),
+        "route_map_out_preferable": ("router.route-map.name",),
+        "route_map_out6": ("router.route-map.name",),
+        "route_map_out6_preferable": ("router.route-map.name",),
+        "route_map_out_vpnv4": ("router.route-map.name",),
+        "route_map_out_vpnv6": ("router.route-map.name",),
+        "route_map_out_vpnv4_preferable": ("router.route-map.name",),
+        "route_map_out_vpnv6_preferable": ("router.route-map.name",),
+        "route_map_out_evpn": ("router.route-map.name",),
+        "unsuppress_map": ("router.route-map.name",),
+        "unsuppress_map6": ("router.route-map.name",),
+        "update_source": ("system.interface.name",),
+        "auth_options": ("router.key-chain.name",),
+    }
+    
     ip: str = Field(max_length=45, description="IP/IPv6 address of neighbor.")    
     advertisement_interval: int | None = Field(ge=0, le=600, default=30, description="Minimum interval (sec) between sending updates.")    
     allowas_in_enable: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable IPv4 Enable to allow my AS in AS path.")    
@@ -874,6 +1046,11 @@ class BgpAdminDistance(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "route_list": ("router.access-list.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     neighbour_prefix: str = Field(default="0.0.0.0 0.0.0.0", description="Neighbor address prefix.")    
     route_list: str | None = Field(max_length=35, default=None, description="Access list of routes to apply new distance to.")  # datasource: ['router.access-list.name']    
@@ -913,6 +1090,11 @@ class BgpModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "dampening_route_map": ("router.route-map.name",),
+    }
+    
     as_: str = Field(serialization_alias="as", description="Router AS number, asplain/asdot/asdot+ format, 0 to disable BGP.")    
     router_id: str | None = Field(default=None, description="Router ID.")    
     keepalive_timer: int | None = Field(ge=0, le=65535, default=60, description="Frequency to send keep alive requests.")    
@@ -1720,8 +1902,9 @@ class BgpModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -1735,33 +1918,10 @@ class BgpModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_dampening_route_map_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_neighbor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_neighbor_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_neighbor_range_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_neighbor_range6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_network_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_network6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_admin_distance_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vrf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vrf6_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
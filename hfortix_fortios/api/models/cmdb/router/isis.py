@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -64,6 +64,11 @@ class IsisRedistribute6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "routemap": ("router.route-map.name",),
+    }
+    
     protocol: str = Field(max_length=35, description="Protocol name.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable redistribution.")    
     metric: int | None = Field(ge=0, le=4261412864, default=0, description="Metric.")    
@@ -83,6 +88,11 @@ class IsisRedistribute(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "routemap": ("router.route-map.name",),
+    }
+    
     protocol: str = Field(max_length=35, description="Protocol name.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     metric: int | None = Field(ge=0, le=4261412864, default=0, description="Metric.")    
@@ -117,6 +127,13 @@ class IsisIsisInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+        "auth_keychain_l1": ("router.key-chain.name",),
+        "auth_keychain_l2": ("router.key-chain.name",),
+    }
+    
     name: str | None = Field(max_length=15, default=None, description="IS-IS interface name.")  # datasource: ['system.interface.name']    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable interface for IS-IS.")    
     status6: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable IPv6 interface for IS-IS.")    
@@ -191,6 +208,16 @@ class IsisModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "auth_keychain_l1": ("router.key-chain.name",),
+        "auth_keychain_l2": ("router.key-chain.name",),
+        "redistribute_l1_list": ("router.access-list.name",),
+        "redistribute_l2_list": ("router.access-list.name",),
+        "redistribute6_l1_list": ("router.access-list6.name",),
+        "redistribute6_l2_list": ("router.access-list6.name",),
+    }
+    
     is_type: Literal["level-1-2", "level-1", "level-2-only"] | None = Field(default="level-1-2", description="IS type.")    
     adv_passive_only: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable IS-IS advertisement of passive interfaces only.")    
     adv_passive_only6: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable IPv6 IS-IS advertisement of passive interfaces only.")    
@@ -827,8 +854,9 @@ class IsisModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -842,27 +870,10 @@ class IsisModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_auth_keychain_l1_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_auth_keychain_l2_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute_l1_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute_l2_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute6_l1_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute6_l2_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_isis_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute6_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
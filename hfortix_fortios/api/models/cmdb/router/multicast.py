@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class MulticastPimSmGlobalRpAddress(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "group": ("router.access-list.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     ip_address: str = Field(default="0.0.0.0", description="RP router address.")    
     group: str | None = Field(max_length=35, default=None, description="Groups to use this RP.")  # datasource: ['router.access-list.name']
@@ -47,6 +52,11 @@ class MulticastPimSmGlobalVrfRpAddress(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "group": ("router.access-list.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     ip_address: str = Field(default="0.0.0.0", description="RP router address.")    
     group: str | None = Field(max_length=35, default=None, description="Groups to use this RP.")  # datasource: ['router.access-list.name']
@@ -63,6 +73,11 @@ class MulticastPimSmGlobalVrf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "bsr_interface": ("system.interface.name",),
+    }
+    
     vrf: int | None = Field(ge=1, le=511, default=0, description="VRF ID.")    
     bsr_candidate: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable allowing this router to become a bootstrap router (BSR).")    
     bsr_interface: str | None = Field(max_length=15, default=None, description="Interface to advertise as candidate BSR.")  # datasource: ['system.interface.name']    
@@ -84,6 +99,17 @@ class MulticastPimSmGlobal(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "accept_register_list": ("router.access-list.name",),
+        "accept_source_list": ("router.access-list.name",),
+        "bsr_interface": ("system.interface.name",),
+        "cisco_register_checksum_group": ("router.access-list.name",),
+        "register_source_interface": ("system.interface.name",),
+        "spt_threshold_group": ("router.access-list.name",),
+        "ssm_range": ("router.access-list.name",),
+    }
+    
     message_interval: int | None = Field(ge=1, le=65535, default=60, description="Period of time between sending periodic PIM join/prune messages in seconds (1 - 65535, default = 60).")    
     join_prune_holdtime: int | None = Field(ge=1, le=65535, default=210, description="Join/prune holdtime (1 - 65535, default = 210).")    
     accept_register_list: str | None = Field(max_length=35, default=None, description="Sources allowed to register packets with this Rendezvous Point (RP).")  # datasource: ['router.access-list.name']    
@@ -138,6 +164,12 @@ class MulticastInterfaceIgmp(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "access_group": ("router.access-list.name",),
+        "immediate_leave_group": ("router.access-list.name",),
+    }
+    
     access_group: str | None = Field(max_length=35, default=None, description="Groups IGMP hosts are allowed to join.")  # datasource: ['router.access-list.name']    
     version: Literal["3", "2", "1"] | None = Field(default="3", description="Maximum version of IGMP to support.")    
     immediate_leave_group: str | None = Field(max_length=35, default=None, description="Groups to drop membership for immediately after receiving IGMPv2 leave.")  # datasource: ['router.access-list.name']    
@@ -160,6 +192,16 @@ class MulticastInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+        "neighbour_filter": ("router.access-list.name",),
+        "rp_candidate_group": ("router.access-list.name",),
+        "multicast_flow": ("router.multicast-flow.name",),
+        "static_group": ("router.multicast-flow.name",),
+        "rpf_nbr_fail_back_filter": ("router.access-list.name",),
+    }
+    
     name: str | None = Field(max_length=15, default=None, description="Interface name.")  # datasource: ['system.interface.name']    
     ttl_threshold: int | None = Field(ge=1, le=255, default=1, description="Minimum TTL of multicast packets that will be forwarded (applied only to new multicast routes) (1 - 255, default = 1).")    
     pim_mode: Literal["sparse-mode", "dense-mode"] | None = Field(default="sparse-mode", description="PIM operation mode.")    
@@ -427,8 +469,9 @@ class MulticastModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -442,15 +485,10 @@ class MulticastModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_pim_sm_global_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_pim_sm_global_vrf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
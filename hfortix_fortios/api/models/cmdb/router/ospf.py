@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -57,6 +57,11 @@ class OspfRedistribute(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "routemap": ("router.route-map.name",),
+    }
+    
     name: str = Field(max_length=35, description="Redistribute name.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     metric: int | None = Field(ge=0, le=16777214, default=0, description="Redistribute metric setting.")    
@@ -76,6 +81,11 @@ class OspfPassiveInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=79, description="Passive interface name.")  # datasource: ['system.interface.name']
 class OspfOspfInterfaceMd5Keys(BaseModel):
     """
@@ -105,6 +115,12 @@ class OspfOspfInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+        "keychain": ("router.key-chain.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Interface entry name.")    
     comments: str | None = Field(max_length=255, default=None, description="Comment.")    
     interface: str = Field(max_length=15, description="Configuration interface name.")  # datasource: ['system.interface.name']    
@@ -177,6 +193,11 @@ class OspfDistributeList(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "access_list": ("router.access-list.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Distribute list entry ID.")    
     access_list: str = Field(max_length=35, description="Access list name.")  # datasource: ['router.access-list.name']    
     protocol: Literal["connected", "static", "rip"] = Field(default="connected", description="Protocol type.")
@@ -208,6 +229,11 @@ class OspfAreaVirtualLink(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "keychain": ("router.key-chain.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Virtual link entry name.")    
     authentication: Literal["none", "text", "message-digest"] | None = Field(default="none", description="Authentication type.")    
     authentication_key: Any = Field(max_length=8, default=None, description="Authentication key.")    
@@ -249,6 +275,11 @@ class OspfAreaFilterList(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "list_": ("router.access-list.name", "router.prefix-list.name"),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Filter list entry ID.")    
     list_: str = Field(max_length=35, serialization_alias="list", description="Access-list or prefix-list name.")  # datasource: ['router.access-list.name', 'router.prefix-list.name']    
     direction: Literal["in", "out"] = Field(default="out", description="Direction.")
@@ -315,6 +346,13 @@ class OspfModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "default_information_route_map": ("router.route-map.name",),
+        "distribute_list_in": ("router.access-list.name", "router.prefix-list.name"),
+        "distribute_route_map_in": ("router.route-map.name",),
+    }
+    
     abr_type: OspfAbrTypeEnum | None = Field(default=OspfAbrTypeEnum.STANDARD, description="Area border router type.")    
     auto_cost_ref_bandwidth: int | None = Field(ge=1, le=1000000, default=1000, description="Reference bandwidth in terms of megabits per second.")    
     distance_external: int | None = Field(ge=1, le=255, default=110, description="Administrative external distance.")    
@@ -811,8 +849,9 @@ class OspfModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -826,23 +865,10 @@ class OspfModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_default_information_route_map_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_distribute_list_in_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_distribute_route_map_in_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ospf_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_passive_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_distribute_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -122,6 +122,11 @@ class Ospf6Redistribute(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "routemap": ("router.route-map.name",),
+    }
+    
     name: str = Field(max_length=35, description="Redistribute name.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     metric: int | None = Field(ge=0, le=16777214, default=0, description="Redistribute metric setting.")    
@@ -140,6 +145,11 @@ class Ospf6PassiveInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=79, description="Passive interface name.")  # datasource: ['system.interface.name']
 class Ospf6Ospf6InterfaceNeighbor(BaseModel):
     """
@@ -187,6 +197,11 @@ class Ospf6Ospf6Interface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Interface entry name.")    
     area_id: str = Field(default="0.0.0.0", description="A.B.C.D, in IPv4 address format.")    
     interface: str = Field(max_length=15, description="Configuration interface name.")  # datasource: ['system.interface.name']    
@@ -336,6 +351,11 @@ class Ospf6Model(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "default_information_route_map": ("router.route-map.name",),
+    }
+    
     abr_type: Literal["cisco", "ibm", "standard"] | None = Field(default="standard", description="Area border router type.")    
     auto_cost_ref_bandwidth: int | None = Field(ge=1, le=1000000, default=1000, description="Reference bandwidth in terms of megabits per second.")    
     default_information_originate: Literal["enable", "always", "disable"] | None = Field(default="disable", description="Enable/disable generation of default route.")    
@@ -630,8 +650,9 @@ class Ospf6Model(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -645,17 +666,10 @@ class Ospf6Model(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_default_information_route_map_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ospf6_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_passive_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class PolicyUsers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.local.name",),
+    }
+    
     name: str = Field(max_length=79, description="User name.")  # datasource: ['user.local.name']
 class PolicySrcaddr(BaseModel):
     """
@@ -45,6 +50,11 @@ class PolicySrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Address/group name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class PolicySrc(BaseModel):
     """
@@ -73,6 +83,11 @@ class PolicyInternetServiceId(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "id_": ("firewall.internet-service.id",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Destination Internet Service ID.")  # datasource: ['firewall.internet-service.id']
 class PolicyInternetServiceFortiguard(BaseModel):
     """
@@ -87,6 +102,11 @@ class PolicyInternetServiceFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Destination Internet Service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class PolicyInternetServiceCustom(BaseModel):
     """
@@ -101,6 +121,11 @@ class PolicyInternetServiceCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Destination Internet Service name.")  # datasource: ['firewall.internet-service-custom.name']
 class PolicyInputDevice(BaseModel):
     """
@@ -115,6 +140,11 @@ class PolicyInputDevice(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name']
 class PolicyGroups(BaseModel):
     """
@@ -129,6 +159,11 @@ class PolicyGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Group name.")  # datasource: ['user.group.name']
 class PolicyDstaddr(BaseModel):
     """
@@ -143,6 +178,11 @@ class PolicyDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Address/group name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class PolicyDst(BaseModel):
     """
@@ -186,6 +226,11 @@ class PolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "output_device": ("system.interface.name",),
+    }
+    
     seq_num: int | None = Field(ge=1, le=65535, default=0, description="Sequence number(1-65535).")    
     input_device: list[PolicyInputDevice] = Field(default_factory=list, description="Incoming interface name.")    
     input_device_negate: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable negation of input device match.")    
@@ -781,8 +826,9 @@ class PolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -796,27 +842,10 @@ class PolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_input_device_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_output_device_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_id_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_custom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_fortiguard_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_users_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_groups_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
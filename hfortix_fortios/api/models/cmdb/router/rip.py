@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class RipRedistribute(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "routemap": ("router.route-map.name",),
+    }
+    
     name: str = Field(max_length=35, description="Redistribute name.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     metric: int | None = Field(ge=1, le=16, default=0, description="Redistribute metric setting.")    
@@ -48,6 +53,11 @@ class RipPassiveInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=79, description="Passive interface name.")  # datasource: ['system.interface.name']
 class RipOffsetList(BaseModel):
     """
@@ -62,6 +72,12 @@ class RipOffsetList(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "access_list": ("router.access-list.name",),
+        "interface": ("system.interface.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Offset-list ID.")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Status.")    
     direction: Literal["in", "out"] = Field(default="out", description="Offset list direction.")    
@@ -111,6 +127,12 @@ class RipInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+        "auth_keychain": ("router.key-chain.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Interface name.")  # datasource: ['system.interface.name']    
     auth_keychain: str | None = Field(max_length=35, default=None, description="Authentication key-chain name.")  # datasource: ['router.key-chain.name']    
     auth_mode: Literal["none", "text", "md5"] | None = Field(default="none", description="Authentication mode.")    
@@ -134,6 +156,12 @@ class RipDistributeList(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "listname": ("router.access-list.name", "router.prefix-list.name"),
+        "interface": ("system.interface.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Distribute list ID.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     direction: Literal["in", "out"] = Field(default="out", description="Distribute list direction.")    
@@ -152,6 +180,11 @@ class RipDistance(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "access_list": ("router.access-list.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Distance ID.")    
     prefix: Any = Field(default="0.0.0.0 0.0.0.0", description="Distance prefix.")    
     distance: int = Field(ge=1, le=255, default=0, description="Distance (1 - 255).")    
@@ -584,8 +617,9 @@ class RipModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -599,21 +633,10 @@ class RipModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_distance_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_distribute_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_offset_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_passive_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
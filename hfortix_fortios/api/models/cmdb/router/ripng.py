@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class RipngRedistribute(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "routemap": ("router.route-map.name",),
+    }
+    
     name: str = Field(max_length=35, description="Redistribute name.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     metric: int | None = Field(ge=1, le=16, default=0, description="Redistribute metric setting.")    
@@ -48,6 +53,11 @@ class RipngPassiveInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=79, description="Passive interface name.")  # datasource: ['system.interface.name']
 class RipngOffsetList(BaseModel):
     """
@@ -62,6 +72,12 @@ class RipngOffsetList(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "access_list6": ("router.access-list6.name",),
+        "interface": ("system.interface.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Offset-list ID.")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Status.")    
     direction: Literal["in", "out"] = Field(default="out", description="Offset list direction.")    
@@ -96,6 +112,11 @@ class RipngNeighbor(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Neighbor entry ID.")    
     ip6: str = Field(default="::", description="IPv6 link-local address.")    
     interface: str = Field(max_length=15, description="Interface name.")  # datasource: ['system.interface.name']
@@ -112,6 +133,11 @@ class RipngInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Interface name.")  # datasource: ['system.interface.name']    
     split_horizon_status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable split horizon.")    
     split_horizon: Literal["poisoned", "regular"] | None = Field(default="poisoned", description="Enable/disable split horizon.")    
@@ -129,6 +155,12 @@ class RipngDistributeList(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "listname": ("router.access-list6.name", "router.prefix-list6.name"),
+        "interface": ("system.interface.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Distribute list ID.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     direction: Literal["in", "out"] = Field(default="out", description="Distribute list direction.")    
@@ -147,6 +179,11 @@ class RipngDistance(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "access_list6": ("router.access-list6.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Distance ID.")    
     distance: int = Field(ge=1, le=255, default=0, description="Distance (1 - 255).")    
     prefix6: str | None = Field(default="::/0", description="Distance prefix6.")    
@@ -652,8 +689,9 @@ class RipngModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -667,23 +705,10 @@ class RipngModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_distance_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_distribute_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_neighbor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_offset_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_passive_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_redistribute_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -102,6 +102,19 @@ class RouteMapRule(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "match_as_path": ("router.aspath-list.name",),
+        "match_community": ("router.community-list.name",),
+        "match_extcommunity": ("router.extcommunity-list.name",),
+        "match_interface": ("system.interface.name",),
+        "match_ip_address": ("router.access-list.name", "router.prefix-list.name"),
+        "match_ip6_address": ("router.access-list6.name", "router.prefix-list6.name"),
+        "match_ip_nexthop": ("router.access-list.name", "router.prefix-list.name"),
+        "match_ip6_nexthop": ("router.access-list6.name", "router.prefix-list6.name"),
+        "set_community_delete": ("router.community-list.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Rule ID.")    
     action: Literal["permit", "deny"] | None = Field(default="permit", description="Action.")    
     match_as_path: str | None = Field(max_length=35, default=None, description="Match BGP AS path list.")  # datasource: ['router.aspath-list.name']    
@@ -277,8 +290,9 @@ class RouteMapModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -292,11 +306,10 @@ class RouteMapModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_rule_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
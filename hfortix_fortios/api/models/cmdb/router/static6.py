@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class Static6SdwanZone(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.sdwan.zone.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="SD-WAN zone name.")  # datasource: ['system.sdwan.zone.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -60,6 +65,12 @@ class Static6Model(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "device": ("system.interface.name",),
+        "dstaddr": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     seq_num: int | None = Field(ge=0, le=4294967295, default=0, description="Sequence number.")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable this static route.")    
     dst: str = Field(default="::/0", description="Destination IPv6 prefix.")    
@@ -303,8 +314,9 @@ class Static6Model(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -318,15 +330,10 @@ class Static6Model(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_device_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sdwan_zone_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dstaddr_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
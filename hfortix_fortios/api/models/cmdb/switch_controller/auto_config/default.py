@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,13 @@ class DefaultModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "fgt_policy": ("switch-controller.auto-config.policy.name",),
+        "isl_policy": ("switch-controller.auto-config.policy.name",),
+        "icl_policy": ("switch-controller.auto-config.policy.name",),
+    }
+    
     fgt_policy: str | None = Field(max_length=63, default="default", description="Default FortiLink auto-config policy.")  # datasource: ['switch-controller.auto-config.policy.name']    
     isl_policy: str | None = Field(max_length=63, default="default", description="Default ISL auto-config policy.")  # datasource: ['switch-controller.auto-config.policy.name']    
     icl_policy: str | None = Field(max_length=63, default="default-icl", description="Default ICL auto-config policy.")  # datasource: ['switch-controller.auto-config.policy.name']    
@@ -270,8 +277,9 @@ class DefaultModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -285,15 +293,10 @@ class DefaultModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_fgt_policy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_isl_policy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_icl_policy_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
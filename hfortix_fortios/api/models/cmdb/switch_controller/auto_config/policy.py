@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,12 @@ class PolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "qos_policy": ("switch-controller.qos.qos-policy.name",),
+        "storm_control_policy": ("switch-controller.storm-control-policy.name",),
+    }
+    
     name: str = Field(max_length=63, description="Auto-config policy name.")    
     qos_policy: str | None = Field(max_length=63, default="default", description="Auto-Config QoS policy.")  # datasource: ['switch-controller.qos.qos-policy.name']    
     storm_control_policy: str | None = Field(max_length=63, default="auto-config", description="Auto-Config storm control policy.")  # datasource: ['switch-controller.storm-control-policy.name']    
@@ -209,8 +215,9 @@ class PolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -224,13 +231,10 @@ class PolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_qos_policy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_storm_control_policy_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class DynamicPortPolicyPolicyInterfaceTags(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "tag_name": ("switch-controller.switch-interface-tag.name",),
+    }
+    
     tag_name: str | None = Field(max_length=63, default=None, description="FortiSwitch port tag name.")  # datasource: ['switch-controller.switch-interface-tag.name']
 class DynamicPortPolicyPolicy(BaseModel):
     """
@@ -45,6 +50,14 @@ class DynamicPortPolicyPolicy(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "lldp_profile": ("switch-controller.lldp-profile.name",),
+        "qos_policy": ("switch-controller.qos.qos-policy.name",),
+        "_802_1x": ("switch-controller.security-policy.802-1X.name", "switch-controller.security-policy.captive-portal.name"),
+        "vlan_policy": ("switch-controller.vlan-policy.name",),
+    }
+    
     name: str = Field(max_length=63, description="Policy name.")    
     description: str | None = Field(max_length=63, default=None, description="Description for the policy.")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable policy.")    
@@ -93,6 +106,11 @@ class DynamicPortPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "fortilink": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Dynamic port policy name.")    
     description: str | None = Field(max_length=63, default=None, description="Description for the Dynamic port policy.")    
     fortilink: str = Field(max_length=15, description="FortiLink interface for which this Dynamic port policy belongs to.")  # datasource: ['system.interface.name']    
@@ -256,8 +274,9 @@ class DynamicPortPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -271,13 +290,10 @@ class DynamicPortPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_fortilink_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_policy_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
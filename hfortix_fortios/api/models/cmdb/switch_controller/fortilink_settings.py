@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class FortilinkSettingsNacPortsNacSegmentVlans(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan_name": ("system.interface.name",),
+    }
+    
     vlan_name: str = Field(max_length=79, description="VLAN interface name.")  # datasource: ['system.interface.name']
 class FortilinkSettingsNacPorts(BaseModel):
     """
@@ -45,6 +50,12 @@ class FortilinkSettingsNacPorts(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "onboarding_vlan": ("system.interface.name",),
+        "nac_lan_interface": ("system.interface.name",),
+    }
+    
     onboarding_vlan: str = Field(max_length=15, description="Default NAC Onboarding VLAN when NAC devices are discovered.")  # datasource: ['system.interface.name']    
     lan_segment: Literal["enabled", "disabled"] | None = Field(default="disabled", description="Enable/disable LAN segment feature on the FortiLink interface.")    
     nac_lan_interface: str = Field(max_length=15, description="Configure NAC LAN interface.")  # datasource: ['system.interface.name']    
@@ -79,6 +90,11 @@ class FortilinkSettingsModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "fortilink": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="FortiLink settings name.")    
     fortilink: str | None = Field(max_length=15, default=None, description="FortiLink interface to which this fortilink-setting belongs.")  # datasource: ['system.interface.name']    
     inactive_timer: int | None = Field(ge=1, le=1440, default=15, description="Time interval(minutes) to be included in the inactive devices expiry calculation (mac age-out + inactive-time + periodic scan interval).")    
@@ -244,8 +260,9 @@ class FortilinkSettingsModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -259,13 +276,10 @@ class FortilinkSettingsModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_fortilink_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_nac_ports_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -46,6 +46,11 @@ class GlobalCustomCommand(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "command_name": ("switch-controller.custom-command.command-name",),
+    }
+    
     command_entry: str | None = Field(max_length=35, default=None, description="List of FortiSwitch commands.")    
     command_name: str = Field(max_length=35, description="Name of custom command to push to all FortiSwitches in VDOM.")  # datasource: ['switch-controller.custom-command.command-name']
 # ============================================================================
@@ -92,6 +97,11 @@ class GlobalModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "default_virtual_switch_vlan": ("system.interface.name",),
+    }
+    
     mac_aging_interval: int | None = Field(ge=10, le=1000000, default=300, description="Time after which an inactive MAC is aged out (10 - 1000000 sec, default = 300, 0 = disable).")    
     https_image_push: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable image push to FortiSwitch using HTTPS.")    
     vlan_all_mode: Literal["all", "defined"] | None = Field(default="defined", description="VLAN configuration mode, user-defined-vlans or all-possible-vlans.")    
@@ -278,8 +288,9 @@ class GlobalModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -293,13 +304,10 @@ class GlobalModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_default_virtual_switch_vlan_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_custom_command_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
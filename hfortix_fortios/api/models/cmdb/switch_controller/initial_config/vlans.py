@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,17 @@ class VlansModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "default_vlan": ("switch-controller.initial-config.template.name",),
+        "quarantine": ("switch-controller.initial-config.template.name",),
+        "rspan": ("switch-controller.initial-config.template.name",),
+        "voice": ("switch-controller.initial-config.template.name",),
+        "video": ("switch-controller.initial-config.template.name",),
+        "nac": ("switch-controller.initial-config.template.name",),
+        "nac_segment": ("switch-controller.initial-config.template.name",),
+    }
+    
     optional_vlans: Literal["enable", "disable"] | None = Field(default="enable", description="Auto-generate pre-configured VLANs upon switch discovery.")    
     default_vlan: str | None = Field(max_length=63, default="_default", description="Default VLAN (native) assigned to all switch ports upon discovery.")  # datasource: ['switch-controller.initial-config.template.name']    
     quarantine: str | None = Field(max_length=63, default="quarantine", description="VLAN for quarantined traffic.")  # datasource: ['switch-controller.initial-config.template.name']    
@@ -531,8 +542,9 @@ class VlansModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -546,23 +558,10 @@ class VlansModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_default_vlan_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_quarantine_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_rspan_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_voice_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_video_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_nac_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_nac_segment_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
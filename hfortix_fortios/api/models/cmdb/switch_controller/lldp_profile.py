@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class LldpProfileMedNetworkPolicy(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan_intf": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Policy type name.")    
     status: Literal["disable", "enable"] | None = Field(default="disable", description="Enable or disable this TLV.")    
     vlan_intf: str | None = Field(max_length=15, default=None, description="VLAN interface to advertise; if configured on port.")  # datasource: ['system.interface.name']    
@@ -51,6 +56,11 @@ class LldpProfileMedLocationService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "sys_location_id": ("switch-controller.location.name",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Location service type name.")    
     status: Literal["disable", "enable"] | None = Field(default="disable", description="Enable or disable this TLV.")    
     sys_location_id: str | None = Field(max_length=63, default=None, description="Location service ID.")  # datasource: ['switch-controller.location.name']
@@ -277,8 +287,9 @@ class LldpProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -292,13 +303,10 @@ class LldpProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_med_network_policy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_med_location_service_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
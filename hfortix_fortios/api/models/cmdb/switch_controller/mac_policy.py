@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,13 @@ class MacPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "fortilink": ("system.interface.name",),
+        "vlan": ("system.interface.name",),
+        "traffic_policy": ("switch-controller.traffic-policy.name",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="MAC policy name.")    
     description: str | None = Field(max_length=63, default=None, description="Description for the MAC policy.")    
     fortilink: str = Field(max_length=15, description="FortiLink interface for which this MAC policy belongs to.")  # datasource: ['system.interface.name']    
@@ -276,8 +283,9 @@ class MacPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -291,15 +299,10 @@ class MacPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_fortilink_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vlan_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_traffic_policy_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
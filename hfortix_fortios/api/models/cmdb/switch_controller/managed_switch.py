@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -243,6 +243,11 @@ class ManagedSwitchVlan(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan_name": ("system.interface.name",),
+    }
+    
     vlan_name: str | None = Field(max_length=15, default=None, description="VLAN name.")  # datasource: ['system.interface.name']    
     assignment_priority: int = Field(ge=1, le=255, default=128, description="802.1x Radius (Tunnel-Private-Group-Id) VLANID assign-by-name priority. A smaller value has a higher priority.")
 class ManagedSwitchSystemInterface(BaseModel):
@@ -258,6 +263,14 @@ class ManagedSwitchSystemInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "switch_id": ("switch-controller.managed-switch.switch-id",),
+        "vlan": ("system.interface.name",),
+        "interface": ("switch-controller.managed-switch.ports.port-name",),
+        "vrf": ("switch-controller.managed-switch.router-vrf.name",),
+    }
+    
     name: str | None = Field(max_length=15, default=None, description="Interface name.")    
     switch_id: str | None = Field(max_length=35, default=None, description="Switch ID.")  # datasource: ['switch-controller.managed-switch.switch-id']    
     mode: Literal["static", "dhcp"] | None = Field(default="static", description="Interface addressing mode.")    
@@ -315,6 +328,12 @@ class ManagedSwitchSystemDhcpServer(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "switch_id": ("switch-controller.managed-switch.switch-id",),
+        "interface": ("switch-controller.managed-switch.system-interface.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     switch_id: str | None = Field(max_length=35, default=None, description="Switch ID.")  # datasource: ['switch-controller.managed-switch.switch-id']    
     status: Literal["disable", "enable"] | None = Field(default="enable", description="Enable/disable this DHCP configuration.")    
@@ -416,6 +435,11 @@ class ManagedSwitchStaticMac(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan": ("system.interface.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     type_: Literal["static", "sticky"] | None = Field(default="static", serialization_alias="type", description="Type.")    
     vlan: str | None = Field(max_length=15, default=None, description="Vlan.")  # datasource: ['system.interface.name']    
@@ -533,6 +557,11 @@ class ManagedSwitchRouterVrf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "switch_id": ("switch-controller.managed-switch.switch-id",),
+    }
+    
     name: str = Field(max_length=35, description="VRF entry name.")    
     switch_id: str | None = Field(max_length=35, default=None, description="Switch ID.")  # datasource: ['switch-controller.managed-switch.switch-id']    
     vrfid: int = Field(ge=0, le=1023, default=0, description="VRF ID.")
@@ -549,6 +578,13 @@ class ManagedSwitchRouterStatic(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "switch_id": ("switch-controller.managed-switch.switch-id",),
+        "device": ("switch-controller.managed-switch.system-interface.name",),
+        "vrf": ("switch-controller.managed-switch.router-vrf.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Entry sequence number.")    
     switch_id: str | None = Field(max_length=35, default=None, description="Switch ID.")  # datasource: ['switch-controller.managed-switch.switch-id']    
     blackhole: Literal["disable", "enable"] | None = Field(default="disable", description="Enable/disable blackhole on this route.")    
@@ -573,6 +609,11 @@ class ManagedSwitchRouteOffloadRouter(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan_name": ("system.interface.name",),
+    }
+    
     vlan_name: str | None = Field(max_length=15, default=None, description="VLAN name.")  # datasource: ['system.interface.name']    
     router_ip: str = Field(default="0.0.0.0", description="Router IP address.")
 class ManagedSwitchRemoteLog(BaseModel):
@@ -608,6 +649,11 @@ class ManagedSwitchPortsUntaggedVlans(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan_name": ("system.interface.name",),
+    }
+    
     vlan_name: str = Field(max_length=79, description="VLAN name.")  # datasource: ['system.interface.name']
 class ManagedSwitchPortsMembers(BaseModel):
     """
@@ -636,6 +682,11 @@ class ManagedSwitchPortsInterfaceTags(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "tag_name": ("switch-controller.switch-interface-tag.name",),
+    }
+    
     tag_name: str | None = Field(max_length=63, default=None, description="FortiSwitch port tag name when exported to a virtual port pool or matched to dynamic port policy.")  # datasource: ['switch-controller.switch-interface-tag.name']
 class ManagedSwitchPortsFortiswitchAcls(BaseModel):
     """
@@ -664,6 +715,11 @@ class ManagedSwitchPortsDhcpSnoopOption82Override(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan_name": ("system.interface.name",),
+    }
+    
     vlan_name: str | None = Field(max_length=15, default=None, description="DHCP snooping option 82 VLAN.")  # datasource: ['system.interface.name']    
     circuit_id: str | None = Field(max_length=254, default=None, description="Circuit ID string.")    
     remote_id: str | None = Field(max_length=254, default=None, description="Remote ID string.")
@@ -680,6 +736,11 @@ class ManagedSwitchPortsAllowedVlans(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan_name": ("system.interface.name",),
+    }
+    
     vlan_name: str = Field(max_length=79, description="VLAN name.")  # datasource: ['system.interface.name']
 class ManagedSwitchPortsAclGroup(BaseModel):
     """
@@ -694,6 +755,11 @@ class ManagedSwitchPortsAclGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("switch-controller.acl.group.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="ACL group name.")  # datasource: ['switch-controller.acl.group.name']
 class ManagedSwitchPorts(BaseModel):
     """
@@ -708,6 +774,20 @@ class ManagedSwitchPorts(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ptp_policy": ("switch-controller.ptp.interface-policy.name",),
+        "vlan": ("system.interface.name",),
+        "port_policy": ("switch-controller.dynamic-port-policy.name",),
+        "qos_policy": ("switch-controller.qos.qos-policy.name",),
+        "storm_control_policy": ("switch-controller.storm-control-policy.name",),
+        "port_security_policy": ("switch-controller.security-policy.802-1X.name",),
+        "export_to_pool": ("switch-controller.virtual-port-pool.name",),
+        "lldp_profile": ("switch-controller.lldp-profile.name",),
+        "export_to": ("system.vdom.name",),
+        "qnq": ("system.interface.name",),
+    }
+    
     port_name: str = Field(max_length=15, description="Switch port name.")    
     port_owner: str | None = Field(max_length=15, default=None, description="Switch port name.")    
     switch_id: str | None = Field(max_length=35, default=None, description="Switch id.")    
@@ -901,6 +981,11 @@ class ManagedSwitchIgmpSnoopingVlans(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan_name": ("system.interface.name",),
+    }
+    
     vlan_name: str | None = Field(max_length=15, default="default", description="List of FortiSwitch VLANs.")  # datasource: ['system.interface.name']    
     proxy: Literal["disable", "enable", "global"] | None = Field(default="global", description="IGMP snooping proxy for the VLAN interface.")    
     querier: Literal["disable", "enable"] | None = Field(default="disable", description="Enable/disable IGMP snooping querier for the VLAN interface.")    
@@ -936,6 +1021,11 @@ class ManagedSwitchDhcpSnoopingStaticClient(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Client name.")    
     vlan: str = Field(max_length=15, description="VLAN name.")  # datasource: ['system.interface.name']    
     ip: str = Field(default="0.0.0.0", description="Client static IP address.")    
@@ -954,6 +1044,11 @@ class ManagedSwitchCustomCommand(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "command_name": ("switch-controller.custom-command.command-name",),
+    }
+    
     command_entry: str | None = Field(max_length=35, default=None, description="List of FortiSwitch commands.")    
     command_name: str = Field(max_length=35, description="Names of commands to be pushed to this FortiSwitch device, as configured under config switch-controller custom-command.")  # datasource: ['switch-controller.custom-command.command-name']
 class ManagedSwitch8021XSettings(BaseModel):
@@ -1020,6 +1115,14 @@ class ManagedSwitchModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "switch_profile": ("switch-controller.switch-profile.name",),
+        "access_profile": ("switch-controller.security-policy.local-access.name",),
+        "fsw_wan1_peer": ("system.interface.name",),
+        "ptp_profile": ("switch-controller.ptp.profile.name",),
+    }
+    
     switch_id: str = Field(max_length=35, description="Managed-switch name.")    
     sn: str = Field(max_length=16, description="Managed-switch serial number.")    
     description: str | None = Field(max_length=63, default=None, description="Description.")    
@@ -1961,8 +2064,9 @@ class ManagedSwitchModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -1976,37 +2080,10 @@ class ManagedSwitchModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_switch_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_access_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fsw_wan1_peer_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ptp_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_route_offload_router_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vlan_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ports_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_static_mac_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_custom_command_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dhcp_snooping_static_client_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_router_vrf_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_system_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_router_static_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_system_dhcp_server_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
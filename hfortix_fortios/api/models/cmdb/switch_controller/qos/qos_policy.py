@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,13 @@ class QosPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "trust_dot1p_map": ("switch-controller.qos.dot1p-map.name",),
+        "trust_ip_dscp_map": ("switch-controller.qos.ip-dscp-map.name",),
+        "queue_policy": ("switch-controller.qos.queue-policy.name",),
+    }
+    
     name: str = Field(max_length=63, description="QoS policy name.")    
     default_cos: int = Field(ge=0, le=7, default=0, description="Default cos queue for untagged packets.")    
     trust_dot1p_map: str | None = Field(max_length=63, default=None, description="QoS trust 802.1p map.")  # datasource: ['switch-controller.qos.dot1p-map.name']    
@@ -272,8 +279,9 @@ class QosPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -287,15 +295,10 @@ class QosPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_trust_dot1p_map_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_trust_ip_dscp_map_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_queue_policy_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class X8021xUserGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Group name.")  # datasource: ['user.group.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -60,6 +65,14 @@ class X8021xModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "guest_vlan_id": ("system.interface.name",),
+        "auth_fail_vlan_id": ("system.interface.name",),
+        "authserver_timeout_vlanid": ("system.interface.name",),
+        "authserver_timeout_tagged_vlanid": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=31, default=None, description="Policy name.")    
     security_mode: Literal["802.1X", "802.1X-mac-based"] | None = Field(default="802.1X", description="Port or MAC based 802.1X security mode.")    
     user_group: list[X8021xUserGroup] = Field(description="Name of user-group to assign to this MAC Authentication Bypass (MAB) policy.")    
@@ -434,8 +447,9 @@ class X8021xModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -449,19 +463,10 @@ class X8021xModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_user_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_guest_vlan_id_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_auth_fail_vlan_id_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_authserver_timeout_vlanid_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_authserver_timeout_tagged_vlanid_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class SwitchGroupMembers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "switch_id": ("switch-controller.managed-switch.switch-id",),
+    }
+    
     switch_id: str | None = Field(max_length=79, default=None, description="Managed device ID.")  # datasource: ['switch-controller.managed-switch.switch-id']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -60,6 +65,11 @@ class SwitchGroupModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "fortilink": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Switch group name.")    
     description: str | None = Field(max_length=63, default=None, description="Optional switch group description.")    
     fortilink: str | None = Field(max_length=15, default=None, description="FortiLink interface to which switch group members belong.")  # datasource: ['system.interface.name']    
@@ -223,8 +233,9 @@ class SwitchGroupModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -238,13 +249,10 @@ class SwitchGroupModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_fortilink_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_members_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -59,6 +59,11 @@ class TrafficSnifferTargetPort(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "switch_id": ("switch-controller.managed-switch.switch-id",),
+    }
+    
     switch_id: str = Field(max_length=35, description="Managed-switch ID.")  # datasource: ['switch-controller.managed-switch.switch-id']    
     description: str | None = Field(max_length=63, default=None, description="Description for the sniffer port entry.")    
     in_ports: list[TrafficSnifferTargetPortInPorts] = Field(default_factory=list, description="Configure source ingress port interfaces.")    
@@ -221,8 +226,9 @@ class TrafficSnifferModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -236,11 +242,10 @@ class TrafficSnifferModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_target_port_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
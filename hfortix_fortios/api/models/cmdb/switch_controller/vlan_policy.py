@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class VlanPolicyUntaggedVlans(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan_name": ("system.interface.name",),
+    }
+    
     vlan_name: str = Field(max_length=79, description="VLAN name.")  # datasource: ['system.interface.name']
 class VlanPolicyAllowedVlans(BaseModel):
     """
@@ -45,6 +50,11 @@ class VlanPolicyAllowedVlans(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vlan_name": ("system.interface.name",),
+    }
+    
     vlan_name: str = Field(max_length=79, description="VLAN name.")  # datasource: ['system.interface.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -74,6 +84,12 @@ class VlanPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "fortilink": ("system.interface.name",),
+        "vlan": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="VLAN policy name.")    
     description: str | None = Field(max_length=63, default=None, description="Description for the VLAN policy.")    
     fortilink: str = Field(max_length=15, description="FortiLink interface for which this VLAN policy belongs to.")  # datasource: ['system.interface.name']    
@@ -363,8 +379,9 @@ class VlanPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -378,17 +395,10 @@ class VlanPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_fortilink_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vlan_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_allowed_vlans_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_untagged_vlans_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
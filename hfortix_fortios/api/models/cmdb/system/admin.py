@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class AdminVdom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.vdom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Virtual domain name.")  # datasource: ['system.vdom.name']
 class AdminGuestUsergroups(BaseModel):
     """
@@ -83,6 +88,14 @@ class AdminModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "accprofile": ("system.accprofile.name",),
+        "ssh_certificate": ("certificate.remote.name",),
+        "sms_custom_server": ("system.sms-server.name",),
+        "guest_lang": ("system.custom-language.name",),
+    }
+    
     name: str | None = Field(max_length=64, default=None, description="User name.")    
     vdom: list[AdminVdom] = Field(default_factory=list, description="Virtual domain(s) that the administrator can access.")    
     remote_auth: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable authentication using a remote RADIUS, LDAP, or TACACS+ server.")    
@@ -487,8 +500,9 @@ class AdminModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -502,19 +516,10 @@ class AdminModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_vdom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_accprofile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssh_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sms_custom_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_guest_lang_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class ApiUserVdom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.vdom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Virtual domain name.")  # datasource: ['system.vdom.name']
 class ApiUserTrusthost(BaseModel):
     """
@@ -77,6 +82,11 @@ class ApiUserModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "accprofile": ("system.accprofile.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="User name.")    
     comments: str | None = Field(max_length=255, default=None, description="Comment.")    
     api_key: Any = Field(max_length=128, default=None, description="Admin user password.")    
@@ -246,8 +256,9 @@ class ApiUserModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -261,13 +272,10 @@ class ApiUserModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_accprofile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vdom_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class AutomationActionSdnConnector(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.sdn-connector.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="SDN connector name.")  # datasource: ['system.sdn-connector.name']
 class AutomationActionHttpHeaders(BaseModel):
     """
@@ -138,6 +143,13 @@ class AutomationActionModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "tls_certificate": ("certificate.local.name",),
+        "replacemsg_group": ("system.replacemsg-group.name",),
+        "accprofile": ("system.accprofile.name",),
+    }
+    
     name: str | None = Field(max_length=64, default=None, description="Name.")    
     description: str | None = Field(max_length=255, default=None, description="Description.")    
     action_type: AutomationActionActionTypeEnum | None = Field(default=AutomationActionActionTypeEnum.ALERT, description="Action type.")    
@@ -465,8 +477,9 @@ class AutomationActionModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -480,17 +493,10 @@ class AutomationActionModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_tls_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_replacemsg_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_accprofile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sdn_connector_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class AutomationStitchDestination(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.automation-destination.name",),
+    }
+    
     name: str = Field(max_length=79, description="Destination name.")  # datasource: ['system.automation-destination.name']
 class AutomationStitchCondition(BaseModel):
     """
@@ -45,6 +50,11 @@ class AutomationStitchCondition(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.automation-condition.name",),
+    }
+    
     name: str = Field(max_length=79, description="Condition name.")  # datasource: ['system.automation-condition.name']
 class AutomationStitchActions(BaseModel):
     """
@@ -59,6 +69,11 @@ class AutomationStitchActions(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "action": ("system.automation-action.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Entry ID.")    
     action: str = Field(max_length=64, description="Action name.")  # datasource: ['system.automation-action.name']    
     delay: int | None = Field(ge=0, le=3600, default=0, description="Delay before execution (in seconds).")    
@@ -91,6 +106,11 @@ class AutomationStitchModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "trigger": ("system.automation-trigger.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Name.")    
     description: str | None = Field(max_length=255, default=None, description="Description.")    
     status: Literal["enable", "disable"] = Field(default="enable", description="Enable/disable this stitch.")    
@@ -374,8 +394,9 @@ class AutomationStitchModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -389,17 +410,10 @@ class AutomationStitchModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_trigger_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_condition_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_actions_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_destination_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
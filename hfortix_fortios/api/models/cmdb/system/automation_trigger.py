@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class AutomationTriggerVdom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.vdom.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Virtual domain name.")  # datasource: ['system.vdom.name']
 class AutomationTriggerLogid(BaseModel):
     """
@@ -151,6 +156,11 @@ class AutomationTriggerModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "stitch_name": ("system.automation-stitch.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Name.")    
     description: str | None = Field(max_length=255, default=None, description="Description.")    
     trigger_type: Literal["event-based", "scheduled"] | None = Field(default="event-based", description="Trigger type.")    
@@ -332,8 +342,9 @@ class AutomationTriggerModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -347,13 +358,10 @@ class AutomationTriggerModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_vdom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_stitch_name_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -73,6 +73,15 @@ class CentralManagementModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "fortigate_cloud_sso_default_profile": ("system.accprofile.name",),
+        "local_cert": ("certificate.local.name",),
+        "ca_cert": ("certificate.ca.name",),
+        "vdom": ("system.vdom.name",),
+        "interface": ("system.interface.name",),
+    }
+    
     mode: Literal["normal", "backup"] | None = Field(default="normal", description="Central management mode.")    
     type_: Literal["fortimanager", "fortiguard", "none"] | None = Field(default="fortiguard", serialization_alias="type", description="Central management type.")    
     fortigate_cloud_sso_default_profile: str | None = Field(max_length=35, default=None, description="Override access profile. Permission is set to read-only without a FortiGate Cloud Central Management license.")  # datasource: ['system.accprofile.name']    
@@ -454,8 +463,9 @@ class CentralManagementModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -469,19 +479,10 @@ class CentralManagementModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_fortigate_cloud_sso_default_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_local_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ca_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vdom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -52,6 +52,11 @@ class CsfFabricConnectorVdom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.vdom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Virtual domain name.")  # datasource: ['system.vdom.name']
 class CsfFabricConnector(BaseModel):
     """
@@ -66,6 +71,11 @@ class CsfFabricConnector(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "accprofile": ("system.accprofile.name",),
+    }
+    
     serial: str | None = Field(max_length=19, default=None, description="Serial.")    
     accprofile: str | None = Field(max_length=35, default=None, description="Override access profile.")  # datasource: ['system.accprofile.name']    
     configuration_write_access: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable downstream device write access to configuration.")    
@@ -98,6 +108,13 @@ class CsfModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "upstream_interface": ("system.interface.name",),
+        "certificate": ("certificate.local.name",),
+        "downstream_accprofile": ("system.accprofile.name",),
+    }
+    
     status: Literal["enable", "disable"] = Field(default="disable", description="Enable/disable Security Fabric.")    
     uid: str | None = Field(max_length=35, default=None, description="Unique ID of the current CSF node")    
     upstream: str | None = Field(max_length=255, default=None, description="IP/FQDN of the FortiGate upstream from this FortiGate in the Security Fabric.")    
@@ -411,8 +428,9 @@ class CsfModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -426,17 +444,10 @@ class CsfModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_upstream_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_downstream_accprofile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fabric_connector_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class DdnsMonitorInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface_name": ("system.interface.name",),
+    }
+    
     interface_name: str = Field(max_length=79, description="Interface name.")  # datasource: ['system.interface.name']
 class DdnsDdnsServerAddr(BaseModel):
     """
@@ -89,6 +94,11 @@ class DdnsModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ssl_certificate": ("certificate.local.name",),
+    }
+    
     ddnsid: int | None = Field(ge=0, le=4294967295, default=0, description="DDNS ID.")    
     ddns_server: DdnsDdnsServerEnum = Field(description="Select a DDNS service provider.")    
     addr_type: Literal["ipv4", "ipv6"] | None = Field(default="ipv4", description="Address type of interface address in DDNS update.")    
@@ -268,8 +278,9 @@ class DdnsModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -283,13 +294,10 @@ class DdnsModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_ssl_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_monitor_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
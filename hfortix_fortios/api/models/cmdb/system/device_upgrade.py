@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -105,6 +105,11 @@ class DeviceUpgradeModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vdom": ("system.vdom.name",),
+    }
+    
     vdom: str | None = Field(max_length=31, default=None, description="Limit upgrade to this virtual domain (VDOM).")  # datasource: ['system.vdom.name']    
     status: DeviceUpgradeStatusEnum = Field(default=DeviceUpgradeStatusEnum.DISABLED, description="Current status of the upgrade.")    
     ha_reboot_controller: str | None = Field(max_length=79, default=None, description="Serial number of the FortiGate unit that will control the reboot process for the federated upgrade of the HA cluster.")    
@@ -222,8 +227,9 @@ class DeviceUpgradeModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -237,11 +243,10 @@ class DeviceUpgradeModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_vdom_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
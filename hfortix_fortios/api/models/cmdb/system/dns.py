@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -74,6 +74,13 @@ class DnsModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ssl_certificate": ("certificate.local.name",),
+        "source_ip_interface": ("system.interface.name",),
+        "interface": ("system.interface.name",),
+    }
+    
     primary: str = Field(default="0.0.0.0", description="Primary DNS server IP address.")    
     secondary: str | None = Field(default="0.0.0.0", description="Secondary DNS server IP address.")    
     protocol: list[Literal["cleartext", "dot", "doh"]] = Field(default_factory=list, description="DNS transport protocols.")    
@@ -331,8 +338,9 @@ class DnsModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -346,15 +354,10 @@ class DnsModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_ssl_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_source_ip_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
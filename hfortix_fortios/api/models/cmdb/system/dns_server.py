@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -46,6 +46,12 @@ class DnsServerModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+        "dnsfilter_profile": ("dnsfilter.profile.name",),
+    }
+    
     name: str | None = Field(max_length=15, default=None, description="DNS server name.")  # datasource: ['system.interface.name']    
     mode: DnsServerModeEnum | None = Field(default=DnsServerModeEnum.RECURSIVE, description="DNS server mode.")    
     dnsfilter_profile: str | None = Field(max_length=47, default=None, description="DNS filter profile.")  # datasource: ['dnsfilter.profile.name']    
@@ -217,8 +223,9 @@ class DnsServerModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -232,13 +239,10 @@ class DnsServerModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dnsfilter_profile_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
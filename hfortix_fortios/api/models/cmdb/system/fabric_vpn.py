@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,19 @@ class FabricVpnOverlays(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+        "bgp_neighbor": ("router.bgp.neighbor.ip",),
+        "overlay_policy": ("firewall.policy.policyid",),
+        "bgp_network": ("router.bgp.network.id",),
+        "route_policy": ("router.policy.seq-num",),
+        "bgp_neighbor_group": ("router.bgp.neighbor-group.name",),
+        "bgp_neighbor_range": ("router.bgp.neighbor-range.id",),
+        "ipsec_phase1": ("vpn.ipsec.phase1-interface.name",),
+        "sdwan_member": ("system.sdwan.members.seq-num",),
+    }
+    
     name: str = Field(max_length=79, description="Overlay name.")    
     ipsec_network_id: int | None = Field(ge=0, le=255, default=0, description="VPN gateway network ID.")    
     overlay_tunnel_block: Any = Field(default="0.0.0.0 0.0.0.0", description="IPv4 address and subnet mask for the overlay tunnel , syntax: X.X.X.X/24.")    
@@ -57,6 +70,13 @@ class FabricVpnAdvertisedSubnets(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "bgp_network": ("router.bgp.network.id",),
+        "firewall_address": ("firewall.address.name",),
+        "policies": ("firewall.policy.policyid",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967294, default=0, serialization_alias="id", description="ID.")    
     prefix: str = Field(default="0.0.0.0 0.0.0.0", description="Network prefix.")    
     access: Literal["inbound", "bidirectional"] = Field(default="inbound", description="Access policy direction.")    
@@ -91,6 +111,14 @@ class FabricVpnModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "loopback_interface": ("system.interface.name",),
+        "loopback_advertised_subnet": ("system.fabric-vpn.advertised-subnets.id",),
+        "sdwan_zone": ("system.sdwan.zone.name",),
+        "health_checks": ("system.sdwan.health-check.name",),
+    }
+    
     status: Literal["enable", "disable"] = Field(default="disable", description="Enable/disable Fabric VPN.")    
     sync_mode: Literal["enable", "disable"] = Field(default="enable", description="Setting synchronized by fabric or manual.")    
     branch_name: str | None = Field(max_length=35, default=None, description="Branch name.")    
@@ -514,8 +542,9 @@ class FabricVpnModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -529,21 +558,10 @@ class FabricVpnModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_overlays_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_advertised_subnets_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_loopback_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_loopback_advertised_subnet_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sdwan_zone_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_health_checks_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class GlobalInternetServiceDownloadList(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "id_": ("firewall.internet-service.id",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Internet Service ID.")  # datasource: ['firewall.internet-service.id']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -201,6 +206,18 @@ class GlobalModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "timezone": ("system.timezone.name",),
+        "management_vdom": ("system.vdom.name",),
+        "admin_forticloud_sso_default_profile": ("system.accprofile.name",),
+        "admin_server_cert": ("certificate.local.name",),
+        "wifi_certificate": ("certificate.local.name",),
+        "wifi_ca_certificate": ("certificate.ca.name",),
+        "auth_cert": ("certificate.local.name",),
+        "scim_server_cert": ("certificate.local.name",),
+    }
+    
     language: GlobalLanguageEnum | None = Field(default=GlobalLanguageEnum.ENGLISH, description="GUI display language.")    
     gui_ipv6: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable IPv6 settings on the GUI.")    
     gui_replacement_message_groups: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable replacement message groups on the GUI.")    
@@ -1060,8 +1077,9 @@ class GlobalModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -1075,27 +1093,10 @@ class GlobalModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_timezone_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_management_vdom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_admin_forticloud_sso_default_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_admin_server_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_wifi_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_wifi_ca_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_auth_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internet_service_download_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_scim_server_cert_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class HaVclusterVdom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.vdom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Virtual domain name.")  # datasource: ['system.vdom.name']
 class HaVcluster(BaseModel):
     """
@@ -46,6 +51,12 @@ class HaVcluster(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "monitor": ("system.interface.name",),
+        "pingserver_monitor_interface": ("system.interface.name",),
+    }
+    
     vcluster_id: int | None = Field(ge=1, le=30, default=1, description="ID.")    
     override: Literal["enable", "disable"] | None = Field(default="disable", description="Enable and increase the priority of the unit that should always be primary (master).")    
     priority: int | None = Field(ge=0, le=255, default=128, description="Increase the priority to select the primary unit (0 - 255).")    
@@ -98,6 +109,11 @@ class HaHaMgmtInterfaces(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Table ID.")    
     interface: str = Field(max_length=15, description="Interface to reserve for HA management.")  # datasource: ['system.interface.name']    
     dst: str | None = Field(default="0.0.0.0 0.0.0.0", description="Default route destination for reserved HA management interface.")    
@@ -117,6 +133,11 @@ class HaBackupHbdev(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Interface name.")  # datasource: ['system.interface.name']
 class HaAutoVirtualMacInterface(BaseModel):
     """
@@ -131,6 +152,11 @@ class HaAutoVirtualMacInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface_name": ("system.interface.name",),
+    }
+    
     interface_name: str = Field(max_length=15, description="Interface name.")  # datasource: ['system.interface.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -195,6 +221,13 @@ class HaModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "session_sync_dev": ("system.interface.name",),
+        "monitor": ("system.interface.name",),
+        "pingserver_monitor_interface": ("system.interface.name",),
+    }
+    
     group_id: int | None = Field(ge=0, le=1023, default=0, description="HA group ID  (0 - 1023;  or 0 - 7 when there are more than 2 vclusters). Must be the same for all members.")    
     group_name: str | None = Field(max_length=32, default=None, description="Cluster group name. Must be the same for all members.")    
     mode: Literal["standalone", "a-a", "a-p"] | None = Field(default="standalone", description="HA mode. Must be the same for all members. FGSP requires standalone.")    
@@ -737,8 +770,9 @@ class HaModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -752,23 +786,10 @@ class HaModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_auto_virtual_mac_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_backup_hbdev_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_session_sync_dev_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ha_mgmt_interfaces_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_monitor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_pingserver_monitor_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vcluster_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -124,6 +124,11 @@ class InterfaceTaggingTags(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.object-tagging.tags.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Tag name.")  # datasource: ['system.object-tagging.tags.name']
 class InterfaceTagging(BaseModel):
     """
@@ -138,6 +143,11 @@ class InterfaceTagging(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "category": ("system.object-tagging.category",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Tagging entry name.")    
     category: str | None = Field(max_length=63, default=None, description="Tag category.")  # datasource: ['system.object-tagging.category']    
     tags: list[InterfaceTaggingTags] = Field(default_factory=list, description="Tags.")
@@ -154,6 +164,11 @@ class InterfaceSecurityGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Names of user groups that can authenticate with the captive portal.")  # datasource: ['user.group.name']
 class InterfaceSecondaryip(BaseModel):
     """
@@ -218,6 +233,11 @@ class InterfaceMember(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface_name": ("system.interface.name",),
+    }
+    
     interface_name: str | None = Field(max_length=79, default=None, description="Physical interface name.")  # datasource: ['system.interface.name']
 class InterfaceIpv6Vrrp6(BaseModel):
     """
@@ -335,6 +355,11 @@ class InterfaceIpv6Ip6DelegatedPrefixList(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "upstream_interface": ("system.interface.name",),
+    }
+    
     prefix_id: int = Field(ge=0, le=4294967295, default=0, description="Prefix ID.")    
     upstream_interface: str = Field(max_length=15, description="Name of the interface that provides delegated information.")  # datasource: ['system.interface.name']    
     delegated_prefix_iaid: int = Field(ge=0, le=4294967295, default=0, description="IAID of obtained delegated-prefix from the upstream interface.")    
@@ -392,6 +417,12 @@ class InterfaceIpv6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "nd_cert": ("certificate.local.name",),
+        "ip6_upstream_interface": ("system.interface.name",),
+    }
+    
     ip6_mode: InterfaceIpv6Ip6ModeEnum | None = Field(default=InterfaceIpv6Ip6ModeEnum.STATIC, description="Addressing mode (static, DHCP, delegated).")    
     client_options: list[InterfaceIpv6ClientOptions] = Field(default_factory=list, description="DHCP6 client options.")    
     nd_mode: Literal["basic", "SEND-compatible"] | None = Field(default="basic", description="Neighbor discovery mode.")    
@@ -457,6 +488,11 @@ class InterfaceFailAlertInterfaces(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=15, description="Names of the non-virtual interface.")  # datasource: ['system.interface.name']
 class InterfaceDhcpSnoopingServerList(BaseModel):
     """
@@ -663,6 +699,23 @@ class InterfaceModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vdom": ("system.vdom.name",),
+        "dhcp_relay_interface": ("system.interface.name",),
+        "egress_shaping_profile": ("firewall.shaping-profile.profile-name",),
+        "ingress_shaping_profile": ("firewall.shaping-profile.profile-name",),
+        "interface": ("system.interface.name",),
+        "auth_cert": ("vpn.certificate.local.name",),
+        "ike_saml_server": ("user.saml.name",),
+        "lldp_network_policy": ("system.lldp.network-policy.name",),
+        "switch_controller_traffic_policy": ("switch-controller.traffic-policy.name",),
+        "switch_controller_nac": ("switch-controller.fortilink-settings.name",),
+        "switch_controller_dynamic": ("switch-controller.fortilink-settings.name",),
+        "eap_ca_cert": ("certificate.ca.name",),
+        "eap_user_cert": ("certificate.local.name",),
+    }
+    
     name: str | None = Field(max_length=15, default=None, description="Name.")    
     vdom: str = Field(max_length=31, description="Interface is in this virtual domain (VDOM).")  # datasource: ['system.vdom.name']    
     vrf: int | None = Field(ge=0, le=511, default=0, description="Virtual Routing Forwarding ID.")    
@@ -2044,8 +2097,9 @@ class InterfaceModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -2059,45 +2113,10 @@ class InterfaceModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_vdom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dhcp_relay_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fail_alert_interfaces_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_egress_shaping_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ingress_shaping_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_member_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_auth_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_security_groups_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ike_saml_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_lldp_network_policy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_switch_controller_traffic_policy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_switch_controller_nac_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_switch_controller_dynamic_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_tagging_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_eap_ca_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_eap_user_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ipv6_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
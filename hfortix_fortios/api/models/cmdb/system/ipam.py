@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -40,6 +40,11 @@ class IpamRulesPool(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.ipam.pools.name",),
+    }
+    
     name: str = Field(max_length=79, description="IPAM pool name.")  # datasource: ['system.ipam.pools.name']
 class IpamRulesInterface(BaseModel):
     """
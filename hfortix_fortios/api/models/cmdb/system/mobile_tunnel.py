@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class MobileTunnelNetwork(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Network entry ID.")    
     interface: str | None = Field(max_length=15, default=None, description="Select the associated interface name from available options.")  # datasource: ['system.interface.name']    
     prefix: str | None = Field(default="0.0.0.0 0.0.0.0", description="Class IP and Netmask with correction (Format:xxx.xxx.xxx.xxx xxx.xxx.xxx.xxx or xxx.xxx.xxx.xxx/x).")
@@ -62,6 +67,11 @@ class MobileTunnelModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "roaming_interface": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=15, default=None, description="Tunnel name.")    
     status: Literal["disable", "enable"] | None = Field(default="enable", description="Enable/disable this mobile tunnel.")    
     roaming_interface: str = Field(max_length=15, description="Select the associated interface name from available options.")  # datasource: ['system.interface.name']    
@@ -236,8 +246,9 @@ class MobileTunnelModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -251,13 +262,10 @@ class MobileTunnelModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_roaming_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_network_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -58,6 +58,11 @@ class PppoeInterfaceModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "device": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=15, default=None, description="Name of the PPPoE interface.")    
     dial_on_demand: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable dial on demand to dial the PPPoE interface when packets are routed to the PPPoE interface.")    
     ipv6: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable IPv6 Control Protocol (IPv6CP).")    
@@ -178,8 +183,9 @@ class PppoeInterfaceModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -193,11 +199,10 @@ class PppoeInterfaceModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_device_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -46,6 +46,11 @@ class SamlServiceProviders(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "sp_cert": ("certificate.remote.name",),
+    }
+    
     name: str = Field(max_length=35, description="Name.")    
     prefix: str = Field(max_length=35, description="Prefix.")    
     sp_binding_protocol: Literal["post", "redirect"] | None = Field(default="post", description="SP binding protocol.")    
@@ -86,6 +91,13 @@ class SamlModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "default_profile": ("system.accprofile.name",),
+        "cert": ("certificate.local.name",),
+        "idp_cert": ("certificate.remote.name",),
+    }
+    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable SAML authentication (default = disable).")    
     role: Literal["identity-provider", "service-provider"] | None = Field(default="service-provider", description="SAML role.")    
     default_login_page: Literal["normal", "sso"] = Field(default="normal", description="Choose default login page.")    
@@ -392,8 +404,9 @@ class SamlModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -407,17 +420,10 @@ class SamlModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_default_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_idp_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_service_providers_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
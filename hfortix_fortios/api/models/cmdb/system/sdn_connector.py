@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -296,6 +296,15 @@ class SdnConnectorModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "proxy": ("system.sdn-proxy.name",),
+        "vdom": ("system.vdom.name",),
+        "oci_cert": ("certificate.local.name",),
+        "server_cert": ("certificate.remote.name",),
+        "server_ca_cert": ("certificate.remote.name", "certificate.ca.name"),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="SDN connector name.")    
     status: Literal["disable", "enable"] = Field(default="enable", description="Enable/disable connection to the remote SDN connector.")    
     type_: SdnConnectorTypeEnum = Field(default=SdnConnectorTypeEnum.AWS, serialization_alias="type", description="Type of SDN connector.")    
@@ -710,8 +719,9 @@ class SdnConnectorModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -725,19 +735,10 @@ class SdnConnectorModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_proxy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vdom_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_oci_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_server_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_server_ca_cert_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,13 @@ class SdnVpnModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "sdn": ("system.sdn-connector.name",),
+        "tunnel_interface": ("system.interface.name",),
+        "internal_interface": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Public cloud VPN name.")    
     sdn: str = Field(max_length=35, description="SDN connector name.")  # datasource: ['system.sdn-connector.name']    
     remote_type: Literal["vgw", "tgw"] = Field(default="vgw", description="Type of remote device.")    
@@ -286,8 +293,9 @@ class SdnVpnModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -301,15 +309,10 @@ class SdnVpnModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_sdn_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_tunnel_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_internal_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
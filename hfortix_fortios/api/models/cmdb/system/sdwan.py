@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -102,6 +102,11 @@ class SdwanZone(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "advpn_health_check": ("system.sdwan.health-check.name",),
+    }
+    
     name: str = Field(max_length=35, description="Zone name.")    
     advpn_select: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable selection of ADVPN based on SDWAN information.")    
     advpn_health_check: str | None = Field(max_length=35, default=None, description="Health check for ADVPN local overlay link quality.")  # datasource: ['system.sdwan.health-check.name']    
@@ -120,6 +125,11 @@ class SdwanServiceUsers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.local.name",),
+    }
+    
     name: str = Field(max_length=79, description="User name.")  # datasource: ['user.local.name']
 class SdwanServiceSrc6(BaseModel):
     """
@@ -134,6 +144,11 @@ class SdwanServiceSrc6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address6 or address6 group name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class SdwanServiceSrc(BaseModel):
     """
@@ -148,6 +163,11 @@ class SdwanServiceSrc(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address or address group name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class SdwanServiceSla(BaseModel):
     """
@@ -162,6 +182,11 @@ class SdwanServiceSla(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "health_check": ("system.sdwan.health-check.name",),
+    }
+    
     health_check: str = Field(max_length=35, description="SD-WAN health-check.")  # datasource: ['system.sdwan.health-check.name']    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="SLA ID.")
 class SdwanServicePriorityZone(BaseModel):
@@ -177,6 +202,11 @@ class SdwanServicePriorityZone(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.sdwan.zone.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Priority zone name.")  # datasource: ['system.sdwan.zone.name']
 class SdwanServicePriorityMembers(BaseModel):
     """
@@ -191,6 +221,11 @@ class SdwanServicePriorityMembers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "seq_num": ("system.sdwan.members.seq-num",),
+    }
+    
     seq_num: int | None = Field(ge=0, le=4294967295, default=0, description="Member sequence number.")  # datasource: ['system.sdwan.members.seq-num']
 class SdwanServiceInternetServiceName(BaseModel):
     """
@@ -205,6 +240,11 @@ class SdwanServiceInternetServiceName(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-name.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet service name.")  # datasource: ['firewall.internet-service-name.name']
 class SdwanServiceInternetServiceGroup(BaseModel):
     """
@@ -219,6 +259,11 @@ class SdwanServiceInternetServiceGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Internet Service group name.")  # datasource: ['firewall.internet-service-group.name']
 class SdwanServiceInternetServiceFortiguard(BaseModel):
     """
@@ -233,6 +278,11 @@ class SdwanServiceInternetServiceFortiguard(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-fortiguard.name",),
+    }
+    
     name: str = Field(max_length=79, description="FortiGuard Internet service name.")  # datasource: ['firewall.internet-service-fortiguard.name']
 class SdwanServiceInternetServiceCustomGroup(BaseModel):
     """
@@ -247,6 +297,11 @@ class SdwanServiceInternetServiceCustomGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet Service group name.")  # datasource: ['firewall.internet-service-custom-group.name']
 class SdwanServiceInternetServiceCustom(BaseModel):
     """
@@ -261,6 +316,11 @@ class SdwanServiceInternetServiceCustom(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.internet-service-custom.name",),
+    }
+    
     name: str = Field(max_length=79, description="Custom Internet service name.")  # datasource: ['firewall.internet-service-custom.name']
 class SdwanServiceInternetServiceAppCtrlGroup(BaseModel):
     """
@@ -275,6 +335,11 @@ class SdwanServiceInternetServiceAppCtrlGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("application.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Application control based Internet Service group name.")  # datasource: ['application.group.name']
 class SdwanServiceInternetServiceAppCtrlCategory(BaseModel):
     """
@@ -317,6 +382,11 @@ class SdwanServiceInputZone(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.sdwan.zone.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Zone.")  # datasource: ['system.sdwan.zone.name']
 class SdwanServiceInputDevice(BaseModel):
     """
@@ -331,6 +401,11 @@ class SdwanServiceInputDevice(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=79, description="Interface name.")  # datasource: ['system.interface.name']
 class SdwanServiceHealthCheck(BaseModel):
     """
@@ -345,6 +420,11 @@ class SdwanServiceHealthCheck(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.sdwan.health-check.name",),
+    }
+    
     name: str = Field(max_length=79, description="Health check name.")  # datasource: ['system.sdwan.health-check.name']
 class SdwanServiceGroups(BaseModel):
     """
@@ -359,6 +439,11 @@ class SdwanServiceGroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Group name.")  # datasource: ['user.group.name']
 class SdwanServiceDst6(BaseModel):
     """
@@ -373,6 +458,11 @@ class SdwanServiceDst6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address6 or address6 group name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class SdwanServiceDst(BaseModel):
     """
@@ -387,6 +477,11 @@ class SdwanServiceDst(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address or address group name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class SdwanService(BaseModel):
     """
@@ -480,6 +575,11 @@ class SdwanNeighborMember(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "seq_num": ("system.sdwan.members.seq-num",),
+    }
+    
     seq_num: int | None = Field(ge=0, le=4294967295, default=0, description="Member sequence number.")  # datasource: ['system.sdwan.members.seq-num']
 class SdwanNeighbor(BaseModel):
     """
@@ -494,6 +594,13 @@ class SdwanNeighbor(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ip": ("router.bgp.neighbor-group.name", "router.bgp.neighbor.ip"),
+        "service_id": ("system.sdwan.service.id",),
+        "health_check": ("system.sdwan.health-check.name",),
+    }
+    
     ip: str = Field(max_length=45, description="IP/IPv6 address of neighbor or neighbor-group name.")  # datasource: ['router.bgp.neighbor-group.name', 'router.bgp.neighbor.ip']    
     member: list[SdwanNeighborMember] = Field(default_factory=list, description="Member sequence number list.")    
     service_id: int | None = Field(ge=0, le=4294967295, default=0, description="SD-WAN service ID to work with the neighbor.")  # datasource: ['system.sdwan.service.id']    
@@ -516,6 +623,12 @@ class SdwanMembers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+        "zone": ("system.sdwan.zone.name",),
+    }
+    
     seq_num: int | None = Field(ge=0, le=512, default=0, description="Sequence number(1-512).")    
     interface: str | None = Field(max_length=15, default=None, description="Interface name.")  # datasource: ['system.interface.name']    
     zone: str | None = Field(max_length=35, default="virtual-wan-link", description="Zone name.")  # datasource: ['system.sdwan.zone.name']    
@@ -571,6 +684,11 @@ class SdwanHealthCheckMembers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "seq_num": ("system.sdwan.members.seq-num",),
+    }
+    
     seq_num: int = Field(ge=0, le=4294967295, default=0, description="Member sequence number.")  # datasource: ['system.sdwan.members.seq-num']
 class SdwanHealthCheck(BaseModel):
     """
@@ -585,6 +703,12 @@ class SdwanHealthCheck(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "fortiguard_name": ("system.health-check-fortiguard.name",),
+        "class_id": ("firewall.traffic-class.class-id",),
+    }
+    
     name: str = Field(max_length=35, description="Status check or health check name.")    
     fortiguard: Literal["disable", "enable"] | None = Field(default="disable", description="Enable/disable use of FortiGuard predefined server.")    
     fortiguard_name: str | None = Field(max_length=35, default=None, description="Predefined health-check target name.")  # datasource: ['system.health-check-fortiguard.name']    
@@ -653,6 +777,11 @@ class SdwanFailAlertInterfaces(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=79, description="Physical interface name.")  # datasource: ['system.interface.name']
 class SdwanDuplicationSrcintf(BaseModel):
     """
@@ -667,6 +796,11 @@ class SdwanDuplicationSrcintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str = Field(max_length=79, description="Interface, zone or SDWAN zone name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class SdwanDuplicationSrcaddr6(BaseModel):
     """
@@ -681,6 +815,11 @@ class SdwanDuplicationSrcaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address6 or address6 group name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class SdwanDuplicationSrcaddr(BaseModel):
     """
@@ -695,6 +834,11 @@ class SdwanDuplicationSrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address or address group name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class SdwanDuplicationServiceId(BaseModel):
     """
@@ -709,6 +853,11 @@ class SdwanDuplicationServiceId(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "id_": ("system.sdwan.service.id",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="SD-WAN service rule ID.")  # datasource: ['system.sdwan.service.id']
 class SdwanDuplicationService(BaseModel):
     """
@@ -723,6 +872,11 @@ class SdwanDuplicationService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str = Field(max_length=79, description="Service and service group name.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class SdwanDuplicationDstintf(BaseModel):
     """
@@ -737,6 +891,11 @@ class SdwanDuplicationDstintf(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name", "system.zone.name", "system.sdwan.zone.name"),
+    }
+    
     name: str = Field(max_length=79, description="Interface, zone or SDWAN zone name.")  # datasource: ['system.interface.name', 'system.zone.name', 'system.sdwan.zone.name']
 class SdwanDuplicationDstaddr6(BaseModel):
     """
@@ -751,6 +910,11 @@ class SdwanDuplicationDstaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address6 or address6 group name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class SdwanDuplicationDstaddr(BaseModel):
     """
@@ -765,6 +929,11 @@ class SdwanDuplicationDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address or address group name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class SdwanDuplication(BaseModel):
     """
@@ -1171,8 +1340,9 @@ class SdwanModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -1186,19 +1356,10 @@ class SdwanModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_fail_alert_interfaces_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_zone_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_members_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_health_check_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_neighbor_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -75,6 +75,12 @@ class SettingsModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "device": ("system.interface.name",),
+        "dhcp_proxy_interface": ("system.interface.name",),
+    }
+    
     comments: str | None = Field(max_length=255, default=None, description="VDOM comments.")    
     vdom_type: Literal["traffic", "lan-extension", "admin"] = Field(default="traffic", description="Vdom type (traffic, lan-extension or admin).")    
     lan_extension_controller_addr: str | None = Field(max_length=255, default=None, description="Controller IP address or FQDN to connect.")    
@@ -382,8 +388,9 @@ class SettingsModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -397,13 +404,10 @@ class SettingsModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_device_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dhcp_proxy_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
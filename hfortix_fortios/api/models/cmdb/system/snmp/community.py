@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class CommunityVdoms(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.vdom.name",),
+    }
+    
     name: str = Field(max_length=79, description="VDOM name.")  # datasource: ['system.vdom.name']
 class CommunityHosts6(BaseModel):
     """
@@ -46,6 +51,11 @@ class CommunityHosts6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Host6 entry ID.")    
     source_ipv6: str | None = Field(default="::", description="Source IPv6 address for SNMP traps.")    
     ipv6: str = Field(default="::/0", description="SNMP manager IPv6 address prefix.")    
@@ -67,6 +77,11 @@ class CommunityHosts(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Host entry ID.")    
     source_ip: str | None = Field(default="0.0.0.0", description="Source IPv4 address for SNMP traps.")    
     ip: str = Field(description="IPv4 address of the SNMP manager (host).")    
@@ -149,6 +164,11 @@ class CommunityModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "mib_view": ("system.snmp.mib-view.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Community ID.")    
     name: str = Field(max_length=35, description="Community name.")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable this SNMP community.")    
@@ -442,8 +462,9 @@ class CommunityModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -457,17 +478,10 @@ class CommunityModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_hosts_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_hosts6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_mib_view_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vdoms_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
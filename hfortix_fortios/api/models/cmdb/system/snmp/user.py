@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class UserVdoms(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.vdom.name",),
+    }
+    
     name: str = Field(max_length=79, description="VDOM name.")  # datasource: ['system.vdom.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -123,6 +128,12 @@ class UserModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "mib_view": ("system.snmp.mib-view.name",),
+        "interface": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=32, description="SNMP user name.")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable this SNMP user.")    
     trap_status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable traps for this SNMP user.")    
@@ -369,8 +380,9 @@ class UserModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -384,15 +396,10 @@ class UserModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_mib_view_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vdoms_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class SpeedTestScheduleSchedules(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.schedule.recurring.name",),
+    }
+    
     name: str = Field(max_length=31, description="Name of a firewall recurring schedule.")  # datasource: ['firewall.schedule.recurring.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -68,6 +73,12 @@ class SpeedTestScheduleModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+        "server_name": ("system.speed-test-server.name",),
+    }
+    
     interface: str | None = Field(max_length=35, default=None, description="Interface name.")  # datasource: ['system.interface.name']    
     status: Literal["disable", "enable"] | None = Field(default="enable", description="Enable/disable scheduled speed test.")    
     diffserv: str | None = Field(default=None, description="DSCP used for speed test.")    
@@ -314,8 +325,9 @@ class SpeedTestScheduleModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -329,15 +341,10 @@ class SpeedTestScheduleModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_server_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_schedules_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
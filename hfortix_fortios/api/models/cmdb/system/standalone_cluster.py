@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class StandaloneClusterPingsvrMonitorInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=79, description="Interface name.")  # datasource: ['system.interface.name']
 class StandaloneClusterMonitorPrefix(BaseModel):
     """
@@ -45,6 +50,11 @@ class StandaloneClusterMonitorPrefix(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vdom": ("system.vdom.name",),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     vdom: str = Field(max_length=31, description="VDOM name.")  # datasource: ['system.vdom.name']    
     vrf: int | None = Field(ge=0, le=511, default=0, description="VRF ID.")    
@@ -62,6 +72,11 @@ class StandaloneClusterMonitorInterface(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=79, description="Interface name.")  # datasource: ['system.interface.name']
 class StandaloneClusterClusterPeerSyncvd(BaseModel):
     """
@@ -76,6 +91,11 @@ class StandaloneClusterClusterPeerSyncvd(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.vdom.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="VDOM name.")  # datasource: ['system.vdom.name']
 class StandaloneClusterClusterPeerSessionSyncFilterCustomService(BaseModel):
     """
@@ -106,6 +126,12 @@ class StandaloneClusterClusterPeerSessionSyncFilter(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "srcintf": ("system.interface.name",),
+        "dstintf": ("system.interface.name",),
+    }
+    
     srcintf: str | None = Field(max_length=15, default=None, description="Only sessions from this interface are synchronized.")  # datasource: ['system.interface.name']    
     dstintf: str | None = Field(max_length=15, default=None, description="Only sessions to this interface are synchronized.")  # datasource: ['system.interface.name']    
     srcaddr: Any = Field(default="0.0.0.0 0.0.0.0", description="Only sessions from this IPv4 address are synchronized.")    
@@ -126,6 +152,11 @@ class StandaloneClusterClusterPeerDownIntfsBeforeSessSync(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=79, description="Interface name.")  # datasource: ['system.interface.name']
 class StandaloneClusterClusterPeer(BaseModel):
     """
@@ -140,6 +171,11 @@ class StandaloneClusterClusterPeer(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "peervd": ("system.vdom.name",),
+    }
+    
     sync_id: int | None = Field(ge=0, le=4294967295, default=0, description="Sync ID.")    
     peervd: str | None = Field(max_length=31, default="root", description="VDOM that contains the session synchronization link interface on the peer unit. Usually both peers would have the same peervd.")  # datasource: ['system.vdom.name']    
     peerip: str | None = Field(default="0.0.0.0", description="IP address of the interface on the peer unit that is used for the session synchronization link.")    
@@ -178,6 +214,11 @@ class StandaloneClusterModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "session_sync_dev": ("system.interface.name",),
+    }
+    
     standalone_group_id: int | None = Field(ge=0, le=255, default=0, description="Cluster group ID (0 - 255). Must be the same for all members.")    
     group_member_id: int | None = Field(ge=0, le=15, default=0, description="Cluster member ID (0 - 15).")    
     layer2_connection: Literal["available", "unavailable"] | None = Field(default="unavailable", description="Indicate whether layer 2 connections are present among FGSP members.")    
@@ -524,8 +565,9 @@ class StandaloneClusterModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -539,19 +581,10 @@ class StandaloneClusterModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_session_sync_dev_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_cluster_peer_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_monitor_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_pingsvr_monitor_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_monitor_prefix_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,12 @@ class VdomRadiusServerModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("system.vdom.name",),
+        "radius_server_vdom": ("system.vdom.name",),
+    }
+    
     name: str | None = Field(max_length=31, default=None, description="Name of the VDOM that you are adding the RADIUS server to.")  # datasource: ['system.vdom.name']    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable the RSSO RADIUS server for this VDOM.")    
     radius_server_vdom: str = Field(max_length=31, description="Use this option to select another VDOM containing a VDOM RSSO RADIUS server to use for the current VDOM.")  # datasource: ['system.vdom.name']    
@@ -206,8 +212,9 @@ class VdomRadiusServerModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -221,13 +228,10 @@ class VdomRadiusServerModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_radius_server_vdom_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,14 @@ class FssoModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ldap_server": ("user.ldap.name",),
+        "user_info_server": ("user.ldap.name",),
+        "ssl_trusted_cert": ("vpn.certificate.remote.name", "vpn.certificate.ca.name"),
+        "interface": ("system.interface.name",),
+    }
+    
     name: str = Field(max_length=35, description="Name.")    
     type_: Literal["default", "fortinac"] | None = Field(default="default", serialization_alias="type", description="Server type.")    
     server: str = Field(max_length=63, description="Domain name or IP address of the first FSSO collector agent.")    
@@ -366,8 +374,9 @@ class FssoModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -381,17 +390,10 @@ class FssoModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_ldap_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_user_info_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_trusted_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
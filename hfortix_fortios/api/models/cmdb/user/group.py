@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class GroupMember(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.peer.name", "user.local.name", "user.radius.name", "user.tacacs+.name", "user.ldap.name", "user.saml.name", "user.external-identity-provider.name", "user.adgrp.name", "user.pop3.name", "user.certificate.name"),
+    }
+    
     name: str = Field(max_length=511, description="Group member name.")  # datasource: ['user.peer.name', 'user.local.name', 'user.radius.name', 'user.tacacs+.name', 'user.ldap.name', 'user.saml.name', 'user.external-identity-provider.name', 'user.adgrp.name', 'user.pop3.name', 'user.certificate.name']
 class GroupMatch(BaseModel):
     """
@@ -46,6 +51,11 @@ class GroupMatch(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "server_name": ("user.radius.name", "user.ldap.name", "user.tacacs+.name", "user.saml.name", "user.external-identity-provider.name"),
+    }
+    
     id_: int = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID.")    
     server_name: str = Field(max_length=35, description="Name of remote auth server.")  # datasource: ['user.radius.name', 'user.ldap.name', 'user.tacacs+.name', 'user.saml.name', 'user.external-identity-provider.name']    
     group_name: str = Field(max_length=511, description="Name of matching user or group on remote authentication server or SCIM.")
@@ -107,6 +117,11 @@ class GroupModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "sms_custom_server": ("system.sms-server.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Group name.")    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Group ID.")    
     group_type: GroupGroupTypeEnum | None = Field(default=GroupGroupTypeEnum.FIREWALL, description="Set the group to be for firewall authentication, FSSO, RSSO, or guest users.")    
@@ -374,8 +389,9 @@ class GroupModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -389,15 +405,10 @@ class GroupModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_member_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_match_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sms_custom_server_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -55,6 +55,15 @@ class LdapModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "source_ip_interface": ("system.interface.name",),
+        "ca_cert": ("vpn.certificate.ca.name",),
+        "client_cert": ("vpn.certificate.local.name",),
+        "user_info_exchange_server": ("user.exchange.name",),
+        "interface": ("system.interface.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="LDAP server entry name.")    
     server: str = Field(max_length=63, description="LDAP server CN domain name or IP.")    
     secondary_server: str | None = Field(max_length=63, default=None, description="Secondary LDAP server CN domain name or IP.")    
@@ -454,8 +463,9 @@ class LdapModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -469,19 +479,10 @@ class LdapModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_source_ip_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ca_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_client_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_user_info_exchange_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
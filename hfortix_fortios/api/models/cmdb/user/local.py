@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -55,6 +55,18 @@ class LocalModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ldap_server": ("user.ldap.name",),
+        "radius_server": ("user.radius.name",),
+        "tacacs_server": ("user.tacacs+.name",),
+        "saml_server": ("user.saml.name",),
+        "fortitoken": ("user.fortitoken.serial-number",),
+        "sms_custom_server": ("system.sms-server.name",),
+        "passwd_policy": ("user.password-policy.name",),
+        "qkd_profile": ("vpn.qkd.name",),
+    }
+    
     name: str | None = Field(max_length=64, default=None, description="Local user name.")    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="User ID.")    
     status: Literal["enable", "disable"] = Field(default="enable", description="Enable/disable allowing the local user to authenticate with the FortiGate unit.")    
@@ -631,8 +643,9 @@ class LocalModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -646,25 +659,10 @@ class LocalModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_ldap_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_radius_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_tacacs_plus__server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_saml_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fortitoken_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_sms_custom_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_passwd_policy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_qkd_profile_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
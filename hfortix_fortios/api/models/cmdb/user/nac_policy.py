@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class NacPolicySwitchGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("switch-controller.switch-group.name",),
+    }
+    
     name: str = Field(max_length=79, description="Managed FortiSwitch group name from available options.")  # datasource: ['switch-controller.switch-group.name']
 class NacPolicySeverity(BaseModel):
     """
@@ -83,6 +88,17 @@ class NacPolicyModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "user_group": ("user.group.name",),
+        "ems_tag": ("firewall.address.name",),
+        "fortivoice_tag": ("firewall.address.name",),
+        "switch_fortilink": ("system.interface.name",),
+        "switch_mac_policy": ("switch-controller.mac-policy.name",),
+        "firewall_address": ("firewall.address.name",),
+        "ssid_policy": ("wireless-controller.ssid-policy.name",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="NAC policy name.")    
     description: str | None = Field(max_length=63, default=None, description="Description for the NAC policy matching pattern.")    
     category: NacPolicyCategoryEnum | None = Field(default=NacPolicyCategoryEnum.DEVICE, description="Category of NAC policy.")    
@@ -652,8 +668,9 @@ class NacPolicyModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -667,25 +684,10 @@ class NacPolicyModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_user_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ems_tag_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fortivoice_tag_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_switch_fortilink_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_switch_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_switch_mac_policy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_firewall_address_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssid_policy_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
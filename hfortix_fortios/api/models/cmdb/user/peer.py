@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -47,6 +47,13 @@ class PeerModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ca": ("vpn.certificate.ca.name",),
+        "mfa_server": ("user.radius.name", "user.ldap.name"),
+        "ocsp_override_server": ("vpn.certificate.ocsp-server.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Peer name.")    
     mandatory_ca_verify: Literal["enable", "disable"] | None = Field(default="enable", description="Determine what happens to the peer if the CA certificate is not installed. Disable to automatically consider the peer certificate as valid.")    
     ca: str | None = Field(max_length=127, default=None, description="Name of the CA certificate.")  # datasource: ['vpn.certificate.ca.name']    
@@ -291,8 +298,9 @@ class PeerModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -306,15 +314,10 @@ class PeerModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_ca_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_mfa_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ocsp_override_server_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
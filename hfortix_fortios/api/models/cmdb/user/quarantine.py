@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -79,6 +79,12 @@ class QuarantineModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "traffic_policy": ("switch-controller.traffic-policy.name",),
+        "firewall_groups": ("firewall.addrgrp.name",),
+    }
+    
     quarantine: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable quarantine.")    
     traffic_policy: str | None = Field(max_length=63, default=None, description="Traffic policy for quarantined MACs.")  # datasource: ['switch-controller.traffic-policy.name']    
     firewall_groups: str | None = Field(max_length=79, default=None, description="Firewall address group which includes all quarantine MAC address.")  # datasource: ['firewall.addrgrp.name']    
@@ -248,8 +254,9 @@ class QuarantineModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -263,13 +270,10 @@ class QuarantineModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_traffic_policy_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_firewall_groups_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
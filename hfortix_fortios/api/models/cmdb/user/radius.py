@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -46,6 +46,11 @@ class RadiusAccountingServer(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="ID (0 - 4294967295).")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     server: str = Field(max_length=63, description="Server CN domain name or IP address.")    
@@ -220,6 +225,14 @@ class RadiusModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "source_ip_interface": ("system.interface.name",),
+        "interface": ("system.interface.name",),
+        "ca_cert": ("vpn.certificate.ca.name",),
+        "client_cert": ("vpn.certificate.local.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="RADIUS server entry name.")    
     server: str = Field(max_length=63, description="Primary RADIUS server CN domain name or IP address.")    
     secret: Any = Field(max_length=128, description="Pre-shared secret key used to access the primary RADIUS server.")    
@@ -633,8 +646,9 @@ class RadiusModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -648,19 +662,10 @@ class RadiusModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_source_ip_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ca_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_client_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_accounting_server_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
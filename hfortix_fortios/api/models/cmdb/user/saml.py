@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -92,6 +92,13 @@ class SamlModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "cert": ("vpn.certificate.local.name",),
+        "idp_cert": ("vpn.certificate.remote.name",),
+        "scim_client": ("user.scim.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="SAML server entry name.")    
     cert: str | None = Field(max_length=35, default=None, description="Certificate to sign SAML messages.")  # datasource: ['vpn.certificate.local.name']    
     entity_id: str = Field(max_length=255, description="SP entity ID.")    
@@ -343,8 +350,9 @@ class SamlModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -358,15 +366,10 @@ class SamlModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_idp_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_scim_client_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,12 @@ class ScimModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "token_certificate": ("vpn.certificate.remote.name", "vpn.certificate.local.name"),
+        "certificate": ("vpn.certificate.ca.name", "vpn.certificate.remote.name", "certificate.ca.name", "certificate.remote.name"),
+    }
+    
     name: str = Field(max_length=35, description="SCIM client name.")    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="SCIM client ID.")    
     status: Literal["enable", "disable"] = Field(default="disable", description="Enable/disable System for Cross-domain Identity Management (SCIM).")    
@@ -221,8 +227,9 @@ class ScimModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -236,13 +243,10 @@ class ScimModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_token_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certificate_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
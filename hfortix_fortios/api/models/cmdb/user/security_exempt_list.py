@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Optional
+from typing import Any, ClassVar, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class SecurityExemptListRuleSrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Address or group name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class SecurityExemptListRuleService(BaseModel):
     """
@@ -45,6 +50,11 @@ class SecurityExemptListRuleService(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.service.custom.name", "firewall.service.group.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Service name.")  # datasource: ['firewall.service.custom.name', 'firewall.service.group.name']
 class SecurityExemptListRuleDstaddr(BaseModel):
     """
@@ -59,6 +69,11 @@ class SecurityExemptListRuleDstaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Address or group name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class SecurityExemptListRule(BaseModel):
     """
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -108,6 +108,13 @@ class SettingModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "auth_cert": ("vpn.certificate.local.name",),
+        "auth_ca_cert": ("vpn.certificate.local.name",),
+        "default_user_password_policy": ("user.password-policy.name",),
+    }
+    
     auth_type: list[SettingAuthTypeEnum] = Field(default_factory=list, description="Supported firewall policy authentication protocols/methods.")    
     auth_cert: str | None = Field(max_length=35, default=None, description="HTTPS server certificate for policy authentication.")  # datasource: ['vpn.certificate.local.name']    
     auth_ca_cert: str | None = Field(max_length=35, default=None, description="HTTPS CA certificate for policy authentication.")  # datasource: ['vpn.certificate.local.name']    
@@ -361,8 +368,9 @@ class SettingModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -376,15 +384,10 @@ class SettingModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_auth_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_auth_ca_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_default_user_password_policy_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
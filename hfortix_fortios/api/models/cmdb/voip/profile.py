@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -55,6 +55,14 @@ class ProfileSip(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ssl_client_certificate": ("vpn.certificate.local.name",),
+        "ssl_server_certificate": ("vpn.certificate.local.name",),
+        "ssl_auth_client": ("user.peer.name", "user.peergrp.name"),
+        "ssl_auth_server": ("user.peer.name", "user.peergrp.name"),
+    }
+    
     status: Literal["disable", "enable"] | None = Field(default="enable", description="Enable/disable SIP.")    
     rtp: Literal["disable", "enable"] | None = Field(default="enable", description="Enable/disable create pinholes for RTP traffic to traverse firewall.")    
     nat_port_range: str | None = Field(default="5117-65533", description="RTP NAT port range.")    
@@ -337,8 +345,9 @@ class ProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -352,11 +361,10 @@ class ProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_sip_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
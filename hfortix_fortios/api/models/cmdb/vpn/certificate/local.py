@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -69,6 +69,13 @@ class LocalModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "cmp_server_cert": ("vpn.certificate.ca.name", "vpn.certificate.remote.name"),
+        "est_client_cert": ("vpn.certificate.local.name",),
+        "est_server_cert": ("vpn.certificate.ca.name", "vpn.certificate.remote.name"),
+    }
+    
     name: str = Field(max_length=35, description="Name.")    
     password: Any = Field(max_length=128, default=None, description="Password as a PEM file.")    
     comments: str | None = Field(max_length=511, default=None, description="Comment.")    
@@ -343,8 +350,9 @@ class LocalModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -358,15 +366,10 @@ class LocalModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_cmp_server_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_est_client_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_est_server_cert_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
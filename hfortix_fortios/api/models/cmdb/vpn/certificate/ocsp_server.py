@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,12 @@ class OcspServerModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "cert": ("vpn.certificate.remote.name", "vpn.certificate.ca.name"),
+        "secondary_cert": ("vpn.certificate.remote.name", "vpn.certificate.ca.name"),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="OCSP server entry name.")    
     url: str | None = Field(max_length=127, default=None, description="OCSP server URL.")    
     cert: str | None = Field(max_length=127, default=None, description="OCSP server certificate.")  # datasource: ['vpn.certificate.remote.name', 'vpn.certificate.ca.name']    
@@ -214,8 +220,9 @@ class OcspServerModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -229,13 +236,10 @@ class OcspServerModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_secondary_cert_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -72,6 +72,22 @@ class SettingModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ocsp_default_server": ("vpn.certificate.ocsp-server.name",),
+        "interface": ("system.interface.name",),
+        "certname_rsa1024": ("vpn.certificate.local.name",),
+        "certname_rsa2048": ("vpn.certificate.local.name",),
+        "certname_rsa4096": ("vpn.certificate.local.name",),
+        "certname_dsa1024": ("vpn.certificate.local.name",),
+        "certname_dsa2048": ("vpn.certificate.local.name",),
+        "certname_ecdsa256": ("vpn.certificate.local.name",),
+        "certname_ecdsa384": ("vpn.certificate.local.name",),
+        "certname_ecdsa521": ("vpn.certificate.local.name",),
+        "certname_ed25519": ("vpn.certificate.local.name",),
+        "certname_ed448": ("vpn.certificate.local.name",),
+    }
+    
     ocsp_status: Literal["enable", "mandatory", "disable"] | None = Field(default="disable", description="Enable/disable receiving certificates using the OCSP.")    
     ocsp_option: Literal["certificate", "server"] | None = Field(default="server", description="Specify whether the OCSP URL is from certificate or configured OCSP server.")    
     proxy: str | None = Field(max_length=127, default=None, description="Proxy server FQDN or IP for OCSP/CA queries during certificate verification.")    
@@ -910,8 +926,9 @@ class SettingModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -925,33 +942,10 @@ class SettingModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_ocsp_default_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certname_rsa1024_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certname_rsa2048_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certname_rsa4096_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certname_dsa1024_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certname_dsa2048_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certname_ecdsa256_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certname_ecdsa384_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certname_ecdsa521_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certname_ed25519_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certname_ed448_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class Phase1InterfaceRemoteGwZtnaTags(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class Phase1InterfaceMonitor(BaseModel):
     """
@@ -46,6 +51,11 @@ class Phase1InterfaceMonitor(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("vpn.ipsec.phase1-interface.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="IPsec interface as backup for primary interface.")  # datasource: ['vpn.ipsec.phase1-interface.name']
 class Phase1InterfaceIpv6ExcludeRange(BaseModel):
     """
@@ -120,6 +130,11 @@ class Phase1InterfaceCertificate(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("vpn.certificate.local.name",),
+    }
+    
     name: str = Field(max_length=79, description="Certificate name.")  # datasource: ['vpn.certificate.local.name']
 class Phase1InterfaceBackupGateway(BaseModel):
     """
@@ -472,6 +487,27 @@ class Phase1InterfaceModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "interface": ("system.interface.name",),
+        "usrgrp": ("user.group.name",),
+        "peer": ("user.peer.name",),
+        "peergrp": ("user.peergrp.name",),
+        "ipv4_split_include": ("firewall.address.name", "firewall.addrgrp.name"),
+        "split_include_service": ("firewall.service.group.name", "firewall.service.custom.name"),
+        "ipv4_name": ("firewall.address.name", "firewall.addrgrp.name"),
+        "ipv6_split_include": ("firewall.address6.name", "firewall.addrgrp6.name"),
+        "ipv6_name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+        "ipv4_split_exclude": ("firewall.address.name", "firewall.addrgrp.name"),
+        "ipv6_split_exclude": ("firewall.address6.name", "firewall.addrgrp6.name"),
+        "eap_exclude_peergrp": ("user.peergrp.name",),
+        "authusrgrp": ("user.group.name",),
+        "fec_health_check": ("system.sdwan.health-check.name",),
+        "fec_mapping_profile": ("vpn.ipsec.fec.name",),
+        "kms": ("vpn.kmip-server.name",),
+        "qkd_profile": ("vpn.qkd.name",),
+    }
+    
     name: str | None = Field(max_length=15, default=None, description="IPsec remote gateway name.")    
     type_: Literal["static", "dynamic", "ddns"] | None = Field(default="static", serialization_alias="type", description="Remote gateway type.")    
     interface: str = Field(max_length=35, description="Local physical, aggregate, or VLAN outgoing interface.")  # datasource: ['system.interface.name']    
@@ -1986,8 +2022,9 @@ class Phase1InterfaceModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -2001,49 +2038,10 @@ class Phase1InterfaceModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_interface_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_certificate_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_usrgrp_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_peer_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_peergrp_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_monitor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ipv4_split_include_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_split_include_service_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ipv4_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ipv6_split_include_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ipv6_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ipv4_split_exclude_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ipv6_split_exclude_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_eap_exclude_peergrp_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_authusrgrp_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fec_health_check_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fec_mapping_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_kms_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_qkd_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_remote_gw_ztna_tags_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -279,6 +279,15 @@ class Phase2InterfaceModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "phase1name": ("vpn.ipsec.phase1-interface.name",),
+        "src_name": ("firewall.address.name", "firewall.addrgrp.name"),
+        "src_name6": ("firewall.address6.name", "firewall.addrgrp6.name"),
+        "dst_name": ("firewall.address.name", "firewall.addrgrp.name"),
+        "dst_name6": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="IPsec tunnel name.")    
     phase1name: str = Field(max_length=15, description="Phase 1 determines the options required for phase 2.")  # datasource: ['vpn.ipsec.phase1-interface.name']    
     dhcp_ipsec: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable DHCP-IPsec.")    
@@ -696,8 +705,9 @@ class Phase2InterfaceModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -711,19 +721,10 @@ class Phase2InterfaceModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_phase1name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_src_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_src_name6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dst_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_dst_name6_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
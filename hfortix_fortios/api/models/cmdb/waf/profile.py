@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -72,6 +72,11 @@ class ProfileUrlAccessAccessPattern(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "srcaddr": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="URL access pattern ID.")    
     srcaddr: str | None = Field(max_length=79, default=None, description="Source address.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']    
     pattern: str = Field(max_length=511, description="URL pattern.")    
@@ -90,6 +95,11 @@ class ProfileUrlAccess(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "address": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="URL access ID.")    
     address: str = Field(max_length=79, description="Host address.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']    
     action: Literal["bypass", "permit", "block"] | None = Field(default="permit", description="Action.")    
@@ -109,6 +119,11 @@ class ProfileSignatureMainClass(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "id_": ("waf.main-class.id",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Main signature class ID.")  # datasource: ['waf.main-class.id']    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Status.")    
     action: Literal["allow", "block", "erase"] | None = Field(default="allow", description="Action.")    
@@ -127,6 +142,11 @@ class ProfileSignatureDisabledSubClass(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "id_": ("waf.sub-class.id",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Signature subclass ID.")  # datasource: ['waf.sub-class.id']
 class ProfileSignatureDisabledSignature(BaseModel):
     """
@@ -141,6 +161,11 @@ class ProfileSignatureDisabledSignature(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "id_": ("waf.signature.id",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Signature ID.")  # datasource: ['waf.signature.id']
 class ProfileSignatureCustomSignature(BaseModel):
     """
@@ -195,6 +220,11 @@ class ProfileMethodMethodPolicy(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "address": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="HTTP method policy ID.")    
     pattern: str | None = Field(max_length=511, default=None, description="URL pattern.")    
     regex: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable regular expression based pattern match.")    
@@ -443,6 +473,11 @@ class ProfileConstraintException(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "address": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Exception ID.")    
     pattern: str = Field(max_length=511, description="URL pattern.")    
     regex: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable regular expression based pattern match.")    
@@ -518,6 +553,11 @@ class ProfileAddressListTrustedAddress(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class ProfileAddressListBlockedAddress(BaseModel):
     """
@@ -532,6 +572,11 @@ class ProfileAddressListBlockedAddress(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 class ProfileAddressList(BaseModel):
     """
@@ -685,8 +730,9 @@ class ProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -700,11 +746,10 @@ class ProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_url_access_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
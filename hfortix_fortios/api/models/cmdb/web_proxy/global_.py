@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions for Child Table Fields (for fields with 4+ allowed values)
@@ -31,6 +31,11 @@ class GlobalLearnClientIpSrcaddr6(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address6.name", "firewall.addrgrp6.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address6.name', 'firewall.addrgrp6.name']
 class GlobalLearnClientIpSrcaddr(BaseModel):
     """
@@ -45,6 +50,11 @@ class GlobalLearnClientIpSrcaddr(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.address.name", "firewall.addrgrp.name"),
+    }
+    
     name: str = Field(max_length=79, description="Address name.")  # datasource: ['firewall.address.name', 'firewall.addrgrp.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -74,6 +84,13 @@ class GlobalModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ssl_cert": ("vpn.certificate.local.name",),
+        "ssl_ca_cert": ("vpn.certificate.local.name", "vpn.certificate.hsm-local.name"),
+        "webproxy_profile": ("web-proxy.profile.name",),
+    }
+    
     ssl_cert: str | None = Field(max_length=35, default="Fortinet_Factory", description="SSL certificate for SSL interception.")  # datasource: ['vpn.certificate.local.name']    
     ssl_ca_cert: str | None = Field(max_length=35, default="Fortinet_CA_SSL", description="SSL CA certificate for SSL interception.")  # datasource: ['vpn.certificate.local.name', 'vpn.certificate.hsm-local.name']    
     fast_policy_match: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable fast matching algorithm for explicit and transparent proxy policy.")    
@@ -453,8 +470,9 @@ class GlobalModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -468,19 +486,10 @@ class GlobalModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_ssl_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ssl_ca_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webproxy_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_learn_client_ip_srcaddr_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_learn_client_ip_srcaddr6_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -38,6 +38,12 @@ class UrlMatchModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "forward_server": ("web-proxy.forward-server.name", "web-proxy.forward-server-group.name"),
+        "fast_fallback": ("web-proxy.fast-fallback.name",),
+    }
+    
     name: str | None = Field(max_length=63, default=None, description="Configure a name for the URL to be exempted.")    
     status: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable exempting the URLs matching the URL pattern from web proxy forwarding, caching and fast-fallback.")    
     url_pattern: str = Field(max_length=511, description="URL pattern to be exempted from web proxy forwarding, caching and fast-fallback.")    
@@ -212,8 +218,9 @@ class UrlMatchModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -227,13 +234,10 @@ class UrlMatchModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_forward_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_fast_fallback_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -46,6 +46,13 @@ class OverrideModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "user_group": ("user.group.name",),
+        "old_profile": ("webfilter.profile.name",),
+        "new_profile": ("webfilter.profile.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4294967295, default=0, serialization_alias="id", description="Override rule ID.")    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable override rule.")    
     scope: OverrideScopeEnum | None = Field(default=OverrideScopeEnum.USER, description="Override either the specific user, user group, IPv4 address, or IPv6 address.")    
@@ -286,8 +293,9 @@ class OverrideModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -301,15 +309,10 @@ class OverrideModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_user_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_old_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_new_profile_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -95,6 +95,11 @@ class ProfileWispServers(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("web-proxy.wisp.name",),
+    }
+    
     name: str = Field(max_length=79, description="Server name.")  # datasource: ['web-proxy.wisp.name']
 class ProfileWebKeywordMatch(BaseModel):
     """
@@ -123,6 +128,13 @@ class ProfileWeb(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "bword_table": ("webfilter.content.id",),
+        "urlfilter_table": ("webfilter.urlfilter.id",),
+        "content_header_list": ("webfilter.content-header.id",),
+    }
+    
     bword_threshold: int | None = Field(ge=0, le=2147483647, default=10, description="Banned word score threshold.")    
     bword_table: int | None = Field(ge=0, le=4294967295, default=0, description="Banned word table ID.")  # datasource: ['webfilter.content.id']    
     urlfilter_table: int | None = Field(ge=0, le=4294967295, default=0, description="URL filter table ID.")  # datasource: ['webfilter.urlfilter.id']    
@@ -147,6 +159,11 @@ class ProfileOverrideProfile(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("webfilter.profile.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="Web profile.")  # datasource: ['webfilter.profile.name']
 class ProfileOverrideOvrdUserGroup(BaseModel):
     """
@@ -161,6 +178,11 @@ class ProfileOverrideOvrdUserGroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="User group name.")  # datasource: ['user.group.name']
 class ProfileOverride(BaseModel):
     """
@@ -196,6 +218,11 @@ class ProfileFtgdWfRisk(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "risk_level": ("webfilter.ftgd-risk-level.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=255, default=0, serialization_alias="id", description="ID number.")    
     risk_level: str = Field(max_length=35, description="Risk level to be examined.")  # datasource: ['webfilter.ftgd-risk-level.name']    
     action: Literal["block", "monitor"] | None = Field(default="monitor", description="Action to take for matches.")    
@@ -233,6 +260,11 @@ class ProfileFtgdWfFiltersAuthUsrGrp(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="User group name.")  # datasource: ['user.group.name']
 class ProfileFtgdWfFilters(BaseModel):
     """
@@ -324,6 +356,12 @@ class ProfileAntiphish(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "domain_controller": ("user.domain-controller.name", "credential-store.domain-controller.server-name"),
+        "ldap": ("user.ldap.name",),
+    }
+    
     status: Literal["enable", "disable"] | None = Field(default="disable", description="Toggle AntiPhishing functionality.")    
     default_action: Literal["exempt", "log", "block"] | None = Field(default="exempt", description="Action to be taken when there is no matching rule.")    
     check_uri: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable checking of GET URI parameters for known credentials.")    
@@ -385,6 +423,11 @@ class ProfileModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "replacemsg_group": ("system.replacemsg-group.name",),
+    }
+    
     name: str = Field(max_length=47, description="Profile name.")    
     comment: str | None = Field(max_length=255, default=None, description="Optional comments.")    
     feature_set: Literal["flow", "proxy"] | None = Field(default="flow", description="Flow/proxy feature set.")    
@@ -695,8 +738,9 @@ class ProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -710,17 +754,10 @@ class ProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_replacemsg_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_web_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_antiphish_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_wisp_servers_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
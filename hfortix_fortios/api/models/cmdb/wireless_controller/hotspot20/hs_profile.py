@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class HsProfileOsuProvider(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("wireless-controller.hotspot20.h2qp-osu-provider.name",),
+    }
+    
     name: str = Field(max_length=35, description="OSU provider name.")  # datasource: ['wireless-controller.hotspot20.h2qp-osu-provider.name']
 # ============================================================================
 # Enum Definitions (for fields with 4+ allowed values)
@@ -145,6 +150,25 @@ class HsProfileModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "venue_name": ("wireless-controller.hotspot20.anqp-venue-name.name",),
+        "venue_url": ("wireless-controller.hotspot20.anqp-venue-url.name",),
+        "roaming_consortium": ("wireless-controller.hotspot20.anqp-roaming-consortium.name",),
+        "nai_realm": ("wireless-controller.hotspot20.anqp-nai-realm.name",),
+        "oper_friendly_name": ("wireless-controller.hotspot20.h2qp-operator-name.name",),
+        "oper_icon": ("wireless-controller.hotspot20.icon.name",),
+        "advice_of_charge": ("wireless-controller.hotspot20.h2qp-advice-of-charge.name",),
+        "osu_provider_nai": ("wireless-controller.hotspot20.h2qp-osu-provider-nai.name",),
+        "terms_and_conditions": ("wireless-controller.hotspot20.h2qp-terms-and-conditions.name",),
+        "wan_metrics": ("wireless-controller.hotspot20.h2qp-wan-metric.name",),
+        "network_auth": ("wireless-controller.hotspot20.anqp-network-auth-type.name",),
+        "_3gpp_plmn": ("wireless-controller.hotspot20.anqp-3gpp-cellular.name",),
+        "conn_cap": ("wireless-controller.hotspot20.h2qp-conn-capability.name",),
+        "qos_map": ("wireless-controller.hotspot20.qos-map.name",),
+        "ip_addr_type": ("wireless-controller.hotspot20.anqp-ip-address-type.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="Hotspot profile name.")    
     release: int | None = Field(ge=1, le=3, default=2, description="Hotspot 2.0 Release number (1, 2, 3, default = 2).")    
     access_network_type: HsProfileAccessNetworkTypeEnum | None = Field(default=HsProfileAccessNetworkTypeEnum.PRIVATE_NETWORK, description="Access network type.")    
@@ -1243,8 +1267,9 @@ class HsProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -1258,41 +1283,10 @@ class HsProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_venue_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_venue_url_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_roaming_consortium_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_nai_realm_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_oper_friendly_name_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_oper_icon_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_advice_of_charge_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_osu_provider_nai_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_terms_and_conditions_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_osu_provider_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_wan_metrics_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_network_auth_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_3gpp_plmn_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_conn_cap_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_qos_map_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ip_addr_type_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
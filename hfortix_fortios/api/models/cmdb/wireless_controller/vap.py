@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -32,6 +32,11 @@ class VapVlanPool(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "wtp_group": ("wireless-controller.wtp-group.name",),
+    }
+    
     id_: int | None = Field(ge=0, le=4094, default=0, serialization_alias="id", description="ID.")    
     wtp_group: str | None = Field(max_length=35, default=None, description="WTP group name.")  # datasource: ['wireless-controller.wtp-group.name']
 class VapVlanName(BaseModel):
@@ -62,6 +67,11 @@ class VapUsergroup(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="User group name.")  # datasource: ['user.group.name']
 class VapSelectedUsergroups(BaseModel):
     """
@@ -76,6 +86,11 @@ class VapSelectedUsergroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="User group name.")  # datasource: ['user.group.name']
 class VapSchedule(BaseModel):
     """
@@ -90,6 +105,11 @@ class VapSchedule(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.schedule.group.name", "firewall.schedule.recurring.name", "firewall.schedule.onetime.name"),
+    }
+    
     name: str = Field(max_length=35, description="Schedule name.")  # datasource: ['firewall.schedule.group.name', 'firewall.schedule.recurring.name', 'firewall.schedule.onetime.name']
 class VapRadiusMacAuthUsergroups(BaseModel):
     """
@@ -104,6 +124,11 @@ class VapRadiusMacAuthUsergroups(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("user.group.name",),
+    }
+    
     name: str = Field(max_length=79, description="User group name.")  # datasource: ['user.group.name']
 class VapPortalMessageOverrides(BaseModel):
     """
@@ -350,6 +375,28 @@ class VapModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "radius_mac_auth_server": ("user.radius.name",),
+        "radius_server": ("user.radius.name",),
+        "portal_message_override_group": ("system.replacemsg-group.name",),
+        "security_exempt_list": ("user.security-exempt-list.name",),
+        "auth_cert": ("vpn.certificate.local.name",),
+        "mpsk_profile": ("wireless-controller.mpsk-profile.name",),
+        "nac_profile": ("wireless-controller.nac-profile.name",),
+        "qos_profile": ("wireless-controller.qos-profile.name",),
+        "hotspot20_profile": ("wireless-controller.hotspot20.hs-profile.name",),
+        "access_control_list": ("wireless-controller.access-control-list.name",),
+        "primary_wag_profile": ("wireless-controller.wag-profile.name",),
+        "secondary_wag_profile": ("wireless-controller.wag-profile.name",),
+        "utm_profile": ("wireless-controller.utm-profile.name",),
+        "ips_sensor": ("ips.sensor.name",),
+        "application_list": ("application.list.name",),
+        "antivirus_profile": ("antivirus.profile.name",),
+        "webfilter_profile": ("webfilter.profile.name",),
+        "address_group": ("firewall.addrgrp.name",),
+    }
+    
     name: str = Field(max_length=15, description="Virtual AP name.")    
     pre_auth: Literal["enable", "disable"] | None = Field(default="enable", description="Enable/disable pre-authentication, where supported by clients (default = enable).")    
     external_pre_auth: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable pre-authentication with external APs not managed by the FortiGate (default = disable).")    
@@ -2005,8 +2052,9 @@ class VapModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -2020,55 +2068,10 @@ class VapModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_radius_mac_auth_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_radius_mac_auth_usergroups_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_radius_server_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_usergroup_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_portal_message_override_group_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_selected_usergroups_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_security_exempt_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_auth_cert_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_schedule_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_mpsk_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_nac_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vlan_pool_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_qos_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_hotspot20_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_access_control_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_primary_wag_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_secondary_wag_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_utm_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ips_sensor_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_application_list_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_antivirus_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_webfilter_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_address_group_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
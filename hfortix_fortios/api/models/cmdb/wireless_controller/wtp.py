@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 from uuid import UUID
 
@@ -210,6 +210,11 @@ class WtpRadio4Vaps(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("wireless-controller.vap-group.name", "system.interface.name"),
+    }
+    
     name: str = Field(max_length=35, description="Virtual Access Point (VAP) name.")  # datasource: ['wireless-controller.vap-group.name', 'system.interface.name']
 class WtpRadio4Channel(BaseModel):
     """
@@ -267,6 +272,11 @@ class WtpRadio3Vaps(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("wireless-controller.vap-group.name", "system.interface.name"),
+    }
+    
     name: str = Field(max_length=35, description="Virtual Access Point (VAP) name.")  # datasource: ['wireless-controller.vap-group.name', 'system.interface.name']
 class WtpRadio3Channel(BaseModel):
     """
@@ -324,6 +334,11 @@ class WtpRadio2Vaps(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("wireless-controller.vap-group.name", "system.interface.name"),
+    }
+    
     name: str = Field(max_length=35, description="Virtual Access Point (VAP) name.")  # datasource: ['wireless-controller.vap-group.name', 'system.interface.name']
 class WtpRadio2Channel(BaseModel):
     """
@@ -381,6 +396,11 @@ class WtpRadio1Vaps(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("wireless-controller.vap-group.name", "system.interface.name"),
+    }
+    
     name: str = Field(max_length=35, description="Virtual Access Point (VAP) name.")  # datasource: ['wireless-controller.vap-group.name', 'system.interface.name']
 class WtpRadio1Channel(BaseModel):
     """
@@ -438,6 +458,20 @@ class WtpLan(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "port_ssid": ("system.interface.name",),
+        "port1_ssid": ("system.interface.name",),
+        "port2_ssid": ("system.interface.name",),
+        "port3_ssid": ("system.interface.name",),
+        "port4_ssid": ("system.interface.name",),
+        "port5_ssid": ("system.interface.name",),
+        "port6_ssid": ("system.interface.name",),
+        "port7_ssid": ("system.interface.name",),
+        "port8_ssid": ("system.interface.name",),
+        "port_esl_ssid": ("system.interface.name",),
+    }
+    
     port_mode: WtpLanPortModeEnum | None = Field(default=WtpLanPortModeEnum.OFFLINE, description="LAN port mode.")    
     port_ssid: str | None = Field(max_length=15, default=None, description="Bridge LAN port to SSID.")  # datasource: ['system.interface.name']    
     port1_mode: WtpLanPort1ModeEnum | None = Field(default=WtpLanPort1ModeEnum.OFFLINE, description="LAN port 1 mode.")    
@@ -498,6 +532,14 @@ class WtpModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "region": ("wireless-controller.region.name",),
+        "wtp_profile": ("wireless-controller.wtp-profile.name",),
+        "apcfg_profile": ("wireless-controller.apcfg-profile.name",),
+        "bonjour_profile": ("wireless-controller.bonjour-profile.name",),
+    }
+    
     wtp_id: str = Field(max_length=35, description="WTP ID.")    
     index: int | None = Field(ge=0, le=4294967295, default=0, description="Index (0 - 4294967295).")    
     uuid: str | None = Field(default="00000000-0000-0000-0000-000000000000", description="Universally Unique Identifier (UUID; automatically assigned but can be manually reset).")    
@@ -896,8 +938,9 @@ class WtpModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -911,19 +954,10 @@ class WtpModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_region_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_wtp_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_apcfg_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_bonjour_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_lan_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
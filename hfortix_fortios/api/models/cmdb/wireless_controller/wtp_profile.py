@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -551,6 +551,11 @@ class WtpProfileRadio4Vaps(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("wireless-controller.vap-group.name", "system.interface.name"),
+    }
+    
     name: str = Field(max_length=35, description="Virtual Access Point (VAP) name.")  # datasource: ['wireless-controller.vap-group.name', 'system.interface.name']
 class WtpProfileRadio4Channel(BaseModel):
     """
@@ -579,6 +584,15 @@ class WtpProfileRadio4(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "sam_client_certificate": ("vpn.certificate.local.name",),
+        "sam_private_key": ("vpn.certificate.local.name",),
+        "sam_ca_certificate": ("vpn.certificate.ca.name",),
+        "wids_profile": ("wireless-controller.wids-profile.name",),
+        "arrp_profile": ("wireless-controller.arrp-profile.name",),
+    }
+    
     mode: WtpProfileRadio4ModeEnum | None = Field(default=WtpProfileRadio4ModeEnum.AP, description="Mode of radio 4. Radio 4 can be disabled, configured as an access point, a rogue AP monitor, a sniffer, or a station.")    
     band: list[WtpProfileRadio4BandEnum] = Field(default_factory=list, description="WiFi band that Radio 4 operates on.")    
     band_5g_type: Literal["5g-full", "5g-high", "5g-low"] | None = Field(default="5g-full", description="WiFi 5G band type.")    
@@ -672,6 +686,11 @@ class WtpProfileRadio3Vaps(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("wireless-controller.vap-group.name", "system.interface.name"),
+    }
+    
     name: str = Field(max_length=35, description="Virtual Access Point (VAP) name.")  # datasource: ['wireless-controller.vap-group.name', 'system.interface.name']
 class WtpProfileRadio3Channel(BaseModel):
     """
@@ -700,6 +719,15 @@ class WtpProfileRadio3(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "sam_client_certificate": ("vpn.certificate.local.name",),
+        "sam_private_key": ("vpn.certificate.local.name",),
+        "sam_ca_certificate": ("vpn.certificate.ca.name",),
+        "wids_profile": ("wireless-controller.wids-profile.name",),
+        "arrp_profile": ("wireless-controller.arrp-profile.name",),
+    }
+    
     mode: WtpProfileRadio3ModeEnum | None = Field(default=WtpProfileRadio3ModeEnum.AP, description="Mode of radio 3. Radio 3 can be disabled, configured as an access point, a rogue AP monitor, a sniffer, or a station.")    
     band: list[WtpProfileRadio3BandEnum] = Field(default_factory=list, description="WiFi band that Radio 3 operates on.")    
     band_5g_type: Literal["5g-full", "5g-high", "5g-low"] | None = Field(default="5g-full", description="WiFi 5G band type.")    
@@ -793,6 +821,11 @@ class WtpProfileRadio2Vaps(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("wireless-controller.vap-group.name", "system.interface.name"),
+    }
+    
     name: str = Field(max_length=35, description="Virtual Access Point (VAP) name.")  # datasource: ['wireless-controller.vap-group.name', 'system.interface.name']
 class WtpProfileRadio2Channel(BaseModel):
     """
@@ -821,6 +854,15 @@ class WtpProfileRadio2(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "sam_client_certificate": ("vpn.certificate.local.name",),
+        "sam_private_key": ("vpn.certificate.local.name",),
+        "sam_ca_certificate": ("vpn.certificate.ca.name",),
+        "wids_profile": ("wireless-controller.wids-profile.name",),
+        "arrp_profile": ("wireless-controller.arrp-profile.name",),
+    }
+    
     mode: WtpProfileRadio2ModeEnum | None = Field(default=WtpProfileRadio2ModeEnum.AP, description="Mode of radio 2. Radio 2 can be disabled, configured as an access point, a rogue AP monitor, a sniffer, or a station.")    
     band: list[WtpProfileRadio2BandEnum] = Field(default_factory=list, description="WiFi band that Radio 2 operates on.")    
     band_5g_type: Literal["5g-full", "5g-high", "5g-low"] | None = Field(default="5g-full", description="WiFi 5G band type.")    
@@ -914,6 +956,11 @@ class WtpProfileRadio1Vaps(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("wireless-controller.vap-group.name", "system.interface.name"),
+    }
+    
     name: str = Field(max_length=35, description="Virtual Access Point (VAP) name.")  # datasource: ['wireless-controller.vap-group.name', 'system.interface.name']
 class WtpProfileRadio1Channel(BaseModel):
     """
@@ -942,6 +989,15 @@ class WtpProfileRadio1(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "sam_client_certificate": ("vpn.certificate.local.name",),
+        "sam_private_key": ("vpn.certificate.local.name",),
+        "sam_ca_certificate": ("vpn.certificate.ca.name",),
+        "wids_profile": ("wireless-controller.wids-profile.name",),
+        "arrp_profile": ("wireless-controller.arrp-profile.name",),
+    }
+    
     mode: WtpProfileRadio1ModeEnum | None = Field(default=WtpProfileRadio1ModeEnum.AP, description="Mode of radio 1. Radio 1 can be disabled, configured as an access point, a rogue AP monitor, a sniffer, or a station.")    
     band: list[WtpProfileRadio1BandEnum] = Field(default_factory=list, description="WiFi band that Radio 1 operates on.")    
     band_5g_type: Literal["5g-full", "5g-high", "5g-low"] | None = Field(default="5g-full", description="WiFi 5G band type.")    
@@ -1051,6 +1107,11 @@ class WtpProfileLedSchedules(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "name": ("firewall.schedule.group.name", "firewall.schedule.recurring.name", "firewall.schedule.onetime.name"),
+    }
+    
     name: str = Field(max_length=35, description="Schedule name.")  # datasource: ['firewall.schedule.group.name', 'firewall.schedule.recurring.name', 'firewall.schedule.onetime.name']
 class WtpProfileLbs(BaseModel):
     """
@@ -1065,6 +1126,11 @@ class WtpProfileLbs(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "ble_rtls_asset_addrgrp_list": ("firewall.addrgrp.name",),
+    }
+    
     ekahau_blink_mode: Literal["enable", "disable"] | None = Field(default="disable", description="Enable/disable Ekahau blink mode (now known as AiRISTA Flow) to track and locate WiFi tags (default = disable).")    
     ekahau_tag: str | None = Field(default="01:18:8e:00:00:00", description="WiFi frame MAC address or WiFi Tag.")    
     erc_server_ip: str | None = Field(default="0.0.0.0", description="IP address of Ekahau RTLS Controller (ERC).")    
@@ -1115,6 +1181,20 @@ class WtpProfileLan(BaseModel):
         str_strip_whitespace = True
         use_enum_values = True  # Use enum values instead of names
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "port_ssid": ("system.interface.name",),
+        "port1_ssid": ("system.interface.name",),
+        "port2_ssid": ("system.interface.name",),
+        "port3_ssid": ("system.interface.name",),
+        "port4_ssid": ("system.interface.name",),
+        "port5_ssid": ("system.interface.name",),
+        "port6_ssid": ("system.interface.name",),
+        "port7_ssid": ("system.interface.name",),
+        "port8_ssid": ("system.interface.name",),
+        "port_esl_ssid": ("system.interface.name",),
+    }
+    
     port_mode: WtpProfileLanPortModeEnum | None = Field(default=WtpProfileLanPortModeEnum.OFFLINE, description="LAN port mode.")    
     port_ssid: str | None = Field(max_length=15, default=None, description="Bridge LAN port to SSID.")  # datasource: ['system.interface.name']    
     port1_mode: WtpProfileLanPort1ModeEnum | None = Field(default=WtpProfileLanPort1ModeEnum.OFFLINE, description="LAN port 1 mode.")    
@@ -1455,6 +1535,19 @@ class WtpProfileModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "bonjour_profile": ("wireless-controller.bonjour-profile.name",),
+        "apcfg_profile": ("wireless-controller.apcfg-profile.name",),
+        "apcfg_mesh_ssid": ("wireless-controller.vap.name",),
+        "ble_profile": ("wireless-controller.ble-profile.name",),
+        "lw_profile": ("wireless-controller.lw-profile.name",),
+        "syslog_profile": ("wireless-controller.syslog-profile.name",),
+        "apcfg_auto_cert_est_https_ca": ("vpn.certificate.ca.name",),
+        "apcfg_auto_cert_scep_https_ca": ("vpn.certificate.ca.name",),
+        "admin_auth_tacacs": ("user.tacacs+.name",),
+    }
+    
     name: str | None = Field(max_length=35, default=None, description="WTP (or FortiAP or AP) profile name.")    
     comment: str | None = Field(max_length=255, default=None, description="Comment.")    
     platform: WtpProfilePlatform | None = Field(default=None, description="WTP, FortiAP, or AP platform.")    
@@ -2556,8 +2649,9 @@ class WtpProfileModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -2571,41 +2665,10 @@ class WtpProfileModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_bonjour_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_apcfg_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_apcfg_mesh_ssid_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_ble_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_lw_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_syslog_profile_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_lan_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_led_schedules_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_radio_1_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_radio_2_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_radio_3_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_radio_4_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_lbs_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_apcfg_auto_cert_est_https_ca_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_apcfg_auto_cert_scep_https_ca_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_admin_auth_tacacs_plus__references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
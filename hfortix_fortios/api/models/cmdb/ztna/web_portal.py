@@ -8,7 +8,7 @@ Generated from FortiOS schema version unknown.
 from __future__ import annotations
 
 from pydantic import BaseModel, Field, field_validator
-from typing import Any, Literal, Optional
+from typing import Any, ClassVar, Literal, Optional
 from enum import Enum
 
 # ============================================================================
@@ -52,6 +52,16 @@ class WebPortalModel(BaseModel):
     # Model Fields
     # ========================================================================
     
+    # Datasource references per field (see datasource_map())
+    DATASOURCES: ClassVar[dict[str, tuple[str, ...]]] = {
+        "vip": ("firewall.vip.name",),
+        "host": ("firewall.access-proxy-virtual-host.name",),
+        "decrypted_traffic_mirror": ("firewall.decrypted-traffic-mirror.name",),
+        "auth_virtual_host": ("firewall.access-proxy-virtual-host.name",),
+        "vip6": ("firewall.vip6.name",),
+        "auth_rule": ("authentication.rule.name",),
+    }
+    
     name: str | None = Field(max_length=79, default=None, description="ZTNA proxy name.")    
     vip: str | None = Field(max_length=79, default=None, description="Virtual IP name.")  # datasource: ['firewall.vip.name']    
     host: str | None = Field(max_length=79, default=None, description="Virtual or real host name.")  # datasource: ['firewall.access-proxy-virtual-host.name']    
@@ -497,8 +507,9 @@ class WebPortalModel(BaseModel):
         """
         Validate ALL datasource references in this model.
         
-        Convenience method that runs all validate_*_references() methods
-        and aggregates the results.
+        Fetches each referenced table once (concurrently) and checks all
+        references locally. Use validate_references() to check a batch of
+        models with the same few requests.
         
         Args:
             client: FortiOS client instance (from fgt._client)
@@ -512,21 +523,10 @@ class WebPortalModel(BaseModel):
             ...     for error in errors:
             ...         print(f"  - {error}")
         """
-        all_errors = []
-        
-        errors = await self.validate_vip_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_host_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_decrypted_traffic_mirror_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_auth_virtual_host_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_vip6_references(client)
-        all_errors.extend(errors)        
-        errors = await self.validate_auth_rule_references(client)
-        all_errors.extend(errors)        
-        return all_errors
+        from hfortix_fortios._helpers.references import avalidate_references
+
+        report = await avalidate_references([self], client)
+        return report.errors_for(0)
 
 # ============================================================================
 # Type Aliases for Convenience
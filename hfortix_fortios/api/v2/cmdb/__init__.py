@@ -1,42 +1,6 @@
 """FortiOS CMDB - CMDB category"""
 
-from . import alertemail
-from . import antivirus
-from . import application
-from . import authentication
-from . import automation
-from . import casb
-from . import certificate
-from . import diameter_filter
-from . import dlp
-from . import dnsfilter
-from . import emailfilter
-from . import endpoint_control
-from . import ethernet_oam
-from . import extension_controller
-from . import file_filter
-from . import firewall
-from . import ftp_proxy
-from . import icap
-from . import ips
-from . import log
-from . import monitoring
-from . import report
-from . import router
-from . import rule
-from . import sctp_filter
-from . import switch_controller
-from . import system
-from . import user
-from . import videofilter
-from . import virtual_patch
-from . import voip
-from . import vpn
-from . import waf
-from . import web_proxy
-from . import webfilter
-from . import wireless_controller
-from . import ztna
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Alertemail",
@@ -79,50 +43,94 @@ __all__ = [
     "Ztna",
 ]
 
+_LAZY_IMPORTS = {
+    "alertemail": (".alertemail", None),
+    "antivirus": (".antivirus", None),
+    "application": (".application", None),
+    "authentication": (".authentication", None),
+    "automation": (".automation", None),
+    "casb": (".casb", None),
+    "certificate": (".certificate", None),
+    "diameter_filter": (".diameter_filter", None),
+    "dlp": (".dlp", None),
+    "dnsfilter": (".dnsfilter", None),
+    "emailfilter": (".emailfilter", None),
+    "endpoint_control": (".endpoint_control", None),
+    "ethernet_oam": (".ethernet_oam", None),
+    "extension_controller": (".extension_controller", None),
+    "file_filter": (".file_filter", None),
+    "firewall": (".firewall", None),
+    "ftp_proxy": (".ftp_proxy", None),
+    "icap": (".icap", None),
+    "ips": (".ips", None),
+    "log": (".log", None),
+    "monitoring": (".monitoring", None),
+    "report": (".report", None),
+    "router": (".router", None),
+    "rule": (".rule", None),
+    "sctp_filter": (".sctp_filter", None),
+    "switch_controller": (".switch_controller", None),
+    "system": (".system", None),
+    "user": (".user", None),
+    "videofilter": (".videofilter", None),
+    "virtual_patch": (".virtual_patch", None),
+    "voip": (".voip", None),
+    "vpn": (".vpn", None),
+    "waf": (".waf", None),
+    "web_proxy": (".web_proxy", None),
+    "webfilter": (".webfilter", None),
+    "wireless_controller": (".wireless_controller", None),
+    "ztna": (".ztna", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class CMDB:
     """CMDB endpoints wrapper for CMDB API."""
 
+    alertemail = LazyEndpoint(".alertemail", "Alertemail")
+    antivirus = LazyEndpoint(".antivirus", "Antivirus")
+    application = LazyEndpoint(".application", "Application")
+    authentication = LazyEndpoint(".authentication", "Authentication")
+    automation = LazyEndpoint(".automation", "Automation")
+    casb = LazyEndpoint(".casb", "Casb")
+    certificate = LazyEndpoint(".certificate", "Certificate")
+    diameter_filter = LazyEndpoint(".diameter_filter", "DiameterFilter")
+    dlp = LazyEndpoint(".dlp", "Dlp")
+    dnsfilter = LazyEndpoint(".dnsfilter", "Dnsfilter")
+    emailfilter = LazyEndpoint(".emailfilter", "Emailfilter")
+    endpoint_control = LazyEndpoint(".endpoint_control", "EndpointControl")
+    ethernet_oam = LazyEndpoint(".ethernet_oam", "EthernetOam")
+    extension_controller = LazyEndpoint(".extension_controller", "ExtensionController")
+    file_filter = LazyEndpoint(".file_filter", "FileFilter")
+    firewall = LazyEndpoint(".firewall", "Firewall")
+    ftp_proxy = LazyEndpoint(".ftp_proxy", "FtpProxy")
+    icap = LazyEndpoint(".icap", "Icap")
+    ips = LazyEndpoint(".ips", "Ips")
+    log = LazyEndpoint(".log", "Log")
+    monitoring = LazyEndpoint(".monitoring", "Monitoring")
+    report = LazyEndpoint(".report", "Report")
+    router = LazyEndpoint(".router", "Router")
+    rule = LazyEndpoint(".rule", "Rule")
+    sctp_filter = LazyEndpoint(".sctp_filter", "SctpFilter")
+    switch_controller = LazyEndpoint(".switch_controller", "SwitchController")
+    system = LazyEndpoint(".system", "System")
+    user = LazyEndpoint(".user", "User")
+    videofilter = LazyEndpoint(".videofilter", "Videofilter")
+    virtual_patch = LazyEndpoint(".virtual_patch", "VirtualPatch")
+    voip = LazyEndpoint(".voip", "Voip")
+    vpn = LazyEndpoint(".vpn", "Vpn")
+    waf = LazyEndpoint(".waf", "Waf")
+    web_proxy = LazyEndpoint(".web_proxy", "WebProxy")
+    webfilter = LazyEndpoint(".webfilter", "Webfilter")
+    wireless_controller = LazyEndpoint(".wireless_controller", "WirelessController")
+    ztna = LazyEndpoint(".ztna", "Ztna")
+
     def __init__(self, client):
         """CMDB endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.alertemail = alertemail.Alertemail(client)
-        self.antivirus = antivirus.Antivirus(client)
-        self.application = application.Application(client)
-        self.authentication = authentication.Authentication(client)
-        self.automation = automation.Automation(client)
-        self.casb = casb.Casb(client)
-        self.certificate = certificate.Certificate(client)
-        self.diameter_filter = diameter_filter.DiameterFilter(client)
-        self.dlp = dlp.Dlp(client)
-        self.dnsfilter = dnsfilter.Dnsfilter(client)
-        self.emailfilter = emailfilter.Emailfilter(client)
-        self.endpoint_control = endpoint_control.EndpointControl(client)
-        self.ethernet_oam = ethernet_oam.EthernetOam(client)
-        self.extension_controller = extension_controller.ExtensionController(client)
-        self.file_filter = file_filter.FileFilter(client)
-        self.firewall = firewall.Firewall(client)
-        self.ftp_proxy = ftp_proxy.FtpProxy(client)
-        self.icap = icap.Icap(client)
-        self.ips = ips.Ips(client)
-        self.log = log.Log(client)
-        self.monitoring = monitoring.Monitoring(client)
-        self.report = report.Report(client)
-        self.router = router.Router(client)
-        self.rule = rule.Rule(client)
-        self.sctp_filter = sctp_filter.SctpFilter(client)
-        self.switch_controller = switch_controller.SwitchController(client)
-        self.system = system.System(client)
-        self.user = user.User(client)
-        self.videofilter = videofilter.Videofilter(client)
-        self.virtual_patch = virtual_patch.VirtualPatch(client)
-        self.voip = voip.Voip(client)
-        self.vpn = vpn.Vpn(client)
-        self.waf = waf.Waf(client)
-        self.web_proxy = web_proxy.WebProxy(client)
-        self.webfilter = webfilter.Webfilter(client)
-        self.wireless_controller = wireless_controller.WirelessController(client)
-        self.ztna = ztna.Ztna(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Alertemail category"""
 
-from .setting import Setting
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Alertemail",
     "Setting",
 ]
 
+_LAZY_IMPORTS = {
+    "Setting": (".setting", "Setting"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Alertemail:
     """Alertemail endpoints wrapper for CMDB API."""
 
+    setting = LazyEndpoint(".setting", "Setting")
+
     def __init__(self, client):
         """Alertemail endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.setting = Setting(client)
+        self._client = client
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 from typing import (
     Any,
+    AsyncIterator,
     ClassVar,
+    Iterator,
     Literal,
     TypedDict,
 )
@@ -193,6 +195,25 @@ class Setting:
         error_format: Literal["detailed", "simple", "code_only"] | None = ...,
     ) -> SettingObject: ...
     
+    # Auto-pagination (start/count windows)
+    def iter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> Iterator[FortiObject[Any]]: ...
+    
+    def aiter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> AsyncIterator[FortiObject[Any]]: ...
+    
     def get_schema(
         self,
         vdom: str | None = ...,
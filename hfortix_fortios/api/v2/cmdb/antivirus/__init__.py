@@ -1,9 +1,6 @@
 """FortiOS CMDB - Antivirus category"""
 
-from .exempt_list import ExemptList
-from .profile import Profile
-from .quarantine import Quarantine
-from .settings import Settings
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Antivirus",
@@ -13,17 +10,28 @@ __all__ = [
     "Settings",
 ]
 
+_LAZY_IMPORTS = {
+    "ExemptList": (".exempt_list", "ExemptList"),
+    "Profile": (".profile", "Profile"),
+    "Quarantine": (".quarantine", "Quarantine"),
+    "Settings": (".settings", "Settings"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Antivirus:
     """Antivirus endpoints wrapper for CMDB API."""
 
+    exempt_list = LazyEndpoint(".exempt_list", "ExemptList")
+    profile = LazyEndpoint(".profile", "Profile")
+    quarantine = LazyEndpoint(".quarantine", "Quarantine")
+    settings = LazyEndpoint(".settings", "Settings")
+
     def __init__(self, client):
         """Antivirus endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.exempt_list = ExemptList(client)
-        self.profile = Profile(client)
-        self.quarantine = Quarantine(client)
-        self.settings = Settings(client)
+        self._client = client
@@ -10,12 +10,18 @@ from __future__ import annotations
 
 from typing import (
     Any,
+    AsyncIterator,
     ClassVar,
+    Iterable,
+    Iterator,
     Literal,
     TypedDict,
     overload,
 )
 
+from hfortix_fortios._helpers.bulk import BulkResult
+from hfortix_fortios._helpers.sync import SyncPlan
+from hfortix_fortios._helpers.lookup import LookupResult
 from hfortix_fortios.models import (
     FortiObject,
     FortiObjectList,
@@ -125,6 +131,25 @@ class ExemptList:
         error_format: Literal["detailed", "simple", "code_only"] | None = ...,
     ) -> FortiObjectList[ExemptListObject]: ...
     
+    # Auto-pagination (start/count windows)
+    def iter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> Iterator[ExemptListObject]: ...
+    
+    def aiter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> AsyncIterator[ExemptListObject]: ...
+    
     def get_schema(
         self,
         vdom: str | None = ...,
@@ -189,6 +214,14 @@ class ExemptList:
         vdom: str | bool | None = ...,
         **kwargs: Any,
     ) -> FortiObject[Any]: ...
+    
+    def reorder(
+        self,
+        desired_keys: Iterable[Any],
+        dry_run: bool = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        vdom: str | bool | None = ...,
+    ) -> BulkResult: ...
 
 
     # ================================================================
@@ -210,10 +243,78 @@ class ExemptList:
         hash: str | None = ...,
         status: Literal["disable", "enable"] | None = ...,
         vdom: str | bool | None = ...,
+        upsert_strategy: Literal["check", "post_first", "put_first"] | None = ...,
         error_mode: Literal["raise", "return", "print"] | None = ...,
         error_format: Literal["detailed", "simple", "code_only"] | None = ...,
     ) -> FortiObject[Any]: ...
     
+    # Bulk operations (bounded concurrency)
+    def bulk_post(
+        self,
+        payloads: Iterable[ExemptListPayload | dict[str, Any]],
+        concurrency: int | None = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        vdom: str | bool | None = ...,
+        **kwargs: Any,
+    ) -> BulkResult: ...
+    
+    def bulk_put(
+        self,
+        payloads: Iterable[ExemptListPayload | dict[str, Any]],
+        concurrency: int | None = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        vdom: str | bool | None = ...,
+        **kwargs: Any,
+    ) -> BulkResult: ...
+    
+    def bulk_set(
+        self,
+        payloads: Iterable[ExemptListPayload | dict[str, Any]],
+        concurrency: int | None = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        upsert_strategy: Literal["check", "post_first", "put_first"] | None = ...,
+        vdom: str | bool | None = ...,
+        **kwargs: Any,
+    ) -> BulkResult: ...
+    
+    def bulk_delete(
+        self,
+        keys: Iterable[Any],
+        concurrency: int | None = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        vdom: str | bool | None = ...,
+        **kwargs: Any,
+    ) -> BulkResult: ...
+    
+    def sync(
+        self,
+        desired: Iterable[Any],
+        prune: bool = ...,
+        dry_run: bool = ...,
+        concurrency: int | None = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        vdom: str | bool | None = ...,
+    ) -> SyncPlan: ...
+    
+    def exists_many(
+        self,
+        keys: Iterable[Any],
+        strategy: Literal["auto", "column", "filter"] = ...,
+        batch_size: int = ...,
+        concurrency: int | None = ...,
+        vdom: str | bool | None = ...,
+    ) -> LookupResult: ...
+    
+    def get_many(
+        self,
+        keys: Iterable[Any],
+        fields: Iterable[str] | None = ...,
+        strategy: Literal["auto", "column", "filter"] = ...,
+        batch_size: int = ...,
+        concurrency: int | None = ...,
+        vdom: str | bool | None = ...,
+    ) -> LookupResult: ...
+    
     # Helper methods
     @staticmethod
     def help(field_name: str | None = ...) -> str: ...
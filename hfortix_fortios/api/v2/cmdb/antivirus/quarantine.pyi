@@ -10,7 +10,9 @@ from __future__ import annotations
 
 from typing import (
     Any,
+    AsyncIterator,
     ClassVar,
+    Iterator,
     Literal,
     TypedDict,
 )
@@ -115,6 +117,25 @@ class Quarantine:
         error_format: Literal["detailed", "simple", "code_only"] | None = ...,
     ) -> QuarantineObject: ...
     
+    # Auto-pagination (start/count windows)
+    def iter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> Iterator[FortiObject[Any]]: ...
+    
+    def aiter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> AsyncIterator[FortiObject[Any]]: ...
+    
     def get_schema(
         self,
         vdom: str | None = ...,
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 from typing import (
     Any,
+    AsyncIterator,
     ClassVar,
+    Iterator,
     Literal,
     TypedDict,
 )
@@ -103,6 +105,25 @@ class Settings:
         error_format: Literal["detailed", "simple", "code_only"] | None = ...,
     ) -> SettingsObject: ...
     
+    # Auto-pagination (start/count windows)
+    def iter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> Iterator[FortiObject[Any]]: ...
+    
+    def aiter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> AsyncIterator[FortiObject[Any]]: ...
+    
     def get_schema(
         self,
         vdom: str | None = ...,
@@ -1,10 +1,6 @@
 """FortiOS CMDB - Application category"""
 
-from .custom import Custom
-from .group import Group
-from .list import List
-from .name import Name
-from .rule_settings import RuleSettings
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Application",
@@ -15,18 +11,30 @@ __all__ = [
     "RuleSettings",
 ]
 
+_LAZY_IMPORTS = {
+    "Custom": (".custom", "Custom"),
+    "Group": (".group", "Group"),
+    "List": (".list", "List"),
+    "Name": (".name", "Name"),
+    "RuleSettings": (".rule_settings", "RuleSettings"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Application:
     """Application endpoints wrapper for CMDB API."""
 
+    custom = LazyEndpoint(".custom", "Custom")
+    group = LazyEndpoint(".group", "Group")
+    list = LazyEndpoint(".list", "List")
+    name = LazyEndpoint(".name", "Name")
+    rule_settings = LazyEndpoint(".rule_settings", "RuleSettings")
+
     def __init__(self, client):
         """Application endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.custom = Custom(client)
-        self.group = Group(client)
-        self.list = List(client)
-        self.name = Name(client)
-        self.rule_settings = RuleSettings(client)
+        self._client = client
@@ -45,6 +45,10 @@ if TYPE_CHECKING:
 from hfortix_fortios._helpers import (
     build_api_payload,
     build_cmdb_payload,  # Keep for backward compatibility / manual usage
+    compile_filter,  # Cached filter/query compilation
+    validate_payload,  # Client-side payload validation
+    upsert,  # set() create-or-update strategies
+    move_object,  # move() neighbour lookups
     is_success,
     quote_path_param,  # URL encoding for path parameters
 )
@@ -175,58 +179,10 @@ class Custom(CRUDEndpoint, MetadataMixin):
         params = payload_dict.copy() if payload_dict else {}
         
         # Add explicit query parameters
-        # Handle filter parameter specially to support FortiOS AND syntax with multiple filters
-        # FortiOS uses: ?filter=a&filter=b for AND operations
-        # Normalize filter syntax to support all common formats:
-        #   1. name=@test&name!@web (implicit & separator)
-        #   2. name=@test&filter=name!@web (mixed implicit/explicit)
-        #   3. filter=name=@test&filter=name!@web (explicit with filter= prefix)
-        #   4. filter=name=@test&name!@web (explicit prefix with implicit separator)
+        # Handle filter parameter: strings ("a&b", "filter=a&filter=b"), lists
+        # of strings and F expressions compile (cached) to FortiOS AND/OR syntax
         if filter is not None:
-            normalized_filter = filter
-            
-            # Step 1: Remove leading "filter=" if present (normalize input format)
-            # "filter=name=@test&..." -> "name=@test&..."
-            if normalized_filter.startswith("filter="):
-                normalized_filter = normalized_filter[7:]  # Remove "filter=" prefix
-            
-            # Step 2: Normalize & separators to &filter=
-            # This handles all variations: "a&b", "a&filter=b", etc.
-            if "&" in normalized_filter:
-                # Split on both & and &filter= to get all filter parts
-                # Then rejoin with &filter= for consistency
-                parts = []
-                current = normalized_filter
-                
-                # Split on &filter= first to preserve already-explicit parts
-                while "&filter=" in current:
-                    before, after = current.split("&filter=", 1)
-                    # Now split 'before' on & if it contains any
-                    if "&" in before:
-                        parts.extend(before.split("&"))
-                    else:
-                        parts.append(before)
-                    current = after
-                
-                # Handle remaining part (after last &filter= or the whole string if no &filter=)
-                if "&" in current:
-                    parts.extend(current.split("&"))
-                else:
-                    parts.append(current)
-                
-                # Rejoin with &filter= separator
-                if len(parts) > 1:
-                    normalized_filter = parts[0] + "".join(f"&filter={part}" for part in parts[1:])
-            
-            # Step 3: Check if we have multiple filters (AND operation)
-            if "&filter=" in normalized_filter:
-                # Multiple filters for AND operation: "filter1&filter=filter2&filter=filter3"
-                # Split and create list of filter values
-                filters = [normalized_filter.split("&filter=")[0]]  # First filter before &filter=
-                filters.extend(normalized_filter.split("&filter=")[1:])  # Remaining filters after each &filter=
-                params["filter"] = filters
-            else:
-                params["filter"] = normalized_filter
+            params["filter"] = compile_filter(filter)
         if sort is not None:
             params["sort"] = sort
         if format is not None:
@@ -400,6 +356,8 @@ class Custom(CRUDEndpoint, MetadataMixin):
         if q_scope is not None:
             params["scope"] = q_scope
         
+        # Client-side validation (FortiOS(validate=...)); no-op when off
+        validate_payload(self, payload_data, "PUT")
         return self._client.put(  # type: ignore[return-value]
             "cmdb", endpoint, data=payload_data, params=params, vdom=vdom        )
 
@@ -514,6 +472,8 @@ class Custom(CRUDEndpoint, MetadataMixin):
         if q_scope is not None:
             params["scope"] = q_scope
         
+        # Client-side validation (FortiOS(validate=...)); no-op when off
+        validate_payload(self, payload_data, "POST")
         return self._client.post(  # type: ignore[return-value]
             "cmdb", endpoint, data=payload_data, params=params, vdom=vdom        )
 
@@ -619,7 +579,11 @@ class Custom(CRUDEndpoint, MetadataMixin):
             if hasattr(result, '__await__'):
                 # Async response - return coroutine that checks status
                 async def _check() -> bool:
-                    r = await result  # type: ignore[misc]
+                    try:
+                        r = await result  # type: ignore[misc]
+                    except Exception:
+                        # Same as the sync branch: existence not confirmed
+                        return False
                     return r.http_status == "success"  # type: ignore[union-attr]
                 return _check()
             else:
@@ -643,6 +607,7 @@ class Custom(CRUDEndpoint, MetadataMixin):
         behavior: str | None = None,
         vendor: str | None = None,
         vdom: str | bool | None = None,
+        upsert_strategy: Literal["check", "post_first", "put_first"] | None = None,
         error_mode: Literal["raise", "return", "print"] | None = None,
         error_format: Literal["detailed", "simple", "code_only"] | None = None,
         **kwargs: Any,
@@ -665,6 +630,7 @@ class Custom(CRUDEndpoint, MetadataMixin):
             behavior: Field behavior
             vendor: Field vendor
             vdom: Virtual domain name
+            upsert_strategy: "check", "post_first" or "put_first" (see Note)
             **kwargs: Additional parameters passed to PUT or POST
 
         Returns:
@@ -695,8 +661,10 @@ class Custom(CRUDEndpoint, MetadataMixin):
             >>> # Safely applies configuration regardless of current state
 
         Note:
-            This method internally calls exists() then either post() or put().
-            For performance-critical code with known state, call post() or put() directly.
+            upsert_strategy (default: FortiOS(upsert_strategy=...), "check")
+            picks the round trips: "check" calls exists() then put() or
+            post(); "post_first" POSTs and falls back to PUT on a duplicate
+            entry; "put_first" PUTs and falls back to POST on 404.
 
         See Also:
             - post(): Create new object
@@ -725,13 +693,15 @@ class Custom(CRUDEndpoint, MetadataMixin):
         if not mkey_value:
             raise ValueError("tag is required for set()")
         
-        # Check if resource exists
-        if self.exists(tag=mkey_value, vdom=vdom):
-            # Update existing resource
-            return self.put(payload_dict=payload_data, vdom=vdom, **kwargs)
-        else:
-            # Create new resource
-            return self.post(payload_dict=payload_data, vdom=vdom, **kwargs)
+        # Create or update; strategy defaults to FortiOS(upsert_strategy=...)
+        return upsert(
+            self,
+            payload_data,
+            {"tag": mkey_value},
+            strategy=upsert_strategy,
+            vdom=vdom,
+            **kwargs,
+        )
 
     # ========================================================================
     # Action: Move
@@ -785,71 +755,17 @@ class Custom(CRUDEndpoint, MetadataMixin):
             ...     reference_tag=50
             ... )
         """
-        # Handle numeric position (1-based index)
-        if isinstance(position, int):
-            if position < 1:
-                raise ValueError(f"Position must be >= 1, got {position}")
-            
-            # Get all objects to find the target position
-            all_objects = self.get(vdom=vdom)
-            if not all_objects:
-                raise ValueError("Cannot move to position {position} - no objects found")
-            
-            # Validate position is within range (can be len+1 to append at end)
-            if position > len(all_objects) + 1:
-                raise ValueError(
-                    f"Position {position} is out of range. Valid range: 1-{len(all_objects) + 1} "
-                    f"({len(all_objects)} objects exist)"
-                )
-            
-            # Convert to before/after operation
-            if position == 1:
-                # Move to first position
-                reference_tag = all_objects[0].tag
-                actual_position = "before"
-            elif position > len(all_objects):
-                # Move to last position (after all existing objects)
-                reference_tag = all_objects[-1].tag
-                actual_position = "after"
-            else:
-                # Move before the object currently at that position
-                reference_tag = all_objects[position - 1].tag
-                actual_position = "before"
-        
-        # Handle top/bottom string positions
-        elif position in ("top", "bottom"):
-            # Get all objects to find first/last
-            all_objects = self.get(vdom=vdom)
-            if not all_objects:
-                raise ValueError(f"Cannot move to {position} - no objects found")
-            
-            if position == "top":
-                # Move before first object
-                reference_tag = all_objects[0].tag
-                actual_position = "before"
-            else:  # bottom
-                # Move after last object
-                reference_tag = all_objects[-1].tag
-                actual_position = "after"
-        
-        # Handle before/after string positions
-        else:
-            # Validate reference is provided for before/after
-            if reference_tag is None:
-                raise ValueError(f"reference_tag is required when position='{position}'")
-            actual_position = position
-        
-        # Build params for move operation
-        params = {
-            "action": "move",
-            actual_position: reference_tag,
-            **kwargs,
-        }
-        
-        # Move requires the mkey in the endpoint path
-        endpoint = "/application/custom/" + quote_path_param(tag)
-        return self._client.put(  # type: ignore[return-value]
-            "cmdb", endpoint, data={}, params=params, vdom=vdom        )
+        # Looks up only the neighbour's key (mkey column, one-row window)
+        return move_object(  # type: ignore[return-value]
+            self,
+            "/application/custom",
+            tag,
+            position,
+            reference_tag,
+            "reference_tag",
+            params=kwargs,
+            vdom=vdom,
+        )
 
 
 
@@ -10,12 +10,18 @@ from __future__ import annotations
 
 from typing import (
     Any,
+    AsyncIterator,
     ClassVar,
+    Iterable,
+    Iterator,
     Literal,
     TypedDict,
     overload,
 )
 
+from hfortix_fortios._helpers.bulk import BulkResult
+from hfortix_fortios._helpers.sync import SyncPlan
+from hfortix_fortios._helpers.lookup import LookupResult
 from hfortix_fortios.models import (
     FortiObject,
     FortiObjectList,
@@ -173,6 +179,25 @@ class Group:
         error_format: Literal["detailed", "simple", "code_only"] | None = ...,
     ) -> FortiObjectList[GroupObject]: ...
     
+    # Auto-pagination (start/count windows)
+    def iter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> Iterator[GroupObject]: ...
+    
+    def aiter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> AsyncIterator[GroupObject]: ...
+    
     def get_schema(
         self,
         vdom: str | None = ...,
@@ -249,6 +274,14 @@ class Group:
         vdom: str | bool | None = ...,
         **kwargs: Any,
     ) -> FortiObject[Any]: ...
+    
+    def reorder(
+        self,
+        desired_keys: Iterable[Any],
+        dry_run: bool = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        vdom: str | bool | None = ...,
+    ) -> BulkResult: ...
 
 
     # ================================================================
@@ -276,10 +309,78 @@ class Group:
         behavior: str | list[str] | None = ...,
         popularity: Literal["1", "2", "3", "4", "5"] | list[str] | None = ...,
         vdom: str | bool | None = ...,
+        upsert_strategy: Literal["check", "post_first", "put_first"] | None = ...,
         error_mode: Literal["raise", "return", "print"] | None = ...,
         error_format: Literal["detailed", "simple", "code_only"] | None = ...,
     ) -> FortiObject[Any]: ...
     
+    # Bulk operations (bounded concurrency)
+    def bulk_post(
+        self,
+        payloads: Iterable[GroupPayload | dict[str, Any]],
+        concurrency: int | None = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        vdom: str | bool | None = ...,
+        **kwargs: Any,
+    ) -> BulkResult: ...
+    
+    def bulk_put(
+        self,
+        payloads: Iterable[GroupPayload | dict[str, Any]],
+        concurrency: int | None = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        vdom: str | bool | None = ...,
+        **kwargs: Any,
+    ) -> BulkResult: ...
+    
+    def bulk_set(
+        self,
+        payloads: Iterable[GroupPayload | dict[str, Any]],
+        concurrency: int | None = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        upsert_strategy: Literal["check", "post_first", "put_first"] | None = ...,
+        vdom: str | bool | None = ...,
+        **kwargs: Any,
+    ) -> BulkResult: ...
+    
+    def bulk_delete(
+        self,
+        keys: Iterable[Any],
+        concurrency: int | None = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        vdom: str | bool | None = ...,
+        **kwargs: Any,
+    ) -> BulkResult: ...
+    
+    def sync(
+        self,
+        desired: Iterable[Any],
+        prune: bool = ...,
+        dry_run: bool = ...,
+        concurrency: int | None = ...,
+        on_error: Literal["continue", "stop"] = ...,
+        vdom: str | bool | None = ...,
+    ) -> SyncPlan: ...
+    
+    def exists_many(
+        self,
+        keys: Iterable[Any],
+        strategy: Literal["auto", "column", "filter"] = ...,
+        batch_size: int = ...,
+        concurrency: int | None = ...,
+        vdom: str | bool | None = ...,
+    ) -> LookupResult: ...
+    
+    def get_many(
+        self,
+        keys: Iterable[Any],
+        fields: Iterable[str] | None = ...,
+        strategy: Literal["auto", "column", "filter"] = ...,
+        batch_size: int = ...,
+        concurrency: int | None = ...,
+        vdom: str | bool | None = ...,
+    ) -> LookupResult: ...
+    
     # Helper methods
     @staticmethod
     def help(field_name: str | None = ...) -> str: ...
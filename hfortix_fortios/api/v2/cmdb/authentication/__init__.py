@@ -1,8 +1,6 @@
 """FortiOS CMDB - Authentication category"""
 
-from .rule import Rule
-from .scheme import Scheme
-from .setting import Setting
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Authentication",
@@ -11,16 +9,26 @@ __all__ = [
     "Setting",
 ]
 
+_LAZY_IMPORTS = {
+    "Rule": (".rule", "Rule"),
+    "Scheme": (".scheme", "Scheme"),
+    "Setting": (".setting", "Setting"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Authentication:
     """Authentication endpoints wrapper for CMDB API."""
 
+    rule = LazyEndpoint(".rule", "Rule")
+    scheme = LazyEndpoint(".scheme", "Scheme")
+    setting = LazyEndpoint(".setting", "Setting")
+
     def __init__(self, client):
         """Authentication endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.rule = Rule(client)
-        self.scheme = Scheme(client)
-        self.setting = Setting(client)
+        self._client = client
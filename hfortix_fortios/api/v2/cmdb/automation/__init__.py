@@ -1,20 +1,28 @@
 """FortiOS CMDB - Automation category"""
 
-from .setting import Setting
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Automation",
     "Setting",
 ]
 
+_LAZY_IMPORTS = {
+    "Setting": (".setting", "Setting"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Automation:
     """Automation endpoints wrapper for CMDB API."""
 
+    setting = LazyEndpoint(".setting", "Setting")
+
     def __init__(self, client):
         """Automation endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.setting = Setting(client)
+        self._client = client
@@ -1,9 +1,6 @@
 """FortiOS CMDB - Casb category"""
 
-from .attribute_match import AttributeMatch
-from .profile import Profile
-from .saas_application import SaasApplication
-from .user_activity import UserActivity
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AttributeMatch",
@@ -13,17 +10,28 @@ __all__ = [
     "UserActivity",
 ]
 
+_LAZY_IMPORTS = {
+    "AttributeMatch": (".attribute_match", "AttributeMatch"),
+    "Profile": (".profile", "Profile"),
+    "SaasApplication": (".saas_application", "SaasApplication"),
+    "UserActivity": (".user_activity", "UserActivity"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Casb:
     """Casb endpoints wrapper for CMDB API."""
 
+    attribute_match = LazyEndpoint(".attribute_match", "AttributeMatch")
+    profile = LazyEndpoint(".profile", "Profile")
+    saas_application = LazyEndpoint(".saas_application", "SaasApplication")
+    user_activity = LazyEndpoint(".user_activity", "UserActivity")
+
     def __init__(self, client):
         """Casb endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.attribute_match = AttributeMatch(client)
-        self.profile = Profile(client)
-        self.saas_application = SaasApplication(client)
-        self.user_activity = UserActivity(client)
+        self._client = client
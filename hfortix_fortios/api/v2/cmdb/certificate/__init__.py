@@ -1,10 +1,6 @@
 """FortiOS CMDB - Certificate category"""
 
-from .ca import Ca
-from .crl import Crl
-from .hsm_local import HsmLocal
-from .local import Local
-from .remote import Remote
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Ca",
@@ -15,18 +11,30 @@ __all__ = [
     "Remote",
 ]
 
+_LAZY_IMPORTS = {
+    "Ca": (".ca", "Ca"),
+    "Crl": (".crl", "Crl"),
+    "HsmLocal": (".hsm_local", "HsmLocal"),
+    "Local": (".local", "Local"),
+    "Remote": (".remote", "Remote"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Certificate:
     """Certificate endpoints wrapper for CMDB API."""
 
+    ca = LazyEndpoint(".ca", "Ca")
+    crl = LazyEndpoint(".crl", "Crl")
+    hsm_local = LazyEndpoint(".hsm_local", "HsmLocal")
+    local = LazyEndpoint(".local", "Local")
+    remote = LazyEndpoint(".remote", "Remote")
+
     def __init__(self, client):
         """Certificate endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.ca = Ca(client)
-        self.crl = Crl(client)
-        self.hsm_local = HsmLocal(client)
-        self.local = Local(client)
-        self.remote = Remote(client)
+        self._client = client
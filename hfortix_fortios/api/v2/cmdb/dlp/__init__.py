@@ -1,13 +1,6 @@
 """FortiOS CMDB - Dlp category"""
 
-from .data_type import DataType
-from .dictionary import Dictionary
-from .exact_data_match import ExactDataMatch
-from .filepattern import Filepattern
-from .label import Label
-from .profile import Profile
-from .sensor import Sensor
-from .settings import Settings
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "DataType",
@@ -21,21 +14,36 @@ __all__ = [
     "Settings",
 ]
 
+_LAZY_IMPORTS = {
+    "DataType": (".data_type", "DataType"),
+    "Dictionary": (".dictionary", "Dictionary"),
+    "ExactDataMatch": (".exact_data_match", "ExactDataMatch"),
+    "Filepattern": (".filepattern", "Filepattern"),
+    "Label": (".label", "Label"),
+    "Profile": (".profile", "Profile"),
+    "Sensor": (".sensor", "Sensor"),
+    "Settings": (".settings", "Settings"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Dlp:
     """Dlp endpoints wrapper for CMDB API."""
 
+    data_type = LazyEndpoint(".data_type", "DataType")
+    dictionary = LazyEndpoint(".dictionary", "Dictionary")
+    exact_data_match = LazyEndpoint(".exact_data_match", "ExactDataMatch")
+    filepattern = LazyEndpoint(".filepattern", "Filepattern")
+    label = LazyEndpoint(".label", "Label")
+    profile = LazyEndpoint(".profile", "Profile")
+    sensor = LazyEndpoint(".sensor", "Sensor")
+    settings = LazyEndpoint(".settings", "Settings")
+
     def __init__(self, client):
         """Dlp endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.data_type = DataType(client)
-        self.dictionary = Dictionary(client)
-        self.exact_data_match = ExactDataMatch(client)
-        self.filepattern = Filepattern(client)
-        self.label = Label(client)
-        self.profile = Profile(client)
-        self.sensor = Sensor(client)
-        self.settings = Settings(client)
+        self._client = client
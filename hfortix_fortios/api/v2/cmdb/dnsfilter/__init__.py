@@ -1,7 +1,6 @@
 """FortiOS CMDB - Dnsfilter category"""
 
-from .domain_filter import DomainFilter
-from .profile import Profile
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Dnsfilter",
@@ -9,15 +8,24 @@ __all__ = [
     "Profile",
 ]
 
+_LAZY_IMPORTS = {
+    "DomainFilter": (".domain_filter", "DomainFilter"),
+    "Profile": (".profile", "Profile"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Dnsfilter:
     """Dnsfilter endpoints wrapper for CMDB API."""
 
+    domain_filter = LazyEndpoint(".domain_filter", "DomainFilter")
+    profile = LazyEndpoint(".profile", "Profile")
+
     def __init__(self, client):
         """Dnsfilter endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.domain_filter = DomainFilter(client)
-        self.profile = Profile(client)
+        self._client = client
@@ -1,13 +1,6 @@
 """FortiOS CMDB - Emailfilter category"""
 
-from .block_allow_list import BlockAllowList
-from .bword import Bword
-from .dnsbl import Dnsbl
-from .fortishield import Fortishield
-from .iptrust import Iptrust
-from .mheader import Mheader
-from .options import Options
-from .profile import Profile
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "BlockAllowList",
@@ -21,21 +14,36 @@ __all__ = [
     "Profile",
 ]
 
+_LAZY_IMPORTS = {
+    "BlockAllowList": (".block_allow_list", "BlockAllowList"),
+    "Bword": (".bword", "Bword"),
+    "Dnsbl": (".dnsbl", "Dnsbl"),
+    "Fortishield": (".fortishield", "Fortishield"),
+    "Iptrust": (".iptrust", "Iptrust"),
+    "Mheader": (".mheader", "Mheader"),
+    "Options": (".options", "Options"),
+    "Profile": (".profile", "Profile"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Emailfilter:
     """Emailfilter endpoints wrapper for CMDB API."""
 
+    block_allow_list = LazyEndpoint(".block_allow_list", "BlockAllowList")
+    bword = LazyEndpoint(".bword", "Bword")
+    dnsbl = LazyEndpoint(".dnsbl", "Dnsbl")
+    fortishield = LazyEndpoint(".fortishield", "Fortishield")
+    iptrust = LazyEndpoint(".iptrust", "Iptrust")
+    mheader = LazyEndpoint(".mheader", "Mheader")
+    options = LazyEndpoint(".options", "Options")
+    profile = LazyEndpoint(".profile", "Profile")
+
     def __init__(self, client):
         """Emailfilter endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.block_allow_list = BlockAllowList(client)
-        self.bword = Bword(client)
-        self.dnsbl = Dnsbl(client)
-        self.fortishield = Fortishield(client)
-        self.iptrust = Iptrust(client)
-        self.mheader = Mheader(client)
-        self.options = Options(client)
-        self.profile = Profile(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - EndpointControl category"""
 
-from .fctems import Fctems
-from .fctems_override import FctemsOverride
-from .settings import Settings
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "EndpointControl",
@@ -11,16 +9,26 @@ __all__ = [
     "Settings",
 ]
 
+_LAZY_IMPORTS = {
+    "Fctems": (".fctems", "Fctems"),
+    "FctemsOverride": (".fctems_override", "FctemsOverride"),
+    "Settings": (".settings", "Settings"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class EndpointControl:
     """EndpointControl endpoints wrapper for CMDB API."""
 
+    fctems = LazyEndpoint(".fctems", "Fctems")
+    fctems_override = LazyEndpoint(".fctems_override", "FctemsOverride")
+    settings = LazyEndpoint(".settings", "Settings")
+
     def __init__(self, client):
         """EndpointControl endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.fctems = Fctems(client)
-        self.fctems_override = FctemsOverride(client)
-        self.settings = Settings(client)
+        self._client = client
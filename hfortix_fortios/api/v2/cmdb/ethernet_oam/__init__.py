@@ -1,20 +1,28 @@
 """FortiOS CMDB - EthernetOam category"""
 
-from .cfm import Cfm
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Cfm",
     "EthernetOam",
 ]
 
+_LAZY_IMPORTS = {
+    "Cfm": (".cfm", "Cfm"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class EthernetOam:
     """EthernetOam endpoints wrapper for CMDB API."""
 
+    cfm = LazyEndpoint(".cfm", "Cfm")
+
     def __init__(self, client):
         """EthernetOam endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.cfm = Cfm(client)
+        self._client = client
@@ -1,11 +1,6 @@
 """FortiOS CMDB - ExtensionController category"""
 
-from .dataplan import Dataplan
-from .extender import Extender
-from .extender_profile import ExtenderProfile
-from .extender_vap import ExtenderVap
-from .fortigate import Fortigate
-from .fortigate_profile import FortigateProfile
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Dataplan",
@@ -17,19 +12,32 @@ __all__ = [
     "FortigateProfile",
 ]
 
+_LAZY_IMPORTS = {
+    "Dataplan": (".dataplan", "Dataplan"),
+    "Extender": (".extender", "Extender"),
+    "ExtenderProfile": (".extender_profile", "ExtenderProfile"),
+    "ExtenderVap": (".extender_vap", "ExtenderVap"),
+    "Fortigate": (".fortigate", "Fortigate"),
+    "FortigateProfile": (".fortigate_profile", "FortigateProfile"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ExtensionController:
     """ExtensionController endpoints wrapper for CMDB API."""
 
+    dataplan = LazyEndpoint(".dataplan", "Dataplan")
+    extender = LazyEndpoint(".extender", "Extender")
+    extender_profile = LazyEndpoint(".extender_profile", "ExtenderProfile")
+    extender_vap = LazyEndpoint(".extender_vap", "ExtenderVap")
+    fortigate = LazyEndpoint(".fortigate", "Fortigate")
+    fortigate_profile = LazyEndpoint(".fortigate_profile", "FortigateProfile")
+
     def __init__(self, client):
         """ExtensionController endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.dataplan = Dataplan(client)
-        self.extender = Extender(client)
-        self.extender_profile = ExtenderProfile(client)
-        self.extender_vap = ExtenderVap(client)
-        self.fortigate = Fortigate(client)
-        self.fortigate_profile = FortigateProfile(client)
+        self._client = client
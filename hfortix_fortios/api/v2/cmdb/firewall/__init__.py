@@ -1,84 +1,6 @@
 """FortiOS CMDB - Firewall category"""
 
-from . import ipmacbinding
-from . import schedule
-from . import service
-from . import shaper
-from . import ssh
-from . import ssl
-from . import wildcard_fqdn
-from .DoS_policy import DosPolicy
-from .DoS_policy6 import DosPolicy6
-from .access_proxy import AccessProxy
-from .access_proxy6 import AccessProxy6
-from .access_proxy_ssh_client_cert import AccessProxySshClientCert
-from .access_proxy_virtual_host import AccessProxyVirtualHost
-from .address import Address
-from .address6 import Address6
-from .address6_template import Address6Template
-from .addrgrp import Addrgrp
-from .addrgrp6 import Addrgrp6
-from .auth_portal import AuthPortal
-from .central_snat_map import CentralSnatMap
-from .city import City
-from .country import Country
-from .decrypted_traffic_mirror import DecryptedTrafficMirror
-from .dnstranslation import Dnstranslation
-from .global_ import Global
-from .identity_based_route import IdentityBasedRoute
-from .interface_policy import InterfacePolicy
-from .interface_policy6 import InterfacePolicy6
-from .internet_service import InternetService
-from .internet_service_addition import InternetServiceAddition
-from .internet_service_append import InternetServiceAppend
-from .internet_service_botnet import InternetServiceBotnet
-from .internet_service_custom import InternetServiceCustom
-from .internet_service_custom_group import InternetServiceCustomGroup
-from .internet_service_definition import InternetServiceDefinition
-from .internet_service_extension import InternetServiceExtension
-from .internet_service_fortiguard import InternetServiceFortiguard
-from .internet_service_group import InternetServiceGroup
-from .internet_service_ipbl_reason import InternetServiceIpblReason
-from .internet_service_ipbl_vendor import InternetServiceIpblVendor
-from .internet_service_list import InternetServiceList
-from .internet_service_name import InternetServiceName
-from .internet_service_owner import InternetServiceOwner
-from .internet_service_reputation import InternetServiceReputation
-from .internet_service_sld import InternetServiceSld
-from .internet_service_subapp import InternetServiceSubapp
-from .ip_translation import IpTranslation
-from .ippool import Ippool
-from .ippool6 import Ippool6
-from .ldb_monitor import LdbMonitor
-from .local_in_policy import LocalInPolicy
-from .local_in_policy6 import LocalInPolicy6
-from .multicast_address import MulticastAddress
-from .multicast_address6 import MulticastAddress6
-from .multicast_policy import MulticastPolicy
-from .multicast_policy6 import MulticastPolicy6
-from .network_service_dynamic import NetworkServiceDynamic
-from .on_demand_sniffer import OnDemandSniffer
-from .policy import Policy
-from .profile_group import ProfileGroup
-from .profile_protocol_options import ProfileProtocolOptions
-from .proxy_address import ProxyAddress
-from .proxy_addrgrp import ProxyAddrgrp
-from .proxy_policy import ProxyPolicy
-from .region import Region
-from .security_policy import SecurityPolicy
-from .shaping_policy import ShapingPolicy
-from .shaping_profile import ShapingProfile
-from .sniffer import Sniffer
-from .ssl_server import SslServer
-from .ssl_ssh_profile import SslSshProfile
-from .traffic_class import TrafficClass
-from .ttl_policy import TtlPolicy
-from .vendor_mac import VendorMac
-from .vendor_mac_summary import VendorMacSummary
-from .vip import Vip
-from .vip6 import Vip6
-from .vipgrp import Vipgrp
-from .vipgrp6 import Vipgrp6
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AccessProxy",
@@ -163,92 +85,178 @@ __all__ = [
     "WildcardFqdn",
 ]
 
+_LAZY_IMPORTS = {
+    "ipmacbinding": (".ipmacbinding", None),
+    "schedule": (".schedule", None),
+    "service": (".service", None),
+    "shaper": (".shaper", None),
+    "ssh": (".ssh", None),
+    "ssl": (".ssl", None),
+    "wildcard_fqdn": (".wildcard_fqdn", None),
+    "DosPolicy": (".DoS_policy", "DosPolicy"),
+    "DosPolicy6": (".DoS_policy6", "DosPolicy6"),
+    "AccessProxy": (".access_proxy", "AccessProxy"),
+    "AccessProxy6": (".access_proxy6", "AccessProxy6"),
+    "AccessProxySshClientCert": (".access_proxy_ssh_client_cert", "AccessProxySshClientCert"),
+    "AccessProxyVirtualHost": (".access_proxy_virtual_host", "AccessProxyVirtualHost"),
+    "Address": (".address", "Address"),
+    "Address6": (".address6", "Address6"),
+    "Address6Template": (".address6_template", "Address6Template"),
+    "Addrgrp": (".addrgrp", "Addrgrp"),
+    "Addrgrp6": (".addrgrp6", "Addrgrp6"),
+    "AuthPortal": (".auth_portal", "AuthPortal"),
+    "CentralSnatMap": (".central_snat_map", "CentralSnatMap"),
+    "City": (".city", "City"),
+    "Country": (".country", "Country"),
+    "DecryptedTrafficMirror": (".decrypted_traffic_mirror", "DecryptedTrafficMirror"),
+    "Dnstranslation": (".dnstranslation", "Dnstranslation"),
+    "Global": (".global_", "Global"),
+    "IdentityBasedRoute": (".identity_based_route", "IdentityBasedRoute"),
+    "InterfacePolicy": (".interface_policy", "InterfacePolicy"),
+    "InterfacePolicy6": (".interface_policy6", "InterfacePolicy6"),
+    "InternetService": (".internet_service", "InternetService"),
+    "InternetServiceAddition": (".internet_service_addition", "InternetServiceAddition"),
+    "InternetServiceAppend": (".internet_service_append", "InternetServiceAppend"),
+    "InternetServiceBotnet": (".internet_service_botnet", "InternetServiceBotnet"),
+    "InternetServiceCustom": (".internet_service_custom", "InternetServiceCustom"),
+    "InternetServiceCustomGroup": (".internet_service_custom_group", "InternetServiceCustomGroup"),
+    "InternetServiceDefinition": (".internet_service_definition", "InternetServiceDefinition"),
+    "InternetServiceExtension": (".internet_service_extension", "InternetServiceExtension"),
+    "InternetServiceFortiguard": (".internet_service_fortiguard", "InternetServiceFortiguard"),
+    "InternetServiceGroup": (".internet_service_group", "InternetServiceGroup"),
+    "InternetServiceIpblReason": (".internet_service_ipbl_reason", "InternetServiceIpblReason"),
+    "InternetServiceIpblVendor": (".internet_service_ipbl_vendor", "InternetServiceIpblVendor"),
+    "InternetServiceList": (".internet_service_list", "InternetServiceList"),
+    "InternetServiceName": (".internet_service_name", "InternetServiceName"),
+    "InternetServiceOwner": (".internet_service_owner", "InternetServiceOwner"),
+    "InternetServiceReputation": (".internet_service_reputation", "InternetServiceReputation"),
+    "InternetServiceSld": (".internet_service_sld", "InternetServiceSld"),
+    "InternetServiceSubapp": (".internet_service_subapp", "InternetServiceSubapp"),
+    "IpTranslation": (".ip_translation", "IpTranslation"),
+    "Ippool": (".ippool", "Ippool"),
+    "Ippool6": (".ippool6", "Ippool6"),
+    "LdbMonitor": (".ldb_monitor", "LdbMonitor"),
+    "LocalInPolicy": (".local_in_policy", "LocalInPolicy"),
+    "LocalInPolicy6": (".local_in_policy6", "LocalInPolicy6"),
+    "MulticastAddress": (".multicast_address", "MulticastAddress"),
+    "MulticastAddress6": (".multicast_address6", "MulticastAddress6"),
+    "MulticastPolicy": (".multicast_policy", "MulticastPolicy"),
+    "MulticastPolicy6": (".multicast_policy6", "MulticastPolicy6"),
+    "NetworkServiceDynamic": (".network_service_dynamic", "NetworkServiceDynamic"),
+    "OnDemandSniffer": (".on_demand_sniffer", "OnDemandSniffer"),
+    "Policy": (".policy", "Policy"),
+    "ProfileGroup": (".profile_group", "ProfileGroup"),
+    "ProfileProtocolOptions": (".profile_protocol_options", "ProfileProtocolOptions"),
+    "ProxyAddress": (".proxy_address", "ProxyAddress"),
+    "ProxyAddrgrp": (".proxy_addrgrp", "ProxyAddrgrp"),
+    "ProxyPolicy": (".proxy_policy", "ProxyPolicy"),
+    "Region": (".region", "Region"),
+    "SecurityPolicy": (".security_policy", "SecurityPolicy"),
+    "ShapingPolicy": (".shaping_policy", "ShapingPolicy"),
+    "ShapingProfile": (".shaping_profile", "ShapingProfile"),
+    "Sniffer": (".sniffer", "Sniffer"),
+    "SslServer": (".ssl_server", "SslServer"),
+    "SslSshProfile": (".ssl_ssh_profile", "SslSshProfile"),
+    "TrafficClass": (".traffic_class", "TrafficClass"),
+    "TtlPolicy": (".ttl_policy", "TtlPolicy"),
+    "VendorMac": (".vendor_mac", "VendorMac"),
+    "VendorMacSummary": (".vendor_mac_summary", "VendorMacSummary"),
+    "Vip": (".vip", "Vip"),
+    "Vip6": (".vip6", "Vip6"),
+    "Vipgrp": (".vipgrp", "Vipgrp"),
+    "Vipgrp6": (".vipgrp6", "Vipgrp6"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Firewall:
     """Firewall endpoints wrapper for CMDB API."""
 
+    ipmacbinding = LazyEndpoint(".ipmacbinding", "Ipmacbinding")
+    schedule = LazyEndpoint(".schedule", "Schedule")
+    service = LazyEndpoint(".service", "Service")
+    shaper = LazyEndpoint(".shaper", "Shaper")
+    ssh = LazyEndpoint(".ssh", "Ssh")
+    ssl = LazyEndpoint(".ssl", "Ssl")
+    wildcard_fqdn = LazyEndpoint(".wildcard_fqdn", "WildcardFqdn")
+    DoS_policy = LazyEndpoint(".DoS_policy", "DosPolicy")
+    DoS_policy6 = LazyEndpoint(".DoS_policy6", "DosPolicy6")
+    access_proxy = LazyEndpoint(".access_proxy", "AccessProxy")
+    access_proxy6 = LazyEndpoint(".access_proxy6", "AccessProxy6")
+    access_proxy_ssh_client_cert = LazyEndpoint(".access_proxy_ssh_client_cert", "AccessProxySshClientCert")
+    access_proxy_virtual_host = LazyEndpoint(".access_proxy_virtual_host", "AccessProxyVirtualHost")
+    address = LazyEndpoint(".address", "Address")
+    address6 = LazyEndpoint(".address6", "Address6")
+    address6_template = LazyEndpoint(".address6_template", "Address6Template")
+    addrgrp = LazyEndpoint(".addrgrp", "Addrgrp")
+    addrgrp6 = LazyEndpoint(".addrgrp6", "Addrgrp6")
+    auth_portal = LazyEndpoint(".auth_portal", "AuthPortal")
+    central_snat_map = LazyEndpoint(".central_snat_map", "CentralSnatMap")
+    city = LazyEndpoint(".city", "City")
+    country = LazyEndpoint(".country", "Country")
+    decrypted_traffic_mirror = LazyEndpoint(".decrypted_traffic_mirror", "DecryptedTrafficMirror")
+    dnstranslation = LazyEndpoint(".dnstranslation", "Dnstranslation")
+    global_ = LazyEndpoint(".global_", "Global")
+    identity_based_route = LazyEndpoint(".identity_based_route", "IdentityBasedRoute")
+    interface_policy = LazyEndpoint(".interface_policy", "InterfacePolicy")
+    interface_policy6 = LazyEndpoint(".interface_policy6", "InterfacePolicy6")
+    internet_service = LazyEndpoint(".internet_service", "InternetService")
+    internet_service_addition = LazyEndpoint(".internet_service_addition", "InternetServiceAddition")
+    internet_service_append = LazyEndpoint(".internet_service_append", "InternetServiceAppend")
+    internet_service_botnet = LazyEndpoint(".internet_service_botnet", "InternetServiceBotnet")
+    internet_service_custom = LazyEndpoint(".internet_service_custom", "InternetServiceCustom")
+    internet_service_custom_group = LazyEndpoint(".internet_service_custom_group", "InternetServiceCustomGroup")
+    internet_service_definition = LazyEndpoint(".internet_service_definition", "InternetServiceDefinition")
+    internet_service_extension = LazyEndpoint(".internet_service_extension", "InternetServiceExtension")
+    internet_service_fortiguard = LazyEndpoint(".internet_service_fortiguard", "InternetServiceFortiguard")
+    internet_service_group = LazyEndpoint(".internet_service_group", "InternetServiceGroup")
+    internet_service_ipbl_reason = LazyEndpoint(".internet_service_ipbl_reason", "InternetServiceIpblReason")
+    internet_service_ipbl_vendor = LazyEndpoint(".internet_service_ipbl_vendor", "InternetServiceIpblVendor")
+    internet_service_list = LazyEndpoint(".internet_service_list", "InternetServiceList")
+    internet_service_name = LazyEndpoint(".internet_service_name", "InternetServiceName")
+    internet_service_owner = LazyEndpoint(".internet_service_owner", "InternetServiceOwner")
+    internet_service_reputation = LazyEndpoint(".internet_service_reputation", "InternetServiceReputation")
+    internet_service_sld = LazyEndpoint(".internet_service_sld", "InternetServiceSld")
+    internet_service_subapp = LazyEndpoint(".internet_service_subapp", "InternetServiceSubapp")
+    ip_translation = LazyEndpoint(".ip_translation", "IpTranslation")
+    ippool = LazyEndpoint(".ippool", "Ippool")
+    ippool6 = LazyEndpoint(".ippool6", "Ippool6")
+    ldb_monitor = LazyEndpoint(".ldb_monitor", "LdbMonitor")
+    local_in_policy = LazyEndpoint(".local_in_policy", "LocalInPolicy")
+    local_in_policy6 = LazyEndpoint(".local_in_policy6", "LocalInPolicy6")
+    multicast_address = LazyEndpoint(".multicast_address", "MulticastAddress")
+    multicast_address6 = LazyEndpoint(".multicast_address6", "MulticastAddress6")
+    multicast_policy = LazyEndpoint(".multicast_policy", "MulticastPolicy")
+    multicast_policy6 = LazyEndpoint(".multicast_policy6", "MulticastPolicy6")
+    network_service_dynamic = LazyEndpoint(".network_service_dynamic", "NetworkServiceDynamic")
+    on_demand_sniffer = LazyEndpoint(".on_demand_sniffer", "OnDemandSniffer")
+    policy = LazyEndpoint(".policy", "Policy")
+    profile_group = LazyEndpoint(".profile_group", "ProfileGroup")
+    profile_protocol_options = LazyEndpoint(".profile_protocol_options", "ProfileProtocolOptions")
+    proxy_address = LazyEndpoint(".proxy_address", "ProxyAddress")
+    proxy_addrgrp = LazyEndpoint(".proxy_addrgrp", "ProxyAddrgrp")
+    proxy_policy = LazyEndpoint(".proxy_policy", "ProxyPolicy")
+    region = LazyEndpoint(".region", "Region")
+    security_policy = LazyEndpoint(".security_policy", "SecurityPolicy")
+    shaping_policy = LazyEndpoint(".shaping_policy", "ShapingPolicy")
+    shaping_profile = LazyEndpoint(".shaping_profile", "ShapingProfile")
+    sniffer = LazyEndpoint(".sniffer", "Sniffer")
+    ssl_server = LazyEndpoint(".ssl_server", "SslServer")
+    ssl_ssh_profile = LazyEndpoint(".ssl_ssh_profile", "SslSshProfile")
+    traffic_class = LazyEndpoint(".traffic_class", "TrafficClass")
+    ttl_policy = LazyEndpoint(".ttl_policy", "TtlPolicy")
+    vendor_mac = LazyEndpoint(".vendor_mac", "VendorMac")
+    vendor_mac_summary = LazyEndpoint(".vendor_mac_summary", "VendorMacSummary")
+    vip = LazyEndpoint(".vip", "Vip")
+    vip6 = LazyEndpoint(".vip6", "Vip6")
+    vipgrp = LazyEndpoint(".vipgrp", "Vipgrp")
+    vipgrp6 = LazyEndpoint(".vipgrp6", "Vipgrp6")
+
     def __init__(self, client):
         """Firewall endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.ipmacbinding = ipmacbinding.Ipmacbinding(client)
-        self.schedule = schedule.Schedule(client)
-        self.service = service.Service(client)
-        self.shaper = shaper.Shaper(client)
-        self.ssh = ssh.Ssh(client)
-        self.ssl = ssl.Ssl(client)
-        self.wildcard_fqdn = wildcard_fqdn.WildcardFqdn(client)
-        self.DoS_policy = DosPolicy(client)
-        self.DoS_policy6 = DosPolicy6(client)
-        self.access_proxy = AccessProxy(client)
-        self.access_proxy6 = AccessProxy6(client)
-        self.access_proxy_ssh_client_cert = AccessProxySshClientCert(client)
-        self.access_proxy_virtual_host = AccessProxyVirtualHost(client)
-        self.address = Address(client)
-        self.address6 = Address6(client)
-        self.address6_template = Address6Template(client)
-        self.addrgrp = Addrgrp(client)
-        self.addrgrp6 = Addrgrp6(client)
-        self.auth_portal = AuthPortal(client)
-        self.central_snat_map = CentralSnatMap(client)
-        self.city = City(client)
-        self.country = Country(client)
-        self.decrypted_traffic_mirror = DecryptedTrafficMirror(client)
-        self.dnstranslation = Dnstranslation(client)
-        self.global_ = Global(client)
-        self.identity_based_route = IdentityBasedRoute(client)
-        self.interface_policy = InterfacePolicy(client)
-        self.interface_policy6 = InterfacePolicy6(client)
-        self.internet_service = InternetService(client)
-        self.internet_service_addition = InternetServiceAddition(client)
-        self.internet_service_append = InternetServiceAppend(client)
-        self.internet_service_botnet = InternetServiceBotnet(client)
-        self.internet_service_custom = InternetServiceCustom(client)
-        self.internet_service_custom_group = InternetServiceCustomGroup(client)
-        self.internet_service_definition = InternetServiceDefinition(client)
-        self.internet_service_extension = InternetServiceExtension(client)
-        self.internet_service_fortiguard = InternetServiceFortiguard(client)
-        self.internet_service_group = InternetServiceGroup(client)
-        self.internet_service_ipbl_reason = InternetServiceIpblReason(client)
-        self.internet_service_ipbl_vendor = InternetServiceIpblVendor(client)
-        self.internet_service_list = InternetServiceList(client)
-        self.internet_service_name = InternetServiceName(client)
-        self.internet_service_owner = InternetServiceOwner(client)
-        self.internet_service_reputation = InternetServiceReputation(client)
-        self.internet_service_sld = InternetServiceSld(client)
-        self.internet_service_subapp = InternetServiceSubapp(client)
-        self.ip_translation = IpTranslation(client)
-        self.ippool = Ippool(client)
-        self.ippool6 = Ippool6(client)
-        self.ldb_monitor = LdbMonitor(client)
-        self.local_in_policy = LocalInPolicy(client)
-        self.local_in_policy6 = LocalInPolicy6(client)
-        self.multicast_address = MulticastAddress(client)
-        self.multicast_address6 = MulticastAddress6(client)
-        self.multicast_policy = MulticastPolicy(client)
-        self.multicast_policy6 = MulticastPolicy6(client)
-        self.network_service_dynamic = NetworkServiceDynamic(client)
-        self.on_demand_sniffer = OnDemandSniffer(client)
-        self.policy = Policy(client)
-        self.profile_group = ProfileGroup(client)
-        self.profile_protocol_options = ProfileProtocolOptions(client)
-        self.proxy_address = ProxyAddress(client)
-        self.proxy_addrgrp = ProxyAddrgrp(client)
-        self.proxy_policy = ProxyPolicy(client)
-        self.region = Region(client)
-        self.security_policy = SecurityPolicy(client)
-        self.shaping_policy = ShapingPolicy(client)
-        self.shaping_profile = ShapingProfile(client)
-        self.sniffer = Sniffer(client)
-        self.ssl_server = SslServer(client)
-        self.ssl_ssh_profile = SslSshProfile(client)
-        self.traffic_class = TrafficClass(client)
-        self.ttl_policy = TtlPolicy(client)
-        self.vendor_mac = VendorMac(client)
-        self.vendor_mac_summary = VendorMacSummary(client)
-        self.vip = Vip(client)
-        self.vip6 = Vip6(client)
-        self.vipgrp = Vipgrp(client)
-        self.vipgrp6 = Vipgrp6(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - Ipmacbinding category"""
 
-from .setting import Setting
-from .table import Table
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Ipmacbinding",
@@ -9,15 +8,24 @@ __all__ = [
     "Table",
 ]
 
+_LAZY_IMPORTS = {
+    "Setting": (".setting", "Setting"),
+    "Table": (".table", "Table"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ipmacbinding:
     """Ipmacbinding endpoints wrapper for CMDB API."""
 
+    setting = LazyEndpoint(".setting", "Setting")
+    table = LazyEndpoint(".table", "Table")
+
     def __init__(self, client):
         """Ipmacbinding endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.setting = Setting(client)
-        self.table = Table(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Schedule category"""
 
-from .group import Group
-from .onetime import Onetime
-from .recurring import Recurring
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Group",
@@ -11,16 +9,26 @@ __all__ = [
     "Schedule",
 ]
 
+_LAZY_IMPORTS = {
+    "Group": (".group", "Group"),
+    "Onetime": (".onetime", "Onetime"),
+    "Recurring": (".recurring", "Recurring"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Schedule:
     """Schedule endpoints wrapper for CMDB API."""
 
+    group = LazyEndpoint(".group", "Group")
+    onetime = LazyEndpoint(".onetime", "Onetime")
+    recurring = LazyEndpoint(".recurring", "Recurring")
+
     def __init__(self, client):
         """Schedule endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.group = Group(client)
-        self.onetime = Onetime(client)
-        self.recurring = Recurring(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Service category"""
 
-from .category import Category
-from .custom import Custom
-from .group import Group
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Category",
@@ -11,16 +9,26 @@ __all__ = [
     "Service",
 ]
 
+_LAZY_IMPORTS = {
+    "Category": (".category", "Category"),
+    "Custom": (".custom", "Custom"),
+    "Group": (".group", "Group"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Service:
     """Service endpoints wrapper for CMDB API."""
 
+    category = LazyEndpoint(".category", "Category")
+    custom = LazyEndpoint(".custom", "Custom")
+    group = LazyEndpoint(".group", "Group")
+
     def __init__(self, client):
         """Service endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.category = Category(client)
-        self.custom = Custom(client)
-        self.group = Group(client)
+        self._client = client
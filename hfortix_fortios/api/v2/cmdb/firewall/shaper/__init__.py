@@ -1,7 +1,6 @@
 """FortiOS CMDB - Shaper category"""
 
-from .per_ip_shaper import PerIpShaper
-from .traffic_shaper import TrafficShaper
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "PerIpShaper",
@@ -9,15 +8,24 @@ __all__ = [
     "TrafficShaper",
 ]
 
+_LAZY_IMPORTS = {
+    "PerIpShaper": (".per_ip_shaper", "PerIpShaper"),
+    "TrafficShaper": (".traffic_shaper", "TrafficShaper"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Shaper:
     """Shaper endpoints wrapper for CMDB API."""
 
+    per_ip_shaper = LazyEndpoint(".per_ip_shaper", "PerIpShaper")
+    traffic_shaper = LazyEndpoint(".traffic_shaper", "TrafficShaper")
+
     def __init__(self, client):
         """Shaper endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.per_ip_shaper = PerIpShaper(client)
-        self.traffic_shaper = TrafficShaper(client)
+        self._client = client
@@ -1,9 +1,6 @@
 """FortiOS CMDB - Ssh category"""
 
-from .host_key import HostKey
-from .local_ca import LocalCa
-from .local_key import LocalKey
-from .setting import Setting
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "HostKey",
@@ -13,17 +10,28 @@ __all__ = [
     "Ssh",
 ]
 
+_LAZY_IMPORTS = {
+    "HostKey": (".host_key", "HostKey"),
+    "LocalCa": (".local_ca", "LocalCa"),
+    "LocalKey": (".local_key", "LocalKey"),
+    "Setting": (".setting", "Setting"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ssh:
     """Ssh endpoints wrapper for CMDB API."""
 
+    host_key = LazyEndpoint(".host_key", "HostKey")
+    local_ca = LazyEndpoint(".local_ca", "LocalCa")
+    local_key = LazyEndpoint(".local_key", "LocalKey")
+    setting = LazyEndpoint(".setting", "Setting")
+
     def __init__(self, client):
         """Ssh endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.host_key = HostKey(client)
-        self.local_ca = LocalCa(client)
-        self.local_key = LocalKey(client)
-        self.setting = Setting(client)
+        self._client = client
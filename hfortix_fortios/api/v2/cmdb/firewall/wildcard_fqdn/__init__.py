@@ -1,7 +1,6 @@
 """FortiOS CMDB - WildcardFqdn category"""
 
-from .custom import Custom
-from .group import Group
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Custom",
@@ -9,15 +8,24 @@ __all__ = [
     "WildcardFqdn",
 ]
 
+_LAZY_IMPORTS = {
+    "Custom": (".custom", "Custom"),
+    "Group": (".group", "Group"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class WildcardFqdn:
     """WildcardFqdn endpoints wrapper for CMDB API."""
 
+    custom = LazyEndpoint(".custom", "Custom")
+    group = LazyEndpoint(".group", "Group")
+
     def __init__(self, client):
         """WildcardFqdn endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.custom = Custom(client)
-        self.group = Group(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - FtpProxy category"""
 
-from .explicit import Explicit
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Explicit",
     "FtpProxy",
 ]
 
+_LAZY_IMPORTS = {
+    "Explicit": (".explicit", "Explicit"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class FtpProxy:
     """FtpProxy endpoints wrapper for CMDB API."""
 
+    explicit = LazyEndpoint(".explicit", "Explicit")
+
     def __init__(self, client):
         """FtpProxy endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.explicit = Explicit(client)
+        self._client = client
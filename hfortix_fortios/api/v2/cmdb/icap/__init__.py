@@ -1,8 +1,6 @@
 """FortiOS CMDB - Icap category"""
 
-from .profile import Profile
-from .server import Server
-from .server_group import ServerGroup
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Icap",
@@ -11,16 +9,26 @@ __all__ = [
     "ServerGroup",
 ]
 
+_LAZY_IMPORTS = {
+    "Profile": (".profile", "Profile"),
+    "Server": (".server", "Server"),
+    "ServerGroup": (".server_group", "ServerGroup"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Icap:
     """Icap endpoints wrapper for CMDB API."""
 
+    profile = LazyEndpoint(".profile", "Profile")
+    server = LazyEndpoint(".server", "Server")
+    server_group = LazyEndpoint(".server_group", "ServerGroup")
+
     def __init__(self, client):
         """Icap endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.profile = Profile(client)
-        self.server = Server(client)
-        self.server_group = ServerGroup(client)
+        self._client = client
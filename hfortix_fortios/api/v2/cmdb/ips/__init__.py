@@ -1,13 +1,6 @@
 """FortiOS CMDB - Ips category"""
 
-from .custom import Custom
-from .decoder import Decoder
-from .global_ import Global
-from .rule import Rule
-from .rule_settings import RuleSettings
-from .sensor import Sensor
-from .settings import Settings
-from .view_map import ViewMap
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Custom",
@@ -21,21 +14,36 @@ __all__ = [
     "ViewMap",
 ]
 
+_LAZY_IMPORTS = {
+    "Custom": (".custom", "Custom"),
+    "Decoder": (".decoder", "Decoder"),
+    "Global": (".global_", "Global"),
+    "Rule": (".rule", "Rule"),
+    "RuleSettings": (".rule_settings", "RuleSettings"),
+    "Sensor": (".sensor", "Sensor"),
+    "Settings": (".settings", "Settings"),
+    "ViewMap": (".view_map", "ViewMap"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ips:
     """Ips endpoints wrapper for CMDB API."""
 
+    custom = LazyEndpoint(".custom", "Custom")
+    decoder = LazyEndpoint(".decoder", "Decoder")
+    global_ = LazyEndpoint(".global_", "Global")
+    rule = LazyEndpoint(".rule", "Rule")
+    rule_settings = LazyEndpoint(".rule_settings", "RuleSettings")
+    sensor = LazyEndpoint(".sensor", "Sensor")
+    settings = LazyEndpoint(".settings", "Settings")
+    view_map = LazyEndpoint(".view_map", "ViewMap")
+
     def __init__(self, client):
         """Ips endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.custom = Custom(client)
-        self.decoder = Decoder(client)
-        self.global_ = Global(client)
-        self.rule = Rule(client)
-        self.rule_settings = RuleSettings(client)
-        self.sensor = Sensor(client)
-        self.settings = Settings(client)
-        self.view_map = ViewMap(client)
+        self._client = client
@@ -1,26 +1,6 @@
 """FortiOS CMDB - Log category"""
 
-from . import disk
-from . import fortianalyzer
-from . import fortianalyzer2
-from . import fortianalyzer3
-from . import fortianalyzer_cloud
-from . import fortiguard
-from . import memory
-from . import null_device
-from . import syslogd
-from . import syslogd2
-from . import syslogd3
-from . import syslogd4
-from . import tacacs_plus_accounting
-from . import tacacs_plus_accounting2
-from . import tacacs_plus_accounting3
-from . import webtrends
-from .custom_field import CustomField
-from .eventfilter import Eventfilter
-from .gui_display import GuiDisplay
-from .setting import Setting
-from .threat_weight import ThreatWeight
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "CustomField",
@@ -47,34 +27,62 @@ __all__ = [
     "Webtrends",
 ]
 
+_LAZY_IMPORTS = {
+    "disk": (".disk", None),
+    "fortianalyzer": (".fortianalyzer", None),
+    "fortianalyzer2": (".fortianalyzer2", None),
+    "fortianalyzer3": (".fortianalyzer3", None),
+    "fortianalyzer_cloud": (".fortianalyzer_cloud", None),
+    "fortiguard": (".fortiguard", None),
+    "memory": (".memory", None),
+    "null_device": (".null_device", None),
+    "syslogd": (".syslogd", None),
+    "syslogd2": (".syslogd2", None),
+    "syslogd3": (".syslogd3", None),
+    "syslogd4": (".syslogd4", None),
+    "tacacs_plus_accounting": (".tacacs_plus_accounting", None),
+    "tacacs_plus_accounting2": (".tacacs_plus_accounting2", None),
+    "tacacs_plus_accounting3": (".tacacs_plus_accounting3", None),
+    "webtrends": (".webtrends", None),
+    "CustomField": (".custom_field", "CustomField"),
+    "Eventfilter": (".eventfilter", "Eventfilter"),
+    "GuiDisplay": (".gui_display", "GuiDisplay"),
+    "Setting": (".setting", "Setting"),
+    "ThreatWeight": (".threat_weight", "ThreatWeight"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Log:
     """Log endpoints wrapper for CMDB API."""
 
+    disk = LazyEndpoint(".disk", "Disk")
+    fortianalyzer = LazyEndpoint(".fortianalyzer", "Fortianalyzer")
+    fortianalyzer2 = LazyEndpoint(".fortianalyzer2", "Fortianalyzer2")
+    fortianalyzer3 = LazyEndpoint(".fortianalyzer3", "Fortianalyzer3")
+    fortianalyzer_cloud = LazyEndpoint(".fortianalyzer_cloud", "FortianalyzerCloud")
+    fortiguard = LazyEndpoint(".fortiguard", "Fortiguard")
+    memory = LazyEndpoint(".memory", "Memory")
+    null_device = LazyEndpoint(".null_device", "NullDevice")
+    syslogd = LazyEndpoint(".syslogd", "Syslogd")
+    syslogd2 = LazyEndpoint(".syslogd2", "Syslogd2")
+    syslogd3 = LazyEndpoint(".syslogd3", "Syslogd3")
+    syslogd4 = LazyEndpoint(".syslogd4", "Syslogd4")
+    tacacs_plus_accounting = LazyEndpoint(".tacacs_plus_accounting", "TacacsPlusAccounting")
+    tacacs_plus_accounting2 = LazyEndpoint(".tacacs_plus_accounting2", "TacacsPlusAccounting2")
+    tacacs_plus_accounting3 = LazyEndpoint(".tacacs_plus_accounting3", "TacacsPlusAccounting3")
+    webtrends = LazyEndpoint(".webtrends", "Webtrends")
+    custom_field = LazyEndpoint(".custom_field", "CustomField")
+    eventfilter = LazyEndpoint(".eventfilter", "Eventfilter")
+    gui_display = LazyEndpoint(".gui_display", "GuiDisplay")
+    setting = LazyEndpoint(".setting", "Setting")
+    threat_weight = LazyEndpoint(".threat_weight", "ThreatWeight")
+
     def __init__(self, client):
         """Log endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.disk = disk.Disk(client)
-        self.fortianalyzer = fortianalyzer.Fortianalyzer(client)
-        self.fortianalyzer2 = fortianalyzer2.Fortianalyzer2(client)
-        self.fortianalyzer3 = fortianalyzer3.Fortianalyzer3(client)
-        self.fortianalyzer_cloud = fortianalyzer_cloud.FortianalyzerCloud(client)
-        self.fortiguard = fortiguard.Fortiguard(client)
-        self.memory = memory.Memory(client)
-        self.null_device = null_device.NullDevice(client)
-        self.syslogd = syslogd.Syslogd(client)
-        self.syslogd2 = syslogd2.Syslogd2(client)
-        self.syslogd3 = syslogd3.Syslogd3(client)
-        self.syslogd4 = syslogd4.Syslogd4(client)
-        self.tacacs_plus_accounting = tacacs_plus_accounting.TacacsPlusAccounting(client)
-        self.tacacs_plus_accounting2 = tacacs_plus_accounting2.TacacsPlusAccounting2(client)
-        self.tacacs_plus_accounting3 = tacacs_plus_accounting3.TacacsPlusAccounting3(client)
-        self.webtrends = webtrends.Webtrends(client)
-        self.custom_field = CustomField(client)
-        self.eventfilter = Eventfilter(client)
-        self.gui_display = GuiDisplay(client)
-        self.setting = Setting(client)
-        self.threat_weight = ThreatWeight(client)
+        self._client = client
@@ -1,9 +1,6 @@
 """FortiOS CMDB - FortianalyzerCloud category"""
 
-from .filter import Filter
-from .override_filter import OverrideFilter
-from .override_setting import OverrideSetting
-from .setting import Setting
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Filter",
@@ -13,17 +10,28 @@ __all__ = [
     "Setting",
 ]
 
+_LAZY_IMPORTS = {
+    "Filter": (".filter", "Filter"),
+    "OverrideFilter": (".override_filter", "OverrideFilter"),
+    "OverrideSetting": (".override_setting", "OverrideSetting"),
+    "Setting": (".setting", "Setting"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class FortianalyzerCloud:
     """FortianalyzerCloud endpoints wrapper for CMDB API."""
 
+    filter = LazyEndpoint(".filter", "Filter")
+    override_filter = LazyEndpoint(".override_filter", "OverrideFilter")
+    override_setting = LazyEndpoint(".override_setting", "OverrideSetting")
+    setting = LazyEndpoint(".setting", "Setting")
+
     def __init__(self, client):
         """FortianalyzerCloud endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.filter = Filter(client)
-        self.override_filter = OverrideFilter(client)
-        self.override_setting = OverrideSetting(client)
-        self.setting = Setting(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Memory category"""
 
-from .filter import Filter
-from .global_setting import GlobalSetting
-from .setting import Setting
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Filter",
@@ -11,16 +9,26 @@ __all__ = [
     "Setting",
 ]
 
+_LAZY_IMPORTS = {
+    "Filter": (".filter", "Filter"),
+    "GlobalSetting": (".global_setting", "GlobalSetting"),
+    "Setting": (".setting", "Setting"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Memory:
     """Memory endpoints wrapper for CMDB API."""
 
+    filter = LazyEndpoint(".filter", "Filter")
+    global_setting = LazyEndpoint(".global_setting", "GlobalSetting")
+    setting = LazyEndpoint(".setting", "Setting")
+
     def __init__(self, client):
         """Memory endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.filter = Filter(client)
-        self.global_setting = GlobalSetting(client)
-        self.setting = Setting(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - NullDevice category"""
 
-from .filter import Filter
-from .setting import Setting
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Filter",
@@ -9,15 +8,24 @@ __all__ = [
     "Setting",
 ]
 
+_LAZY_IMPORTS = {
+    "Filter": (".filter", "Filter"),
+    "Setting": (".setting", "Setting"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class NullDevice:
     """NullDevice endpoints wrapper for CMDB API."""
 
+    filter = LazyEndpoint(".filter", "Filter")
+    setting = LazyEndpoint(".setting", "Setting")
+
     def __init__(self, client):
         """NullDevice endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.filter = Filter(client)
-        self.setting = Setting(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Monitoring category"""
 
-from .npu_hpe import NpuHpe
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Monitoring",
     "NpuHpe",
 ]
 
+_LAZY_IMPORTS = {
+    "NpuHpe": (".npu_hpe", "NpuHpe"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Monitoring:
     """Monitoring endpoints wrapper for CMDB API."""
 
+    npu_hpe = LazyEndpoint(".npu_hpe", "NpuHpe")
+
     def __init__(self, client):
         """Monitoring endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.npu_hpe = NpuHpe(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - Report category"""
 
-from .layout import Layout
-from .setting import Setting
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Layout",
@@ -9,15 +8,24 @@ __all__ = [
     "Setting",
 ]
 
+_LAZY_IMPORTS = {
+    "Layout": (".layout", "Layout"),
+    "Setting": (".setting", "Setting"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Report:
     """Report endpoints wrapper for CMDB API."""
 
+    layout = LazyEndpoint(".layout", "Layout")
+    setting = LazyEndpoint(".setting", "Setting")
+
     def __init__(self, client):
         """Report endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.layout = Layout(client)
-        self.setting = Setting(client)
+        self._client = client
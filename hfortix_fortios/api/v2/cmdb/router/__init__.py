@@ -1,31 +1,6 @@
 """FortiOS CMDB - Router category"""
 
-from .access_list import AccessList
-from .access_list6 import AccessList6
-from .aspath_list import AspathList
-from .auth_path import AuthPath
-from .bfd import Bfd
-from .bfd6 import Bfd6
-from .bgp import Bgp
-from .community_list import CommunityList
-from .extcommunity_list import ExtcommunityList
-from .isis import Isis
-from .key_chain import KeyChain
-from .multicast import Multicast
-from .multicast6 import Multicast6
-from .multicast_flow import MulticastFlow
-from .ospf import Ospf
-from .ospf6 import Ospf6
-from .policy import Policy
-from .policy6 import Policy6
-from .prefix_list import PrefixList
-from .prefix_list6 import PrefixList6
-from .rip import Rip
-from .ripng import Ripng
-from .route_map import RouteMap
-from .setting import Setting
-from .static import Static
-from .static6 import Static6
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AccessList",
@@ -57,39 +32,72 @@ __all__ = [
     "Static6",
 ]
 
+_LAZY_IMPORTS = {
+    "AccessList": (".access_list", "AccessList"),
+    "AccessList6": (".access_list6", "AccessList6"),
+    "AspathList": (".aspath_list", "AspathList"),
+    "AuthPath": (".auth_path", "AuthPath"),
+    "Bfd": (".bfd", "Bfd"),
+    "Bfd6": (".bfd6", "Bfd6"),
+    "Bgp": (".bgp", "Bgp"),
+    "CommunityList": (".community_list", "CommunityList"),
+    "ExtcommunityList": (".extcommunity_list", "ExtcommunityList"),
+    "Isis": (".isis", "Isis"),
+    "KeyChain": (".key_chain", "KeyChain"),
+    "Multicast": (".multicast", "Multicast"),
+    "Multicast6": (".multicast6", "Multicast6"),
+    "MulticastFlow": (".multicast_flow", "MulticastFlow"),
+    "Ospf": (".ospf", "Ospf"),
+    "Ospf6": (".ospf6", "Ospf6"),
+    "Policy": (".policy", "Policy"),
+    "Policy6": (".policy6", "Policy6"),
+    "PrefixList": (".prefix_list", "PrefixList"),
+    "PrefixList6": (".prefix_list6", "PrefixList6"),
+    "Rip": (".rip", "Rip"),
+    "Ripng": (".ripng", "Ripng"),
+    "RouteMap": (".route_map", "RouteMap"),
+    "Setting": (".setting", "Setting"),
+    "Static": (".static", "Static"),
+    "Static6": (".static6", "Static6"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Router:
     """Router endpoints wrapper for CMDB API."""
 
+    access_list = LazyEndpoint(".access_list", "AccessList")
+    access_list6 = LazyEndpoint(".access_list6", "AccessList6")
+    aspath_list = LazyEndpoint(".aspath_list", "AspathList")
+    auth_path = LazyEndpoint(".auth_path", "AuthPath")
+    bfd = LazyEndpoint(".bfd", "Bfd")
+    bfd6 = LazyEndpoint(".bfd6", "Bfd6")
+    bgp = LazyEndpoint(".bgp", "Bgp")
+    community_list = LazyEndpoint(".community_list", "CommunityList")
+    extcommunity_list = LazyEndpoint(".extcommunity_list", "ExtcommunityList")
+    isis = LazyEndpoint(".isis", "Isis")
+    key_chain = LazyEndpoint(".key_chain", "KeyChain")
+    multicast = LazyEndpoint(".multicast", "Multicast")
+    multicast6 = LazyEndpoint(".multicast6", "Multicast6")
+    multicast_flow = LazyEndpoint(".multicast_flow", "MulticastFlow")
+    ospf = LazyEndpoint(".ospf", "Ospf")
+    ospf6 = LazyEndpoint(".ospf6", "Ospf6")
+    policy = LazyEndpoint(".policy", "Policy")
+    policy6 = LazyEndpoint(".policy6", "Policy6")
+    prefix_list = LazyEndpoint(".prefix_list", "PrefixList")
+    prefix_list6 = LazyEndpoint(".prefix_list6", "PrefixList6")
+    rip = LazyEndpoint(".rip", "Rip")
+    ripng = LazyEndpoint(".ripng", "Ripng")
+    route_map = LazyEndpoint(".route_map", "RouteMap")
+    setting = LazyEndpoint(".setting", "Setting")
+    static = LazyEndpoint(".static", "Static")
+    static6 = LazyEndpoint(".static6", "Static6")
+
     def __init__(self, client):
         """Router endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.access_list = AccessList(client)
-        self.access_list6 = AccessList6(client)
-        self.aspath_list = AspathList(client)
-        self.auth_path = AuthPath(client)
-        self.bfd = Bfd(client)
-        self.bfd6 = Bfd6(client)
-        self.bgp = Bgp(client)
-        self.community_list = CommunityList(client)
-        self.extcommunity_list = ExtcommunityList(client)
-        self.isis = Isis(client)
-        self.key_chain = KeyChain(client)
-        self.multicast = Multicast(client)
-        self.multicast6 = Multicast6(client)
-        self.multicast_flow = MulticastFlow(client)
-        self.ospf = Ospf(client)
-        self.ospf6 = Ospf6(client)
-        self.policy = Policy(client)
-        self.policy6 = Policy6(client)
-        self.prefix_list = PrefixList(client)
-        self.prefix_list6 = PrefixList6(client)
-        self.rip = Rip(client)
-        self.ripng = Ripng(client)
-        self.route_map = RouteMap(client)
-        self.setting = Setting(client)
-        self.static = Static(client)
-        self.static6 = Static6(client)
+        self._client = client
@@ -9,12 +9,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
+from hfortix_fortios._helpers.child_tables import ChildTableHelper
+
 if TYPE_CHECKING:
     from hfortix_fortios.models import FortiObject
 
 
 
-class NeighborHelper:
+class NeighborHelper(ChildTableHelper):
     """
     Helper for managing neighbor child table in cmdb.router.bfd6.
     
@@ -81,27 +83,8 @@ class NeighborHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bfd6.neighbor.get(ip6_address="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if ip6_address is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == ip6_address:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(ip6_address):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<ip6_address>] (child-table sub-path)
+        return self._get_entries(ip6_address)
     
     def set(
         self,
@@ -139,55 +122,9 @@ class NeighborHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -210,36 +147,9 @@ class NeighborHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bfd6.neighbor.delete(ip6_address="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != ip6_address and str(entry_value) != str(ip6_address)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<ip6_address> (child-table sub-path)
+        return self._delete_entry(
+            ip6_address, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -265,17 +175,9 @@ class NeighborHelper:
             ...     {'ip6_address': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -295,13 +197,12 @@ class NeighborHelper:
             >>> if fgt.api.cmdb.router.bfd6.neighbor.exists(ip6_address="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(ip6_address=ip6_address)
-        return entry is not None
+        return self._entry_exists(ip6_address)
 
 
 
 
-class MultihopTemplateHelper:
+class MultihopTemplateHelper(ChildTableHelper):
     """
     Helper for managing multihop-template child table in cmdb.router.bfd6.
     
@@ -368,27 +269,8 @@ class MultihopTemplateHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bfd6.multihop_template.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -426,55 +308,9 @@ class MultihopTemplateHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -497,36 +333,9 @@ class MultihopTemplateHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bfd6.multihop_template.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -552,17 +361,9 @@ class MultihopTemplateHelper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -582,7 +383,6 @@ class MultihopTemplateHelper:
             >>> if fgt.api.cmdb.router.bfd6.multihop_template.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
@@ -9,12 +9,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
+from hfortix_fortios._helpers.child_tables import ChildTableHelper
+
 if TYPE_CHECKING:
     from hfortix_fortios.models import FortiObject
 
 
 
-class ConfederationPeersHelper:
+class ConfederationPeersHelper(ChildTableHelper):
     """
     Helper for managing confederation-peers child table in cmdb.router.bgp.
     
@@ -81,27 +83,8 @@ class ConfederationPeersHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.confederation_peers.get(peer="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if peer is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == peer:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(peer):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<peer>] (child-table sub-path)
+        return self._get_entries(peer)
     
     def set(
         self,
@@ -139,55 +122,9 @@ class ConfederationPeersHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -210,36 +147,9 @@ class ConfederationPeersHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.confederation_peers.delete(peer="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != peer and str(entry_value) != str(peer)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<peer> (child-table sub-path)
+        return self._delete_entry(
+            peer, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -265,17 +175,9 @@ class ConfederationPeersHelper:
             ...     {'peer': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -295,13 +197,12 @@ class ConfederationPeersHelper:
             >>> if fgt.api.cmdb.router.bgp.confederation_peers.exists(peer="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(peer=peer)
-        return entry is not None
+        return self._entry_exists(peer)
 
 
 
 
-class AggregateAddressHelper:
+class AggregateAddressHelper(ChildTableHelper):
     """
     Helper for managing aggregate-address child table in cmdb.router.bgp.
     
@@ -368,27 +269,8 @@ class AggregateAddressHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.aggregate_address.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -426,55 +308,9 @@ class AggregateAddressHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -497,36 +333,9 @@ class AggregateAddressHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.aggregate_address.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -552,17 +361,9 @@ class AggregateAddressHelper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -582,13 +383,12 @@ class AggregateAddressHelper:
             >>> if fgt.api.cmdb.router.bgp.aggregate_address.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
 
 
-class AggregateAddress6Helper:
+class AggregateAddress6Helper(ChildTableHelper):
     """
     Helper for managing aggregate-address6 child table in cmdb.router.bgp.
     
@@ -655,27 +455,8 @@ class AggregateAddress6Helper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.aggregate_address6.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -713,55 +494,9 @@ class AggregateAddress6Helper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -784,36 +519,9 @@ class AggregateAddress6Helper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.aggregate_address6.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -839,17 +547,9 @@ class AggregateAddress6Helper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -869,13 +569,12 @@ class AggregateAddress6Helper:
             >>> if fgt.api.cmdb.router.bgp.aggregate_address6.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
 
 
-class NeighborHelper:
+class NeighborHelper(ChildTableHelper):
     """
     Helper for managing neighbor child table in cmdb.router.bgp.
     
@@ -942,27 +641,8 @@ class NeighborHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.neighbor.get(ip="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if ip is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == ip:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(ip):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<ip>] (child-table sub-path)
+        return self._get_entries(ip)
     
     def set(
         self,
@@ -1000,55 +680,9 @@ class NeighborHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -1071,36 +705,9 @@ class NeighborHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.neighbor.delete(ip="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != ip and str(entry_value) != str(ip)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<ip> (child-table sub-path)
+        return self._delete_entry(
+            ip, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -1126,17 +733,9 @@ class NeighborHelper:
             ...     {'ip': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -1156,13 +755,12 @@ class NeighborHelper:
             >>> if fgt.api.cmdb.router.bgp.neighbor.exists(ip="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(ip=ip)
-        return entry is not None
+        return self._entry_exists(ip)
 
 
 
 
-class NeighborGroupHelper:
+class NeighborGroupHelper(ChildTableHelper):
     """
     Helper for managing neighbor-group child table in cmdb.router.bgp.
     
@@ -1229,27 +827,8 @@ class NeighborGroupHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.neighbor_group.get(name="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if name is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == name:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(name):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<name>] (child-table sub-path)
+        return self._get_entries(name)
     
     def set(
         self,
@@ -1287,55 +866,9 @@ class NeighborGroupHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -1358,36 +891,9 @@ class NeighborGroupHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.neighbor_group.delete(name="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != name and str(entry_value) != str(name)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<name> (child-table sub-path)
+        return self._delete_entry(
+            name, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -1413,17 +919,9 @@ class NeighborGroupHelper:
             ...     {'name': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -1443,13 +941,12 @@ class NeighborGroupHelper:
             >>> if fgt.api.cmdb.router.bgp.neighbor_group.exists(name="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(name=name)
-        return entry is not None
+        return self._entry_exists(name)
 
 
 
 
-class NeighborRangeHelper:
+class NeighborRangeHelper(ChildTableHelper):
     """
     Helper for managing neighbor-range child table in cmdb.router.bgp.
     
@@ -1516,27 +1013,8 @@ class NeighborRangeHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.neighbor_range.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -1574,55 +1052,9 @@ class NeighborRangeHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -1645,36 +1077,9 @@ class NeighborRangeHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.neighbor_range.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -1700,17 +1105,9 @@ class NeighborRangeHelper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -1730,13 +1127,12 @@ class NeighborRangeHelper:
             >>> if fgt.api.cmdb.router.bgp.neighbor_range.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
 
 
-class NeighborRange6Helper:
+class NeighborRange6Helper(ChildTableHelper):
     """
     Helper for managing neighbor-range6 child table in cmdb.router.bgp.
     
@@ -1803,27 +1199,8 @@ class NeighborRange6Helper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.neighbor_range6.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -1861,55 +1238,9 @@ class NeighborRange6Helper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -1932,36 +1263,9 @@ class NeighborRange6Helper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.neighbor_range6.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -1987,17 +1291,9 @@ class NeighborRange6Helper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -2017,13 +1313,12 @@ class NeighborRange6Helper:
             >>> if fgt.api.cmdb.router.bgp.neighbor_range6.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
 
 
-class NetworkHelper:
+class NetworkHelper(ChildTableHelper):
     """
     Helper for managing network child table in cmdb.router.bgp.
     
@@ -2090,27 +1385,8 @@ class NetworkHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.network.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -2148,55 +1424,9 @@ class NetworkHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -2219,36 +1449,9 @@ class NetworkHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.network.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -2274,17 +1477,9 @@ class NetworkHelper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -2304,13 +1499,12 @@ class NetworkHelper:
             >>> if fgt.api.cmdb.router.bgp.network.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
 
 
-class Network6Helper:
+class Network6Helper(ChildTableHelper):
     """
     Helper for managing network6 child table in cmdb.router.bgp.
     
@@ -2377,27 +1571,8 @@ class Network6Helper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.network6.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -2435,55 +1610,9 @@ class Network6Helper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -2506,36 +1635,9 @@ class Network6Helper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.network6.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -2561,17 +1663,9 @@ class Network6Helper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -2591,13 +1685,12 @@ class Network6Helper:
             >>> if fgt.api.cmdb.router.bgp.network6.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
 
 
-class RedistributeHelper:
+class RedistributeHelper(ChildTableHelper):
     """
     Helper for managing redistribute child table in cmdb.router.bgp.
     
@@ -2664,27 +1757,8 @@ class RedistributeHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.redistribute.get(name="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if name is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == name:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(name):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<name>] (child-table sub-path)
+        return self._get_entries(name)
     
     def set(
         self,
@@ -2722,55 +1796,9 @@ class RedistributeHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -2793,36 +1821,9 @@ class RedistributeHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.redistribute.delete(name="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != name and str(entry_value) != str(name)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<name> (child-table sub-path)
+        return self._delete_entry(
+            name, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -2848,17 +1849,9 @@ class RedistributeHelper:
             ...     {'name': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -2878,13 +1871,12 @@ class RedistributeHelper:
             >>> if fgt.api.cmdb.router.bgp.redistribute.exists(name="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(name=name)
-        return entry is not None
+        return self._entry_exists(name)
 
 
 
 
-class Redistribute6Helper:
+class Redistribute6Helper(ChildTableHelper):
     """
     Helper for managing redistribute6 child table in cmdb.router.bgp.
     
@@ -2951,27 +1943,8 @@ class Redistribute6Helper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.redistribute6.get(name="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if name is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == name:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(name):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<name>] (child-table sub-path)
+        return self._get_entries(name)
     
     def set(
         self,
@@ -3009,55 +1982,9 @@ class Redistribute6Helper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -3080,36 +2007,9 @@ class Redistribute6Helper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.redistribute6.delete(name="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != name and str(entry_value) != str(name)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<name> (child-table sub-path)
+        return self._delete_entry(
+            name, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -3135,17 +2035,9 @@ class Redistribute6Helper:
             ...     {'name': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -3165,13 +2057,12 @@ class Redistribute6Helper:
             >>> if fgt.api.cmdb.router.bgp.redistribute6.exists(name="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(name=name)
-        return entry is not None
+        return self._entry_exists(name)
 
 
 
 
-class AdminDistanceHelper:
+class AdminDistanceHelper(ChildTableHelper):
     """
     Helper for managing admin-distance child table in cmdb.router.bgp.
     
@@ -3238,27 +2129,8 @@ class AdminDistanceHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.admin_distance.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -3296,55 +2168,9 @@ class AdminDistanceHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -3367,36 +2193,9 @@ class AdminDistanceHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.admin_distance.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -3422,17 +2221,9 @@ class AdminDistanceHelper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -3452,13 +2243,12 @@ class AdminDistanceHelper:
             >>> if fgt.api.cmdb.router.bgp.admin_distance.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
 
 
-class VrfHelper:
+class VrfHelper(ChildTableHelper):
     """
     Helper for managing vrf child table in cmdb.router.bgp.
     
@@ -3525,27 +2315,8 @@ class VrfHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.vrf.get(vrf="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if vrf is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == vrf:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(vrf):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<vrf>] (child-table sub-path)
+        return self._get_entries(vrf)
     
     def set(
         self,
@@ -3583,55 +2354,9 @@ class VrfHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -3654,36 +2379,9 @@ class VrfHelper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.vrf.delete(vrf="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != vrf and str(entry_value) != str(vrf)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<vrf> (child-table sub-path)
+        return self._delete_entry(
+            vrf, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -3709,17 +2407,9 @@ class VrfHelper:
             ...     {'vrf': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -3739,13 +2429,12 @@ class VrfHelper:
             >>> if fgt.api.cmdb.router.bgp.vrf.exists(vrf="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(vrf=vrf)
-        return entry is not None
+        return self._entry_exists(vrf)
 
 
 
 
-class Vrf6Helper:
+class Vrf6Helper(ChildTableHelper):
     """
     Helper for managing vrf6 child table in cmdb.router.bgp.
     
@@ -3812,27 +2501,8 @@ class Vrf6Helper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.bgp.vrf6.get(vrf="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if vrf is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == vrf:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(vrf):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<vrf>] (child-table sub-path)
+        return self._get_entries(vrf)
     
     def set(
         self,
@@ -3870,55 +2540,9 @@ class Vrf6Helper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -3941,36 +2565,9 @@ class Vrf6Helper:
         Example:
             >>> result = fgt.api.cmdb.router.bgp.vrf6.delete(vrf="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != vrf and str(entry_value) != str(vrf)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<vrf> (child-table sub-path)
+        return self._delete_entry(
+            vrf, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -3996,17 +2593,9 @@ class Vrf6Helper:
             ...     {'vrf': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -4026,7 +2615,6 @@ class Vrf6Helper:
             >>> if fgt.api.cmdb.router.bgp.vrf6.exists(vrf="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(vrf=vrf)
-        return entry is not None
+        return self._entry_exists(vrf)
 
 
@@ -9,12 +9,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
+from hfortix_fortios._helpers.child_tables import ChildTableHelper
+
 if TYPE_CHECKING:
     from hfortix_fortios.models import FortiObject
 
 
 
-class IsisNetHelper:
+class IsisNetHelper(ChildTableHelper):
     """
     Helper for managing isis-net child table in cmdb.router.isis.
     
@@ -81,27 +83,8 @@ class IsisNetHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.isis.isis_net.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -139,55 +122,9 @@ class IsisNetHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -210,36 +147,9 @@ class IsisNetHelper:
         Example:
             >>> result = fgt.api.cmdb.router.isis.isis_net.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -265,17 +175,9 @@ class IsisNetHelper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -295,13 +197,12 @@ class IsisNetHelper:
             >>> if fgt.api.cmdb.router.isis.isis_net.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
 
 
-class IsisInterfaceHelper:
+class IsisInterfaceHelper(ChildTableHelper):
     """
     Helper for managing isis-interface child table in cmdb.router.isis.
     
@@ -368,27 +269,8 @@ class IsisInterfaceHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.isis.isis_interface.get(name="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if name is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == name:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(name):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<name>] (child-table sub-path)
+        return self._get_entries(name)
     
     def set(
         self,
@@ -426,55 +308,9 @@ class IsisInterfaceHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -497,36 +333,9 @@ class IsisInterfaceHelper:
         Example:
             >>> result = fgt.api.cmdb.router.isis.isis_interface.delete(name="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != name and str(entry_value) != str(name)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<name> (child-table sub-path)
+        return self._delete_entry(
+            name, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -552,17 +361,9 @@ class IsisInterfaceHelper:
             ...     {'name': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -582,13 +383,12 @@ class IsisInterfaceHelper:
             >>> if fgt.api.cmdb.router.isis.isis_interface.exists(name="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(name=name)
-        return entry is not None
+        return self._entry_exists(name)
 
 
 
 
-class SummaryAddressHelper:
+class SummaryAddressHelper(ChildTableHelper):
     """
     Helper for managing summary-address child table in cmdb.router.isis.
     
@@ -655,27 +455,8 @@ class SummaryAddressHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.isis.summary_address.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -713,55 +494,9 @@ class SummaryAddressHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -784,36 +519,9 @@ class SummaryAddressHelper:
         Example:
             >>> result = fgt.api.cmdb.router.isis.summary_address.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -839,17 +547,9 @@ class SummaryAddressHelper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -869,13 +569,12 @@ class SummaryAddressHelper:
             >>> if fgt.api.cmdb.router.isis.summary_address.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
 
 
-class SummaryAddress6Helper:
+class SummaryAddress6Helper(ChildTableHelper):
     """
     Helper for managing summary-address6 child table in cmdb.router.isis.
     
@@ -942,27 +641,8 @@ class SummaryAddress6Helper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.isis.summary_address6.get(id="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if id is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == id:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(id):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<id>] (child-table sub-path)
+        return self._get_entries(id)
     
     def set(
         self,
@@ -1000,55 +680,9 @@ class SummaryAddress6Helper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -1071,36 +705,9 @@ class SummaryAddress6Helper:
         Example:
             >>> result = fgt.api.cmdb.router.isis.summary_address6.delete(id="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != id and str(entry_value) != str(id)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<id> (child-table sub-path)
+        return self._delete_entry(
+            id, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -1126,17 +733,9 @@ class SummaryAddress6Helper:
             ...     {'id': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -1156,13 +755,12 @@ class SummaryAddress6Helper:
             >>> if fgt.api.cmdb.router.isis.summary_address6.exists(id="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(id=id)
-        return entry is not None
+        return self._entry_exists(id)
 
 
 
 
-class RedistributeHelper:
+class RedistributeHelper(ChildTableHelper):
     """
     Helper for managing redistribute child table in cmdb.router.isis.
     
@@ -1229,27 +827,8 @@ class RedistributeHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.isis.redistribute.get(protocol="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if protocol is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == protocol:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(protocol):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<protocol>] (child-table sub-path)
+        return self._get_entries(protocol)
     
     def set(
         self,
@@ -1287,55 +866,9 @@ class RedistributeHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -1358,36 +891,9 @@ class RedistributeHelper:
         Example:
             >>> result = fgt.api.cmdb.router.isis.redistribute.delete(protocol="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != protocol and str(entry_value) != str(protocol)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<protocol> (child-table sub-path)
+        return self._delete_entry(
+            protocol, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -1413,17 +919,9 @@ class RedistributeHelper:
             ...     {'protocol': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -1443,13 +941,12 @@ class RedistributeHelper:
             >>> if fgt.api.cmdb.router.isis.redistribute.exists(protocol="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(protocol=protocol)
-        return entry is not None
+        return self._entry_exists(protocol)
 
 
 
 
-class Redistribute6Helper:
+class Redistribute6Helper(ChildTableHelper):
     """
     Helper for managing redistribute6 child table in cmdb.router.isis.
     
@@ -1516,27 +1013,8 @@ class Redistribute6Helper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.isis.redistribute6.get(protocol="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if protocol is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == protocol:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(protocol):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<protocol>] (child-table sub-path)
+        return self._get_entries(protocol)
     
     def set(
         self,
@@ -1574,55 +1052,9 @@ class Redistribute6Helper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -1645,36 +1077,9 @@ class Redistribute6Helper:
         Example:
             >>> result = fgt.api.cmdb.router.isis.redistribute6.delete(protocol="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != protocol and str(entry_value) != str(protocol)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<protocol> (child-table sub-path)
+        return self._delete_entry(
+            protocol, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -1700,17 +1105,9 @@ class Redistribute6Helper:
             ...     {'protocol': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -1730,7 +1127,6 @@ class Redistribute6Helper:
             >>> if fgt.api.cmdb.router.isis.redistribute6.exists(protocol="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(protocol=protocol)
-        return entry is not None
+        return self._entry_exists(protocol)
 
 
@@ -9,12 +9,14 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any, Literal, TypedDict
 
+from hfortix_fortios._helpers.child_tables import ChildTableHelper
+
 if TYPE_CHECKING:
     from hfortix_fortios.models import FortiObject
 
 
 
-class InterfaceHelper:
+class InterfaceHelper(ChildTableHelper):
     """
     Helper for managing interface child table in cmdb.router.multicast6.
     
@@ -81,27 +83,8 @@ class InterfaceHelper:
             >>> # Get specific entry
             >>> entry = fgt.api.cmdb.router.multicast6.interface.get(name="value")
         """
-        # Get parent config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Extract child table (entries are already FortiObjects)
-        entries = getattr(config, self._table_name, [])
-        
-        # If no filter, return all
-        if name is None:
-            return list(entries) if entries else []
-        
-        # Find specific entry (handle both string and int comparison)
-        for entry in entries:
-            entry_value = entry.get(self._mkey) if hasattr(entry, 'get') else getattr(entry, self._mkey, None)
-            # Try exact match first
-            if entry_value == name:
-                return entry
-            # Try string comparison for int/string mismatches
-            if str(entry_value) == str(name):
-                return entry
-        
-        return None
+        # GET <parent>/<table>[/<name>] (child-table sub-path)
+        return self._get_entries(name)
     
     def set(
         self,
@@ -139,55 +122,9 @@ class InterfaceHelper:
             ...     field="new_value",
             ... )
         """
-        # Validate mkey present
-        if self._mkey not in kwargs:
-            raise ValueError(f"{self._mkey} is required")
-        
-        mkey_value = kwargs[self._mkey]
-        
-        # Convert Python snake_case keys to FortiOS kebab-case
-        fortios_kwargs = {k.replace('_', '-'): v for k, v in kwargs.items()}
-        
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Find and update or append
-        found = False
-        for i, entry in enumerate(entries):
-            entry_value = entry.get(self._mkey)
-            # Handle both exact match and string comparison for int/string mismatches
-            if entry_value == mkey_value or str(entry_value) == str(mkey_value):
-                # Get raw dict from FortiObject (which has hyphenated keys)
-                entry_dict = entry.to_dict() if hasattr(entry, 'to_dict') else entry
-                # Update existing entry
-                entries[i] = {**entry_dict, **fortios_kwargs}
-                found = True
-                break
-        
-        if not found:
-            # Add new entry
-            entries.append(fortios_kwargs)
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT/POST of this entry only (child-table sub-path)
+        return self._set_entry(
+            kwargs, error_mode=error_mode, error_format=error_format
         )
     
     def delete(
@@ -210,36 +147,9 @@ class InterfaceHelper:
         Example:
             >>> result = fgt.api.cmdb.router.multicast6.interface.delete(name="value")
         """
-        # Get current config (singleton endpoint, no vdom parameter)
-        config = self._parent.get()
-        
-        # Get current entries
-        entries = list(getattr(config, self._table_name, []))
-        
-        # Remove matching entry (handle both exact match and string comparison)
-        def should_keep(e):
-            entry_value = e.get(self._mkey)
-            return entry_value != name and str(entry_value) != str(name)
-        
-        entries = [e for e in entries if should_keep(e)]
-        
-        # Convert all FortiObjects to dicts for API submission
-        entries_as_dicts = [
-            e.to_dict() if hasattr(e, 'to_dict') else e
-            for e in entries
-        ]
-        
-        # Get all fields from current config to preserve other fields
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries_as_dicts
-        
-        # Put back entire config with updated child table (singleton endpoint)
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # DELETE <parent>/<table>/<name> (child-table sub-path)
+        return self._delete_entry(
+            name, error_mode=error_mode, error_format=error_format
         )
     
     def put(
@@ -265,17 +175,9 @@ class InterfaceHelper:
             ...     {'name': "value2"},
             ... ])
         """
-        # Get current config to preserve other fields
-        config = self._parent.get()
-        config_dict = config.to_dict() if hasattr(config, 'to_dict') else {}
-        
-        # Update only the child table field
-        config_dict[self._table_name.replace('_', '-')] = entries
-        
-        return self._parent.put(
-            payload_dict=config_dict,
-            error_mode=error_mode,
-            error_format=error_format,
+        # PUT the parent with this child table only
+        return self._put_entries(
+            entries, error_mode=error_mode, error_format=error_format
         )
     
     def exists(
@@ -295,7 +197,6 @@ class InterfaceHelper:
             >>> if fgt.api.cmdb.router.multicast6.interface.exists(name="value"):
             ...     print("Entry exists")
         """
-        entry = self.get(name=name)
-        return entry is not None
+        return self._entry_exists(name)
 
 
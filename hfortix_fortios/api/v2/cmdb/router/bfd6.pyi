@@ -10,7 +10,9 @@ from __future__ import annotations
 
 from typing import (
     Any,
+    AsyncIterator,
     ClassVar,
+    Iterator,
     Literal,
     TypedDict,
 )
@@ -20,6 +22,8 @@ from hfortix_fortios.models import (
     FortiObjectList,
 )
 
+from hfortix_fortios._helpers.child_tables import ChildTableBatch
+
 # Import child table helper types
 from ._bfd6_child_tables import (
     NeighborHelper,
@@ -140,6 +144,25 @@ class Bfd6:
         error_format: Literal["detailed", "simple", "code_only"] | None = ...,
     ) -> Bfd6Object: ...
     
+    # Auto-pagination (start/count windows)
+    def iter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> Iterator[FortiObject[Any]]: ...
+    
+    def aiter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> AsyncIterator[FortiObject[Any]]: ...
+    
     def get_schema(
         self,
         vdom: str | None = ...,
@@ -176,6 +199,12 @@ class Bfd6:
     ) -> FortiObject[Any]: ...
 
 
+    def batch(
+        self,
+        dry_run: bool = ...,
+        vdom: str | bool | None = ...,
+    ) -> ChildTableBatch: ...
+    
     # ================================================================
     # Utility Methods
     # ================================================================
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 from typing import (
     Any,
+    AsyncIterator,
     ClassVar,
+    Iterator,
     Literal,
     TypedDict,
 )
@@ -20,6 +22,8 @@ from hfortix_fortios.models import (
     FortiObjectList,
 )
 
+from hfortix_fortios._helpers.child_tables import ChildTableBatch
+
 # Import child table helper types
 from ._bgp_child_tables import (
     ConfederationPeersHelper,
@@ -1278,6 +1282,25 @@ class Bgp:
         error_format: Literal["detailed", "simple", "code_only"] | None = ...,
     ) -> BgpObject: ...
     
+    # Auto-pagination (start/count windows)
+    def iter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> Iterator[FortiObject[Any]]: ...
+    
+    def aiter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> AsyncIterator[FortiObject[Any]]: ...
+    
     def get_schema(
         self,
         vdom: str | None = ...,
@@ -1378,6 +1401,12 @@ class Bgp:
     ) -> FortiObject[Any]: ...
 
 
+    def batch(
+        self,
+        dry_run: bool = ...,
+        vdom: str | bool | None = ...,
+    ) -> ChildTableBatch: ...
+    
     # ================================================================
     # Utility Methods
     # ================================================================
@@ -10,7 +10,9 @@ from __future__ import annotations
 
 from typing import (
     Any,
+    AsyncIterator,
     ClassVar,
+    Iterator,
     Literal,
     TypedDict,
 )
@@ -20,6 +22,8 @@ from hfortix_fortios.models import (
     FortiObjectList,
 )
 
+from hfortix_fortios._helpers.child_tables import ChildTableBatch
+
 # Import child table helper types
 from ._isis_child_tables import (
     IsisNetHelper,
@@ -377,6 +381,25 @@ class Isis:
         error_format: Literal["detailed", "simple", "code_only"] | None = ...,
     ) -> IsisObject: ...
     
+    # Auto-pagination (start/count windows)
+    def iter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> Iterator[FortiObject[Any]]: ...
+    
+    def aiter_all(
+        self,
+        page_size: int = ...,
+        prefetch: bool = ...,
+        start: int = ...,
+        fanout: int = ...,
+        **filters: Any,
+    ) -> AsyncIterator[FortiObject[Any]]: ...
+    
     def get_schema(
         self,
         vdom: str | None = ...,
@@ -452,6 +475,12 @@ class Isis:
     ) -> FortiObject[Any]: ...
 
 
+    def batch(
+        self,
+        dry_run: bool = ...,
+        vdom: str | bool | None = ...,
+    ) -> ChildTableBatch: ...
+    
     # ================================================================
     # Utility Methods
     # ================================================================
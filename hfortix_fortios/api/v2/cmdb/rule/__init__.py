@@ -1,9 +1,6 @@
 """FortiOS CMDB - Rule category"""
 
-from .fmwp import Fmwp
-from .iotd import Iotd
-from .otdt import Otdt
-from .otvp import Otvp
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Fmwp",
@@ -13,17 +10,28 @@ __all__ = [
     "Rule",
 ]
 
+_LAZY_IMPORTS = {
+    "Fmwp": (".fmwp", "Fmwp"),
+    "Iotd": (".iotd", "Iotd"),
+    "Otdt": (".otdt", "Otdt"),
+    "Otvp": (".otvp", "Otvp"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Rule:
     """Rule endpoints wrapper for CMDB API."""
 
+    fmwp = LazyEndpoint(".fmwp", "Fmwp")
+    iotd = LazyEndpoint(".iotd", "Iotd")
+    otdt = LazyEndpoint(".otdt", "Otdt")
+    otvp = LazyEndpoint(".otvp", "Otvp")
+
     def __init__(self, client):
         """Rule endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.fmwp = Fmwp(client)
-        self.iotd = Iotd(client)
-        self.otdt = Otdt(client)
-        self.otvp = Otvp(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - SctpFilter category"""
 
-from .profile import Profile
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Profile",
     "SctpFilter",
 ]
 
+_LAZY_IMPORTS = {
+    "Profile": (".profile", "Profile"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class SctpFilter:
     """SctpFilter endpoints wrapper for CMDB API."""
 
+    profile = LazyEndpoint(".profile", "Profile")
+
     def __init__(self, client):
         """SctpFilter endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.profile = Profile(client)
+        self._client = client
@@ -1,44 +1,6 @@
 """FortiOS CMDB - SwitchController category"""
 
-from . import acl
-from . import auto_config
-from . import initial_config
-from . import ptp
-from . import qos
-from . import security_policy
-from .custom_command import CustomCommand
-from .dynamic_port_policy import DynamicPortPolicy
-from .flow_tracking import FlowTracking
-from .fortilink_settings import FortilinkSettings
-from .global_ import Global
-from .igmp_snooping import IgmpSnooping
-from .ip_source_guard_log import IpSourceGuardLog
-from .lldp_profile import LldpProfile
-from .lldp_settings import LldpSettings
-from .location import Location
-from .mac_policy import MacPolicy
-from .managed_switch import ManagedSwitch
-from .network_monitor_settings import NetworkMonitorSettings
-from .remote_log import RemoteLog
-from .sflow import Sflow
-from .snmp_community import SnmpCommunity
-from .snmp_sysinfo import SnmpSysinfo
-from .snmp_trap_threshold import SnmpTrapThreshold
-from .snmp_user import SnmpUser
-from .storm_control import StormControl
-from .storm_control_policy import StormControlPolicy
-from .stp_instance import StpInstance
-from .stp_settings import StpSettings
-from .switch_group import SwitchGroup
-from .switch_interface_tag import SwitchInterfaceTag
-from .switch_log import SwitchLog
-from .switch_profile import SwitchProfile
-from .system import System
-from .traffic_policy import TrafficPolicy
-from .traffic_sniffer import TrafficSniffer
-from .virtual_port_pool import VirtualPortPool
-from .vlan_policy import VlanPolicy
-from .x802_1x_settings import X8021xSettings
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Acl",
@@ -83,52 +45,98 @@ __all__ = [
     "X8021xSettings",
 ]
 
+_LAZY_IMPORTS = {
+    "acl": (".acl", None),
+    "auto_config": (".auto_config", None),
+    "initial_config": (".initial_config", None),
+    "ptp": (".ptp", None),
+    "qos": (".qos", None),
+    "security_policy": (".security_policy", None),
+    "CustomCommand": (".custom_command", "CustomCommand"),
+    "DynamicPortPolicy": (".dynamic_port_policy", "DynamicPortPolicy"),
+    "FlowTracking": (".flow_tracking", "FlowTracking"),
+    "FortilinkSettings": (".fortilink_settings", "FortilinkSettings"),
+    "Global": (".global_", "Global"),
+    "IgmpSnooping": (".igmp_snooping", "IgmpSnooping"),
+    "IpSourceGuardLog": (".ip_source_guard_log", "IpSourceGuardLog"),
+    "LldpProfile": (".lldp_profile", "LldpProfile"),
+    "LldpSettings": (".lldp_settings", "LldpSettings"),
+    "Location": (".location", "Location"),
+    "MacPolicy": (".mac_policy", "MacPolicy"),
+    "ManagedSwitch": (".managed_switch", "ManagedSwitch"),
+    "NetworkMonitorSettings": (".network_monitor_settings", "NetworkMonitorSettings"),
+    "RemoteLog": (".remote_log", "RemoteLog"),
+    "Sflow": (".sflow", "Sflow"),
+    "SnmpCommunity": (".snmp_community", "SnmpCommunity"),
+    "SnmpSysinfo": (".snmp_sysinfo", "SnmpSysinfo"),
+    "SnmpTrapThreshold": (".snmp_trap_threshold", "SnmpTrapThreshold"),
+    "SnmpUser": (".snmp_user", "SnmpUser"),
+    "StormControl": (".storm_control", "StormControl"),
+    "StormControlPolicy": (".storm_control_policy", "StormControlPolicy"),
+    "StpInstance": (".stp_instance", "StpInstance"),
+    "StpSettings": (".stp_settings", "StpSettings"),
+    "SwitchGroup": (".switch_group", "SwitchGroup"),
+    "SwitchInterfaceTag": (".switch_interface_tag", "SwitchInterfaceTag"),
+    "SwitchLog": (".switch_log", "SwitchLog"),
+    "SwitchProfile": (".switch_profile", "SwitchProfile"),
+    "System": (".system", "System"),
+    "TrafficPolicy": (".traffic_policy", "TrafficPolicy"),
+    "TrafficSniffer": (".traffic_sniffer", "TrafficSniffer"),
+    "VirtualPortPool": (".virtual_port_pool", "VirtualPortPool"),
+    "VlanPolicy": (".vlan_policy", "VlanPolicy"),
+    "X8021xSettings": (".x802_1x_settings", "X8021xSettings"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class SwitchController:
     """SwitchController endpoints wrapper for CMDB API."""
 
+    acl = LazyEndpoint(".acl", "Acl")
+    auto_config = LazyEndpoint(".auto_config", "AutoConfig")
+    initial_config = LazyEndpoint(".initial_config", "InitialConfig")
+    ptp = LazyEndpoint(".ptp", "Ptp")
+    qos = LazyEndpoint(".qos", "Qos")
+    security_policy = LazyEndpoint(".security_policy", "SecurityPolicy")
+    custom_command = LazyEndpoint(".custom_command", "CustomCommand")
+    dynamic_port_policy = LazyEndpoint(".dynamic_port_policy", "DynamicPortPolicy")
+    flow_tracking = LazyEndpoint(".flow_tracking", "FlowTracking")
+    fortilink_settings = LazyEndpoint(".fortilink_settings", "FortilinkSettings")
+    global_ = LazyEndpoint(".global_", "Global")
+    igmp_snooping = LazyEndpoint(".igmp_snooping", "IgmpSnooping")
+    ip_source_guard_log = LazyEndpoint(".ip_source_guard_log", "IpSourceGuardLog")
+    lldp_profile = LazyEndpoint(".lldp_profile", "LldpProfile")
+    lldp_settings = LazyEndpoint(".lldp_settings", "LldpSettings")
+    location = LazyEndpoint(".location", "Location")
+    mac_policy = LazyEndpoint(".mac_policy", "MacPolicy")
+    managed_switch = LazyEndpoint(".managed_switch", "ManagedSwitch")
+    network_monitor_settings = LazyEndpoint(".network_monitor_settings", "NetworkMonitorSettings")
+    remote_log = LazyEndpoint(".remote_log", "RemoteLog")
+    sflow = LazyEndpoint(".sflow", "Sflow")
+    snmp_community = LazyEndpoint(".snmp_community", "SnmpCommunity")
+    snmp_sysinfo = LazyEndpoint(".snmp_sysinfo", "SnmpSysinfo")
+    snmp_trap_threshold = LazyEndpoint(".snmp_trap_threshold", "SnmpTrapThreshold")
+    snmp_user = LazyEndpoint(".snmp_user", "SnmpUser")
+    storm_control = LazyEndpoint(".storm_control", "StormControl")
+    storm_control_policy = LazyEndpoint(".storm_control_policy", "StormControlPolicy")
+    stp_instance = LazyEndpoint(".stp_instance", "StpInstance")
+    stp_settings = LazyEndpoint(".stp_settings", "StpSettings")
+    switch_group = LazyEndpoint(".switch_group", "SwitchGroup")
+    switch_interface_tag = LazyEndpoint(".switch_interface_tag", "SwitchInterfaceTag")
+    switch_log = LazyEndpoint(".switch_log", "SwitchLog")
+    switch_profile = LazyEndpoint(".switch_profile", "SwitchProfile")
+    system = LazyEndpoint(".system", "System")
+    traffic_policy = LazyEndpoint(".traffic_policy", "TrafficPolicy")
+    traffic_sniffer = LazyEndpoint(".traffic_sniffer", "TrafficSniffer")
+    virtual_port_pool = LazyEndpoint(".virtual_port_pool", "VirtualPortPool")
+    vlan_policy = LazyEndpoint(".vlan_policy", "VlanPolicy")
+    x802_1x_settings = LazyEndpoint(".x802_1x_settings", "X8021xSettings")
+
     def __init__(self, client):
         """SwitchController endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.acl = acl.Acl(client)
-        self.auto_config = auto_config.AutoConfig(client)
-        self.initial_config = initial_config.InitialConfig(client)
-        self.ptp = ptp.Ptp(client)
-        self.qos = qos.Qos(client)
-        self.security_policy = security_policy.SecurityPolicy(client)
-        self.custom_command = CustomCommand(client)
-        self.dynamic_port_policy = DynamicPortPolicy(client)
-        self.flow_tracking = FlowTracking(client)
-        self.fortilink_settings = FortilinkSettings(client)
-        self.global_ = Global(client)
-        self.igmp_snooping = IgmpSnooping(client)
-        self.ip_source_guard_log = IpSourceGuardLog(client)
-        self.lldp_profile = LldpProfile(client)
-        self.lldp_settings = LldpSettings(client)
-        self.location = Location(client)
-        self.mac_policy = MacPolicy(client)
-        self.managed_switch = ManagedSwitch(client)
-        self.network_monitor_settings = NetworkMonitorSettings(client)
-        self.remote_log = RemoteLog(client)
-        self.sflow = Sflow(client)
-        self.snmp_community = SnmpCommunity(client)
-        self.snmp_sysinfo = SnmpSysinfo(client)
-        self.snmp_trap_threshold = SnmpTrapThreshold(client)
-        self.snmp_user = SnmpUser(client)
-        self.storm_control = StormControl(client)
-        self.storm_control_policy = StormControlPolicy(client)
-        self.stp_instance = StpInstance(client)
-        self.stp_settings = StpSettings(client)
-        self.switch_group = SwitchGroup(client)
-        self.switch_interface_tag = SwitchInterfaceTag(client)
-        self.switch_log = SwitchLog(client)
-        self.switch_profile = SwitchProfile(client)
-        self.system = System(client)
-        self.traffic_policy = TrafficPolicy(client)
-        self.traffic_sniffer = TrafficSniffer(client)
-        self.virtual_port_pool = VirtualPortPool(client)
-        self.vlan_policy = VlanPolicy(client)
-        self.x802_1x_settings = X8021xSettings(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - Acl category"""
 
-from .group import Group
-from .ingress import Ingress
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Acl",
@@ -9,15 +8,24 @@ __all__ = [
     "Ingress",
 ]
 
+_LAZY_IMPORTS = {
+    "Group": (".group", "Group"),
+    "Ingress": (".ingress", "Ingress"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Acl:
     """Acl endpoints wrapper for CMDB API."""
 
+    group = LazyEndpoint(".group", "Group")
+    ingress = LazyEndpoint(".ingress", "Ingress")
+
     def __init__(self, client):
         """Acl endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.group = Group(client)
-        self.ingress = Ingress(client)
+        self._client = client
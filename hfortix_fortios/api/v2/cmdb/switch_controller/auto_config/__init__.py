@@ -1,8 +1,6 @@
 """FortiOS CMDB - AutoConfig category"""
 
-from .custom import Custom
-from .default import Default
-from .policy import Policy
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AutoConfig",
@@ -11,16 +9,26 @@ __all__ = [
     "Policy",
 ]
 
+_LAZY_IMPORTS = {
+    "Custom": (".custom", "Custom"),
+    "Default": (".default", "Default"),
+    "Policy": (".policy", "Policy"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class AutoConfig:
     """AutoConfig endpoints wrapper for CMDB API."""
 
+    custom = LazyEndpoint(".custom", "Custom")
+    default = LazyEndpoint(".default", "Default")
+    policy = LazyEndpoint(".policy", "Policy")
+
     def __init__(self, client):
         """AutoConfig endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.custom = Custom(client)
-        self.default = Default(client)
-        self.policy = Policy(client)
+        self._client = client
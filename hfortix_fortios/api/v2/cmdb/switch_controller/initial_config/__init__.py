@@ -1,7 +1,6 @@
 """FortiOS CMDB - InitialConfig category"""
 
-from .template import Template
-from .vlans import Vlans
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "InitialConfig",
@@ -9,15 +8,24 @@ __all__ = [
     "Vlans",
 ]
 
+_LAZY_IMPORTS = {
+    "Template": (".template", "Template"),
+    "Vlans": (".vlans", "Vlans"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class InitialConfig:
     """InitialConfig endpoints wrapper for CMDB API."""
 
+    template = LazyEndpoint(".template", "Template")
+    vlans = LazyEndpoint(".vlans", "Vlans")
+
     def __init__(self, client):
         """InitialConfig endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.template = Template(client)
-        self.vlans = Vlans(client)
+        self._client = client
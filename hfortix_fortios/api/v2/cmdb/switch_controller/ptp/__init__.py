@@ -1,7 +1,6 @@
 """FortiOS CMDB - Ptp category"""
 
-from .interface_policy import InterfacePolicy
-from .profile import Profile
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "InterfacePolicy",
@@ -9,15 +8,24 @@ __all__ = [
     "Ptp",
 ]
 
+_LAZY_IMPORTS = {
+    "InterfacePolicy": (".interface_policy", "InterfacePolicy"),
+    "Profile": (".profile", "Profile"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ptp:
     """Ptp endpoints wrapper for CMDB API."""
 
+    interface_policy = LazyEndpoint(".interface_policy", "InterfacePolicy")
+    profile = LazyEndpoint(".profile", "Profile")
+
     def __init__(self, client):
         """Ptp endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.interface_policy = InterfacePolicy(client)
-        self.profile = Profile(client)
+        self._client = client
@@ -1,9 +1,6 @@
 """FortiOS CMDB - Qos category"""
 
-from .dot1p_map import Dot1pMap
-from .ip_dscp_map import IpDscpMap
-from .qos_policy import QosPolicy
-from .queue_policy import QueuePolicy
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Dot1pMap",
@@ -13,17 +10,28 @@ __all__ = [
     "QueuePolicy",
 ]
 
+_LAZY_IMPORTS = {
+    "Dot1pMap": (".dot1p_map", "Dot1pMap"),
+    "IpDscpMap": (".ip_dscp_map", "IpDscpMap"),
+    "QosPolicy": (".qos_policy", "QosPolicy"),
+    "QueuePolicy": (".queue_policy", "QueuePolicy"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Qos:
     """Qos endpoints wrapper for CMDB API."""
 
+    dot1p_map = LazyEndpoint(".dot1p_map", "Dot1pMap")
+    ip_dscp_map = LazyEndpoint(".ip_dscp_map", "IpDscpMap")
+    qos_policy = LazyEndpoint(".qos_policy", "QosPolicy")
+    queue_policy = LazyEndpoint(".queue_policy", "QueuePolicy")
+
     def __init__(self, client):
         """Qos endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.dot1p_map = Dot1pMap(client)
-        self.ip_dscp_map = IpDscpMap(client)
-        self.qos_policy = QosPolicy(client)
-        self.queue_policy = QueuePolicy(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - SecurityPolicy category"""
 
-from .local_access import LocalAccess
-from .x802_1x import X8021x
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "LocalAccess",
@@ -9,15 +8,24 @@ __all__ = [
     "X8021x",
 ]
 
+_LAZY_IMPORTS = {
+    "LocalAccess": (".local_access", "LocalAccess"),
+    "X8021x": (".x802_1x", "X8021x"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class SecurityPolicy:
     """SecurityPolicy endpoints wrapper for CMDB API."""
 
+    local_access = LazyEndpoint(".local_access", "LocalAccess")
+    x802_1x = LazyEndpoint(".x802_1x", "X8021x")
+
     def __init__(self, client):
         """SecurityPolicy endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.local_access = LocalAccess(client)
-        self.x802_1x = X8021x(client)
+        self._client = client
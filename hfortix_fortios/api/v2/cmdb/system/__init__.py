@@ -1,134 +1,6 @@
 """FortiOS CMDB - System category"""
 
-from . import autoupdate
-from . import dhcp
-from . import dhcp6
-from . import lldp
-from . import modem3g
-from . import replacemsg
-from . import security_rating
-from . import snmp
-from .accprofile import Accprofile
-from .acme import Acme
-from .admin import Admin
-from .affinity_interrupt import AffinityInterrupt
-from .affinity_packet_redistribution import AffinityPacketRedistribution
-from .alarm import Alarm
-from .alias import Alias
-from .api_user import ApiUser
-from .arp_table import ArpTable
-from .auto_install import AutoInstall
-from .auto_script import AutoScript
-from .automation_action import AutomationAction
-from .automation_condition import AutomationCondition
-from .automation_destination import AutomationDestination
-from .automation_stitch import AutomationStitch
-from .automation_trigger import AutomationTrigger
-from .central_management import CentralManagement
-from .cloud_service import CloudService
-from .console import Console
-from .csf import Csf
-from .custom_language import CustomLanguage
-from .ddns import Ddns
-from .dedicated_mgmt import DedicatedMgmt
-from .device_upgrade import DeviceUpgrade
-from .device_upgrade_exemptions import DeviceUpgradeExemptions
-from .dns import Dns
-from .dns64 import Dns64
-from .dns_database import DnsDatabase
-from .dns_server import DnsServer
-from .dscp_based_priority import DscpBasedPriority
-from .email_server import EmailServer
-from .evpn import Evpn
-from .external_resource import ExternalResource
-from .fabric_vpn import FabricVpn
-from .federated_upgrade import FederatedUpgrade
-from .fips_cc import FipsCc
-from .fortiguard import Fortiguard
-from .fortisandbox import Fortisandbox
-from .fsso_polling import FssoPolling
-from .ftm_push import FtmPush
-from .geneve import Geneve
-from .geoip_country import GeoipCountry
-from .geoip_override import GeoipOverride
-from .global_ import Global
-from .gre_tunnel import GreTunnel
-from .ha import Ha
-from .ha_monitor import HaMonitor
-from .health_check_fortiguard import HealthCheckFortiguard
-from .ike import Ike
-from .interface import Interface
-from .ipam import Ipam
-from .ipip_tunnel import IpipTunnel
-from .ips import Ips
-from .ips_urlfilter_dns import IpsUrlfilterDns
-from .ips_urlfilter_dns6 import IpsUrlfilterDns6
-from .ipsec_aggregate import IpsecAggregate
-from .ipv6_neighbor_cache import Ipv6NeighborCache
-from .ipv6_tunnel import Ipv6Tunnel
-from .link_monitor import LinkMonitor
-from .lte_modem import LteModem
-from .mac_address_table import MacAddressTable
-from .mobile_tunnel import MobileTunnel
-from .modem import Modem
-from .nd_proxy import NdProxy
-from .netflow import Netflow
-from .network_visibility import NetworkVisibility
-from .ngfw_settings import NgfwSettings
-from .np6xlite import Np6xlite
-from .npu import Npu
-from .ntp import Ntp
-from .object_tagging import ObjectTagging
-from .password_policy import PasswordPolicy
-from .password_policy_guest_admin import PasswordPolicyGuestAdmin
-from .pcp_server import PcpServer
-from .physical_switch import PhysicalSwitch
-from .pppoe_interface import PppoeInterface
-from .probe_response import ProbeResponse
-from .proxy_arp import ProxyArp
-from .ptp import Ptp
-from .replacemsg_group import ReplacemsgGroup
-from .replacemsg_image import ReplacemsgImage
-from .resource_limits import ResourceLimits
-from .saml import Saml
-from .sdn_connector import SdnConnector
-from .sdn_proxy import SdnProxy
-from .sdn_vpn import SdnVpn
-from .sdwan import Sdwan
-from .session_helper import SessionHelper
-from .session_ttl import SessionTtl
-from .settings import Settings
-from .sflow import Sflow
-from .sit_tunnel import SitTunnel
-from .sms_server import SmsServer
-from .sov_sase import SovSase
-from .speed_test_schedule import SpeedTestSchedule
-from .speed_test_server import SpeedTestServer
-from .speed_test_setting import SpeedTestSetting
-from .ssh_config import SshConfig
-from .sso_admin import SsoAdmin
-from .sso_forticloud_admin import SsoForticloudAdmin
-from .sso_fortigate_cloud_admin import SsoFortigateCloudAdmin
-from .standalone_cluster import StandaloneCluster
-from .storage import Storage
-from .stp import Stp
-from .switch_interface import SwitchInterface
-from .timezone import Timezone
-from .tos_based_priority import TosBasedPriority
-from .vdom import Vdom
-from .vdom_dns import VdomDns
-from .vdom_exception import VdomException
-from .vdom_link import VdomLink
-from .vdom_netflow import VdomNetflow
-from .vdom_property import VdomProperty
-from .vdom_radius_server import VdomRadiusServer
-from .vdom_sflow import VdomSflow
-from .virtual_switch import VirtualSwitch
-from .virtual_wire_pair import VirtualWirePair
-from .vne_interface import VneInterface
-from .vxlan import Vxlan
-from .wccp import Wccp
-from .zone import Zone
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Accprofile",
@@ -263,142 +135,278 @@ __all__ = [
     "Zone",
 ]
 
+_LAZY_IMPORTS = {
+    "autoupdate": (".autoupdate", None),
+    "dhcp": (".dhcp", None),
+    "dhcp6": (".dhcp6", None),
+    "lldp": (".lldp", None),
+    "modem3g": (".modem3g", None),
+    "replacemsg": (".replacemsg", None),
+    "security_rating": (".security_rating", None),
+    "snmp": (".snmp", None),
+    "Accprofile": (".accprofile", "Accprofile"),
+    "Acme": (".acme", "Acme"),
+    "Admin": (".admin", "Admin"),
+    "AffinityInterrupt": (".affinity_interrupt", "AffinityInterrupt"),
+    "AffinityPacketRedistribution": (".affinity_packet_redistribution", "AffinityPacketRedistribution"),
+    "Alarm": (".alarm", "Alarm"),
+    "Alias": (".alias", "Alias"),
+    "ApiUser": (".api_user", "ApiUser"),
+    "ArpTable": (".arp_table", "ArpTable"),
+    "AutoInstall": (".auto_install", "AutoInstall"),
+    "AutoScript": (".auto_script", "AutoScript"),
+    "AutomationAction": (".automation_action", "AutomationAction"),
+    "AutomationCondition": (".automation_condition", "AutomationCondition"),
+    "AutomationDestination": (".automation_destination", "AutomationDestination"),
+    "AutomationStitch": (".automation_stitch", "AutomationStitch"),
+    "AutomationTrigger": (".automation_trigger", "AutomationTrigger"),
+    "CentralManagement": (".central_management", "CentralManagement"),
+    "CloudService": (".cloud_service", "CloudService"),
+    "Console": (".console", "Console"),
+    "Csf": (".csf", "Csf"),
+    "CustomLanguage": (".custom_language", "CustomLanguage"),
+    "Ddns": (".ddns", "Ddns"),
+    "DedicatedMgmt": (".dedicated_mgmt", "DedicatedMgmt"),
+    "DeviceUpgrade": (".device_upgrade", "DeviceUpgrade"),
+    "DeviceUpgradeExemptions": (".device_upgrade_exemptions", "DeviceUpgradeExemptions"),
+    "Dns": (".dns", "Dns"),
+    "Dns64": (".dns64", "Dns64"),
+    "DnsDatabase": (".dns_database", "DnsDatabase"),
+    "DnsServer": (".dns_server", "DnsServer"),
+    "DscpBasedPriority": (".dscp_based_priority", "DscpBasedPriority"),
+    "EmailServer": (".email_server", "EmailServer"),
+    "Evpn": (".evpn", "Evpn"),
+    "ExternalResource": (".external_resource", "ExternalResource"),
+    "FabricVpn": (".fabric_vpn", "FabricVpn"),
+    "FederatedUpgrade": (".federated_upgrade", "FederatedUpgrade"),
+    "FipsCc": (".fips_cc", "FipsCc"),
+    "Fortiguard": (".fortiguard", "Fortiguard"),
+    "Fortisandbox": (".fortisandbox", "Fortisandbox"),
+    "FssoPolling": (".fsso_polling", "FssoPolling"),
+    "FtmPush": (".ftm_push", "FtmPush"),
+    "Geneve": (".geneve", "Geneve"),
+    "GeoipCountry": (".geoip_country", "GeoipCountry"),
+    "GeoipOverride": (".geoip_override", "GeoipOverride"),
+    "Global": (".global_", "Global"),
+    "GreTunnel": (".gre_tunnel", "GreTunnel"),
+    "Ha": (".ha", "Ha"),
+    "HaMonitor": (".ha_monitor", "HaMonitor"),
+    "HealthCheckFortiguard": (".health_check_fortiguard", "HealthCheckFortiguard"),
+    "Ike": (".ike", "Ike"),
+    "Interface": (".interface", "Interface"),
+    "Ipam": (".ipam", "Ipam"),
+    "IpipTunnel": (".ipip_tunnel", "IpipTunnel"),
+    "Ips": (".ips", "Ips"),
+    "IpsUrlfilterDns": (".ips_urlfilter_dns", "IpsUrlfilterDns"),
+    "IpsUrlfilterDns6": (".ips_urlfilter_dns6", "IpsUrlfilterDns6"),
+    "IpsecAggregate": (".ipsec_aggregate", "IpsecAggregate"),
+    "Ipv6NeighborCache": (".ipv6_neighbor_cache", "Ipv6NeighborCache"),
+    "Ipv6Tunnel": (".ipv6_tunnel", "Ipv6Tunnel"),
+    "LinkMonitor": (".link_monitor", "LinkMonitor"),
+    "LteModem": (".lte_modem", "LteModem"),
+    "MacAddressTable": (".mac_address_table", "MacAddressTable"),
+    "MobileTunnel": (".mobile_tunnel", "MobileTunnel"),
+    "Modem": (".modem", "Modem"),
+    "NdProxy": (".nd_proxy", "NdProxy"),
+    "Netflow": (".netflow", "Netflow"),
+    "NetworkVisibility": (".network_visibility", "NetworkVisibility"),
+    "NgfwSettings": (".ngfw_settings", "NgfwSettings"),
+    "Np6xlite": (".np6xlite", "Np6xlite"),
+    "Npu": (".npu", "Npu"),
+    "Ntp": (".ntp", "Ntp"),
+    "ObjectTagging": (".object_tagging", "ObjectTagging"),
+    "PasswordPolicy": (".password_policy", "PasswordPolicy"),
+    "PasswordPolicyGuestAdmin": (".password_policy_guest_admin", "PasswordPolicyGuestAdmin"),
+    "PcpServer": (".pcp_server", "PcpServer"),
+    "PhysicalSwitch": (".physical_switch", "PhysicalSwitch"),
+    "PppoeInterface": (".pppoe_interface", "PppoeInterface"),
+    "ProbeResponse": (".probe_response", "ProbeResponse"),
+    "ProxyArp": (".proxy_arp", "ProxyArp"),
+    "Ptp": (".ptp", "Ptp"),
+    "ReplacemsgGroup": (".replacemsg_group", "ReplacemsgGroup"),
+    "ReplacemsgImage": (".replacemsg_image", "ReplacemsgImage"),
+    "ResourceLimits": (".resource_limits", "ResourceLimits"),
+    "Saml": (".saml", "Saml"),
+    "SdnConnector": (".sdn_connector", "SdnConnector"),
+    "SdnProxy": (".sdn_proxy", "SdnProxy"),
+    "SdnVpn": (".sdn_vpn", "SdnVpn"),
+    "Sdwan": (".sdwan", "Sdwan"),
+    "SessionHelper": (".session_helper", "SessionHelper"),
+    "SessionTtl": (".session_ttl", "SessionTtl"),
+    "Settings": (".settings", "Settings"),
+    "Sflow": (".sflow", "Sflow"),
+    "SitTunnel": (".sit_tunnel", "SitTunnel"),
+    "SmsServer": (".sms_server", "SmsServer"),
+    "SovSase": (".sov_sase", "SovSase"),
+    "SpeedTestSchedule": (".speed_test_schedule", "SpeedTestSchedule"),
+    "SpeedTestServer": (".speed_test_server", "SpeedTestServer"),
+    "SpeedTestSetting": (".speed_test_setting", "SpeedTestSetting"),
+    "SshConfig": (".ssh_config", "SshConfig"),
+    "SsoAdmin": (".sso_admin", "SsoAdmin"),
+    "SsoForticloudAdmin": (".sso_forticloud_admin", "SsoForticloudAdmin"),
+    "SsoFortigateCloudAdmin": (".sso_fortigate_cloud_admin", "SsoFortigateCloudAdmin"),
+    "StandaloneCluster": (".standalone_cluster", "StandaloneCluster"),
+    "Storage": (".storage", "Storage"),
+    "Stp": (".stp", "Stp"),
+    "SwitchInterface": (".switch_interface", "SwitchInterface"),
+    "Timezone": (".timezone", "Timezone"),
+    "TosBasedPriority": (".tos_based_priority", "TosBasedPriority"),
+    "Vdom": (".vdom", "Vdom"),
+    "VdomDns": (".vdom_dns", "VdomDns"),
+    "VdomException": (".vdom_exception", "VdomException"),
+    "VdomLink": (".vdom_link", "VdomLink"),
+    "VdomNetflow": (".vdom_netflow", "VdomNetflow"),
+    "VdomProperty": (".vdom_property", "VdomProperty"),
+    "VdomRadiusServer": (".vdom_radius_server", "VdomRadiusServer"),
+    "VdomSflow": (".vdom_sflow", "VdomSflow"),
+    "VirtualSwitch": (".virtual_switch", "VirtualSwitch"),
+    "VirtualWirePair": (".virtual_wire_pair", "VirtualWirePair"),
+    "VneInterface": (".vne_interface", "VneInterface"),
+    "Vxlan": (".vxlan", "Vxlan"),
+    "Wccp": (".wccp", "Wccp"),
+    "Zone": (".zone", "Zone"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class System:
     """System endpoints wrapper for CMDB API."""
 
+    autoupdate = LazyEndpoint(".autoupdate", "Autoupdate")
+    dhcp = LazyEndpoint(".dhcp", "Dhcp")
+    dhcp6 = LazyEndpoint(".dhcp6", "Dhcp6")
+    lldp = LazyEndpoint(".lldp", "Lldp")
+    modem3g = LazyEndpoint(".modem3g", "Modem3g")
+    replacemsg = LazyEndpoint(".replacemsg", "Replacemsg")
+    security_rating = LazyEndpoint(".security_rating", "SecurityRating")
+    snmp = LazyEndpoint(".snmp", "Snmp")
+    accprofile = LazyEndpoint(".accprofile", "Accprofile")
+    acme = LazyEndpoint(".acme", "Acme")
+    admin = LazyEndpoint(".admin", "Admin")
+    affinity_interrupt = LazyEndpoint(".affinity_interrupt", "AffinityInterrupt")
+    affinity_packet_redistribution = LazyEndpoint(".affinity_packet_redistribution", "AffinityPacketRedistribution")
+    alarm = LazyEndpoint(".alarm", "Alarm")
+    alias = LazyEndpoint(".alias", "Alias")
+    api_user = LazyEndpoint(".api_user", "ApiUser")
+    arp_table = LazyEndpoint(".arp_table", "ArpTable")
+    auto_install = LazyEndpoint(".auto_install", "AutoInstall")
+    auto_script = LazyEndpoint(".auto_script", "AutoScript")
+    automation_action = LazyEndpoint(".automation_action", "AutomationAction")
+    automation_condition = LazyEndpoint(".automation_condition", "AutomationCondition")
+    automation_destination = LazyEndpoint(".automation_destination", "AutomationDestination")
+    automation_stitch = LazyEndpoint(".automation_stitch", "AutomationStitch")
+    automation_trigger = LazyEndpoint(".automation_trigger", "AutomationTrigger")
+    central_management = LazyEndpoint(".central_management", "CentralManagement")
+    cloud_service = LazyEndpoint(".cloud_service", "CloudService")
+    console = LazyEndpoint(".console", "Console")
+    csf = LazyEndpoint(".csf", "Csf")
+    custom_language = LazyEndpoint(".custom_language", "CustomLanguage")
+    ddns = LazyEndpoint(".ddns", "Ddns")
+    dedicated_mgmt = LazyEndpoint(".dedicated_mgmt", "DedicatedMgmt")
+    device_upgrade = LazyEndpoint(".device_upgrade", "DeviceUpgrade")
+    device_upgrade_exemptions = LazyEndpoint(".device_upgrade_exemptions", "DeviceUpgradeExemptions")
+    dns = LazyEndpoint(".dns", "Dns")
+    dns64 = LazyEndpoint(".dns64", "Dns64")
+    dns_database = LazyEndpoint(".dns_database", "DnsDatabase")
+    dns_server = LazyEndpoint(".dns_server", "DnsServer")
+    dscp_based_priority = LazyEndpoint(".dscp_based_priority", "DscpBasedPriority")
+    email_server = LazyEndpoint(".email_server", "EmailServer")
+    evpn = LazyEndpoint(".evpn", "Evpn")
+    external_resource = LazyEndpoint(".external_resource", "ExternalResource")
+    fabric_vpn = LazyEndpoint(".fabric_vpn", "FabricVpn")
+    federated_upgrade = LazyEndpoint(".federated_upgrade", "FederatedUpgrade")
+    fips_cc = LazyEndpoint(".fips_cc", "FipsCc")
+    fortiguard = LazyEndpoint(".fortiguard", "Fortiguard")
+    fortisandbox = LazyEndpoint(".fortisandbox", "Fortisandbox")
+    fsso_polling = LazyEndpoint(".fsso_polling", "FssoPolling")
+    ftm_push = LazyEndpoint(".ftm_push", "FtmPush")
+    geneve = LazyEndpoint(".geneve", "Geneve")
+    geoip_country = LazyEndpoint(".geoip_country", "GeoipCountry")
+    geoip_override = LazyEndpoint(".geoip_override", "GeoipOverride")
+    global_ = LazyEndpoint(".global_", "Global")
+    gre_tunnel = LazyEndpoint(".gre_tunnel", "GreTunnel")
+    ha = LazyEndpoint(".ha", "Ha")
+    ha_monitor = LazyEndpoint(".ha_monitor", "HaMonitor")
+    health_check_fortiguard = LazyEndpoint(".health_check_fortiguard", "HealthCheckFortiguard")
+    ike = LazyEndpoint(".ike", "Ike")
+    interface = LazyEndpoint(".interface", "Interface")
+    ipam = LazyEndpoint(".ipam", "Ipam")
+    ipip_tunnel = LazyEndpoint(".ipip_tunnel", "IpipTunnel")
+    ips = LazyEndpoint(".ips", "Ips")
+    ips_urlfilter_dns = LazyEndpoint(".ips_urlfilter_dns", "IpsUrlfilterDns")
+    ips_urlfilter_dns6 = LazyEndpoint(".ips_urlfilter_dns6", "IpsUrlfilterDns6")
+    ipsec_aggregate = LazyEndpoint(".ipsec_aggregate", "IpsecAggregate")
+    ipv6_neighbor_cache = LazyEndpoint(".ipv6_neighbor_cache", "Ipv6NeighborCache")
+    ipv6_tunnel = LazyEndpoint(".ipv6_tunnel", "Ipv6Tunnel")
+    link_monitor = LazyEndpoint(".link_monitor", "LinkMonitor")
+    lte_modem = LazyEndpoint(".lte_modem", "LteModem")
+    mac_address_table = LazyEndpoint(".mac_address_table", "MacAddressTable")
+    mobile_tunnel = LazyEndpoint(".mobile_tunnel", "MobileTunnel")
+    modem = LazyEndpoint(".modem", "Modem")
+    nd_proxy = LazyEndpoint(".nd_proxy", "NdProxy")
+    netflow = LazyEndpoint(".netflow", "Netflow")
+    network_visibility = LazyEndpoint(".network_visibility", "NetworkVisibility")
+    ngfw_settings = LazyEndpoint(".ngfw_settings", "NgfwSettings")
+    np6xlite = LazyEndpoint(".np6xlite", "Np6xlite")
+    npu = LazyEndpoint(".npu", "Npu")
+    ntp = LazyEndpoint(".ntp", "Ntp")
+    object_tagging = LazyEndpoint(".object_tagging", "ObjectTagging")
+    password_policy = LazyEndpoint(".password_policy", "PasswordPolicy")
+    password_policy_guest_admin = LazyEndpoint(".password_policy_guest_admin", "PasswordPolicyGuestAdmin")
+    pcp_server = LazyEndpoint(".pcp_server", "PcpServer")
+    physical_switch = LazyEndpoint(".physical_switch", "PhysicalSwitch")
+    pppoe_interface = LazyEndpoint(".pppoe_interface", "PppoeInterface")
+    probe_response = LazyEndpoint(".probe_response", "ProbeResponse")
+    proxy_arp = LazyEndpoint(".proxy_arp", "ProxyArp")
+    ptp = LazyEndpoint(".ptp", "Ptp")
+    replacemsg_group = LazyEndpoint(".replacemsg_group", "ReplacemsgGroup")
+    replacemsg_image = LazyEndpoint(".replacemsg_image", "ReplacemsgImage")
+    resource_limits = LazyEndpoint(".resource_limits", "ResourceLimits")
+    saml = LazyEndpoint(".saml", "Saml")
+    sdn_connector = LazyEndpoint(".sdn_connector", "SdnConnector")
+    sdn_proxy = LazyEndpoint(".sdn_proxy", "SdnProxy")
+    sdn_vpn = LazyEndpoint(".sdn_vpn", "SdnVpn")
+    sdwan = LazyEndpoint(".sdwan", "Sdwan")
+    session_helper = LazyEndpoint(".session_helper", "SessionHelper")
+    session_ttl = LazyEndpoint(".session_ttl", "SessionTtl")
+    settings = LazyEndpoint(".settings", "Settings")
+    sflow = LazyEndpoint(".sflow", "Sflow")
+    sit_tunnel = LazyEndpoint(".sit_tunnel", "SitTunnel")
+    sms_server = LazyEndpoint(".sms_server", "SmsServer")
+    sov_sase = LazyEndpoint(".sov_sase", "SovSase")
+    speed_test_schedule = LazyEndpoint(".speed_test_schedule", "SpeedTestSchedule")
+    speed_test_server = LazyEndpoint(".speed_test_server", "SpeedTestServer")
+    speed_test_setting = LazyEndpoint(".speed_test_setting", "SpeedTestSetting")
+    ssh_config = LazyEndpoint(".ssh_config", "SshConfig")
+    sso_admin = LazyEndpoint(".sso_admin", "SsoAdmin")
+    sso_forticloud_admin = LazyEndpoint(".sso_forticloud_admin", "SsoForticloudAdmin")
+    sso_fortigate_cloud_admin = LazyEndpoint(".sso_fortigate_cloud_admin", "SsoFortigateCloudAdmin")
+    standalone_cluster = LazyEndpoint(".standalone_cluster", "StandaloneCluster")
+    storage = LazyEndpoint(".storage", "Storage")
+    stp = LazyEndpoint(".stp", "Stp")
+    switch_interface = LazyEndpoint(".switch_interface", "SwitchInterface")
+    timezone = LazyEndpoint(".timezone", "Timezone")
+    tos_based_priority = LazyEndpoint(".tos_based_priority", "TosBasedPriority")
+    vdom = LazyEndpoint(".vdom", "Vdom")
+    vdom_dns = LazyEndpoint(".vdom_dns", "VdomDns")
+    vdom_exception = LazyEndpoint(".vdom_exception", "VdomException")
+    vdom_link = LazyEndpoint(".vdom_link", "VdomLink")
+    vdom_netflow = LazyEndpoint(".vdom_netflow", "VdomNetflow")
+    vdom_property = LazyEndpoint(".vdom_property", "VdomProperty")
+    vdom_radius_server = LazyEndpoint(".vdom_radius_server", "VdomRadiusServer")
+    vdom_sflow = LazyEndpoint(".vdom_sflow", "VdomSflow")
+    virtual_switch = LazyEndpoint(".virtual_switch", "VirtualSwitch")
+    virtual_wire_pair = LazyEndpoint(".virtual_wire_pair", "VirtualWirePair")
+    vne_interface = LazyEndpoint(".vne_interface", "VneInterface")
+    vxlan = LazyEndpoint(".vxlan", "Vxlan")
+    wccp = LazyEndpoint(".wccp", "Wccp")
+    zone = LazyEndpoint(".zone", "Zone")
+
     def __init__(self, client):
         """System endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.autoupdate = autoupdate.Autoupdate(client)
-        self.dhcp = dhcp.Dhcp(client)
-        self.dhcp6 = dhcp6.Dhcp6(client)
-        self.lldp = lldp.Lldp(client)
-        self.modem3g = modem3g.Modem3g(client)
-        self.replacemsg = replacemsg.Replacemsg(client)
-        self.security_rating = security_rating.SecurityRating(client)
-        self.snmp = snmp.Snmp(client)
-        self.accprofile = Accprofile(client)
-        self.acme = Acme(client)
-        self.admin = Admin(client)
-        self.affinity_interrupt = AffinityInterrupt(client)
-        self.affinity_packet_redistribution = AffinityPacketRedistribution(client)
-        self.alarm = Alarm(client)
-        self.alias = Alias(client)
-        self.api_user = ApiUser(client)
-        self.arp_table = ArpTable(client)
-        self.auto_install = AutoInstall(client)
-        self.auto_script = AutoScript(client)
-        self.automation_action = AutomationAction(client)
-        self.automation_condition = AutomationCondition(client)
-        self.automation_destination = AutomationDestination(client)
-        self.automation_stitch = AutomationStitch(client)
-        self.automation_trigger = AutomationTrigger(client)
-        self.central_management = CentralManagement(client)
-        self.cloud_service = CloudService(client)
-        self.console = Console(client)
-        self.csf = Csf(client)
-        self.custom_language = CustomLanguage(client)
-        self.ddns = Ddns(client)
-        self.dedicated_mgmt = DedicatedMgmt(client)
-        self.device_upgrade = DeviceUpgrade(client)
-        self.device_upgrade_exemptions = DeviceUpgradeExemptions(client)
-        self.dns = Dns(client)
-        self.dns64 = Dns64(client)
-        self.dns_database = DnsDatabase(client)
-        self.dns_server = DnsServer(client)
-        self.dscp_based_priority = DscpBasedPriority(client)
-        self.email_server = EmailServer(client)
-        self.evpn = Evpn(client)
-        self.external_resource = ExternalResource(client)
-        self.fabric_vpn = FabricVpn(client)
-        self.federated_upgrade = FederatedUpgrade(client)
-        self.fips_cc = FipsCc(client)
-        self.fortiguard = Fortiguard(client)
-        self.fortisandbox = Fortisandbox(client)
-        self.fsso_polling = FssoPolling(client)
-        self.ftm_push = FtmPush(client)
-        self.geneve = Geneve(client)
-        self.geoip_country = GeoipCountry(client)
-        self.geoip_override = GeoipOverride(client)
-        self.global_ = Global(client)
-        self.gre_tunnel = GreTunnel(client)
-        self.ha = Ha(client)
-        self.ha_monitor = HaMonitor(client)
-        self.health_check_fortiguard = HealthCheckFortiguard(client)
-        self.ike = Ike(client)
-        self.interface = Interface(client)
-        self.ipam = Ipam(client)
-        self.ipip_tunnel = IpipTunnel(client)
-        self.ips = Ips(client)
-        self.ips_urlfilter_dns = IpsUrlfilterDns(client)
-        self.ips_urlfilter_dns6 = IpsUrlfilterDns6(client)
-        self.ipsec_aggregate = IpsecAggregate(client)
-        self.ipv6_neighbor_cache = Ipv6NeighborCache(client)
-        self.ipv6_tunnel = Ipv6Tunnel(client)
-        self.link_monitor = LinkMonitor(client)
-        self.lte_modem = LteModem(client)
-        self.mac_address_table = MacAddressTable(client)
-        self.mobile_tunnel = MobileTunnel(client)
-        self.modem = Modem(client)
-        self.nd_proxy = NdProxy(client)
-        self.netflow = Netflow(client)
-        self.network_visibility = NetworkVisibility(client)
-        self.ngfw_settings = NgfwSettings(client)
-        self.np6xlite = Np6xlite(client)
-        self.npu = Npu(client)
-        self.ntp = Ntp(client)
-        self.object_tagging = ObjectTagging(client)
-        self.password_policy = PasswordPolicy(client)
-        self.password_policy_guest_admin = PasswordPolicyGuestAdmin(client)
-        self.pcp_server = PcpServer(client)
-        self.physical_switch = PhysicalSwitch(client)
-        self.pppoe_interface = PppoeInterface(client)
-        self.probe_response = ProbeResponse(client)
-        self.proxy_arp = ProxyArp(client)
-        self.ptp = Ptp(client)
-        self.replacemsg_group = ReplacemsgGroup(client)
-        self.replacemsg_image = ReplacemsgImage(client)
-        self.resource_limits = ResourceLimits(client)
-        self.saml = Saml(client)
-        self.sdn_connector = SdnConnector(client)
-        self.sdn_proxy = SdnProxy(client)
-        self.sdn_vpn = SdnVpn(client)
-        self.sdwan = Sdwan(client)
-        self.session_helper = SessionHelper(client)
-        self.session_ttl = SessionTtl(client)
-        self.settings = Settings(client)
-        self.sflow = Sflow(client)
-        self.sit_tunnel = SitTunnel(client)
-        self.sms_server = SmsServer(client)
-        self.sov_sase = SovSase(client)
-        self.speed_test_schedule = SpeedTestSchedule(client)
-        self.speed_test_server = SpeedTestServer(client)
-        self.speed_test_setting = SpeedTestSetting(client)
-        self.ssh_config = SshConfig(client)
-        self.sso_admin = SsoAdmin(client)
-        self.sso_forticloud_admin = SsoForticloudAdmin(client)
-        self.sso_fortigate_cloud_admin = SsoFortigateCloudAdmin(client)
-        self.standalone_cluster = StandaloneCluster(client)
-        self.storage = Storage(client)
-        self.stp = Stp(client)
-        self.switch_interface = SwitchInterface(client)
-        self.timezone = Timezone(client)
-        self.tos_based_priority = TosBasedPriority(client)
-        self.vdom = Vdom(client)
-        self.vdom_dns = VdomDns(client)
-        self.vdom_exception = VdomException(client)
-        self.vdom_link = VdomLink(client)
-        self.vdom_netflow = VdomNetflow(client)
-        self.vdom_property = VdomProperty(client)
-        self.vdom_radius_server = VdomRadiusServer(client)
-        self.vdom_sflow = VdomSflow(client)
-        self.virtual_switch = VirtualSwitch(client)
-        self.virtual_wire_pair = VirtualWirePair(client)
-        self.vne_interface = VneInterface(client)
-        self.vxlan = Vxlan(client)
-        self.wccp = Wccp(client)
-        self.zone = Zone(client)
+        self._client = client
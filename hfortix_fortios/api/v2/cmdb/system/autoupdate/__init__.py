@@ -1,20 +1,28 @@
 """FortiOS CMDB - Autoupdate category"""
 
-from .schedule import Schedule
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Autoupdate",
     "Schedule",
 ]
 
+_LAZY_IMPORTS = {
+    "Schedule": (".schedule", "Schedule"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Autoupdate:
     """Autoupdate endpoints wrapper for CMDB API."""
 
+    schedule = LazyEndpoint(".schedule", "Schedule")
+
     def __init__(self, client):
         """Autoupdate endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.schedule = Schedule(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Dhcp category"""
 
-from .server import Server
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Dhcp",
     "Server",
 ]
 
+_LAZY_IMPORTS = {
+    "Server": (".server", "Server"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Dhcp:
     """Dhcp endpoints wrapper for CMDB API."""
 
+    server = LazyEndpoint(".server", "Server")
+
     def __init__(self, client):
         """Dhcp endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.server = Server(client)
+        self._client = client
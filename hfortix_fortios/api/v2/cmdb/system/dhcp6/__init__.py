@@ -1,20 +1,28 @@
 """FortiOS CMDB - Dhcp6 category"""
 
-from .server import Server
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Dhcp6",
     "Server",
 ]
 
+_LAZY_IMPORTS = {
+    "Server": (".server", "Server"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Dhcp6:
     """Dhcp6 endpoints wrapper for CMDB API."""
 
+    server = LazyEndpoint(".server", "Server")
+
     def __init__(self, client):
         """Dhcp6 endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.server = Server(client)
+        self._client = client
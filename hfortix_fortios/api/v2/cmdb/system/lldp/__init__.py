@@ -1,20 +1,28 @@
 """FortiOS CMDB - Lldp category"""
 
-from .network_policy import NetworkPolicy
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Lldp",
     "NetworkPolicy",
 ]
 
+_LAZY_IMPORTS = {
+    "NetworkPolicy": (".network_policy", "NetworkPolicy"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Lldp:
     """Lldp endpoints wrapper for CMDB API."""
 
+    network_policy = LazyEndpoint(".network_policy", "NetworkPolicy")
+
     def __init__(self, client):
         """Lldp endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.network_policy = NetworkPolicy(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Modem3g category"""
 
-from .custom import Custom
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Custom",
     "Modem3g",
 ]
 
+_LAZY_IMPORTS = {
+    "Custom": (".custom", "Custom"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Modem3g:
     """Modem3g endpoints wrapper for CMDB API."""
 
+    custom = LazyEndpoint(".custom", "Custom")
+
     def __init__(self, client):
         """Modem3g endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.custom = Custom(client)
+        self._client = client
@@ -1,17 +1,6 @@
 """FortiOS CMDB - Replacemsg category"""
 
-from .admin import Admin
-from .alertmail import Alertmail
-from .auth import Auth
-from .automation import Automation
-from .fortiguard_wf import FortiguardWf
-from .http import Http
-from .mail import Mail
-from .nac_quar import NacQuar
-from .spam import Spam
-from .sslvpn import Sslvpn
-from .traffic_quota import TrafficQuota
-from .utm import Utm
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Admin",
@@ -29,25 +18,44 @@ __all__ = [
     "Utm",
 ]
 
+_LAZY_IMPORTS = {
+    "Admin": (".admin", "Admin"),
+    "Alertmail": (".alertmail", "Alertmail"),
+    "Auth": (".auth", "Auth"),
+    "Automation": (".automation", "Automation"),
+    "FortiguardWf": (".fortiguard_wf", "FortiguardWf"),
+    "Http": (".http", "Http"),
+    "Mail": (".mail", "Mail"),
+    "NacQuar": (".nac_quar", "NacQuar"),
+    "Spam": (".spam", "Spam"),
+    "Sslvpn": (".sslvpn", "Sslvpn"),
+    "TrafficQuota": (".traffic_quota", "TrafficQuota"),
+    "Utm": (".utm", "Utm"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Replacemsg:
     """Replacemsg endpoints wrapper for CMDB API."""
 
+    admin = LazyEndpoint(".admin", "Admin")
+    alertmail = LazyEndpoint(".alertmail", "Alertmail")
+    auth = LazyEndpoint(".auth", "Auth")
+    automation = LazyEndpoint(".automation", "Automation")
+    fortiguard_wf = LazyEndpoint(".fortiguard_wf", "FortiguardWf")
+    http = LazyEndpoint(".http", "Http")
+    mail = LazyEndpoint(".mail", "Mail")
+    nac_quar = LazyEndpoint(".nac_quar", "NacQuar")
+    spam = LazyEndpoint(".spam", "Spam")
+    sslvpn = LazyEndpoint(".sslvpn", "Sslvpn")
+    traffic_quota = LazyEndpoint(".traffic_quota", "TrafficQuota")
+    utm = LazyEndpoint(".utm", "Utm")
+
     def __init__(self, client):
         """Replacemsg endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.admin = Admin(client)
-        self.alertmail = Alertmail(client)
-        self.auth = Auth(client)
-        self.automation = Automation(client)
-        self.fortiguard_wf = FortiguardWf(client)
-        self.http = Http(client)
-        self.mail = Mail(client)
-        self.nac_quar = NacQuar(client)
-        self.spam = Spam(client)
-        self.sslvpn = Sslvpn(client)
-        self.traffic_quota = TrafficQuota(client)
-        self.utm = Utm(client)
+        self._client = client
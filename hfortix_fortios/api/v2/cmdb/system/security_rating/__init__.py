@@ -1,7 +1,6 @@
 """FortiOS CMDB - SecurityRating category"""
 
-from .controls import Controls
-from .settings import Settings
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Controls",
@@ -9,15 +8,24 @@ __all__ = [
     "Settings",
 ]
 
+_LAZY_IMPORTS = {
+    "Controls": (".controls", "Controls"),
+    "Settings": (".settings", "Settings"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class SecurityRating:
     """SecurityRating endpoints wrapper for CMDB API."""
 
+    controls = LazyEndpoint(".controls", "Controls")
+    settings = LazyEndpoint(".settings", "Settings")
+
     def __init__(self, client):
         """SecurityRating endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.controls = Controls(client)
-        self.settings = Settings(client)
+        self._client = client
@@ -1,10 +1,6 @@
 """FortiOS CMDB - Snmp category"""
 
-from .community import Community
-from .mib_view import MibView
-from .rmon_stat import RmonStat
-from .sysinfo import Sysinfo
-from .user import User
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Community",
@@ -15,18 +11,30 @@ __all__ = [
     "User",
 ]
 
+_LAZY_IMPORTS = {
+    "Community": (".community", "Community"),
+    "MibView": (".mib_view", "MibView"),
+    "RmonStat": (".rmon_stat", "RmonStat"),
+    "Sysinfo": (".sysinfo", "Sysinfo"),
+    "User": (".user", "User"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Snmp:
     """Snmp endpoints wrapper for CMDB API."""
 
+    community = LazyEndpoint(".community", "Community")
+    mib_view = LazyEndpoint(".mib_view", "MibView")
+    rmon_stat = LazyEndpoint(".rmon_stat", "RmonStat")
+    sysinfo = LazyEndpoint(".sysinfo", "Sysinfo")
+    user = LazyEndpoint(".user", "User")
+
     def __init__(self, client):
         """Snmp endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.community = Community(client)
-        self.mib_view = MibView(client)
-        self.rmon_stat = RmonStat(client)
-        self.sysinfo = Sysinfo(client)
-        self.user = User(client)
+        self._client = client
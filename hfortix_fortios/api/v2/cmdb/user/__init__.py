@@ -1,30 +1,6 @@
 """FortiOS CMDB - User category"""
 
-from .adgrp import Adgrp
-from .certificate import Certificate
-from .domain_controller import DomainController
-from .exchange import Exchange
-from .external_identity_provider import ExternalIdentityProvider
-from .fortitoken import Fortitoken
-from .fsso import Fsso
-from .fsso_polling import FssoPolling
-from .group import Group
-from .krb_keytab import KrbKeytab
-from .ldap import Ldap
-from .local import Local
-from .nac_policy import NacPolicy
-from .password_policy import PasswordPolicy
-from .peer import Peer
-from .peergrp import Peergrp
-from .pop3 import Pop3
-from .quarantine import Quarantine
-from .radius import Radius
-from .saml import Saml
-from .scim import Scim
-from .security_exempt_list import SecurityExemptList
-from .setting import Setting
-from .tacacs_plus import TacacsPlus
-from .tacacs_plus_ import TacacsPlus
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Adgrp",
@@ -55,38 +31,69 @@ __all__ = [
     "User",
 ]
 
+_LAZY_IMPORTS = {
+    "Adgrp": (".adgrp", "Adgrp"),
+    "Certificate": (".certificate", "Certificate"),
+    "DomainController": (".domain_controller", "DomainController"),
+    "Exchange": (".exchange", "Exchange"),
+    "ExternalIdentityProvider": (".external_identity_provider", "ExternalIdentityProvider"),
+    "Fortitoken": (".fortitoken", "Fortitoken"),
+    "Fsso": (".fsso", "Fsso"),
+    "FssoPolling": (".fsso_polling", "FssoPolling"),
+    "Group": (".group", "Group"),
+    "KrbKeytab": (".krb_keytab", "KrbKeytab"),
+    "Ldap": (".ldap", "Ldap"),
+    "Local": (".local", "Local"),
+    "NacPolicy": (".nac_policy", "NacPolicy"),
+    "PasswordPolicy": (".password_policy", "PasswordPolicy"),
+    "Peer": (".peer", "Peer"),
+    "Peergrp": (".peergrp", "Peergrp"),
+    "Pop3": (".pop3", "Pop3"),
+    "Quarantine": (".quarantine", "Quarantine"),
+    "Radius": (".radius", "Radius"),
+    "Saml": (".saml", "Saml"),
+    "Scim": (".scim", "Scim"),
+    "SecurityExemptList": (".security_exempt_list", "SecurityExemptList"),
+    "Setting": (".setting", "Setting"),
+    "TacacsPlus": (".tacacs_plus_", "TacacsPlus"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class User:
     """User endpoints wrapper for CMDB API."""
 
+    adgrp = LazyEndpoint(".adgrp", "Adgrp")
+    certificate = LazyEndpoint(".certificate", "Certificate")
+    domain_controller = LazyEndpoint(".domain_controller", "DomainController")
+    exchange = LazyEndpoint(".exchange", "Exchange")
+    external_identity_provider = LazyEndpoint(".external_identity_provider", "ExternalIdentityProvider")
+    fortitoken = LazyEndpoint(".fortitoken", "Fortitoken")
+    fsso = LazyEndpoint(".fsso", "Fsso")
+    fsso_polling = LazyEndpoint(".fsso_polling", "FssoPolling")
+    group = LazyEndpoint(".group", "Group")
+    krb_keytab = LazyEndpoint(".krb_keytab", "KrbKeytab")
+    ldap = LazyEndpoint(".ldap", "Ldap")
+    local = LazyEndpoint(".local", "Local")
+    nac_policy = LazyEndpoint(".nac_policy", "NacPolicy")
+    password_policy = LazyEndpoint(".password_policy", "PasswordPolicy")
+    peer = LazyEndpoint(".peer", "Peer")
+    peergrp = LazyEndpoint(".peergrp", "Peergrp")
+    pop3 = LazyEndpoint(".pop3", "Pop3")
+    quarantine = LazyEndpoint(".quarantine", "Quarantine")
+    radius = LazyEndpoint(".radius", "Radius")
+    saml = LazyEndpoint(".saml", "Saml")
+    scim = LazyEndpoint(".scim", "Scim")
+    security_exempt_list = LazyEndpoint(".security_exempt_list", "SecurityExemptList")
+    setting = LazyEndpoint(".setting", "Setting")
+    tacacs_plus = LazyEndpoint(".tacacs_plus_", "TacacsPlus")
+    tacacs_plus_ = LazyEndpoint(".tacacs_plus_", "TacacsPlus")
+
     def __init__(self, client):
         """User endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.adgrp = Adgrp(client)
-        self.certificate = Certificate(client)
-        self.domain_controller = DomainController(client)
-        self.exchange = Exchange(client)
-        self.external_identity_provider = ExternalIdentityProvider(client)
-        self.fortitoken = Fortitoken(client)
-        self.fsso = Fsso(client)
-        self.fsso_polling = FssoPolling(client)
-        self.group = Group(client)
-        self.krb_keytab = KrbKeytab(client)
-        self.ldap = Ldap(client)
-        self.local = Local(client)
-        self.nac_policy = NacPolicy(client)
-        self.password_policy = PasswordPolicy(client)
-        self.peer = Peer(client)
-        self.peergrp = Peergrp(client)
-        self.pop3 = Pop3(client)
-        self.quarantine = Quarantine(client)
-        self.radius = Radius(client)
-        self.saml = Saml(client)
-        self.scim = Scim(client)
-        self.security_exempt_list = SecurityExemptList(client)
-        self.setting = Setting(client)
-        self.tacacs_plus = TacacsPlus(client)
-        self.tacacs_plus_ = TacacsPlus(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Videofilter category"""
 
-from .keyword import Keyword
-from .profile import Profile
-from .youtube_key import YoutubeKey
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Keyword",
@@ -11,16 +9,26 @@ __all__ = [
     "YoutubeKey",
 ]
 
+_LAZY_IMPORTS = {
+    "Keyword": (".keyword", "Keyword"),
+    "Profile": (".profile", "Profile"),
+    "YoutubeKey": (".youtube_key", "YoutubeKey"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Videofilter:
     """Videofilter endpoints wrapper for CMDB API."""
 
+    keyword = LazyEndpoint(".keyword", "Keyword")
+    profile = LazyEndpoint(".profile", "Profile")
+    youtube_key = LazyEndpoint(".youtube_key", "YoutubeKey")
+
     def __init__(self, client):
         """Videofilter endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.keyword = Keyword(client)
-        self.profile = Profile(client)
-        self.youtube_key = YoutubeKey(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - VirtualPatch category"""
 
-from .profile import Profile
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Profile",
     "VirtualPatch",
 ]
 
+_LAZY_IMPORTS = {
+    "Profile": (".profile", "Profile"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class VirtualPatch:
     """VirtualPatch endpoints wrapper for CMDB API."""
 
+    profile = LazyEndpoint(".profile", "Profile")
+
     def __init__(self, client):
         """VirtualPatch endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.profile = Profile(client)
+        self._client = client
@@ -1,11 +1,6 @@
 """FortiOS CMDB - Vpn category"""
 
-from . import certificate
-from . import ipsec
-from .kmip_server import KmipServer
-from .l2tp import L2tp
-from .pptp import Pptp
-from .qkd import Qkd
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Certificate",
@@ -17,19 +12,32 @@ __all__ = [
     "Vpn",
 ]
 
+_LAZY_IMPORTS = {
+    "certificate": (".certificate", None),
+    "ipsec": (".ipsec", None),
+    "KmipServer": (".kmip_server", "KmipServer"),
+    "L2tp": (".l2tp", "L2tp"),
+    "Pptp": (".pptp", "Pptp"),
+    "Qkd": (".qkd", "Qkd"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Vpn:
     """Vpn endpoints wrapper for CMDB API."""
 
+    certificate = LazyEndpoint(".certificate", "Certificate")
+    ipsec = LazyEndpoint(".ipsec", "Ipsec")
+    kmip_server = LazyEndpoint(".kmip_server", "KmipServer")
+    l2tp = LazyEndpoint(".l2tp", "L2tp")
+    pptp = LazyEndpoint(".pptp", "Pptp")
+    qkd = LazyEndpoint(".qkd", "Qkd")
+
     def __init__(self, client):
         """Vpn endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.certificate = certificate.Certificate(client)
-        self.ipsec = ipsec.Ipsec(client)
-        self.kmip_server = KmipServer(client)
-        self.l2tp = L2tp(client)
-        self.pptp = Pptp(client)
-        self.qkd = Qkd(client)
+        self._client = client
@@ -1,12 +1,6 @@
 """FortiOS CMDB - Certificate category"""
 
-from .ca import Ca
-from .crl import Crl
-from .hsm_local import HsmLocal
-from .local import Local
-from .ocsp_server import OcspServer
-from .remote import Remote
-from .setting import Setting
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Ca",
@@ -19,20 +13,34 @@ __all__ = [
     "Setting",
 ]
 
+_LAZY_IMPORTS = {
+    "Ca": (".ca", "Ca"),
+    "Crl": (".crl", "Crl"),
+    "HsmLocal": (".hsm_local", "HsmLocal"),
+    "Local": (".local", "Local"),
+    "OcspServer": (".ocsp_server", "OcspServer"),
+    "Remote": (".remote", "Remote"),
+    "Setting": (".setting", "Setting"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Certificate:
     """Certificate endpoints wrapper for CMDB API."""
 
+    ca = LazyEndpoint(".ca", "Ca")
+    crl = LazyEndpoint(".crl", "Crl")
+    hsm_local = LazyEndpoint(".hsm_local", "HsmLocal")
+    local = LazyEndpoint(".local", "Local")
+    ocsp_server = LazyEndpoint(".ocsp_server", "OcspServer")
+    remote = LazyEndpoint(".remote", "Remote")
+    setting = LazyEndpoint(".setting", "Setting")
+
     def __init__(self, client):
         """Certificate endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.ca = Ca(client)
-        self.crl = Crl(client)
-        self.hsm_local = HsmLocal(client)
-        self.local = Local(client)
-        self.ocsp_server = OcspServer(client)
-        self.remote = Remote(client)
-        self.setting = Setting(client)
+        self._client = client
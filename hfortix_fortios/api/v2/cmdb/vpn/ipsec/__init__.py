@@ -1,13 +1,6 @@
 """FortiOS CMDB - Ipsec category"""
 
-from .concentrator import Concentrator
-from .fec import Fec
-from .manualkey import Manualkey
-from .manualkey_interface import ManualkeyInterface
-from .phase1 import Phase1
-from .phase1_interface import Phase1Interface
-from .phase2 import Phase2
-from .phase2_interface import Phase2Interface
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Concentrator",
@@ -21,21 +14,36 @@ __all__ = [
     "Phase2Interface",
 ]
 
+_LAZY_IMPORTS = {
+    "Concentrator": (".concentrator", "Concentrator"),
+    "Fec": (".fec", "Fec"),
+    "Manualkey": (".manualkey", "Manualkey"),
+    "ManualkeyInterface": (".manualkey_interface", "ManualkeyInterface"),
+    "Phase1": (".phase1", "Phase1"),
+    "Phase1Interface": (".phase1_interface", "Phase1Interface"),
+    "Phase2": (".phase2", "Phase2"),
+    "Phase2Interface": (".phase2_interface", "Phase2Interface"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ipsec:
     """Ipsec endpoints wrapper for CMDB API."""
 
+    concentrator = LazyEndpoint(".concentrator", "Concentrator")
+    fec = LazyEndpoint(".fec", "Fec")
+    manualkey = LazyEndpoint(".manualkey", "Manualkey")
+    manualkey_interface = LazyEndpoint(".manualkey_interface", "ManualkeyInterface")
+    phase1 = LazyEndpoint(".phase1", "Phase1")
+    phase1_interface = LazyEndpoint(".phase1_interface", "Phase1Interface")
+    phase2 = LazyEndpoint(".phase2", "Phase2")
+    phase2_interface = LazyEndpoint(".phase2_interface", "Phase2Interface")
+
     def __init__(self, client):
         """Ipsec endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.concentrator = Concentrator(client)
-        self.fec = Fec(client)
-        self.manualkey = Manualkey(client)
-        self.manualkey_interface = ManualkeyInterface(client)
-        self.phase1 = Phase1(client)
-        self.phase1_interface = Phase1Interface(client)
-        self.phase2 = Phase2(client)
-        self.phase2_interface = Phase2Interface(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Waf category"""
 
-from .main_class import MainClass
-from .profile import Profile
-from .signature import Signature
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "MainClass",
@@ -11,16 +9,26 @@ __all__ = [
     "Waf",
 ]
 
+_LAZY_IMPORTS = {
+    "MainClass": (".main_class", "MainClass"),
+    "Profile": (".profile", "Profile"),
+    "Signature": (".signature", "Signature"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Waf:
     """Waf endpoints wrapper for CMDB API."""
 
+    main_class = LazyEndpoint(".main_class", "MainClass")
+    profile = LazyEndpoint(".profile", "Profile")
+    signature = LazyEndpoint(".signature", "Signature")
+
     def __init__(self, client):
         """Waf endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.main_class = MainClass(client)
-        self.profile = Profile(client)
-        self.signature = Signature(client)
+        self._client = client
@@ -1,15 +1,6 @@
 """FortiOS CMDB - WebProxy category"""
 
-from .debug_url import DebugUrl
-from .explicit import Explicit
-from .fast_fallback import FastFallback
-from .forward_server import ForwardServer
-from .forward_server_group import ForwardServerGroup
-from .global_ import Global
-from .isolator_server import IsolatorServer
-from .profile import Profile
-from .url_match import UrlMatch
-from .wisp import Wisp
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "DebugUrl",
@@ -25,23 +16,40 @@ __all__ = [
     "Wisp",
 ]
 
+_LAZY_IMPORTS = {
+    "DebugUrl": (".debug_url", "DebugUrl"),
+    "Explicit": (".explicit", "Explicit"),
+    "FastFallback": (".fast_fallback", "FastFallback"),
+    "ForwardServer": (".forward_server", "ForwardServer"),
+    "ForwardServerGroup": (".forward_server_group", "ForwardServerGroup"),
+    "Global": (".global_", "Global"),
+    "IsolatorServer": (".isolator_server", "IsolatorServer"),
+    "Profile": (".profile", "Profile"),
+    "UrlMatch": (".url_match", "UrlMatch"),
+    "Wisp": (".wisp", "Wisp"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class WebProxy:
     """WebProxy endpoints wrapper for CMDB API."""
 
+    debug_url = LazyEndpoint(".debug_url", "DebugUrl")
+    explicit = LazyEndpoint(".explicit", "Explicit")
+    fast_fallback = LazyEndpoint(".fast_fallback", "FastFallback")
+    forward_server = LazyEndpoint(".forward_server", "ForwardServer")
+    forward_server_group = LazyEndpoint(".forward_server_group", "ForwardServerGroup")
+    global_ = LazyEndpoint(".global_", "Global")
+    isolator_server = LazyEndpoint(".isolator_server", "IsolatorServer")
+    profile = LazyEndpoint(".profile", "Profile")
+    url_match = LazyEndpoint(".url_match", "UrlMatch")
+    wisp = LazyEndpoint(".wisp", "Wisp")
+
     def __init__(self, client):
         """WebProxy endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.debug_url = DebugUrl(client)
-        self.explicit = Explicit(client)
-        self.fast_fallback = FastFallback(client)
-        self.forward_server = ForwardServer(client)
-        self.forward_server_group = ForwardServerGroup(client)
-        self.global_ = Global(client)
-        self.isolator_server = IsolatorServer(client)
-        self.profile = Profile(client)
-        self.url_match = UrlMatch(client)
-        self.wisp = Wisp(client)
+        self._client = client
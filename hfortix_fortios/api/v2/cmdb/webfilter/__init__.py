@@ -1,19 +1,6 @@
 """FortiOS CMDB - Webfilter category"""
 
-from .content import Content
-from .content_header import ContentHeader
-from .fortiguard import Fortiguard
-from .ftgd_local_cat import FtgdLocalCat
-from .ftgd_local_rating import FtgdLocalRating
-from .ftgd_local_risk import FtgdLocalRisk
-from .ftgd_risk_level import FtgdRiskLevel
-from .ips_urlfilter_cache_setting import IpsUrlfilterCacheSetting
-from .ips_urlfilter_setting import IpsUrlfilterSetting
-from .ips_urlfilter_setting6 import IpsUrlfilterSetting6
-from .override import Override
-from .profile import Profile
-from .search_engine import SearchEngine
-from .urlfilter import Urlfilter
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Content",
@@ -33,27 +20,48 @@ __all__ = [
     "Webfilter",
 ]
 
+_LAZY_IMPORTS = {
+    "Content": (".content", "Content"),
+    "ContentHeader": (".content_header", "ContentHeader"),
+    "Fortiguard": (".fortiguard", "Fortiguard"),
+    "FtgdLocalCat": (".ftgd_local_cat", "FtgdLocalCat"),
+    "FtgdLocalRating": (".ftgd_local_rating", "FtgdLocalRating"),
+    "FtgdLocalRisk": (".ftgd_local_risk", "FtgdLocalRisk"),
+    "FtgdRiskLevel": (".ftgd_risk_level", "FtgdRiskLevel"),
+    "IpsUrlfilterCacheSetting": (".ips_urlfilter_cache_setting", "IpsUrlfilterCacheSetting"),
+    "IpsUrlfilterSetting": (".ips_urlfilter_setting", "IpsUrlfilterSetting"),
+    "IpsUrlfilterSetting6": (".ips_urlfilter_setting6", "IpsUrlfilterSetting6"),
+    "Override": (".override", "Override"),
+    "Profile": (".profile", "Profile"),
+    "SearchEngine": (".search_engine", "SearchEngine"),
+    "Urlfilter": (".urlfilter", "Urlfilter"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Webfilter:
     """Webfilter endpoints wrapper for CMDB API."""
 
+    content = LazyEndpoint(".content", "Content")
+    content_header = LazyEndpoint(".content_header", "ContentHeader")
+    fortiguard = LazyEndpoint(".fortiguard", "Fortiguard")
+    ftgd_local_cat = LazyEndpoint(".ftgd_local_cat", "FtgdLocalCat")
+    ftgd_local_rating = LazyEndpoint(".ftgd_local_rating", "FtgdLocalRating")
+    ftgd_local_risk = LazyEndpoint(".ftgd_local_risk", "FtgdLocalRisk")
+    ftgd_risk_level = LazyEndpoint(".ftgd_risk_level", "FtgdRiskLevel")
+    ips_urlfilter_cache_setting = LazyEndpoint(".ips_urlfilter_cache_setting", "IpsUrlfilterCacheSetting")
+    ips_urlfilter_setting = LazyEndpoint(".ips_urlfilter_setting", "IpsUrlfilterSetting")
+    ips_urlfilter_setting6 = LazyEndpoint(".ips_urlfilter_setting6", "IpsUrlfilterSetting6")
+    override = LazyEndpoint(".override", "Override")
+    profile = LazyEndpoint(".profile", "Profile")
+    search_engine = LazyEndpoint(".search_engine", "SearchEngine")
+    urlfilter = LazyEndpoint(".urlfilter", "Urlfilter")
+
     def __init__(self, client):
         """Webfilter endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.content = Content(client)
-        self.content_header = ContentHeader(client)
-        self.fortiguard = Fortiguard(client)
-        self.ftgd_local_cat = FtgdLocalCat(client)
-        self.ftgd_local_rating = FtgdLocalRating(client)
-        self.ftgd_local_risk = FtgdLocalRisk(client)
-        self.ftgd_risk_level = FtgdRiskLevel(client)
-        self.ips_urlfilter_cache_setting = IpsUrlfilterCacheSetting(client)
-        self.ips_urlfilter_setting = IpsUrlfilterSetting(client)
-        self.ips_urlfilter_setting6 = IpsUrlfilterSetting6(client)
-        self.override = Override(client)
-        self.profile = Profile(client)
-        self.search_engine = SearchEngine(client)
-        self.urlfilter = Urlfilter(client)
+        self._client = client
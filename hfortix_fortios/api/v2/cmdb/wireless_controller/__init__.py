@@ -1,33 +1,6 @@
 """FortiOS CMDB - WirelessController category"""
 
-from . import hotspot20
-from .access_control_list import AccessControlList
-from .ap_status import ApStatus
-from .apcfg_profile import ApcfgProfile
-from .arrp_profile import ArrpProfile
-from .ble_profile import BleProfile
-from .bonjour_profile import BonjourProfile
-from .global_ import Global
-from .inter_controller import InterController
-from .log import Log
-from .lw_profile import LwProfile
-from .mpsk_profile import MpskProfile
-from .nac_profile import NacProfile
-from .qos_profile import QosProfile
-from .region import Region
-from .setting import Setting
-from .snmp import Snmp
-from .ssid_policy import SsidPolicy
-from .syslog_profile import SyslogProfile
-from .timers import Timers
-from .utm_profile import UtmProfile
-from .vap import Vap
-from .vap_group import VapGroup
-from .wag_profile import WagProfile
-from .wids_profile import WidsProfile
-from .wtp import Wtp
-from .wtp_group import WtpGroup
-from .wtp_profile import WtpProfile
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AccessControlList",
@@ -61,41 +34,76 @@ __all__ = [
     "WtpProfile",
 ]
 
+_LAZY_IMPORTS = {
+    "hotspot20": (".hotspot20", None),
+    "AccessControlList": (".access_control_list", "AccessControlList"),
+    "ApStatus": (".ap_status", "ApStatus"),
+    "ApcfgProfile": (".apcfg_profile", "ApcfgProfile"),
+    "ArrpProfile": (".arrp_profile", "ArrpProfile"),
+    "BleProfile": (".ble_profile", "BleProfile"),
+    "BonjourProfile": (".bonjour_profile", "BonjourProfile"),
+    "Global": (".global_", "Global"),
+    "InterController": (".inter_controller", "InterController"),
+    "Log": (".log", "Log"),
+    "LwProfile": (".lw_profile", "LwProfile"),
+    "MpskProfile": (".mpsk_profile", "MpskProfile"),
+    "NacProfile": (".nac_profile", "NacProfile"),
+    "QosProfile": (".qos_profile", "QosProfile"),
+    "Region": (".region", "Region"),
+    "Setting": (".setting", "Setting"),
+    "Snmp": (".snmp", "Snmp"),
+    "SsidPolicy": (".ssid_policy", "SsidPolicy"),
+    "SyslogProfile": (".syslog_profile", "SyslogProfile"),
+    "Timers": (".timers", "Timers"),
+    "UtmProfile": (".utm_profile", "UtmProfile"),
+    "Vap": (".vap", "Vap"),
+    "VapGroup": (".vap_group", "VapGroup"),
+    "WagProfile": (".wag_profile", "WagProfile"),
+    "WidsProfile": (".wids_profile", "WidsProfile"),
+    "Wtp": (".wtp", "Wtp"),
+    "WtpGroup": (".wtp_group", "WtpGroup"),
+    "WtpProfile": (".wtp_profile", "WtpProfile"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class WirelessController:
     """WirelessController endpoints wrapper for CMDB API."""
 
+    hotspot20 = LazyEndpoint(".hotspot20", "Hotspot20")
+    access_control_list = LazyEndpoint(".access_control_list", "AccessControlList")
+    ap_status = LazyEndpoint(".ap_status", "ApStatus")
+    apcfg_profile = LazyEndpoint(".apcfg_profile", "ApcfgProfile")
+    arrp_profile = LazyEndpoint(".arrp_profile", "ArrpProfile")
+    ble_profile = LazyEndpoint(".ble_profile", "BleProfile")
+    bonjour_profile = LazyEndpoint(".bonjour_profile", "BonjourProfile")
+    global_ = LazyEndpoint(".global_", "Global")
+    inter_controller = LazyEndpoint(".inter_controller", "InterController")
+    log = LazyEndpoint(".log", "Log")
+    lw_profile = LazyEndpoint(".lw_profile", "LwProfile")
+    mpsk_profile = LazyEndpoint(".mpsk_profile", "MpskProfile")
+    nac_profile = LazyEndpoint(".nac_profile", "NacProfile")
+    qos_profile = LazyEndpoint(".qos_profile", "QosProfile")
+    region = LazyEndpoint(".region", "Region")
+    setting = LazyEndpoint(".setting", "Setting")
+    snmp = LazyEndpoint(".snmp", "Snmp")
+    ssid_policy = LazyEndpoint(".ssid_policy", "SsidPolicy")
+    syslog_profile = LazyEndpoint(".syslog_profile", "SyslogProfile")
+    timers = LazyEndpoint(".timers", "Timers")
+    utm_profile = LazyEndpoint(".utm_profile", "UtmProfile")
+    vap = LazyEndpoint(".vap", "Vap")
+    vap_group = LazyEndpoint(".vap_group", "VapGroup")
+    wag_profile = LazyEndpoint(".wag_profile", "WagProfile")
+    wids_profile = LazyEndpoint(".wids_profile", "WidsProfile")
+    wtp = LazyEndpoint(".wtp", "Wtp")
+    wtp_group = LazyEndpoint(".wtp_group", "WtpGroup")
+    wtp_profile = LazyEndpoint(".wtp_profile", "WtpProfile")
+
     def __init__(self, client):
         """WirelessController endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.hotspot20 = hotspot20.Hotspot20(client)
-        self.access_control_list = AccessControlList(client)
-        self.ap_status = ApStatus(client)
-        self.apcfg_profile = ApcfgProfile(client)
-        self.arrp_profile = ArrpProfile(client)
-        self.ble_profile = BleProfile(client)
-        self.bonjour_profile = BonjourProfile(client)
-        self.global_ = Global(client)
-        self.inter_controller = InterController(client)
-        self.log = Log(client)
-        self.lw_profile = LwProfile(client)
-        self.mpsk_profile = MpskProfile(client)
-        self.nac_profile = NacProfile(client)
-        self.qos_profile = QosProfile(client)
-        self.region = Region(client)
-        self.setting = Setting(client)
-        self.snmp = Snmp(client)
-        self.ssid_policy = SsidPolicy(client)
-        self.syslog_profile = SyslogProfile(client)
-        self.timers = Timers(client)
-        self.utm_profile = UtmProfile(client)
-        self.vap = Vap(client)
-        self.vap_group = VapGroup(client)
-        self.wag_profile = WagProfile(client)
-        self.wids_profile = WidsProfile(client)
-        self.wtp = Wtp(client)
-        self.wtp_group = WtpGroup(client)
-        self.wtp_profile = WtpProfile(client)
+        self._client = client
@@ -1,10 +1,6 @@
 """FortiOS CMDB - Ztna category"""
 
-from .reverse_connector import ReverseConnector
-from .traffic_forward_proxy import TrafficForwardProxy
-from .web_portal import WebPortal
-from .web_portal_bookmark import WebPortalBookmark
-from .web_proxy import WebProxy
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ReverseConnector",
@@ -15,18 +11,30 @@ __all__ = [
     "Ztna",
 ]
 
+_LAZY_IMPORTS = {
+    "ReverseConnector": (".reverse_connector", "ReverseConnector"),
+    "TrafficForwardProxy": (".traffic_forward_proxy", "TrafficForwardProxy"),
+    "WebPortal": (".web_portal", "WebPortal"),
+    "WebPortalBookmark": (".web_portal_bookmark", "WebPortalBookmark"),
+    "WebProxy": (".web_proxy", "WebProxy"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ztna:
     """Ztna endpoints wrapper for CMDB API."""
 
+    reverse_connector = LazyEndpoint(".reverse_connector", "ReverseConnector")
+    traffic_forward_proxy = LazyEndpoint(".traffic_forward_proxy", "TrafficForwardProxy")
+    web_portal = LazyEndpoint(".web_portal", "WebPortal")
+    web_portal_bookmark = LazyEndpoint(".web_portal_bookmark", "WebPortalBookmark")
+    web_proxy = LazyEndpoint(".web_proxy", "WebProxy")
+
     def __init__(self, client):
         """Ztna endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.reverse_connector = ReverseConnector(client)
-        self.traffic_forward_proxy = TrafficForwardProxy(client)
-        self.web_portal = WebPortal(client)
-        self.web_portal_bookmark = WebPortalBookmark(client)
-        self.web_proxy = WebProxy(client)
+        self._client = client
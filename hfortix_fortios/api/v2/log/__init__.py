@@ -2,15 +2,21 @@
 
 from typing import TYPE_CHECKING
 
-from .disk import Disk
-from .fortianalyzer import Fortianalyzer
-from .forticloud import Forticloud
-from .memory import Memory
-from .search import Search
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 if TYPE_CHECKING:
     from hfortix_core.http.interface import IHTTPClient
 
+_LAZY_IMPORTS = {
+    "Disk": (".disk", "Disk"),
+    "Fortianalyzer": (".fortianalyzer", "Fortianalyzer"),
+    "Forticloud": (".forticloud", "Forticloud"),
+    "Memory": (".memory", "Memory"),
+    "Search": (".search", "Search"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Log:
     """Container for LOG endpoints.
@@ -23,10 +29,12 @@ class Log:
     - search: Log search operations
     """
 
+    disk = LazyEndpoint(".disk", "Disk")
+    fortianalyzer = LazyEndpoint(".fortianalyzer", "Fortianalyzer")
+    forticloud = LazyEndpoint(".forticloud", "Forticloud")
+    memory = LazyEndpoint(".memory", "Memory")
+    search = LazyEndpoint(".search", "Search")
+
     def __init__(self, client: "IHTTPClient"):
         """Initialize LOG category."""
-        self.disk = Disk(client)
-        self.fortianalyzer = Fortianalyzer(client)
-        self.forticloud = Forticloud(client)
-        self.memory = Memory(client)
-        self.search = Search(client)
+        self._client = client
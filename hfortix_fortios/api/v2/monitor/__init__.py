@@ -1,38 +1,6 @@
 """FortiOS CMDB - Monitor category"""
 
-from . import azure
-from . import casb
-from . import endpoint_control
-from . import extender_controller
-from . import extension_controller
-from . import firewall
-from . import firmware
-from . import fortiguard
-from . import fortiview
-from . import geoip
-from . import ips
-from . import license
-from . import log
-from . import monitor
-from . import network
-from . import registration
-from . import router
-from . import sdwan
-from . import service
-from . import switch_controller
-from . import system
-from . import user
-from . import utm
-from . import videofilter
-from . import virtual_wan
-from . import vpn
-from . import vpn_certificate
-from . import wanopt
-from . import web_ui
-from . import webcache
-from . import webfilter
-from . import webproxy
-from . import wifi
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Azure",
@@ -71,46 +39,86 @@ __all__ = [
     "Wifi",
 ]
 
+_LAZY_IMPORTS = {
+    "azure": (".azure", None),
+    "casb": (".casb", None),
+    "endpoint_control": (".endpoint_control", None),
+    "extender_controller": (".extender_controller", None),
+    "extension_controller": (".extension_controller", None),
+    "firewall": (".firewall", None),
+    "firmware": (".firmware", None),
+    "fortiguard": (".fortiguard", None),
+    "fortiview": (".fortiview", None),
+    "geoip": (".geoip", None),
+    "ips": (".ips", None),
+    "license": (".license", None),
+    "log": (".log", None),
+    "monitor": (".monitor", None),
+    "network": (".network", None),
+    "registration": (".registration", None),
+    "router": (".router", None),
+    "sdwan": (".sdwan", None),
+    "service": (".service", None),
+    "switch_controller": (".switch_controller", None),
+    "system": (".system", None),
+    "user": (".user", None),
+    "utm": (".utm", None),
+    "videofilter": (".videofilter", None),
+    "virtual_wan": (".virtual_wan", None),
+    "vpn": (".vpn", None),
+    "vpn_certificate": (".vpn_certificate", None),
+    "wanopt": (".wanopt", None),
+    "web_ui": (".web_ui", None),
+    "webcache": (".webcache", None),
+    "webfilter": (".webfilter", None),
+    "webproxy": (".webproxy", None),
+    "wifi": (".wifi", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Monitor:
     """Monitor endpoints wrapper for CMDB API."""
 
+    azure = LazyEndpoint(".azure", "Azure")
+    casb = LazyEndpoint(".casb", "Casb")
+    endpoint_control = LazyEndpoint(".endpoint_control", "EndpointControl")
+    extender_controller = LazyEndpoint(".extender_controller", "ExtenderController")
+    extension_controller = LazyEndpoint(".extension_controller", "ExtensionController")
+    firewall = LazyEndpoint(".firewall", "Firewall")
+    firmware = LazyEndpoint(".firmware", "Firmware")
+    fortiguard = LazyEndpoint(".fortiguard", "Fortiguard")
+    fortiview = LazyEndpoint(".fortiview", "Fortiview")
+    geoip = LazyEndpoint(".geoip", "Geoip")
+    ips = LazyEndpoint(".ips", "Ips")
+    license = LazyEndpoint(".license", "License")
+    log = LazyEndpoint(".log", "Log")
+    monitor = LazyEndpoint(".monitor", "Monitor")
+    network = LazyEndpoint(".network", "Network")
+    registration = LazyEndpoint(".registration", "Registration")
+    router = LazyEndpoint(".router", "Router")
+    sdwan = LazyEndpoint(".sdwan", "Sdwan")
+    service = LazyEndpoint(".service", "Service")
+    switch_controller = LazyEndpoint(".switch_controller", "SwitchController")
+    system = LazyEndpoint(".system", "System")
+    user = LazyEndpoint(".user", "User")
+    utm = LazyEndpoint(".utm", "Utm")
+    videofilter = LazyEndpoint(".videofilter", "Videofilter")
+    virtual_wan = LazyEndpoint(".virtual_wan", "VirtualWan")
+    vpn = LazyEndpoint(".vpn", "Vpn")
+    vpn_certificate = LazyEndpoint(".vpn_certificate", "VpnCertificate")
+    wanopt = LazyEndpoint(".wanopt", "Wanopt")
+    web_ui = LazyEndpoint(".web_ui", "WebUi")
+    webcache = LazyEndpoint(".webcache", "Webcache")
+    webfilter = LazyEndpoint(".webfilter", "Webfilter")
+    webproxy = LazyEndpoint(".webproxy", "Webproxy")
+    wifi = LazyEndpoint(".wifi", "Wifi")
+
     def __init__(self, client):
         """Monitor endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.azure = azure.Azure(client)
-        self.casb = casb.Casb(client)
-        self.endpoint_control = endpoint_control.EndpointControl(client)
-        self.extender_controller = extender_controller.ExtenderController(client)
-        self.extension_controller = extension_controller.ExtensionController(client)
-        self.firewall = firewall.Firewall(client)
-        self.firmware = firmware.Firmware(client)
-        self.fortiguard = fortiguard.Fortiguard(client)
-        self.fortiview = fortiview.Fortiview(client)
-        self.geoip = geoip.Geoip(client)
-        self.ips = ips.Ips(client)
-        self.license = license.License(client)
-        self.log = log.Log(client)
-        self.monitor = monitor.Monitor(client)
-        self.network = network.Network(client)
-        self.registration = registration.Registration(client)
-        self.router = router.Router(client)
-        self.sdwan = sdwan.Sdwan(client)
-        self.service = service.Service(client)
-        self.switch_controller = switch_controller.SwitchController(client)
-        self.system = system.System(client)
-        self.user = user.User(client)
-        self.utm = utm.Utm(client)
-        self.videofilter = videofilter.Videofilter(client)
-        self.virtual_wan = virtual_wan.VirtualWan(client)
-        self.vpn = vpn.Vpn(client)
-        self.vpn_certificate = vpn_certificate.VpnCertificate(client)
-        self.wanopt = wanopt.Wanopt(client)
-        self.web_ui = web_ui.WebUi(client)
-        self.webcache = webcache.Webcache(client)
-        self.webfilter = webfilter.Webfilter(client)
-        self.webproxy = webproxy.Webproxy(client)
-        self.wifi = wifi.Wifi(client)
+        self._client = client
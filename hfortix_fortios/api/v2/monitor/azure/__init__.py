@@ -1,20 +1,28 @@
 """FortiOS CMDB - Azure category"""
 
-from . import application_list
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ApplicationList",
     "Azure",
 ]
 
+_LAZY_IMPORTS = {
+    "application_list": (".application_list", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Azure:
     """Azure endpoints wrapper for CMDB API."""
 
+    application_list = LazyEndpoint(".application_list", "ApplicationList")
+
     def __init__(self, client):
         """Azure endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.application_list = application_list.ApplicationList(client)
+        self._client = client
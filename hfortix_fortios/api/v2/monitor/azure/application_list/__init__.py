@@ -1,17 +1,25 @@
 """FortiOS CMDB - ApplicationList category"""
 
 from ..application_list_base import ApplicationList as ApplicationListBase
-from .refresh import Refresh
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ApplicationList",
     "Refresh",
 ]
 
+_LAZY_IMPORTS = {
+    "Refresh": (".refresh", "Refresh"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ApplicationList(ApplicationListBase):
     """ApplicationList endpoints wrapper for CMDB API."""
 
+    refresh = LazyEndpoint(".refresh", "Refresh")
+
     def __init__(self, client):
         """ApplicationList endpoints.
         
@@ -19,4 +27,4 @@ class ApplicationList(ApplicationListBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.refresh = Refresh(client)
+        self._client = client
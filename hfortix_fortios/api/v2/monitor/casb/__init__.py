@@ -1,20 +1,28 @@
 """FortiOS CMDB - Casb category"""
 
-from . import saas_application
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Casb",
     "SaasApplication",
 ]
 
+_LAZY_IMPORTS = {
+    "saas_application": (".saas_application", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Casb:
     """Casb endpoints wrapper for CMDB API."""
 
+    saas_application = LazyEndpoint(".saas_application", "SaasApplication")
+
     def __init__(self, client):
         """Casb endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.saas_application = saas_application.SaasApplication(client)
+        self._client = client
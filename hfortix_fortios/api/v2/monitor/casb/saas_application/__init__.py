@@ -1,20 +1,28 @@
 """FortiOS CMDB - SaasApplication category"""
 
-from .details import Details
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Details",
     "SaasApplication",
 ]
 
+_LAZY_IMPORTS = {
+    "Details": (".details", "Details"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class SaasApplication:
     """SaasApplication endpoints wrapper for CMDB API."""
 
+    details = LazyEndpoint(".details", "Details")
+
     def __init__(self, client):
         """SaasApplication endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.details = Details(client)
+        self._client = client
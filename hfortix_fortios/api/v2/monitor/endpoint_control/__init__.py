@@ -1,10 +1,6 @@
 """FortiOS CMDB - EndpointControl category"""
 
-from . import avatar
-from . import ems
-from . import installer
-from .record_list import RecordList
-from .summary import Summary
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Avatar",
@@ -15,18 +11,30 @@ __all__ = [
     "Summary",
 ]
 
+_LAZY_IMPORTS = {
+    "avatar": (".avatar", None),
+    "ems": (".ems", None),
+    "installer": (".installer", None),
+    "RecordList": (".record_list", "RecordList"),
+    "Summary": (".summary", "Summary"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class EndpointControl:
     """EndpointControl endpoints wrapper for CMDB API."""
 
+    avatar = LazyEndpoint(".avatar", "Avatar")
+    ems = LazyEndpoint(".ems", "Ems")
+    installer = LazyEndpoint(".installer", "Installer")
+    record_list = LazyEndpoint(".record_list", "RecordList")
+    summary = LazyEndpoint(".summary", "Summary")
+
     def __init__(self, client):
         """EndpointControl endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.avatar = avatar.Avatar(client)
-        self.ems = ems.Ems(client)
-        self.installer = installer.Installer(client)
-        self.record_list = RecordList(client)
-        self.summary = Summary(client)
+        self._client = client
@@ -1,11 +1,6 @@
 """FortiOS CMDB - Ems category"""
 
-from .cert_status import CertStatus
-from .malware_hash import MalwareHash
-from .status import Status
-from .status_summary import StatusSummary
-from .unverify_cert import UnverifyCert
-from .verify_cert import VerifyCert
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "CertStatus",
@@ -17,19 +12,32 @@ __all__ = [
     "VerifyCert",
 ]
 
+_LAZY_IMPORTS = {
+    "CertStatus": (".cert_status", "CertStatus"),
+    "MalwareHash": (".malware_hash", "MalwareHash"),
+    "Status": (".status", "Status"),
+    "StatusSummary": (".status_summary", "StatusSummary"),
+    "UnverifyCert": (".unverify_cert", "UnverifyCert"),
+    "VerifyCert": (".verify_cert", "VerifyCert"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ems:
     """Ems endpoints wrapper for CMDB API."""
 
+    cert_status = LazyEndpoint(".cert_status", "CertStatus")
+    malware_hash = LazyEndpoint(".malware_hash", "MalwareHash")
+    status = LazyEndpoint(".status", "Status")
+    status_summary = LazyEndpoint(".status_summary", "StatusSummary")
+    unverify_cert = LazyEndpoint(".unverify_cert", "UnverifyCert")
+    verify_cert = LazyEndpoint(".verify_cert", "VerifyCert")
+
     def __init__(self, client):
         """Ems endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.cert_status = CertStatus(client)
-        self.malware_hash = MalwareHash(client)
-        self.status = Status(client)
-        self.status_summary = StatusSummary(client)
-        self.unverify_cert = UnverifyCert(client)
-        self.verify_cert = VerifyCert(client)
+        self._client = client
@@ -45,6 +45,7 @@ if TYPE_CHECKING:
 from hfortix_fortios._helpers import (
     build_api_payload,
     build_cmdb_payload,  # Keep for backward compatibility / manual usage
+    validate_payload,  # Client-side payload validation
     is_success,
     quote_path_param,  # URL encoding for path parameters
 )
@@ -154,6 +155,8 @@ class UnverifyCert(CRUDEndpoint, MetadataMixin):
             )
 
         endpoint = "/endpoint-control/ems/unverify-cert"
+        # Client-side validation (FortiOS(validate=...)); no-op when off
+        validate_payload(self, payload_data, "POST")
         return self._client.post(  # type: ignore[return-value]
             "monitor", endpoint, data=payload_data, vdom=vdom        )
 
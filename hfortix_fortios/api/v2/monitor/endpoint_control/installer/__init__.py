@@ -1,17 +1,25 @@
 """FortiOS CMDB - Installer category"""
 
 from ..installer_base import Installer as InstallerBase
-from .download import Download
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Download",
     "Installer",
 ]
 
+_LAZY_IMPORTS = {
+    "Download": (".download", "Download"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Installer(InstallerBase):
     """Installer endpoints wrapper for CMDB API."""
 
+    download = LazyEndpoint(".download", "Download")
+
     def __init__(self, client):
         """Installer endpoints.
         
@@ -19,4 +27,4 @@ class Installer(InstallerBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.download = Download(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - ExtenderController category"""
 
-from . import extender
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Extender",
     "ExtenderController",
 ]
 
+_LAZY_IMPORTS = {
+    "extender": (".extender", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ExtenderController:
     """ExtenderController endpoints wrapper for CMDB API."""
 
+    extender = LazyEndpoint(".extender", "Extender")
+
     def __init__(self, client):
         """ExtenderController endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.extender = extender.Extender(client)
+        self._client = client
@@ -1,10 +1,7 @@
 """FortiOS CMDB - Extender category"""
 
 from ..extender_base import Extender as ExtenderBase
-from .diagnose import Diagnose
-from .modem_firmware import ModemFirmware
-from .reset import Reset
-from .upgrade import Upgrade
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Diagnose",
@@ -14,10 +11,24 @@ __all__ = [
     "Upgrade",
 ]
 
+_LAZY_IMPORTS = {
+    "Diagnose": (".diagnose", "Diagnose"),
+    "ModemFirmware": (".modem_firmware", "ModemFirmware"),
+    "Reset": (".reset", "Reset"),
+    "Upgrade": (".upgrade", "Upgrade"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Extender(ExtenderBase):
     """Extender endpoints wrapper for CMDB API."""
 
+    diagnose = LazyEndpoint(".diagnose", "Diagnose")
+    modem_firmware = LazyEndpoint(".modem_firmware", "ModemFirmware")
+    reset = LazyEndpoint(".reset", "Reset")
+    upgrade = LazyEndpoint(".upgrade", "Upgrade")
+
     def __init__(self, client):
         """Extender endpoints.
         
@@ -25,7 +36,4 @@ class Extender(ExtenderBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.diagnose = Diagnose(client)
-        self.modem_firmware = ModemFirmware(client)
-        self.reset = Reset(client)
-        self.upgrade = Upgrade(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - ExtensionController category"""
 
-from .fortigate import Fortigate
-from .lan_extension_vdom_status import LanExtensionVdomStatus
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ExtensionController",
@@ -9,15 +8,24 @@ __all__ = [
     "LanExtensionVdomStatus",
 ]
 
+_LAZY_IMPORTS = {
+    "Fortigate": (".fortigate", "Fortigate"),
+    "LanExtensionVdomStatus": (".lan_extension_vdom_status", "LanExtensionVdomStatus"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ExtensionController:
     """ExtensionController endpoints wrapper for CMDB API."""
 
+    fortigate = LazyEndpoint(".fortigate", "Fortigate")
+    lan_extension_vdom_status = LazyEndpoint(".lan_extension_vdom_status", "LanExtensionVdomStatus")
+
     def __init__(self, client):
         """ExtensionController endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.fortigate = Fortigate(client)
-        self.lan_extension_vdom_status = LanExtensionVdomStatus(client)
+        self._client = client
@@ -1,48 +1,6 @@
 """FortiOS CMDB - Firewall category"""
 
-from . import acl
-from . import acl6
-from . import central_snat_map
-from . import clearpass_address
-from . import dnat
-from . import gtp
-from . import ippool
-from . import multicast_policy
-from . import multicast_policy6
-from . import per_ip_shaper
-from . import policy
-from . import proxy
-from . import proxy_policy
-from . import security_policy
-from . import session
-from . import session6
-from . import shaper
-from . import ztna_firewall_policy
-from .address6_dynamic import Address6Dynamic
-from .address_dynamic import AddressDynamic
-from .address_fqdns import AddressFqdns
-from .address_fqdns6 import AddressFqdns6
-from .check_addrgrp_exclude_mac_member import CheckAddrgrpExcludeMacMember
-from .gtp_runtime_statistics import GtpRuntimeStatistics
-from .gtp_statistics import GtpStatistics
-from .health import Health
-from .internet_service_basic import InternetServiceBasic
-from .internet_service_details import InternetServiceDetails
-from .internet_service_fqdn import InternetServiceFqdn
-from .internet_service_fqdn_icon_ids import InternetServiceFqdnIconIds
-from .internet_service_match import InternetServiceMatch
-from .internet_service_reputation import InternetServiceReputation
-from .load_balance import LoadBalance
-from .local_in import LocalIn
-from .local_in6 import LocalIn6
-from .network_service_dynamic import NetworkServiceDynamic
-from .policy_lookup import PolicyLookup
-from .saas_application import SaasApplication
-from .sdn_connector_filters import SdnConnectorFilters
-from .sessions import Sessions
-from .uuid_list import UuidList
-from .uuid_type_lookup import UuidTypeLookup
-from .vip_overlap import VipOverlap
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Acl",
@@ -91,56 +49,106 @@ __all__ = [
     "ZtnaFirewallPolicy",
 ]
 
+_LAZY_IMPORTS = {
+    "acl": (".acl", None),
+    "acl6": (".acl6", None),
+    "central_snat_map": (".central_snat_map", None),
+    "clearpass_address": (".clearpass_address", None),
+    "dnat": (".dnat", None),
+    "gtp": (".gtp", None),
+    "ippool": (".ippool", None),
+    "multicast_policy": (".multicast_policy", None),
+    "multicast_policy6": (".multicast_policy6", None),
+    "per_ip_shaper": (".per_ip_shaper", None),
+    "policy": (".policy", None),
+    "proxy": (".proxy", None),
+    "proxy_policy": (".proxy_policy", None),
+    "security_policy": (".security_policy", None),
+    "session": (".session", None),
+    "session6": (".session6", None),
+    "shaper": (".shaper", None),
+    "ztna_firewall_policy": (".ztna_firewall_policy", None),
+    "Address6Dynamic": (".address6_dynamic", "Address6Dynamic"),
+    "AddressDynamic": (".address_dynamic", "AddressDynamic"),
+    "AddressFqdns": (".address_fqdns", "AddressFqdns"),
+    "AddressFqdns6": (".address_fqdns6", "AddressFqdns6"),
+    "CheckAddrgrpExcludeMacMember": (".check_addrgrp_exclude_mac_member", "CheckAddrgrpExcludeMacMember"),
+    "GtpRuntimeStatistics": (".gtp_runtime_statistics", "GtpRuntimeStatistics"),
+    "GtpStatistics": (".gtp_statistics", "GtpStatistics"),
+    "Health": (".health", "Health"),
+    "InternetServiceBasic": (".internet_service_basic", "InternetServiceBasic"),
+    "InternetServiceDetails": (".internet_service_details", "InternetServiceDetails"),
+    "InternetServiceFqdn": (".internet_service_fqdn", "InternetServiceFqdn"),
+    "InternetServiceFqdnIconIds": (".internet_service_fqdn_icon_ids", "InternetServiceFqdnIconIds"),
+    "InternetServiceMatch": (".internet_service_match", "InternetServiceMatch"),
+    "InternetServiceReputation": (".internet_service_reputation", "InternetServiceReputation"),
+    "LoadBalance": (".load_balance", "LoadBalance"),
+    "LocalIn": (".local_in", "LocalIn"),
+    "LocalIn6": (".local_in6", "LocalIn6"),
+    "NetworkServiceDynamic": (".network_service_dynamic", "NetworkServiceDynamic"),
+    "PolicyLookup": (".policy_lookup", "PolicyLookup"),
+    "SaasApplication": (".saas_application", "SaasApplication"),
+    "SdnConnectorFilters": (".sdn_connector_filters", "SdnConnectorFilters"),
+    "Sessions": (".sessions", "Sessions"),
+    "UuidList": (".uuid_list", "UuidList"),
+    "UuidTypeLookup": (".uuid_type_lookup", "UuidTypeLookup"),
+    "VipOverlap": (".vip_overlap", "VipOverlap"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Firewall:
     """Firewall endpoints wrapper for CMDB API."""
 
+    acl = LazyEndpoint(".acl", "Acl")
+    acl6 = LazyEndpoint(".acl6", "Acl6")
+    central_snat_map = LazyEndpoint(".central_snat_map", "CentralSnatMap")
+    clearpass_address = LazyEndpoint(".clearpass_address", "ClearpassAddress")
+    dnat = LazyEndpoint(".dnat", "Dnat")
+    gtp = LazyEndpoint(".gtp", "Gtp")
+    ippool = LazyEndpoint(".ippool", "Ippool")
+    multicast_policy = LazyEndpoint(".multicast_policy", "MulticastPolicy")
+    multicast_policy6 = LazyEndpoint(".multicast_policy6", "MulticastPolicy6")
+    per_ip_shaper = LazyEndpoint(".per_ip_shaper", "PerIpShaper")
+    policy = LazyEndpoint(".policy", "Policy")
+    proxy = LazyEndpoint(".proxy", "Proxy")
+    proxy_policy = LazyEndpoint(".proxy_policy", "ProxyPolicy")
+    security_policy = LazyEndpoint(".security_policy", "SecurityPolicy")
+    session = LazyEndpoint(".session", "Session")
+    session6 = LazyEndpoint(".session6", "Session6")
+    shaper = LazyEndpoint(".shaper", "Shaper")
+    ztna_firewall_policy = LazyEndpoint(".ztna_firewall_policy", "ZtnaFirewallPolicy")
+    address6_dynamic = LazyEndpoint(".address6_dynamic", "Address6Dynamic")
+    address_dynamic = LazyEndpoint(".address_dynamic", "AddressDynamic")
+    address_fqdns = LazyEndpoint(".address_fqdns", "AddressFqdns")
+    address_fqdns6 = LazyEndpoint(".address_fqdns6", "AddressFqdns6")
+    check_addrgrp_exclude_mac_member = LazyEndpoint(".check_addrgrp_exclude_mac_member", "CheckAddrgrpExcludeMacMember")
+    gtp_runtime_statistics = LazyEndpoint(".gtp_runtime_statistics", "GtpRuntimeStatistics")
+    gtp_statistics = LazyEndpoint(".gtp_statistics", "GtpStatistics")
+    health = LazyEndpoint(".health", "Health")
+    internet_service_basic = LazyEndpoint(".internet_service_basic", "InternetServiceBasic")
+    internet_service_details = LazyEndpoint(".internet_service_details", "InternetServiceDetails")
+    internet_service_fqdn = LazyEndpoint(".internet_service_fqdn", "InternetServiceFqdn")
+    internet_service_fqdn_icon_ids = LazyEndpoint(".internet_service_fqdn_icon_ids", "InternetServiceFqdnIconIds")
+    internet_service_match = LazyEndpoint(".internet_service_match", "InternetServiceMatch")
+    internet_service_reputation = LazyEndpoint(".internet_service_reputation", "InternetServiceReputation")
+    load_balance = LazyEndpoint(".load_balance", "LoadBalance")
+    local_in = LazyEndpoint(".local_in", "LocalIn")
+    local_in6 = LazyEndpoint(".local_in6", "LocalIn6")
+    network_service_dynamic = LazyEndpoint(".network_service_dynamic", "NetworkServiceDynamic")
+    policy_lookup = LazyEndpoint(".policy_lookup", "PolicyLookup")
+    saas_application = LazyEndpoint(".saas_application", "SaasApplication")
+    sdn_connector_filters = LazyEndpoint(".sdn_connector_filters", "SdnConnectorFilters")
+    sessions = LazyEndpoint(".sessions", "Sessions")
+    uuid_list = LazyEndpoint(".uuid_list", "UuidList")
+    uuid_type_lookup = LazyEndpoint(".uuid_type_lookup", "UuidTypeLookup")
+    vip_overlap = LazyEndpoint(".vip_overlap", "VipOverlap")
+
     def __init__(self, client):
         """Firewall endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.acl = acl.Acl(client)
-        self.acl6 = acl6.Acl6(client)
-        self.central_snat_map = central_snat_map.CentralSnatMap(client)
-        self.clearpass_address = clearpass_address.ClearpassAddress(client)
-        self.dnat = dnat.Dnat(client)
-        self.gtp = gtp.Gtp(client)
-        self.ippool = ippool.Ippool(client)
-        self.multicast_policy = multicast_policy.MulticastPolicy(client)
-        self.multicast_policy6 = multicast_policy6.MulticastPolicy6(client)
-        self.per_ip_shaper = per_ip_shaper.PerIpShaper(client)
-        self.policy = policy.Policy(client)
-        self.proxy = proxy.Proxy(client)
-        self.proxy_policy = proxy_policy.ProxyPolicy(client)
-        self.security_policy = security_policy.SecurityPolicy(client)
-        self.session = session.Session(client)
-        self.session6 = session6.Session6(client)
-        self.shaper = shaper.Shaper(client)
-        self.ztna_firewall_policy = ztna_firewall_policy.ZtnaFirewallPolicy(client)
-        self.address6_dynamic = Address6Dynamic(client)
-        self.address_dynamic = AddressDynamic(client)
-        self.address_fqdns = AddressFqdns(client)
-        self.address_fqdns6 = AddressFqdns6(client)
-        self.check_addrgrp_exclude_mac_member = CheckAddrgrpExcludeMacMember(client)
-        self.gtp_runtime_statistics = GtpRuntimeStatistics(client)
-        self.gtp_statistics = GtpStatistics(client)
-        self.health = Health(client)
-        self.internet_service_basic = InternetServiceBasic(client)
-        self.internet_service_details = InternetServiceDetails(client)
-        self.internet_service_fqdn = InternetServiceFqdn(client)
-        self.internet_service_fqdn_icon_ids = InternetServiceFqdnIconIds(client)
-        self.internet_service_match = InternetServiceMatch(client)
-        self.internet_service_reputation = InternetServiceReputation(client)
-        self.load_balance = LoadBalance(client)
-        self.local_in = LocalIn(client)
-        self.local_in6 = LocalIn6(client)
-        self.network_service_dynamic = NetworkServiceDynamic(client)
-        self.policy_lookup = PolicyLookup(client)
-        self.saas_application = SaasApplication(client)
-        self.sdn_connector_filters = SdnConnectorFilters(client)
-        self.sessions = Sessions(client)
-        self.uuid_list = UuidList(client)
-        self.uuid_type_lookup = UuidTypeLookup(client)
-        self.vip_overlap = VipOverlap(client)
+        self._client = client
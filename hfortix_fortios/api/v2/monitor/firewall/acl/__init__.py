@@ -1,17 +1,25 @@
 """FortiOS CMDB - Acl category"""
 
 from ..acl_base import Acl as AclBase
-from .clear_counters import ClearCounters
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Acl",
     "ClearCounters",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearCounters": (".clear_counters", "ClearCounters"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Acl(AclBase):
     """Acl endpoints wrapper for CMDB API."""
 
+    clear_counters = LazyEndpoint(".clear_counters", "ClearCounters")
+
     def __init__(self, client):
         """Acl endpoints.
         
@@ -19,4 +27,4 @@ class Acl(AclBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.clear_counters = ClearCounters(client)
+        self._client = client
@@ -1,17 +1,25 @@
 """FortiOS CMDB - Acl6 category"""
 
 from ..acl6_base import Acl6 as Acl6Base
-from .clear_counters import ClearCounters
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Acl6",
     "ClearCounters",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearCounters": (".clear_counters", "ClearCounters"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Acl6(Acl6Base):
     """Acl6 endpoints wrapper for CMDB API."""
 
+    clear_counters = LazyEndpoint(".clear_counters", "ClearCounters")
+
     def __init__(self, client):
         """Acl6 endpoints.
         
@@ -19,4 +27,4 @@ class Acl6(Acl6Base):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.clear_counters = ClearCounters(client)
+        self._client = client
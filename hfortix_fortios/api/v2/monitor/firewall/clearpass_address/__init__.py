@@ -1,7 +1,6 @@
 """FortiOS CMDB - ClearpassAddress category"""
 
-from .add import Add
-from .delete import Delete
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Add",
@@ -9,15 +8,24 @@ __all__ = [
     "Delete",
 ]
 
+_LAZY_IMPORTS = {
+    "Add": (".add", "Add"),
+    "Delete": (".delete", "Delete"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ClearpassAddress:
     """ClearpassAddress endpoints wrapper for CMDB API."""
 
+    add = LazyEndpoint(".add", "Add")
+    delete = LazyEndpoint(".delete", "Delete")
+
     def __init__(self, client):
         """ClearpassAddress endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.add = Add(client)
-        self.delete = Delete(client)
+        self._client = client
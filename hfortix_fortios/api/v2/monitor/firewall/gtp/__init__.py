@@ -1,17 +1,25 @@
 """FortiOS CMDB - Gtp category"""
 
 from ..gtp_base import Gtp as GtpBase
-from .flush import Flush
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Flush",
     "Gtp",
 ]
 
+_LAZY_IMPORTS = {
+    "Flush": (".flush", "Flush"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Gtp(GtpBase):
     """Gtp endpoints wrapper for CMDB API."""
 
+    flush = LazyEndpoint(".flush", "Flush")
+
     def __init__(self, client):
         """Gtp endpoints.
         
@@ -19,4 +27,4 @@ class Gtp(GtpBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.flush = Flush(client)
+        self._client = client
@@ -1,17 +1,25 @@
 """FortiOS CMDB - Ippool category"""
 
 from ..ippool_base import Ippool as IppoolBase
-from .mapping import Mapping
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Ippool",
     "Mapping",
 ]
 
+_LAZY_IMPORTS = {
+    "Mapping": (".mapping", "Mapping"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ippool(IppoolBase):
     """Ippool endpoints wrapper for CMDB API."""
 
+    mapping = LazyEndpoint(".mapping", "Mapping")
+
     def __init__(self, client):
         """Ippool endpoints.
         
@@ -19,4 +27,4 @@ class Ippool(IppoolBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.mapping = Mapping(client)
+        self._client = client
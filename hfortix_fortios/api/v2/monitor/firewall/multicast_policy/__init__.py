@@ -1,8 +1,7 @@
 """FortiOS CMDB - MulticastPolicy category"""
 
 from ..multicast_policy_base import MulticastPolicy as MulticastPolicyBase
-from .clear_counters import ClearCounters
-from .reset import Reset
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ClearCounters",
@@ -10,10 +9,20 @@ __all__ = [
     "Reset",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearCounters": (".clear_counters", "ClearCounters"),
+    "Reset": (".reset", "Reset"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class MulticastPolicy(MulticastPolicyBase):
     """MulticastPolicy endpoints wrapper for CMDB API."""
 
+    clear_counters = LazyEndpoint(".clear_counters", "ClearCounters")
+    reset = LazyEndpoint(".reset", "Reset")
+
     def __init__(self, client):
         """MulticastPolicy endpoints.
         
@@ -21,5 +30,4 @@ class MulticastPolicy(MulticastPolicyBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.clear_counters = ClearCounters(client)
-        self.reset = Reset(client)
+        self._client = client
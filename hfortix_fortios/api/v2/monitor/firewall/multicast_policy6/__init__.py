@@ -1,8 +1,7 @@
 """FortiOS CMDB - MulticastPolicy6 category"""
 
 from ..multicast_policy6_base import MulticastPolicy6 as MulticastPolicy6Base
-from .clear_counters import ClearCounters
-from .reset import Reset
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ClearCounters",
@@ -10,10 +9,20 @@ __all__ = [
     "Reset",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearCounters": (".clear_counters", "ClearCounters"),
+    "Reset": (".reset", "Reset"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class MulticastPolicy6(MulticastPolicy6Base):
     """MulticastPolicy6 endpoints wrapper for CMDB API."""
 
+    clear_counters = LazyEndpoint(".clear_counters", "ClearCounters")
+    reset = LazyEndpoint(".reset", "Reset")
+
     def __init__(self, client):
         """MulticastPolicy6 endpoints.
         
@@ -21,5 +30,4 @@ class MulticastPolicy6(MulticastPolicy6Base):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.clear_counters = ClearCounters(client)
-        self.reset = Reset(client)
+        self._client = client
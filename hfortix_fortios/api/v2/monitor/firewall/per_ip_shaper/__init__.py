@@ -1,17 +1,25 @@
 """FortiOS CMDB - PerIpShaper category"""
 
 from ..per_ip_shaper_base import PerIpShaper as PerIpShaperBase
-from .reset import Reset
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "PerIpShaper",
     "Reset",
 ]
 
+_LAZY_IMPORTS = {
+    "Reset": (".reset", "Reset"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class PerIpShaper(PerIpShaperBase):
     """PerIpShaper endpoints wrapper for CMDB API."""
 
+    reset = LazyEndpoint(".reset", "Reset")
+
     def __init__(self, client):
         """PerIpShaper endpoints.
         
@@ -19,4 +27,4 @@ class PerIpShaper(PerIpShaperBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.reset = Reset(client)
+        self._client = client
@@ -1,9 +1,7 @@
 """FortiOS CMDB - Policy category"""
 
 from ..policy_base import Policy as PolicyBase
-from .clear_counters import ClearCounters
-from .reset import Reset
-from .update_global_label import UpdateGlobalLabel
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ClearCounters",
@@ -12,10 +10,22 @@ __all__ = [
     "UpdateGlobalLabel",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearCounters": (".clear_counters", "ClearCounters"),
+    "Reset": (".reset", "Reset"),
+    "UpdateGlobalLabel": (".update_global_label", "UpdateGlobalLabel"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Policy(PolicyBase):
     """Policy endpoints wrapper for CMDB API."""
 
+    clear_counters = LazyEndpoint(".clear_counters", "ClearCounters")
+    reset = LazyEndpoint(".reset", "Reset")
+    update_global_label = LazyEndpoint(".update_global_label", "UpdateGlobalLabel")
+
     def __init__(self, client):
         """Policy endpoints.
         
@@ -23,6 +33,4 @@ class Policy(PolicyBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.clear_counters = ClearCounters(client)
-        self.reset = Reset(client)
-        self.update_global_label = UpdateGlobalLabel(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Proxy category"""
 
-from .sessions import Sessions
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Proxy",
     "Sessions",
 ]
 
+_LAZY_IMPORTS = {
+    "Sessions": (".sessions", "Sessions"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Proxy:
     """Proxy endpoints wrapper for CMDB API."""
 
+    sessions = LazyEndpoint(".sessions", "Sessions")
+
     def __init__(self, client):
         """Proxy endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.sessions = Sessions(client)
+        self._client = client
@@ -1,17 +1,25 @@
 """FortiOS CMDB - ProxyPolicy category"""
 
 from ..proxy_policy_base import ProxyPolicy as ProxyPolicyBase
-from .clear_counters import ClearCounters
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ClearCounters",
     "ProxyPolicy",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearCounters": (".clear_counters", "ClearCounters"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ProxyPolicy(ProxyPolicyBase):
     """ProxyPolicy endpoints wrapper for CMDB API."""
 
+    clear_counters = LazyEndpoint(".clear_counters", "ClearCounters")
+
     def __init__(self, client):
         """ProxyPolicy endpoints.
         
@@ -19,4 +27,4 @@ class ProxyPolicy(ProxyPolicyBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.clear_counters = ClearCounters(client)
+        self._client = client
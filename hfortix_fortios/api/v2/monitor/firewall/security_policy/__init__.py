@@ -1,8 +1,7 @@
 """FortiOS CMDB - SecurityPolicy category"""
 
 from ..security_policy_base import SecurityPolicy as SecurityPolicyBase
-from .clear_counters import ClearCounters
-from .update_global_label import UpdateGlobalLabel
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ClearCounters",
@@ -10,10 +9,20 @@ __all__ = [
     "UpdateGlobalLabel",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearCounters": (".clear_counters", "ClearCounters"),
+    "UpdateGlobalLabel": (".update_global_label", "UpdateGlobalLabel"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class SecurityPolicy(SecurityPolicyBase):
     """SecurityPolicy endpoints wrapper for CMDB API."""
 
+    clear_counters = LazyEndpoint(".clear_counters", "ClearCounters")
+    update_global_label = LazyEndpoint(".update_global_label", "UpdateGlobalLabel")
+
     def __init__(self, client):
         """SecurityPolicy endpoints.
         
@@ -21,5 +30,4 @@ class SecurityPolicy(SecurityPolicyBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.clear_counters = ClearCounters(client)
-        self.update_global_label = UpdateGlobalLabel(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Session category"""
 
-from .close import Close
-from .close_all import CloseAll
-from .close_multiple import CloseMultiple
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Close",
@@ -11,16 +9,26 @@ __all__ = [
     "Session",
 ]
 
+_LAZY_IMPORTS = {
+    "Close": (".close", "Close"),
+    "CloseAll": (".close_all", "CloseAll"),
+    "CloseMultiple": (".close_multiple", "CloseMultiple"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Session:
     """Session endpoints wrapper for CMDB API."""
 
+    close = LazyEndpoint(".close", "Close")
+    close_all = LazyEndpoint(".close_all", "CloseAll")
+    close_multiple = LazyEndpoint(".close_multiple", "CloseMultiple")
+
     def __init__(self, client):
         """Session endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.close = Close(client)
-        self.close_all = CloseAll(client)
-        self.close_multiple = CloseMultiple(client)
+        self._client = client
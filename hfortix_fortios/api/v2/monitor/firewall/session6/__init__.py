@@ -1,20 +1,28 @@
 """FortiOS CMDB - Session6 category"""
 
-from .close_multiple import CloseMultiple
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "CloseMultiple",
     "Session6",
 ]
 
+_LAZY_IMPORTS = {
+    "CloseMultiple": (".close_multiple", "CloseMultiple"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Session6:
     """Session6 endpoints wrapper for CMDB API."""
 
+    close_multiple = LazyEndpoint(".close_multiple", "CloseMultiple")
+
     def __init__(self, client):
         """Session6 endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.close_multiple = CloseMultiple(client)
+        self._client = client
@@ -1,8 +1,7 @@
 """FortiOS CMDB - Shaper category"""
 
 from ..shaper_base import Shaper as ShaperBase
-from .multi_class_shaper import MultiClassShaper
-from .reset import Reset
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "MultiClassShaper",
@@ -10,10 +9,20 @@ __all__ = [
     "Shaper",
 ]
 
+_LAZY_IMPORTS = {
+    "MultiClassShaper": (".multi_class_shaper", "MultiClassShaper"),
+    "Reset": (".reset", "Reset"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Shaper(ShaperBase):
     """Shaper endpoints wrapper for CMDB API."""
 
+    multi_class_shaper = LazyEndpoint(".multi_class_shaper", "MultiClassShaper")
+    reset = LazyEndpoint(".reset", "Reset")
+
     def __init__(self, client):
         """Shaper endpoints.
         
@@ -21,5 +30,4 @@ class Shaper(ShaperBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.multi_class_shaper = MultiClassShaper(client)
-        self.reset = Reset(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - ZtnaFirewallPolicy category"""
 
-from .clear_counters import ClearCounters
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ClearCounters",
     "ZtnaFirewallPolicy",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearCounters": (".clear_counters", "ClearCounters"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ZtnaFirewallPolicy:
     """ZtnaFirewallPolicy endpoints wrapper for CMDB API."""
 
+    clear_counters = LazyEndpoint(".clear_counters", "ClearCounters")
+
     def __init__(self, client):
         """ZtnaFirewallPolicy endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.clear_counters = ClearCounters(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Firmware category"""
 
-from .extension_device import ExtensionDevice
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ExtensionDevice",
     "Firmware",
 ]
 
+_LAZY_IMPORTS = {
+    "ExtensionDevice": (".extension_device", "ExtensionDevice"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Firmware:
     """Firmware endpoints wrapper for CMDB API."""
 
+    extension_device = LazyEndpoint(".extension_device", "ExtensionDevice")
+
     def __init__(self, client):
         """Firmware endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.extension_device = ExtensionDevice(client)
+        self._client = client
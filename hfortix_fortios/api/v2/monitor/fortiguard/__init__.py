@@ -1,8 +1,6 @@
 """FortiOS CMDB - Fortiguard category"""
 
-from .answers import Answers
-from .redirect_portal import RedirectPortal
-from .service_communication_stats import ServiceCommunicationStats
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Answers",
@@ -11,16 +9,26 @@ __all__ = [
     "ServiceCommunicationStats",
 ]
 
+_LAZY_IMPORTS = {
+    "Answers": (".answers", "Answers"),
+    "RedirectPortal": (".redirect_portal", "RedirectPortal"),
+    "ServiceCommunicationStats": (".service_communication_stats", "ServiceCommunicationStats"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Fortiguard:
     """Fortiguard endpoints wrapper for CMDB API."""
 
+    answers = LazyEndpoint(".answers", "Answers")
+    redirect_portal = LazyEndpoint(".redirect_portal", "RedirectPortal")
+    service_communication_stats = LazyEndpoint(".service_communication_stats", "ServiceCommunicationStats")
+
     def __init__(self, client):
         """Fortiguard endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.answers = Answers(client)
-        self.redirect_portal = RedirectPortal(client)
-        self.service_communication_stats = ServiceCommunicationStats(client)
+        self._client = client
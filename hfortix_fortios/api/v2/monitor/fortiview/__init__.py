@@ -1,9 +1,6 @@
 """FortiOS CMDB - Fortiview category"""
 
-from . import session
-from .historical_statistics import HistoricalStatistics
-from .realtime_proxy_statistics import RealtimeProxyStatistics
-from .realtime_statistics import RealtimeStatistics
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Fortiview",
@@ -13,17 +10,28 @@ __all__ = [
     "Session",
 ]
 
+_LAZY_IMPORTS = {
+    "session": (".session", None),
+    "HistoricalStatistics": (".historical_statistics", "HistoricalStatistics"),
+    "RealtimeProxyStatistics": (".realtime_proxy_statistics", "RealtimeProxyStatistics"),
+    "RealtimeStatistics": (".realtime_statistics", "RealtimeStatistics"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Fortiview:
     """Fortiview endpoints wrapper for CMDB API."""
 
+    session = LazyEndpoint(".session", "Session")
+    historical_statistics = LazyEndpoint(".historical_statistics", "HistoricalStatistics")
+    realtime_proxy_statistics = LazyEndpoint(".realtime_proxy_statistics", "RealtimeProxyStatistics")
+    realtime_statistics = LazyEndpoint(".realtime_statistics", "RealtimeStatistics")
+
     def __init__(self, client):
         """Fortiview endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.session = session.Session(client)
-        self.historical_statistics = HistoricalStatistics(client)
-        self.realtime_proxy_statistics = RealtimeProxyStatistics(client)
-        self.realtime_statistics = RealtimeStatistics(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Session category"""
 
-from .cancel import Cancel
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Cancel",
     "Session",
 ]
 
+_LAZY_IMPORTS = {
+    "Cancel": (".cancel", "Cancel"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Session:
     """Session endpoints wrapper for CMDB API."""
 
+    cancel = LazyEndpoint(".cancel", "Cancel")
+
     def __init__(self, client):
         """Session endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.cancel = Cancel(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Geoip category"""
 
-from . import geoip_query
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Geoip",
     "GeoipQuery",
 ]
 
+_LAZY_IMPORTS = {
+    "geoip_query": (".geoip_query", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Geoip:
     """Geoip endpoints wrapper for CMDB API."""
 
+    geoip_query = LazyEndpoint(".geoip_query", "GeoipQuery")
+
     def __init__(self, client):
         """Geoip endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.geoip_query = geoip_query.GeoipQuery(client)
+        self._client = client
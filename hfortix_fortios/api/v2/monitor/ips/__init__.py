@@ -1,10 +1,6 @@
 """FortiOS CMDB - Ips category"""
 
-from . import session
-from .anomaly import Anomaly
-from .hold_signatures import HoldSignatures
-from .metadata import Metadata
-from .rate_based import RateBased
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Anomaly",
@@ -15,18 +11,30 @@ __all__ = [
     "Session",
 ]
 
+_LAZY_IMPORTS = {
+    "session": (".session", None),
+    "Anomaly": (".anomaly", "Anomaly"),
+    "HoldSignatures": (".hold_signatures", "HoldSignatures"),
+    "Metadata": (".metadata", "Metadata"),
+    "RateBased": (".rate_based", "RateBased"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ips:
     """Ips endpoints wrapper for CMDB API."""
 
+    session = LazyEndpoint(".session", "Session")
+    anomaly = LazyEndpoint(".anomaly", "Anomaly")
+    hold_signatures = LazyEndpoint(".hold_signatures", "HoldSignatures")
+    metadata = LazyEndpoint(".metadata", "Metadata")
+    rate_based = LazyEndpoint(".rate_based", "RateBased")
+
     def __init__(self, client):
         """Ips endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.session = session.Session(client)
-        self.anomaly = Anomaly(client)
-        self.hold_signatures = HoldSignatures(client)
-        self.metadata = Metadata(client)
-        self.rate_based = RateBased(client)
+        self._client = client
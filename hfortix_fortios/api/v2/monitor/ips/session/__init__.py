@@ -1,20 +1,28 @@
 """FortiOS CMDB - Session category"""
 
-from .performance import Performance
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Performance",
     "Session",
 ]
 
+_LAZY_IMPORTS = {
+    "Performance": (".performance", "Performance"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Session:
     """Session endpoints wrapper for CMDB API."""
 
+    performance = LazyEndpoint(".performance", "Performance")
+
     def __init__(self, client):
         """Session endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.performance = Performance(client)
+        self._client = client
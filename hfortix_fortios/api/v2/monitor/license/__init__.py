@@ -1,10 +1,6 @@
 """FortiOS CMDB - License category"""
 
-from . import database
-from .fortianalyzer_status import FortianalyzerStatus
-from .forticare_org_list import ForticareOrgList
-from .forticare_resellers import ForticareResellers
-from .status import Status
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Database",
@@ -15,18 +11,30 @@ __all__ = [
     "Status",
 ]
 
+_LAZY_IMPORTS = {
+    "database": (".database", None),
+    "FortianalyzerStatus": (".fortianalyzer_status", "FortianalyzerStatus"),
+    "ForticareOrgList": (".forticare_org_list", "ForticareOrgList"),
+    "ForticareResellers": (".forticare_resellers", "ForticareResellers"),
+    "Status": (".status", "Status"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class License:
     """License endpoints wrapper for CMDB API."""
 
+    database = LazyEndpoint(".database", "Database")
+    fortianalyzer_status = LazyEndpoint(".fortianalyzer_status", "FortianalyzerStatus")
+    forticare_org_list = LazyEndpoint(".forticare_org_list", "ForticareOrgList")
+    forticare_resellers = LazyEndpoint(".forticare_resellers", "ForticareResellers")
+    status = LazyEndpoint(".status", "Status")
+
     def __init__(self, client):
         """License endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.database = database.Database(client)
-        self.fortianalyzer_status = FortianalyzerStatus(client)
-        self.forticare_org_list = ForticareOrgList(client)
-        self.forticare_resellers = ForticareResellers(client)
-        self.status = Status(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Database category"""
 
-from .upgrade import Upgrade
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Database",
     "Upgrade",
 ]
 
+_LAZY_IMPORTS = {
+    "Upgrade": (".upgrade", "Upgrade"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Database:
     """Database endpoints wrapper for CMDB API."""
 
+    upgrade = LazyEndpoint(".upgrade", "Upgrade")
+
     def __init__(self, client):
         """Database endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.upgrade = Upgrade(client)
+        self._client = client
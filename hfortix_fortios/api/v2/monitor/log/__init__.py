@@ -1,20 +1,6 @@
 """FortiOS CMDB - Log category"""
 
-from . import av_archive
-from . import device
-from . import forticloud
-from . import forticloud_report
-from . import local_report
-from . import policy_archive
-from . import stats
-from .current_disk_usage import CurrentDiskUsage
-from .feature_set import FeatureSet
-from .fortianalyzer import Fortianalyzer
-from .fortianalyzer_queue import FortianalyzerQueue
-from .forticloud_report_list import ForticloudReportList
-from .historic_daily_remote_logs import HistoricDailyRemoteLogs
-from .hourly_disk_usage import HourlyDiskUsage
-from .local_report_list import LocalReportList
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AvArchive",
@@ -35,28 +21,50 @@ __all__ = [
     "Stats",
 ]
 
+_LAZY_IMPORTS = {
+    "av_archive": (".av_archive", None),
+    "device": (".device", None),
+    "forticloud": (".forticloud", None),
+    "forticloud_report": (".forticloud_report", None),
+    "local_report": (".local_report", None),
+    "policy_archive": (".policy_archive", None),
+    "stats": (".stats", None),
+    "CurrentDiskUsage": (".current_disk_usage", "CurrentDiskUsage"),
+    "FeatureSet": (".feature_set", "FeatureSet"),
+    "Fortianalyzer": (".fortianalyzer", "Fortianalyzer"),
+    "FortianalyzerQueue": (".fortianalyzer_queue", "FortianalyzerQueue"),
+    "ForticloudReportList": (".forticloud_report_list", "ForticloudReportList"),
+    "HistoricDailyRemoteLogs": (".historic_daily_remote_logs", "HistoricDailyRemoteLogs"),
+    "HourlyDiskUsage": (".hourly_disk_usage", "HourlyDiskUsage"),
+    "LocalReportList": (".local_report_list", "LocalReportList"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Log:
     """Log endpoints wrapper for CMDB API."""
 
+    av_archive = LazyEndpoint(".av_archive", "AvArchive")
+    device = LazyEndpoint(".device", "Device")
+    forticloud = LazyEndpoint(".forticloud", "Forticloud")
+    forticloud_report = LazyEndpoint(".forticloud_report", "ForticloudReport")
+    local_report = LazyEndpoint(".local_report", "LocalReport")
+    policy_archive = LazyEndpoint(".policy_archive", "PolicyArchive")
+    stats = LazyEndpoint(".stats", "Stats")
+    current_disk_usage = LazyEndpoint(".current_disk_usage", "CurrentDiskUsage")
+    feature_set = LazyEndpoint(".feature_set", "FeatureSet")
+    fortianalyzer = LazyEndpoint(".fortianalyzer", "Fortianalyzer")
+    fortianalyzer_queue = LazyEndpoint(".fortianalyzer_queue", "FortianalyzerQueue")
+    forticloud_report_list = LazyEndpoint(".forticloud_report_list", "ForticloudReportList")
+    historic_daily_remote_logs = LazyEndpoint(".historic_daily_remote_logs", "HistoricDailyRemoteLogs")
+    hourly_disk_usage = LazyEndpoint(".hourly_disk_usage", "HourlyDiskUsage")
+    local_report_list = LazyEndpoint(".local_report_list", "LocalReportList")
+
     def __init__(self, client):
         """Log endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.av_archive = av_archive.AvArchive(client)
-        self.device = device.Device(client)
-        self.forticloud = forticloud.Forticloud(client)
-        self.forticloud_report = forticloud_report.ForticloudReport(client)
-        self.local_report = local_report.LocalReport(client)
-        self.policy_archive = policy_archive.PolicyArchive(client)
-        self.stats = stats.Stats(client)
-        self.current_disk_usage = CurrentDiskUsage(client)
-        self.feature_set = FeatureSet(client)
-        self.fortianalyzer = Fortianalyzer(client)
-        self.fortianalyzer_queue = FortianalyzerQueue(client)
-        self.forticloud_report_list = ForticloudReportList(client)
-        self.historic_daily_remote_logs = HistoricDailyRemoteLogs(client)
-        self.hourly_disk_usage = HourlyDiskUsage(client)
-        self.local_report_list = LocalReportList(client)
+        self._client = client
@@ -1,17 +1,25 @@
 """FortiOS CMDB - Forticloud category"""
 
 from ..forticloud_base import Forticloud as ForticloudBase
-from .connection import Connection
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Connection",
     "Forticloud",
 ]
 
+_LAZY_IMPORTS = {
+    "Connection": (".connection", "Connection"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Forticloud(ForticloudBase):
     """Forticloud endpoints wrapper for CMDB API."""
 
+    connection = LazyEndpoint(".connection", "Connection")
+
     def __init__(self, client):
         """Forticloud endpoints.
         
@@ -19,4 +27,4 @@ class Forticloud(ForticloudBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.connection = Connection(client)
+        self._client = client
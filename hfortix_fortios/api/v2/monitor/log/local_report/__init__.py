@@ -1,7 +1,6 @@
 """FortiOS CMDB - LocalReport category"""
 
-from .delete import Delete
-from .download import Download
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Delete",
@@ -9,15 +8,24 @@ __all__ = [
     "LocalReport",
 ]
 
+_LAZY_IMPORTS = {
+    "Delete": (".delete", "Delete"),
+    "Download": (".download", "Download"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class LocalReport:
     """LocalReport endpoints wrapper for CMDB API."""
 
+    delete = LazyEndpoint(".delete", "Delete")
+    download = LazyEndpoint(".download", "Download")
+
     def __init__(self, client):
         """LocalReport endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.delete = Delete(client)
-        self.download = Download(client)
+        self._client = client
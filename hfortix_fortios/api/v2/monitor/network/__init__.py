@@ -1,12 +1,6 @@
 """FortiOS CMDB - Network category"""
 
-from . import ddns
-from . import debug_flow
-from . import dns
-from . import fortiguard
-from . import lldp
-from .arp import Arp
-from .reverse_ip_lookup import ReverseIpLookup
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Arp",
@@ -19,20 +13,34 @@ __all__ = [
     "ReverseIpLookup",
 ]
 
+_LAZY_IMPORTS = {
+    "ddns": (".ddns", None),
+    "debug_flow": (".debug_flow", None),
+    "dns": (".dns", None),
+    "fortiguard": (".fortiguard", None),
+    "lldp": (".lldp", None),
+    "Arp": (".arp", "Arp"),
+    "ReverseIpLookup": (".reverse_ip_lookup", "ReverseIpLookup"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Network:
     """Network endpoints wrapper for CMDB API."""
 
+    ddns = LazyEndpoint(".ddns", "Ddns")
+    debug_flow = LazyEndpoint(".debug_flow", "DebugFlow")
+    dns = LazyEndpoint(".dns", "Dns")
+    fortiguard = LazyEndpoint(".fortiguard", "Fortiguard")
+    lldp = LazyEndpoint(".lldp", "Lldp")
+    arp = LazyEndpoint(".arp", "Arp")
+    reverse_ip_lookup = LazyEndpoint(".reverse_ip_lookup", "ReverseIpLookup")
+
     def __init__(self, client):
         """Network endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.ddns = ddns.Ddns(client)
-        self.debug_flow = debug_flow.DebugFlow(client)
-        self.dns = dns.Dns(client)
-        self.fortiguard = fortiguard.Fortiguard(client)
-        self.lldp = lldp.Lldp(client)
-        self.arp = Arp(client)
-        self.reverse_ip_lookup = ReverseIpLookup(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - Ddns category"""
 
-from .lookup import Lookup
-from .servers import Servers
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Ddns",
@@ -9,15 +8,24 @@ __all__ = [
     "Servers",
 ]
 
+_LAZY_IMPORTS = {
+    "Lookup": (".lookup", "Lookup"),
+    "Servers": (".servers", "Servers"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ddns:
     """Ddns endpoints wrapper for CMDB API."""
 
+    lookup = LazyEndpoint(".lookup", "Lookup")
+    servers = LazyEndpoint(".servers", "Servers")
+
     def __init__(self, client):
         """Ddns endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.lookup = Lookup(client)
-        self.servers = Servers(client)
+        self._client = client
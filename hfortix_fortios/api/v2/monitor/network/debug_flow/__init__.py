@@ -1,7 +1,6 @@
 """FortiOS CMDB - DebugFlow category"""
 
-from .start import Start
-from .stop import Stop
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "DebugFlow",
@@ -9,15 +8,24 @@ __all__ = [
     "Stop",
 ]
 
+_LAZY_IMPORTS = {
+    "Start": (".start", "Start"),
+    "Stop": (".stop", "Stop"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class DebugFlow:
     """DebugFlow endpoints wrapper for CMDB API."""
 
+    start = LazyEndpoint(".start", "Start")
+    stop = LazyEndpoint(".stop", "Stop")
+
     def __init__(self, client):
         """DebugFlow endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.start = Start(client)
-        self.stop = Stop(client)
+        self._client = client
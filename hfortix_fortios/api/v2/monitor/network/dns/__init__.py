@@ -1,20 +1,28 @@
 """FortiOS CMDB - Dns category"""
 
-from .latency import Latency
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Dns",
     "Latency",
 ]
 
+_LAZY_IMPORTS = {
+    "Latency": (".latency", "Latency"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Dns:
     """Dns endpoints wrapper for CMDB API."""
 
+    latency = LazyEndpoint(".latency", "Latency")
+
     def __init__(self, client):
         """Dns endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.latency = Latency(client)
+        self._client = client
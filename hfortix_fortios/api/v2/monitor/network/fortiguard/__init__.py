@@ -1,20 +1,28 @@
 """FortiOS CMDB - Fortiguard category"""
 
-from .live_services_latency import LiveServicesLatency
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Fortiguard",
     "LiveServicesLatency",
 ]
 
+_LAZY_IMPORTS = {
+    "LiveServicesLatency": (".live_services_latency", "LiveServicesLatency"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Fortiguard:
     """Fortiguard endpoints wrapper for CMDB API."""
 
+    live_services_latency = LazyEndpoint(".live_services_latency", "LiveServicesLatency")
+
     def __init__(self, client):
         """Fortiguard endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.live_services_latency = LiveServicesLatency(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - Lldp category"""
 
-from .neighbors import Neighbors
-from .ports import Ports
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Lldp",
@@ -9,15 +8,24 @@ __all__ = [
     "Ports",
 ]
 
+_LAZY_IMPORTS = {
+    "Neighbors": (".neighbors", "Neighbors"),
+    "Ports": (".ports", "Ports"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Lldp:
     """Lldp endpoints wrapper for CMDB API."""
 
+    neighbors = LazyEndpoint(".neighbors", "Neighbors")
+    ports = LazyEndpoint(".ports", "Ports")
+
     def __init__(self, client):
         """Lldp endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.neighbors = Neighbors(client)
-        self.ports = Ports(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Registration category"""
 
-from . import forticare
-from . import forticloud
-from . import vdom
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Forticare",
@@ -11,16 +9,26 @@ __all__ = [
     "Vdom",
 ]
 
+_LAZY_IMPORTS = {
+    "forticare": (".forticare", None),
+    "forticloud": (".forticloud", None),
+    "vdom": (".vdom", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Registration:
     """Registration endpoints wrapper for CMDB API."""
 
+    forticare = LazyEndpoint(".forticare", "Forticare")
+    forticloud = LazyEndpoint(".forticloud", "Forticloud")
+    vdom = LazyEndpoint(".vdom", "Vdom")
+
     def __init__(self, client):
         """Registration endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.forticare = forticare.Forticare(client)
-        self.forticloud = forticloud.Forticloud(client)
-        self.vdom = vdom.Vdom(client)
+        self._client = client
@@ -1,11 +1,6 @@
 """FortiOS CMDB - Forticare category"""
 
-from .add_license import AddLicense
-from .check_connectivity import CheckConnectivity
-from .create import Create
-from .deregister_device import DeregisterDevice
-from .login import Login
-from .transfer import Transfer
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AddLicense",
@@ -17,19 +12,32 @@ __all__ = [
     "Transfer",
 ]
 
+_LAZY_IMPORTS = {
+    "AddLicense": (".add_license", "AddLicense"),
+    "CheckConnectivity": (".check_connectivity", "CheckConnectivity"),
+    "Create": (".create", "Create"),
+    "DeregisterDevice": (".deregister_device", "DeregisterDevice"),
+    "Login": (".login", "Login"),
+    "Transfer": (".transfer", "Transfer"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Forticare:
     """Forticare endpoints wrapper for CMDB API."""
 
+    add_license = LazyEndpoint(".add_license", "AddLicense")
+    check_connectivity = LazyEndpoint(".check_connectivity", "CheckConnectivity")
+    create = LazyEndpoint(".create", "Create")
+    deregister_device = LazyEndpoint(".deregister_device", "DeregisterDevice")
+    login = LazyEndpoint(".login", "Login")
+    transfer = LazyEndpoint(".transfer", "Transfer")
+
     def __init__(self, client):
         """Forticare endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.add_license = AddLicense(client)
-        self.check_connectivity = CheckConnectivity(client)
-        self.create = Create(client)
-        self.deregister_device = DeregisterDevice(client)
-        self.login = Login(client)
-        self.transfer = Transfer(client)
+        self._client = client
@@ -1,12 +1,6 @@
 """FortiOS CMDB - Forticloud category"""
 
-from .device_status import DeviceStatus
-from .disclaimer import Disclaimer
-from .domains import Domains
-from .login import Login
-from .logout import Logout
-from .migrate import Migrate
-from .register_device import RegisterDevice
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "DeviceStatus",
@@ -19,20 +13,34 @@ __all__ = [
     "RegisterDevice",
 ]
 
+_LAZY_IMPORTS = {
+    "DeviceStatus": (".device_status", "DeviceStatus"),
+    "Disclaimer": (".disclaimer", "Disclaimer"),
+    "Domains": (".domains", "Domains"),
+    "Login": (".login", "Login"),
+    "Logout": (".logout", "Logout"),
+    "Migrate": (".migrate", "Migrate"),
+    "RegisterDevice": (".register_device", "RegisterDevice"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Forticloud:
     """Forticloud endpoints wrapper for CMDB API."""
 
+    device_status = LazyEndpoint(".device_status", "DeviceStatus")
+    disclaimer = LazyEndpoint(".disclaimer", "Disclaimer")
+    domains = LazyEndpoint(".domains", "Domains")
+    login = LazyEndpoint(".login", "Login")
+    logout = LazyEndpoint(".logout", "Logout")
+    migrate = LazyEndpoint(".migrate", "Migrate")
+    register_device = LazyEndpoint(".register_device", "RegisterDevice")
+
     def __init__(self, client):
         """Forticloud endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.device_status = DeviceStatus(client)
-        self.disclaimer = Disclaimer(client)
-        self.domains = Domains(client)
-        self.login = Login(client)
-        self.logout = Logout(client)
-        self.migrate = Migrate(client)
-        self.register_device = RegisterDevice(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Vdom category"""
 
-from .add_license import AddLicense
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AddLicense",
     "Vdom",
 ]
 
+_LAZY_IMPORTS = {
+    "AddLicense": (".add_license", "AddLicense"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Vdom:
     """Vdom endpoints wrapper for CMDB API."""
 
+    add_license = LazyEndpoint(".add_license", "AddLicense")
+
     def __init__(self, client):
         """Vdom endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.add_license = AddLicense(client)
+        self._client = client
@@ -1,16 +1,6 @@
 """FortiOS CMDB - Router category"""
 
-from . import bgp
-from . import lookup
-from . import ospf
-from . import sdwan
-from .charts import Charts
-from .ipv4 import Ipv4
-from .ipv6 import Ipv6
-from .lookup_policy import LookupPolicy
-from .policy import Policy
-from .policy6 import Policy6
-from .statistics import Statistics
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Bgp",
@@ -27,24 +17,42 @@ __all__ = [
     "Statistics",
 ]
 
+_LAZY_IMPORTS = {
+    "bgp": (".bgp", None),
+    "lookup": (".lookup", None),
+    "ospf": (".ospf", None),
+    "sdwan": (".sdwan", None),
+    "Charts": (".charts", "Charts"),
+    "Ipv4": (".ipv4", "Ipv4"),
+    "Ipv6": (".ipv6", "Ipv6"),
+    "LookupPolicy": (".lookup_policy", "LookupPolicy"),
+    "Policy": (".policy", "Policy"),
+    "Policy6": (".policy6", "Policy6"),
+    "Statistics": (".statistics", "Statistics"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Router:
     """Router endpoints wrapper for CMDB API."""
 
+    bgp = LazyEndpoint(".bgp", "Bgp")
+    lookup = LazyEndpoint(".lookup", "Lookup")
+    ospf = LazyEndpoint(".ospf", "Ospf")
+    sdwan = LazyEndpoint(".sdwan", "Sdwan")
+    charts = LazyEndpoint(".charts", "Charts")
+    ipv4 = LazyEndpoint(".ipv4", "Ipv4")
+    ipv6 = LazyEndpoint(".ipv6", "Ipv6")
+    lookup_policy = LazyEndpoint(".lookup_policy", "LookupPolicy")
+    policy = LazyEndpoint(".policy", "Policy")
+    policy6 = LazyEndpoint(".policy6", "Policy6")
+    statistics = LazyEndpoint(".statistics", "Statistics")
+
     def __init__(self, client):
         """Router endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.bgp = bgp.Bgp(client)
-        self.lookup = lookup.Lookup(client)
-        self.ospf = ospf.Ospf(client)
-        self.sdwan = sdwan.Sdwan(client)
-        self.charts = Charts(client)
-        self.ipv4 = Ipv4(client)
-        self.ipv6 = Ipv6(client)
-        self.lookup_policy = LookupPolicy(client)
-        self.policy = Policy(client)
-        self.policy6 = Policy6(client)
-        self.statistics = Statistics(client)
+        self._client = client
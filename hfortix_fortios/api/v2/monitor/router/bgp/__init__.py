@@ -1,14 +1,6 @@
 """FortiOS CMDB - Bgp category"""
 
-from .clear_soft_in import ClearSoftIn
-from .clear_soft_out import ClearSoftOut
-from .neighbors import Neighbors
-from .neighbors6 import Neighbors6
-from .neighbors_statistics import NeighborsStatistics
-from .paths import Paths
-from .paths6 import Paths6
-from .paths_statistics import PathsStatistics
-from .soft_reset_neighbor import SoftResetNeighbor
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Bgp",
@@ -23,22 +15,38 @@ __all__ = [
     "SoftResetNeighbor",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearSoftIn": (".clear_soft_in", "ClearSoftIn"),
+    "ClearSoftOut": (".clear_soft_out", "ClearSoftOut"),
+    "Neighbors": (".neighbors", "Neighbors"),
+    "Neighbors6": (".neighbors6", "Neighbors6"),
+    "NeighborsStatistics": (".neighbors_statistics", "NeighborsStatistics"),
+    "Paths": (".paths", "Paths"),
+    "Paths6": (".paths6", "Paths6"),
+    "PathsStatistics": (".paths_statistics", "PathsStatistics"),
+    "SoftResetNeighbor": (".soft_reset_neighbor", "SoftResetNeighbor"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Bgp:
     """Bgp endpoints wrapper for CMDB API."""
 
+    clear_soft_in = LazyEndpoint(".clear_soft_in", "ClearSoftIn")
+    clear_soft_out = LazyEndpoint(".clear_soft_out", "ClearSoftOut")
+    neighbors = LazyEndpoint(".neighbors", "Neighbors")
+    neighbors6 = LazyEndpoint(".neighbors6", "Neighbors6")
+    neighbors_statistics = LazyEndpoint(".neighbors_statistics", "NeighborsStatistics")
+    paths = LazyEndpoint(".paths", "Paths")
+    paths6 = LazyEndpoint(".paths6", "Paths6")
+    paths_statistics = LazyEndpoint(".paths_statistics", "PathsStatistics")
+    soft_reset_neighbor = LazyEndpoint(".soft_reset_neighbor", "SoftResetNeighbor")
+
     def __init__(self, client):
         """Bgp endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.clear_soft_in = ClearSoftIn(client)
-        self.clear_soft_out = ClearSoftOut(client)
-        self.neighbors = Neighbors(client)
-        self.neighbors6 = Neighbors6(client)
-        self.neighbors_statistics = NeighborsStatistics(client)
-        self.paths = Paths(client)
-        self.paths6 = Paths6(client)
-        self.paths_statistics = PathsStatistics(client)
-        self.soft_reset_neighbor = SoftResetNeighbor(client)
+        self._client = client
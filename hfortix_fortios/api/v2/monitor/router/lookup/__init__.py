@@ -1,17 +1,25 @@
 """FortiOS CMDB - Lookup category"""
 
 from ..lookup_base import Lookup as LookupBase
-from .ha_peer import HaPeer
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "HaPeer",
     "Lookup",
 ]
 
+_LAZY_IMPORTS = {
+    "HaPeer": (".ha_peer", "HaPeer"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Lookup(LookupBase):
     """Lookup endpoints wrapper for CMDB API."""
 
+    ha_peer = LazyEndpoint(".ha_peer", "HaPeer")
+
     def __init__(self, client):
         """Lookup endpoints.
         
@@ -19,4 +27,4 @@ class Lookup(LookupBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.ha_peer = HaPeer(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Ospf category"""
 
-from .neighbors import Neighbors
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Neighbors",
     "Ospf",
 ]
 
+_LAZY_IMPORTS = {
+    "Neighbors": (".neighbors", "Neighbors"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ospf:
     """Ospf endpoints wrapper for CMDB API."""
 
+    neighbors = LazyEndpoint(".neighbors", "Neighbors")
+
     def __init__(self, client):
         """Ospf endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.neighbors = Neighbors(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Sdwan category"""
 
-from .routes import Routes
-from .routes6 import Routes6
-from .routes_statistics import RoutesStatistics
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Routes",
@@ -11,16 +9,26 @@ __all__ = [
     "Sdwan",
 ]
 
+_LAZY_IMPORTS = {
+    "Routes": (".routes", "Routes"),
+    "Routes6": (".routes6", "Routes6"),
+    "RoutesStatistics": (".routes_statistics", "RoutesStatistics"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Sdwan:
     """Sdwan endpoints wrapper for CMDB API."""
 
+    routes = LazyEndpoint(".routes", "Routes")
+    routes6 = LazyEndpoint(".routes6", "Routes6")
+    routes_statistics = LazyEndpoint(".routes_statistics", "RoutesStatistics")
+
     def __init__(self, client):
         """Sdwan endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.routes = Routes(client)
-        self.routes6 = Routes6(client)
-        self.routes_statistics = RoutesStatistics(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Sdwan category"""
 
-from . import link_monitor_metrics
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "LinkMonitorMetrics",
     "Sdwan",
 ]
 
+_LAZY_IMPORTS = {
+    "link_monitor_metrics": (".link_monitor_metrics", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Sdwan:
     """Sdwan endpoints wrapper for CMDB API."""
 
+    link_monitor_metrics = LazyEndpoint(".link_monitor_metrics", "LinkMonitorMetrics")
+
     def __init__(self, client):
         """Sdwan endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.link_monitor_metrics = link_monitor_metrics.LinkMonitorMetrics(client)
+        self._client = client
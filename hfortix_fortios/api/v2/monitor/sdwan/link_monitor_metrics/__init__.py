@@ -1,20 +1,28 @@
 """FortiOS CMDB - LinkMonitorMetrics category"""
 
-from .report import Report
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "LinkMonitorMetrics",
     "Report",
 ]
 
+_LAZY_IMPORTS = {
+    "Report": (".report", "Report"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class LinkMonitorMetrics:
     """LinkMonitorMetrics endpoints wrapper for CMDB API."""
 
+    report = LazyEndpoint(".report", "Report")
+
     def __init__(self, client):
         """LinkMonitorMetrics endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.report = Report(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Service category"""
 
-from . import ldap
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Ldap",
     "Service",
 ]
 
+_LAZY_IMPORTS = {
+    "ldap": (".ldap", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Service:
     """Service endpoints wrapper for CMDB API."""
 
+    ldap = LazyEndpoint(".ldap", "Ldap")
+
     def __init__(self, client):
         """Service endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.ldap = ldap.Ldap(client)
+        self._client = client
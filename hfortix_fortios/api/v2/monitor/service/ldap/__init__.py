@@ -1,20 +1,28 @@
 """FortiOS CMDB - Ldap category"""
 
-from .query import Query
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Ldap",
     "Query",
 ]
 
+_LAZY_IMPORTS = {
+    "Query": (".query", "Query"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ldap:
     """Ldap endpoints wrapper for CMDB API."""
 
+    query = LazyEndpoint(".query", "Query")
+
     def __init__(self, client):
         """Ldap endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.query = Query(client)
+        self._client = client
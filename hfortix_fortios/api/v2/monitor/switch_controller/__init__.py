@@ -1,14 +1,6 @@
 """FortiOS CMDB - SwitchController category"""
 
-from . import fsw_firmware
-from . import isl_lockdown
-from . import managed_switch
-from . import mclag_icl
-from . import nac_device
-from . import recommendation
-from .detected_device import DetectedDevice
-from .known_nac_device_criteria_list import KnownNacDeviceCriteriaList
-from .matched_devices import MatchedDevices
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "DetectedDevice",
@@ -23,22 +15,38 @@ __all__ = [
     "SwitchController",
 ]
 
+_LAZY_IMPORTS = {
+    "fsw_firmware": (".fsw_firmware", None),
+    "isl_lockdown": (".isl_lockdown", None),
+    "managed_switch": (".managed_switch", None),
+    "mclag_icl": (".mclag_icl", None),
+    "nac_device": (".nac_device", None),
+    "recommendation": (".recommendation", None),
+    "DetectedDevice": (".detected_device", "DetectedDevice"),
+    "KnownNacDeviceCriteriaList": (".known_nac_device_criteria_list", "KnownNacDeviceCriteriaList"),
+    "MatchedDevices": (".matched_devices", "MatchedDevices"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class SwitchController:
     """SwitchController endpoints wrapper for CMDB API."""
 
+    fsw_firmware = LazyEndpoint(".fsw_firmware", "FswFirmware")
+    isl_lockdown = LazyEndpoint(".isl_lockdown", "IslLockdown")
+    managed_switch = LazyEndpoint(".managed_switch", "ManagedSwitch")
+    mclag_icl = LazyEndpoint(".mclag_icl", "MclagIcl")
+    nac_device = LazyEndpoint(".nac_device", "NacDevice")
+    recommendation = LazyEndpoint(".recommendation", "Recommendation")
+    detected_device = LazyEndpoint(".detected_device", "DetectedDevice")
+    known_nac_device_criteria_list = LazyEndpoint(".known_nac_device_criteria_list", "KnownNacDeviceCriteriaList")
+    matched_devices = LazyEndpoint(".matched_devices", "MatchedDevices")
+
     def __init__(self, client):
         """SwitchController endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.fsw_firmware = fsw_firmware.FswFirmware(client)
-        self.isl_lockdown = isl_lockdown.IslLockdown(client)
-        self.managed_switch = managed_switch.ManagedSwitch(client)
-        self.mclag_icl = mclag_icl.MclagIcl(client)
-        self.nac_device = nac_device.NacDevice(client)
-        self.recommendation = recommendation.Recommendation(client)
-        self.detected_device = DetectedDevice(client)
-        self.known_nac_device_criteria_list = KnownNacDeviceCriteriaList(client)
-        self.matched_devices = MatchedDevices(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - IslLockdown category"""
 
-from .status import Status
-from .update import Update
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "IslLockdown",
@@ -9,15 +8,24 @@ __all__ = [
     "Update",
 ]
 
+_LAZY_IMPORTS = {
+    "Status": (".status", "Status"),
+    "Update": (".update", "Update"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class IslLockdown:
     """IslLockdown endpoints wrapper for CMDB API."""
 
+    status = LazyEndpoint(".status", "Status")
+    update = LazyEndpoint(".update", "Update")
+
     def __init__(self, client):
         """IslLockdown endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.status = Status(client)
-        self.update = Update(client)
+        self._client = client
@@ -1,22 +1,6 @@
 """FortiOS CMDB - ManagedSwitch category"""
 
-from .bios import Bios
-from .bounce_port import BouncePort
-from .cable_status import CableStatus
-from .dhcp_snooping import DhcpSnooping
-from .faceplate_xml import FaceplateXml
-from .factory_reset import FactoryReset
-from .health_status import HealthStatus
-from .models import Models
-from .poe_reset import PoeReset
-from .port_health import PortHealth
-from .port_stats import PortStats
-from .port_stats_reset import PortStatsReset
-from .restart import Restart
-from .status import Status
-from .transceivers import Transceivers
-from .tx_rx import TxRx
-from .update import Update
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Bios",
@@ -39,30 +23,54 @@ __all__ = [
     "Update",
 ]
 
+_LAZY_IMPORTS = {
+    "Bios": (".bios", "Bios"),
+    "BouncePort": (".bounce_port", "BouncePort"),
+    "CableStatus": (".cable_status", "CableStatus"),
+    "DhcpSnooping": (".dhcp_snooping", "DhcpSnooping"),
+    "FaceplateXml": (".faceplate_xml", "FaceplateXml"),
+    "FactoryReset": (".factory_reset", "FactoryReset"),
+    "HealthStatus": (".health_status", "HealthStatus"),
+    "Models": (".models", "Models"),
+    "PoeReset": (".poe_reset", "PoeReset"),
+    "PortHealth": (".port_health", "PortHealth"),
+    "PortStats": (".port_stats", "PortStats"),
+    "PortStatsReset": (".port_stats_reset", "PortStatsReset"),
+    "Restart": (".restart", "Restart"),
+    "Status": (".status", "Status"),
+    "Transceivers": (".transceivers", "Transceivers"),
+    "TxRx": (".tx_rx", "TxRx"),
+    "Update": (".update", "Update"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ManagedSwitch:
     """ManagedSwitch endpoints wrapper for CMDB API."""
 
+    bios = LazyEndpoint(".bios", "Bios")
+    bounce_port = LazyEndpoint(".bounce_port", "BouncePort")
+    cable_status = LazyEndpoint(".cable_status", "CableStatus")
+    dhcp_snooping = LazyEndpoint(".dhcp_snooping", "DhcpSnooping")
+    faceplate_xml = LazyEndpoint(".faceplate_xml", "FaceplateXml")
+    factory_reset = LazyEndpoint(".factory_reset", "FactoryReset")
+    health_status = LazyEndpoint(".health_status", "HealthStatus")
+    models = LazyEndpoint(".models", "Models")
+    poe_reset = LazyEndpoint(".poe_reset", "PoeReset")
+    port_health = LazyEndpoint(".port_health", "PortHealth")
+    port_stats = LazyEndpoint(".port_stats", "PortStats")
+    port_stats_reset = LazyEndpoint(".port_stats_reset", "PortStatsReset")
+    restart = LazyEndpoint(".restart", "Restart")
+    status = LazyEndpoint(".status", "Status")
+    transceivers = LazyEndpoint(".transceivers", "Transceivers")
+    tx_rx = LazyEndpoint(".tx_rx", "TxRx")
+    update = LazyEndpoint(".update", "Update")
+
     def __init__(self, client):
         """ManagedSwitch endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.bios = Bios(client)
-        self.bounce_port = BouncePort(client)
-        self.cable_status = CableStatus(client)
-        self.dhcp_snooping = DhcpSnooping(client)
-        self.faceplate_xml = FaceplateXml(client)
-        self.factory_reset = FactoryReset(client)
-        self.health_status = HealthStatus(client)
-        self.models = Models(client)
-        self.poe_reset = PoeReset(client)
-        self.port_health = PortHealth(client)
-        self.port_stats = PortStats(client)
-        self.port_stats_reset = PortStatsReset(client)
-        self.restart = Restart(client)
-        self.status = Status(client)
-        self.transceivers = Transceivers(client)
-        self.tx_rx = TxRx(client)
-        self.update = Update(client)
+        self._client = client
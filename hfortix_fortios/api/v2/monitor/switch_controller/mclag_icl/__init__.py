@@ -1,9 +1,6 @@
 """FortiOS CMDB - MclagIcl category"""
 
-from .eligible_peer import EligiblePeer
-from .set_tier1 import SetTier1
-from .set_tier_plus import SetTierPlus
-from .tier_plus_candidates import TierPlusCandidates
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "EligiblePeer",
@@ -13,17 +10,28 @@ __all__ = [
     "TierPlusCandidates",
 ]
 
+_LAZY_IMPORTS = {
+    "EligiblePeer": (".eligible_peer", "EligiblePeer"),
+    "SetTier1": (".set_tier1", "SetTier1"),
+    "SetTierPlus": (".set_tier_plus", "SetTierPlus"),
+    "TierPlusCandidates": (".tier_plus_candidates", "TierPlusCandidates"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class MclagIcl:
     """MclagIcl endpoints wrapper for CMDB API."""
 
+    eligible_peer = LazyEndpoint(".eligible_peer", "EligiblePeer")
+    set_tier1 = LazyEndpoint(".set_tier1", "SetTier1")
+    set_tier_plus = LazyEndpoint(".set_tier_plus", "SetTierPlus")
+    tier_plus_candidates = LazyEndpoint(".tier_plus_candidates", "TierPlusCandidates")
+
     def __init__(self, client):
         """MclagIcl endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.eligible_peer = EligiblePeer(client)
-        self.set_tier1 = SetTier1(client)
-        self.set_tier_plus = SetTierPlus(client)
-        self.tier_plus_candidates = TierPlusCandidates(client)
+        self._client = client
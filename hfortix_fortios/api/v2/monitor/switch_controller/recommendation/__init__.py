@@ -1,20 +1,28 @@
 """FortiOS CMDB - Recommendation category"""
 
-from .pse_config import PseConfig
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "PseConfig",
     "Recommendation",
 ]
 
+_LAZY_IMPORTS = {
+    "PseConfig": (".pse_config", "PseConfig"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Recommendation:
     """Recommendation endpoints wrapper for CMDB API."""
 
+    pse_config = LazyEndpoint(".pse_config", "PseConfig")
+
     def __init__(self, client):
         """Recommendation endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.pse_config = PseConfig(client)
+        self._client = client
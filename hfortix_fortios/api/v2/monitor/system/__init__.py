@@ -1,86 +1,6 @@
 """FortiOS CMDB - System category"""
 
-from . import admin
-from . import api_user
-from . import automation_action
-from . import automation_stitch
-from . import available_interfaces
-from . import botnet
-from . import botnet_domains
-from . import central_management
-from . import certificate
-from . import change_password
-from . import cluster
-from . import com_log
-from . import config
-from . import config_error_log
-from . import config_revision
-from . import config_script
-from . import config_sync
-from . import crash_log
-from . import csf
-from . import debug
-from . import dhcp
-from . import dhcp6
-from . import disconnect_admins
-from . import external_resource
-from . import firmware
-from . import fortiguard
-from . import fortimanager
-from . import fsck
-from . import ha_peer
-from . import hscalefw_license
-from . import interface
-from . import ipam
-from . import logdisk
-from . import lte_modem
-from . import modem
-from . import modem5g
-from . import ntp
-from . import object
-from . import os
-from . import password_policy_conform
-from . import performance
-from . import private_data_encryption
-from . import process
-from . import resource
-from . import sandbox
-from . import sdn_connector
-from . import time
-from . import traffic_history
-from . import upgrade_report
-from . import usb_device
-from . import usb_log
-from . import vmlicense
-from .acme_certificate_status import AcmeCertificateStatus
-from .acquired_dns import AcquiredDns
-from .available_certificates import AvailableCertificates
-from .check_port_availability import CheckPortAvailability
-from .current_admins import CurrentAdmins
-from .global_resources import GlobalResources
-from .global_search import GlobalSearch
-from .ha_backup_hb_used import HaBackupHbUsed
-from .ha_checksums import HaChecksums
-from .ha_history import HaHistory
-from .ha_hw_interface import HaHwInterface
-from .ha_nonsync_checksums import HaNonsyncChecksums
-from .ha_statistics import HaStatistics
-from .ha_table_checksums import HaTableChecksums
-from .interface_connected_admins_info import InterfaceConnectedAdminsInfo
-from .ipconf import Ipconf
-from .link_monitor import LinkMonitor
-from .modem3g import Modem3g
-from .monitor_sensor import MonitorSensor
-from .resolve_fqdn import ResolveFqdn
-from .running_processes import RunningProcesses
-from .sensor_info import SensorInfo
-from .status import Status
-from .storage import Storage
-from .timezone import Timezone
-from .trusted_cert_authorities import TrustedCertAuthorities
-from .vdom_link import VdomLink
-from .vdom_resource import VdomResource
-from .vm_information import VmInformation
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AcmeCertificateStatus",
@@ -167,94 +87,182 @@ __all__ = [
     "Vmlicense",
 ]
 
+_LAZY_IMPORTS = {
+    "admin": (".admin", None),
+    "api_user": (".api_user", None),
+    "automation_action": (".automation_action", None),
+    "automation_stitch": (".automation_stitch", None),
+    "available_interfaces": (".available_interfaces", None),
+    "botnet": (".botnet", None),
+    "botnet_domains": (".botnet_domains", None),
+    "central_management": (".central_management", None),
+    "certificate": (".certificate", None),
+    "change_password": (".change_password", None),
+    "cluster": (".cluster", None),
+    "com_log": (".com_log", None),
+    "config": (".config", None),
+    "config_error_log": (".config_error_log", None),
+    "config_revision": (".config_revision", None),
+    "config_script": (".config_script", None),
+    "config_sync": (".config_sync", None),
+    "crash_log": (".crash_log", None),
+    "csf": (".csf", None),
+    "debug": (".debug", None),
+    "dhcp": (".dhcp", None),
+    "dhcp6": (".dhcp6", None),
+    "disconnect_admins": (".disconnect_admins", None),
+    "external_resource": (".external_resource", None),
+    "firmware": (".firmware", None),
+    "fortiguard": (".fortiguard", None),
+    "fortimanager": (".fortimanager", None),
+    "fsck": (".fsck", None),
+    "ha_peer": (".ha_peer", None),
+    "hscalefw_license": (".hscalefw_license", None),
+    "interface": (".interface", None),
+    "ipam": (".ipam", None),
+    "logdisk": (".logdisk", None),
+    "lte_modem": (".lte_modem", None),
+    "modem": (".modem", None),
+    "modem5g": (".modem5g", None),
+    "ntp": (".ntp", None),
+    "object": (".object", None),
+    "os": (".os", None),
+    "password_policy_conform": (".password_policy_conform", None),
+    "performance": (".performance", None),
+    "private_data_encryption": (".private_data_encryption", None),
+    "process": (".process", None),
+    "resource": (".resource", None),
+    "sandbox": (".sandbox", None),
+    "sdn_connector": (".sdn_connector", None),
+    "time": (".time", None),
+    "traffic_history": (".traffic_history", None),
+    "upgrade_report": (".upgrade_report", None),
+    "usb_device": (".usb_device", None),
+    "usb_log": (".usb_log", None),
+    "vmlicense": (".vmlicense", None),
+    "AcmeCertificateStatus": (".acme_certificate_status", "AcmeCertificateStatus"),
+    "AcquiredDns": (".acquired_dns", "AcquiredDns"),
+    "AvailableCertificates": (".available_certificates", "AvailableCertificates"),
+    "CheckPortAvailability": (".check_port_availability", "CheckPortAvailability"),
+    "CurrentAdmins": (".current_admins", "CurrentAdmins"),
+    "GlobalResources": (".global_resources", "GlobalResources"),
+    "GlobalSearch": (".global_search", "GlobalSearch"),
+    "HaBackupHbUsed": (".ha_backup_hb_used", "HaBackupHbUsed"),
+    "HaChecksums": (".ha_checksums", "HaChecksums"),
+    "HaHistory": (".ha_history", "HaHistory"),
+    "HaHwInterface": (".ha_hw_interface", "HaHwInterface"),
+    "HaNonsyncChecksums": (".ha_nonsync_checksums", "HaNonsyncChecksums"),
+    "HaStatistics": (".ha_statistics", "HaStatistics"),
+    "HaTableChecksums": (".ha_table_checksums", "HaTableChecksums"),
+    "InterfaceConnectedAdminsInfo": (".interface_connected_admins_info", "InterfaceConnectedAdminsInfo"),
+    "Ipconf": (".ipconf", "Ipconf"),
+    "LinkMonitor": (".link_monitor", "LinkMonitor"),
+    "Modem3g": (".modem3g", "Modem3g"),
+    "MonitorSensor": (".monitor_sensor", "MonitorSensor"),
+    "ResolveFqdn": (".resolve_fqdn", "ResolveFqdn"),
+    "RunningProcesses": (".running_processes", "RunningProcesses"),
+    "SensorInfo": (".sensor_info", "SensorInfo"),
+    "Status": (".status", "Status"),
+    "Storage": (".storage", "Storage"),
+    "Timezone": (".timezone", "Timezone"),
+    "TrustedCertAuthorities": (".trusted_cert_authorities", "TrustedCertAuthorities"),
+    "VdomLink": (".vdom_link", "VdomLink"),
+    "VdomResource": (".vdom_resource", "VdomResource"),
+    "VmInformation": (".vm_information", "VmInformation"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class System:
     """System endpoints wrapper for CMDB API."""
 
+    admin = LazyEndpoint(".admin", "Admin")
+    api_user = LazyEndpoint(".api_user", "ApiUser")
+    automation_action = LazyEndpoint(".automation_action", "AutomationAction")
+    automation_stitch = LazyEndpoint(".automation_stitch", "AutomationStitch")
+    available_interfaces = LazyEndpoint(".available_interfaces", "AvailableInterfaces")
+    botnet = LazyEndpoint(".botnet", "Botnet")
+    botnet_domains = LazyEndpoint(".botnet_domains", "BotnetDomains")
+    central_management = LazyEndpoint(".central_management", "CentralManagement")
+    certificate = LazyEndpoint(".certificate", "Certificate")
+    change_password = LazyEndpoint(".change_password", "ChangePassword")
+    cluster = LazyEndpoint(".cluster", "Cluster")
+    com_log = LazyEndpoint(".com_log", "ComLog")
+    config = LazyEndpoint(".config", "Config")
+    config_error_log = LazyEndpoint(".config_error_log", "ConfigErrorLog")
+    config_revision = LazyEndpoint(".config_revision", "ConfigRevision")
+    config_script = LazyEndpoint(".config_script", "ConfigScript")
+    config_sync = LazyEndpoint(".config_sync", "ConfigSync")
+    crash_log = LazyEndpoint(".crash_log", "CrashLog")
+    csf = LazyEndpoint(".csf", "Csf")
+    debug = LazyEndpoint(".debug", "Debug")
+    dhcp = LazyEndpoint(".dhcp", "Dhcp")
+    dhcp6 = LazyEndpoint(".dhcp6", "Dhcp6")
+    disconnect_admins = LazyEndpoint(".disconnect_admins", "DisconnectAdmins")
+    external_resource = LazyEndpoint(".external_resource", "ExternalResource")
+    firmware = LazyEndpoint(".firmware", "Firmware")
+    fortiguard = LazyEndpoint(".fortiguard", "Fortiguard")
+    fortimanager = LazyEndpoint(".fortimanager", "Fortimanager")
+    fsck = LazyEndpoint(".fsck", "Fsck")
+    ha_peer = LazyEndpoint(".ha_peer", "HaPeer")
+    hscalefw_license = LazyEndpoint(".hscalefw_license", "HscalefwLicense")
+    interface = LazyEndpoint(".interface", "Interface")
+    ipam = LazyEndpoint(".ipam", "Ipam")
+    logdisk = LazyEndpoint(".logdisk", "Logdisk")
+    lte_modem = LazyEndpoint(".lte_modem", "LteModem")
+    modem = LazyEndpoint(".modem", "Modem")
+    modem5g = LazyEndpoint(".modem5g", "Modem5g")
+    ntp = LazyEndpoint(".ntp", "Ntp")
+    object = LazyEndpoint(".object", "Object")
+    os = LazyEndpoint(".os", "Os")
+    password_policy_conform = LazyEndpoint(".password_policy_conform", "PasswordPolicyConform")
+    performance = LazyEndpoint(".performance", "Performance")
+    private_data_encryption = LazyEndpoint(".private_data_encryption", "PrivateDataEncryption")
+    process = LazyEndpoint(".process", "Process")
+    resource = LazyEndpoint(".resource", "Resource")
+    sandbox = LazyEndpoint(".sandbox", "Sandbox")
+    sdn_connector = LazyEndpoint(".sdn_connector", "SdnConnector")
+    time = LazyEndpoint(".time", "Time")
+    traffic_history = LazyEndpoint(".traffic_history", "TrafficHistory")
+    upgrade_report = LazyEndpoint(".upgrade_report", "UpgradeReport")
+    usb_device = LazyEndpoint(".usb_device", "UsbDevice")
+    usb_log = LazyEndpoint(".usb_log", "UsbLog")
+    vmlicense = LazyEndpoint(".vmlicense", "Vmlicense")
+    acme_certificate_status = LazyEndpoint(".acme_certificate_status", "AcmeCertificateStatus")
+    acquired_dns = LazyEndpoint(".acquired_dns", "AcquiredDns")
+    available_certificates = LazyEndpoint(".available_certificates", "AvailableCertificates")
+    check_port_availability = LazyEndpoint(".check_port_availability", "CheckPortAvailability")
+    current_admins = LazyEndpoint(".current_admins", "CurrentAdmins")
+    global_resources = LazyEndpoint(".global_resources", "GlobalResources")
+    global_search = LazyEndpoint(".global_search", "GlobalSearch")
+    ha_backup_hb_used = LazyEndpoint(".ha_backup_hb_used", "HaBackupHbUsed")
+    ha_checksums = LazyEndpoint(".ha_checksums", "HaChecksums")
+    ha_history = LazyEndpoint(".ha_history", "HaHistory")
+    ha_hw_interface = LazyEndpoint(".ha_hw_interface", "HaHwInterface")
+    ha_nonsync_checksums = LazyEndpoint(".ha_nonsync_checksums", "HaNonsyncChecksums")
+    ha_statistics = LazyEndpoint(".ha_statistics", "HaStatistics")
+    ha_table_checksums = LazyEndpoint(".ha_table_checksums", "HaTableChecksums")
+    interface_connected_admins_info = LazyEndpoint(".interface_connected_admins_info", "InterfaceConnectedAdminsInfo")
+    ipconf = LazyEndpoint(".ipconf", "Ipconf")
+    link_monitor = LazyEndpoint(".link_monitor", "LinkMonitor")
+    modem3g = LazyEndpoint(".modem3g", "Modem3g")
+    monitor_sensor = LazyEndpoint(".monitor_sensor", "MonitorSensor")
+    resolve_fqdn = LazyEndpoint(".resolve_fqdn", "ResolveFqdn")
+    running_processes = LazyEndpoint(".running_processes", "RunningProcesses")
+    sensor_info = LazyEndpoint(".sensor_info", "SensorInfo")
+    status = LazyEndpoint(".status", "Status")
+    storage = LazyEndpoint(".storage", "Storage")
+    timezone = LazyEndpoint(".timezone", "Timezone")
+    trusted_cert_authorities = LazyEndpoint(".trusted_cert_authorities", "TrustedCertAuthorities")
+    vdom_link = LazyEndpoint(".vdom_link", "VdomLink")
+    vdom_resource = LazyEndpoint(".vdom_resource", "VdomResource")
+    vm_information = LazyEndpoint(".vm_information", "VmInformation")
+
     def __init__(self, client):
         """System endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.admin = admin.Admin(client)
-        self.api_user = api_user.ApiUser(client)
-        self.automation_action = automation_action.AutomationAction(client)
-        self.automation_stitch = automation_stitch.AutomationStitch(client)
-        self.available_interfaces = available_interfaces.AvailableInterfaces(client)
-        self.botnet = botnet.Botnet(client)
-        self.botnet_domains = botnet_domains.BotnetDomains(client)
-        self.central_management = central_management.CentralManagement(client)
-        self.certificate = certificate.Certificate(client)
-        self.change_password = change_password.ChangePassword(client)
-        self.cluster = cluster.Cluster(client)
-        self.com_log = com_log.ComLog(client)
-        self.config = config.Config(client)
-        self.config_error_log = config_error_log.ConfigErrorLog(client)
-        self.config_revision = config_revision.ConfigRevision(client)
-        self.config_script = config_script.ConfigScript(client)
-        self.config_sync = config_sync.ConfigSync(client)
-        self.crash_log = crash_log.CrashLog(client)
-        self.csf = csf.Csf(client)
-        self.debug = debug.Debug(client)
-        self.dhcp = dhcp.Dhcp(client)
-        self.dhcp6 = dhcp6.Dhcp6(client)
-        self.disconnect_admins = disconnect_admins.DisconnectAdmins(client)
-        self.external_resource = external_resource.ExternalResource(client)
-        self.firmware = firmware.Firmware(client)
-        self.fortiguard = fortiguard.Fortiguard(client)
-        self.fortimanager = fortimanager.Fortimanager(client)
-        self.fsck = fsck.Fsck(client)
-        self.ha_peer = ha_peer.HaPeer(client)
-        self.hscalefw_license = hscalefw_license.HscalefwLicense(client)
-        self.interface = interface.Interface(client)
-        self.ipam = ipam.Ipam(client)
-        self.logdisk = logdisk.Logdisk(client)
-        self.lte_modem = lte_modem.LteModem(client)
-        self.modem = modem.Modem(client)
-        self.modem5g = modem5g.Modem5g(client)
-        self.ntp = ntp.Ntp(client)
-        self.object = object.Object(client)
-        self.os = os.Os(client)
-        self.password_policy_conform = password_policy_conform.PasswordPolicyConform(client)
-        self.performance = performance.Performance(client)
-        self.private_data_encryption = private_data_encryption.PrivateDataEncryption(client)
-        self.process = process.Process(client)
-        self.resource = resource.Resource(client)
-        self.sandbox = sandbox.Sandbox(client)
-        self.sdn_connector = sdn_connector.SdnConnector(client)
-        self.time = time.Time(client)
-        self.traffic_history = traffic_history.TrafficHistory(client)
-        self.upgrade_report = upgrade_report.UpgradeReport(client)
-        self.usb_device = usb_device.UsbDevice(client)
-        self.usb_log = usb_log.UsbLog(client)
-        self.vmlicense = vmlicense.Vmlicense(client)
-        self.acme_certificate_status = AcmeCertificateStatus(client)
-        self.acquired_dns = AcquiredDns(client)
-        self.available_certificates = AvailableCertificates(client)
-        self.check_port_availability = CheckPortAvailability(client)
-        self.current_admins = CurrentAdmins(client)
-        self.global_resources = GlobalResources(client)
-        self.global_search = GlobalSearch(client)
-        self.ha_backup_hb_used = HaBackupHbUsed(client)
-        self.ha_checksums = HaChecksums(client)
-        self.ha_history = HaHistory(client)
-        self.ha_hw_interface = HaHwInterface(client)
-        self.ha_nonsync_checksums = HaNonsyncChecksums(client)
-        self.ha_statistics = HaStatistics(client)
-        self.ha_table_checksums = HaTableChecksums(client)
-        self.interface_connected_admins_info = InterfaceConnectedAdminsInfo(client)
-        self.ipconf = Ipconf(client)
-        self.link_monitor = LinkMonitor(client)
-        self.modem3g = Modem3g(client)
-        self.monitor_sensor = MonitorSensor(client)
-        self.resolve_fqdn = ResolveFqdn(client)
-        self.running_processes = RunningProcesses(client)
-        self.sensor_info = SensorInfo(client)
-        self.status = Status(client)
-        self.storage = Storage(client)
-        self.timezone = Timezone(client)
-        self.trusted_cert_authorities = TrustedCertAuthorities(client)
-        self.vdom_link = VdomLink(client)
-        self.vdom_resource = VdomResource(client)
-        self.vm_information = VmInformation(client)
+        self._client = client
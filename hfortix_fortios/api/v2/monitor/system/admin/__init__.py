@@ -1,20 +1,28 @@
 """FortiOS CMDB - Admin category"""
 
-from .change_vdom_mode import ChangeVdomMode
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Admin",
     "ChangeVdomMode",
 ]
 
+_LAZY_IMPORTS = {
+    "ChangeVdomMode": (".change_vdom_mode", "ChangeVdomMode"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Admin:
     """Admin endpoints wrapper for CMDB API."""
 
+    change_vdom_mode = LazyEndpoint(".change_vdom_mode", "ChangeVdomMode")
+
     def __init__(self, client):
         """Admin endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.change_vdom_mode = ChangeVdomMode(client)
+        self._client = client
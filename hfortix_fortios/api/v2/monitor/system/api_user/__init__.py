@@ -1,20 +1,28 @@
 """FortiOS CMDB - ApiUser category"""
 
-from .generate_key import GenerateKey
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ApiUser",
     "GenerateKey",
 ]
 
+_LAZY_IMPORTS = {
+    "GenerateKey": (".generate_key", "GenerateKey"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ApiUser:
     """ApiUser endpoints wrapper for CMDB API."""
 
+    generate_key = LazyEndpoint(".generate_key", "GenerateKey")
+
     def __init__(self, client):
         """ApiUser endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.generate_key = GenerateKey(client)
+        self._client = client
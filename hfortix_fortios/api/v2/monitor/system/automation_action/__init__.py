@@ -1,20 +1,28 @@
 """FortiOS CMDB - AutomationAction category"""
 
-from .stats import Stats
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AutomationAction",
     "Stats",
 ]
 
+_LAZY_IMPORTS = {
+    "Stats": (".stats", "Stats"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class AutomationAction:
     """AutomationAction endpoints wrapper for CMDB API."""
 
+    stats = LazyEndpoint(".stats", "Stats")
+
     def __init__(self, client):
         """AutomationAction endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.stats = Stats(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - AutomationStitch category"""
 
-from .stats import Stats
-from .test import Test
-from .webhook import Webhook
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AutomationStitch",
@@ -11,16 +9,26 @@ __all__ = [
     "Webhook",
 ]
 
+_LAZY_IMPORTS = {
+    "Stats": (".stats", "Stats"),
+    "Test": (".test", "Test"),
+    "Webhook": (".webhook", "Webhook"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class AutomationStitch:
     """AutomationStitch endpoints wrapper for CMDB API."""
 
+    stats = LazyEndpoint(".stats", "Stats")
+    test = LazyEndpoint(".test", "Test")
+    webhook = LazyEndpoint(".webhook", "Webhook")
+
     def __init__(self, client):
         """AutomationStitch endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.stats = Stats(client)
-        self.test = Test(client)
-        self.webhook = Webhook(client)
+        self._client = client
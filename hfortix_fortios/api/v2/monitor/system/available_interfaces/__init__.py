@@ -1,17 +1,25 @@
 """FortiOS CMDB - AvailableInterfaces category"""
 
 from ..available_interfaces_base import AvailableInterfaces as AvailableInterfacesBase
-from .meta import Meta
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AvailableInterfaces",
     "Meta",
 ]
 
+_LAZY_IMPORTS = {
+    "Meta": (".meta", "Meta"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class AvailableInterfaces(AvailableInterfacesBase):
     """AvailableInterfaces endpoints wrapper for CMDB API."""
 
+    meta = LazyEndpoint(".meta", "Meta")
+
     def __init__(self, client):
         """AvailableInterfaces endpoints.
         
@@ -19,4 +27,4 @@ class AvailableInterfaces(AvailableInterfacesBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.meta = Meta(client)
+        self._client = client
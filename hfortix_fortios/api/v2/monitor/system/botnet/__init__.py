@@ -1,17 +1,25 @@
 """FortiOS CMDB - Botnet category"""
 
 from ..botnet_base import Botnet as BotnetBase
-from .stat import Stat
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Botnet",
     "Stat",
 ]
 
+_LAZY_IMPORTS = {
+    "Stat": (".stat", "Stat"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Botnet(BotnetBase):
     """Botnet endpoints wrapper for CMDB API."""
 
+    stat = LazyEndpoint(".stat", "Stat")
+
     def __init__(self, client):
         """Botnet endpoints.
         
@@ -19,4 +27,4 @@ class Botnet(BotnetBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.stat = Stat(client)
+        self._client = client
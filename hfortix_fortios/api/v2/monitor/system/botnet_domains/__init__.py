@@ -1,8 +1,7 @@
 """FortiOS CMDB - BotnetDomains category"""
 
 from ..botnet_domains_base import BotnetDomains as BotnetDomainsBase
-from .hits import Hits
-from .stat import Stat
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "BotnetDomains",
@@ -10,10 +9,20 @@ __all__ = [
     "Stat",
 ]
 
+_LAZY_IMPORTS = {
+    "Hits": (".hits", "Hits"),
+    "Stat": (".stat", "Stat"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class BotnetDomains(BotnetDomainsBase):
     """BotnetDomains endpoints wrapper for CMDB API."""
 
+    hits = LazyEndpoint(".hits", "Hits")
+    stat = LazyEndpoint(".stat", "Stat")
+
     def __init__(self, client):
         """BotnetDomains endpoints.
         
@@ -21,5 +30,4 @@ class BotnetDomains(BotnetDomainsBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.hits = Hits(client)
-        self.stat = Stat(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - CentralManagement category"""
 
-from .status import Status
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "CentralManagement",
     "Status",
 ]
 
+_LAZY_IMPORTS = {
+    "Status": (".status", "Status"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class CentralManagement:
     """CentralManagement endpoints wrapper for CMDB API."""
 
+    status = LazyEndpoint(".status", "Status")
+
     def __init__(self, client):
         """CentralManagement endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.status = Status(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - Certificate category"""
 
-from .download import Download
-from .read_info import ReadInfo
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Certificate",
@@ -9,15 +8,24 @@ __all__ = [
     "ReadInfo",
 ]
 
+_LAZY_IMPORTS = {
+    "Download": (".download", "Download"),
+    "ReadInfo": (".read_info", "ReadInfo"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Certificate:
     """Certificate endpoints wrapper for CMDB API."""
 
+    download = LazyEndpoint(".download", "Download")
+    read_info = LazyEndpoint(".read_info", "ReadInfo")
+
     def __init__(self, client):
         """Certificate endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.download = Download(client)
-        self.read_info = ReadInfo(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Cluster category"""
 
-from .state import State
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Cluster",
     "State",
 ]
 
+_LAZY_IMPORTS = {
+    "State": (".state", "State"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Cluster:
     """Cluster endpoints wrapper for CMDB API."""
 
+    state = LazyEndpoint(".state", "State")
+
     def __init__(self, client):
         """Cluster endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.state = State(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - ComLog category"""
 
-from .download import Download
-from .dump import Dump
-from .update import Update
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ComLog",
@@ -11,16 +9,26 @@ __all__ = [
     "Update",
 ]
 
+_LAZY_IMPORTS = {
+    "Download": (".download", "Download"),
+    "Dump": (".dump", "Dump"),
+    "Update": (".update", "Update"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ComLog:
     """ComLog endpoints wrapper for CMDB API."""
 
+    download = LazyEndpoint(".download", "Download")
+    dump = LazyEndpoint(".dump", "Dump")
+    update = LazyEndpoint(".update", "Update")
+
     def __init__(self, client):
         """ComLog endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.download = Download(client)
-        self.dump = Dump(client)
-        self.update = Update(client)
+        self._client = client
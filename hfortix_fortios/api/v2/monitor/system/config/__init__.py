@@ -1,9 +1,6 @@
 """FortiOS CMDB - Config category"""
 
-from .backup import Backup
-from .restore import Restore
-from .restore_status import RestoreStatus
-from .usb_filelist import UsbFilelist
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Backup",
@@ -13,17 +10,28 @@ __all__ = [
     "UsbFilelist",
 ]
 
+_LAZY_IMPORTS = {
+    "Backup": (".backup", "Backup"),
+    "Restore": (".restore", "Restore"),
+    "RestoreStatus": (".restore_status", "RestoreStatus"),
+    "UsbFilelist": (".usb_filelist", "UsbFilelist"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Config:
     """Config endpoints wrapper for CMDB API."""
 
+    backup = LazyEndpoint(".backup", "Backup")
+    restore = LazyEndpoint(".restore", "Restore")
+    restore_status = LazyEndpoint(".restore_status", "RestoreStatus")
+    usb_filelist = LazyEndpoint(".usb_filelist", "UsbFilelist")
+
     def __init__(self, client):
         """Config endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.backup = Backup(client)
-        self.restore = Restore(client)
-        self.restore_status = RestoreStatus(client)
-        self.usb_filelist = UsbFilelist(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - ConfigErrorLog category"""
 
-from .download import Download
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ConfigErrorLog",
     "Download",
 ]
 
+_LAZY_IMPORTS = {
+    "Download": (".download", "Download"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ConfigErrorLog:
     """ConfigErrorLog endpoints wrapper for CMDB API."""
 
+    download = LazyEndpoint(".download", "Download")
+
     def __init__(self, client):
         """ConfigErrorLog endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.download = Download(client)
+        self._client = client
@@ -1,11 +1,7 @@
 """FortiOS CMDB - ConfigRevision category"""
 
 from ..config_revision_base import ConfigRevision as ConfigRevisionBase
-from .delete import Delete
-from .file import File
-from .info import Info
-from .save import Save
-from .update_comments import UpdateComments
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ConfigRevision",
@@ -16,10 +12,26 @@ __all__ = [
     "UpdateComments",
 ]
 
+_LAZY_IMPORTS = {
+    "Delete": (".delete", "Delete"),
+    "File": (".file", "File"),
+    "Info": (".info", "Info"),
+    "Save": (".save", "Save"),
+    "UpdateComments": (".update_comments", "UpdateComments"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ConfigRevision(ConfigRevisionBase):
     """ConfigRevision endpoints wrapper for CMDB API."""
 
+    delete = LazyEndpoint(".delete", "Delete")
+    file = LazyEndpoint(".file", "File")
+    info = LazyEndpoint(".info", "Info")
+    save = LazyEndpoint(".save", "Save")
+    update_comments = LazyEndpoint(".update_comments", "UpdateComments")
+
     def __init__(self, client):
         """ConfigRevision endpoints.
         
@@ -27,8 +39,4 @@ class ConfigRevision(ConfigRevisionBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.delete = Delete(client)
-        self.file = File(client)
-        self.info = Info(client)
-        self.save = Save(client)
-        self.update_comments = UpdateComments(client)
+        self._client = client
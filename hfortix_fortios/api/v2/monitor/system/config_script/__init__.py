@@ -1,9 +1,7 @@
 """FortiOS CMDB - ConfigScript category"""
 
 from ..config_script_base import ConfigScript as ConfigScriptBase
-from .delete import Delete
-from .run import Run
-from .upload import Upload
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ConfigScript",
@@ -12,10 +10,22 @@ __all__ = [
     "Upload",
 ]
 
+_LAZY_IMPORTS = {
+    "Delete": (".delete", "Delete"),
+    "Run": (".run", "Run"),
+    "Upload": (".upload", "Upload"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ConfigScript(ConfigScriptBase):
     """ConfigScript endpoints wrapper for CMDB API."""
 
+    delete = LazyEndpoint(".delete", "Delete")
+    run = LazyEndpoint(".run", "Run")
+    upload = LazyEndpoint(".upload", "Upload")
+
     def __init__(self, client):
         """ConfigScript endpoints.
         
@@ -23,6 +33,4 @@ class ConfigScript(ConfigScriptBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.delete = Delete(client)
-        self.run = Run(client)
-        self.upload = Upload(client)
+        self._client = client
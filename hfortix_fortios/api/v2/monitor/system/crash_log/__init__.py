@@ -1,7 +1,6 @@
 """FortiOS CMDB - CrashLog category"""
 
-from .clear import Clear
-from .download import Download
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Clear",
@@ -9,15 +8,24 @@ __all__ = [
     "Download",
 ]
 
+_LAZY_IMPORTS = {
+    "Clear": (".clear", "Clear"),
+    "Download": (".download", "Download"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class CrashLog:
     """CrashLog endpoints wrapper for CMDB API."""
 
+    clear = LazyEndpoint(".clear", "Clear")
+    download = LazyEndpoint(".download", "Download")
+
     def __init__(self, client):
         """CrashLog endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.clear = Clear(client)
-        self.download = Download(client)
+        self._client = client
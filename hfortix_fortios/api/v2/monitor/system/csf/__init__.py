@@ -1,8 +1,7 @@
 """FortiOS CMDB - Csf category"""
 
 from ..csf_base import Csf as CsfBase
-from .pending_authorizations import PendingAuthorizations
-from .register_appliance import RegisterAppliance
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Csf",
@@ -10,10 +9,20 @@ __all__ = [
     "RegisterAppliance",
 ]
 
+_LAZY_IMPORTS = {
+    "PendingAuthorizations": (".pending_authorizations", "PendingAuthorizations"),
+    "RegisterAppliance": (".register_appliance", "RegisterAppliance"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Csf(CsfBase):
     """Csf endpoints wrapper for CMDB API."""
 
+    pending_authorizations = LazyEndpoint(".pending_authorizations", "PendingAuthorizations")
+    register_appliance = LazyEndpoint(".register_appliance", "RegisterAppliance")
+
     def __init__(self, client):
         """Csf endpoints.
         
@@ -21,5 +30,4 @@ class Csf(CsfBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.pending_authorizations = PendingAuthorizations(client)
-        self.register_appliance = RegisterAppliance(client)
+        self._client = client
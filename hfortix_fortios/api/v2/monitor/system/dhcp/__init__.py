@@ -1,17 +1,25 @@
 """FortiOS CMDB - Dhcp category"""
 
 from ..dhcp_base import Dhcp as DhcpBase
-from .revoke import Revoke
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Dhcp",
     "Revoke",
 ]
 
+_LAZY_IMPORTS = {
+    "Revoke": (".revoke", "Revoke"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Dhcp(DhcpBase):
     """Dhcp endpoints wrapper for CMDB API."""
 
+    revoke = LazyEndpoint(".revoke", "Revoke")
+
     def __init__(self, client):
         """Dhcp endpoints.
         
@@ -19,4 +27,4 @@ class Dhcp(DhcpBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.revoke = Revoke(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Dhcp6 category"""
 
-from .revoke import Revoke
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Dhcp6",
     "Revoke",
 ]
 
+_LAZY_IMPORTS = {
+    "Revoke": (".revoke", "Revoke"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Dhcp6:
     """Dhcp6 endpoints wrapper for CMDB API."""
 
+    revoke = LazyEndpoint(".revoke", "Revoke")
+
     def __init__(self, client):
         """Dhcp6 endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.revoke = Revoke(client)
+        self._client = client
@@ -1,10 +1,6 @@
 """FortiOS CMDB - ExternalResource category"""
 
-from .dynamic import Dynamic
-from .entry_list import EntryList
-from .generic_address import GenericAddress
-from .refresh import Refresh
-from .validate_jsonpath import ValidateJsonpath
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Dynamic",
@@ -15,18 +11,30 @@ __all__ = [
     "ValidateJsonpath",
 ]
 
+_LAZY_IMPORTS = {
+    "Dynamic": (".dynamic", "Dynamic"),
+    "EntryList": (".entry_list", "EntryList"),
+    "GenericAddress": (".generic_address", "GenericAddress"),
+    "Refresh": (".refresh", "Refresh"),
+    "ValidateJsonpath": (".validate_jsonpath", "ValidateJsonpath"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ExternalResource:
     """ExternalResource endpoints wrapper for CMDB API."""
 
+    dynamic = LazyEndpoint(".dynamic", "Dynamic")
+    entry_list = LazyEndpoint(".entry_list", "EntryList")
+    generic_address = LazyEndpoint(".generic_address", "GenericAddress")
+    refresh = LazyEndpoint(".refresh", "Refresh")
+    validate_jsonpath = LazyEndpoint(".validate_jsonpath", "ValidateJsonpath")
+
     def __init__(self, client):
         """ExternalResource endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.dynamic = Dynamic(client)
-        self.entry_list = EntryList(client)
-        self.generic_address = GenericAddress(client)
-        self.refresh = Refresh(client)
-        self.validate_jsonpath = ValidateJsonpath(client)
+        self._client = client
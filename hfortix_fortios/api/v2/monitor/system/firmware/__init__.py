@@ -1,8 +1,7 @@
 """FortiOS CMDB - Firmware category"""
 
 from ..firmware_base import Firmware as FirmwareBase
-from .upgrade import Upgrade
-from .upgrade_paths import UpgradePaths
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Firmware",
@@ -10,10 +9,20 @@ __all__ = [
     "UpgradePaths",
 ]
 
+_LAZY_IMPORTS = {
+    "Upgrade": (".upgrade", "Upgrade"),
+    "UpgradePaths": (".upgrade_paths", "UpgradePaths"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Firmware(FirmwareBase):
     """Firmware endpoints wrapper for CMDB API."""
 
+    upgrade = LazyEndpoint(".upgrade", "Upgrade")
+    upgrade_paths = LazyEndpoint(".upgrade_paths", "UpgradePaths")
+
     def __init__(self, client):
         """Firmware endpoints.
         
@@ -21,5 +30,4 @@ class Firmware(FirmwareBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.upgrade = Upgrade(client)
-        self.upgrade_paths = UpgradePaths(client)
+        self._client = client
@@ -1,10 +1,6 @@
 """FortiOS CMDB - Fortiguard category"""
 
-from .clear_statistics import ClearStatistics
-from .manual_update import ManualUpdate
-from .server_info import ServerInfo
-from .test_availability import TestAvailability
-from .update import Update
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ClearStatistics",
@@ -15,18 +11,30 @@ __all__ = [
     "Update",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearStatistics": (".clear_statistics", "ClearStatistics"),
+    "ManualUpdate": (".manual_update", "ManualUpdate"),
+    "ServerInfo": (".server_info", "ServerInfo"),
+    "TestAvailability": (".test_availability", "TestAvailability"),
+    "Update": (".update", "Update"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Fortiguard:
     """Fortiguard endpoints wrapper for CMDB API."""
 
+    clear_statistics = LazyEndpoint(".clear_statistics", "ClearStatistics")
+    manual_update = LazyEndpoint(".manual_update", "ManualUpdate")
+    server_info = LazyEndpoint(".server_info", "ServerInfo")
+    test_availability = LazyEndpoint(".test_availability", "TestAvailability")
+    update = LazyEndpoint(".update", "Update")
+
     def __init__(self, client):
         """Fortiguard endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.clear_statistics = ClearStatistics(client)
-        self.manual_update = ManualUpdate(client)
-        self.server_info = ServerInfo(client)
-        self.test_availability = TestAvailability(client)
-        self.update = Update(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Fortimanager category"""
 
-from .backup_action import BackupAction
-from .backup_details import BackupDetails
-from .backup_summary import BackupSummary
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "BackupAction",
@@ -11,16 +9,26 @@ __all__ = [
     "Fortimanager",
 ]
 
+_LAZY_IMPORTS = {
+    "BackupAction": (".backup_action", "BackupAction"),
+    "BackupDetails": (".backup_details", "BackupDetails"),
+    "BackupSummary": (".backup_summary", "BackupSummary"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Fortimanager:
     """Fortimanager endpoints wrapper for CMDB API."""
 
+    backup_action = LazyEndpoint(".backup_action", "BackupAction")
+    backup_details = LazyEndpoint(".backup_details", "BackupDetails")
+    backup_summary = LazyEndpoint(".backup_summary", "BackupSummary")
+
     def __init__(self, client):
         """Fortimanager endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.backup_action = BackupAction(client)
-        self.backup_details = BackupDetails(client)
-        self.backup_summary = BackupSummary(client)
+        self._client = client
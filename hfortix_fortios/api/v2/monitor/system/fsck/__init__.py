@@ -1,20 +1,28 @@
 """FortiOS CMDB - Fsck category"""
 
-from .start import Start
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Fsck",
     "Start",
 ]
 
+_LAZY_IMPORTS = {
+    "Start": (".start", "Start"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Fsck:
     """Fsck endpoints wrapper for CMDB API."""
 
+    start = LazyEndpoint(".start", "Start")
+
     def __init__(self, client):
         """Fsck endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.start = Start(client)
+        self._client = client
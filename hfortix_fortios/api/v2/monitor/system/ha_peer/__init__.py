@@ -1,8 +1,7 @@
 """FortiOS CMDB - HaPeer category"""
 
 from ..ha_peer_base import HaPeer as HaPeerBase
-from .disconnect import Disconnect
-from .update import Update
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Disconnect",
@@ -10,10 +9,20 @@ __all__ = [
     "Update",
 ]
 
+_LAZY_IMPORTS = {
+    "Disconnect": (".disconnect", "Disconnect"),
+    "Update": (".update", "Update"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class HaPeer(HaPeerBase):
     """HaPeer endpoints wrapper for CMDB API."""
 
+    disconnect = LazyEndpoint(".disconnect", "Disconnect")
+    update = LazyEndpoint(".update", "Update")
+
     def __init__(self, client):
         """HaPeer endpoints.
         
@@ -21,5 +30,4 @@ class HaPeer(HaPeerBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.disconnect = Disconnect(client)
-        self.update = Update(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - HscalefwLicense category"""
 
-from .upload import Upload
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "HscalefwLicense",
     "Upload",
 ]
 
+_LAZY_IMPORTS = {
+    "Upload": (".upload", "Upload"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class HscalefwLicense:
     """HscalefwLicense endpoints wrapper for CMDB API."""
 
+    upload = LazyEndpoint(".upload", "Upload")
+
     def __init__(self, client):
         """HscalefwLicense endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.upload = Upload(client)
+        self._client = client
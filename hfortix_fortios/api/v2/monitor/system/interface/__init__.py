@@ -1,15 +1,7 @@
 """FortiOS CMDB - Interface category"""
 
 from ..interface_base import Interface as InterfaceBase
-from .dhcp_renew import DhcpRenew
-from .dhcp_status import DhcpStatus
-from .kernel_interfaces import KernelInterfaces
-from .poe import Poe
-from .poe_usage import PoeUsage
-from .speed_test_status import SpeedTestStatus
-from .speed_test_trigger import SpeedTestTrigger
-from .transceivers import Transceivers
-from .wake_on_lan import WakeOnLan
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "DhcpRenew",
@@ -24,10 +16,34 @@ __all__ = [
     "WakeOnLan",
 ]
 
+_LAZY_IMPORTS = {
+    "DhcpRenew": (".dhcp_renew", "DhcpRenew"),
+    "DhcpStatus": (".dhcp_status", "DhcpStatus"),
+    "KernelInterfaces": (".kernel_interfaces", "KernelInterfaces"),
+    "Poe": (".poe", "Poe"),
+    "PoeUsage": (".poe_usage", "PoeUsage"),
+    "SpeedTestStatus": (".speed_test_status", "SpeedTestStatus"),
+    "SpeedTestTrigger": (".speed_test_trigger", "SpeedTestTrigger"),
+    "Transceivers": (".transceivers", "Transceivers"),
+    "WakeOnLan": (".wake_on_lan", "WakeOnLan"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Interface(InterfaceBase):
     """Interface endpoints wrapper for CMDB API."""
 
+    dhcp_renew = LazyEndpoint(".dhcp_renew", "DhcpRenew")
+    dhcp_status = LazyEndpoint(".dhcp_status", "DhcpStatus")
+    kernel_interfaces = LazyEndpoint(".kernel_interfaces", "KernelInterfaces")
+    poe = LazyEndpoint(".poe", "Poe")
+    poe_usage = LazyEndpoint(".poe_usage", "PoeUsage")
+    speed_test_status = LazyEndpoint(".speed_test_status", "SpeedTestStatus")
+    speed_test_trigger = LazyEndpoint(".speed_test_trigger", "SpeedTestTrigger")
+    transceivers = LazyEndpoint(".transceivers", "Transceivers")
+    wake_on_lan = LazyEndpoint(".wake_on_lan", "WakeOnLan")
+
     def __init__(self, client):
         """Interface endpoints.
         
@@ -35,12 +51,4 @@ class Interface(InterfaceBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.dhcp_renew = DhcpRenew(client)
-        self.dhcp_status = DhcpStatus(client)
-        self.kernel_interfaces = KernelInterfaces(client)
-        self.poe = Poe(client)
-        self.poe_usage = PoeUsage(client)
-        self.speed_test_status = SpeedTestStatus(client)
-        self.speed_test_trigger = SpeedTestTrigger(client)
-        self.transceivers = Transceivers(client)
-        self.wake_on_lan = WakeOnLan(client)
+        self._client = client
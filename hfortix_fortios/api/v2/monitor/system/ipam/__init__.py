@@ -1,8 +1,6 @@
 """FortiOS CMDB - Ipam category"""
 
-from .list import List
-from .status import Status
-from .utilization import Utilization
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Ipam",
@@ -11,16 +9,26 @@ __all__ = [
     "Utilization",
 ]
 
+_LAZY_IMPORTS = {
+    "List": (".list", "List"),
+    "Status": (".status", "Status"),
+    "Utilization": (".utilization", "Utilization"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ipam:
     """Ipam endpoints wrapper for CMDB API."""
 
+    list = LazyEndpoint(".list", "List")
+    status = LazyEndpoint(".status", "Status")
+    utilization = LazyEndpoint(".utilization", "Utilization")
+
     def __init__(self, client):
         """Ipam endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.list = List(client)
-        self.status = Status(client)
-        self.utilization = Utilization(client)
+        self._client = client
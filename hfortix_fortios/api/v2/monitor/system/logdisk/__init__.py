@@ -1,20 +1,28 @@
 """FortiOS CMDB - Logdisk category"""
 
-from .format import Format
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Format",
     "Logdisk",
 ]
 
+_LAZY_IMPORTS = {
+    "Format": (".format", "Format"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Logdisk:
     """Logdisk endpoints wrapper for CMDB API."""
 
+    format = LazyEndpoint(".format", "Format")
+
     def __init__(self, client):
         """Logdisk endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.format = Format(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - LteModem category"""
 
-from .status import Status
-from .upgrade import Upgrade
-from .upload import Upload
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "LteModem",
@@ -11,16 +9,26 @@ __all__ = [
     "Upload",
 ]
 
+_LAZY_IMPORTS = {
+    "Status": (".status", "Status"),
+    "Upgrade": (".upgrade", "Upgrade"),
+    "Upload": (".upload", "Upload"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class LteModem:
     """LteModem endpoints wrapper for CMDB API."""
 
+    status = LazyEndpoint(".status", "Status")
+    upgrade = LazyEndpoint(".upgrade", "Upgrade")
+    upload = LazyEndpoint(".upload", "Upload")
+
     def __init__(self, client):
         """LteModem endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.status = Status(client)
-        self.upgrade = Upgrade(client)
-        self.upload = Upload(client)
+        self._client = client
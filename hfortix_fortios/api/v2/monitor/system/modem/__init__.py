@@ -1,10 +1,7 @@
 """FortiOS CMDB - Modem category"""
 
 from ..modem_base import Modem as ModemBase
-from .connect import Connect
-from .disconnect import Disconnect
-from .reset import Reset
-from .update import Update
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Connect",
@@ -14,10 +11,24 @@ __all__ = [
     "Update",
 ]
 
+_LAZY_IMPORTS = {
+    "Connect": (".connect", "Connect"),
+    "Disconnect": (".disconnect", "Disconnect"),
+    "Reset": (".reset", "Reset"),
+    "Update": (".update", "Update"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Modem(ModemBase):
     """Modem endpoints wrapper for CMDB API."""
 
+    connect = LazyEndpoint(".connect", "Connect")
+    disconnect = LazyEndpoint(".disconnect", "Disconnect")
+    reset = LazyEndpoint(".reset", "Reset")
+    update = LazyEndpoint(".update", "Update")
+
     def __init__(self, client):
         """Modem endpoints.
         
@@ -25,7 +36,4 @@ class Modem(ModemBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.connect = Connect(client)
-        self.disconnect = Disconnect(client)
-        self.reset = Reset(client)
-        self.update = Update(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Modem5g category"""
 
-from .status import Status
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Modem5g",
     "Status",
 ]
 
+_LAZY_IMPORTS = {
+    "Status": (".status", "Status"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Modem5g:
     """Modem5g endpoints wrapper for CMDB API."""
 
+    status = LazyEndpoint(".status", "Status")
+
     def __init__(self, client):
         """Modem5g endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.status = Status(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Object category"""
 
-from .usage import Usage
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Object",
     "Usage",
 ]
 
+_LAZY_IMPORTS = {
+    "Usage": (".usage", "Usage"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Object:
     """Object endpoints wrapper for CMDB API."""
 
+    usage = LazyEndpoint(".usage", "Usage")
+
     def __init__(self, client):
         """Object endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.usage = Usage(client)
+        self._client = client
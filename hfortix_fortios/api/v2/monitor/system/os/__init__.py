@@ -1,7 +1,6 @@
 """FortiOS CMDB - Os category"""
 
-from .reboot import Reboot
-from .shutdown import Shutdown
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Os",
@@ -9,15 +8,24 @@ __all__ = [
     "Shutdown",
 ]
 
+_LAZY_IMPORTS = {
+    "Reboot": (".reboot", "Reboot"),
+    "Shutdown": (".shutdown", "Shutdown"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Os:
     """Os endpoints wrapper for CMDB API."""
 
+    reboot = LazyEndpoint(".reboot", "Reboot")
+    shutdown = LazyEndpoint(".shutdown", "Shutdown")
+
     def __init__(self, client):
         """Os endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.reboot = Reboot(client)
-        self.shutdown = Shutdown(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - PrivateDataEncryption category"""
 
-from .set import Set
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "PrivateDataEncryption",
     "Set",
 ]
 
+_LAZY_IMPORTS = {
+    "Set": (".set", "Set"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class PrivateDataEncryption:
     """PrivateDataEncryption endpoints wrapper for CMDB API."""
 
+    set = LazyEndpoint(".set", "Set")
+
     def __init__(self, client):
         """PrivateDataEncryption endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.set = Set(client)
+        self._client = client
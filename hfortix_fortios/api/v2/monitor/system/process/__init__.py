@@ -1,20 +1,28 @@
 """FortiOS CMDB - Process category"""
 
-from .kill import Kill
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Kill",
     "Process",
 ]
 
+_LAZY_IMPORTS = {
+    "Kill": (".kill", "Kill"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Process:
     """Process endpoints wrapper for CMDB API."""
 
+    kill = LazyEndpoint(".kill", "Kill")
+
     def __init__(self, client):
         """Process endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.kill = Kill(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Resource category"""
 
-from .usage import Usage
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Resource",
     "Usage",
 ]
 
+_LAZY_IMPORTS = {
+    "Usage": (".usage", "Usage"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Resource:
     """Resource endpoints wrapper for CMDB API."""
 
+    usage = LazyEndpoint(".usage", "Usage")
+
     def __init__(self, client):
         """Resource endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.usage = Usage(client)
+        self._client = client
@@ -1,10 +1,6 @@
 """FortiOS CMDB - Sandbox category"""
 
-from .cloud_regions import CloudRegions
-from .connection import Connection
-from .detect import Detect
-from .stats import Stats
-from .status import Status
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "CloudRegions",
@@ -15,18 +11,30 @@ __all__ = [
     "Status",
 ]
 
+_LAZY_IMPORTS = {
+    "CloudRegions": (".cloud_regions", "CloudRegions"),
+    "Connection": (".connection", "Connection"),
+    "Detect": (".detect", "Detect"),
+    "Stats": (".stats", "Stats"),
+    "Status": (".status", "Status"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Sandbox:
     """Sandbox endpoints wrapper for CMDB API."""
 
+    cloud_regions = LazyEndpoint(".cloud_regions", "CloudRegions")
+    connection = LazyEndpoint(".connection", "Connection")
+    detect = LazyEndpoint(".detect", "Detect")
+    stats = LazyEndpoint(".stats", "Stats")
+    status = LazyEndpoint(".status", "Status")
+
     def __init__(self, client):
         """Sandbox endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.cloud_regions = CloudRegions(client)
-        self.connection = Connection(client)
-        self.detect = Detect(client)
-        self.stats = Stats(client)
-        self.status = Status(client)
+        self._client = client
@@ -1,9 +1,6 @@
 """FortiOS CMDB - SdnConnector category"""
 
-from .nsx_security_tags import NsxSecurityTags
-from .status import Status
-from .update import Update
-from .validate_gcp_key import ValidateGcpKey
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "NsxSecurityTags",
@@ -13,17 +10,28 @@ __all__ = [
     "ValidateGcpKey",
 ]
 
+_LAZY_IMPORTS = {
+    "NsxSecurityTags": (".nsx_security_tags", "NsxSecurityTags"),
+    "Status": (".status", "Status"),
+    "Update": (".update", "Update"),
+    "ValidateGcpKey": (".validate_gcp_key", "ValidateGcpKey"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class SdnConnector:
     """SdnConnector endpoints wrapper for CMDB API."""
 
+    nsx_security_tags = LazyEndpoint(".nsx_security_tags", "NsxSecurityTags")
+    status = LazyEndpoint(".status", "Status")
+    update = LazyEndpoint(".update", "Update")
+    validate_gcp_key = LazyEndpoint(".validate_gcp_key", "ValidateGcpKey")
+
     def __init__(self, client):
         """SdnConnector endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.nsx_security_tags = NsxSecurityTags(client)
-        self.status = Status(client)
-        self.update = Update(client)
-        self.validate_gcp_key = ValidateGcpKey(client)
+        self._client = client
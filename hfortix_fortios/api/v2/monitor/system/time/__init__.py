@@ -1,17 +1,25 @@
 """FortiOS CMDB - Time category"""
 
 from ..time_base import Time as TimeBase
-from .set import Set
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Set",
     "Time",
 ]
 
+_LAZY_IMPORTS = {
+    "Set": (".set", "Set"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Time(TimeBase):
     """Time endpoints wrapper for CMDB API."""
 
+    set = LazyEndpoint(".set", "Set")
+
     def __init__(self, client):
         """Time endpoints.
         
@@ -19,4 +27,4 @@ class Time(TimeBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.set = Set(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - TrafficHistory category"""
 
-from .enable_app_bandwidth_tracking import EnableAppBandwidthTracking
-from .interface import Interface
-from .top_applications import TopApplications
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "EnableAppBandwidthTracking",
@@ -11,16 +9,26 @@ __all__ = [
     "TrafficHistory",
 ]
 
+_LAZY_IMPORTS = {
+    "EnableAppBandwidthTracking": (".enable_app_bandwidth_tracking", "EnableAppBandwidthTracking"),
+    "Interface": (".interface", "Interface"),
+    "TopApplications": (".top_applications", "TopApplications"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class TrafficHistory:
     """TrafficHistory endpoints wrapper for CMDB API."""
 
+    enable_app_bandwidth_tracking = LazyEndpoint(".enable_app_bandwidth_tracking", "EnableAppBandwidthTracking")
+    interface = LazyEndpoint(".interface", "Interface")
+    top_applications = LazyEndpoint(".top_applications", "TopApplications")
+
     def __init__(self, client):
         """TrafficHistory endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.enable_app_bandwidth_tracking = EnableAppBandwidthTracking(client)
-        self.interface = Interface(client)
-        self.top_applications = TopApplications(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - UpgradeReport category"""
 
-from .current import Current
-from .exists import Exists
-from .saved import Saved
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Current",
@@ -11,16 +9,26 @@ __all__ = [
     "UpgradeReport",
 ]
 
+_LAZY_IMPORTS = {
+    "Current": (".current", "Current"),
+    "Exists": (".exists", "Exists"),
+    "Saved": (".saved", "Saved"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class UpgradeReport:
     """UpgradeReport endpoints wrapper for CMDB API."""
 
+    current = LazyEndpoint(".current", "Current")
+    exists = LazyEndpoint(".exists", "Exists")
+    saved = LazyEndpoint(".saved", "Saved")
+
     def __init__(self, client):
         """UpgradeReport endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.current = Current(client)
-        self.exists = Exists(client)
-        self.saved = Saved(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - UsbDevice category"""
 
-from .eject import Eject
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Eject",
     "UsbDevice",
 ]
 
+_LAZY_IMPORTS = {
+    "Eject": (".eject", "Eject"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class UsbDevice:
     """UsbDevice endpoints wrapper for CMDB API."""
 
+    eject = LazyEndpoint(".eject", "Eject")
+
     def __init__(self, client):
         """UsbDevice endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.eject = Eject(client)
+        self._client = client
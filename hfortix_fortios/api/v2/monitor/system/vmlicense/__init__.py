@@ -1,8 +1,6 @@
 """FortiOS CMDB - Vmlicense category"""
 
-from .download import Download
-from .download_eval import DownloadEval
-from .upload import Upload
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Download",
@@ -11,16 +9,26 @@ __all__ = [
     "Vmlicense",
 ]
 
+_LAZY_IMPORTS = {
+    "Download": (".download", "Download"),
+    "DownloadEval": (".download_eval", "DownloadEval"),
+    "Upload": (".upload", "Upload"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Vmlicense:
     """Vmlicense endpoints wrapper for CMDB API."""
 
+    download = LazyEndpoint(".download", "Download")
+    download_eval = LazyEndpoint(".download_eval", "DownloadEval")
+    upload = LazyEndpoint(".upload", "Upload")
+
     def __init__(self, client):
         """Vmlicense endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.download = Download(client)
-        self.download_eval = DownloadEval(client)
-        self.upload = Upload(client)
+        self._client = client
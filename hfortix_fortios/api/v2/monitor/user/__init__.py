@@ -1,21 +1,6 @@
 """FortiOS CMDB - User category"""
 
-from . import banned
-from . import device
-from . import firewall
-from . import fortitoken
-from . import fortitoken_cloud
-from . import fsso
-from . import guest
-from . import info
-from . import local
-from . import password_policy_conform
-from . import proxy
-from . import query
-from . import radius
-from . import scim
-from . import tacacs_plus
-from .collected_email import CollectedEmail
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Banned",
@@ -37,29 +22,52 @@ __all__ = [
     "User",
 ]
 
+_LAZY_IMPORTS = {
+    "banned": (".banned", None),
+    "device": (".device", None),
+    "firewall": (".firewall", None),
+    "fortitoken": (".fortitoken", None),
+    "fortitoken_cloud": (".fortitoken_cloud", None),
+    "fsso": (".fsso", None),
+    "guest": (".guest", None),
+    "info": (".info", None),
+    "local": (".local", None),
+    "password_policy_conform": (".password_policy_conform", None),
+    "proxy": (".proxy", None),
+    "query": (".query", None),
+    "radius": (".radius", None),
+    "scim": (".scim", None),
+    "tacacs_plus": (".tacacs_plus", None),
+    "CollectedEmail": (".collected_email", "CollectedEmail"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class User:
     """User endpoints wrapper for CMDB API."""
 
+    banned = LazyEndpoint(".banned", "Banned")
+    device = LazyEndpoint(".device", "Device")
+    firewall = LazyEndpoint(".firewall", "Firewall")
+    fortitoken = LazyEndpoint(".fortitoken", "Fortitoken")
+    fortitoken_cloud = LazyEndpoint(".fortitoken_cloud", "FortitokenCloud")
+    fsso = LazyEndpoint(".fsso", "Fsso")
+    guest = LazyEndpoint(".guest", "Guest")
+    info = LazyEndpoint(".info", "Info")
+    local = LazyEndpoint(".local", "Local")
+    password_policy_conform = LazyEndpoint(".password_policy_conform", "PasswordPolicyConform")
+    proxy = LazyEndpoint(".proxy", "Proxy")
+    query = LazyEndpoint(".query", "Query")
+    radius = LazyEndpoint(".radius", "Radius")
+    scim = LazyEndpoint(".scim", "Scim")
+    tacacs_plus = LazyEndpoint(".tacacs_plus", "TacacsPlus")
+    collected_email = LazyEndpoint(".collected_email", "CollectedEmail")
+
     def __init__(self, client):
         """User endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.banned = banned.Banned(client)
-        self.device = device.Device(client)
-        self.firewall = firewall.Firewall(client)
-        self.fortitoken = fortitoken.Fortitoken(client)
-        self.fortitoken_cloud = fortitoken_cloud.FortitokenCloud(client)
-        self.fsso = fsso.Fsso(client)
-        self.guest = guest.Guest(client)
-        self.info = info.Info(client)
-        self.local = local.Local(client)
-        self.password_policy_conform = password_policy_conform.PasswordPolicyConform(client)
-        self.proxy = proxy.Proxy(client)
-        self.query = query.Query(client)
-        self.radius = radius.Radius(client)
-        self.scim = scim.Scim(client)
-        self.tacacs_plus = tacacs_plus.TacacsPlus(client)
-        self.collected_email = CollectedEmail(client)
+        self._client = client
@@ -1,10 +1,7 @@
 """FortiOS CMDB - Banned category"""
 
 from ..banned_base import Banned as BannedBase
-from .add_users import AddUsers
-from .check import Check
-from .clear_all import ClearAll
-from .clear_users import ClearUsers
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "AddUsers",
@@ -14,10 +11,24 @@ __all__ = [
     "ClearUsers",
 ]
 
+_LAZY_IMPORTS = {
+    "AddUsers": (".add_users", "AddUsers"),
+    "Check": (".check", "Check"),
+    "ClearAll": (".clear_all", "ClearAll"),
+    "ClearUsers": (".clear_users", "ClearUsers"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Banned(BannedBase):
     """Banned endpoints wrapper for CMDB API."""
 
+    add_users = LazyEndpoint(".add_users", "AddUsers")
+    check = LazyEndpoint(".check", "Check")
+    clear_all = LazyEndpoint(".clear_all", "ClearAll")
+    clear_users = LazyEndpoint(".clear_users", "ClearUsers")
+
     def __init__(self, client):
         """Banned endpoints.
         
@@ -25,7 +36,4 @@ class Banned(BannedBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.add_users = AddUsers(client)
-        self.check = Check(client)
-        self.clear_all = ClearAll(client)
-        self.clear_users = ClearUsers(client)
+        self._client = client
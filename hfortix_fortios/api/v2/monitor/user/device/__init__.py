@@ -1,9 +1,6 @@
 """FortiOS CMDB - Device category"""
 
-from .iot_query import IotQuery
-from .purdue_level import PurdueLevel
-from .query import Query
-from .stats import Stats
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Device",
@@ -13,17 +10,28 @@ __all__ = [
     "Stats",
 ]
 
+_LAZY_IMPORTS = {
+    "IotQuery": (".iot_query", "IotQuery"),
+    "PurdueLevel": (".purdue_level", "PurdueLevel"),
+    "Query": (".query", "Query"),
+    "Stats": (".stats", "Stats"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Device:
     """Device endpoints wrapper for CMDB API."""
 
+    iot_query = LazyEndpoint(".iot_query", "IotQuery")
+    purdue_level = LazyEndpoint(".purdue_level", "PurdueLevel")
+    query = LazyEndpoint(".query", "Query")
+    stats = LazyEndpoint(".stats", "Stats")
+
     def __init__(self, client):
         """Device endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.iot_query = IotQuery(client)
-        self.purdue_level = PurdueLevel(client)
-        self.query = Query(client)
-        self.stats = Stats(client)
+        self._client = client
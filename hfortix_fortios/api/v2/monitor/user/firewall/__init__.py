@@ -1,9 +1,7 @@
 """FortiOS CMDB - Firewall category"""
 
 from ..firewall_base import Firewall as FirewallBase
-from .auth import Auth
-from .count import Count
-from .deauth import Deauth
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Auth",
@@ -12,10 +10,22 @@ __all__ = [
     "Firewall",
 ]
 
+_LAZY_IMPORTS = {
+    "Auth": (".auth", "Auth"),
+    "Count": (".count", "Count"),
+    "Deauth": (".deauth", "Deauth"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Firewall(FirewallBase):
     """Firewall endpoints wrapper for CMDB API."""
 
+    auth = LazyEndpoint(".auth", "Auth")
+    count = LazyEndpoint(".count", "Count")
+    deauth = LazyEndpoint(".deauth", "Deauth")
+
     def __init__(self, client):
         """Firewall endpoints.
         
@@ -23,6 +33,4 @@ class Firewall(FirewallBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.auth = Auth(client)
-        self.count = Count(client)
-        self.deauth = Deauth(client)
+        self._client = client
@@ -1,13 +1,7 @@
 """FortiOS CMDB - Fortitoken category"""
 
 from ..fortitoken_base import Fortitoken as FortitokenBase
-from .activate import Activate
-from .import_mobile import ImportMobile
-from .import_seed import ImportSeed
-from .import_trial import ImportTrial
-from .provision import Provision
-from .refresh import Refresh
-from .send_activation import SendActivation
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Activate",
@@ -20,10 +14,30 @@ __all__ = [
     "SendActivation",
 ]
 
+_LAZY_IMPORTS = {
+    "Activate": (".activate", "Activate"),
+    "ImportMobile": (".import_mobile", "ImportMobile"),
+    "ImportSeed": (".import_seed", "ImportSeed"),
+    "ImportTrial": (".import_trial", "ImportTrial"),
+    "Provision": (".provision", "Provision"),
+    "Refresh": (".refresh", "Refresh"),
+    "SendActivation": (".send_activation", "SendActivation"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Fortitoken(FortitokenBase):
     """Fortitoken endpoints wrapper for CMDB API."""
 
+    activate = LazyEndpoint(".activate", "Activate")
+    import_mobile = LazyEndpoint(".import_mobile", "ImportMobile")
+    import_seed = LazyEndpoint(".import_seed", "ImportSeed")
+    import_trial = LazyEndpoint(".import_trial", "ImportTrial")
+    provision = LazyEndpoint(".provision", "Provision")
+    refresh = LazyEndpoint(".refresh", "Refresh")
+    send_activation = LazyEndpoint(".send_activation", "SendActivation")
+
     def __init__(self, client):
         """Fortitoken endpoints.
         
@@ -31,10 +45,4 @@ class Fortitoken(FortitokenBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.activate = Activate(client)
-        self.import_mobile = ImportMobile(client)
-        self.import_seed = ImportSeed(client)
-        self.import_trial = ImportTrial(client)
-        self.provision = Provision(client)
-        self.refresh = Refresh(client)
-        self.send_activation = SendActivation(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - FortitokenCloud category"""
 
-from .status import Status
-from .trial import Trial
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "FortitokenCloud",
@@ -9,15 +8,24 @@ __all__ = [
     "Trial",
 ]
 
+_LAZY_IMPORTS = {
+    "Status": (".status", "Status"),
+    "Trial": (".trial", "Trial"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class FortitokenCloud:
     """FortitokenCloud endpoints wrapper for CMDB API."""
 
+    status = LazyEndpoint(".status", "Status")
+    trial = LazyEndpoint(".trial", "Trial")
+
     def __init__(self, client):
         """FortitokenCloud endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.status = Status(client)
-        self.trial = Trial(client)
+        self._client = client
@@ -1,17 +1,25 @@
 """FortiOS CMDB - Fsso category"""
 
 from ..fsso_base import Fsso as FssoBase
-from .refresh_server import RefreshServer
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Fsso",
     "RefreshServer",
 ]
 
+_LAZY_IMPORTS = {
+    "RefreshServer": (".refresh_server", "RefreshServer"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Fsso(FssoBase):
     """Fsso endpoints wrapper for CMDB API."""
 
+    refresh_server = LazyEndpoint(".refresh_server", "RefreshServer")
+
     def __init__(self, client):
         """Fsso endpoints.
         
@@ -19,4 +27,4 @@ class Fsso(FssoBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.refresh_server = RefreshServer(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - Guest category"""
 
-from .email import Email
-from .sms import Sms
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Email",
@@ -9,15 +8,24 @@ __all__ = [
     "Sms",
 ]
 
+_LAZY_IMPORTS = {
+    "Email": (".email", "Email"),
+    "Sms": (".sms", "Sms"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Guest:
     """Guest endpoints wrapper for CMDB API."""
 
+    email = LazyEndpoint(".email", "Email")
+    sms = LazyEndpoint(".sms", "Sms")
+
     def __init__(self, client):
         """Guest endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.email = Email(client)
-        self.sms = Sms(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Info category"""
 
-from .query import Query
-from .thumbnail import Thumbnail
-from .thumbnail_file import ThumbnailFile
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Info",
@@ -11,16 +9,26 @@ __all__ = [
     "ThumbnailFile",
 ]
 
+_LAZY_IMPORTS = {
+    "Query": (".query", "Query"),
+    "Thumbnail": (".thumbnail", "Thumbnail"),
+    "ThumbnailFile": (".thumbnail_file", "ThumbnailFile"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Info:
     """Info endpoints wrapper for CMDB API."""
 
+    query = LazyEndpoint(".query", "Query")
+    thumbnail = LazyEndpoint(".thumbnail", "Thumbnail")
+    thumbnail_file = LazyEndpoint(".thumbnail_file", "ThumbnailFile")
+
     def __init__(self, client):
         """Info endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.query = Query(client)
-        self.thumbnail = Thumbnail(client)
-        self.thumbnail_file = ThumbnailFile(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Local category"""
 
-from .change_password import ChangePassword
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ChangePassword",
     "Local",
 ]
 
+_LAZY_IMPORTS = {
+    "ChangePassword": (".change_password", "ChangePassword"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Local:
     """Local endpoints wrapper for CMDB API."""
 
+    change_password = LazyEndpoint(".change_password", "ChangePassword")
+
     def __init__(self, client):
         """Local endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.change_password = ChangePassword(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - PasswordPolicyConform category"""
 
-from .select import Select
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "PasswordPolicyConform",
     "Select",
 ]
 
+_LAZY_IMPORTS = {
+    "Select": (".select", "Select"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class PasswordPolicyConform:
     """PasswordPolicyConform endpoints wrapper for CMDB API."""
 
+    select = LazyEndpoint(".select", "Select")
+
     def __init__(self, client):
         """PasswordPolicyConform endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.select = Select(client)
+        self._client = client
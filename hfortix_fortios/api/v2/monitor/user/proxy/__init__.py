@@ -1,17 +1,25 @@
 """FortiOS CMDB - Proxy category"""
 
 from ..proxy_base import Proxy as ProxyBase
-from .count import Count
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Count",
     "Proxy",
 ]
 
+_LAZY_IMPORTS = {
+    "Count": (".count", "Count"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Proxy(ProxyBase):
     """Proxy endpoints wrapper for CMDB API."""
 
+    count = LazyEndpoint(".count", "Count")
+
     def __init__(self, client):
         """Proxy endpoints.
         
@@ -19,4 +27,4 @@ class Proxy(ProxyBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.count = Count(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Query category"""
 
-from .abort import Abort
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Abort",
     "Query",
 ]
 
+_LAZY_IMPORTS = {
+    "Abort": (".abort", "Abort"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Query:
     """Query endpoints wrapper for CMDB API."""
 
+    abort = LazyEndpoint(".abort", "Abort")
+
     def __init__(self, client):
         """Query endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.abort = Abort(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - Radius category"""
 
-from .get_test_connect import GetTestConnect
-from .test_connect import TestConnect
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "GetTestConnect",
@@ -9,15 +8,24 @@ __all__ = [
     "TestConnect",
 ]
 
+_LAZY_IMPORTS = {
+    "GetTestConnect": (".get_test_connect", "GetTestConnect"),
+    "TestConnect": (".test_connect", "TestConnect"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Radius:
     """Radius endpoints wrapper for CMDB API."""
 
+    get_test_connect = LazyEndpoint(".get_test_connect", "GetTestConnect")
+    test_connect = LazyEndpoint(".test_connect", "TestConnect")
+
     def __init__(self, client):
         """Radius endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.get_test_connect = GetTestConnect(client)
-        self.test_connect = TestConnect(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - Scim category"""
 
-from .groups import Groups
-from .users import Users
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Groups",
@@ -9,15 +8,24 @@ __all__ = [
     "Users",
 ]
 
+_LAZY_IMPORTS = {
+    "Groups": (".groups", "Groups"),
+    "Users": (".users", "Users"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Scim:
     """Scim endpoints wrapper for CMDB API."""
 
+    groups = LazyEndpoint(".groups", "Groups")
+    users = LazyEndpoint(".users", "Users")
+
     def __init__(self, client):
         """Scim endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.groups = Groups(client)
-        self.users = Users(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - TacacsPlus category"""
 
-from .test import Test
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "TacacsPlus",
     "Test",
 ]
 
+_LAZY_IMPORTS = {
+    "Test": (".test", "Test"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class TacacsPlus:
     """TacacsPlus endpoints wrapper for CMDB API."""
 
+    test = LazyEndpoint(".test", "Test")
+
     def __init__(self, client):
         """TacacsPlus endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.test = Test(client)
+        self._client = client
@@ -1,10 +1,6 @@
 """FortiOS CMDB - Utm category"""
 
-from . import antivirus
-from . import blacklisted_certificates
-from . import rating_lookup
-from .app_lookup import AppLookup
-from .application_categories import ApplicationCategories
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Antivirus",
@@ -15,18 +11,30 @@ __all__ = [
     "Utm",
 ]
 
+_LAZY_IMPORTS = {
+    "antivirus": (".antivirus", None),
+    "blacklisted_certificates": (".blacklisted_certificates", None),
+    "rating_lookup": (".rating_lookup", None),
+    "AppLookup": (".app_lookup", "AppLookup"),
+    "ApplicationCategories": (".application_categories", "ApplicationCategories"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Utm:
     """Utm endpoints wrapper for CMDB API."""
 
+    antivirus = LazyEndpoint(".antivirus", "Antivirus")
+    blacklisted_certificates = LazyEndpoint(".blacklisted_certificates", "BlacklistedCertificates")
+    rating_lookup = LazyEndpoint(".rating_lookup", "RatingLookup")
+    app_lookup = LazyEndpoint(".app_lookup", "AppLookup")
+    application_categories = LazyEndpoint(".application_categories", "ApplicationCategories")
+
     def __init__(self, client):
         """Utm endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.antivirus = antivirus.Antivirus(client)
-        self.blacklisted_certificates = blacklisted_certificates.BlacklistedCertificates(client)
-        self.rating_lookup = rating_lookup.RatingLookup(client)
-        self.app_lookup = AppLookup(client)
-        self.application_categories = ApplicationCategories(client)
+        self._client = client
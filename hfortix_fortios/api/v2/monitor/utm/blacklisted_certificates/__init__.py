@@ -1,17 +1,25 @@
 """FortiOS CMDB - BlacklistedCertificates category"""
 
 from ..blacklisted_certificates_base import BlacklistedCertificates as BlacklistedCertificatesBase
-from .statistics import Statistics
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "BlacklistedCertificates",
     "Statistics",
 ]
 
+_LAZY_IMPORTS = {
+    "Statistics": (".statistics", "Statistics"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class BlacklistedCertificates(BlacklistedCertificatesBase):
     """BlacklistedCertificates endpoints wrapper for CMDB API."""
 
+    statistics = LazyEndpoint(".statistics", "Statistics")
+
     def __init__(self, client):
         """BlacklistedCertificates endpoints.
         
@@ -19,4 +27,4 @@ class BlacklistedCertificates(BlacklistedCertificatesBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.statistics = Statistics(client)
+        self._client = client
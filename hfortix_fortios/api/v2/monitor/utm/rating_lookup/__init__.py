@@ -1,20 +1,28 @@
 """FortiOS CMDB - RatingLookup category"""
 
-from .select import Select
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "RatingLookup",
     "Select",
 ]
 
+_LAZY_IMPORTS = {
+    "Select": (".select", "Select"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class RatingLookup:
     """RatingLookup endpoints wrapper for CMDB API."""
 
+    select = LazyEndpoint(".select", "Select")
+
     def __init__(self, client):
         """RatingLookup endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.select = Select(client)
+        self._client = client
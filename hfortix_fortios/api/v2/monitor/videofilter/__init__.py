@@ -1,20 +1,28 @@
 """FortiOS CMDB - Videofilter category"""
 
-from .fortiguard_categories import FortiguardCategories
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "FortiguardCategories",
     "Videofilter",
 ]
 
+_LAZY_IMPORTS = {
+    "FortiguardCategories": (".fortiguard_categories", "FortiguardCategories"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Videofilter:
     """Videofilter endpoints wrapper for CMDB API."""
 
+    fortiguard_categories = LazyEndpoint(".fortiguard_categories", "FortiguardCategories")
+
     def __init__(self, client):
         """Videofilter endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.fortiguard_categories = FortiguardCategories(client)
+        self._client = client
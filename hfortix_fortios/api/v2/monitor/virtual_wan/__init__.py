@@ -1,10 +1,6 @@
 """FortiOS CMDB - VirtualWan category"""
 
-from .health_check import HealthCheck
-from .interface_log import InterfaceLog
-from .members import Members
-from .sla_log import SlaLog
-from .sladb import Sladb
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "HealthCheck",
@@ -15,18 +11,30 @@ __all__ = [
     "VirtualWan",
 ]
 
+_LAZY_IMPORTS = {
+    "HealthCheck": (".health_check", "HealthCheck"),
+    "InterfaceLog": (".interface_log", "InterfaceLog"),
+    "Members": (".members", "Members"),
+    "SlaLog": (".sla_log", "SlaLog"),
+    "Sladb": (".sladb", "Sladb"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class VirtualWan:
     """VirtualWan endpoints wrapper for CMDB API."""
 
+    health_check = LazyEndpoint(".health_check", "HealthCheck")
+    interface_log = LazyEndpoint(".interface_log", "InterfaceLog")
+    members = LazyEndpoint(".members", "Members")
+    sla_log = LazyEndpoint(".sla_log", "SlaLog")
+    sladb = LazyEndpoint(".sladb", "Sladb")
+
     def __init__(self, client):
         """VirtualWan endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.health_check = HealthCheck(client)
-        self.interface_log = InterfaceLog(client)
-        self.members = Members(client)
-        self.sla_log = SlaLog(client)
-        self.sladb = Sladb(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Vpn category"""
 
-from . import ike
-from . import ipsec
-from . import ssl
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Ike",
@@ -11,16 +9,26 @@ __all__ = [
     "Vpn",
 ]
 
+_LAZY_IMPORTS = {
+    "ike": (".ike", None),
+    "ipsec": (".ipsec", None),
+    "ssl": (".ssl", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Vpn:
     """Vpn endpoints wrapper for CMDB API."""
 
+    ike = LazyEndpoint(".ike", "Ike")
+    ipsec = LazyEndpoint(".ipsec", "Ipsec")
+    ssl = LazyEndpoint(".ssl", "Ssl")
+
     def __init__(self, client):
         """Vpn endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.ike = ike.Ike(client)
-        self.ipsec = ipsec.Ipsec(client)
-        self.ssl = ssl.Ssl(client)
+        self._client = client
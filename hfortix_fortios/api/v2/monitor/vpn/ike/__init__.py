@@ -1,20 +1,28 @@
 """FortiOS CMDB - Ike category"""
 
-from .clear import Clear
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Clear",
     "Ike",
 ]
 
+_LAZY_IMPORTS = {
+    "Clear": (".clear", "Clear"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ike:
     """Ike endpoints wrapper for CMDB API."""
 
+    clear = LazyEndpoint(".clear", "Clear")
+
     def __init__(self, client):
         """Ike endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.clear = Clear(client)
+        self._client = client
@@ -1,10 +1,7 @@
 """FortiOS CMDB - Ipsec category"""
 
 from ..ipsec_base import Ipsec as IpsecBase
-from .connection_count import ConnectionCount
-from .tunnel_down import TunnelDown
-from .tunnel_reset_stats import TunnelResetStats
-from .tunnel_up import TunnelUp
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ConnectionCount",
@@ -14,10 +11,24 @@ __all__ = [
     "TunnelUp",
 ]
 
+_LAZY_IMPORTS = {
+    "ConnectionCount": (".connection_count", "ConnectionCount"),
+    "TunnelDown": (".tunnel_down", "TunnelDown"),
+    "TunnelResetStats": (".tunnel_reset_stats", "TunnelResetStats"),
+    "TunnelUp": (".tunnel_up", "TunnelUp"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ipsec(IpsecBase):
     """Ipsec endpoints wrapper for CMDB API."""
 
+    connection_count = LazyEndpoint(".connection_count", "ConnectionCount")
+    tunnel_down = LazyEndpoint(".tunnel_down", "TunnelDown")
+    tunnel_reset_stats = LazyEndpoint(".tunnel_reset_stats", "TunnelResetStats")
+    tunnel_up = LazyEndpoint(".tunnel_up", "TunnelUp")
+
     def __init__(self, client):
         """Ipsec endpoints.
         
@@ -25,7 +36,4 @@ class Ipsec(IpsecBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.connection_count = ConnectionCount(client)
-        self.tunnel_down = TunnelDown(client)
-        self.tunnel_reset_stats = TunnelResetStats(client)
-        self.tunnel_up = TunnelUp(client)
+        self._client = client
@@ -1,9 +1,7 @@
 """FortiOS CMDB - Ssl category"""
 
 from ..ssl_base import Ssl as SslBase
-from .clear_tunnel import ClearTunnel
-from .delete import Delete
-from .stats import Stats
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ClearTunnel",
@@ -12,10 +10,22 @@ __all__ = [
     "Stats",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearTunnel": (".clear_tunnel", "ClearTunnel"),
+    "Delete": (".delete", "Delete"),
+    "Stats": (".stats", "Stats"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ssl(SslBase):
     """Ssl endpoints wrapper for CMDB API."""
 
+    clear_tunnel = LazyEndpoint(".clear_tunnel", "ClearTunnel")
+    delete = LazyEndpoint(".delete", "Delete")
+    stats = LazyEndpoint(".stats", "Stats")
+
     def __init__(self, client):
         """Ssl endpoints.
         
@@ -23,6 +33,4 @@ class Ssl(SslBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.clear_tunnel = ClearTunnel(client)
-        self.delete = Delete(client)
-        self.stats = Stats(client)
+        self._client = client
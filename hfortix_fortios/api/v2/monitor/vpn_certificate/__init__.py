@@ -1,11 +1,6 @@
 """FortiOS CMDB - VpnCertificate category"""
 
-from . import ca
-from . import crl
-from . import csr
-from . import local
-from . import remote
-from .cert_name_available import CertNameAvailable
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Ca",
@@ -17,19 +12,32 @@ __all__ = [
     "VpnCertificate",
 ]
 
+_LAZY_IMPORTS = {
+    "ca": (".ca", None),
+    "crl": (".crl", None),
+    "csr": (".csr", None),
+    "local": (".local", None),
+    "remote": (".remote", None),
+    "CertNameAvailable": (".cert_name_available", "CertNameAvailable"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class VpnCertificate:
     """VpnCertificate endpoints wrapper for CMDB API."""
 
+    ca = LazyEndpoint(".ca", "Ca")
+    crl = LazyEndpoint(".crl", "Crl")
+    csr = LazyEndpoint(".csr", "Csr")
+    local = LazyEndpoint(".local", "Local")
+    remote = LazyEndpoint(".remote", "Remote")
+    cert_name_available = LazyEndpoint(".cert_name_available", "CertNameAvailable")
+
     def __init__(self, client):
         """VpnCertificate endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.ca = ca.Ca(client)
-        self.crl = crl.Crl(client)
-        self.csr = csr.Csr(client)
-        self.local = local.Local(client)
-        self.remote = remote.Remote(client)
-        self.cert_name_available = CertNameAvailable(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Csr category"""
 
-from .generate import Generate
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Csr",
     "Generate",
 ]
 
+_LAZY_IMPORTS = {
+    "Generate": (".generate", "Generate"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Csr:
     """Csr endpoints wrapper for CMDB API."""
 
+    generate = LazyEndpoint(".generate", "Generate")
+
     def __init__(self, client):
         """Csr endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.generate = Generate(client)
+        self._client = client
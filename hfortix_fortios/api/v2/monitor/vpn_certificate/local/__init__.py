@@ -1,7 +1,6 @@
 """FortiOS CMDB - Local category"""
 
-from .create import Create
-from .import_ import Import
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Create",
@@ -9,15 +8,24 @@ __all__ = [
     "Local",
 ]
 
+_LAZY_IMPORTS = {
+    "Create": (".create", "Create"),
+    "Import": (".import_", "Import"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Local:
     """Local endpoints wrapper for CMDB API."""
 
+    create = LazyEndpoint(".create", "Create")
+    import_ = LazyEndpoint(".import_", "Import")
+
     def __init__(self, client):
         """Local endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.create = Create(client)
-        self.import_ = Import(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - Wanopt category"""
 
-from . import history
-from . import peer_stats
-from . import webcache
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "History",
@@ -11,16 +9,26 @@ __all__ = [
     "Webcache",
 ]
 
+_LAZY_IMPORTS = {
+    "history": (".history", None),
+    "peer_stats": (".peer_stats", None),
+    "webcache": (".webcache", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Wanopt:
     """Wanopt endpoints wrapper for CMDB API."""
 
+    history = LazyEndpoint(".history", "History")
+    peer_stats = LazyEndpoint(".peer_stats", "PeerStats")
+    webcache = LazyEndpoint(".webcache", "Webcache")
+
     def __init__(self, client):
         """Wanopt endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.history = history.History(client)
-        self.peer_stats = peer_stats.PeerStats(client)
-        self.webcache = webcache.Webcache(client)
+        self._client = client
@@ -1,17 +1,25 @@
 """FortiOS CMDB - History category"""
 
 from ..history_base import History as HistoryBase
-from .reset import Reset
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "History",
     "Reset",
 ]
 
+_LAZY_IMPORTS = {
+    "Reset": (".reset", "Reset"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class History(HistoryBase):
     """History endpoints wrapper for CMDB API."""
 
+    reset = LazyEndpoint(".reset", "Reset")
+
     def __init__(self, client):
         """History endpoints.
         
@@ -19,4 +27,4 @@ class History(HistoryBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.reset = Reset(client)
+        self._client = client
@@ -1,17 +1,25 @@
 """FortiOS CMDB - PeerStats category"""
 
 from ..peer_stats_base import PeerStats as PeerStatsBase
-from .reset import Reset
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "PeerStats",
     "Reset",
 ]
 
+_LAZY_IMPORTS = {
+    "Reset": (".reset", "Reset"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class PeerStats(PeerStatsBase):
     """PeerStats endpoints wrapper for CMDB API."""
 
+    reset = LazyEndpoint(".reset", "Reset")
+
     def __init__(self, client):
         """PeerStats endpoints.
         
@@ -19,4 +27,4 @@ class PeerStats(PeerStatsBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.reset = Reset(client)
+        self._client = client
@@ -1,17 +1,25 @@
 """FortiOS CMDB - Webcache category"""
 
 from ..webcache_base import Webcache as WebcacheBase
-from .reset import Reset
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Reset",
     "Webcache",
 ]
 
+_LAZY_IMPORTS = {
+    "Reset": (".reset", "Reset"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Webcache(WebcacheBase):
     """Webcache endpoints wrapper for CMDB API."""
 
+    reset = LazyEndpoint(".reset", "Reset")
+
     def __init__(self, client):
         """Webcache endpoints.
         
@@ -19,4 +27,4 @@ class Webcache(WebcacheBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.reset = Reset(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - WebUi category"""
 
-from . import custom_language
-from . import language
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "CustomLanguage",
@@ -9,15 +8,24 @@ __all__ = [
     "WebUi",
 ]
 
+_LAZY_IMPORTS = {
+    "custom_language": (".custom_language", None),
+    "language": (".language", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class WebUi:
     """WebUi endpoints wrapper for CMDB API."""
 
+    custom_language = LazyEndpoint(".custom_language", "CustomLanguage")
+    language = LazyEndpoint(".language", "Language")
+
     def __init__(self, client):
         """WebUi endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.custom_language = custom_language.CustomLanguage(client)
-        self.language = language.Language(client)
+        self._client = client
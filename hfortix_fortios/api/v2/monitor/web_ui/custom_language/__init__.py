@@ -1,8 +1,6 @@
 """FortiOS CMDB - CustomLanguage category"""
 
-from .create import Create
-from .download import Download
-from .update import Update
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Create",
@@ -11,16 +9,26 @@ __all__ = [
     "Update",
 ]
 
+_LAZY_IMPORTS = {
+    "Create": (".create", "Create"),
+    "Download": (".download", "Download"),
+    "Update": (".update", "Update"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class CustomLanguage:
     """CustomLanguage endpoints wrapper for CMDB API."""
 
+    create = LazyEndpoint(".create", "Create")
+    download = LazyEndpoint(".download", "Download")
+    update = LazyEndpoint(".update", "Update")
+
     def __init__(self, client):
         """CustomLanguage endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.create = Create(client)
-        self.download = Download(client)
-        self.update = Update(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Language category"""
 
-from .import_ import Import
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Import",
     "Language",
 ]
 
+_LAZY_IMPORTS = {
+    "Import": (".import_", "Import"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Language:
     """Language endpoints wrapper for CMDB API."""
 
+    import_ = LazyEndpoint(".import_", "Import")
+
     def __init__(self, client):
         """Language endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.import_ = Import(client)
+        self._client = client
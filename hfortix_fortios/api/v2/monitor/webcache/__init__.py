@@ -1,20 +1,28 @@
 """FortiOS CMDB - Webcache category"""
 
-from . import stats
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Stats",
     "Webcache",
 ]
 
+_LAZY_IMPORTS = {
+    "stats": (".stats", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Webcache:
     """Webcache endpoints wrapper for CMDB API."""
 
+    stats = LazyEndpoint(".stats", "Stats")
+
     def __init__(self, client):
         """Webcache endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.stats = stats.Stats(client)
+        self._client = client
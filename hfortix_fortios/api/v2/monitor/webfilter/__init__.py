@@ -1,10 +1,6 @@
 """FortiOS CMDB - Webfilter category"""
 
-from . import category_quota
-from . import malicious_urls
-from . import override
-from .fortiguard_categories import FortiguardCategories
-from .trusted_urls import TrustedUrls
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "CategoryQuota",
@@ -15,18 +11,30 @@ __all__ = [
     "Webfilter",
 ]
 
+_LAZY_IMPORTS = {
+    "category_quota": (".category_quota", None),
+    "malicious_urls": (".malicious_urls", None),
+    "override": (".override", None),
+    "FortiguardCategories": (".fortiguard_categories", "FortiguardCategories"),
+    "TrustedUrls": (".trusted_urls", "TrustedUrls"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Webfilter:
     """Webfilter endpoints wrapper for CMDB API."""
 
+    category_quota = LazyEndpoint(".category_quota", "CategoryQuota")
+    malicious_urls = LazyEndpoint(".malicious_urls", "MaliciousUrls")
+    override = LazyEndpoint(".override", "Override")
+    fortiguard_categories = LazyEndpoint(".fortiguard_categories", "FortiguardCategories")
+    trusted_urls = LazyEndpoint(".trusted_urls", "TrustedUrls")
+
     def __init__(self, client):
         """Webfilter endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.category_quota = category_quota.CategoryQuota(client)
-        self.malicious_urls = malicious_urls.MaliciousUrls(client)
-        self.override = override.Override(client)
-        self.fortiguard_categories = FortiguardCategories(client)
-        self.trusted_urls = TrustedUrls(client)
+        self._client = client
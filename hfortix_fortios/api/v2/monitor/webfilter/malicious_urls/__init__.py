@@ -1,17 +1,25 @@
 """FortiOS CMDB - MaliciousUrls category"""
 
 from ..malicious_urls_base import MaliciousUrls as MaliciousUrlsBase
-from .stat import Stat
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "MaliciousUrls",
     "Stat",
 ]
 
+_LAZY_IMPORTS = {
+    "Stat": (".stat", "Stat"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class MaliciousUrls(MaliciousUrlsBase):
     """MaliciousUrls endpoints wrapper for CMDB API."""
 
+    stat = LazyEndpoint(".stat", "Stat")
+
     def __init__(self, client):
         """MaliciousUrls endpoints.
         
@@ -19,4 +27,4 @@ class MaliciousUrls(MaliciousUrlsBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.stat = Stat(client)
+        self._client = client
@@ -1,17 +1,25 @@
 """FortiOS CMDB - Override category"""
 
 from ..override_base import Override as OverrideBase
-from .delete import Delete
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Delete",
     "Override",
 ]
 
+_LAZY_IMPORTS = {
+    "Delete": (".delete", "Delete"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Override(OverrideBase):
     """Override endpoints wrapper for CMDB API."""
 
+    delete = LazyEndpoint(".delete", "Delete")
+
     def __init__(self, client):
         """Override endpoints.
         
@@ -19,4 +27,4 @@ class Override(OverrideBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.delete = Delete(client)
+        self._client = client
@@ -1,20 +1,28 @@
 """FortiOS CMDB - Webproxy category"""
 
-from . import pacfile
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Pacfile",
     "Webproxy",
 ]
 
+_LAZY_IMPORTS = {
+    "pacfile": (".pacfile", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Webproxy:
     """Webproxy endpoints wrapper for CMDB API."""
 
+    pacfile = LazyEndpoint(".pacfile", "Pacfile")
+
     def __init__(self, client):
         """Webproxy endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.pacfile = pacfile.Pacfile(client)
+        self._client = client
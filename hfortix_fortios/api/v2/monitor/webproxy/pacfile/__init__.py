@@ -1,7 +1,6 @@
 """FortiOS CMDB - Pacfile category"""
 
-from .download import Download
-from .upload import Upload
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Download",
@@ -9,15 +8,24 @@ __all__ = [
     "Upload",
 ]
 
+_LAZY_IMPORTS = {
+    "Download": (".download", "Download"),
+    "Upload": (".upload", "Upload"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Pacfile:
     """Pacfile endpoints wrapper for CMDB API."""
 
+    download = LazyEndpoint(".download", "Download")
+    upload = LazyEndpoint(".upload", "Upload")
+
     def __init__(self, client):
         """Pacfile endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.download = Download(client)
-        self.upload = Upload(client)
+        self._client = client
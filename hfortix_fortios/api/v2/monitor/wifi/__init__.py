@@ -1,26 +1,6 @@
 """FortiOS CMDB - Wifi category"""
 
-from . import ap_profile
-from . import client as client_ns
-from . import euclid
-from . import firmware
-from . import managed_ap
-from . import nac_device
-from . import network
-from . import region_image
-from . import rogue_ap
-from . import spectrum
-from . import ssid
-from . import vlan_probe
-from .ap_channels import ApChannels
-from .ap_names import ApNames
-from .ap_status import ApStatus
-from .interfering_ap import InterferingAp
-from .matched_devices import MatchedDevices
-from .meta import Meta
-from .station_capability import StationCapability
-from .statistics import Statistics
-from .unassociated_devices import UnassociatedDevices
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ApChannels",
@@ -47,34 +27,62 @@ __all__ = [
     "Wifi",
 ]
 
+_LAZY_IMPORTS = {
+    "ap_profile": (".ap_profile", None),
+    "client_ns": (".client", None),
+    "euclid": (".euclid", None),
+    "firmware": (".firmware", None),
+    "managed_ap": (".managed_ap", None),
+    "nac_device": (".nac_device", None),
+    "network": (".network", None),
+    "region_image": (".region_image", None),
+    "rogue_ap": (".rogue_ap", None),
+    "spectrum": (".spectrum", None),
+    "ssid": (".ssid", None),
+    "vlan_probe": (".vlan_probe", None),
+    "ApChannels": (".ap_channels", "ApChannels"),
+    "ApNames": (".ap_names", "ApNames"),
+    "ApStatus": (".ap_status", "ApStatus"),
+    "InterferingAp": (".interfering_ap", "InterferingAp"),
+    "MatchedDevices": (".matched_devices", "MatchedDevices"),
+    "Meta": (".meta", "Meta"),
+    "StationCapability": (".station_capability", "StationCapability"),
+    "Statistics": (".statistics", "Statistics"),
+    "UnassociatedDevices": (".unassociated_devices", "UnassociatedDevices"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Wifi:
     """Wifi endpoints wrapper for CMDB API."""
 
+    ap_profile = LazyEndpoint(".ap_profile", "ApProfile")
+    client = LazyEndpoint(".client", "Client")
+    euclid = LazyEndpoint(".euclid", "Euclid")
+    firmware = LazyEndpoint(".firmware", "Firmware")
+    managed_ap = LazyEndpoint(".managed_ap", "ManagedAp")
+    nac_device = LazyEndpoint(".nac_device", "NacDevice")
+    network = LazyEndpoint(".network", "Network")
+    region_image = LazyEndpoint(".region_image", "RegionImage")
+    rogue_ap = LazyEndpoint(".rogue_ap", "RogueAp")
+    spectrum = LazyEndpoint(".spectrum", "Spectrum")
+    ssid = LazyEndpoint(".ssid", "Ssid")
+    vlan_probe = LazyEndpoint(".vlan_probe", "VlanProbe")
+    ap_channels = LazyEndpoint(".ap_channels", "ApChannels")
+    ap_names = LazyEndpoint(".ap_names", "ApNames")
+    ap_status = LazyEndpoint(".ap_status", "ApStatus")
+    interfering_ap = LazyEndpoint(".interfering_ap", "InterferingAp")
+    matched_devices = LazyEndpoint(".matched_devices", "MatchedDevices")
+    meta = LazyEndpoint(".meta", "Meta")
+    station_capability = LazyEndpoint(".station_capability", "StationCapability")
+    statistics = LazyEndpoint(".statistics", "Statistics")
+    unassociated_devices = LazyEndpoint(".unassociated_devices", "UnassociatedDevices")
+
     def __init__(self, client):
         """Wifi endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.ap_profile = ap_profile.ApProfile(client)
-        self.client = client_ns.Client(client)
-        self.euclid = euclid.Euclid(client)
-        self.firmware = firmware.Firmware(client)
-        self.managed_ap = managed_ap.ManagedAp(client)
-        self.nac_device = nac_device.NacDevice(client)
-        self.network = network.Network(client)
-        self.region_image = region_image.RegionImage(client)
-        self.rogue_ap = rogue_ap.RogueAp(client)
-        self.spectrum = spectrum.Spectrum(client)
-        self.ssid = ssid.Ssid(client)
-        self.vlan_probe = vlan_probe.VlanProbe(client)
-        self.ap_channels = ApChannels(client)
-        self.ap_names = ApNames(client)
-        self.ap_status = ApStatus(client)
-        self.interfering_ap = InterferingAp(client)
-        self.matched_devices = MatchedDevices(client)
-        self.meta = Meta(client)
-        self.station_capability = StationCapability(client)
-        self.statistics = Statistics(client)
-        self.unassociated_devices = UnassociatedDevices(client)
+        self._client = client
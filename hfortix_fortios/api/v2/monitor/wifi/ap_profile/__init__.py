@@ -1,20 +1,28 @@
 """FortiOS CMDB - ApProfile category"""
 
-from .create_default import CreateDefault
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ApProfile",
     "CreateDefault",
 ]
 
+_LAZY_IMPORTS = {
+    "CreateDefault": (".create_default", "CreateDefault"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ApProfile:
     """ApProfile endpoints wrapper for CMDB API."""
 
+    create_default = LazyEndpoint(".create_default", "CreateDefault")
+
     def __init__(self, client):
         """ApProfile endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.create_default = CreateDefault(client)
+        self._client = client
@@ -1,17 +1,25 @@
 """FortiOS CMDB - Client category"""
 
 from ..client_base import Client as ClientBase
-from .disassociate import Disassociate
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Client",
     "Disassociate",
 ]
 
+_LAZY_IMPORTS = {
+    "Disassociate": (".disassociate", "Disassociate"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Client(ClientBase):
     """Client endpoints wrapper for CMDB API."""
 
+    disassociate = LazyEndpoint(".disassociate", "Disassociate")
+
     def __init__(self, client):
         """Client endpoints.
         
@@ -19,4 +27,4 @@ class Client(ClientBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.disassociate = Disassociate(client)
+        self._client = client
@@ -1,9 +1,7 @@
 """FortiOS CMDB - Firmware category"""
 
 from ..firmware_base import Firmware as FirmwareBase
-from .download import Download
-from .push import Push
-from .upload import Upload
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Download",
@@ -12,10 +10,22 @@ __all__ = [
     "Upload",
 ]
 
+_LAZY_IMPORTS = {
+    "Download": (".download", "Download"),
+    "Push": (".push", "Push"),
+    "Upload": (".upload", "Upload"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Firmware(FirmwareBase):
     """Firmware endpoints wrapper for CMDB API."""
 
+    download = LazyEndpoint(".download", "Download")
+    push = LazyEndpoint(".push", "Push")
+    upload = LazyEndpoint(".upload", "Upload")
+
     def __init__(self, client):
         """Firmware endpoints.
         
@@ -23,6 +33,4 @@ class Firmware(FirmwareBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.download = Download(client)
-        self.push = Push(client)
-        self.upload = Upload(client)
+        self._client = client
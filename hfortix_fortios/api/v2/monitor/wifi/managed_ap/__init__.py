@@ -1,9 +1,7 @@
 """FortiOS CMDB - ManagedAp category"""
 
 from ..managed_ap_base import ManagedAp as ManagedApBase
-from .led_blink import LedBlink
-from .restart import Restart
-from .set_status import SetStatus
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "LedBlink",
@@ -12,10 +10,22 @@ __all__ = [
     "SetStatus",
 ]
 
+_LAZY_IMPORTS = {
+    "LedBlink": (".led_blink", "LedBlink"),
+    "Restart": (".restart", "Restart"),
+    "SetStatus": (".set_status", "SetStatus"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class ManagedAp(ManagedApBase):
     """ManagedAp endpoints wrapper for CMDB API."""
 
+    led_blink = LazyEndpoint(".led_blink", "LedBlink")
+    restart = LazyEndpoint(".restart", "Restart")
+    set_status = LazyEndpoint(".set_status", "SetStatus")
+
     def __init__(self, client):
         """ManagedAp endpoints.
         
@@ -23,6 +33,4 @@ class ManagedAp(ManagedApBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.led_blink = LedBlink(client)
-        self.restart = Restart(client)
-        self.set_status = SetStatus(client)
+        self._client = client
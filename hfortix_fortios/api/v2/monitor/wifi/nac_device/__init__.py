@@ -1,20 +1,28 @@
 """FortiOS CMDB - NacDevice category"""
 
-from .stats import Stats
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "NacDevice",
     "Stats",
 ]
 
+_LAZY_IMPORTS = {
+    "Stats": (".stats", "Stats"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class NacDevice:
     """NacDevice endpoints wrapper for CMDB API."""
 
+    stats = LazyEndpoint(".stats", "Stats")
+
     def __init__(self, client):
         """NacDevice endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.stats = Stats(client)
+        self._client = client
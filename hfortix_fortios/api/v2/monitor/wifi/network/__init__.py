@@ -1,9 +1,6 @@
 """FortiOS CMDB - Network category"""
 
-from .connect import Connect
-from .list import List
-from .scan import Scan
-from .status import Status
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Connect",
@@ -13,17 +10,28 @@ __all__ = [
     "Status",
 ]
 
+_LAZY_IMPORTS = {
+    "Connect": (".connect", "Connect"),
+    "List": (".list", "List"),
+    "Scan": (".scan", "Scan"),
+    "Status": (".status", "Status"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Network:
     """Network endpoints wrapper for CMDB API."""
 
+    connect = LazyEndpoint(".connect", "Connect")
+    list = LazyEndpoint(".list", "List")
+    scan = LazyEndpoint(".scan", "Scan")
+    status = LazyEndpoint(".status", "Status")
+
     def __init__(self, client):
         """Network endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.connect = Connect(client)
-        self.list = List(client)
-        self.scan = Scan(client)
-        self.status = Status(client)
+        self._client = client
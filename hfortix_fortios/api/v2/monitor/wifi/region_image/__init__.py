@@ -1,17 +1,25 @@
 """FortiOS CMDB - RegionImage category"""
 
 from ..region_image_base import RegionImage as RegionImageBase
-from .upload import Upload
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "RegionImage",
     "Upload",
 ]
 
+_LAZY_IMPORTS = {
+    "Upload": (".upload", "Upload"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class RegionImage(RegionImageBase):
     """RegionImage endpoints wrapper for CMDB API."""
 
+    upload = LazyEndpoint(".upload", "Upload")
+
     def __init__(self, client):
         """RegionImage endpoints.
         
@@ -19,4 +27,4 @@ class RegionImage(RegionImageBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.upload = Upload(client)
+        self._client = client
@@ -1,8 +1,7 @@
 """FortiOS CMDB - RogueAp category"""
 
 from ..rogue_ap_base import RogueAp as RogueApBase
-from .clear_all import ClearAll
-from .set_status import SetStatus
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "ClearAll",
@@ -10,10 +9,20 @@ __all__ = [
     "SetStatus",
 ]
 
+_LAZY_IMPORTS = {
+    "ClearAll": (".clear_all", "ClearAll"),
+    "SetStatus": (".set_status", "SetStatus"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class RogueAp(RogueApBase):
     """RogueAp endpoints wrapper for CMDB API."""
 
+    clear_all = LazyEndpoint(".clear_all", "ClearAll")
+    set_status = LazyEndpoint(".set_status", "SetStatus")
+
     def __init__(self, client):
         """RogueAp endpoints.
         
@@ -21,5 +30,4 @@ class RogueAp(RogueApBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.clear_all = ClearAll(client)
-        self.set_status = SetStatus(client)
+        self._client = client
@@ -1,9 +1,7 @@
 """FortiOS CMDB - Spectrum category"""
 
 from ..spectrum_base import Spectrum as SpectrumBase
-from .keep_alive import KeepAlive
-from .start import Start
-from .stop import Stop
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "KeepAlive",
@@ -12,10 +10,22 @@ __all__ = [
     "Stop",
 ]
 
+_LAZY_IMPORTS = {
+    "KeepAlive": (".keep_alive", "KeepAlive"),
+    "Start": (".start", "Start"),
+    "Stop": (".stop", "Stop"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Spectrum(SpectrumBase):
     """Spectrum endpoints wrapper for CMDB API."""
 
+    keep_alive = LazyEndpoint(".keep_alive", "KeepAlive")
+    start = LazyEndpoint(".start", "Start")
+    stop = LazyEndpoint(".stop", "Stop")
+
     def __init__(self, client):
         """Spectrum endpoints.
         
@@ -23,6 +33,4 @@ class Spectrum(SpectrumBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.keep_alive = KeepAlive(client)
-        self.start = Start(client)
-        self.stop = Stop(client)
+        self._client = client
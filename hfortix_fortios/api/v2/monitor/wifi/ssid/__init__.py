@@ -1,20 +1,28 @@
 """FortiOS CMDB - Ssid category"""
 
-from .generate_keys import GenerateKeys
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "GenerateKeys",
     "Ssid",
 ]
 
+_LAZY_IMPORTS = {
+    "GenerateKeys": (".generate_keys", "GenerateKeys"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Ssid:
     """Ssid endpoints wrapper for CMDB API."""
 
+    generate_keys = LazyEndpoint(".generate_keys", "GenerateKeys")
+
     def __init__(self, client):
         """Ssid endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.generate_keys = GenerateKeys(client)
+        self._client = client
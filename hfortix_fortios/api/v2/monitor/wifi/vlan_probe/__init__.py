@@ -1,8 +1,7 @@
 """FortiOS CMDB - VlanProbe category"""
 
 from ..vlan_probe_base import VlanProbe as VlanProbeBase
-from .start import Start
-from .stop import Stop
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Start",
@@ -10,10 +9,20 @@ __all__ = [
     "VlanProbe",
 ]
 
+_LAZY_IMPORTS = {
+    "Start": (".start", "Start"),
+    "Stop": (".stop", "Stop"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class VlanProbe(VlanProbeBase):
     """VlanProbe endpoints wrapper for CMDB API."""
 
+    start = LazyEndpoint(".start", "Start")
+    stop = LazyEndpoint(".stop", "Stop")
+
     def __init__(self, client):
         """VlanProbe endpoints.
         
@@ -21,5 +30,4 @@ class VlanProbe(VlanProbeBase):
             client: HTTP client instance for API communication
         """
         super().__init__(client)  # Initialize base class with GET methods
-        self.start = Start(client)
-        self.stop = Stop(client)
+        self._client = client
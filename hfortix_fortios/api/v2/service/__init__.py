@@ -1,9 +1,6 @@
 """FortiOS CMDB - Service category"""
 
-from . import security_rating
-from . import service
-from . import sniffer
-from . import system
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "SecurityRating",
@@ -13,17 +10,28 @@ __all__ = [
     "System",
 ]
 
+_LAZY_IMPORTS = {
+    "security_rating": (".security_rating", None),
+    "service": (".service", None),
+    "sniffer": (".sniffer", None),
+    "system": (".system", None),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Service:
     """Service endpoints wrapper for CMDB API."""
 
+    security_rating = LazyEndpoint(".security_rating", "SecurityRating")
+    service = LazyEndpoint(".service", "Service")
+    sniffer = LazyEndpoint(".sniffer", "Sniffer")
+    system = LazyEndpoint(".system", "System")
+
     def __init__(self, client):
         """Service endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.security_rating = security_rating.SecurityRating(client)
-        self.service = service.Service(client)
-        self.sniffer = sniffer.Sniffer(client)
-        self.system = system.System(client)
+        self._client = client
@@ -1,7 +1,6 @@
 """FortiOS CMDB - SecurityRating category"""
 
-from .recommendations import Recommendations
-from .report import Report
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Recommendations",
@@ -9,15 +8,24 @@ __all__ = [
     "SecurityRating",
 ]
 
+_LAZY_IMPORTS = {
+    "Recommendations": (".recommendations", "Recommendations"),
+    "Report": (".report", "Report"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class SecurityRating:
     """SecurityRating endpoints wrapper for CMDB API."""
 
+    recommendations = LazyEndpoint(".recommendations", "Recommendations")
+    report = LazyEndpoint(".report", "Report")
+
     def __init__(self, client):
         """SecurityRating endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.recommendations = Recommendations(client)
-        self.report = Report(client)
+        self._client = client
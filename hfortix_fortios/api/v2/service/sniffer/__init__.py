@@ -1,11 +1,6 @@
 """FortiOS CMDB - Sniffer category"""
 
-from .delete import Delete
-from .download import Download
-from .list import List
-from .meta import Meta
-from .start import Start
-from .stop import Stop
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "Delete",
@@ -17,19 +12,32 @@ __all__ = [
     "Stop",
 ]
 
+_LAZY_IMPORTS = {
+    "Delete": (".delete", "Delete"),
+    "Download": (".download", "Download"),
+    "List": (".list", "List"),
+    "Meta": (".meta", "Meta"),
+    "Start": (".start", "Start"),
+    "Stop": (".stop", "Stop"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class Sniffer:
     """Sniffer endpoints wrapper for CMDB API."""
 
+    delete = LazyEndpoint(".delete", "Delete")
+    download = LazyEndpoint(".download", "Download")
+    list = LazyEndpoint(".list", "List")
+    meta = LazyEndpoint(".meta", "Meta")
+    start = LazyEndpoint(".start", "Start")
+    stop = LazyEndpoint(".stop", "Stop")
+
     def __init__(self, client):
         """Sniffer endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.delete = Delete(client)
-        self.download = Download(client)
-        self.list = List(client)
-        self.meta = Meta(client)
-        self.start = Start(client)
-        self.stop = Stop(client)
+        self._client = client
@@ -1,8 +1,6 @@
 """FortiOS CMDB - System category"""
 
-from .fabric_admin_lockout_exists_on_firmware_update import FabricAdminLockoutExistsOnFirmwareUpdate
-from .fabric_time_in_sync import FabricTimeInSync
-from .psirt_vulnerabilities import PsirtVulnerabilities
+from hfortix_fortios.api._lazy import LazyEndpoint, lazy_module_getattr
 
 __all__ = [
     "FabricAdminLockoutExistsOnFirmwareUpdate",
@@ -11,16 +9,26 @@ __all__ = [
     "System",
 ]
 
+_LAZY_IMPORTS = {
+    "FabricAdminLockoutExistsOnFirmwareUpdate": (".fabric_admin_lockout_exists_on_firmware_update", "FabricAdminLockoutExistsOnFirmwareUpdate"),
+    "FabricTimeInSync": (".fabric_time_in_sync", "FabricTimeInSync"),
+    "PsirtVulnerabilities": (".psirt_vulnerabilities", "PsirtVulnerabilities"),
+}
+
+__getattr__ = lazy_module_getattr(__name__, _LAZY_IMPORTS)
+
 
 class System:
     """System endpoints wrapper for CMDB API."""
 
+    fabric_admin_lockout_exists_on_firmware_update = LazyEndpoint(".fabric_admin_lockout_exists_on_firmware_update", "FabricAdminLockoutExistsOnFirmwareUpdate")
+    fabric_time_in_sync = LazyEndpoint(".fabric_time_in_sync", "FabricTimeInSync")
+    psirt_vulnerabilities = LazyEndpoint(".psirt_vulnerabilities", "PsirtVulnerabilities")
+
     def __init__(self, client):
         """System endpoints.
         
         Args:
             client: HTTP client instance for API communication
         """
-        self.fabric_admin_lockout_exists_on_firmware_update = FabricAdminLockoutExistsOnFirmwareUpdate(client)
-        self.fabric_time_in_sync = FabricTimeInSync(client)
-        self.psirt_vulnerabilities = PsirtVulnerabilities(client)
+        self._client = client
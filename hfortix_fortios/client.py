@@ -1,20 +1,475 @@
 from __future__ import annotations
 
 import functools
+import inspect
 import logging
 import os
+import ssl
+import time as _time
 from typing import TYPE_CHECKING, Any, Callable, Literal, Optional, Union, cast, overload
 
 from hfortix_core.audit import AuditHandler
 from hfortix_core.http.client import HTTPClient
 from hfortix_core.http.interface import IHTTPClient
-
+import httpx
+
+from ._helpers.builders import ApiPayload, to_api_fields
+from ._helpers.schema_validator import ValidationMode, check_validation_mode
+from ._helpers.upsert import (
+    UpsertStrategy,
+    check_upsert_strategy,
+    silent_attempt,
+)
 from .api import API
+from .models import process_response
+from .streaming import ResultStream, read_body
 
 if TYPE_CHECKING:
     from .transaction import Transaction
 
-__all__ = ["FortiOS"]
+__all__ = ["FortiOS", "ResponseMode"]
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_ssl_context(verify: bool) -> ssl.SSLContext:
+    """
+    Return a process-wide SSL context for the given verification mode.
+
+    Building an SSL context loads the CA bundle, which costs ~40ms and
+    close to 1MB of memory. httpx would otherwise build one per client, so
+    a process managing hundreds of FortiGates pays that per device. The
+    context is created on first use with the same settings httpx applies
+    for ``verify=True``/``verify=False`` and then reused by every client.
+    """
+    context = httpx.create_ssl_context(verify=verify)
+    # HTTPClient always enables HTTP/2; advertise it like httpx would
+    context.set_alpn_protocols(["http/1.1", "h2"])
+    return context
+
+
+def convert_field_names(data: Any) -> Any:
+    """
+    Convert Python snake_case field names to FortiOS hyphenated names.
+
+    Recursively processes dictionaries and lists to convert all field names
+    from snake_case (Python convention) to hyphenated format (FortiOS API).
+
+    EXCEPTION: Parameters in NO_HYPHEN_PARAMETERS are preserved with underscores
+    because the FortiOS API expects them that way (e.g., file_content).
+
+    Examples:
+        ip6_address -> ip6-address
+        src_addr -> src-addr
+        file_content -> file_content (preserved - in whitelist)
+
+    Args:
+        data: Dictionary, list, or primitive value to convert
+
+    Returns:
+        Converted data with hyphenated field names
+    """
+    return to_api_fields(data)
+
+
+@functools.lru_cache(maxsize=None)
+def _request_takes_silent(client_type: type) -> bool:
+    """Whether the (sync) HTTP client's request() has a ``silent`` option."""
+    request = getattr(client_type, "request", None)
+    if request is None or inspect.iscoroutinefunction(request):
+        return False
+    return "silent" in inspect.signature(request).parameters
+
+
+def _request_body(data: Any) -> Any:
+    """
+    Request body in FortiOS API format.
+
+    Payloads from ``build_api_payload`` are already translated in a single
+    pass and are sent as-is; any other dict is converted here.
+    """
+    if not data:
+        return None
+    if isinstance(data, ApiPayload):
+        return data
+    return convert_field_names(data)
+
+
+ResponseMode = Literal["object", "dict", "raw_bytes", "stream"]
+
+RESPONSE_MODES: frozenset[str] = frozenset(
+    {"object", "dict", "raw_bytes", "stream"}
+)
+
+
+def _check_response_mode(response_mode: str) -> None:
+    """Raise ValueError for an unknown response mode."""
+    if response_mode not in RESPONSE_MODES:
+        raise ValueError(
+            f"Invalid response_mode '{response_mode}'. "
+            f"Must be one of: {', '.join(sorted(RESPONSE_MODES))}"
+        )
+
+
+class ResponseProcessingClient:
+    """Wrapper that automatically processes responses with FortiObject.
+
+    Defined once at module level (rather than per FortiOS instance) so that
+    each client only pays for a slotted wrapper instance, not a new class.
+
+    The ``response_mode`` decides what the endpoint methods return:
+
+    - ``"object"``: FortiObject/FortiObjectList with timing and request
+      info (default)
+    - ``"dict"``: the decoded API envelope as a plain dict, untimed and
+      unwrapped
+    - ``"raw_bytes"``: the undecoded response body of GET requests;
+      POST/PUT/DELETE behave like ``"dict"``
+    - ``"stream"``: GET requests return a ResultStream that decodes the
+      ``results`` items incrementally; POST/PUT/DELETE behave like
+      ``"dict"``
+
+    ``"raw_bytes"`` and ``"stream"`` GETs are sent through
+    ``streaming.open_stream()``, which applies the request pipeline of
+    the HTTP client (vdom rules, transaction header, circuit breaker,
+    retries, statistics and auditing) except rate limiting.
+
+    Every method also accepts ``response_mode`` to override the default for
+    a single call. Silent GETs are the existence probes of the generated
+    ``exists()`` helpers, which read ``.http_status`` from the result, so
+    they are always processed in ``"object"`` mode.
+
+    ``validation`` is the client-side payload validation mode read by the
+    generated ``post()``/``put()`` methods before they send a request, and
+    ``upsert_strategy`` the default strategy of the generated ``set()``
+    methods.
+    """
+
+    __slots__ = (
+        "_wrapped_client",
+        "_response_mode",
+        "_validation",
+        "_upsert_strategy",
+    )
+
+    def __init__(
+        self,
+        client: Any,
+        response_mode: ResponseMode = "object",
+        validation: ValidationMode = "off",
+        upsert_strategy: UpsertStrategy = "check",
+    ):
+        _check_response_mode(response_mode)
+        check_validation_mode(validation)
+        check_upsert_strategy(upsert_strategy)
+        self._wrapped_client = client
+        self._response_mode = response_mode
+        self._validation = validation
+        self._upsert_strategy = upsert_strategy
+
+    @property
+    def response_mode(self) -> ResponseMode:
+        """Default response mode of this wrapper"""
+        return self._response_mode
+
+    @property
+    def validation(self) -> ValidationMode:
+        """Client-side payload validation mode ("off", "fast" or "strict")"""
+        return self._validation
+
+    @property
+    def upsert_strategy(self) -> UpsertStrategy:
+        """Default set() strategy ("check", "post_first" or "put_first")"""
+        return self._upsert_strategy
+
+    def _request_info(
+        self, method: str, api_type: str, path: str, data: Any = None
+    ) -> Any:
+        """
+        Return _last_request if it belongs to this request, else None.
+
+        Concurrent requests (bulk operations, parallel pagination, async
+        tasks) share the HTTP client's ``_last_request``, so it is only
+        attached when method and endpoint match, and for POST/PUT when it
+        carries this request's body.
+        """
+        info = getattr(self._wrapped_client, "_last_request", None)
+        if not info or info.get("method") != method:
+            return None
+        if data is not None and info.get("data") is not data:
+            return None
+        endpoint = f"/api/v2/{api_type}/{path.lstrip('/')}"
+        return info if info.get("endpoint") == endpoint else None
+
+    def get(
+        self,
+        api_type: str,
+        path: str,
+        params=None,
+        vdom=None,
+        unwrap_single=False,
+        silent=False,
+        response_mode: Optional[ResponseMode] = None,
+    ):
+        """GET request with automatic response processing.
+
+        Returns FortiObject/FortiObjectList with .raw property for accessing
+        the full API envelope, unless a ``"dict"`` or ``"raw_bytes"``
+        response mode is in effect.
+        """
+        mode = "object" if silent else response_mode or self._response_mode
+        if mode != "object":
+            _check_response_mode(mode)
+        if mode == "dict":
+            return self._wrapped_client.get(
+                api_type, path, params, vdom, raw_json=True, silent=silent
+            )
+        if mode == "stream":
+            return ResultStream(
+                self._wrapped_client, api_type, path, params, vdom
+            )
+        if mode == "raw_bytes":
+            return read_body(
+                self._wrapped_client, api_type, path, params, vdom
+            )
+
+        # Always get full response to store in .raw property
+        start_time = _time.perf_counter()
+        result = self._wrapped_client.get(
+            api_type, path, params, vdom, raw_json=True, silent=silent
+        )
+        response_time = _time.perf_counter() - start_time
+        request_info = self._request_info("GET", api_type, path)
+
+        return process_response(result, unwrap_single=unwrap_single, raw_envelope=result, response_time=response_time, request_info=request_info)  # type: ignore
+
+    def post(
+        self,
+        api_type: str,
+        path: str,
+        data=None,
+        params=None,
+        vdom=None,
+        response_mode: Optional[ResponseMode] = None,
+    ):
+        """POST request with automatic response processing."""
+        mode = response_mode or self._response_mode
+        if mode != "object":
+            _check_response_mode(mode)
+        start_time = _time.perf_counter()
+        # Convert Python snake_case field names to FortiOS hyphenated format
+        converted_data = _request_body(data)
+        result = self._send("POST", api_type, path, converted_data, params, vdom)
+        if mode != "object":
+            return result
+        response_time = _time.perf_counter() - start_time
+        request_info = self._request_info(
+            "POST", api_type, path, converted_data
+        )
+
+        return process_response(result, raw_envelope=result, response_time=response_time, request_info=request_info)  # type: ignore
+
+    def put(
+        self,
+        api_type: str,
+        path: str,
+        data=None,
+        params=None,
+        vdom=None,
+        response_mode: Optional[ResponseMode] = None,
+    ):
+        """PUT request with automatic response processing."""
+        mode = response_mode or self._response_mode
+        if mode != "object":
+            _check_response_mode(mode)
+        start_time = _time.perf_counter()
+        # Convert Python snake_case field names to FortiOS hyphenated format
+        converted_data = _request_body(data)
+        result = self._send("PUT", api_type, path, converted_data, params, vdom)
+        if mode != "object":
+            return result
+        response_time = _time.perf_counter() - start_time
+        request_info = self._request_info(
+            "PUT", api_type, path, converted_data
+        )
+
+        return process_response(result, raw_envelope=result, response_time=response_time, request_info=request_info)  # type: ignore
+
+    def _send(self, method, api_type, path, data, params, vdom):
+        """
+        Send a POST/PUT and return the raw envelope.
+
+        The first attempt of a ``post_first``/``put_first`` upsert expects
+        to fail; it is sent with ``silent=True`` when the HTTP client
+        supports it, so the expected error is not logged.
+        """
+        client = self._wrapped_client
+        if silent_attempt() and _request_takes_silent(type(client)):
+            return client.request(
+                method,
+                api_type,
+                path,
+                data=data,
+                params=params,
+                vdom=vdom,
+                raw_json=True,
+                silent=True,
+            )
+        send = client.post if method == "POST" else client.put
+        return send(api_type, path, data, params, vdom, raw_json=True)
+
+    def delete(
+        self,
+        api_type: str,
+        path: str,
+        params=None,
+        vdom=None,
+        response_mode: Optional[ResponseMode] = None,
+    ):
+        """DELETE request with automatic response processing."""
+        mode = response_mode or self._response_mode
+        if mode != "object":
+            _check_response_mode(mode)
+        start_time = _time.perf_counter()
+        result = self._wrapped_client.delete(
+            api_type, path, params, vdom, raw_json=True
+        )
+        if mode != "object":
+            return result
+        response_time = _time.perf_counter() - start_time
+        request_info = self._request_info("DELETE", api_type, path)
+
+        return process_response(result, raw_envelope=result, response_time=response_time, request_info=request_info)  # type: ignore
+
+    def __getattr__(self, name):
+        """Delegate all other attributes to the wrapped client."""
+        return getattr(self._wrapped_client, name)
+
+
+class AsyncResponseProcessingClient(ResponseProcessingClient):
+    """ResponseProcessingClient for async HTTP clients.
+
+    The wrapped client returns coroutines, so the object mode awaits them
+    before timing and wrapping the result. Endpoint methods still return an
+    awaitable (``await fgt.api.cmdb.firewall.address.get()``) that now
+    resolves to FortiObject/FortiObjectList with a real
+    ``http_response_time``. The other response modes are handled by the
+    base class, which returns the wrapped client's coroutine untouched (or
+    a ResultStream for ``"stream"``).
+    """
+
+    __slots__ = ()
+
+    def get(
+        self,
+        api_type: str,
+        path: str,
+        params=None,
+        vdom=None,
+        unwrap_single=False,
+        silent=False,
+        response_mode: Optional[ResponseMode] = None,
+    ):
+        """GET request; returns a coroutine resolving to the processed result."""
+        # AsyncHTTPClient.get() has no ``silent`` parameter
+        mode = "object" if silent else response_mode or self._response_mode
+        if mode == "dict":
+            return self._wrapped_client.get(
+                api_type, path, params, vdom, raw_json=True
+            )
+        if mode != "object":
+            return super().get(
+                api_type, path, params, vdom, unwrap_single, silent, mode
+            )
+        return self._get_object(api_type, path, params, vdom, unwrap_single)
+
+    async def _get_object(self, api_type, path, params, vdom, unwrap_single):
+        start_time = _time.perf_counter()
+        result = await self._wrapped_client.get(
+            api_type, path, params, vdom, raw_json=True
+        )
+        response_time = _time.perf_counter() - start_time
+        request_info = self._request_info("GET", api_type, path)
+        return process_response(result, unwrap_single=unwrap_single, raw_envelope=result, response_time=response_time, request_info=request_info)  # type: ignore
+
+    def post(
+        self,
+        api_type: str,
+        path: str,
+        data=None,
+        params=None,
+        vdom=None,
+        response_mode: Optional[ResponseMode] = None,
+    ):
+        """POST request; returns a coroutine resolving to the processed result."""
+        mode = response_mode or self._response_mode
+        if mode != "object":
+            return super().post(api_type, path, data, params, vdom, mode)
+        return self._mutate_object("POST", api_type, path, data, params, vdom)
+
+    def put(
+        self,
+        api_type: str,
+        path: str,
+        data=None,
+        params=None,
+        vdom=None,
+        response_mode: Optional[ResponseMode] = None,
+    ):
+        """PUT request; returns a coroutine resolving to the processed result."""
+        mode = response_mode or self._response_mode
+        if mode != "object":
+            return super().put(api_type, path, data, params, vdom, mode)
+        return self._mutate_object("PUT", api_type, path, data, params, vdom)
+
+    def delete(
+        self,
+        api_type: str,
+        path: str,
+        params=None,
+        vdom=None,
+        response_mode: Optional[ResponseMode] = None,
+    ):
+        """DELETE request; returns a coroutine resolving to the processed result."""
+        mode = response_mode or self._response_mode
+        if mode != "object":
+            return super().delete(api_type, path, params, vdom, mode)
+        return self._mutate_object("DELETE", api_type, path, None, params, vdom)
+
+    async def _mutate_object(self, method, api_type, path, data, params, vdom):
+        start_time = _time.perf_counter()
+        if method == "DELETE":
+            result = await self._wrapped_client.delete(
+                api_type, path, params, vdom, raw_json=True
+            )
+        else:
+            # Convert Python snake_case field names to FortiOS hyphenated format
+            converted_data = _request_body(data)
+            send = (
+                self._wrapped_client.post
+                if method == "POST"
+                else self._wrapped_client.put
+            )
+            result = await send(api_type, path, converted_data, params, vdom, raw_json=True)  # type: ignore
+            data = converted_data
+        response_time = _time.perf_counter() - start_time
+        request_info = self._request_info(method, api_type, path, data)
+        return process_response(result, raw_envelope=result, response_time=response_time, request_info=request_info)  # type: ignore
+
+
+def _processing_client(
+    client: Any,
+    response_mode: ResponseMode,
+    validation: ValidationMode = "off",
+    upsert_strategy: UpsertStrategy = "check",
+) -> ResponseProcessingClient:
+    """Wrap ``client`` in the processing client matching its sync/async API."""
+    if inspect.iscoroutinefunction(getattr(client, "get", None)):
+        return AsyncResponseProcessingClient(
+            client, response_mode, validation, upsert_strategy
+        )
+    return ResponseProcessingClient(
+        client, response_mode, validation, upsert_strategy
+    )
 
 
 class FortiOS:
@@ -110,6 +565,9 @@ class FortiOS:
         audit_callback: Optional[Any] = None,
         user_context: Optional[dict[str, Any]] = None,
         trace_id: Optional[str] = None,
+        response_mode: ResponseMode = "object",
+        validate: ValidationMode = "off",
+        upsert_strategy: UpsertStrategy = "check",
     ) -> None:
         """Synchronous FortiOS client (default)"""
         ...
@@ -152,6 +610,9 @@ class FortiOS:
         audit_callback: Optional[Any] = None,
         user_context: Optional[dict[str, Any]] = None,
         trace_id: Optional[str] = None,
+        response_mode: ResponseMode = "object",
+        validate: ValidationMode = "off",
+        upsert_strategy: UpsertStrategy = "check",
     ) -> None:
         """Asynchronous FortiOS client"""
         ...
@@ -193,6 +654,9 @@ class FortiOS:
         audit_callback: Optional[Any] = None,
         user_context: Optional[dict[str, Any]] = None,
         trace_id: Optional[str] = None,
+        response_mode: ResponseMode = "object",
+        validate: ValidationMode = "off",
+        upsert_strategy: UpsertStrategy = "check",
     ) -> None:
         """
         Initialize FortiOS API client (sync or async mode)
@@ -391,6 +855,44 @@ class FortiOS:
                      Useful for debugging and distributed tracing systems
                      (Jaeger, Zipkin, etc.).
                      Example: "request-12345" or UUID
+            response_mode: What endpoint methods return (default: "object").
+
+                - "object": FortiObject/FortiObjectList wrappers with
+                  timing and request info
+                - "dict": the decoded API envelope as a plain dict,
+                  skipping wrapping and timing (bulk export, ETL)
+                - "raw_bytes": the undecoded response body for GET
+                  requests, skipping JSON decoding as well;
+                  POST/PUT/DELETE return the envelope dict
+                - "stream": GET requests return a ResultStream that
+                  yields the results while the body is still being
+                  received (constant memory for very large responses);
+                  POST/PUT/DELETE return the envelope dict
+
+                Use with_response_mode() to switch modes for individual
+                calls. Helpers such as exists() keep working in every
+                mode.
+            validate: Client-side payload validation before POST/PUT
+                requests are sent (default: "off").
+
+                - "off": no checks, payloads are sent as built
+                - "fast": option values, string lengths and numeric
+                  ranges, compiled from the endpoint schema metadata
+                - "strict": additionally integer types and table
+                  children (required fields are not checked: the schema
+                  lists fields that are only conditionally required)
+
+                Invalid payloads raise PayloadValidationError listing
+                every bad field, without a round trip to the FortiGate.
+            upsert_strategy: How the generated set() methods create or
+                update an object (default: "check"); override per call
+                with set(..., upsert_strategy=...).
+
+                - "check": exists() then put() or post() (two requests)
+                - "post_first": POST, then PUT on a duplicate-entry
+                  error (one request for new objects)
+                - "put_first": PUT, then POST on 404 (one request for
+                  existing objects)
 
         Important:
             Username/password authentication still works in FortiOS 7.4.x but
@@ -562,6 +1064,13 @@ class FortiOS:
         self._error_format: Literal["detailed", "simple", "code_only"] = (
             error_format
         )
+        _check_response_mode(response_mode)
+        check_validation_mode(validate)
+        check_upsert_strategy(upsert_strategy)
+        self._response_mode: ResponseMode = response_mode
+        self._validate: ValidationMode = validate
+        self._upsert_strategy: UpsertStrategy = upsert_strategy
+        self._api_views: dict[str, API] = {}
         
         # Transaction tracking
         self._active_transaction: Optional[Transaction] = None
@@ -614,13 +1123,20 @@ class FortiOS:
                     "host parameter is required when not providing a custom client"  # noqa: E501
                 )
 
+            # Share one SSL context per verification mode across clients
+            ssl_verify: Any = (
+                _shared_ssl_context(verify)
+                if isinstance(verify, bool)
+                else verify
+            )
+
             # Create default client based on mode
             if mode == "async":
                 from hfortix_core.http.async_client import AsyncHTTPClient
 
                 self._client = AsyncHTTPClient(
                     url=url,
-                    verify=verify,
+                    verify=ssl_verify,
                     token=token,
                     username=username,
                     password=password,
@@ -649,7 +1165,7 @@ class FortiOS:
             else:
                 self._client = HTTPClient(
                     url=url,
-                    verify=verify,
+                    verify=ssl_verify,
                     token=token,
                     username=username,
                     password=password,
@@ -676,141 +1192,12 @@ class FortiOS:
                     user_context=user_context,  # type: ignore[call-arg]
                 )
 
-        # Wrap the client to enable response processing (object mode)
-        from hfortix_fortios.models import process_response
-        from hfortix_fortios._helpers.field_overrides import NO_HYPHEN_PARAMETERS
-        import time as _time
-
-        def convert_field_names(data: Any) -> Any:
-            """
-            Convert Python snake_case field names to FortiOS hyphenated names.
-            
-            Recursively processes dictionaries and lists to convert all field names
-            from snake_case (Python convention) to hyphenated format (FortiOS API).
-            
-            EXCEPTION: Parameters in NO_HYPHEN_PARAMETERS are preserved with underscores
-            because the FortiOS API expects them that way (e.g., file_content).
-            
-            Examples:
-                ip6_address -> ip6-address
-                src_addr -> src-addr
-                file_content -> file_content (preserved - in whitelist)
-                
-            Args:
-                data: Dictionary, list, or primitive value to convert
-                
-            Returns:
-                Converted data with hyphenated field names
-            """
-            if isinstance(data, dict):
-                return {
-                    key if key in NO_HYPHEN_PARAMETERS else key.replace("_", "-"): convert_field_names(value)
-                    for key, value in data.items()
-                }
-            elif isinstance(data, list):
-                return [convert_field_names(item) for item in data]
-            else:
-                return data
-
-        class ResponseProcessingClient:
-            """Wrapper that automatically processes responses with FortiObject."""
-
-            def __init__(self, client: Any):
-                self._wrapped_client = client
-
-            def get(
-                self,
-                api_type: str,
-                path: str,
-                params=None,
-                vdom=None,
-                unwrap_single=False,
-                silent=False,
-            ):
-                """GET request with automatic response processing.
-                
-                Always returns FortiObject/FortiObjectList with .raw property
-                for accessing the full API envelope.
-                """
-                # Always get full response to store in .raw property
-                start_time = _time.perf_counter()
-                result = self._wrapped_client.get(
-                    api_type, path, params, vdom, raw_json=True, silent=silent
-                )
-                response_time = _time.perf_counter() - start_time
-                
-                # Get request info from the HTTP client
-                request_info = getattr(self._wrapped_client, '_last_request', None)
-                
-                return process_response(result, unwrap_single=unwrap_single, raw_envelope=result, response_time=response_time, request_info=request_info)  # type: ignore
-
-            def post(
-                self,
-                api_type: str,
-                path: str,
-                data=None,
-                params=None,
-                vdom=None,
-            ):
-                """POST request with automatic response processing."""
-                start_time = _time.perf_counter()
-                # Convert Python snake_case field names to FortiOS hyphenated format
-                converted_data = convert_field_names(data) if data else None
-                result = self._wrapped_client.post(api_type, path, converted_data, params, vdom, raw_json=True)  # type: ignore
-                response_time = _time.perf_counter() - start_time
-                
-                # Get request info from the HTTP client
-                request_info = getattr(self._wrapped_client, '_last_request', None)
-                
-                return process_response(result, raw_envelope=result, response_time=response_time, request_info=request_info)  # type: ignore
-
-            def put(
-                self,
-                api_type: str,
-                path: str,
-                data=None,
-                params=None,
-                vdom=None,
-            ):
-                """PUT request with automatic response processing."""
-                start_time = _time.perf_counter()
-                # Convert Python snake_case field names to FortiOS hyphenated format
-                converted_data = convert_field_names(data) if data else None
-                result = self._wrapped_client.put(api_type, path, converted_data, params, vdom, raw_json=True)  # type: ignore
-                response_time = _time.perf_counter() - start_time
-                
-                # Get request info from the HTTP client
-                request_info = getattr(self._wrapped_client, '_last_request', None)
-                
-                return process_response(result, raw_envelope=result, response_time=response_time, request_info=request_info)  # type: ignore
-
-            def delete(
-                self,
-                api_type: str,
-                path: str,
-                params=None,
-                vdom=None,
-            ):
-                """DELETE request with automatic response processing."""
-                start_time = _time.perf_counter()
-                result = self._wrapped_client.delete(
-                    api_type, path, params, vdom, raw_json=True
-                )
-                response_time = _time.perf_counter() - start_time
-                
-                # Get request info from the HTTP client
-                request_info = getattr(self._wrapped_client, '_last_request', None)
-                
-                return process_response(result, raw_envelope=result, response_time=response_time, request_info=request_info)  # type: ignore
-
-            def __getattr__(self, name):
-                """Delegate all other attributes to the wrapped client."""
-                return getattr(self._wrapped_client, name)
-
         # Wrap client for automatic response processing and cast to IHTTPClient for type checking
         wrapped_client = cast(
             IHTTPClient,
-            ResponseProcessingClient(self._client),
+            _processing_client(
+                self._client, response_mode, validate, upsert_strategy
+            ),
         )
 
         # Initialize API namespace.
@@ -989,6 +1376,71 @@ class FortiOS:
         """Default error message format for convenience wrappers"""
         return self._error_format
 
+    @property
+    def response_mode(self) -> ResponseMode:
+        """Default response mode of the api namespace"""
+        return self._response_mode
+
+    @property
+    def validate(self) -> ValidationMode:
+        """Client-side payload validation mode ("off", "fast" or "strict")"""
+        return self._validate
+
+    @property
+    def upsert_strategy(self) -> UpsertStrategy:
+        """Default set() strategy ("check", "post_first" or "put_first")"""
+        return self._upsert_strategy
+
+    def with_response_mode(self, response_mode: ResponseMode) -> API:
+        """
+        Return an API namespace that returns results in another mode.
+
+        The namespace shares this client's connection pool, credentials and
+        settings; only the post-processing of responses differs. Views are
+        cached, so calling this in a loop is cheap.
+
+        Args:
+            response_mode: "object", "dict", "raw_bytes" or "stream"
+                (see __init__)
+
+        Returns:
+            API namespace bound to the requested response mode
+
+        Raises:
+            ValueError: If response_mode is not a valid mode
+
+        Example:
+            >>> fgt = FortiOS("192.0.2.10", token="...")
+            >>> # Plain dict envelope for a bulk export
+            >>> envelope = fgt.with_response_mode("dict").cmdb.firewall.address.get()
+            >>> rows = envelope["results"]
+            >>>
+            >>> # Undecoded body, e.g. to stream straight to disk
+            >>> body = fgt.with_response_mode("raw_bytes").cmdb.firewall.policy.get()
+            >>>
+            >>> # Rows decoded while they arrive, constant memory
+            >>> sessions = fgt.with_response_mode("stream").monitor.firewall.sessions.get()
+            >>> for session in sessions:
+            ...     process(session)
+            >>> sessions.matched_count
+        """
+        if response_mode == self._response_mode:
+            return self._api
+        view = self._api_views.get(response_mode)
+        if view is None:
+            _check_response_mode(response_mode)
+            wrapped_client = cast(
+                IHTTPClient,
+                _processing_client(
+                    self._client,
+                    response_mode,
+                    self._validate,
+                    self._upsert_strategy,
+                ),
+            )
+            view = self._api_views[response_mode] = API(wrapped_client)
+        return view
+
     def request(
         self,
         config: dict[str, Any],
@@ -9,6 +9,10 @@ from hfortix_core.audit import AuditHandler
 from hfortix_fortios.api import API
 from hfortix_fortios.transaction import Transaction
 
+ResponseMode = Literal["object", "dict", "raw_bytes", "stream"]
+ValidationMode = Literal["off", "fast", "strict"]
+UpsertStrategy = Literal["check", "post_first", "put_first"]
+
 class FortiOS:
     """FortiOS REST API Client.
 
@@ -57,6 +61,9 @@ class FortiOS:
         audit_callback: Any | None = None,
         user_context: dict[str, Any] | None = None,
         trace_id: str | None = None,
+        response_mode: ResponseMode = "object",
+        validate: ValidationMode = "off",
+        upsert_strategy: UpsertStrategy = "check",
     ) -> None:
         """Initialize sync FortiOS client."""
         ...
@@ -99,6 +106,9 @@ class FortiOS:
         audit_callback: Any | None = None,
         user_context: dict[str, Any] | None = None,
         trace_id: str | None = None,
+        response_mode: ResponseMode = "object",
+        validate: ValidationMode = "off",
+        upsert_strategy: UpsertStrategy = "check",
     ) -> None:
         """Initialize async FortiOS client."""
         ...
@@ -123,6 +133,13 @@ class FortiOS:
     @property
     def error_format(self) -> Literal["detailed", "simple", "code_only"]: ...
     @property
+    def response_mode(self) -> ResponseMode: ...
+    @property
+    def validate(self) -> ValidationMode: ...
+    @property
+    def upsert_strategy(self) -> UpsertStrategy: ...
+    def with_response_mode(self, response_mode: ResponseMode) -> API: ...
+    @property
     def connection_stats(self) -> dict[str, Any]: ...
     @property
     def last_request(self) -> dict[str, Any] | None: ...
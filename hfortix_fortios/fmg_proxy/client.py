@@ -598,53 +598,14 @@ class ProxiedFortiOS:
         if self._api is None:
             # Import here to avoid circular imports
             from hfortix_fortios.api import API
-            from hfortix_fortios.models import process_response
-            import time as _time
-            
-            # Create a response-processing wrapper (like FortiOS client does)
-            proxy_client = self._proxy_client
-            
-            class ResponseProcessingClient:
-                """Wrapper that automatically processes responses with FortiObject."""
-                
-                def __init__(self, client):
-                    self._wrapped_client = client
-                
-                def get(self, api_type, path, params=None, vdom=None, unwrap_single=False):
-                    start_time = _time.perf_counter()
-                    result = self._wrapped_client.get(api_type, path, params, vdom, raw_json=True)
-                    response_time = _time.perf_counter() - start_time
-                    request_info = getattr(self._wrapped_client, '_last_request', None)
-                    return process_response(result, unwrap_single=unwrap_single, raw_envelope=result, response_time=response_time, request_info=request_info)
-                
-                def post(self, api_type, path, data=None, params=None, vdom=None):
-                    start_time = _time.perf_counter()
-                    result = self._wrapped_client.post(api_type, path, data, params, vdom, raw_json=True)
-                    response_time = _time.perf_counter() - start_time
-                    request_info = getattr(self._wrapped_client, '_last_request', None)
-                    return process_response(result, raw_envelope=result, response_time=response_time, request_info=request_info)
-                
-                def put(self, api_type, path, data=None, params=None, vdom=None):
-                    start_time = _time.perf_counter()
-                    result = self._wrapped_client.put(api_type, path, data, params, vdom, raw_json=True)
-                    response_time = _time.perf_counter() - start_time
-                    request_info = getattr(self._wrapped_client, '_last_request', None)
-                    return process_response(result, raw_envelope=result, response_time=response_time, request_info=request_info)
-                
-                def delete(self, api_type, path, params=None, vdom=None):
-                    start_time = _time.perf_counter()
-                    result = self._wrapped_client.delete(api_type, path, params, vdom, raw_json=True)
-                    response_time = _time.perf_counter() - start_time
-                    request_info = getattr(self._wrapped_client, '_last_request', None)
-                    return process_response(result, raw_envelope=result, response_time=response_time, request_info=request_info)
-                
-                def __getattr__(self, name):
-                    return getattr(self._wrapped_client, name)
-            
-            from typing import cast
+            from hfortix_fortios.client import _processing_client
             from hfortix_core.http.interface import IHTTPClient
-            
-            wrapped_client = cast(IHTTPClient, ResponseProcessingClient(proxy_client))
+
+            # Same response processing as the FortiOS client, so the
+            # endpoint helpers' response_mode/silent GETs work here too
+            wrapped_client = cast(
+                IHTTPClient, _processing_client(self._proxy_client, "object")
+            )
             self._api = API(wrapped_client)
         
         return self._api
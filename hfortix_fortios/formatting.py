@@ -9,7 +9,9 @@ Never raises exceptions - returns sensible defaults for edge cases.
 from __future__ import annotations
 
 import json
-from typing import Any
+import sys
+from array import array
+from typing import Any, Iterable, Iterator
 
 __all__ = [
     "to_json",
@@ -25,6 +27,7 @@ __all__ = [
     "to_markdown_table",
     "to_dictlist",
     "to_listdict",
+    "to_columns",
 ]
 
 
@@ -868,3 +871,155 @@ def to_listdict(data: Any) -> dict[str, list[Any]]:
             result[key].append(item.get(key, None))
 
     return result
+
+
+def to_columns(
+    data: Any,
+    fields: Iterable[str] | None = None,
+    numpy: bool = False,
+) -> dict[str, Any]:
+    """
+    Convert API results to a dict of typed column arrays.
+
+    Builds every column in a single pass over the rows, interning the
+    column names. Each column is then stored in the most compact type that
+    holds all of its values:
+
+    - all ints -> ``array('q')``
+    - ints and floats -> ``array('d')``
+    - anything else (strings, bools, None, nested tables) -> ``list``
+
+    With ``numpy=True`` the columns are NumPy arrays instead (int64,
+    float64, bool, fixed-width unicode for all-string columns, object
+    otherwise), so aggregations can be vectorized.
+
+    Rows missing a field get ``None`` in that column. Unlike the other
+    helpers in this module, ``numpy=True`` raises ImportError when NumPy
+    is not installed.
+
+    Args:
+        data: FortiObjectList, list of dicts/FortiObjects, a response
+            envelope with a ``results`` list, or a single dict/FortiObject
+        fields: Columns to extract, in order (default: every key seen)
+        numpy: Return NumPy arrays instead of array/list columns
+
+    Returns:
+        Dict mapping field name to column
+
+    Examples:
+        >>> sessions = fgt.api.monitor.firewall.sessions.get(count=1000)
+        >>> cols = to_columns(sessions, fields=["proto", "sentbyte"])
+        >>> cols["sentbyte"]
+        array('q', [1520, 88, 40213, ...])
+        >>> sum(cols["sentbyte"])
+        4112789
+
+        >>> to_columns([{'name': 'p1', 'port': 80}, {'name': 'p2'}])
+        {'name': ['p1', 'p2'], 'port': [80, None]}
+
+        >>> to_columns(None)
+        {}
+    """
+    np = None
+    if numpy:
+        try:
+            import numpy as np
+        except ImportError:
+            raise ImportError(
+                "numpy=True requires NumPy. Install it with: pip install numpy"
+            ) from None
+
+    intern = sys.intern
+    columns: dict[str, list[Any]] = {}
+    if fields is not None:
+        names = [intern(name) for name in fields]
+        appends = [
+            (name, columns.setdefault(name, []).append) for name in names
+        ]
+        for row in _column_rows(data):
+            get = row.get
+            for name, append in appends:
+                append(get(name))
+    else:
+        known = columns.keys()
+        appends: dict[str, Any] = {}
+        count = 0
+        for row in _column_rows(data):
+            if row.keys() == known:
+                # Same fields as every column so far (the common case)
+                for key, value in row.items():
+                    appends[key](value)
+            else:
+                for key, value in row.items():
+                    column = columns.get(key)
+                    if column is None:
+                        column = columns[intern(key)] = [None] * count
+                        appends[key] = column.append
+                    column.append(value)
+                # Pad the columns this row does not have
+                for column in columns.values():
+                    if len(column) == count:
+                        column.append(None)
+            count += 1
+
+    return {
+        name: _typed_column(values, np)
+        for name, values in columns.items()
+    }
+
+
+def _column_rows(data: Any) -> Iterator[dict[str, Any]]:
+    """Yield the rows of ``data`` as dicts for to_columns()."""
+    if data is None:
+        return
+    if isinstance(data, dict):
+        results = data.get("results")
+        if isinstance(results, list):
+            data = results
+        else:
+            yield data
+            return
+    elif hasattr(data, "to_dict") and not isinstance(data, list):
+        yield data.to_dict()
+        return
+    elif hasattr(data, "dict") and isinstance(data, list):
+        # FortiObjectList: plain dicts without wrapping each item
+        data = data.dict
+    if not isinstance(data, (list, tuple)):
+        yield {"value": data}
+        return
+    for item in data:
+        if isinstance(item, dict):
+            yield item
+        elif hasattr(item, "to_dict"):
+            yield item.to_dict()
+        else:
+            yield {"value": item}
+
+
+def _typed_column(values: list[Any], np: Any = None) -> Any:
+    """Store one column in the most compact type that holds its values."""
+    kinds = set(map(type, values))
+    if np is not None:
+        if kinds == {int}:
+            try:
+                return np.array(values, dtype=np.int64)
+            except OverflowError:
+                return np.array(values, dtype=object)
+        if kinds and kinds <= {int, float}:
+            return np.array(values, dtype=np.float64)
+        if kinds == {bool}:
+            return np.array(values, dtype=np.bool_)
+        if kinds == {str}:
+            return np.array(values, dtype=np.str_)
+        column = np.empty(len(values), dtype=object)
+        column[:] = values
+        return column
+    if kinds == {int}:
+        try:
+            return array("q", values)
+        except OverflowError:
+            return values
+    if kinds and kinds <= {int, float}:
+        return array("d", values)
+    return values
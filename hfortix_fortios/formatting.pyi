@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Iterable
 
 __all__ = [
     "to_json",
@@ -18,6 +18,7 @@ __all__ = [
     "to_markdown_table",
     "to_dictlist",
     "to_listdict",
+    "to_columns",
 ]
 
 def to_json(data: Any, indent: int = 2, **kwargs: Any) -> str:
@@ -193,3 +194,26 @@ def to_listdict(data: Any) -> dict[str, list[Any]]:
         Dictionary of lists (columnar format)
     """
     ...
+
+def to_columns(
+    data: Any,
+    fields: Iterable[str] | None = None,
+    numpy: bool = False,
+) -> dict[str, Any]:
+    """
+    Convert API results to a dict of typed column arrays.
+
+    Builds every column in one pass. All-int columns become array('q'),
+    numeric columns array('d') and the rest lists; with numpy=True every
+    column is a NumPy array.
+
+    Args:
+        data: FortiObjectList, list of dicts/FortiObjects, a response
+            envelope with a ``results`` list, or a single dict/FortiObject
+        fields: Columns to extract, in order (default: every key seen)
+        numpy: Return NumPy arrays instead of array/list columns
+
+    Returns:
+        Dict mapping field name to column
+    """
+    ...
@@ -7,7 +7,7 @@ Provides zero-maintenance object wrappers for FortiOS API responses.
 from __future__ import annotations
 
 import json as json_module
-from typing import Any, Iterator
+from typing import Any, ClassVar, Iterator
 
 
 # API field to Python keyword mapping (reverse of PYTHON_KEYWORD_TO_API_FIELD)
@@ -21,6 +21,20 @@ API_FIELD_TO_PYTHON_KEYWORD = {
     "global": "global_",  # Global fields
 }
 
+# Python attribute name -> API field for keyword-mapped fields (e.g. 'asn' -> 'as')
+# Built once here instead of on every attribute access
+PYTHON_KEYWORD_TO_API_FIELD = {
+    python_name: api_field
+    for api_field, python_name in API_FIELD_TO_PYTHON_KEYWORD.items()
+}
+
+# Upper bound for FortiObject._key_cache so arbitrary lookups (e.g. .get()
+# with user-supplied keys) cannot grow it without limit
+_KEY_CACHE_MAX_SIZE = 4096
+
+# Sentinel for "key not present" (None is a valid field value)
+_MISSING = object()
+
 
 class FortiObject:
     """
@@ -67,6 +81,17 @@ class FortiObject:
         raw_envelope: Optional full API response envelope (with http_status, results, etc.)
     """
 
+    __slots__ = (
+        "_data",
+        "_raw_envelope",
+        "_response_time",
+        "_request_info",
+        "_children",
+    )
+
+    # Python name -> hyphenated API key, shared by all instances of the class
+    _key_cache: ClassVar[dict[str, str]] = {}
+
     def __init__(
         self,
         data: dict,
@@ -87,6 +112,8 @@ class FortiObject:
         self._raw_envelope = raw_envelope
         self._response_time = response_time
         self._request_info = request_info
+        # field -> (raw value, wrapper); created on first nested access
+        self._children: dict[str, tuple[Any, Any]] | None = None
 
     # ========================================================================
     # Explicit envelope properties (for autocomplete - these are common fields)
@@ -409,6 +436,30 @@ class FortiObject:
             "vdom": self.vdom,
         }
 
+    def _resolve_key(self, name: str) -> str:
+        """
+        Map a Python attribute name to the key used in the response data.
+
+        Priority order:
+        1. Python keyword mapping (e.g., 'asn' -> 'as')
+        2. Exact name match
+        3. snake_case -> hyphen-case conversion (cached per class)
+        """
+        key = PYTHON_KEYWORD_TO_API_FIELD.get(name)
+        if key is not None or name in self._data:
+            return key or name
+        return self._key_cache.get(name) or self._hyphenate(name)
+
+    @classmethod
+    def _hyphenate(cls, name: str) -> str:
+        """Return ``name`` in hyphen-case, caching the result per class."""
+        key = cls._key_cache.get(name)
+        if key is None:
+            key = name.replace("_", "-")
+            if len(cls._key_cache) < _KEY_CACHE_MAX_SIZE:
+                cls._key_cache[name] = key
+        return key
+
     def __getattr__(self, name: str) -> Any:
         """
         Dynamic attribute access with automatic wrapping of nested objects.
@@ -438,45 +489,61 @@ class FortiObject:
             >>> obj.asn  # Python keyword mapping (API 'as' -> Python 'asn')
             '65001'
         """
-        if name.startswith("_"):
+        if name[:1] == "_":
             raise AttributeError(
                 f"'{type(self).__name__}' object has no attribute '{name}'"
             )
 
-        # Resolve key with priority order:
-        # 1. Check if name maps to API keyword (e.g., 'asn' -> 'as')
-        # 2. Try exact name match
-        # 3. Try snake_case -> hyphen-case conversion
-        
-        # Check reverse keyword mapping (Python name -> API field)
-        reverse_keyword_map = {v: k for k, v in API_FIELD_TO_PYTHON_KEYWORD.items()}
-        if name in reverse_keyword_map:
-            key = reverse_keyword_map[name]
-        elif name in self._data:
-            key = name
-        else:
-            key = name.replace("_", "-")
+        # Same resolution as _resolve_key(), inlined for the hot path
+        data = self._data
+        key = PYTHON_KEYWORD_TO_API_FIELD.get(name)
+        if key is None:
+            if name in data:
+                key = name
+            else:
+                key = self._key_cache.get(name) or self._hyphenate(name)
 
         # If key not present, behave like previous implementation and return None
-        if key not in self._data:
+        value = data.get(key, _MISSING)
+        if value is _MISSING:
             return None
 
-        value = self._data.get(key)
+        if isinstance(value, (dict, list)):
+            return self._wrap_child(key, value)
+        return value
+
+    def _wrap_child(self, key: str, value: Any) -> Any:
+        """
+        Wrap a nested dict/list value, reusing the wrapper from earlier access.
+
+        Wrappers are cached per instance and keyed by field, so walking the
+        same member tables repeatedly allocates nothing and returns the same
+        objects each time. A cached wrapper is only reused while the field
+        still holds the very same dict/list it was built from.
+        """
+        children = self._children
+        if children is None:
+            children = self._children = {}
+        else:
+            cached = children.get(key)
+            if cached is not None and cached[0] is value:
+                return cached[1]
 
         # Auto-wrap nested objects (single dict) in FortiObject for attribute access
         if isinstance(value, dict):
-            return FortiObject(value)
-
+            wrapped: Any = FortiObject(value)
         # Auto-wrap member_table fields (lists of dicts) in FortiObjectList
         # Wrap both empty and non-empty lists so .dict property is always available
-        if isinstance(value, list):
-            if not value:
-                # Empty list - wrap in FortiObjectList for consistent .dict access
-                return FortiObjectList([])
-            if isinstance(value[0], dict):
-                return FortiObjectList([FortiObject(item) for item in value])
+        elif not value:
+            # Empty list - wrap in FortiObjectList for consistent .dict access
+            wrapped = FortiObjectList([])
+        elif isinstance(value[0], dict):
+            wrapped = LazyFortiObjectList(value)
+        else:
+            return value
 
-        return value
+        children[key] = (value, wrapped)
+        return wrapped
 
     def get_full(self, name: str) -> Any:
         """
@@ -496,14 +563,7 @@ class FortiObject:
             [{'name': 'addr1', 'q_origin_key': 'addr1'}]
         """
         # Support reverse keyword mapping, exact names, and hyphenated keys
-        reverse_keyword_map = {v: k for k, v in API_FIELD_TO_PYTHON_KEYWORD.items()}
-        if name in reverse_keyword_map:
-            key = reverse_keyword_map[name]
-        elif name in self._data:
-            key = name
-        else:
-            key = name.replace("_", "-")
-        return self._data.get(key)
+        return self._data.get(self._resolve_key(name))
 
     def to_dict(self) -> dict:
         """
@@ -718,7 +778,7 @@ class FortiObject:
             True
         """
         # Consider both exact key and underscore->hyphen variants
-        return key in self._data or key.replace("_", "-") in self._data
+        return key in self._data or self._hyphenate(key) in self._data
 
     def __getitem__(self, key: str) -> Any:
         """
@@ -745,15 +805,15 @@ class FortiObject:
         # Resolve key presence for both formats
         if key in self._data:
             raw_key = key
-        elif key.replace("_", "-") in self._data:
-            raw_key = key.replace("_", "-")
+        elif self._hyphenate(key) in self._data:
+            raw_key = self._hyphenate(key)
         else:
             raise KeyError(key)
 
         # Return processed value (apply same logic as attribute access)
         value = self._data[raw_key]
         if isinstance(value, list) and value and isinstance(value[0], dict):
-            return [FortiObject(item) for item in value]
+            return list(self._wrap_child(raw_key, value))
         return value
 
     def __len__(self) -> int:
@@ -869,13 +929,13 @@ class FortiObject:
             'default'
         """
         # Resolve raw key (support snake_case attribute to hyphenated keys)
-        raw_key = key if key in self._data else key.replace("_", "-")
+        raw_key = key if key in self._data else self._hyphenate(key)
         if raw_key not in self._data:
             return default
 
         value = self._data[raw_key]
         if isinstance(value, list) and value and isinstance(value[0], dict):
-            return FortiObjectList([FortiObject(item) for item in value])
+            return self._wrap_child(raw_key, value)
         return value
 
 
@@ -891,6 +951,9 @@ class FortiObjectList(list):
         dict: Returns list of dictionaries (each FortiObject as dict)
         json: Returns pretty-printed JSON string  
         raw: Returns the full API response envelope
+
+    Methods:
+        to_columns(): Returns a dict of typed column arrays
     
     Examples:
         >>> policies = fgt.api.cmdb.firewall.policy.get()
@@ -1200,6 +1263,252 @@ class FortiObjectList(list):
             return self._raw_envelope
         return self.dict
 
+    def to_columns(
+        self,
+        fields: list[str] | None = None,
+        numpy: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Get the results as a dict of typed column arrays.
+
+        Built in one pass over the underlying dictionaries, without
+        creating a FortiObject per row. Integer columns become
+        ``array('q')``, numeric columns ``array('d')`` and everything else
+        a list; with ``numpy=True`` every column is a NumPy array.
+        See :func:`hfortix_fortios.formatting.to_columns`.
+
+        Args:
+            fields: Columns to extract, in order (default: every key seen)
+            numpy: Return NumPy arrays (requires NumPy)
+
+        Returns:
+            Dict mapping field name to column
+
+        Examples:
+            >>> sessions = fgt.api.monitor.firewall.sessions.get(count=1000)
+            >>> cols = sessions.to_columns(["proto", "sentbyte"], numpy=True)
+            >>> cols["sentbyte"][cols["proto"] == 6].sum()
+        """
+        from .formatting import to_columns
+
+        return to_columns(self.dict, fields=fields, numpy=numpy)
+
+
+class LazyFortiObjectList(FortiObjectList):
+    """
+    FortiObjectList that wraps result dicts in FortiObject on demand.
+
+    Holds the raw ``results`` list from the API response and only builds a
+    FortiObject when an item is indexed, sliced or reached by iteration.
+    Each wrapper is stored back in place, so later access returns the same
+    object. A 100k-entry dump therefore costs one list of references until
+    the caller actually touches the entries.
+
+    Behaves like FortiObjectList for callers: indexing, iteration, ``len``,
+    ``in`` and the ``raw``/``json``/``http_*`` properties are unchanged.
+    ``dict`` returns a new list holding the original result dicts (a
+    shallow copy, nothing is rebuilt) as long as the list has not been
+    modified.
+
+    Examples:
+        >>> addresses = fgt.api.cmdb.firewall.address.get()  # no wrappers yet
+        >>> addresses[0].name                                 # wraps item 0
+        'all'
+        >>> addresses.dict == addresses.raw["results"]
+        True
+        >>> addresses.dict[0] is addresses.raw["results"][0]
+        True
+    """
+
+    def __init__(
+        self,
+        results: list | None = None,
+        raw_envelope: dict | None = None,
+        response_time: float | None = None,
+        request_info: dict | None = None,
+        item_envelope: dict | None = None,
+    ):
+        """
+        Initialize LazyFortiObjectList.
+
+        Args:
+            results: Raw result items (dicts are wrapped on first access)
+            raw_envelope: The full API response envelope (optional)
+            response_time: Response time in seconds for the HTTP request (optional)
+            request_info: HTTP request information (optional)
+            item_envelope: Envelope attached to each wrapped item (optional)
+        """
+        super().__init__(results, raw_envelope, response_time, request_info)
+        # Original results list, returned by .dict until the list is modified
+        self._results: list | None = results if results is not None else []
+        self._item_envelope = item_envelope
+        self._materialized = False
+
+    def _wrap(self, index: int) -> Any:
+        """Return item ``index``, wrapping (and storing) it if still raw."""
+        item = list.__getitem__(self, index)
+        if type(item) is dict:
+            item = FortiObject(
+                item,
+                raw_envelope=self._item_envelope,
+                response_time=self._response_time,
+                request_info=self._request_info,
+            )
+            list.__setitem__(self, index, item)
+        return item
+
+    def _materialize(self) -> None:
+        """Wrap every remaining raw item."""
+        if not self._materialized:
+            for index in range(list.__len__(self)):
+                self._wrap(index)
+            self._materialized = True
+
+    def _detach(self) -> None:
+        """Forget the original results list after an in-place modification."""
+        self._results = None
+
+    # -- read access ---------------------------------------------------------
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            for i in range(*index.indices(list.__len__(self))):
+                self._wrap(i)
+            return list.__getitem__(self, index)
+        return self._wrap(index)
+
+    def __iter__(self):  # type: ignore[override]
+        if self._materialized:
+            return list.__iter__(self)
+        return self._iter_wrapping()
+
+    def _iter_wrapping(self):
+        index = 0
+        while index < list.__len__(self):
+            yield self._wrap(index)
+            index += 1
+        self._materialized = True
+
+    def __reversed__(self):
+        self._materialize()
+        return list.__reversed__(self)
+
+    def __contains__(self, value: object) -> bool:
+        self._materialize()
+        return list.__contains__(self, value)
+
+    def __eq__(self, other: object) -> bool:
+        self._materialize()
+        return list.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        self._materialize()
+        return list.__ne__(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __add__(self, other):  # type: ignore[override]
+        self._materialize()
+        return list.__add__(self, other)
+
+    def __mul__(self, count):  # type: ignore[override]
+        self._materialize()
+        return list.__mul__(self, count)
+
+    __rmul__ = __mul__
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return list.__repr__(self)
+
+    def copy(self) -> list:  # type: ignore[override]
+        self._materialize()
+        return list.copy(self)
+
+    def index(self, value, *args) -> int:  # type: ignore[override]
+        self._materialize()
+        return list.index(self, value, *args)
+
+    def count(self, value) -> int:  # type: ignore[override]
+        self._materialize()
+        return list.count(self, value)
+
+    # -- modification (results list no longer mirrors the contents) ----------
+
+    def __setitem__(self, index, value):  # type: ignore[override]
+        self._detach()
+        list.__setitem__(self, index, value)
+
+    def __delitem__(self, index):  # type: ignore[override]
+        self._detach()
+        list.__delitem__(self, index)
+
+    def __iadd__(self, other):  # type: ignore[override]
+        self._detach()
+        return list.__iadd__(self, other)
+
+    def __imul__(self, count):  # type: ignore[override]
+        self._detach()
+        return list.__imul__(self, count)
+
+    def append(self, value) -> None:  # type: ignore[override]
+        self._detach()
+        list.append(self, value)
+
+    def extend(self, values) -> None:  # type: ignore[override]
+        self._detach()
+        list.extend(self, values)
+
+    def insert(self, index, value) -> None:  # type: ignore[override]
+        self._detach()
+        list.insert(self, index, value)
+
+    def pop(self, index: int = -1):  # type: ignore[override]
+        self._detach()
+        item = self._wrap(index)
+        list.pop(self, index)
+        return item
+
+    def remove(self, value) -> None:  # type: ignore[override]
+        self._materialize()
+        self._detach()
+        list.remove(self, value)
+
+    def clear(self) -> None:
+        self._detach()
+        list.clear(self)
+
+    def sort(self, *args, **kwargs) -> None:  # type: ignore[override]
+        self._materialize()
+        self._detach()
+        list.sort(self, *args, **kwargs)
+
+    def reverse(self) -> None:
+        self._detach()
+        list.reverse(self)
+
+    # -- conversions ---------------------------------------------------------
+
+    @property
+    def dict(self) -> list[dict]:
+        """
+        Get list of dictionaries.
+
+        Returns a new list holding the original ``results`` dicts of the API
+        response (a pointer copy; the items are not rebuilt), so changing
+        the list leaves the envelope alone. If the list was modified in
+        place, the dictionaries are rebuilt from the current items instead.
+
+        Returns:
+            List of dictionaries
+        """
+        if self._results is not None:
+            return list(self._results)
+        return [
+            item.to_dict() if isinstance(item, FortiObject) else item
+            for item in list.__iter__(self)
+        ]
+
 
 # ============================================================================
 # Content Response for Binary/File Download Endpoints
@@ -1837,11 +2146,9 @@ def process_response(
     # Wrap in FortiObject based on response type
     if isinstance(result, list):
         # Direct list of results
-        # Only wrap dict items in FortiObject; pass through non-dicts (strings, ints, etc.)
-        wrapped = [
-            FortiObject(item, response_time=response_time, request_info=request_info) if isinstance(item, dict) else item
-            for item in result
-        ]
+        # Dict items are wrapped in FortiObject on first access; non-dicts
+        # (strings, ints, etc.) pass through
+        wrapped = LazyFortiObjectList(result, raw_envelope=raw_envelope, response_time=response_time, request_info=request_info)
 
         # If unwrap_single=True and we have exactly 1 item, return just that item
         # This happens when querying by mkey (e.g., get(name="specific_object"))
@@ -1849,7 +2156,7 @@ def process_response(
             return wrapped[0]
 
         # Return FortiObjectList with raw envelope for .raw property access
-        return FortiObjectList(wrapped, raw_envelope=raw_envelope, response_time=response_time, request_info=request_info)
+        return wrapped
     
     elif isinstance(result, dict):
         # Check if this is a content response (file download endpoints)
@@ -1862,18 +2169,15 @@ def process_response(
             results_data = result["results"]
             
             if isinstance(results_data, list):
-                # List of results: wrap each in FortiObject
-                wrapped_results = [
-                    FortiObject(item, raw_envelope=result, response_time=response_time, request_info=request_info) if isinstance(item, dict) else item
-                    for item in results_data
-                ]
+                # List of results: each dict is wrapped in FortiObject on first access
+                wrapped_results = LazyFortiObjectList(results_data, raw_envelope=result, response_time=response_time, request_info=request_info, item_envelope=result)
 
                 # If unwrap_single=True and we have exactly 1 item, unwrap it
                 if unwrap_single and len(wrapped_results) == 1:
                     return wrapped_results[0]
 
                 # Return FortiObjectList with the full envelope as raw
-                return FortiObjectList(wrapped_results, raw_envelope=result, response_time=response_time, request_info=request_info)
+                return wrapped_results
             
             elif isinstance(results_data, dict):
                 # Singleton endpoint: results is a dict, not a list
@@ -714,6 +714,42 @@ class FortiObjectList(list[_ObjectT], Generic[_ObjectT]):
         """
         ...
 
+    def to_columns(
+        self,
+        fields: builtins.list[str] | None = None,
+        numpy: bool = False,
+    ) -> builtins.dict[str, Any]:
+        """
+        Get the results as a dict of typed column arrays.
+
+        Args:
+            fields: Columns to extract, in order (default: every key seen)
+            numpy: Return NumPy arrays (requires NumPy)
+
+        Returns:
+            Dict mapping field name to column
+        """
+        ...
+
+
+class LazyFortiObjectList(FortiObjectList[_ObjectT], Generic[_ObjectT]):
+    """
+    FortiObjectList that wraps result dicts in FortiObject on demand.
+
+    Items are wrapped on first index, slice or iteration and cached in place.
+    ``dict`` returns a shallow copy of the results list while the list is
+    unmodified.
+    """
+
+    def __init__(
+        self,
+        results: list[Any] | None = None,
+        raw_envelope: dict[str, Any] | None = None,
+        response_time: float | None = None,
+        request_info: dict[str, Any] | None = None,
+        item_envelope: dict[str, Any] | None = None,
+    ) -> None: ...
+
 
 # ============================================================================
 # Content Response for Binary/File Download Endpoints
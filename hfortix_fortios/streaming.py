@@ -0,0 +1,704 @@
+"""
+Streaming decoding of large FortiOS list responses.
+
+A regular GET decodes the whole response into one dict before the first row
+is usable, so peak memory is roughly twice the payload. ``ResultStream``
+instead reads the body in chunks, parses the envelope incrementally and
+yields each ``results`` item as soon as it is complete. Only the item being
+parsed is buffered, so a multi-gigabyte session table or log dump can be
+processed in constant memory.
+
+Envelope fields (``matched_count``, ``next_idx``, ``serial``, ...) are
+collected while streaming and are complete once the iteration finishes.
+
+Streams are normally obtained through the ``"stream"`` response mode::
+
+    >>> rows = fgt.with_response_mode("stream").monitor.firewall.sessions.get()
+    >>> for row in rows:
+    ...     process(row)
+    >>> rows.matched_count
+    1843211
+
+    >>> # Async clients
+    >>> rows = fgt.with_response_mode("stream").log.disk.traffic.forward.get(rows=500000)
+    >>> async for row in rows:
+    ...     process(row)
+
+The request goes through ``open_stream()``, which applies the client's
+request pipeline to the streamed GET: vdom resolution, the
+``X-TRANSACTION-ID`` header inside ``fgt.transaction()``, the circuit
+breaker, retries with backoff, ``_last_request``, request statistics and
+audit logging. Retries are only possible until the response headers have
+arrived; a connection that drops while the body is being read raises to
+the consumer, which has already processed part of the rows. The client's
+rate limiter and proactive session refresh are not applied.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import inspect
+import json
+import re
+import time
+import uuid
+from typing import Any, AsyncIterator, Iterator, Optional, Union
+
+import httpx
+from hfortix_core.utils import normalize_keys
+
+__all__ = [
+    "EnvelopeParser",
+    "ResultStream",
+    "aopen_stream",
+    "open_stream",
+    "read_body",
+    "request_params",
+]
+
+DEFAULT_CHUNK_SIZE = 65536
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# Scanning for the end of a value: text up to the next bracket, with
+# complete strings skipped whole, and the rest of a string cut off by the
+# end of a chunk (both stop at a lone trailing backslash)
+_PLAIN = re.compile(r'[^"{}\[\]]*(?:"[^"\\]*(?:\\.[^"\\]*)*"[^"{}\[\]]*)*')
+_STRING_REST = re.compile(r'[^"\\]*(?:\\.[^"\\]*)*')
+
+# A scalar (number or literal) is complete once one of these follows it
+_SCALAR_END = re.compile(r"[\s,\]}]")
+
+# Parser states
+_START = 0
+_KEY = 1
+_COLON = 2
+_VALUE = 3
+_ITEMS = 4
+_END = 5
+
+
+class EnvelopeParser:
+    """
+    Incremental parser for a FortiOS response envelope.
+
+    Feed it text as it arrives; every call returns the ``results`` items
+    completed by that chunk. All other top-level fields end up in
+    ``metadata``. A body that is a bare JSON array is treated as a list of
+    results, and a ``results`` object (single-object responses) is
+    returned as one item.
+
+    Example:
+        >>> parser = EnvelopeParser()
+        >>> parser.feed('{"status": "success", "results": [{"a": 1}, {"a"')
+        [{'a': 1}]
+        >>> parser.feed(': 2}], "matched_count": 2}')
+        [{'a': 2}]
+        >>> parser.close()
+        >>> parser.metadata
+        {'status': 'success', 'matched_count': 2}
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._key: Optional[str] = None
+        self._top_level_list = False
+        # Scan state of the incomplete value at _pos, kept across chunks
+        self._scanned = 0
+        self._depth = 0
+        self._in_string = False
+        self.metadata: dict[str, Any] = {}
+
+    @property
+    def done(self) -> bool:
+        """True once the closing bracket of the envelope was parsed."""
+        return self._state == _END
+
+    def feed(self, text: str) -> list[Any]:
+        """Add the next chunk of the body and return the completed items."""
+        # Drop everything already consumed; only a partial value remains
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+        items: list[Any] = []
+        self._parse(items, final=False)
+        return items
+
+    def close(self) -> list[Any]:
+        """
+        Signal the end of the body and return any remaining items.
+
+        Raises:
+            ValueError: If the body ended before the envelope was complete
+        """
+        items: list[Any] = []
+        self._parse(items, final=True)
+        if self._state != _END:
+            raise ValueError("Truncated JSON response: envelope is incomplete")
+        return items
+
+    def _skip_whitespace(self) -> bool:
+        """Advance past whitespace; False if the buffer is exhausted."""
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()  # type: ignore[union-attr]
+        return self._pos < len(self._buffer)
+
+    def _scan(self) -> bool:
+        """
+        True once the string/array/object at ``_pos`` is complete.
+
+        Scanning resumes where the previous chunk ended, so every byte of
+        a large value is scanned once, however many chunks it spans.
+        """
+        buffer = self._buffer
+        start = self._pos
+        end = len(buffer)
+        i = start + self._scanned
+        depth, in_string = self._depth, self._in_string
+        if i == start:
+            # The opening quote or bracket of the value itself
+            in_string = buffer[i] == '"'
+            depth = 0 if in_string else 1
+            i += 1
+        while i < end:
+            if in_string:
+                i = _STRING_REST.match(buffer, i).end()  # type: ignore[union-attr]
+                if i == end or buffer[i] != '"':
+                    break  # the string (or an escape) continues
+                i += 1
+                in_string = False
+                if depth == 0:
+                    return True
+                continue
+            # Skip to the next bracket; complete strings are skipped whole
+            i = _PLAIN.match(buffer, i).end()  # type: ignore[union-attr]
+            if i == end:
+                break
+            char = buffer[i]
+            i += 1
+            if char == '"':
+                in_string = True  # a string cut off by the chunk end
+            elif char in "{[":
+                depth += 1
+            else:
+                depth -= 1
+                if depth == 0:
+                    return True
+        self._scanned = i - start
+        self._depth, self._in_string = depth, in_string
+        return False
+
+    def _decode(self, final: bool) -> tuple[bool, Any]:
+        """Decode one complete JSON value at the current position."""
+        buffer = self._buffer
+        if buffer[self._pos] in '{["':
+            # Decode only once the value is complete; a malformed value
+            # then raises instead of being buffered until close()
+            if not self._scan() and not final:
+                return False, None  # value continues in the next chunk
+            self._scanned = self._depth = 0
+            self._in_string = False
+            value, self._pos = self._decoder.raw_decode(buffer, self._pos)
+            return True, value
+        try:
+            value, end = self._decoder.raw_decode(buffer, self._pos)
+        except json.JSONDecodeError:
+            if final or _SCALAR_END.search(buffer, self._pos):
+                raise
+            return False, None  # number or literal cut off
+        if end < len(buffer) or not final:
+            # "-1" of "-1.5" is only complete once a delimiter follows
+            if not _SCALAR_END.match(buffer, end):
+                if final or _SCALAR_END.search(buffer, end):
+                    text = buffer[self._pos : end + 10]
+                    raise ValueError(f"Invalid JSON value at {text!r}")
+                return False, None
+        self._pos = end
+        return True, value
+
+    def _parse(self, items: list[Any], final: bool) -> None:
+        buffer = self._buffer
+        while self._skip_whitespace():
+            char = buffer[self._pos]
+            state = self._state
+            if state == _START:
+                if char == "{":
+                    self._state = _KEY
+                elif char == "[":
+                    self._top_level_list = True
+                    self._state = _ITEMS
+                else:
+                    raise ValueError(
+                        f"Unexpected character {char!r} at start of response"
+                    )
+                self._pos += 1
+            elif state == _KEY:
+                if char == ",":
+                    self._pos += 1
+                elif char == "}":
+                    self._pos += 1
+                    self._state = _END
+                else:
+                    complete, key = self._decode(final)
+                    if not complete:
+                        return
+                    self._key = key
+                    self._state = _COLON
+            elif state == _COLON:
+                if char != ":":
+                    raise ValueError(f"Expected ':' after key {self._key!r}")
+                self._pos += 1
+                self._state = _VALUE
+            elif state == _VALUE:
+                if self._key == "results" and char == "[":
+                    self._pos += 1
+                    self._state = _ITEMS
+                    continue
+                complete, value = self._decode(final)
+                if not complete:
+                    return
+                if self._key == "results":
+                    items.append(value)
+                else:
+                    self.metadata[self._key] = value  # type: ignore[index]
+                self._state = _KEY
+            elif state == _ITEMS:
+                if char == ",":
+                    self._pos += 1
+                elif char == "]":
+                    self._pos += 1
+                    self._state = _END if self._top_level_list else _KEY
+                else:
+                    complete, value = self._decode(final)
+                    if not complete:
+                        return
+                    items.append(value)
+            else:
+                raise ValueError(
+                    f"Unexpected data after end of response: {char!r}"
+                )
+
+
+def request_params(
+    client: Any,
+    params: Optional[dict[str, Any]],
+    vdom: Optional[Union[str, bool]],
+) -> dict[str, Any]:
+    """
+    Query parameters with the vdom resolved like ``HTTPClient.request()``.
+
+    ``vdom=False`` sends no vdom (global endpoints), ``True`` sends
+    ``global``, a name is sent as-is and None falls back to the client's
+    default vdom, then ``root``.
+    """
+    params = dict(params) if params else {}
+    if vdom is False:
+        pass
+    elif vdom is True:
+        params["vdom"] = "global"
+    elif vdom is not None:
+        params["vdom"] = vdom
+    elif "vdom" not in params:
+        default_vdom = getattr(client, "_vdom", None)
+        params["vdom"] = default_vdom if default_vdom is not None else "root"
+    return params
+
+
+def _streams(client: Any) -> bool:
+    """True for clients with an httpx connection (HTTPClient and friends)."""
+    return hasattr(client, "_build_url") and hasattr(
+        getattr(client, "_client", None), "send"
+    )
+
+
+class _StreamRequest:
+    """Bookkeeping of ``HTTPClient.request()`` for one streamed GET."""
+
+    def __init__(
+        self,
+        client: Any,
+        api_type: str,
+        path: str,
+        params: Optional[dict[str, Any]],
+        vdom: Optional[Union[str, bool]],
+    ):
+        self.client = client
+        self.api_type = api_type
+        self.path = path.lstrip("/")
+        self.url = client._build_url(api_type, self.path)
+        self.params = request_params(client, params, vdom)
+        self.endpoint = f"/api/v2/{api_type}/{self.path}"
+        self.key = f"{api_type}/{self.path}"
+        self.request_id = str(uuid.uuid4())[:8]
+        self.start = time.time()
+        client._retry_stats["total_requests"] += 1
+
+    def build(self) -> httpx.Request:
+        """Request for the next attempt, with the transaction header."""
+        client = self.client
+        headers = {}
+        if getattr(client, "_active_transaction_id", None) is not None:
+            headers["X-TRANSACTION-ID"] = str(client._active_transaction_id)
+        client._total_requests += 1
+        client._last_request = {
+            "method": "GET",
+            "endpoint": self.endpoint,
+            "url": self.url,
+            "params": self.params,
+            "data": None,
+            "timestamp": time.time(),
+        }
+        return client._client.build_request(
+            "GET",
+            self.url,
+            params=self.params or None,
+            headers=headers or None,
+        )
+
+    def check(self, response: httpx.Response) -> None:
+        """Raise the client's error for a failed (fully read) response."""
+        self.client._handle_response_errors(
+            response, endpoint=self.endpoint, method="GET", params=self.params
+        )
+
+    def retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """Backoff before the next attempt, or None to give up."""
+        client = self.client
+        client._record_circuit_breaker_failure(self.key)
+        if not client._should_retry(error, attempt, self.key):
+            return None
+        response = (
+            error.response if isinstance(error, httpx.HTTPStatusError) else None
+        )
+        return client._get_retry_delay(attempt, response, self.key)
+
+    def _audit(self, status_code: int, error: Optional[str] = None) -> None:
+        self.client._log_audit(
+            method="GET",
+            endpoint=self.endpoint,
+            api_type=self.api_type,
+            path=self.path,
+            data=None,
+            params=self.params,
+            status_code=status_code,
+            success=error is None,
+            duration_ms=int((time.time() - self.start) * 1000),
+            request_id=self.request_id,
+            error=error,
+        )
+
+    def succeeded(self, response: httpx.Response) -> None:
+        client = self.client
+        duration = time.time() - self.start
+        client._last_response = {
+            "status_code": response.status_code,
+            "headers": dict(response.headers),
+        }
+        client._last_response_time = duration
+        client._record_response_time(self.key, duration)
+        client._record_circuit_breaker_success()
+        client._retry_stats["successful_requests"] += 1
+        self._audit(response.status_code)
+
+    def failed(self, error: Exception) -> None:
+        self.client._retry_stats["failed_requests"] += 1
+        response = getattr(error, "response", None)
+        self._audit(getattr(response, "status_code", 0) or 0, str(error))
+
+
+@contextlib.contextmanager
+def open_stream(
+    client: Any,
+    api_type: str,
+    path: str,
+    params: Optional[dict[str, Any]] = None,
+    vdom: Optional[Union[str, bool]] = None,
+) -> Iterator[httpx.Response]:
+    """
+    Send a GET through the client's request pipeline, body unread.
+
+    Resolves the vdom, honours the circuit breaker, adds the transaction
+    header and retries like ``HTTPClient.request()`` until a successful
+    response has arrived; error responses raise the client's exceptions.
+    The connection is closed on exit.
+
+    Args:
+        client: HTTPClient (sync)
+        api_type: API type (cmdb, monitor, log, service)
+        path: Endpoint path
+        params: Query parameters
+        vdom: Virtual domain (False: none, True: global, None: default)
+
+    Yields:
+        httpx.Response whose body has not been read yet
+    """
+    request = _StreamRequest(client, api_type, path, params, vdom)
+    client._check_circuit_breaker(request.key)
+    attempt = 0
+    while True:
+        try:
+            response = client._client.send(request.build(), stream=True)
+            if not response.is_success:
+                try:
+                    response.read()
+                    request.check(response)
+                finally:
+                    response.close()
+            break
+        except Exception as error:
+            delay = request.retry_delay(error, attempt)
+            if delay is None:
+                request.failed(error)
+                raise
+            time.sleep(delay)
+            attempt += 1
+    request.succeeded(response)
+    try:
+        yield response
+    finally:
+        response.close()
+
+
+@contextlib.asynccontextmanager
+async def aopen_stream(
+    client: Any,
+    api_type: str,
+    path: str,
+    params: Optional[dict[str, Any]] = None,
+    vdom: Optional[Union[str, bool]] = None,
+) -> AsyncIterator[httpx.Response]:
+    """``open_stream()`` for AsyncHTTPClient."""
+    request = _StreamRequest(client, api_type, path, params, vdom)
+    check = client._check_circuit_breaker(request.key)
+    if inspect.isawaitable(check):
+        await check
+    attempt = 0
+    while True:
+        try:
+            response = await client._client.send(request.build(), stream=True)
+            if not response.is_success:
+                try:
+                    await response.aread()
+                    request.check(response)
+                finally:
+                    await response.aclose()
+            break
+        except Exception as error:
+            delay = request.retry_delay(error, attempt)
+            if delay is None:
+                request.failed(error)
+                raise
+            await asyncio.sleep(delay)
+            attempt += 1
+    request.succeeded(response)
+    try:
+        yield response
+    finally:
+        await response.aclose()
+
+
+def read_body(
+    client: Any,
+    api_type: str,
+    path: str,
+    params: Optional[dict[str, Any]] = None,
+    vdom: Optional[Union[str, bool]] = None,
+) -> Any:
+    """
+    Undecoded body of a GET, sent through the client's request pipeline.
+
+    Returns:
+        bytes, or a coroutine resolving to them with an async client
+    """
+    if not _streams(client):
+        # Custom IHTTPClient implementations: their own binary GET
+        return client.get_binary(
+            api_type, path, request_params(client, params, vdom)
+        )
+    if not inspect.iscoroutinefunction(client.get):
+        with open_stream(client, api_type, path, params, vdom) as response:
+            return response.read()
+
+    async def _read() -> bytes:
+        async with aopen_stream(
+            client, api_type, path, params, vdom
+        ) as response:
+            return await response.aread()
+
+    return _read()
+
+
+class ResultStream:
+    """
+    Iterator over the ``results`` items of a GET, decoded while streaming.
+
+    Works as a regular iterator with sync clients and as an async iterator
+    with async clients. The request is sent when iteration starts and a
+    stream can be consumed once. Leaving the loop early closes the
+    connection.
+
+    Items are plain dicts with the same (normalized) keys as the results of
+    a regular GET. Envelope fields are available from ``envelope`` and the
+    convenience properties once iteration has finished.
+
+    Clients that do not expose an httpx connection (custom IHTTPClient
+    implementations) fall back to a regular GET; the API is the same but
+    memory is not bounded.
+
+    Attributes:
+        envelope: Top-level response fields except ``results``
+        response_time: Seconds from sending the request to the end of the
+            body (None until finished)
+        rows: Number of items yielded so far
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        api_type: str,
+        path: str,
+        params: Optional[dict[str, Any]] = None,
+        vdom: Optional[Union[str, bool]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ):
+        """
+        Prepare a streamed GET (no request is sent yet).
+
+        Args:
+            client: HTTP client (HTTPClient, AsyncHTTPClient or IHTTPClient)
+            api_type: API type (cmdb, monitor, log, service)
+            path: Endpoint path
+            params: Query parameters
+            vdom: Virtual domain
+            chunk_size: Size of the chunks read from the connection
+        """
+        self._client = client
+        self._api_type = api_type
+        self._path = path.lstrip("/")
+        self._params = dict(params) if params else {}
+        self._vdom = vdom
+        self._chunk_size = chunk_size
+        self._started = False
+        self.envelope: dict[str, Any] = {}
+        self.response_time: Optional[float] = None
+        self.rows = 0
+
+    def __repr__(self) -> str:
+        state = "finished" if self.response_time is not None else "pending"
+        return (
+            f"ResultStream(/api/v2/{self._api_type}/{self._path}, "
+            f"{state}, rows={self.rows})"
+        )
+
+    # ========================================================================
+    # Envelope properties (complete after iteration)
+    # ========================================================================
+
+    @property
+    def finished(self) -> bool:
+        """True once the whole response was consumed."""
+        return self.response_time is not None
+
+    @property
+    def matched_count(self) -> Optional[int]:
+        """Number of entries matching the query (from the envelope)."""
+        return self.envelope.get("matched_count")
+
+    @property
+    def next_idx(self) -> Optional[int]:
+        """Index to request the next page from (from the envelope)."""
+        return self.envelope.get("next_idx")
+
+    @property
+    def http_status(self) -> Optional[str]:
+        """Status reported in the envelope ('success' or 'error')."""
+        return self.envelope.get("status")
+
+    # ========================================================================
+    # Iteration
+    # ========================================================================
+
+    def _start(self) -> None:
+        if self._started:
+            raise RuntimeError("A ResultStream can only be iterated once")
+        self._started = True
+
+    def _finish(self, metadata: dict[str, Any], start: float) -> None:
+        self.envelope = normalize_keys(metadata)
+        self.response_time = time.perf_counter() - start
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        self._start()
+        start = time.perf_counter()
+        if not _streams(self._client):
+            result = self._client.get(
+                self._api_type,
+                self._path,
+                self._params or None,
+                self._vdom,
+                raw_json=True,
+            )
+            yield from self._from_decoded(result, start)
+            return
+
+        parser = EnvelopeParser()
+        with open_stream(
+            self._client, self._api_type, self._path, self._params, self._vdom
+        ) as response:
+            for text in response.iter_text(self._chunk_size):
+                for item in parser.feed(text):
+                    self.rows += 1
+                    yield normalize_keys(item)
+        for item in parser.close():
+            self.rows += 1
+            yield normalize_keys(item)
+        self._finish(parser.metadata, start)
+
+    def __aiter__(self) -> AsyncIterator[dict[str, Any]]:
+        return self._aiterate()
+
+    async def _aiterate(self) -> AsyncIterator[dict[str, Any]]:
+        self._start()
+        start = time.perf_counter()
+        if not _streams(self._client):
+            result = await self._client.get(
+                self._api_type,
+                self._path,
+                self._params or None,
+                self._vdom,
+                raw_json=True,
+            )
+            for item in self._from_decoded(result, start):
+                yield item
+            return
+
+        parser = EnvelopeParser()
+        async with aopen_stream(
+            self._client, self._api_type, self._path, self._params, self._vdom
+        ) as response:
+            async for text in response.aiter_text(self._chunk_size):
+                for item in parser.feed(text):
+                    self.rows += 1
+                    yield normalize_keys(item)
+        for item in parser.close():
+            self.rows += 1
+            yield normalize_keys(item)
+        self._finish(parser.metadata, start)
+
+    def _from_decoded(
+        self, result: Any, start: float
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate an already decoded response (non-streaming clients)."""
+        if isinstance(result, dict):
+            results = result.get("results", [])
+            metadata = {k: v for k, v in result.items() if k != "results"}
+        else:
+            results, metadata = result, {}
+        if isinstance(results, dict):
+            results = [results]
+        self._finish(metadata, start)
+        for item in results:
+            self.rows += 1
+            yield item